@@ -0,0 +1,59 @@
+"""Declaring types for protocols that imply many others
+
+Usage: python implications.py
+
+'wide' declares 300 classes, each for a protocol at the bottom of 8 levels of
+20 protocols, where each protocol implies two or three protocols of the
+level above.  'deep' declares 20 classes for the last protocol of a chain of
+60, 400 or 1000, each implying the one before it through an adapter, and then
+adapts an instance of the last class to the first protocol 2000 times.
+Reports the time taken to declare (and adapt) each, or why declaring failed.
+"""
+
+import time
+from protocols import Protocol, NO_ADAPTER_NEEDED
+from protocols import declareAdapterForProtocol, declareAdapterForType
+
+def wide():
+    levels = [[Protocol() for i in range(20)]]
+    for level in range(8):
+        row = [Protocol() for i in range(20)]
+        above = levels[-1]
+        for i in range(20):
+            for j in dict.fromkeys([i, (i*7+3) % 20, (i*3+1) % 20]):
+                declareAdapterForProtocol(above[j], NO_ADAPTER_NEEDED, row[i])
+        levels.append(row)
+
+    start = time.time()
+    for i in range(300):
+        klass = type('Wide%d' % i, (object,), {})
+        declareAdapterForType(levels[-1][i % 20], NO_ADAPTER_NEEDED, klass)
+    return '%.3fs' % (time.time() - start)
+
+def deep(length):
+    chain = [Protocol() for i in range(length)]
+    for protocol, implied in zip(chain[1:], chain):
+        declareAdapterForProtocol(implied, lambda ob: ob, protocol)
+
+    start = time.time()
+    try:
+        for i in range(20):
+            klass = type('Deep%d' % i, (object,), {})
+            declareAdapterForType(chain[-1], NO_ADAPTER_NEEDED, klass)
+    except RuntimeError, v:
+        return 'fails: %s' % v
+    declared = time.time() - start
+
+    ob = klass()
+    start = time.time()
+    for i in range(2000):
+        chain[0](ob)
+    return '%.3fs (adapt %.3fs)' % (declared, time.time() - start)
+
+def main():
+    print "wide: %s" % wide()
+    for length in 60, 400, 1000:
+        print "deep(%d): %s" % (length, deep(length))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,58 @@
+"""Memory used by per-object declarations
+
+Usage: python objectmemory.py [count]
+
+Makes 'count' (default 1,000,000) objects of each kind (new-style instance,
+classic instance and 'ProviderMixin' instance), declares with
+'adviseObject()' that each one provides an interface, and reports the growth
+in resident memory per object, along with the time taken to declare and then
+adapt them all.  Resident memory is read from '/proc/self/status', so this
+only runs on Linux.
+"""
+
+import sys, time, gc
+from protocols import Interface, ProviderMixin, adviseObject
+
+def rss():
+    for line in open('/proc/self/status'):
+        if line.startswith('VmRSS:'):
+            return int(line.split()[1]) * 1024
+
+class IFoo(Interface):
+    pass
+
+class NewStyle(object):
+    pass
+
+class Classic:
+    pass
+
+class Mixin(ProviderMixin):
+    pass
+
+def main(count=1000000):
+    for kind in NewStyle, Classic, Mixin:
+        obs = [kind() for i in xrange(count)]
+        gc.collect()
+        before = rss()
+
+        start = time.time()
+        for ob in obs:
+            adviseObject(ob, provides=[IFoo])
+        declared = time.time() - start
+
+        gc.collect()
+        size = float(rss() - before) / count
+
+        start = time.time()
+        for ob in obs:
+            IFoo(ob)
+        adapted = time.time() - start
+
+        print "%-8s %6.0f bytes/object  declare %6.2fs  adapt %5.2fs" % (
+            kind.__name__, size, declared, adapted
+        )
+        del obs, ob
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,54 @@
+"""Memory used by protocols that have nothing registered with them
+
+Usage: python protocolmemory.py [count]
+
+Makes 'count' (default 50,000) each of plain protocols, 'Variation' objects
+and interfaces, and reports the growth in resident memory per protocol,
+along with the time taken to look up an object that none of them support
+(except for variations, which imply their base).  Resident memory is read
+from '/proc/self/status', so this only runs on Linux.
+"""
+
+import sys, time, gc
+from protocols import Protocol, Interface, Variation
+
+def rss():
+    for line in open('/proc/self/status'):
+        if line.startswith('VmRSS:'):
+            return int(line.split()[1]) * 1024
+
+def makeProtocol(base, i):
+    return Protocol()
+
+def makeVariation(base, i):
+    return Variation(base, i)
+
+def makeInterface(base, i):
+    class IFoo(Interface):
+        pass
+    return IFoo
+
+def main(count=50000):
+    base = Protocol()
+    ob = object()
+
+    for make in makeProtocol, makeVariation, makeInterface:
+        gc.collect()
+        before = rss()
+        protocols = [make(base, i) for i in xrange(count)]
+        gc.collect()
+        size = float(rss() - before) / count
+
+        start = time.time()
+        if make is not makeVariation:
+            for protocol in protocols:
+                protocol(ob, None)
+        missed = time.time() - start
+
+        print "%-13s %6.0f bytes/protocol  adapt-miss %5.3fs" % (
+            make.__name__[4:], size, missed
+        )
+        del protocols
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
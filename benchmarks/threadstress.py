@@ -0,0 +1,78 @@
+"""Lookups racing with declarations in other threads
+
+Usage: python threadstress.py [readers] [seconds]
+
+Starts 'readers' (default 8) threads that repeatedly adapt instances of 200
+classes to a base interface, and one thread that keeps declaring (and then
+dropping) new classes and adapters, for 'seconds' (default 2.0).
+Reports lookups and declarations per second, and the number of lookups that
+failed or returned the wrong thing, which should always be zero.
+"""
+
+import sys, time, threading
+from protocols import Interface, Protocol, declareAdapter
+from protocols import declareImplementation
+
+class IBase(Interface):
+    pass
+
+class ISub(IBase):
+    pass
+
+def main(readers=8, seconds=2.0):
+    sys.setcheckinterval(100)   # switch threads often
+
+    obs = []
+    for i in range(200):
+        class Provider(object):
+            pass
+        declareImplementation(Provider, instancesProvide=[ISub])
+        obs.append(Provider())
+
+    stop = []
+    counts = []
+    errors = []
+    declared = [0]
+
+    def read():
+        count = 0
+        try:
+            while not stop:
+                for ob in obs:
+                    if IBase(ob, None) is not ob:
+                        errors.append(ob)
+                count += len(obs)
+        except Exception, v:
+            errors.append(v)
+        counts.append(count)
+
+    def write():
+        while not stop:
+            class Temporary(object):
+                pass
+            declareImplementation(Temporary, instancesProvide=[ISub])
+            declareAdapter(lambda ob: ob, provides=[Protocol()],
+                forTypes=[Temporary]
+            )
+            IBase(Temporary(), None)
+            declared[0] += 1
+
+    threads = [threading.Thread(target=read) for i in range(readers)]
+    threads.append(threading.Thread(target=write))
+    for thread in threads:
+        thread.start()
+    time.sleep(seconds)
+    stop.append(True)
+    for thread in threads:
+        thread.join()
+
+    print "lookups/s %.0f  declarations/s %.0f  errors %d" % (
+        sum(counts) / seconds, declared[0] / seconds, len(errors)
+    )
+
+if __name__ == '__main__':
+    args = sys.argv[1:]
+    if args:
+        main(int(args[0]), *map(float, args[1:]))
+    else:
+        main()
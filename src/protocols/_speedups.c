@@ -1,1592 +1,16464 @@
-/* Generated by Pyrex 0.9.5.1 on Wed Jan 31 16:35:25 2007 */
+/* Generated by Cython 0.29.37 */
 
+#ifndef PY_SSIZE_T_CLEAN
+#define PY_SSIZE_T_CLEAN
+#endif /* PY_SSIZE_T_CLEAN */
 #include "Python.h"
-#include "structmember.h"
+#ifndef Py_PYTHON_H
+    #error Python headers needed to compile C extensions, please install development version of Python.
+#elif PY_VERSION_HEX < 0x02060000 || (0x03000000 <= PY_VERSION_HEX && PY_VERSION_HEX < 0x03030000)
+    #error Cython requires Python 2.6+ or Python 3.3+.
+#else
+#define CYTHON_ABI "0_29_37"
+#define CYTHON_HEX_VERSION 0x001D25F0
+#define CYTHON_FUTURE_DIVISION 0
+#include <stddef.h>
+#ifndef offsetof
+  #define offsetof(type, member) ( (size_t) & ((type*)0) -> member )
+#endif
+#if !defined(WIN32) && !defined(MS_WINDOWS)
+  #ifndef __stdcall
+    #define __stdcall
+  #endif
+  #ifndef __cdecl
+    #define __cdecl
+  #endif
+  #ifndef __fastcall
+    #define __fastcall
+  #endif
+#endif
+#ifndef DL_IMPORT
+  #define DL_IMPORT(t) t
+#endif
+#ifndef DL_EXPORT
+  #define DL_EXPORT(t) t
+#endif
+#define __PYX_COMMA ,
+#ifndef HAVE_LONG_LONG
+  #if PY_VERSION_HEX >= 0x02070000
+    #define HAVE_LONG_LONG
+  #endif
+#endif
 #ifndef PY_LONG_LONG
   #define PY_LONG_LONG LONG_LONG
 #endif
-#ifdef __cplusplus
-#define __PYX_EXTERN_C extern "C"
+#ifndef Py_HUGE_VAL
+  #define Py_HUGE_VAL HUGE_VAL
+#endif
+#ifdef PYPY_VERSION
+  #define CYTHON_COMPILING_IN_PYPY 1
+  #define CYTHON_COMPILING_IN_PYSTON 0
+  #define CYTHON_COMPILING_IN_CPYTHON 0
+  #define CYTHON_COMPILING_IN_NOGIL 0
+  #undef CYTHON_USE_TYPE_SLOTS
+  #define CYTHON_USE_TYPE_SLOTS 0
+  #undef CYTHON_USE_PYTYPE_LOOKUP
+  #define CYTHON_USE_PYTYPE_LOOKUP 0
+  #if PY_VERSION_HEX < 0x03050000
+    #undef CYTHON_USE_ASYNC_SLOTS
+    #define CYTHON_USE_ASYNC_SLOTS 0
+  #elif !defined(CYTHON_USE_ASYNC_SLOTS)
+    #define CYTHON_USE_ASYNC_SLOTS 1
+  #endif
+  #undef CYTHON_USE_PYLIST_INTERNALS
+  #define CYTHON_USE_PYLIST_INTERNALS 0
+  #undef CYTHON_USE_UNICODE_INTERNALS
+  #define CYTHON_USE_UNICODE_INTERNALS 0
+  #undef CYTHON_USE_UNICODE_WRITER
+  #define CYTHON_USE_UNICODE_WRITER 0
+  #undef CYTHON_USE_PYLONG_INTERNALS
+  #define CYTHON_USE_PYLONG_INTERNALS 0
+  #undef CYTHON_AVOID_BORROWED_REFS
+  #define CYTHON_AVOID_BORROWED_REFS 1
+  #undef CYTHON_ASSUME_SAFE_MACROS
+  #define CYTHON_ASSUME_SAFE_MACROS 0
+  #undef CYTHON_UNPACK_METHODS
+  #define CYTHON_UNPACK_METHODS 0
+  #undef CYTHON_FAST_THREAD_STATE
+  #define CYTHON_FAST_THREAD_STATE 0
+  #undef CYTHON_FAST_PYCALL
+  #define CYTHON_FAST_PYCALL 0
+  #if PY_VERSION_HEX < 0x03090000
+    #undef CYTHON_PEP489_MULTI_PHASE_INIT
+    #define CYTHON_PEP489_MULTI_PHASE_INIT 0
+  #elif !defined(CYTHON_PEP489_MULTI_PHASE_INIT)
+    #define CYTHON_PEP489_MULTI_PHASE_INIT 1
+  #endif
+  #undef CYTHON_USE_TP_FINALIZE
+  #define CYTHON_USE_TP_FINALIZE (PY_VERSION_HEX >= 0x030400a1 && PYPY_VERSION_NUM >= 0x07030C00)
+  #undef CYTHON_USE_DICT_VERSIONS
+  #define CYTHON_USE_DICT_VERSIONS 0
+  #undef CYTHON_USE_EXC_INFO_STACK
+  #define CYTHON_USE_EXC_INFO_STACK 0
+  #ifndef CYTHON_UPDATE_DESCRIPTOR_DOC
+    #define CYTHON_UPDATE_DESCRIPTOR_DOC 0
+  #endif
+#elif defined(PYSTON_VERSION)
+  #define CYTHON_COMPILING_IN_PYPY 0
+  #define CYTHON_COMPILING_IN_PYSTON 1
+  #define CYTHON_COMPILING_IN_CPYTHON 0
+  #define CYTHON_COMPILING_IN_NOGIL 0
+  #ifndef CYTHON_USE_TYPE_SLOTS
+    #define CYTHON_USE_TYPE_SLOTS 1
+  #endif
+  #undef CYTHON_USE_PYTYPE_LOOKUP
+  #define CYTHON_USE_PYTYPE_LOOKUP 0
+  #undef CYTHON_USE_ASYNC_SLOTS
+  #define CYTHON_USE_ASYNC_SLOTS 0
+  #undef CYTHON_USE_PYLIST_INTERNALS
+  #define CYTHON_USE_PYLIST_INTERNALS 0
+  #ifndef CYTHON_USE_UNICODE_INTERNALS
+    #define CYTHON_USE_UNICODE_INTERNALS 1
+  #endif
+  #undef CYTHON_USE_UNICODE_WRITER
+  #define CYTHON_USE_UNICODE_WRITER 0
+  #undef CYTHON_USE_PYLONG_INTERNALS
+  #define CYTHON_USE_PYLONG_INTERNALS 0
+  #ifndef CYTHON_AVOID_BORROWED_REFS
+    #define CYTHON_AVOID_BORROWED_REFS 0
+  #endif
+  #ifndef CYTHON_ASSUME_SAFE_MACROS
+    #define CYTHON_ASSUME_SAFE_MACROS 1
+  #endif
+  #ifndef CYTHON_UNPACK_METHODS
+    #define CYTHON_UNPACK_METHODS 1
+  #endif
+  #undef CYTHON_FAST_THREAD_STATE
+  #define CYTHON_FAST_THREAD_STATE 0
+  #undef CYTHON_FAST_PYCALL
+  #define CYTHON_FAST_PYCALL 0
+  #undef CYTHON_PEP489_MULTI_PHASE_INIT
+  #define CYTHON_PEP489_MULTI_PHASE_INIT 0
+  #undef CYTHON_USE_TP_FINALIZE
+  #define CYTHON_USE_TP_FINALIZE 0
+  #undef CYTHON_USE_DICT_VERSIONS
+  #define CYTHON_USE_DICT_VERSIONS 0
+  #undef CYTHON_USE_EXC_INFO_STACK
+  #define CYTHON_USE_EXC_INFO_STACK 0
+  #ifndef CYTHON_UPDATE_DESCRIPTOR_DOC
+    #define CYTHON_UPDATE_DESCRIPTOR_DOC 0
+  #endif
+#elif defined(PY_NOGIL)
+  #define CYTHON_COMPILING_IN_PYPY 0
+  #define CYTHON_COMPILING_IN_PYSTON 0
+  #define CYTHON_COMPILING_IN_CPYTHON 0
+  #define CYTHON_COMPILING_IN_NOGIL 1
+  #ifndef CYTHON_USE_TYPE_SLOTS
+    #define CYTHON_USE_TYPE_SLOTS 1
+  #endif
+  #undef CYTHON_USE_PYTYPE_LOOKUP
+  #define CYTHON_USE_PYTYPE_LOOKUP 0
+  #ifndef CYTHON_USE_ASYNC_SLOTS
+    #define CYTHON_USE_ASYNC_SLOTS 1
+  #endif
+  #undef CYTHON_USE_PYLIST_INTERNALS
+  #define CYTHON_USE_PYLIST_INTERNALS 0
+  #ifndef CYTHON_USE_UNICODE_INTERNALS
+    #define CYTHON_USE_UNICODE_INTERNALS 1
+  #endif
+  #undef CYTHON_USE_UNICODE_WRITER
+  #define CYTHON_USE_UNICODE_WRITER 0
+  #undef CYTHON_USE_PYLONG_INTERNALS
+  #define CYTHON_USE_PYLONG_INTERNALS 0
+  #ifndef CYTHON_AVOID_BORROWED_REFS
+    #define CYTHON_AVOID_BORROWED_REFS 0
+  #endif
+  #ifndef CYTHON_ASSUME_SAFE_MACROS
+    #define CYTHON_ASSUME_SAFE_MACROS 1
+  #endif
+  #ifndef CYTHON_UNPACK_METHODS
+    #define CYTHON_UNPACK_METHODS 1
+  #endif
+  #undef CYTHON_FAST_THREAD_STATE
+  #define CYTHON_FAST_THREAD_STATE 0
+  #undef CYTHON_FAST_PYCALL
+  #define CYTHON_FAST_PYCALL 0
+  #ifndef CYTHON_PEP489_MULTI_PHASE_INIT
+    #define CYTHON_PEP489_MULTI_PHASE_INIT 1
+  #endif
+  #ifndef CYTHON_USE_TP_FINALIZE
+    #define CYTHON_USE_TP_FINALIZE 1
+  #endif
+  #undef CYTHON_USE_DICT_VERSIONS
+  #define CYTHON_USE_DICT_VERSIONS 0
+  #undef CYTHON_USE_EXC_INFO_STACK
+  #define CYTHON_USE_EXC_INFO_STACK 0
+#else
+  #define CYTHON_COMPILING_IN_PYPY 0
+  #define CYTHON_COMPILING_IN_PYSTON 0
+  #define CYTHON_COMPILING_IN_CPYTHON 1
+  #define CYTHON_COMPILING_IN_NOGIL 0
+  #ifndef CYTHON_USE_TYPE_SLOTS
+    #define CYTHON_USE_TYPE_SLOTS 1
+  #endif
+  #if PY_VERSION_HEX < 0x02070000
+    #undef CYTHON_USE_PYTYPE_LOOKUP
+    #define CYTHON_USE_PYTYPE_LOOKUP 0
+  #elif !defined(CYTHON_USE_PYTYPE_LOOKUP)
+    #define CYTHON_USE_PYTYPE_LOOKUP 1
+  #endif
+  #if PY_MAJOR_VERSION < 3
+    #undef CYTHON_USE_ASYNC_SLOTS
+    #define CYTHON_USE_ASYNC_SLOTS 0
+  #elif !defined(CYTHON_USE_ASYNC_SLOTS)
+    #define CYTHON_USE_ASYNC_SLOTS 1
+  #endif
+  #if PY_VERSION_HEX < 0x02070000
+    #undef CYTHON_USE_PYLONG_INTERNALS
+    #define CYTHON_USE_PYLONG_INTERNALS 0
+  #elif !defined(CYTHON_USE_PYLONG_INTERNALS)
+    #define CYTHON_USE_PYLONG_INTERNALS (PY_VERSION_HEX < 0x030C00A5)
+  #endif
+  #ifndef CYTHON_USE_PYLIST_INTERNALS
+    #define CYTHON_USE_PYLIST_INTERNALS 1
+  #endif
+  #ifndef CYTHON_USE_UNICODE_INTERNALS
+    #define CYTHON_USE_UNICODE_INTERNALS 1
+  #endif
+  #if PY_VERSION_HEX < 0x030300F0 || PY_VERSION_HEX >= 0x030B00A2
+    #undef CYTHON_USE_UNICODE_WRITER
+    #define CYTHON_USE_UNICODE_WRITER 0
+  #elif !defined(CYTHON_USE_UNICODE_WRITER)
+    #define CYTHON_USE_UNICODE_WRITER 1
+  #endif
+  #ifndef CYTHON_AVOID_BORROWED_REFS
+    #define CYTHON_AVOID_BORROWED_REFS 0
+  #endif
+  #ifndef CYTHON_ASSUME_SAFE_MACROS
+    #define CYTHON_ASSUME_SAFE_MACROS 1
+  #endif
+  #ifndef CYTHON_UNPACK_METHODS
+    #define CYTHON_UNPACK_METHODS 1
+  #endif
+  #if PY_VERSION_HEX >= 0x030B00A4
+    #undef CYTHON_FAST_THREAD_STATE
+    #define CYTHON_FAST_THREAD_STATE 0
+  #elif !defined(CYTHON_FAST_THREAD_STATE)
+    #define CYTHON_FAST_THREAD_STATE 1
+  #endif
+  #ifndef CYTHON_FAST_PYCALL
+    #define CYTHON_FAST_PYCALL (PY_VERSION_HEX < 0x030A0000)
+  #endif
+  #ifndef CYTHON_PEP489_MULTI_PHASE_INIT
+    #define CYTHON_PEP489_MULTI_PHASE_INIT (PY_VERSION_HEX >= 0x03050000)
+  #endif
+  #ifndef CYTHON_USE_TP_FINALIZE
+    #define CYTHON_USE_TP_FINALIZE (PY_VERSION_HEX >= 0x030400a1)
+  #endif
+  #ifndef CYTHON_USE_DICT_VERSIONS
+    #define CYTHON_USE_DICT_VERSIONS ((PY_VERSION_HEX >= 0x030600B1) && (PY_VERSION_HEX < 0x030C00A5))
+  #endif
+  #if PY_VERSION_HEX >= 0x030B00A4
+    #undef CYTHON_USE_EXC_INFO_STACK
+    #define CYTHON_USE_EXC_INFO_STACK 0
+  #elif !defined(CYTHON_USE_EXC_INFO_STACK)
+    #define CYTHON_USE_EXC_INFO_STACK (PY_VERSION_HEX >= 0x030700A3)
+  #endif
+  #ifndef CYTHON_UPDATE_DESCRIPTOR_DOC
+    #define CYTHON_UPDATE_DESCRIPTOR_DOC 1
+  #endif
+#endif
+#if !defined(CYTHON_FAST_PYCCALL)
+#define CYTHON_FAST_PYCCALL  (CYTHON_FAST_PYCALL && PY_VERSION_HEX >= 0x030600B1)
+#endif
+#if CYTHON_USE_PYLONG_INTERNALS
+  #if PY_MAJOR_VERSION < 3
+    #include "longintrepr.h"
+  #endif
+  #undef SHIFT
+  #undef BASE
+  #undef MASK
+  #ifdef SIZEOF_VOID_P
+    enum { __pyx_check_sizeof_voidp = 1 / (int)(SIZEOF_VOID_P == sizeof(void*)) };
+  #endif
+#endif
+#ifndef __has_attribute
+  #define __has_attribute(x) 0
+#endif
+#ifndef __has_cpp_attribute
+  #define __has_cpp_attribute(x) 0
+#endif
+#ifndef CYTHON_RESTRICT
+  #if defined(__GNUC__)
+    #define CYTHON_RESTRICT __restrict__
+  #elif defined(_MSC_VER) && _MSC_VER >= 1400
+    #define CYTHON_RESTRICT __restrict
+  #elif defined (__STDC_VERSION__) && __STDC_VERSION__ >= 199901L
+    #define CYTHON_RESTRICT restrict
+  #else
+    #define CYTHON_RESTRICT
+  #endif
+#endif
+#ifndef CYTHON_UNUSED
+# if defined(__GNUC__)
+#   if !(defined(__cplusplus)) || (__GNUC__ > 3 || (__GNUC__ == 3 && __GNUC_MINOR__ >= 4))
+#     define CYTHON_UNUSED __attribute__ ((__unused__))
+#   else
+#     define CYTHON_UNUSED
+#   endif
+# elif defined(__ICC) || (defined(__INTEL_COMPILER) && !defined(_MSC_VER))
+#   define CYTHON_UNUSED __attribute__ ((__unused__))
+# else
+#   define CYTHON_UNUSED
+# endif
+#endif
+#ifndef CYTHON_MAYBE_UNUSED_VAR
+#  if defined(__cplusplus)
+     template<class T> void CYTHON_MAYBE_UNUSED_VAR( const T& ) { }
+#  else
+#    define CYTHON_MAYBE_UNUSED_VAR(x) (void)(x)
+#  endif
+#endif
+#ifndef CYTHON_NCP_UNUSED
+# if CYTHON_COMPILING_IN_CPYTHON
+#  define CYTHON_NCP_UNUSED
+# else
+#  define CYTHON_NCP_UNUSED CYTHON_UNUSED
+# endif
+#endif
+#define __Pyx_void_to_None(void_result) ((void)(void_result), Py_INCREF(Py_None), Py_None)
+#ifdef _MSC_VER
+    #ifndef _MSC_STDINT_H_
+        #if _MSC_VER < 1300
+           typedef unsigned char     uint8_t;
+           typedef unsigned int      uint32_t;
+        #else
+           typedef unsigned __int8   uint8_t;
+           typedef unsigned __int32  uint32_t;
+        #endif
+    #endif
 #else
-#define __PYX_EXTERN_C extern
+   #include <stdint.h>
+#endif
+#ifndef CYTHON_FALLTHROUGH
+  #if defined(__cplusplus) && __cplusplus >= 201103L
+    #if __has_cpp_attribute(fallthrough)
+      #define CYTHON_FALLTHROUGH [[fallthrough]]
+    #elif __has_cpp_attribute(clang::fallthrough)
+      #define CYTHON_FALLTHROUGH [[clang::fallthrough]]
+    #elif __has_cpp_attribute(gnu::fallthrough)
+      #define CYTHON_FALLTHROUGH [[gnu::fallthrough]]
+    #endif
+  #endif
+  #ifndef CYTHON_FALLTHROUGH
+    #if __has_attribute(fallthrough)
+      #define CYTHON_FALLTHROUGH __attribute__((fallthrough))
+    #else
+      #define CYTHON_FALLTHROUGH
+    #endif
+  #endif
+  #if defined(__clang__ ) && defined(__apple_build_version__)
+    #if __apple_build_version__ < 7000000
+      #undef  CYTHON_FALLTHROUGH
+      #define CYTHON_FALLTHROUGH
+    #endif
+  #endif
+#endif
+
+#ifndef CYTHON_INLINE
+  #if defined(__clang__)
+    #define CYTHON_INLINE __inline__ __attribute__ ((__unused__))
+  #elif defined(__GNUC__)
+    #define CYTHON_INLINE __inline__
+  #elif defined(_MSC_VER)
+    #define CYTHON_INLINE __inline
+  #elif defined (__STDC_VERSION__) && __STDC_VERSION__ >= 199901L
+    #define CYTHON_INLINE inline
+  #else
+    #define CYTHON_INLINE
+  #endif
 #endif
-__PYX_EXTERN_C double pow(double, double);
 
+#define __PYX_BUILD_PY_SSIZE_T "n"
+#define CYTHON_FORMAT_SSIZE_T "z"
+#if PY_MAJOR_VERSION < 3
+  #define __Pyx_BUILTIN_MODULE_NAME "__builtin__"
+  #define __Pyx_PyCode_New(a, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)\
+          PyCode_New(a+k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)
+  #define __Pyx_DefaultClassType PyClass_Type
+#else
+  #define __Pyx_BUILTIN_MODULE_NAME "builtins"
+  #define __Pyx_DefaultClassType PyType_Type
+#if PY_VERSION_HEX >= 0x030B00A1
+    static CYTHON_INLINE PyCodeObject* __Pyx_PyCode_New(int a, int k, int l, int s, int f,
+                                                    PyObject *code, PyObject *c, PyObject* n, PyObject *v,
+                                                    PyObject *fv, PyObject *cell, PyObject* fn,
+                                                    PyObject *name, int fline, PyObject *lnos) {
+        PyObject *kwds=NULL, *argcount=NULL, *posonlyargcount=NULL, *kwonlyargcount=NULL;
+        PyObject *nlocals=NULL, *stacksize=NULL, *flags=NULL, *replace=NULL, *call_result=NULL, *empty=NULL;
+        const char *fn_cstr=NULL;
+        const char *name_cstr=NULL;
+        PyCodeObject* co=NULL;
+        PyObject *type, *value, *traceback;
+        PyErr_Fetch(&type, &value, &traceback);
+        if (!(kwds=PyDict_New())) goto end;
+        if (!(argcount=PyLong_FromLong(a))) goto end;
+        if (PyDict_SetItemString(kwds, "co_argcount", argcount) != 0) goto end;
+        if (!(posonlyargcount=PyLong_FromLong(0))) goto end;
+        if (PyDict_SetItemString(kwds, "co_posonlyargcount", posonlyargcount) != 0) goto end;
+        if (!(kwonlyargcount=PyLong_FromLong(k))) goto end;
+        if (PyDict_SetItemString(kwds, "co_kwonlyargcount", kwonlyargcount) != 0) goto end;
+        if (!(nlocals=PyLong_FromLong(l))) goto end;
+        if (PyDict_SetItemString(kwds, "co_nlocals", nlocals) != 0) goto end;
+        if (!(stacksize=PyLong_FromLong(s))) goto end;
+        if (PyDict_SetItemString(kwds, "co_stacksize", stacksize) != 0) goto end;
+        if (!(flags=PyLong_FromLong(f))) goto end;
+        if (PyDict_SetItemString(kwds, "co_flags", flags) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_code", code) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_consts", c) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_names", n) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_varnames", v) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_freevars", fv) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_cellvars", cell) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_linetable", lnos) != 0) goto end;
+        if (!(fn_cstr=PyUnicode_AsUTF8AndSize(fn, NULL))) goto end;
+        if (!(name_cstr=PyUnicode_AsUTF8AndSize(name, NULL))) goto end;
+        if (!(co = PyCode_NewEmpty(fn_cstr, name_cstr, fline))) goto end;
+        if (!(replace = PyObject_GetAttrString((PyObject*)co, "replace"))) goto cleanup_code_too;
+        if (!(empty = PyTuple_New(0))) goto cleanup_code_too; // unfortunately __pyx_empty_tuple isn't available here
+        if (!(call_result = PyObject_Call(replace, empty, kwds))) goto cleanup_code_too;
+        Py_XDECREF((PyObject*)co);
+        co = (PyCodeObject*)call_result;
+        call_result = NULL;
+        if (0) {
+            cleanup_code_too:
+            Py_XDECREF((PyObject*)co);
+            co = NULL;
+        }
+        end:
+        Py_XDECREF(kwds);
+        Py_XDECREF(argcount);
+        Py_XDECREF(posonlyargcount);
+        Py_XDECREF(kwonlyargcount);
+        Py_XDECREF(nlocals);
+        Py_XDECREF(stacksize);
+        Py_XDECREF(replace);
+        Py_XDECREF(call_result);
+        Py_XDECREF(empty);
+        if (type) {
+            PyErr_Restore(type, value, traceback);
+        }
+        return co;
+    }
+#else
+  #define __Pyx_PyCode_New(a, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)\
+          PyCode_New(a, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)
+#endif
+  #define __Pyx_DefaultClassType PyType_Type
+#endif
+#if PY_VERSION_HEX >= 0x030900F0 && !CYTHON_COMPILING_IN_PYPY
+  #define __Pyx_PyObject_GC_IsFinalized(o) PyObject_GC_IsFinalized(o)
+#else
+  #define __Pyx_PyObject_GC_IsFinalized(o) _PyGC_FINALIZED(o)
+#endif
+#ifndef Py_TPFLAGS_CHECKTYPES
+  #define Py_TPFLAGS_CHECKTYPES 0
+#endif
+#ifndef Py_TPFLAGS_HAVE_INDEX
+  #define Py_TPFLAGS_HAVE_INDEX 0
+#endif
+#ifndef Py_TPFLAGS_HAVE_NEWBUFFER
+  #define Py_TPFLAGS_HAVE_NEWBUFFER 0
+#endif
+#ifndef Py_TPFLAGS_HAVE_FINALIZE
+  #define Py_TPFLAGS_HAVE_FINALIZE 0
+#endif
+#ifndef METH_STACKLESS
+  #define METH_STACKLESS 0
+#endif
+#if PY_VERSION_HEX <= 0x030700A3 || !defined(METH_FASTCALL)
+  #ifndef METH_FASTCALL
+     #define METH_FASTCALL 0x80
+  #endif
+  typedef PyObject *(*__Pyx_PyCFunctionFast) (PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+  typedef PyObject *(*__Pyx_PyCFunctionFastWithKeywords) (PyObject *self, PyObject *const *args,
+                                                          Py_ssize_t nargs, PyObject *kwnames);
+#else
+  #define __Pyx_PyCFunctionFast _PyCFunctionFast
+  #define __Pyx_PyCFunctionFastWithKeywords _PyCFunctionFastWithKeywords
+#endif
+#if CYTHON_FAST_PYCCALL
+#define __Pyx_PyFastCFunction_Check(func)\
+    ((PyCFunction_Check(func) && (METH_FASTCALL == (PyCFunction_GET_FLAGS(func) & ~(METH_CLASS | METH_STATIC | METH_COEXIST | METH_KEYWORDS | METH_STACKLESS)))))
+#else
+#define __Pyx_PyFastCFunction_Check(func) 0
+#endif
+#if CYTHON_COMPILING_IN_PYPY && !defined(PyObject_Malloc)
+  #define PyObject_Malloc(s)   PyMem_Malloc(s)
+  #define PyObject_Free(p)     PyMem_Free(p)
+  #define PyObject_Realloc(p)  PyMem_Realloc(p)
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030400A1
+  #define PyMem_RawMalloc(n)           PyMem_Malloc(n)
+  #define PyMem_RawRealloc(p, n)       PyMem_Realloc(p, n)
+  #define PyMem_RawFree(p)             PyMem_Free(p)
+#endif
+#if CYTHON_COMPILING_IN_PYSTON
+  #define __Pyx_PyCode_HasFreeVars(co)  PyCode_HasFreeVars(co)
+  #define __Pyx_PyFrame_SetLineNumber(frame, lineno) PyFrame_SetLineNumber(frame, lineno)
+#else
+  #define __Pyx_PyCode_HasFreeVars(co)  (PyCode_GetNumFree(co) > 0)
+  #define __Pyx_PyFrame_SetLineNumber(frame, lineno)  (frame)->f_lineno = (lineno)
+#endif
+#if !CYTHON_FAST_THREAD_STATE || PY_VERSION_HEX < 0x02070000
+  #define __Pyx_PyThreadState_Current PyThreadState_GET()
+#elif PY_VERSION_HEX >= 0x03060000
+  #define __Pyx_PyThreadState_Current _PyThreadState_UncheckedGet()
+#elif PY_VERSION_HEX >= 0x03000000
+  #define __Pyx_PyThreadState_Current PyThreadState_GET()
+#else
+  #define __Pyx_PyThreadState_Current _PyThreadState_Current
+#endif
+#if PY_VERSION_HEX < 0x030700A2 && !defined(PyThread_tss_create) && !defined(Py_tss_NEEDS_INIT)
+#include "pythread.h"
+#define Py_tss_NEEDS_INIT 0
+typedef int Py_tss_t;
+static CYTHON_INLINE int PyThread_tss_create(Py_tss_t *key) {
+  *key = PyThread_create_key();
+  return 0;
+}
+static CYTHON_INLINE Py_tss_t * PyThread_tss_alloc(void) {
+  Py_tss_t *key = (Py_tss_t *)PyObject_Malloc(sizeof(Py_tss_t));
+  *key = Py_tss_NEEDS_INIT;
+  return key;
+}
+static CYTHON_INLINE void PyThread_tss_free(Py_tss_t *key) {
+  PyObject_Free(key);
+}
+static CYTHON_INLINE int PyThread_tss_is_created(Py_tss_t *key) {
+  return *key != Py_tss_NEEDS_INIT;
+}
+static CYTHON_INLINE void PyThread_tss_delete(Py_tss_t *key) {
+  PyThread_delete_key(*key);
+  *key = Py_tss_NEEDS_INIT;
+}
+static CYTHON_INLINE int PyThread_tss_set(Py_tss_t *key, void *value) {
+  return PyThread_set_key_value(*key, value);
+}
+static CYTHON_INLINE void * PyThread_tss_get(Py_tss_t *key) {
+  return PyThread_get_key_value(*key);
+}
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON || defined(_PyDict_NewPresized)
+#define __Pyx_PyDict_NewPresized(n)  ((n <= 8) ? PyDict_New() : _PyDict_NewPresized(n))
+#else
+#define __Pyx_PyDict_NewPresized(n)  PyDict_New()
+#endif
+#if PY_MAJOR_VERSION >= 3 || CYTHON_FUTURE_DIVISION
+  #define __Pyx_PyNumber_Divide(x,y)         PyNumber_TrueDivide(x,y)
+  #define __Pyx_PyNumber_InPlaceDivide(x,y)  PyNumber_InPlaceTrueDivide(x,y)
+#else
+  #define __Pyx_PyNumber_Divide(x,y)         PyNumber_Divide(x,y)
+  #define __Pyx_PyNumber_InPlaceDivide(x,y)  PyNumber_InPlaceDivide(x,y)
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030500A1 && CYTHON_USE_UNICODE_INTERNALS
+#define __Pyx_PyDict_GetItemStr(dict, name)  _PyDict_GetItem_KnownHash(dict, name, ((PyASCIIObject *) name)->hash)
+#else
+#define __Pyx_PyDict_GetItemStr(dict, name)  PyDict_GetItem(dict, name)
+#endif
+#if PY_VERSION_HEX > 0x03030000 && defined(PyUnicode_KIND)
+  #define CYTHON_PEP393_ENABLED 1
+  #if PY_VERSION_HEX >= 0x030C0000
+    #define __Pyx_PyUnicode_READY(op)       (0)
+  #else
+    #define __Pyx_PyUnicode_READY(op)       (likely(PyUnicode_IS_READY(op)) ?\
+                                                0 : _PyUnicode_Ready((PyObject *)(op)))
+  #endif
+  #define __Pyx_PyUnicode_GET_LENGTH(u)   PyUnicode_GET_LENGTH(u)
+  #define __Pyx_PyUnicode_READ_CHAR(u, i) PyUnicode_READ_CHAR(u, i)
+  #define __Pyx_PyUnicode_MAX_CHAR_VALUE(u)   PyUnicode_MAX_CHAR_VALUE(u)
+  #define __Pyx_PyUnicode_KIND(u)         PyUnicode_KIND(u)
+  #define __Pyx_PyUnicode_DATA(u)         PyUnicode_DATA(u)
+  #define __Pyx_PyUnicode_READ(k, d, i)   PyUnicode_READ(k, d, i)
+  #define __Pyx_PyUnicode_WRITE(k, d, i, ch)  PyUnicode_WRITE(k, d, i, ch)
+  #if PY_VERSION_HEX >= 0x030C0000
+    #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != PyUnicode_GET_LENGTH(u))
+  #else
+    #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x03090000
+    #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != (likely(PyUnicode_IS_READY(u)) ? PyUnicode_GET_LENGTH(u) : ((PyCompactUnicodeObject *)(u))->wstr_length))
+    #else
+    #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != (likely(PyUnicode_IS_READY(u)) ? PyUnicode_GET_LENGTH(u) : PyUnicode_GET_SIZE(u)))
+    #endif
+  #endif
+#else
+  #define CYTHON_PEP393_ENABLED 0
+  #define PyUnicode_1BYTE_KIND  1
+  #define PyUnicode_2BYTE_KIND  2
+  #define PyUnicode_4BYTE_KIND  4
+  #define __Pyx_PyUnicode_READY(op)       (0)
+  #define __Pyx_PyUnicode_GET_LENGTH(u)   PyUnicode_GET_SIZE(u)
+  #define __Pyx_PyUnicode_READ_CHAR(u, i) ((Py_UCS4)(PyUnicode_AS_UNICODE(u)[i]))
+  #define __Pyx_PyUnicode_MAX_CHAR_VALUE(u)   ((sizeof(Py_UNICODE) == 2) ? 65535 : 1114111)
+  #define __Pyx_PyUnicode_KIND(u)         (sizeof(Py_UNICODE))
+  #define __Pyx_PyUnicode_DATA(u)         ((void*)PyUnicode_AS_UNICODE(u))
+  #define __Pyx_PyUnicode_READ(k, d, i)   ((void)(k), (Py_UCS4)(((Py_UNICODE*)d)[i]))
+  #define __Pyx_PyUnicode_WRITE(k, d, i, ch)  (((void)(k)), ((Py_UNICODE*)d)[i] = ch)
+  #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != PyUnicode_GET_SIZE(u))
+#endif
+#if CYTHON_COMPILING_IN_PYPY
+  #define __Pyx_PyUnicode_Concat(a, b)      PyNumber_Add(a, b)
+  #define __Pyx_PyUnicode_ConcatSafe(a, b)  PyNumber_Add(a, b)
+#else
+  #define __Pyx_PyUnicode_Concat(a, b)      PyUnicode_Concat(a, b)
+  #define __Pyx_PyUnicode_ConcatSafe(a, b)  ((unlikely((a) == Py_None) || unlikely((b) == Py_None)) ?\
+      PyNumber_Add(a, b) : __Pyx_PyUnicode_Concat(a, b))
+#endif
+#if CYTHON_COMPILING_IN_PYPY && !defined(PyUnicode_Contains)
+  #define PyUnicode_Contains(u, s)  PySequence_Contains(u, s)
+#endif
+#if CYTHON_COMPILING_IN_PYPY && !defined(PyByteArray_Check)
+  #define PyByteArray_Check(obj)  PyObject_TypeCheck(obj, &PyByteArray_Type)
+#endif
+#if CYTHON_COMPILING_IN_PYPY && !defined(PyObject_Format)
+  #define PyObject_Format(obj, fmt)  PyObject_CallMethod(obj, "__format__", "O", fmt)
+#endif
+#define __Pyx_PyString_FormatSafe(a, b)   ((unlikely((a) == Py_None || (PyString_Check(b) && !PyString_CheckExact(b)))) ? PyNumber_Remainder(a, b) : __Pyx_PyString_Format(a, b))
+#define __Pyx_PyUnicode_FormatSafe(a, b)  ((unlikely((a) == Py_None || (PyUnicode_Check(b) && !PyUnicode_CheckExact(b)))) ? PyNumber_Remainder(a, b) : PyUnicode_Format(a, b))
+#if PY_MAJOR_VERSION >= 3
+  #define __Pyx_PyString_Format(a, b)  PyUnicode_Format(a, b)
+#else
+  #define __Pyx_PyString_Format(a, b)  PyString_Format(a, b)
+#endif
+#if PY_MAJOR_VERSION < 3 && !defined(PyObject_ASCII)
+  #define PyObject_ASCII(o)            PyObject_Repr(o)
+#endif
+#if PY_MAJOR_VERSION >= 3
+  #define PyBaseString_Type            PyUnicode_Type
+  #define PyStringObject               PyUnicodeObject
+  #define PyString_Type                PyUnicode_Type
+  #define PyString_Check               PyUnicode_Check
+  #define PyString_CheckExact          PyUnicode_CheckExact
+#ifndef PyObject_Unicode
+  #define PyObject_Unicode             PyObject_Str
+#endif
+#endif
+#if PY_MAJOR_VERSION >= 3
+  #define __Pyx_PyBaseString_Check(obj) PyUnicode_Check(obj)
+  #define __Pyx_PyBaseString_CheckExact(obj) PyUnicode_CheckExact(obj)
+#else
+  #define __Pyx_PyBaseString_Check(obj) (PyString_Check(obj) || PyUnicode_Check(obj))
+  #define __Pyx_PyBaseString_CheckExact(obj) (PyString_CheckExact(obj) || PyUnicode_CheckExact(obj))
+#endif
+#ifndef PySet_CheckExact
+  #define PySet_CheckExact(obj)        (Py_TYPE(obj) == &PySet_Type)
+#endif
+#if PY_VERSION_HEX >= 0x030900A4
+  #define __Pyx_SET_REFCNT(obj, refcnt) Py_SET_REFCNT(obj, refcnt)
+  #define __Pyx_SET_SIZE(obj, size) Py_SET_SIZE(obj, size)
+#else
+  #define __Pyx_SET_REFCNT(obj, refcnt) Py_REFCNT(obj) = (refcnt)
+  #define __Pyx_SET_SIZE(obj, size) Py_SIZE(obj) = (size)
+#endif
+#if CYTHON_ASSUME_SAFE_MACROS
+  #define __Pyx_PySequence_SIZE(seq)  Py_SIZE(seq)
+#else
+  #define __Pyx_PySequence_SIZE(seq)  PySequence_Size(seq)
+#endif
+#if PY_MAJOR_VERSION >= 3
+  #define PyIntObject                  PyLongObject
+  #define PyInt_Type                   PyLong_Type
+  #define PyInt_Check(op)              PyLong_Check(op)
+  #define PyInt_CheckExact(op)         PyLong_CheckExact(op)
+  #define PyInt_FromString             PyLong_FromString
+  #define PyInt_FromUnicode            PyLong_FromUnicode
+  #define PyInt_FromLong               PyLong_FromLong
+  #define PyInt_FromSize_t             PyLong_FromSize_t
+  #define PyInt_FromSsize_t            PyLong_FromSsize_t
+  #define PyInt_AsLong                 PyLong_AsLong
+  #define PyInt_AS_LONG                PyLong_AS_LONG
+  #define PyInt_AsSsize_t              PyLong_AsSsize_t
+  #define PyInt_AsUnsignedLongMask     PyLong_AsUnsignedLongMask
+  #define PyInt_AsUnsignedLongLongMask PyLong_AsUnsignedLongLongMask
+  #define PyNumber_Int                 PyNumber_Long
+#endif
+#if PY_MAJOR_VERSION >= 3
+  #define PyBoolObject                 PyLongObject
+#endif
+#if PY_MAJOR_VERSION >= 3 && CYTHON_COMPILING_IN_PYPY
+  #ifndef PyUnicode_InternFromString
+    #define PyUnicode_InternFromString(s) PyUnicode_FromString(s)
+  #endif
+#endif
+#if PY_VERSION_HEX < 0x030200A4
+  typedef long Py_hash_t;
+  #define __Pyx_PyInt_FromHash_t PyInt_FromLong
+  #define __Pyx_PyInt_AsHash_t   __Pyx_PyIndex_AsHash_t
+#else
+  #define __Pyx_PyInt_FromHash_t PyInt_FromSsize_t
+  #define __Pyx_PyInt_AsHash_t   __Pyx_PyIndex_AsSsize_t
+#endif
+#if PY_MAJOR_VERSION >= 3
+  #define __Pyx_PyMethod_New(func, self, klass) ((self) ? ((void)(klass), PyMethod_New(func, self)) : __Pyx_NewRef(func))
+#else
+  #define __Pyx_PyMethod_New(func, self, klass) PyMethod_New(func, self, klass)
+#endif
+#if CYTHON_USE_ASYNC_SLOTS
+  #if PY_VERSION_HEX >= 0x030500B1
+    #define __Pyx_PyAsyncMethodsStruct PyAsyncMethods
+    #define __Pyx_PyType_AsAsync(obj) (Py_TYPE(obj)->tp_as_async)
+  #else
+    #define __Pyx_PyType_AsAsync(obj) ((__Pyx_PyAsyncMethodsStruct*) (Py_TYPE(obj)->tp_reserved))
+  #endif
+#else
+  #define __Pyx_PyType_AsAsync(obj) NULL
+#endif
+#ifndef __Pyx_PyAsyncMethodsStruct
+    typedef struct {
+        unaryfunc am_await;
+        unaryfunc am_aiter;
+        unaryfunc am_anext;
+    } __Pyx_PyAsyncMethodsStruct;
+#endif
 
-typedef struct {PyObject **p; char *s;} __Pyx_InternTabEntry; /*proto*/
-typedef struct {PyObject **p; char *s; long n;} __Pyx_StringTabEntry; /*proto*/
+#if defined(_WIN32) || defined(WIN32) || defined(MS_WINDOWS)
+  #if !defined(_USE_MATH_DEFINES)
+    #define _USE_MATH_DEFINES
+  #endif
+#endif
+#include <math.h>
+#ifdef NAN
+#define __PYX_NAN() ((float) NAN)
+#else
+static CYTHON_INLINE float __PYX_NAN() {
+  float value;
+  memset(&value, 0xFF, sizeof(value));
+  return value;
+}
+#endif
+#if defined(__CYGWIN__) && defined(_LDBL_EQ_DBL)
+#define __Pyx_truncl trunc
+#else
+#define __Pyx_truncl truncl
+#endif
 
-static PyObject *__pyx_m;
-static PyObject *__pyx_b;
-static int __pyx_lineno;
-static char *__pyx_filename;
-static char **__pyx_f;
+#define __PYX_MARK_ERR_POS(f_index, lineno) \
+    { __pyx_filename = __pyx_f[f_index]; (void)__pyx_filename; __pyx_lineno = lineno; (void)__pyx_lineno; __pyx_clineno = __LINE__; (void)__pyx_clineno; }
+#define __PYX_ERR(f_index, lineno, Ln_error) \
+    { __PYX_MARK_ERR_POS(f_index, lineno) goto Ln_error; }
 
-static char __pyx_mdoc[] = "C Speedups for commonly-used operations";
+#ifndef __PYX_EXTERN_C
+  #ifdef __cplusplus
+    #define __PYX_EXTERN_C extern "C"
+  #else
+    #define __PYX_EXTERN_C extern
+  #endif
+#endif
 
-static PyObject *__Pyx_Import(PyObject *name, PyObject *from_list); /*proto*/
+#define __PYX_HAVE__protocols___speedups
+#define __PYX_HAVE_API__protocols___speedups
+/* Early includes */
+#ifdef _OPENMP
+#include <omp.h>
+#endif /* _OPENMP */
 
-static PyObject *__Pyx_GetName(PyObject *dict, PyObject *name); /*proto*/
+#if defined(PYREX_WITHOUT_ASSERTIONS) && !defined(CYTHON_WITHOUT_ASSERTIONS)
+#define CYTHON_WITHOUT_ASSERTIONS
+#endif
 
-static PyObject *__Pyx_GetExcValue(void); /*proto*/
+typedef struct {PyObject **p; const char *s; const Py_ssize_t n; const char* encoding;
+                const char is_unicode; const char is_str; const char intern; } __Pyx_StringTabEntry;
 
-static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb); /*proto*/
+#define __PYX_DEFAULT_STRING_ENCODING_IS_ASCII 0
+#define __PYX_DEFAULT_STRING_ENCODING_IS_UTF8 0
+#define __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT (PY_MAJOR_VERSION >= 3 && __PYX_DEFAULT_STRING_ENCODING_IS_UTF8)
+#define __PYX_DEFAULT_STRING_ENCODING ""
+#define __Pyx_PyObject_FromString __Pyx_PyBytes_FromString
+#define __Pyx_PyObject_FromStringAndSize __Pyx_PyBytes_FromStringAndSize
+#define __Pyx_uchar_cast(c) ((unsigned char)c)
+#define __Pyx_long_cast(x) ((long)x)
+#define __Pyx_fits_Py_ssize_t(v, type, is_signed)  (\
+    (sizeof(type) < sizeof(Py_ssize_t))  ||\
+    (sizeof(type) > sizeof(Py_ssize_t) &&\
+          likely(v < (type)PY_SSIZE_T_MAX ||\
+                 v == (type)PY_SSIZE_T_MAX)  &&\
+          (!is_signed || likely(v > (type)PY_SSIZE_T_MIN ||\
+                                v == (type)PY_SSIZE_T_MIN)))  ||\
+    (sizeof(type) == sizeof(Py_ssize_t) &&\
+          (is_signed || likely(v < (type)PY_SSIZE_T_MAX ||\
+                               v == (type)PY_SSIZE_T_MAX)))  )
+static CYTHON_INLINE int __Pyx_is_valid_index(Py_ssize_t i, Py_ssize_t limit) {
+    return (size_t) i < (size_t) limit;
+}
+#if defined (__cplusplus) && __cplusplus >= 201103L
+    #include <cstdlib>
+    #define __Pyx_sst_abs(value) std::abs(value)
+#elif SIZEOF_INT >= SIZEOF_SIZE_T
+    #define __Pyx_sst_abs(value) abs(value)
+#elif SIZEOF_LONG >= SIZEOF_SIZE_T
+    #define __Pyx_sst_abs(value) labs(value)
+#elif defined (_MSC_VER)
+    #define __Pyx_sst_abs(value) ((Py_ssize_t)_abs64(value))
+#elif defined (__STDC_VERSION__) && __STDC_VERSION__ >= 199901L
+    #define __Pyx_sst_abs(value) llabs(value)
+#elif defined (__GNUC__)
+    #define __Pyx_sst_abs(value) __builtin_llabs(value)
+#else
+    #define __Pyx_sst_abs(value) ((value<0) ? -value : value)
+#endif
+static CYTHON_INLINE const char* __Pyx_PyObject_AsString(PyObject*);
+static CYTHON_INLINE const char* __Pyx_PyObject_AsStringAndSize(PyObject*, Py_ssize_t* length);
+#define __Pyx_PyByteArray_FromString(s) PyByteArray_FromStringAndSize((const char*)s, strlen((const char*)s))
+#define __Pyx_PyByteArray_FromStringAndSize(s, l) PyByteArray_FromStringAndSize((const char*)s, l)
+#define __Pyx_PyBytes_FromString        PyBytes_FromString
+#define __Pyx_PyBytes_FromStringAndSize PyBytes_FromStringAndSize
+static CYTHON_INLINE PyObject* __Pyx_PyUnicode_FromString(const char*);
+#if PY_MAJOR_VERSION < 3
+    #define __Pyx_PyStr_FromString        __Pyx_PyBytes_FromString
+    #define __Pyx_PyStr_FromStringAndSize __Pyx_PyBytes_FromStringAndSize
+#else
+    #define __Pyx_PyStr_FromString        __Pyx_PyUnicode_FromString
+    #define __Pyx_PyStr_FromStringAndSize __Pyx_PyUnicode_FromStringAndSize
+#endif
+#define __Pyx_PyBytes_AsWritableString(s)     ((char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyBytes_AsWritableSString(s)    ((signed char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyBytes_AsWritableUString(s)    ((unsigned char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyBytes_AsString(s)     ((const char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyBytes_AsSString(s)    ((const signed char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyBytes_AsUString(s)    ((const unsigned char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyObject_AsWritableString(s)    ((char*) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_AsWritableSString(s)    ((signed char*) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_AsWritableUString(s)    ((unsigned char*) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_AsSString(s)    ((const signed char*) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_AsUString(s)    ((const unsigned char*) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_FromCString(s)  __Pyx_PyObject_FromString((const char*)s)
+#define __Pyx_PyBytes_FromCString(s)   __Pyx_PyBytes_FromString((const char*)s)
+#define __Pyx_PyByteArray_FromCString(s)   __Pyx_PyByteArray_FromString((const char*)s)
+#define __Pyx_PyStr_FromCString(s)     __Pyx_PyStr_FromString((const char*)s)
+#define __Pyx_PyUnicode_FromCString(s) __Pyx_PyUnicode_FromString((const char*)s)
+static CYTHON_INLINE size_t __Pyx_Py_UNICODE_strlen(const Py_UNICODE *u) {
+    const Py_UNICODE *u_end = u;
+    while (*u_end++) ;
+    return (size_t)(u_end - u - 1);
+}
+#define __Pyx_PyUnicode_FromUnicode(u)       PyUnicode_FromUnicode(u, __Pyx_Py_UNICODE_strlen(u))
+#define __Pyx_PyUnicode_FromUnicodeAndLength PyUnicode_FromUnicode
+#define __Pyx_PyUnicode_AsUnicode            PyUnicode_AsUnicode
+#define __Pyx_NewRef(obj) (Py_INCREF(obj), obj)
+#define __Pyx_Owned_Py_None(b) __Pyx_NewRef(Py_None)
+static CYTHON_INLINE PyObject * __Pyx_PyBool_FromLong(long b);
+static CYTHON_INLINE int __Pyx_PyObject_IsTrue(PyObject*);
+static CYTHON_INLINE int __Pyx_PyObject_IsTrueAndDecref(PyObject*);
+static CYTHON_INLINE PyObject* __Pyx_PyNumber_IntOrLong(PyObject* x);
+#define __Pyx_PySequence_Tuple(obj)\
+    (likely(PyTuple_CheckExact(obj)) ? __Pyx_NewRef(obj) : PySequence_Tuple(obj))
+static CYTHON_INLINE Py_ssize_t __Pyx_PyIndex_AsSsize_t(PyObject*);
+static CYTHON_INLINE PyObject * __Pyx_PyInt_FromSize_t(size_t);
+static CYTHON_INLINE Py_hash_t __Pyx_PyIndex_AsHash_t(PyObject*);
+#if CYTHON_ASSUME_SAFE_MACROS
+#define __pyx_PyFloat_AsDouble(x) (PyFloat_CheckExact(x) ? PyFloat_AS_DOUBLE(x) : PyFloat_AsDouble(x))
+#else
+#define __pyx_PyFloat_AsDouble(x) PyFloat_AsDouble(x)
+#endif
+#define __pyx_PyFloat_AsFloat(x) ((float) __pyx_PyFloat_AsDouble(x))
+#if PY_MAJOR_VERSION >= 3
+#define __Pyx_PyNumber_Int(x) (PyLong_CheckExact(x) ? __Pyx_NewRef(x) : PyNumber_Long(x))
+#else
+#define __Pyx_PyNumber_Int(x) (PyInt_CheckExact(x) ? __Pyx_NewRef(x) : PyNumber_Int(x))
+#endif
+#define __Pyx_PyNumber_Float(x) (PyFloat_CheckExact(x) ? __Pyx_NewRef(x) : PyNumber_Float(x))
+#if PY_MAJOR_VERSION < 3 && __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
+static int __Pyx_sys_getdefaultencoding_not_ascii;
+static int __Pyx_init_sys_getdefaultencoding_params(void) {
+    PyObject* sys;
+    PyObject* default_encoding = NULL;
+    PyObject* ascii_chars_u = NULL;
+    PyObject* ascii_chars_b = NULL;
+    const char* default_encoding_c;
+    sys = PyImport_ImportModule("sys");
+    if (!sys) goto bad;
+    default_encoding = PyObject_CallMethod(sys, (char*) "getdefaultencoding", NULL);
+    Py_DECREF(sys);
+    if (!default_encoding) goto bad;
+    default_encoding_c = PyBytes_AsString(default_encoding);
+    if (!default_encoding_c) goto bad;
+    if (strcmp(default_encoding_c, "ascii") == 0) {
+        __Pyx_sys_getdefaultencoding_not_ascii = 0;
+    } else {
+        char ascii_chars[128];
+        int c;
+        for (c = 0; c < 128; c++) {
+            ascii_chars[c] = c;
+        }
+        __Pyx_sys_getdefaultencoding_not_ascii = 1;
+        ascii_chars_u = PyUnicode_DecodeASCII(ascii_chars, 128, NULL);
+        if (!ascii_chars_u) goto bad;
+        ascii_chars_b = PyUnicode_AsEncodedString(ascii_chars_u, default_encoding_c, NULL);
+        if (!ascii_chars_b || !PyBytes_Check(ascii_chars_b) || memcmp(ascii_chars, PyBytes_AS_STRING(ascii_chars_b), 128) != 0) {
+            PyErr_Format(
+                PyExc_ValueError,
+                "This module compiled with c_string_encoding=ascii, but default encoding '%.200s' is not a superset of ascii.",
+                default_encoding_c);
+            goto bad;
+        }
+        Py_DECREF(ascii_chars_u);
+        Py_DECREF(ascii_chars_b);
+    }
+    Py_DECREF(default_encoding);
+    return 0;
+bad:
+    Py_XDECREF(default_encoding);
+    Py_XDECREF(ascii_chars_u);
+    Py_XDECREF(ascii_chars_b);
+    return -1;
+}
+#endif
+#if __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT && PY_MAJOR_VERSION >= 3
+#define __Pyx_PyUnicode_FromStringAndSize(c_str, size) PyUnicode_DecodeUTF8(c_str, size, NULL)
+#else
+#define __Pyx_PyUnicode_FromStringAndSize(c_str, size) PyUnicode_Decode(c_str, size, __PYX_DEFAULT_STRING_ENCODING, NULL)
+#if __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT
+static char* __PYX_DEFAULT_STRING_ENCODING;
+static int __Pyx_init_sys_getdefaultencoding_params(void) {
+    PyObject* sys;
+    PyObject* default_encoding = NULL;
+    char* default_encoding_c;
+    sys = PyImport_ImportModule("sys");
+    if (!sys) goto bad;
+    default_encoding = PyObject_CallMethod(sys, (char*) (const char*) "getdefaultencoding", NULL);
+    Py_DECREF(sys);
+    if (!default_encoding) goto bad;
+    default_encoding_c = PyBytes_AsString(default_encoding);
+    if (!default_encoding_c) goto bad;
+    __PYX_DEFAULT_STRING_ENCODING = (char*) malloc(strlen(default_encoding_c) + 1);
+    if (!__PYX_DEFAULT_STRING_ENCODING) goto bad;
+    strcpy(__PYX_DEFAULT_STRING_ENCODING, default_encoding_c);
+    Py_DECREF(default_encoding);
+    return 0;
+bad:
+    Py_XDECREF(default_encoding);
+    return -1;
+}
+#endif
+#endif
 
-static void __Pyx_ReRaise(void); /*proto*/
 
-static int __Pyx_InternStrings(__Pyx_InternTabEntry *t); /*proto*/
+/* Test for GCC > 2.95 */
+#if defined(__GNUC__)     && (__GNUC__ > 2 || (__GNUC__ == 2 && (__GNUC_MINOR__ > 95)))
+  #define likely(x)   __builtin_expect(!!(x), 1)
+  #define unlikely(x) __builtin_expect(!!(x), 0)
+#else /* !__GNUC__ or GCC < 2.95 */
+  #define likely(x)   (x)
+  #define unlikely(x) (x)
+#endif /* __GNUC__ */
+static CYTHON_INLINE void __Pyx_pretend_to_initialize(void* ptr) { (void)ptr; }
 
-static int __Pyx_InitStrings(__Pyx_StringTabEntry *t); /*proto*/
+static PyObject *__pyx_m = NULL;
+static PyObject *__pyx_d;
+static PyObject *__pyx_b;
+static PyObject *__pyx_cython_runtime = NULL;
+static PyObject *__pyx_empty_tuple;
+static PyObject *__pyx_empty_bytes;
+static PyObject *__pyx_empty_unicode;
+static int __pyx_lineno;
+static int __pyx_clineno = 0;
+static const char * __pyx_cfilenm= __FILE__;
+static const char *__pyx_filename;
 
-static void __Pyx_AddTraceback(char *funcname); /*proto*/
 
-/* Declarations from _speedups */
+static const char *__pyx_f[] = {
+  "_speedups.pyx",
+  "stringsource",
+};
 
+/*--- Type declarations ---*/
+struct __pyx_obj_9protocols_9_speedups_metamethod;
+struct __pyx_obj_9protocols_9_speedups_AdapterChain;
+struct __pyx_obj_9protocols_9_speedups_AdapterRecord;
 
-struct __pyx_obj_9_speedups_metamethod {
+/* "protocols/_speedups.pyx":142
+ * 
+ * 
+ * cdef class metamethod:             # <<<<<<<<<<<<<<
+ *     """Wrapper for metaclass method that might be confused w/instance method"""
+ * 
+ */
+struct __pyx_obj_9protocols_9_speedups_metamethod {
   PyObject_HEAD
   PyObject *func;
 };
 
-static PyTypeObject *__pyx_ptype_9_speedups_metamethod = 0;
-static PyObject *__pyx_v_9_speedups__marker;
-static PyObject *__pyx_v_9_speedups___conform;
-static PyObject *__pyx_v_9_speedups___adapt;
-static PyObject *__pyx_v_9_speedups___mro;
-static PyObject *__pyx_v_9_speedups___ECType;
-static PyObject *__pyx_k19;
-static PyObject *__pyx_k20;
-static PyObject *__pyx_k21;
-static PyObject *__pyx_k22;
-static PyObject *__pyx_k23;
-static PyObject *__pyx_k24;
-static PyObject *__pyx_k25;
-static PyObject *(__pyx_f_9_speedups__adapt(PyObject *,PyObject *,PyObject *)); /*proto*/
-static PyObject *(__pyx_f_9_speedups_buildClassicMRO(PyClassObject (*),PyListObject (*))); /*proto*/
-static PyObject *(__pyx_f_9_speedups_buildECMRO(PyObject *,PyListObject (*))); /*proto*/
-
-
-/* Implementation of _speedups */
-
-static char (__pyx_k11[]) = "protocols.adapters";
-static char (__pyx_k15[]) = "__conform__";
-static char (__pyx_k16[]) = "__adapt__";
-static char (__pyx_k17[]) = "__class__";
-static char (__pyx_k18[]) = "__mro__";
-
-static PyObject *__pyx_n___all__;
-static PyObject *__pyx_n_exc_info;
-static PyObject *__pyx_n_AdaptationFailure;
-static PyObject *__pyx_n_ExtensionClass;
-static PyObject *__pyx_n___class;
-static PyObject *__pyx_n_NO_ADAPTER_NEEDED;
-static PyObject *__pyx_n_DOES_NOT_SUPPORT;
-static PyObject *__pyx_n_adapt;
-static PyObject *__pyx_n_Protocol__call__;
-static PyObject *__pyx_n_classicMRO;
-static PyObject *__pyx_n_extClassMRO;
-static PyObject *__pyx_n_getMRO;
-static PyObject *__pyx_n_Protocol__adapt__;
-static PyObject *__pyx_n_metamethod;
-static PyObject *__pyx_n_sys;
-static PyObject *__pyx_n_ImportError;
-static PyObject *__pyx_n_object;
-static PyObject *__pyx_n_False;
-
-static PyObject *__pyx_k11p;
-
-static PyObject *__pyx_f_9_speedups_NO_ADAPTER_NEEDED(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static char __pyx_doc_9_speedups_NO_ADAPTER_NEEDED[] = "Assume \'obj\' implements \'protocol\' directly";
-static PyObject *__pyx_f_9_speedups_NO_ADAPTER_NEEDED(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  PyObject *__pyx_v_obj = 0;
-  PyObject *__pyx_v_protocol = 0;
-  PyObject *__pyx_r;
-  static char *__pyx_argnames[] = {"obj","protocol",0};
-  __pyx_v_protocol = __pyx_k19;
-  if (!PyArg_ParseTupleAndKeywords(__pyx_args, __pyx_kwds, "O|O", __pyx_argnames, &__pyx_v_obj, &__pyx_v_protocol)) return 0;
-  Py_INCREF(__pyx_v_obj);
-  Py_INCREF(__pyx_v_protocol);
-
-  /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":87 */
-  Py_INCREF(__pyx_v_obj);
-  __pyx_r = __pyx_v_obj;
-  goto __pyx_L0;
 
-  __pyx_r = Py_None; Py_INCREF(Py_None);
-  __pyx_L0:;
-  Py_DECREF(__pyx_v_obj);
-  Py_DECREF(__pyx_v_protocol);
-  return __pyx_r;
-}
+/* "protocols/_speedups.pyx":162
+ * 
+ * 
+ * cdef class AdapterChain:             # <<<<<<<<<<<<<<
+ *     """Adapter factory that applies a sequence of adapters in turn"""
+ * 
+ */
+struct __pyx_obj_9protocols_9_speedups_AdapterChain {
+  PyObject_HEAD
+  PyObject *adapters;
+  int count;
+};
 
-static PyObject *__pyx_f_9_speedups_DOES_NOT_SUPPORT(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static char __pyx_doc_9_speedups_DOES_NOT_SUPPORT[] = "Prevent \'obj\' from supporting \'protocol\'";
-static PyObject *__pyx_f_9_speedups_DOES_NOT_SUPPORT(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  PyObject *__pyx_v_obj = 0;
-  PyObject *__pyx_v_protocol = 0;
-  PyObject *__pyx_r;
-  static char *__pyx_argnames[] = {"obj","protocol",0};
-  __pyx_v_protocol = __pyx_k20;
-  if (!PyArg_ParseTupleAndKeywords(__pyx_args, __pyx_kwds, "O|O", __pyx_argnames, &__pyx_v_obj, &__pyx_v_protocol)) return 0;
-  Py_INCREF(__pyx_v_obj);
-  Py_INCREF(__pyx_v_protocol);
 
-  /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":91 */
-  Py_INCREF(Py_None);
-  __pyx_r = Py_None;
-  goto __pyx_L0;
+/* "protocols/_speedups.pyx":193
+ * 
+ * 
+ * cdef class AdapterRecord:             # <<<<<<<<<<<<<<
+ *     """An adapter registered at an implication depth, in an adapter registry"""
+ * 
+ */
+struct __pyx_obj_9protocols_9_speedups_AdapterRecord {
+  PyObject_HEAD
+  PyObject *adapter;
+  PyObject *depth;
+  PyObject *count;
+  PyObject *unbound;
+};
 
-  __pyx_r = Py_None; Py_INCREF(Py_None);
-  __pyx_L0:;
-  Py_DECREF(__pyx_v_obj);
-  Py_DECREF(__pyx_v_protocol);
-  return __pyx_r;
-}
 
-static int __pyx_f_9_speedups_10metamethod___init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static int __pyx_f_9_speedups_10metamethod___init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  PyObject *__pyx_v_func = 0;
-  int __pyx_r;
-  static char *__pyx_argnames[] = {"func",0};
-  if (!PyArg_ParseTupleAndKeywords(__pyx_args, __pyx_kwds, "O", __pyx_argnames, &__pyx_v_func)) return -1;
-  Py_INCREF(__pyx_v_self);
-  Py_INCREF(__pyx_v_func);
+/* --- Runtime support code (head) --- */
+/* Refnanny.proto */
+#ifndef CYTHON_REFNANNY
+  #define CYTHON_REFNANNY 0
+#endif
+#if CYTHON_REFNANNY
+  typedef struct {
+    void (*INCREF)(void*, PyObject*, int);
+    void (*DECREF)(void*, PyObject*, int);
+    void (*GOTREF)(void*, PyObject*, int);
+    void (*GIVEREF)(void*, PyObject*, int);
+    void* (*SetupContext)(const char*, int, const char*);
+    void (*FinishContext)(void**);
+  } __Pyx_RefNannyAPIStruct;
+  static __Pyx_RefNannyAPIStruct *__Pyx_RefNanny = NULL;
+  static __Pyx_RefNannyAPIStruct *__Pyx_RefNannyImportAPI(const char *modname);
+  #define __Pyx_RefNannyDeclarations void *__pyx_refnanny = NULL;
+#ifdef WITH_THREAD
+  #define __Pyx_RefNannySetupContext(name, acquire_gil)\
+          if (acquire_gil) {\
+              PyGILState_STATE __pyx_gilstate_save = PyGILState_Ensure();\
+              __pyx_refnanny = __Pyx_RefNanny->SetupContext((name), __LINE__, __FILE__);\
+              PyGILState_Release(__pyx_gilstate_save);\
+          } else {\
+              __pyx_refnanny = __Pyx_RefNanny->SetupContext((name), __LINE__, __FILE__);\
+          }
+#else
+  #define __Pyx_RefNannySetupContext(name, acquire_gil)\
+          __pyx_refnanny = __Pyx_RefNanny->SetupContext((name), __LINE__, __FILE__)
+#endif
+  #define __Pyx_RefNannyFinishContext()\
+          __Pyx_RefNanny->FinishContext(&__pyx_refnanny)
+  #define __Pyx_INCREF(r)  __Pyx_RefNanny->INCREF(__pyx_refnanny, (PyObject *)(r), __LINE__)
+  #define __Pyx_DECREF(r)  __Pyx_RefNanny->DECREF(__pyx_refnanny, (PyObject *)(r), __LINE__)
+  #define __Pyx_GOTREF(r)  __Pyx_RefNanny->GOTREF(__pyx_refnanny, (PyObject *)(r), __LINE__)
+  #define __Pyx_GIVEREF(r) __Pyx_RefNanny->GIVEREF(__pyx_refnanny, (PyObject *)(r), __LINE__)
+  #define __Pyx_XINCREF(r)  do { if((r) != NULL) {__Pyx_INCREF(r); }} while(0)
+  #define __Pyx_XDECREF(r)  do { if((r) != NULL) {__Pyx_DECREF(r); }} while(0)
+  #define __Pyx_XGOTREF(r)  do { if((r) != NULL) {__Pyx_GOTREF(r); }} while(0)
+  #define __Pyx_XGIVEREF(r) do { if((r) != NULL) {__Pyx_GIVEREF(r);}} while(0)
+#else
+  #define __Pyx_RefNannyDeclarations
+  #define __Pyx_RefNannySetupContext(name, acquire_gil)
+  #define __Pyx_RefNannyFinishContext()
+  #define __Pyx_INCREF(r) Py_INCREF(r)
+  #define __Pyx_DECREF(r) Py_DECREF(r)
+  #define __Pyx_GOTREF(r)
+  #define __Pyx_GIVEREF(r)
+  #define __Pyx_XINCREF(r) Py_XINCREF(r)
+  #define __Pyx_XDECREF(r) Py_XDECREF(r)
+  #define __Pyx_XGOTREF(r)
+  #define __Pyx_XGIVEREF(r)
+#endif
+#define __Pyx_XDECREF_SET(r, v) do {\
+        PyObject *tmp = (PyObject *) r;\
+        r = v; __Pyx_XDECREF(tmp);\
+    } while (0)
+#define __Pyx_DECREF_SET(r, v) do {\
+        PyObject *tmp = (PyObject *) r;\
+        r = v; __Pyx_DECREF(tmp);\
+    } while (0)
+#define __Pyx_CLEAR(r)    do { PyObject* tmp = ((PyObject*)(r)); r = NULL; __Pyx_DECREF(tmp);} while(0)
+#define __Pyx_XCLEAR(r)   do { if((r) != NULL) {PyObject* tmp = ((PyObject*)(r)); r = NULL; __Pyx_DECREF(tmp);}} while(0)
 
-  /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":100 */
-  Py_INCREF(__pyx_v_func);
-  Py_DECREF(((struct __pyx_obj_9_speedups_metamethod *)__pyx_v_self)->func);
-  ((struct __pyx_obj_9_speedups_metamethod *)__pyx_v_self)->func = __pyx_v_func;
+/* PyObjectGetAttrStr.proto */
+#if CYTHON_USE_TYPE_SLOTS
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStr(PyObject* obj, PyObject* attr_name);
+#else
+#define __Pyx_PyObject_GetAttrStr(o,n) PyObject_GetAttr(o,n)
+#endif
 
-  __pyx_r = 0;
-  Py_DECREF(__pyx_v_self);
-  Py_DECREF(__pyx_v_func);
-  return __pyx_r;
-}
+/* GetBuiltinName.proto */
+static PyObject *__Pyx_GetBuiltinName(PyObject *name);
 
-static PyObject *__pyx_f_9_speedups_10metamethod___get__(PyObject *__pyx_v_self, PyObject *__pyx_v_ob, PyObject *__pyx_v_typ); /*proto*/
-static PyObject *__pyx_f_9_speedups_10metamethod___get__(PyObject *__pyx_v_self, PyObject *__pyx_v_ob, PyObject *__pyx_v_typ) {
-  PyObject *__pyx_r;
-  int __pyx_1;
-  PyObject *__pyx_2 = 0;
-  Py_INCREF(__pyx_v_self);
-  Py_INCREF(__pyx_v_ob);
-  Py_INCREF(__pyx_v_typ);
+/* RaiseDoubleKeywords.proto */
+static void __Pyx_RaiseDoubleKeywordsError(const char* func_name, PyObject* kw_name);
 
-  /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":103 */
-  __pyx_1 = __pyx_v_ob == Py_None;
-  if (__pyx_1) {
+/* ParseKeywords.proto */
+static int __Pyx_ParseOptionalKeywords(PyObject *kwds, PyObject **argnames[],\
+    PyObject *kwds2, PyObject *values[], Py_ssize_t num_pos_args,\
+    const char* function_name);
 
-    /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":104 */
-    Py_INCREF(__pyx_v_self);
-    __pyx_r = __pyx_v_self;
-    goto __pyx_L0;
-    goto __pyx_L2;
-  }
-  __pyx_L2:;
+/* RaiseArgTupleInvalid.proto */
+static void __Pyx_RaiseArgtupleInvalid(const char* func_name, int exact,
+    Py_ssize_t num_min, Py_ssize_t num_max, Py_ssize_t num_found);
 
-  /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":105 */
-  __pyx_2 = PyMethod_New(((struct __pyx_obj_9_speedups_metamethod *)__pyx_v_self)->func,__pyx_v_ob,__pyx_v_typ); if (!__pyx_2) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 105; goto __pyx_L1;}
-  __pyx_r = __pyx_2;
-  __pyx_2 = 0;
-  goto __pyx_L0;
+/* PyObjectCall.proto */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_Call(PyObject *func, PyObject *arg, PyObject *kw);
+#else
+#define __Pyx_PyObject_Call(func, arg, kw) PyObject_Call(func, arg, kw)
+#endif
 
-  __pyx_r = Py_None; Py_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1:;
-  Py_XDECREF(__pyx_2);
-  __Pyx_AddTraceback("_speedups.metamethod.__get__");
-  __pyx_r = 0;
-  __pyx_L0:;
-  Py_DECREF(__pyx_v_self);
-  Py_DECREF(__pyx_v_ob);
-  Py_DECREF(__pyx_v_typ);
-  return __pyx_r;
-}
+/* PyThreadStateGet.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_PyThreadState_declare  PyThreadState *__pyx_tstate;
+#define __Pyx_PyThreadState_assign  __pyx_tstate = __Pyx_PyThreadState_Current;
+#define __Pyx_PyErr_Occurred()  __pyx_tstate->curexc_type
+#else
+#define __Pyx_PyThreadState_declare
+#define __Pyx_PyThreadState_assign
+#define __Pyx_PyErr_Occurred()  PyErr_Occurred()
+#endif
 
-static PyObject *__pyx_n_AttributeError;
+/* PyErrFetchRestore.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_PyErr_Clear() __Pyx_ErrRestore(NULL, NULL, NULL)
+#define __Pyx_ErrRestoreWithState(type, value, tb)  __Pyx_ErrRestoreInState(PyThreadState_GET(), type, value, tb)
+#define __Pyx_ErrFetchWithState(type, value, tb)    __Pyx_ErrFetchInState(PyThreadState_GET(), type, value, tb)
+#define __Pyx_ErrRestore(type, value, tb)  __Pyx_ErrRestoreInState(__pyx_tstate, type, value, tb)
+#define __Pyx_ErrFetch(type, value, tb)    __Pyx_ErrFetchInState(__pyx_tstate, type, value, tb)
+static CYTHON_INLINE void __Pyx_ErrRestoreInState(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb);
+static CYTHON_INLINE void __Pyx_ErrFetchInState(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb);
+#if CYTHON_COMPILING_IN_CPYTHON
+#define __Pyx_PyErr_SetNone(exc) (Py_INCREF(exc), __Pyx_ErrRestore((exc), NULL, NULL))
+#else
+#define __Pyx_PyErr_SetNone(exc) PyErr_SetNone(exc)
+#endif
+#else
+#define __Pyx_PyErr_Clear() PyErr_Clear()
+#define __Pyx_PyErr_SetNone(exc) PyErr_SetNone(exc)
+#define __Pyx_ErrRestoreWithState(type, value, tb)  PyErr_Restore(type, value, tb)
+#define __Pyx_ErrFetchWithState(type, value, tb)  PyErr_Fetch(type, value, tb)
+#define __Pyx_ErrRestoreInState(tstate, type, value, tb)  PyErr_Restore(type, value, tb)
+#define __Pyx_ErrFetchInState(tstate, type, value, tb)  PyErr_Fetch(type, value, tb)
+#define __Pyx_ErrRestore(type, value, tb)  PyErr_Restore(type, value, tb)
+#define __Pyx_ErrFetch(type, value, tb)  PyErr_Fetch(type, value, tb)
+#endif
 
-static PyObject *__pyx_k26p;
+/* RaiseException.proto */
+static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject *cause);
 
-static char (__pyx_k26[]) = "Read-only attribute";
+/* PyErrExceptionMatches.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_PyErr_ExceptionMatches(err) __Pyx_PyErr_ExceptionMatchesInState(__pyx_tstate, err)
+static CYTHON_INLINE int __Pyx_PyErr_ExceptionMatchesInState(PyThreadState* tstate, PyObject* err);
+#else
+#define __Pyx_PyErr_ExceptionMatches(err)  PyErr_ExceptionMatches(err)
+#endif
 
-static int __pyx_f_9_speedups_10metamethod___set__(PyObject *__pyx_v_self, PyObject *__pyx_v_ob, PyObject *__pyx_v_value); /*proto*/
-static int __pyx_f_9_speedups_10metamethod___set__(PyObject *__pyx_v_self, PyObject *__pyx_v_ob, PyObject *__pyx_v_value) {
-  int __pyx_r;
-  PyObject *__pyx_1 = 0;
-  PyObject *__pyx_2 = 0;
-  PyObject *__pyx_3 = 0;
-  Py_INCREF(__pyx_v_self);
-  Py_INCREF(__pyx_v_ob);
-  Py_INCREF(__pyx_v_value);
-
-  /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":108 */
-  __pyx_1 = __Pyx_GetName(__pyx_b, __pyx_n_AttributeError); if (!__pyx_1) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 108; goto __pyx_L1;}
-  __pyx_2 = PyTuple_New(1); if (!__pyx_2) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 108; goto __pyx_L1;}
-  Py_INCREF(__pyx_k26p);
-  PyTuple_SET_ITEM(__pyx_2, 0, __pyx_k26p);
-  __pyx_3 = PyObject_CallObject(__pyx_1, __pyx_2); if (!__pyx_3) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 108; goto __pyx_L1;}
-  Py_DECREF(__pyx_1); __pyx_1 = 0;
-  Py_DECREF(__pyx_2); __pyx_2 = 0;
-  __Pyx_Raise(__pyx_3, 0, 0);
-  Py_DECREF(__pyx_3); __pyx_3 = 0;
-  {__pyx_filename = __pyx_f[0]; __pyx_lineno = 108; goto __pyx_L1;}
+/* GetAttr.proto */
+static CYTHON_INLINE PyObject *__Pyx_GetAttr(PyObject *, PyObject *);
 
-  __pyx_r = 0;
-  goto __pyx_L0;
-  __pyx_L1:;
-  Py_XDECREF(__pyx_1);
-  Py_XDECREF(__pyx_2);
-  Py_XDECREF(__pyx_3);
-  __Pyx_AddTraceback("_speedups.metamethod.__set__");
-  __pyx_r = -1;
-  __pyx_L0:;
-  Py_DECREF(__pyx_v_self);
-  Py_DECREF(__pyx_v_ob);
-  Py_DECREF(__pyx_v_value);
-  return __pyx_r;
+/* GetAttr3.proto */
+static CYTHON_INLINE PyObject *__Pyx_GetAttr3(PyObject *, PyObject *, PyObject *);
+
+/* PyDictVersioning.proto */
+#if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_TYPE_SLOTS
+#define __PYX_DICT_VERSION_INIT  ((PY_UINT64_T) -1)
+#define __PYX_GET_DICT_VERSION(dict)  (((PyDictObject*)(dict))->ma_version_tag)
+#define __PYX_UPDATE_DICT_CACHE(dict, value, cache_var, version_var)\
+    (version_var) = __PYX_GET_DICT_VERSION(dict);\
+    (cache_var) = (value);
+#define __PYX_PY_DICT_LOOKUP_IF_MODIFIED(VAR, DICT, LOOKUP) {\
+    static PY_UINT64_T __pyx_dict_version = 0;\
+    static PyObject *__pyx_dict_cached_value = NULL;\
+    if (likely(__PYX_GET_DICT_VERSION(DICT) == __pyx_dict_version)) {\
+        (VAR) = __pyx_dict_cached_value;\
+    } else {\
+        (VAR) = __pyx_dict_cached_value = (LOOKUP);\
+        __pyx_dict_version = __PYX_GET_DICT_VERSION(DICT);\
+    }\
 }
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_tp_dict_version(PyObject *obj);
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_object_dict_version(PyObject *obj);
+static CYTHON_INLINE int __Pyx_object_dict_version_matches(PyObject* obj, PY_UINT64_T tp_dict_version, PY_UINT64_T obj_dict_version);
+#else
+#define __PYX_GET_DICT_VERSION(dict)  (0)
+#define __PYX_UPDATE_DICT_CACHE(dict, value, cache_var, version_var)
+#define __PYX_PY_DICT_LOOKUP_IF_MODIFIED(VAR, DICT, LOOKUP)  (VAR) = (LOOKUP);
+#endif
 
-static PyObject *__pyx_k27p;
+/* GetModuleGlobalName.proto */
+#if CYTHON_USE_DICT_VERSIONS
+#define __Pyx_GetModuleGlobalName(var, name)  do {\
+    static PY_UINT64_T __pyx_dict_version = 0;\
+    static PyObject *__pyx_dict_cached_value = NULL;\
+    (var) = (likely(__pyx_dict_version == __PYX_GET_DICT_VERSION(__pyx_d))) ?\
+        (likely(__pyx_dict_cached_value) ? __Pyx_NewRef(__pyx_dict_cached_value) : __Pyx_GetBuiltinName(name)) :\
+        __Pyx__GetModuleGlobalName(name, &__pyx_dict_version, &__pyx_dict_cached_value);\
+} while(0)
+#define __Pyx_GetModuleGlobalNameUncached(var, name)  do {\
+    PY_UINT64_T __pyx_dict_version;\
+    PyObject *__pyx_dict_cached_value;\
+    (var) = __Pyx__GetModuleGlobalName(name, &__pyx_dict_version, &__pyx_dict_cached_value);\
+} while(0)
+static PyObject *__Pyx__GetModuleGlobalName(PyObject *name, PY_UINT64_T *dict_version, PyObject **dict_cached_value);
+#else
+#define __Pyx_GetModuleGlobalName(var, name)  (var) = __Pyx__GetModuleGlobalName(name)
+#define __Pyx_GetModuleGlobalNameUncached(var, name)  (var) = __Pyx__GetModuleGlobalName(name)
+static CYTHON_INLINE PyObject *__Pyx__GetModuleGlobalName(PyObject *name);
+#endif
 
-static char (__pyx_k27[]) = "Read-only attribute";
+/* PyCFunctionFastCall.proto */
+#if CYTHON_FAST_PYCCALL
+static CYTHON_INLINE PyObject *__Pyx_PyCFunction_FastCall(PyObject *func, PyObject **args, Py_ssize_t nargs);
+#else
+#define __Pyx_PyCFunction_FastCall(func, args, nargs)  (assert(0), NULL)
+#endif
 
-static int __pyx_f_9_speedups_10metamethod___delete__(PyObject *__pyx_v_self, PyObject *__pyx_v_ob); /*proto*/
-static int __pyx_f_9_speedups_10metamethod___delete__(PyObject *__pyx_v_self, PyObject *__pyx_v_ob) {
-  int __pyx_r;
-  PyObject *__pyx_1 = 0;
-  PyObject *__pyx_2 = 0;
-  PyObject *__pyx_3 = 0;
-  Py_INCREF(__pyx_v_self);
-  Py_INCREF(__pyx_v_ob);
-
-  /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":111 */
-  __pyx_1 = __Pyx_GetName(__pyx_b, __pyx_n_AttributeError); if (!__pyx_1) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 111; goto __pyx_L1;}
-  __pyx_2 = PyTuple_New(1); if (!__pyx_2) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 111; goto __pyx_L1;}
-  Py_INCREF(__pyx_k27p);
-  PyTuple_SET_ITEM(__pyx_2, 0, __pyx_k27p);
-  __pyx_3 = PyObject_CallObject(__pyx_1, __pyx_2); if (!__pyx_3) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 111; goto __pyx_L1;}
-  Py_DECREF(__pyx_1); __pyx_1 = 0;
-  Py_DECREF(__pyx_2); __pyx_2 = 0;
-  __Pyx_Raise(__pyx_3, 0, 0);
-  Py_DECREF(__pyx_3); __pyx_3 = 0;
-  {__pyx_filename = __pyx_f[0]; __pyx_lineno = 111; goto __pyx_L1;}
+/* PyFunctionFastCall.proto */
+#if CYTHON_FAST_PYCALL
+#define __Pyx_PyFunction_FastCall(func, args, nargs)\
+    __Pyx_PyFunction_FastCallDict((func), (args), (nargs), NULL)
+#if 1 || PY_VERSION_HEX < 0x030600B1
+static PyObject *__Pyx_PyFunction_FastCallDict(PyObject *func, PyObject **args, Py_ssize_t nargs, PyObject *kwargs);
+#else
+#define __Pyx_PyFunction_FastCallDict(func, args, nargs, kwargs) _PyFunction_FastCallDict(func, args, nargs, kwargs)
+#endif
+#define __Pyx_BUILD_ASSERT_EXPR(cond)\
+    (sizeof(char [1 - 2*!(cond)]) - 1)
+#ifndef Py_MEMBER_SIZE
+#define Py_MEMBER_SIZE(type, member) sizeof(((type *)0)->member)
+#endif
+#if CYTHON_FAST_PYCALL
+  static size_t __pyx_pyframe_localsplus_offset = 0;
+  #include "frameobject.h"
+#if PY_VERSION_HEX >= 0x030b00a6
+  #ifndef Py_BUILD_CORE
+    #define Py_BUILD_CORE 1
+  #endif
+  #include "internal/pycore_frame.h"
+#endif
+  #define __Pxy_PyFrame_Initialize_Offsets()\
+    ((void)__Pyx_BUILD_ASSERT_EXPR(sizeof(PyFrameObject) == offsetof(PyFrameObject, f_localsplus) + Py_MEMBER_SIZE(PyFrameObject, f_localsplus)),\
+     (void)(__pyx_pyframe_localsplus_offset = ((size_t)PyFrame_Type.tp_basicsize) - Py_MEMBER_SIZE(PyFrameObject, f_localsplus)))
+  #define __Pyx_PyFrame_GetLocalsplus(frame)\
+    (assert(__pyx_pyframe_localsplus_offset), (PyObject **)(((char *)(frame)) + __pyx_pyframe_localsplus_offset))
+#endif // CYTHON_FAST_PYCALL
+#endif
 
-  __pyx_r = 0;
-  goto __pyx_L0;
-  __pyx_L1:;
-  Py_XDECREF(__pyx_1);
-  Py_XDECREF(__pyx_2);
-  Py_XDECREF(__pyx_3);
-  __Pyx_AddTraceback("_speedups.metamethod.__delete__");
-  __pyx_r = -1;
-  __pyx_L0:;
-  Py_DECREF(__pyx_v_self);
-  Py_DECREF(__pyx_v_ob);
-  return __pyx_r;
-}
+/* PyObjectCall2Args.proto */
+static CYTHON_UNUSED PyObject* __Pyx_PyObject_Call2Args(PyObject* function, PyObject* arg1, PyObject* arg2);
 
-static PyObject *__pyx_n_TypeError;
-static PyObject *__pyx_n_tb_next;
+/* PyObjectCallMethO.proto */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallMethO(PyObject *func, PyObject *arg);
+#endif
 
-static PyObject *__pyx_k28p;
+/* PyObjectCallOneArg.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObject *arg);
 
-static char (__pyx_k28[]) = "Can't adapt";
+/* GetItemInt.proto */
+#define __Pyx_GetItemInt(o, i, type, is_signed, to_py_func, is_list, wraparound, boundscheck)\
+    (__Pyx_fits_Py_ssize_t(i, type, is_signed) ?\
+    __Pyx_GetItemInt_Fast(o, (Py_ssize_t)i, is_list, wraparound, boundscheck) :\
+    (is_list ? (PyErr_SetString(PyExc_IndexError, "list index out of range"), (PyObject*)NULL) :\
+               __Pyx_GetItemInt_Generic(o, to_py_func(i))))
+#define __Pyx_GetItemInt_List(o, i, type, is_signed, to_py_func, is_list, wraparound, boundscheck)\
+    (__Pyx_fits_Py_ssize_t(i, type, is_signed) ?\
+    __Pyx_GetItemInt_List_Fast(o, (Py_ssize_t)i, wraparound, boundscheck) :\
+    (PyErr_SetString(PyExc_IndexError, "list index out of range"), (PyObject*)NULL))
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_List_Fast(PyObject *o, Py_ssize_t i,
+                                                              int wraparound, int boundscheck);
+#define __Pyx_GetItemInt_Tuple(o, i, type, is_signed, to_py_func, is_list, wraparound, boundscheck)\
+    (__Pyx_fits_Py_ssize_t(i, type, is_signed) ?\
+    __Pyx_GetItemInt_Tuple_Fast(o, (Py_ssize_t)i, wraparound, boundscheck) :\
+    (PyErr_SetString(PyExc_IndexError, "tuple index out of range"), (PyObject*)NULL))
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Tuple_Fast(PyObject *o, Py_ssize_t i,
+                                                              int wraparound, int boundscheck);
+static PyObject *__Pyx_GetItemInt_Generic(PyObject *o, PyObject* j);
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Fast(PyObject *o, Py_ssize_t i,
+                                                     int is_list, int wraparound, int boundscheck);
 
-static PyObject *__pyx_f_9_speedups__adapt(PyObject *__pyx_v_obj,PyObject *__pyx_v_protocol,PyObject *__pyx_v_default) {
-  void (*__pyx_v_tmp);
-  PyObject *__pyx_v_meth;
-  PyObject *__pyx_v_result;
-  PyObject *__pyx_v_err;
-  PyObject *__pyx_r;
-  int __pyx_1;
-  PyObject *__pyx_2 = 0;
-  PyObject *__pyx_3 = 0;
-  PyObject *__pyx_4 = 0;
-  Py_INCREF(__pyx_v_obj);
-  Py_INCREF(__pyx_v_protocol);
-  Py_INCREF(__pyx_v_default);
-  __pyx_v_meth = Py_None; Py_INCREF(Py_None);
-  __pyx_v_result = Py_None; Py_INCREF(Py_None);
-  __pyx_v_err = Py_None; Py_INCREF(Py_None);
+/* ObjectGetItem.proto */
+#if CYTHON_USE_TYPE_SLOTS
+static CYTHON_INLINE PyObject *__Pyx_PyObject_GetItem(PyObject *obj, PyObject* key);
+#else
+#define __Pyx_PyObject_GetItem(obj, key)  PyObject_GetItem(obj, key)
+#endif
 
-  /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":131 */
-  __pyx_1 = PyType_Check(__pyx_v_protocol);
-  if (__pyx_1) {
+/* GetTopmostException.proto */
+#if CYTHON_USE_EXC_INFO_STACK
+static _PyErr_StackItem * __Pyx_PyErr_GetTopmostException(PyThreadState *tstate);
+#endif
 
-    /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":132 */
-    __pyx_1 = PyObject_TypeCheck(__pyx_v_obj,__pyx_v_protocol);
-    if (__pyx_1) {
+/* SaveResetException.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_ExceptionSave(type, value, tb)  __Pyx__ExceptionSave(__pyx_tstate, type, value, tb)
+static CYTHON_INLINE void __Pyx__ExceptionSave(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb);
+#define __Pyx_ExceptionReset(type, value, tb)  __Pyx__ExceptionReset(__pyx_tstate, type, value, tb)
+static CYTHON_INLINE void __Pyx__ExceptionReset(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb);
+#else
+#define __Pyx_ExceptionSave(type, value, tb)   PyErr_GetExcInfo(type, value, tb)
+#define __Pyx_ExceptionReset(type, value, tb)  PyErr_SetExcInfo(type, value, tb)
+#endif
 
-      /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":133 */
-      Py_INCREF(__pyx_v_obj);
-      __pyx_r = __pyx_v_obj;
-      goto __pyx_L0;
-      goto __pyx_L3;
-    }
-    __pyx_L3:;
-    goto __pyx_L2;
-  }
-  __pyx_L2:;
+/* GetException.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_GetException(type, value, tb)  __Pyx__GetException(__pyx_tstate, type, value, tb)
+static int __Pyx__GetException(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb);
+#else
+static int __Pyx_GetException(PyObject **type, PyObject **value, PyObject **tb);
+#endif
 
-  /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":135 */
-  __pyx_1 = PyClass_Check(__pyx_v_protocol);
-  if (__pyx_1) {
+/* ExtTypeTest.proto */
+static CYTHON_INLINE int __Pyx_TypeTest(PyObject *obj, PyTypeObject *type);
 
-    /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":136 */
-    __pyx_1 = PyInstance_Check(__pyx_v_obj);
-    if (__pyx_1) {
+/* PyObjectCallNoArg.proto */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallNoArg(PyObject *func);
+#else
+#define __Pyx_PyObject_CallNoArg(func) __Pyx_PyObject_Call(func, __pyx_empty_tuple, NULL)
+#endif
 
-      /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":137 */
-      __pyx_1 = PyObject_IsInstance(__pyx_v_obj,__pyx_v_protocol);
-      if (__pyx_1) {
+/* SliceObject.proto */
+#define __Pyx_PyObject_DelSlice(obj, cstart, cstop, py_start, py_stop, py_slice, has_cstart, has_cstop, wraparound)\
+    __Pyx_PyObject_SetSlice(obj, (PyObject*)NULL, cstart, cstop, py_start, py_stop, py_slice, has_cstart, has_cstop, wraparound)
+static CYTHON_INLINE int __Pyx_PyObject_SetSlice(
+        PyObject* obj, PyObject* value, Py_ssize_t cstart, Py_ssize_t cstop,
+        PyObject** py_start, PyObject** py_stop, PyObject** py_slice,
+        int has_cstart, int has_cstop, int wraparound);
 
-        /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":138 */
-        Py_INCREF(__pyx_v_obj);
-        __pyx_r = __pyx_v_obj;
-        goto __pyx_L0;
-        goto __pyx_L6;
-      }
-      __pyx_L6:;
-      goto __pyx_L5;
-    }
-    __pyx_L5:;
-    goto __pyx_L4;
-  }
-  __pyx_L4:;
+/* DictGetItem.proto */
+#if PY_MAJOR_VERSION >= 3 && !CYTHON_COMPILING_IN_PYPY
+static PyObject *__Pyx_PyDict_GetItem(PyObject *d, PyObject* key);
+#define __Pyx_PyObject_Dict_GetItem(obj, name)\
+    (likely(PyDict_CheckExact(obj)) ?\
+     __Pyx_PyDict_GetItem(obj, name) : PyObject_GetItem(obj, name))
+#else
+#define __Pyx_PyDict_GetItem(d, key) PyObject_GetItem(d, key)
+#define __Pyx_PyObject_Dict_GetItem(obj, name)  PyObject_GetItem(obj, name)
+#endif
 
-  /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":140 */
-  __pyx_v_tmp = PyObject_GetAttr(__pyx_v_obj,__pyx_v_9_speedups___conform);
+/* SliceTupleAndList.proto */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyList_GetSlice(PyObject* src, Py_ssize_t start, Py_ssize_t stop);
+static CYTHON_INLINE PyObject* __Pyx_PyTuple_GetSlice(PyObject* src, Py_ssize_t start, Py_ssize_t stop);
+#else
+#define __Pyx_PyList_GetSlice(seq, start, stop)   PySequence_GetSlice(seq, start, stop)
+#define __Pyx_PyTuple_GetSlice(seq, start, stop)  PySequence_GetSlice(seq, start, stop)
+#endif
 
-  /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":141 */
-  __pyx_1 = (__pyx_v_tmp != 0);
-  if (__pyx_1) {
+/* WriteUnraisableException.proto */
+static void __Pyx_WriteUnraisable(const char *name, int clineno,
+                                  int lineno, const char *filename,
+                                  int full_traceback, int nogil);
 
-    /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":142 */
-    __pyx_2 = (PyObject *)__pyx_v_tmp;
-    Py_INCREF(__pyx_2);
-    Py_DECREF(__pyx_v_meth);
-    __pyx_v_meth = __pyx_2;
-    __pyx_2 = 0;
+/* SliceObject.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetSlice(
+        PyObject* obj, Py_ssize_t cstart, Py_ssize_t cstop,
+        PyObject** py_start, PyObject** py_stop, PyObject** py_slice,
+        int has_cstart, int has_cstop, int wraparound);
 
-    /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":143 */
-    Py_DECREF(((PyObject (*))__pyx_v_tmp));
+/* PyObjectSetAttrStr.proto */
+#if CYTHON_USE_TYPE_SLOTS
+#define __Pyx_PyObject_DelAttrStr(o,n) __Pyx_PyObject_SetAttrStr(o, n, NULL)
+static CYTHON_INLINE int __Pyx_PyObject_SetAttrStr(PyObject* obj, PyObject* attr_name, PyObject* value);
+#else
+#define __Pyx_PyObject_DelAttrStr(o,n)   PyObject_DelAttr(o,n)
+#define __Pyx_PyObject_SetAttrStr(o,n,v) PyObject_SetAttr(o,n,v)
+#endif
 
-    /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":144 */
-    /*try:*/ {
+/* PySequenceContains.proto */
+static CYTHON_INLINE int __Pyx_PySequence_ContainsTF(PyObject* item, PyObject* seq, int eq) {
+    int result = PySequence_Contains(seq, item);
+    return unlikely(result < 0) ? result : (result == (eq == Py_EQ));
+}
 
-      /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":145 */
-      __pyx_2 = PyTuple_New(1); if (!__pyx_2) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 145; goto __pyx_L8;}
-      Py_INCREF(__pyx_v_protocol);
-      PyTuple_SET_ITEM(__pyx_2, 0, __pyx_v_protocol);
-      __pyx_3 = PyObject_CallObject(__pyx_v_meth, __pyx_2); if (!__pyx_3) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 145; goto __pyx_L8;}
-      Py_DECREF(__pyx_2); __pyx_2 = 0;
-      Py_DECREF(__pyx_v_result);
-      __pyx_v_result = __pyx_3;
-      __pyx_3 = 0;
-
-      /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":146 */
-      __pyx_1 = __pyx_v_result != Py_None;
-      if (__pyx_1) {
-
-        /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":147 */
-        Py_INCREF(__pyx_v_result);
-        __pyx_r = __pyx_v_result;
-        goto __pyx_L0;
-        goto __pyx_L10;
-      }
-      __pyx_L10:;
-    }
-    goto __pyx_L9;
-    __pyx_L8:;
-    Py_XDECREF(__pyx_2); __pyx_2 = 0;
-    Py_XDECREF(__pyx_3); __pyx_3 = 0;
-
-    /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":148 */
-    __pyx_2 = __Pyx_GetName(__pyx_b, __pyx_n_TypeError); if (!__pyx_2) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 148; goto __pyx_L1;}
-    __pyx_1 = PyErr_ExceptionMatches(__pyx_2);
-    Py_DECREF(__pyx_2); __pyx_2 = 0;
-    if (__pyx_1) {
-      __Pyx_AddTraceback("_speedups._adapt");
-      __pyx_3 = __Pyx_GetExcValue(); if (!__pyx_3) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 148; goto __pyx_L1;}
-      Py_DECREF(__pyx_3); __pyx_3 = 0;
-
-      /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":149 */
-      __pyx_2 = __Pyx_GetName(__pyx_m, __pyx_n_exc_info); if (!__pyx_2) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 149; goto __pyx_L1;}
-      __pyx_3 = PyObject_CallObject(__pyx_2, 0); if (!__pyx_3) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 149; goto __pyx_L1;}
-      Py_DECREF(__pyx_2); __pyx_2 = 0;
-      __pyx_2 = PyInt_FromLong(2); if (!__pyx_2) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 149; goto __pyx_L1;}
-      __pyx_4 = PyObject_GetItem(__pyx_3, __pyx_2); if (!__pyx_4) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 149; goto __pyx_L1;}
-      Py_DECREF(__pyx_3); __pyx_3 = 0;
-      Py_DECREF(__pyx_2); __pyx_2 = 0;
-      __pyx_3 = PyObject_GetAttr(__pyx_4, __pyx_n_tb_next); if (!__pyx_3) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 149; goto __pyx_L1;}
-      Py_DECREF(__pyx_4); __pyx_4 = 0;
-      __pyx_1 = __pyx_3 != Py_None;
-      Py_DECREF(__pyx_3); __pyx_3 = 0;
-      if (__pyx_1) {
-
-        /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":150 */
-        __Pyx_ReRaise();
-        {__pyx_filename = __pyx_f[0]; __pyx_lineno = 150; goto __pyx_L1;}
-        goto __pyx_L11;
-      }
-      __pyx_L11:;
-      goto __pyx_L9;
-    }
-    goto __pyx_L1;
-    __pyx_L9:;
-    goto __pyx_L7;
-  }
-  __pyx_1 = PyErr_ExceptionMatches(PyExc_AttributeError);
-  if (__pyx_1) {
-
-    /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":152 */
-    PyErr_Clear();
-    goto __pyx_L7;
-  }
-  /*else*/ {
+/* Import.proto */
+static PyObject *__Pyx_Import(PyObject *name, PyObject *from_list, int level);
 
-    /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":154 */
-    __pyx_2 = __Pyx_GetExcValue(); if (!__pyx_2) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 154; goto __pyx_L1;}
-    Py_DECREF(__pyx_v_err);
-    __pyx_v_err = __pyx_2;
-    __pyx_2 = 0;
+/* ImportFrom.proto */
+static PyObject* __Pyx_ImportFrom(PyObject* module, PyObject* name);
 
-    /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":155 */
-    __Pyx_ReRaise();
-    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 155; goto __pyx_L1;}
-  }
-  __pyx_L7:;
+/* HasAttr.proto */
+static CYTHON_INLINE int __Pyx_HasAttr(PyObject *, PyObject *);
 
-  /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":165 */
-  __pyx_v_tmp = PyObject_GetAttr(__pyx_v_protocol,__pyx_v_9_speedups___adapt);
+/* PyObject_GenericGetAttrNoDict.proto */
+#if CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP && PY_VERSION_HEX < 0x03070000
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GenericGetAttrNoDict(PyObject* obj, PyObject* attr_name);
+#else
+#define __Pyx_PyObject_GenericGetAttrNoDict PyObject_GenericGetAttr
+#endif
 
-  /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":166 */
-  __pyx_1 = (__pyx_v_tmp != 0);
-  if (__pyx_1) {
+/* PyObject_GenericGetAttr.proto */
+#if CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP && PY_VERSION_HEX < 0x03070000
+static PyObject* __Pyx_PyObject_GenericGetAttr(PyObject* obj, PyObject* attr_name);
+#else
+#define __Pyx_PyObject_GenericGetAttr PyObject_GenericGetAttr
+#endif
 
-    /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":167 */
-    __pyx_4 = (PyObject *)__pyx_v_tmp;
-    Py_INCREF(__pyx_4);
-    Py_DECREF(__pyx_v_meth);
-    __pyx_v_meth = __pyx_4;
-    __pyx_4 = 0;
+/* PyObjectGetAttrStrNoError.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStrNoError(PyObject* obj, PyObject* attr_name);
 
-    /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":168 */
-    Py_DECREF(((PyObject (*))__pyx_v_tmp));
+/* SetupReduce.proto */
+static int __Pyx_setup_reduce(PyObject* type_obj);
 
-    /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":169 */
-    /*try:*/ {
+/* CLineInTraceback.proto */
+#ifdef CYTHON_CLINE_IN_TRACEBACK
+#define __Pyx_CLineForTraceback(tstate, c_line)  (((CYTHON_CLINE_IN_TRACEBACK)) ? c_line : 0)
+#else
+static int __Pyx_CLineForTraceback(PyThreadState *tstate, int c_line);
+#endif
 
-      /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":170 */
-      __pyx_3 = PyTuple_New(1); if (!__pyx_3) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 170; goto __pyx_L13;}
-      Py_INCREF(__pyx_v_obj);
-      PyTuple_SET_ITEM(__pyx_3, 0, __pyx_v_obj);
-      __pyx_2 = PyObject_CallObject(__pyx_v_meth, __pyx_3); if (!__pyx_2) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 170; goto __pyx_L13;}
-      Py_DECREF(__pyx_3); __pyx_3 = 0;
-      Py_DECREF(__pyx_v_result);
-      __pyx_v_result = __pyx_2;
-      __pyx_2 = 0;
-
-      /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":171 */
-      __pyx_1 = __pyx_v_result != Py_None;
-      if (__pyx_1) {
-
-        /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":172 */
-        Py_INCREF(__pyx_v_result);
-        __pyx_r = __pyx_v_result;
-        goto __pyx_L0;
-        goto __pyx_L15;
-      }
-      __pyx_L15:;
-    }
-    goto __pyx_L14;
-    __pyx_L13:;
-    Py_XDECREF(__pyx_4); __pyx_4 = 0;
-    Py_XDECREF(__pyx_3); __pyx_3 = 0;
-    Py_XDECREF(__pyx_2); __pyx_2 = 0;
-
-    /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":173 */
-    __pyx_4 = __Pyx_GetName(__pyx_b, __pyx_n_TypeError); if (!__pyx_4) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 173; goto __pyx_L1;}
-    __pyx_1 = PyErr_ExceptionMatches(__pyx_4);
-    Py_DECREF(__pyx_4); __pyx_4 = 0;
-    if (__pyx_1) {
-      __Pyx_AddTraceback("_speedups._adapt");
-      __pyx_3 = __Pyx_GetExcValue(); if (!__pyx_3) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 173; goto __pyx_L1;}
-      Py_DECREF(__pyx_3); __pyx_3 = 0;
-
-      /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":174 */
-      __pyx_2 = __Pyx_GetName(__pyx_m, __pyx_n_exc_info); if (!__pyx_2) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 174; goto __pyx_L1;}
-      __pyx_4 = PyObject_CallObject(__pyx_2, 0); if (!__pyx_4) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 174; goto __pyx_L1;}
-      Py_DECREF(__pyx_2); __pyx_2 = 0;
-      __pyx_3 = PyInt_FromLong(2); if (!__pyx_3) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 174; goto __pyx_L1;}
-      __pyx_2 = PyObject_GetItem(__pyx_4, __pyx_3); if (!__pyx_2) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 174; goto __pyx_L1;}
-      Py_DECREF(__pyx_4); __pyx_4 = 0;
-      Py_DECREF(__pyx_3); __pyx_3 = 0;
-      __pyx_4 = PyObject_GetAttr(__pyx_2, __pyx_n_tb_next); if (!__pyx_4) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 174; goto __pyx_L1;}
-      Py_DECREF(__pyx_2); __pyx_2 = 0;
-      __pyx_1 = __pyx_4 != Py_None;
-      Py_DECREF(__pyx_4); __pyx_4 = 0;
-      if (__pyx_1) {
-
-        /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":175 */
-        __Pyx_ReRaise();
-        {__pyx_filename = __pyx_f[0]; __pyx_lineno = 175; goto __pyx_L1;}
-        goto __pyx_L16;
-      }
-      __pyx_L16:;
-      goto __pyx_L14;
-    }
-    goto __pyx_L1;
-    __pyx_L14:;
-    goto __pyx_L12;
-  }
-  __pyx_1 = PyErr_ExceptionMatches(PyExc_AttributeError);
-  if (__pyx_1) {
-
-    /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":177 */
-    PyErr_Clear();
-    goto __pyx_L12;
-  }
-  /*else*/ {
+/* CodeObjectCache.proto */
+typedef struct {
+    PyCodeObject* code_object;
+    int code_line;
+} __Pyx_CodeObjectCacheEntry;
+struct __Pyx_CodeObjectCache {
+    int count;
+    int max_count;
+    __Pyx_CodeObjectCacheEntry* entries;
+};
+static struct __Pyx_CodeObjectCache __pyx_code_cache = {0,0,NULL};
+static int __pyx_bisect_code_objects(__Pyx_CodeObjectCacheEntry* entries, int count, int code_line);
+static PyCodeObject *__pyx_find_code_object(int code_line);
+static void __pyx_insert_code_object(int code_line, PyCodeObject* code_object);
 
-    /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":179 */
-    __pyx_3 = __Pyx_GetExcValue(); if (!__pyx_3) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 179; goto __pyx_L1;}
-    Py_DECREF(__pyx_v_err);
-    __pyx_v_err = __pyx_3;
-    __pyx_3 = 0;
-
-    /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":180 */
-    __Pyx_ReRaise();
-    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 180; goto __pyx_L1;}
-  }
-  __pyx_L12:;
-
-  /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":182 */
-  __pyx_1 = __pyx_v_default == __pyx_v_9_speedups__marker;
-  if (__pyx_1) {
-
-    /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":183 */
-    __pyx_2 = __Pyx_GetName(__pyx_m, __pyx_n_AdaptationFailure); if (!__pyx_2) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 183; goto __pyx_L1;}
-    __pyx_4 = PyTuple_New(3); if (!__pyx_4) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 183; goto __pyx_L1;}
-    Py_INCREF(__pyx_k28p);
-    PyTuple_SET_ITEM(__pyx_4, 0, __pyx_k28p);
-    Py_INCREF(__pyx_v_obj);
-    PyTuple_SET_ITEM(__pyx_4, 1, __pyx_v_obj);
-    Py_INCREF(__pyx_v_protocol);
-    PyTuple_SET_ITEM(__pyx_4, 2, __pyx_v_protocol);
-    __pyx_3 = PyObject_CallObject(__pyx_2, __pyx_4); if (!__pyx_3) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 183; goto __pyx_L1;}
-    Py_DECREF(__pyx_2); __pyx_2 = 0;
-    Py_DECREF(__pyx_4); __pyx_4 = 0;
-    __Pyx_Raise(__pyx_3, 0, 0);
-    Py_DECREF(__pyx_3); __pyx_3 = 0;
-    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 183; goto __pyx_L1;}
-    goto __pyx_L17;
-  }
-  __pyx_L17:;
-
-  /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":185 */
-  Py_INCREF(__pyx_v_default);
-  __pyx_r = __pyx_v_default;
-  goto __pyx_L0;
+/* AddTraceback.proto */
+static void __Pyx_AddTraceback(const char *funcname, int c_line,
+                               int py_line, const char *filename);
 
-  __pyx_r = Py_None; Py_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1:;
-  Py_XDECREF(__pyx_2);
-  Py_XDECREF(__pyx_3);
-  Py_XDECREF(__pyx_4);
-  __Pyx_AddTraceback("_speedups._adapt");
-  __pyx_r = 0;
-  __pyx_L0:;
-  Py_DECREF(__pyx_v_meth);
-  Py_DECREF(__pyx_v_result);
-  Py_DECREF(__pyx_v_err);
-  Py_DECREF(__pyx_v_obj);
-  Py_DECREF(__pyx_v_protocol);
-  Py_DECREF(__pyx_v_default);
-  return __pyx_r;
-}
+/* GCCDiagnostics.proto */
+#if defined(__GNUC__) && (__GNUC__ > 4 || (__GNUC__ == 4 && __GNUC_MINOR__ >= 6))
+#define __Pyx_HAS_GCC_DIAGNOSTIC
+#endif
 
-static PyObject *__pyx_f_9_speedups_adapt(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static char __pyx_doc_9_speedups_adapt[] = "PEP 246-alike: Adapt \'obj\' to \'protocol\', return \'default\'\n\n    If \'default\' is not supplied and no implementation is found,\n    raise \'AdaptationFailure\'.";
-static PyObject *__pyx_f_9_speedups_adapt(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  PyObject *__pyx_v_obj = 0;
-  PyObject *__pyx_v_protocol = 0;
-  PyObject *__pyx_v_default = 0;
-  PyObject *__pyx_r;
-  PyObject *__pyx_1 = 0;
-  static char *__pyx_argnames[] = {"obj","protocol","default",0};
-  __pyx_v_default = __pyx_k21;
-  if (!PyArg_ParseTupleAndKeywords(__pyx_args, __pyx_kwds, "OO|O", __pyx_argnames, &__pyx_v_obj, &__pyx_v_protocol, &__pyx_v_default)) return 0;
-  Py_INCREF(__pyx_v_obj);
-  Py_INCREF(__pyx_v_protocol);
-  Py_INCREF(__pyx_v_default);
-
-  /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":194 */
-  __pyx_1 = __pyx_f_9_speedups__adapt(__pyx_v_obj,__pyx_v_protocol,__pyx_v_default); if (!__pyx_1) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 194; goto __pyx_L1;}
-  __pyx_r = __pyx_1;
-  __pyx_1 = 0;
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; Py_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1:;
-  Py_XDECREF(__pyx_1);
-  __Pyx_AddTraceback("_speedups.adapt");
-  __pyx_r = 0;
+/* CIntFromPy.proto */
+static CYTHON_INLINE long __Pyx_PyInt_As_long(PyObject *);
+
+/* CIntToPy.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_int(int value);
+
+/* CIntFromPy.proto */
+static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *);
+
+/* CIntToPy.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value);
+
+/* FastTypeChecks.proto */
+#if CYTHON_COMPILING_IN_CPYTHON
+#define __Pyx_TypeCheck(obj, type) __Pyx_IsSubtype(Py_TYPE(obj), (PyTypeObject *)type)
+static CYTHON_INLINE int __Pyx_IsSubtype(PyTypeObject *a, PyTypeObject *b);
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches(PyObject *err, PyObject *type);
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches2(PyObject *err, PyObject *type1, PyObject *type2);
+#else
+#define __Pyx_TypeCheck(obj, type) PyObject_TypeCheck(obj, (PyTypeObject *)type)
+#define __Pyx_PyErr_GivenExceptionMatches(err, type) PyErr_GivenExceptionMatches(err, type)
+#define __Pyx_PyErr_GivenExceptionMatches2(err, type1, type2) (PyErr_GivenExceptionMatches(err, type1) || PyErr_GivenExceptionMatches(err, type2))
+#endif
+#define __Pyx_PyException_Check(obj) __Pyx_TypeCheck(obj, PyExc_Exception)
+
+/* CheckBinaryVersion.proto */
+static int __Pyx_check_binary_version(void);
+
+/* InitStrings.proto */
+static int __Pyx_InitStrings(__Pyx_StringTabEntry *t);
+
+
+/* Module declarations from 'protocols._speedups' */
+static PyTypeObject *__pyx_ptype_9protocols_9_speedups_metamethod = 0;
+static PyTypeObject *__pyx_ptype_9protocols_9_speedups_AdapterChain = 0;
+static PyTypeObject *__pyx_ptype_9protocols_9_speedups_AdapterRecord = 0;
+static PyObject *__pyx_v_9protocols_9_speedups__marker = 0;
+static PyObject *__pyx_v_9protocols_9_speedups__failed = 0;
+static PyObject *__pyx_v_9protocols_9_speedups___conform = 0;
+static PyObject *__pyx_v_9protocols_9_speedups___adapt = 0;
+static PyObject *__pyx_v_9protocols_9_speedups___mro = 0;
+static PyObject *__pyx_v_9protocols_9_speedups___init = 0;
+static PyObject *__pyx_v_9protocols_9_speedups___ECType = 0;
+static PyObject *__pyx_v_9protocols_9_speedups__interfaceInit = 0;
+static PyObject *__pyx_v_9protocols_9_speedups__interfaceCall = 0;
+static PyObject *__pyx_v_9protocols_9_speedups__classicMROs = 0;
+static PyObject *__pyx_v_9protocols_9_speedups__classicMROData = 0;
+static void *__pyx_v_9protocols_9_speedups__objectClass;
+static PyObject *__pyx_v_9protocols_9_speedups___provided = 0;
+static PyObject *__pyx_v_9protocols_9_speedups__conformsRegistry = 0;
+static int __pyx_f_9protocols_9_speedups_reraise(void); /*proto*/
+static int __pyx_f_9protocols_9_speedups_compareDepths(PyObject *, PyObject *); /*proto*/
+static struct __pyx_obj_9protocols_9_speedups_AdapterRecord *__pyx_f_9protocols_9_speedups_minimumRecord(struct __pyx_obj_9protocols_9_speedups_AdapterRecord *, struct __pyx_obj_9protocols_9_speedups_AdapterRecord *); /*proto*/
+static int __pyx_f_9protocols_9_speedups_mayConform(PyObject *); /*proto*/
+static PyObject *__pyx_f_9protocols_9_speedups_getConform(PyObject *); /*proto*/
+static PyObject *__pyx_f_9protocols_9_speedups_callConform(PyObject *, PyObject *); /*proto*/
+static PyObject *__pyx_f_9protocols_9_speedups_callAdapt(PyObject *, PyObject *); /*proto*/
+static int __pyx_f_9protocols_9_speedups_isInstanceOf(PyObject *, PyObject *); /*proto*/
+static int __pyx_f_9protocols_9_speedups_hasProtocolAdapt(PyObject *); /*proto*/
+static PyObject *__pyx_f_9protocols_9_speedups__adapt(PyObject *, PyObject *, PyObject *); /*proto*/
+static PyObject *__pyx_f_9protocols_9_speedups__adaptEach(PyObject *, PyObject *, PyObject *, int); /*proto*/
+static PyObject *__pyx_f_9protocols_9_speedups_adaptMany(PyObject *, PyObject *, PyObject *, int); /*proto*/
+static PyObject *__pyx_f_9protocols_9_speedups_InterfaceClass_call(PyObject *, PyObject *, void *); /*proto*/
+static PyObject *__pyx_f_9protocols_9_speedups_buildClassicMRO(PyClassObject *, PyListObject *); /*proto*/
+static PyObject *__pyx_f_9protocols_9_speedups_basesOf(PyObject *); /*proto*/
+static int __pyx_f_9protocols_9_speedups_hasBases(PyObject *, void *); /*proto*/
+static int __pyx_f_9protocols_9_speedups_sameClassicBases(PyObject *, PyObject *); /*proto*/
+static PyObject *__pyx_f_9protocols_9_speedups_classicBases(PyObject *); /*proto*/
+static PyObject *__pyx_f_9protocols_9_speedups_cachedMRO(PyObject *, PyObject *); /*proto*/
+static PyObject *__pyx_f_9protocols_9_speedups_buildECMRO(PyObject *, PyListObject *); /*proto*/
+static PyObject *__pyx_f_9protocols_9_speedups_getClass(PyObject *); /*proto*/
+static PyObject *__pyx_f_9protocols_9_speedups_classMRO(PyObject *); /*proto*/
+static int __pyx_f_9protocols_9_speedups_sameBases(PyObject *, PyObject *); /*proto*/
+static void *__pyx_f_9protocols_9_speedups_registryEntry(PyObject *, PyObject *); /*proto*/
+static PyObject *__pyx_f_9protocols_9_speedups_recordAdapter(PyObject *); /*proto*/
+static PyObject *__pyx_f_9protocols_9_speedups_lookupAdapter(PyObject *, PyObject *); /*proto*/
+static PyObject *__pyx_f_9protocols_9_speedups_declarationMRO(PyObject *); /*proto*/
+static PyObject *__pyx_f_9protocols_9_speedups_declared(PyObject *, PyObject *); /*proto*/
+static PyObject *__pyx_f_9protocols_9_speedups_providedRecord(PyObject *, PyObject *); /*proto*/
+static PyObject *__pyx_f_9protocols_9_speedups_registryRecord(PyObject *, PyObject *); /*proto*/
+static PyObject *__pyx_f_9protocols_9_speedups___pyx_unpickle_metamethod__set_state(struct __pyx_obj_9protocols_9_speedups_metamethod *, PyObject *); /*proto*/
+#define __Pyx_MODULE_NAME "protocols._speedups"
+extern int __pyx_module_is_main_protocols___speedups;
+int __pyx_module_is_main_protocols___speedups = 0;
+
+/* Implementation of 'protocols._speedups' */
+static PyObject *__pyx_builtin_ImportError;
+static PyObject *__pyx_builtin_object;
+static PyObject *__pyx_builtin_AttributeError;
+static PyObject *__pyx_builtin_TypeError;
+static PyObject *__pyx_builtin_KeyError;
+static const char __pyx_k_i[] = "i";
+static const char __pyx_k_a1[] = "a1";
+static const char __pyx_k_a2[] = "a2";
+static const char __pyx_k_d1[] = "d1";
+static const char __pyx_k_d2[] = "d2";
+static const char __pyx_k_ob[] = "ob";
+static const char __pyx_k_all[] = "__all__";
+static const char __pyx_k_cls[] = "cls";
+static const char __pyx_k_cmp[] = "cmp";
+static const char __pyx_k_get[] = "get";
+static const char __pyx_k_key[] = "key";
+static const char __pyx_k_mro[] = "__mro__";
+static const char __pyx_k_new[] = "__new__";
+static const char __pyx_k_obj[] = "obj";
+static const char __pyx_k_old[] = "old";
+static const char __pyx_k_sys[] = "sys";
+static const char __pyx_k_tmp[] = "tmp";
+static const char __pyx_k_typ[] = "typ";
+static const char __pyx_k_call[] = "__call__";
+static const char __pyx_k_data[] = "data";
+static const char __pyx_k_dict[] = "__dict__";
+static const char __pyx_k_func[] = "func";
+static const char __pyx_k_init[] = "__init__";
+static const char __pyx_k_main[] = "__main__";
+static const char __pyx_k_name[] = "__name__";
+static const char __pyx_k_self[] = "self";
+static const char __pyx_k_test[] = "__test__";
+static const char __pyx_k_adapt[] = "adapt";
+static const char __pyx_k_bases[] = "__bases__";
+static const char __pyx_k_class[] = "__class";
+static const char __pyx_k_depth[] = "depth";
+static const char __pyx_k_exact[] = "exact";
+static const char __pyx_k_mro_2[] = "mro";
+static const char __pyx_k_new_2[] = "new";
+static const char __pyx_k_proto[] = "proto";
+static const char __pyx_k_getMRO[] = "getMRO";
+static const char __pyx_k_import[] = "__import__";
+static const char __pyx_k_object[] = "object";
+static const char __pyx_k_pickle[] = "pickle";
+static const char __pyx_k_record[] = "record";
+static const char __pyx_k_reduce[] = "__reduce__";
+static const char __pyx_k_update[] = "update";
+static const char __pyx_k_adapter[] = "adapter";
+static const char __pyx_k_default[] = "default";
+static const char __pyx_k_factory[] = "factory";
+static const char __pyx_k_mapping[] = "mapping";
+static const char __pyx_k_objects[] = "objects";
+static const char __pyx_k_subject[] = "subject";
+static const char __pyx_k_tb_next[] = "tb_next";
+static const char __pyx_k_weakref[] = "weakref";
+static const char __pyx_k_KeyError[] = "KeyError";
+static const char __pyx_k_adapters[] = "adapters";
+static const char __pyx_k_exc_info[] = "exc_info";
+static const char __pyx_k_getstate[] = "__getstate__";
+static const char __pyx_k_protocol[] = "protocol";
+static const char __pyx_k_pyx_type[] = "__pyx_type";
+static const char __pyx_k_setstate[] = "__setstate__";
+static const char __pyx_k_Interface[] = "Interface";
+static const char __pyx_k_TypeError[] = "TypeError";
+static const char __pyx_k_checkSelf[] = "checkSelf";
+static const char __pyx_k_protocols[] = "protocols";
+static const char __pyx_k_pyx_state[] = "__pyx_state";
+static const char __pyx_k_reduce_ex[] = "__reduce_ex__";
+static const char __pyx_k_adapt_each[] = "adapt_each";
+static const char __pyx_k_adapt_many[] = "adapt_many";
+static const char __pyx_k_classicMRO[] = "classicMRO";
+static const char __pyx_k_metamethod[] = "metamethod";
+static const char __pyx_k_pyx_result[] = "__pyx_result";
+static const char __pyx_k_Can_t_adapt[] = "Can't adapt";
+static const char __pyx_k_ImportError[] = "ImportError";
+static const char __pyx_k_PickleError[] = "PickleError";
+static const char __pyx_k_adapt_first[] = "adapt_first";
+static const char __pyx_k_extClassMRO[] = "extClassMRO";
+static const char __pyx_k_AdapterChain[] = "AdapterChain";
+static const char __pyx_k_adapterCount[] = "__adapterCount__";
+static const char __pyx_k_baseProtocol[] = "baseProtocol";
+static const char __pyx_k_pyx_checksum[] = "__pyx_checksum";
+static const char __pyx_k_speedups_pyx[] = "_speedups.pyx";
+static const char __pyx_k_stringsource[] = "stringsource";
+static const char __pyx_k_AdapterRecord[] = "AdapterRecord";
+static const char __pyx_k_reduce_cython[] = "__reduce_cython__";
+static const char __pyx_k_ADAPT_SEQUENCE[] = "ADAPT_SEQUENCE";
+static const char __pyx_k_AdapterChain_r[] = "AdapterChain(%r)";
+static const char __pyx_k_AttributeError[] = "AttributeError";
+static const char __pyx_k_ExtensionClass[] = "ExtensionClass";
+static const char __pyx_k_InterfaceClass[] = "InterfaceClass";
+static const char __pyx_k_Protocol__call[] = "Protocol__call__";
+static const char __pyx_k_minimumAdapter[] = "minimumAdapter";
+static const char __pyx_k_Protocol__adapt[] = "Protocol__adapt__";
+static const char __pyx_k_Protocol__cache[] = "_Protocol__cache";
+static const char __pyx_k_extendedClassic[] = "extendedClassic";
+static const char __pyx_k_pyx_PickleError[] = "__pyx_PickleError";
+static const char __pyx_k_setstate_cython[] = "__setstate_cython__";
+static const char __pyx_k_unbound_adapter[] = "__unbound_adapter__";
+static const char __pyx_k_DOES_NOT_SUPPORT[] = "DOES_NOT_SUPPORT";
+static const char __pyx_k_conformsRegistry[] = "conformsRegistry";
+static const char __pyx_k_AdaptationFailure[] = "AdaptationFailure";
+static const char __pyx_k_AdapterRecord_r_r[] = "AdapterRecord(%r, %r)";
+static const char __pyx_k_NO_ADAPTER_NEEDED[] = "NO_ADAPTER_NEEDED";
+static const char __pyx_k_Protocol__changes[] = "_Protocol__changes";
+static const char __pyx_k_WeakKeyDictionary[] = "WeakKeyDictionary";
+static const char __pyx_k_Protocol__adapters[] = "_Protocol__adapters";
+static const char __pyx_k_Protocol__cacheKey[] = "_Protocol__cacheKey";
+static const char __pyx_k_cline_in_traceback[] = "cline_in_traceback";
+static const char __pyx_k_findImplementation[] = "findImplementation";
+static const char __pyx_k_protocols_adapters[] = "protocols.adapters";
+static const char __pyx_k_Not_a_classic_class[] = "Not a classic class";
+static const char __pyx_k_Read_only_attribute[] = "Read-only attribute";
+static const char __pyx_k_protocols__speedups[] = "protocols._speedups";
+static const char __pyx_k_installInterfaceCall[] = "installInterfaceCall";
+static const char __pyx_k_Protocol__applyPending[] = "_Protocol__applyPending";
+static const char __pyx_k_ProviderMixin__conform[] = "ProviderMixin__conform__";
+static const char __pyx_k_conformsRegistry__call[] = "conformsRegistry__call__";
+static const char __pyx_k_installConformsRegistry[] = "installConformsRegistry";
+static const char __pyx_k_pyx_unpickle_metamethod[] = "__pyx_unpickle_metamethod";
+static const char __pyx_k_Ambiguous_adapter_choice[] = "Ambiguous adapter choice";
+static const char __pyx_k_Protocol__pendingSources[] = "_Protocol__pendingSources";
+static const char __pyx_k_updateWithSimplestAdapter[] = "updateWithSimplestAdapter";
+static const char __pyx_k_Protocol_getAdapterForType[] = "Protocol_getAdapterForType";
+static const char __pyx_k_C_Speedups_for_commonly_used_ope[] = "C Speedups for commonly-used operations";
+static const char __pyx_k_Incompatible___conform___in_base[] = "Incompatible __conform__ in base class";
+static const char __pyx_k_Incompatible_checksums_0x_x_vs_0[] = "Incompatible checksums (0x%x vs (0x7df4935, 0xf638272, 0x99fdb36) = (func))";
+static const char __pyx_k_conformsRegistry_findImplementat[] = "conformsRegistry_findImplementation";
+static PyObject *__pyx_n_s_ADAPT_SEQUENCE;
+static PyObject *__pyx_n_s_AdaptationFailure;
+static PyObject *__pyx_n_s_AdapterChain;
+static PyObject *__pyx_kp_s_AdapterChain_r;
+static PyObject *__pyx_n_s_AdapterRecord;
+static PyObject *__pyx_kp_s_AdapterRecord_r_r;
+static PyObject *__pyx_kp_s_Ambiguous_adapter_choice;
+static PyObject *__pyx_n_s_AttributeError;
+static PyObject *__pyx_kp_s_Can_t_adapt;
+static PyObject *__pyx_n_s_DOES_NOT_SUPPORT;
+static PyObject *__pyx_n_s_ExtensionClass;
+static PyObject *__pyx_n_s_ImportError;
+static PyObject *__pyx_kp_s_Incompatible___conform___in_base;
+static PyObject *__pyx_kp_s_Incompatible_checksums_0x_x_vs_0;
+static PyObject *__pyx_n_s_Interface;
+static PyObject *__pyx_n_s_InterfaceClass;
+static PyObject *__pyx_n_s_KeyError;
+static PyObject *__pyx_n_s_NO_ADAPTER_NEEDED;
+static PyObject *__pyx_kp_s_Not_a_classic_class;
+static PyObject *__pyx_n_s_PickleError;
+static PyObject *__pyx_n_s_Protocol__adapt;
+static PyObject *__pyx_n_s_Protocol__adapters;
+static PyObject *__pyx_n_s_Protocol__applyPending;
+static PyObject *__pyx_n_s_Protocol__cache;
+static PyObject *__pyx_n_s_Protocol__cacheKey;
+static PyObject *__pyx_n_s_Protocol__call;
+static PyObject *__pyx_n_s_Protocol__changes;
+static PyObject *__pyx_n_s_Protocol__pendingSources;
+static PyObject *__pyx_n_s_Protocol_getAdapterForType;
+static PyObject *__pyx_n_s_ProviderMixin__conform;
+static PyObject *__pyx_kp_s_Read_only_attribute;
+static PyObject *__pyx_n_s_TypeError;
+static PyObject *__pyx_n_s_WeakKeyDictionary;
+static PyObject *__pyx_n_s_a1;
+static PyObject *__pyx_n_s_a2;
+static PyObject *__pyx_n_s_adapt;
+static PyObject *__pyx_n_s_adapt_each;
+static PyObject *__pyx_n_s_adapt_first;
+static PyObject *__pyx_n_s_adapt_many;
+static PyObject *__pyx_n_s_adapter;
+static PyObject *__pyx_n_s_adapterCount;
+static PyObject *__pyx_n_s_adapters;
+static PyObject *__pyx_n_s_all;
+static PyObject *__pyx_n_s_baseProtocol;
+static PyObject *__pyx_n_s_bases;
+static PyObject *__pyx_n_s_call;
+static PyObject *__pyx_n_s_checkSelf;
+static PyObject *__pyx_n_s_class;
+static PyObject *__pyx_n_s_classicMRO;
+static PyObject *__pyx_n_s_cline_in_traceback;
+static PyObject *__pyx_n_s_cls;
+static PyObject *__pyx_n_s_cmp;
+static PyObject *__pyx_n_s_conformsRegistry;
+static PyObject *__pyx_n_s_conformsRegistry__call;
+static PyObject *__pyx_n_s_conformsRegistry_findImplementat;
+static PyObject *__pyx_n_s_d1;
+static PyObject *__pyx_n_s_d2;
+static PyObject *__pyx_n_s_data;
+static PyObject *__pyx_n_s_default;
+static PyObject *__pyx_n_s_depth;
+static PyObject *__pyx_n_s_dict;
+static PyObject *__pyx_n_s_exact;
+static PyObject *__pyx_n_s_exc_info;
+static PyObject *__pyx_n_s_extClassMRO;
+static PyObject *__pyx_n_s_extendedClassic;
+static PyObject *__pyx_n_s_factory;
+static PyObject *__pyx_n_s_findImplementation;
+static PyObject *__pyx_n_s_func;
+static PyObject *__pyx_n_s_get;
+static PyObject *__pyx_n_s_getMRO;
+static PyObject *__pyx_n_s_getstate;
+static PyObject *__pyx_n_s_i;
+static PyObject *__pyx_n_s_import;
+static PyObject *__pyx_n_s_init;
+static PyObject *__pyx_n_s_installConformsRegistry;
+static PyObject *__pyx_n_s_installInterfaceCall;
+static PyObject *__pyx_n_s_key;
+static PyObject *__pyx_n_s_main;
+static PyObject *__pyx_n_s_mapping;
+static PyObject *__pyx_n_s_metamethod;
+static PyObject *__pyx_n_s_minimumAdapter;
+static PyObject *__pyx_n_s_mro;
+static PyObject *__pyx_n_s_mro_2;
+static PyObject *__pyx_n_s_name;
+static PyObject *__pyx_n_s_new;
+static PyObject *__pyx_n_s_new_2;
+static PyObject *__pyx_n_s_ob;
+static PyObject *__pyx_n_s_obj;
+static PyObject *__pyx_n_s_object;
+static PyObject *__pyx_n_s_objects;
+static PyObject *__pyx_n_s_old;
+static PyObject *__pyx_n_s_pickle;
+static PyObject *__pyx_n_s_proto;
+static PyObject *__pyx_n_s_protocol;
+static PyObject *__pyx_n_s_protocols;
+static PyObject *__pyx_n_s_protocols__speedups;
+static PyObject *__pyx_n_s_protocols_adapters;
+static PyObject *__pyx_n_s_pyx_PickleError;
+static PyObject *__pyx_n_s_pyx_checksum;
+static PyObject *__pyx_n_s_pyx_result;
+static PyObject *__pyx_n_s_pyx_state;
+static PyObject *__pyx_n_s_pyx_type;
+static PyObject *__pyx_n_s_pyx_unpickle_metamethod;
+static PyObject *__pyx_n_s_record;
+static PyObject *__pyx_n_s_reduce;
+static PyObject *__pyx_n_s_reduce_cython;
+static PyObject *__pyx_n_s_reduce_ex;
+static PyObject *__pyx_n_s_self;
+static PyObject *__pyx_n_s_setstate;
+static PyObject *__pyx_n_s_setstate_cython;
+static PyObject *__pyx_kp_s_speedups_pyx;
+static PyObject *__pyx_kp_s_stringsource;
+static PyObject *__pyx_n_s_subject;
+static PyObject *__pyx_n_s_sys;
+static PyObject *__pyx_n_s_tb_next;
+static PyObject *__pyx_n_s_test;
+static PyObject *__pyx_n_s_tmp;
+static PyObject *__pyx_n_s_typ;
+static PyObject *__pyx_n_s_unbound_adapter;
+static PyObject *__pyx_n_s_update;
+static PyObject *__pyx_n_s_updateWithSimplestAdapter;
+static PyObject *__pyx_n_s_weakref;
+static PyObject *__pyx_pf_9protocols_9_speedups_NO_ADAPTER_NEEDED(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_obj, CYTHON_UNUSED PyObject *__pyx_v_protocol); /* proto */
+static PyObject *__pyx_pf_9protocols_9_speedups_2DOES_NOT_SUPPORT(CYTHON_UNUSED PyObject *__pyx_self, CYTHON_UNUSED PyObject *__pyx_v_obj, CYTHON_UNUSED PyObject *__pyx_v_protocol); /* proto */
+static int __pyx_pf_9protocols_9_speedups_10metamethod___init__(struct __pyx_obj_9protocols_9_speedups_metamethod *__pyx_v_self, PyObject *__pyx_v_func); /* proto */
+static PyObject *__pyx_pf_9protocols_9_speedups_10metamethod_2__get__(struct __pyx_obj_9protocols_9_speedups_metamethod *__pyx_v_self, PyObject *__pyx_v_ob, PyObject *__pyx_v_typ); /* proto */
+static int __pyx_pf_9protocols_9_speedups_10metamethod_4__set__(CYTHON_UNUSED struct __pyx_obj_9protocols_9_speedups_metamethod *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v_ob, CYTHON_UNUSED PyObject *__pyx_v_value); /* proto */
+static int __pyx_pf_9protocols_9_speedups_10metamethod_6__delete__(CYTHON_UNUSED struct __pyx_obj_9protocols_9_speedups_metamethod *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v_ob); /* proto */
+static PyObject *__pyx_pf_9protocols_9_speedups_10metamethod_8__reduce_cython__(struct __pyx_obj_9protocols_9_speedups_metamethod *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_9protocols_9_speedups_10metamethod_10__setstate_cython__(struct __pyx_obj_9protocols_9_speedups_metamethod *__pyx_v_self, PyObject *__pyx_v___pyx_state); /* proto */
+static int __pyx_pf_9protocols_9_speedups_12AdapterChain___init__(struct __pyx_obj_9protocols_9_speedups_AdapterChain *__pyx_v_self, PyObject *__pyx_v_adapters); /* proto */
+static PyObject *__pyx_pf_9protocols_9_speedups_12AdapterChain_16__adapterCount_____get__(struct __pyx_obj_9protocols_9_speedups_AdapterChain *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_9protocols_9_speedups_12AdapterChain_2__call__(struct __pyx_obj_9protocols_9_speedups_AdapterChain *__pyx_v_self, PyObject *__pyx_v_ob); /* proto */
+static PyObject *__pyx_pf_9protocols_9_speedups_12AdapterChain_4__reduce__(struct __pyx_obj_9protocols_9_speedups_AdapterChain *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_9protocols_9_speedups_12AdapterChain_6__repr__(struct __pyx_obj_9protocols_9_speedups_AdapterChain *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_9protocols_9_speedups_12AdapterChain_8adapters___get__(struct __pyx_obj_9protocols_9_speedups_AdapterChain *__pyx_v_self); /* proto */
+static int __pyx_pf_9protocols_9_speedups_13AdapterRecord___init__(struct __pyx_obj_9protocols_9_speedups_AdapterRecord *__pyx_v_self, PyObject *__pyx_v_adapter, PyObject *__pyx_v_depth); /* proto */
+static PyObject *__pyx_pf_9protocols_9_speedups_13AdapterRecord_2__getitem__(struct __pyx_obj_9protocols_9_speedups_AdapterRecord *__pyx_v_self, PyObject *__pyx_v_index); /* proto */
+static Py_ssize_t __pyx_pf_9protocols_9_speedups_13AdapterRecord_4__len__(CYTHON_UNUSED struct __pyx_obj_9protocols_9_speedups_AdapterRecord *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_9protocols_9_speedups_13AdapterRecord_6__iter__(struct __pyx_obj_9protocols_9_speedups_AdapterRecord *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_9protocols_9_speedups_13AdapterRecord_8__reduce__(struct __pyx_obj_9protocols_9_speedups_AdapterRecord *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_9protocols_9_speedups_13AdapterRecord_10__repr__(struct __pyx_obj_9protocols_9_speedups_AdapterRecord *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_9protocols_9_speedups_13AdapterRecord_7adapter___get__(struct __pyx_obj_9protocols_9_speedups_AdapterRecord *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_9protocols_9_speedups_13AdapterRecord_5depth___get__(struct __pyx_obj_9protocols_9_speedups_AdapterRecord *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_9protocols_9_speedups_13AdapterRecord_5count___get__(struct __pyx_obj_9protocols_9_speedups_AdapterRecord *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_9protocols_9_speedups_13AdapterRecord_7unbound___get__(struct __pyx_obj_9protocols_9_speedups_AdapterRecord *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_9protocols_9_speedups_4minimumAdapter(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_a1, PyObject *__pyx_v_a2, PyObject *__pyx_v_d1, PyObject *__pyx_v_d2); /* proto */
+static PyObject *__pyx_pf_9protocols_9_speedups_6updateWithSimplestAdapter(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_mapping, PyObject *__pyx_v_key, PyObject *__pyx_v_adapter, PyObject *__pyx_v_depth); /* proto */
+static PyObject *__pyx_pf_9protocols_9_speedups_8adapt(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_obj, PyObject *__pyx_v_protocol, PyObject *__pyx_v_default); /* proto */
+static PyObject *__pyx_pf_9protocols_9_speedups_10Protocol__call__(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self, PyObject *__pyx_v_ob, PyObject *__pyx_v_default); /* proto */
+static PyObject *__pyx_pf_9protocols_9_speedups_12adapt_many(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_objects, PyObject *__pyx_v_protocol, PyObject *__pyx_v_default); /* proto */
+static PyObject *__pyx_pf_9protocols_9_speedups_14ADAPT_SEQUENCE(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ob, PyObject *__pyx_v_proto); /* proto */
+static PyObject *__pyx_pf_9protocols_9_speedups_16adapt_first(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_obj, PyObject *__pyx_v_protocols, PyObject *__pyx_v_default); /* proto */
+static PyObject *__pyx_pf_9protocols_9_speedups_18adapt_each(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_obj, PyObject *__pyx_v_protocols, PyObject *__pyx_v_default); /* proto */
+static PyObject *__pyx_pf_9protocols_9_speedups_20installInterfaceCall(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_InterfaceClass, PyObject *__pyx_v_Interface); /* proto */
+static PyObject *__pyx_pf_9protocols_9_speedups_22classicMRO(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ob, PyObject *__pyx_v_extendedClassic); /* proto */
+static PyObject *__pyx_pf_9protocols_9_speedups_24extClassMRO(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ob, PyObject *__pyx_v_extendedClassic); /* proto */
+static PyObject *__pyx_pf_9protocols_9_speedups_26getMRO(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ob, PyObject *__pyx_v_extendedClassic); /* proto */
+static PyObject *__pyx_pf_9protocols_9_speedups_28Protocol_getAdapterForType(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self, PyObject *__pyx_v_typ); /* proto */
+static PyObject *__pyx_pf_9protocols_9_speedups_30Protocol__adapt__(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self, PyObject *__pyx_v_obj); /* proto */
+static PyObject *__pyx_pf_9protocols_9_speedups_32ProviderMixin__conform__(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self, PyObject *__pyx_v_protocol); /* proto */
+static PyObject *__pyx_pf_9protocols_9_speedups_34conformsRegistry_findImplementation(CYTHON_UNUSED PyObject *__pyx_self, CYTHON_UNUSED PyObject *__pyx_v_self, PyObject *__pyx_v_subject, PyObject *__pyx_v_protocol, CYTHON_UNUSED PyObject *__pyx_v_checkSelf); /* proto */
+static PyObject *__pyx_pf_9protocols_9_speedups_36conformsRegistry__call__(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self, PyObject *__pyx_v_protocol); /* proto */
+static PyObject *__pyx_pf_9protocols_9_speedups_38installConformsRegistry(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_conformsRegistry); /* proto */
+static PyObject *__pyx_pf_9protocols_9_speedups_40__pyx_unpickle_metamethod(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v___pyx_type, long __pyx_v___pyx_checksum, PyObject *__pyx_v___pyx_state); /* proto */
+static PyObject *__pyx_tp_new_9protocols_9_speedups_metamethod(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
+static PyObject *__pyx_tp_new_9protocols_9_speedups_AdapterChain(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
+static PyObject *__pyx_tp_new_9protocols_9_speedups_AdapterRecord(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
+static PyObject *__pyx_int_0;
+static PyObject *__pyx_int_1;
+static PyObject *__pyx_int_132073781;
+static PyObject *__pyx_int_161471286;
+static PyObject *__pyx_int_258179698;
+static PyObject *__pyx_k__2;
+static PyObject *__pyx_k__3;
+static PyObject *__pyx_k__4;
+static PyObject *__pyx_k__5;
+static PyObject *__pyx_tuple_;
+static PyObject *__pyx_slice__6;
+static PyObject *__pyx_tuple__7;
+static PyObject *__pyx_tuple__8;
+static PyObject *__pyx_tuple__10;
+static PyObject *__pyx_tuple__12;
+static PyObject *__pyx_tuple__14;
+static PyObject *__pyx_tuple__16;
+static PyObject *__pyx_tuple__18;
+static PyObject *__pyx_tuple__20;
+static PyObject *__pyx_tuple__22;
+static PyObject *__pyx_tuple__24;
+static PyObject *__pyx_tuple__26;
+static PyObject *__pyx_tuple__28;
+static PyObject *__pyx_tuple__30;
+static PyObject *__pyx_tuple__32;
+static PyObject *__pyx_tuple__34;
+static PyObject *__pyx_tuple__36;
+static PyObject *__pyx_tuple__38;
+static PyObject *__pyx_tuple__40;
+static PyObject *__pyx_tuple__42;
+static PyObject *__pyx_tuple__44;
+static PyObject *__pyx_tuple__46;
+static PyObject *__pyx_tuple__48;
+static PyObject *__pyx_codeobj__9;
+static PyObject *__pyx_codeobj__11;
+static PyObject *__pyx_codeobj__13;
+static PyObject *__pyx_codeobj__15;
+static PyObject *__pyx_codeobj__17;
+static PyObject *__pyx_codeobj__19;
+static PyObject *__pyx_codeobj__21;
+static PyObject *__pyx_codeobj__23;
+static PyObject *__pyx_codeobj__25;
+static PyObject *__pyx_codeobj__27;
+static PyObject *__pyx_codeobj__29;
+static PyObject *__pyx_codeobj__31;
+static PyObject *__pyx_codeobj__33;
+static PyObject *__pyx_codeobj__35;
+static PyObject *__pyx_codeobj__37;
+static PyObject *__pyx_codeobj__39;
+static PyObject *__pyx_codeobj__41;
+static PyObject *__pyx_codeobj__43;
+static PyObject *__pyx_codeobj__45;
+static PyObject *__pyx_codeobj__47;
+static PyObject *__pyx_codeobj__49;
+/* Late includes */
+
+/* "protocols/_speedups.pyx":123
+ * 
+ * 
+ * cdef int reraise() except -1:             # <<<<<<<<<<<<<<
+ *     # Pass on the error a C API call has already set
+ *     return -1
+ */
+
+static int __pyx_f_9protocols_9_speedups_reraise(void) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("reraise", 0);
+
+  /* "protocols/_speedups.pyx":125
+ * cdef int reraise() except -1:
+ *     # Pass on the error a C API call has already set
+ *     return -1             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_r = -1;
+  goto __pyx_L0;
+
+  /* "protocols/_speedups.pyx":123
+ * 
+ * 
+ * cdef int reraise() except -1:             # <<<<<<<<<<<<<<
+ *     # Pass on the error a C API call has already set
+ *     return -1
+ */
+
+  /* function exit code */
   __pyx_L0:;
-  Py_DECREF(__pyx_v_obj);
-  Py_DECREF(__pyx_v_protocol);
-  Py_DECREF(__pyx_v_default);
+  __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_f_9_speedups_Protocol__call__(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static char __pyx_doc_9_speedups_Protocol__call__[] = "Adapt to this protocol";
-static PyObject *__pyx_f_9_speedups_Protocol__call__(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  PyObject *__pyx_v_self = 0;
-  PyObject *__pyx_v_ob = 0;
-  PyObject *__pyx_v_default = 0;
-  PyObject *__pyx_r;
-  PyObject *__pyx_1 = 0;
-  static char *__pyx_argnames[] = {"self","ob","default",0};
-  __pyx_v_default = __pyx_k22;
-  if (!PyArg_ParseTupleAndKeywords(__pyx_args, __pyx_kwds, "OO|O", __pyx_argnames, &__pyx_v_self, &__pyx_v_ob, &__pyx_v_default)) return 0;
-  Py_INCREF(__pyx_v_self);
-  Py_INCREF(__pyx_v_ob);
-  Py_INCREF(__pyx_v_default);
-
-  /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":198 */
-  __pyx_1 = __pyx_f_9_speedups__adapt(__pyx_v_ob,__pyx_v_self,__pyx_v_default); if (!__pyx_1) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 198; goto __pyx_L1;}
-  __pyx_r = __pyx_1;
-  __pyx_1 = 0;
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; Py_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1:;
-  Py_XDECREF(__pyx_1);
-  __Pyx_AddTraceback("_speedups.Protocol__call__");
-  __pyx_r = 0;
-  __pyx_L0:;
-  Py_DECREF(__pyx_v_self);
-  Py_DECREF(__pyx_v_ob);
-  Py_DECREF(__pyx_v_default);
+/* "protocols/_speedups.pyx":133
+ * # Fundamental Adapters
+ * 
+ * def NO_ADAPTER_NEEDED(obj, protocol=None):             # <<<<<<<<<<<<<<
+ *     """Assume 'obj' implements 'protocol' directly"""
+ *     return obj
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_9protocols_9_speedups_1NO_ADAPTER_NEEDED(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_9protocols_9_speedups_NO_ADAPTER_NEEDED[] = "Assume 'obj' implements 'protocol' directly";
+static PyMethodDef __pyx_mdef_9protocols_9_speedups_1NO_ADAPTER_NEEDED = {"NO_ADAPTER_NEEDED", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_9protocols_9_speedups_1NO_ADAPTER_NEEDED, METH_VARARGS|METH_KEYWORDS, __pyx_doc_9protocols_9_speedups_NO_ADAPTER_NEEDED};
+static PyObject *__pyx_pw_9protocols_9_speedups_1NO_ADAPTER_NEEDED(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_obj = 0;
+  CYTHON_UNUSED PyObject *__pyx_v_protocol = 0;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("NO_ADAPTER_NEEDED (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_obj,&__pyx_n_s_protocol,0};
+    PyObject* values[2] = {0,0};
+    values[1] = ((PyObject *)Py_None);
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_obj)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_protocol);
+          if (value) { values[1] = value; kw_args--; }
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "NO_ADAPTER_NEEDED") < 0)) __PYX_ERR(0, 133, __pyx_L3_error)
+      }
+    } else {
+      switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+    }
+    __pyx_v_obj = values[0];
+    __pyx_v_protocol = values[1];
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("NO_ADAPTER_NEEDED", 0, 1, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 133, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("protocols._speedups.NO_ADAPTER_NEEDED", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_9protocols_9_speedups_NO_ADAPTER_NEEDED(__pyx_self, __pyx_v_obj, __pyx_v_protocol);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_f_9_speedups_buildClassicMRO(PyClassObject (*__pyx_v_cls),PyListObject (*__pyx_v_list)) {
-  PyTupleObject (*__pyx_v_bases);
-  int __pyx_v_i;
-  PyObject *__pyx_v_tmp;
-  PyObject *__pyx_r;
-  PyObject *__pyx_1 = 0;
-  int __pyx_2;
-  __pyx_v_tmp = Py_None; Py_INCREF(Py_None);
-
-  /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":211 */
-  __pyx_1 = (PyObject *)__pyx_v_cls;
-  Py_INCREF(__pyx_1);
-  __pyx_2 = PyList_Append(__pyx_v_list,__pyx_1); if (__pyx_2 == (-1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 211; goto __pyx_L1;}
-  Py_DECREF(__pyx_1); __pyx_1 = 0;
+static PyObject *__pyx_pf_9protocols_9_speedups_NO_ADAPTER_NEEDED(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_obj, CYTHON_UNUSED PyObject *__pyx_v_protocol) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("NO_ADAPTER_NEEDED", 0);
 
-  /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":212 */
-  __pyx_v_bases = __pyx_v_cls->cl_bases;
+  /* "protocols/_speedups.pyx":135
+ * def NO_ADAPTER_NEEDED(obj, protocol=None):
+ *     """Assume 'obj' implements 'protocol' directly"""
+ *     return obj             # <<<<<<<<<<<<<<
+ * 
+ * def DOES_NOT_SUPPORT(obj, protocol=None):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v_obj);
+  __pyx_r = __pyx_v_obj;
+  goto __pyx_L0;
 
-  /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":214 */
-  __pyx_2 = (__pyx_v_bases != 0);
-  if (__pyx_2) {
+  /* "protocols/_speedups.pyx":133
+ * # Fundamental Adapters
+ * 
+ * def NO_ADAPTER_NEEDED(obj, protocol=None):             # <<<<<<<<<<<<<<
+ *     """Assume 'obj' implements 'protocol' directly"""
+ *     return obj
+ */
 
-    /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":215 */
-    __pyx_2 = PyTuple_GET_SIZE(__pyx_v_bases);
-    for (__pyx_v_i = 0; __pyx_v_i < __pyx_2; ++__pyx_v_i) {
+  /* function exit code */
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
 
-      /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":216 */
-      __pyx_1 = (PyObject *)PyTuple_GET_ITEM(__pyx_v_bases,__pyx_v_i);
-      Py_INCREF(__pyx_1);
-      Py_DECREF(__pyx_v_tmp);
-      __pyx_v_tmp = __pyx_1;
-      __pyx_1 = 0;
+/* "protocols/_speedups.pyx":137
+ *     return obj
+ * 
+ * def DOES_NOT_SUPPORT(obj, protocol=None):             # <<<<<<<<<<<<<<
+ *     """Prevent 'obj' from supporting 'protocol'"""
+ *     return None
+ */
 
-      /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":217 */
-      __pyx_1 = __pyx_f_9_speedups_buildClassicMRO(((PyClassObject (*))__pyx_v_tmp),__pyx_v_list); if (!__pyx_1) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 217; goto __pyx_L1;}
-      Py_DECREF(__pyx_1); __pyx_1 = 0;
+/* Python wrapper */
+static PyObject *__pyx_pw_9protocols_9_speedups_3DOES_NOT_SUPPORT(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_9protocols_9_speedups_2DOES_NOT_SUPPORT[] = "Prevent 'obj' from supporting 'protocol'";
+static PyMethodDef __pyx_mdef_9protocols_9_speedups_3DOES_NOT_SUPPORT = {"DOES_NOT_SUPPORT", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_9protocols_9_speedups_3DOES_NOT_SUPPORT, METH_VARARGS|METH_KEYWORDS, __pyx_doc_9protocols_9_speedups_2DOES_NOT_SUPPORT};
+static PyObject *__pyx_pw_9protocols_9_speedups_3DOES_NOT_SUPPORT(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  CYTHON_UNUSED PyObject *__pyx_v_obj = 0;
+  CYTHON_UNUSED PyObject *__pyx_v_protocol = 0;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("DOES_NOT_SUPPORT (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_obj,&__pyx_n_s_protocol,0};
+    PyObject* values[2] = {0,0};
+    values[1] = ((PyObject *)Py_None);
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_obj)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_protocol);
+          if (value) { values[1] = value; kw_args--; }
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "DOES_NOT_SUPPORT") < 0)) __PYX_ERR(0, 137, __pyx_L3_error)
+      }
+    } else {
+      switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        break;
+        default: goto __pyx_L5_argtuple_error;
+      }
     }
-    goto __pyx_L2;
+    __pyx_v_obj = values[0];
+    __pyx_v_protocol = values[1];
   }
-  __pyx_L2:;
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("DOES_NOT_SUPPORT", 0, 1, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 137, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("protocols._speedups.DOES_NOT_SUPPORT", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_9protocols_9_speedups_2DOES_NOT_SUPPORT(__pyx_self, __pyx_v_obj, __pyx_v_protocol);
 
-  __pyx_r = Py_None; Py_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1:;
-  Py_XDECREF(__pyx_1);
-  __Pyx_AddTraceback("_speedups.buildClassicMRO");
-  __pyx_r = 0;
-  __pyx_L0:;
-  Py_DECREF(__pyx_v_tmp);
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_k29p;
+static PyObject *__pyx_pf_9protocols_9_speedups_2DOES_NOT_SUPPORT(CYTHON_UNUSED PyObject *__pyx_self, CYTHON_UNUSED PyObject *__pyx_v_obj, CYTHON_UNUSED PyObject *__pyx_v_protocol) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("DOES_NOT_SUPPORT", 0);
 
-static char (__pyx_k29[]) = "Not a classic class";
+  /* "protocols/_speedups.pyx":139
+ * def DOES_NOT_SUPPORT(obj, protocol=None):
+ *     """Prevent 'obj' from supporting 'protocol'"""
+ *     return None             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
 
-static PyObject *__pyx_f_9_speedups_classicMRO(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static PyObject *__pyx_f_9_speedups_classicMRO(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  PyObject *__pyx_v_ob = 0;
-  PyObject *__pyx_v_extendedClassic = 0;
-  PyObject *__pyx_v_mro;
-  PyObject *__pyx_r;
-  int __pyx_1;
-  PyObject *__pyx_2 = 0;
-  PyObject *__pyx_3 = 0;
-  PyObject *__pyx_4 = 0;
-  static char *__pyx_argnames[] = {"ob","extendedClassic",0};
-  __pyx_v_extendedClassic = __pyx_k23;
-  if (!PyArg_ParseTupleAndKeywords(__pyx_args, __pyx_kwds, "O|O", __pyx_argnames, &__pyx_v_ob, &__pyx_v_extendedClassic)) return 0;
-  Py_INCREF(__pyx_v_ob);
-  Py_INCREF(__pyx_v_extendedClassic);
-  __pyx_v_mro = Py_None; Py_INCREF(Py_None);
-
-  /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":222 */
-  __pyx_1 = PyClass_Check(__pyx_v_ob);
-  if (__pyx_1) {
-
-    /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":223 */
-    __pyx_2 = PyList_New(0); if (!__pyx_2) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 223; goto __pyx_L1;}
-    Py_DECREF(__pyx_v_mro);
-    __pyx_v_mro = __pyx_2;
-    __pyx_2 = 0;
-
-    /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":224 */
-    __pyx_2 = __pyx_f_9_speedups_buildClassicMRO(((PyClassObject (*))__pyx_v_ob),((PyListObject (*))__pyx_v_mro)); if (!__pyx_2) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 224; goto __pyx_L1;}
-    Py_DECREF(__pyx_2); __pyx_2 = 0;
-
-    /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":225 */
-    __pyx_1 = PyObject_IsTrue(__pyx_v_extendedClassic); if (__pyx_1 < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 225; goto __pyx_L1;}
-    if (__pyx_1) {
-
-      /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":226 */
-      __pyx_2 = (PyObject *)(&PyInstance_Type);
-      Py_INCREF(__pyx_2);
-      __pyx_1 = PyList_Append(((PyListObject (*))__pyx_v_mro),__pyx_2); if (__pyx_1 == (-1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 226; goto __pyx_L1;}
-      Py_DECREF(__pyx_2); __pyx_2 = 0;
-
-      /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":227 */
-      __pyx_2 = (PyObject *)(&PyBaseObject_Type);
-      Py_INCREF(__pyx_2);
-      __pyx_1 = PyList_Append(((PyListObject (*))__pyx_v_mro),__pyx_2); if (__pyx_1 == (-1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 227; goto __pyx_L1;}
-      Py_DECREF(__pyx_2); __pyx_2 = 0;
-      goto __pyx_L3;
-    }
-    __pyx_L3:;
-
-    /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":228 */
-    Py_INCREF(__pyx_v_mro);
-    __pyx_r = __pyx_v_mro;
-    goto __pyx_L0;
-    goto __pyx_L2;
-  }
-  __pyx_L2:;
-
-  /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":230 */
-  __pyx_2 = __Pyx_GetName(__pyx_b, __pyx_n_TypeError); if (!__pyx_2) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 230; goto __pyx_L1;}
-  __pyx_3 = PyTuple_New(2); if (!__pyx_3) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 230; goto __pyx_L1;}
-  Py_INCREF(__pyx_k29p);
-  PyTuple_SET_ITEM(__pyx_3, 0, __pyx_k29p);
-  Py_INCREF(__pyx_v_ob);
-  PyTuple_SET_ITEM(__pyx_3, 1, __pyx_v_ob);
-  __pyx_4 = PyObject_CallObject(__pyx_2, __pyx_3); if (!__pyx_4) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 230; goto __pyx_L1;}
-  Py_DECREF(__pyx_2); __pyx_2 = 0;
-  Py_DECREF(__pyx_3); __pyx_3 = 0;
-  __Pyx_Raise(__pyx_4, 0, 0);
-  Py_DECREF(__pyx_4); __pyx_4 = 0;
-  {__pyx_filename = __pyx_f[0]; __pyx_lineno = 230; goto __pyx_L1;}
-
-  __pyx_r = Py_None; Py_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1:;
-  Py_XDECREF(__pyx_2);
-  Py_XDECREF(__pyx_3);
-  Py_XDECREF(__pyx_4);
-  __Pyx_AddTraceback("_speedups.classicMRO");
-  __pyx_r = 0;
+  /* "protocols/_speedups.pyx":137
+ *     return obj
+ * 
+ * def DOES_NOT_SUPPORT(obj, protocol=None):             # <<<<<<<<<<<<<<
+ *     """Prevent 'obj' from supporting 'protocol'"""
+ *     return None
+ */
+
+  /* function exit code */
   __pyx_L0:;
-  Py_DECREF(__pyx_v_mro);
-  Py_DECREF(__pyx_v_ob);
-  Py_DECREF(__pyx_v_extendedClassic);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_n___bases__;
+/* "protocols/_speedups.pyx":147
+ *     cdef object func
+ * 
+ *     def __init__(self, func):             # <<<<<<<<<<<<<<
+ *         self.func = func
+ * 
+ */
+
+/* Python wrapper */
+static int __pyx_pw_9protocols_9_speedups_10metamethod_1__init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static int __pyx_pw_9protocols_9_speedups_10metamethod_1__init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_func = 0;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__init__ (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_func,0};
+    PyObject* values[1] = {0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_func)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__init__") < 0)) __PYX_ERR(0, 147, __pyx_L3_error)
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 1) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+    }
+    __pyx_v_func = values[0];
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("__init__", 1, 1, 1, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 147, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("protocols._speedups.metamethod.__init__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return -1;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_9protocols_9_speedups_10metamethod___init__(((struct __pyx_obj_9protocols_9_speedups_metamethod *)__pyx_v_self), __pyx_v_func);
 
-static PyObject *__pyx_f_9_speedups_buildECMRO(PyObject *__pyx_v_cls,PyListObject (*__pyx_v_list)) {
-  PyObject *__pyx_v_i;
-  PyObject *__pyx_r;
-  int __pyx_1;
-  PyObject *__pyx_2 = 0;
-  PyObject *__pyx_3 = 0;
-  Py_INCREF(__pyx_v_cls);
-  __pyx_v_i = Py_None; Py_INCREF(Py_None);
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
 
-  /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":248 */
-  __pyx_1 = PyList_Append(__pyx_v_list,__pyx_v_cls); if (__pyx_1 == (-1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 248; goto __pyx_L1;}
+static int __pyx_pf_9protocols_9_speedups_10metamethod___init__(struct __pyx_obj_9protocols_9_speedups_metamethod *__pyx_v_self, PyObject *__pyx_v_func) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__init__", 0);
 
-  /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":249 */
-  __pyx_2 = PyObject_GetAttr(__pyx_v_cls, __pyx_n___bases__); if (!__pyx_2) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 249; goto __pyx_L1;}
-  __pyx_3 = PyObject_GetIter(__pyx_2); if (!__pyx_3) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 249; goto __pyx_L1;}
-  Py_DECREF(__pyx_2); __pyx_2 = 0;
-  for (;;) {
-    __pyx_2 = PyIter_Next(__pyx_3);
-    if (!__pyx_2) {
-      if (PyErr_Occurred()) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 249; goto __pyx_L1;}
-      break;
-    }
-    Py_DECREF(__pyx_v_i);
-    __pyx_v_i = __pyx_2;
-    __pyx_2 = 0;
+  /* "protocols/_speedups.pyx":148
+ * 
+ *     def __init__(self, func):
+ *         self.func = func             # <<<<<<<<<<<<<<
+ * 
+ *     def __get__(self, ob, typ):
+ */
+  __Pyx_INCREF(__pyx_v_func);
+  __Pyx_GIVEREF(__pyx_v_func);
+  __Pyx_GOTREF(__pyx_v_self->func);
+  __Pyx_DECREF(__pyx_v_self->func);
+  __pyx_v_self->func = __pyx_v_func;
 
-    /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":250 */
-    __pyx_2 = __pyx_f_9_speedups_buildECMRO(__pyx_v_i,__pyx_v_list); if (!__pyx_2) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 250; goto __pyx_L1;}
-    Py_DECREF(__pyx_2); __pyx_2 = 0;
-  }
-  Py_DECREF(__pyx_3); __pyx_3 = 0;
+  /* "protocols/_speedups.pyx":147
+ *     cdef object func
+ * 
+ *     def __init__(self, func):             # <<<<<<<<<<<<<<
+ *         self.func = func
+ * 
+ */
 
-  __pyx_r = Py_None; Py_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1:;
-  Py_XDECREF(__pyx_2);
-  Py_XDECREF(__pyx_3);
-  __Pyx_AddTraceback("_speedups.buildECMRO");
+  /* function exit code */
   __pyx_r = 0;
-  __pyx_L0:;
-  Py_DECREF(__pyx_v_i);
-  Py_DECREF(__pyx_v_cls);
+  __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_f_9_speedups_extClassMRO(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static PyObject *__pyx_f_9_speedups_extClassMRO(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  PyObject *__pyx_v_ob = 0;
-  PyObject *__pyx_v_extendedClassic = 0;
-  PyObject *__pyx_v_mro;
-  PyObject *__pyx_r;
-  PyObject *__pyx_1 = 0;
-  int __pyx_2;
-  static char *__pyx_argnames[] = {"ob","extendedClassic",0};
-  __pyx_v_extendedClassic = __pyx_k24;
-  if (!PyArg_ParseTupleAndKeywords(__pyx_args, __pyx_kwds, "O|O", __pyx_argnames, &__pyx_v_ob, &__pyx_v_extendedClassic)) return 0;
-  Py_INCREF(__pyx_v_ob);
-  Py_INCREF(__pyx_v_extendedClassic);
-  __pyx_v_mro = Py_None; Py_INCREF(Py_None);
-
-  /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":254 */
-  __pyx_1 = PyList_New(0); if (!__pyx_1) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 254; goto __pyx_L1;}
-  Py_DECREF(__pyx_v_mro);
-  __pyx_v_mro = __pyx_1;
-  __pyx_1 = 0;
-
-  /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":255 */
-  __pyx_1 = __pyx_f_9_speedups_buildECMRO(__pyx_v_ob,((PyListObject (*))__pyx_v_mro)); if (!__pyx_1) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 255; goto __pyx_L1;}
-  Py_DECREF(__pyx_1); __pyx_1 = 0;
-
-  /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":256 */
-  __pyx_2 = PyObject_IsTrue(__pyx_v_extendedClassic); if (__pyx_2 < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 256; goto __pyx_L1;}
-  if (__pyx_2) {
-
-    /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":257 */
-    __pyx_1 = (PyObject *)(&PyInstance_Type);
-    Py_INCREF(__pyx_1);
-    __pyx_2 = PyList_Append(((PyListObject (*))__pyx_v_mro),__pyx_1); if (__pyx_2 == (-1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 257; goto __pyx_L1;}
-    Py_DECREF(__pyx_1); __pyx_1 = 0;
-
-    /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":258 */
-    __pyx_1 = (PyObject *)(&PyBaseObject_Type);
-    Py_INCREF(__pyx_1);
-    __pyx_2 = PyList_Append(((PyListObject (*))__pyx_v_mro),__pyx_1); if (__pyx_2 == (-1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 258; goto __pyx_L1;}
-    Py_DECREF(__pyx_1); __pyx_1 = 0;
-    goto __pyx_L2;
-  }
-  __pyx_L2:;
-
-  /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":259 */
-  Py_INCREF(__pyx_v_mro);
-  __pyx_r = __pyx_v_mro;
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; Py_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1:;
-  Py_XDECREF(__pyx_1);
-  __Pyx_AddTraceback("_speedups.extClassMRO");
-  __pyx_r = 0;
-  __pyx_L0:;
-  Py_DECREF(__pyx_v_mro);
-  Py_DECREF(__pyx_v_ob);
-  Py_DECREF(__pyx_v_extendedClassic);
+/* "protocols/_speedups.pyx":150
+ *         self.func = func
+ * 
+ *     def __get__(self, ob, typ):             # <<<<<<<<<<<<<<
+ *         if ob is None:
+ *             return self
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_9protocols_9_speedups_10metamethod_3__get__(PyObject *__pyx_v_self, PyObject *__pyx_v_ob, PyObject *__pyx_v_typ); /*proto*/
+static PyObject *__pyx_pw_9protocols_9_speedups_10metamethod_3__get__(PyObject *__pyx_v_self, PyObject *__pyx_v_ob, PyObject *__pyx_v_typ) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_9protocols_9_speedups_10metamethod_2__get__(((struct __pyx_obj_9protocols_9_speedups_metamethod *)__pyx_v_self), ((PyObject *)__pyx_v_ob), ((PyObject *)__pyx_v_typ));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_n___mro__;
+static PyObject *__pyx_pf_9protocols_9_speedups_10metamethod_2__get__(struct __pyx_obj_9protocols_9_speedups_metamethod *__pyx_v_self, PyObject *__pyx_v_ob, PyObject *__pyx_v_typ) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__get__", 0);
 
-static PyObject *__pyx_f_9_speedups_getMRO(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static PyObject *__pyx_f_9_speedups_getMRO(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  PyObject *__pyx_v_ob = 0;
-  PyObject *__pyx_v_extendedClassic = 0;
-  PyObject *__pyx_r;
-  int __pyx_1;
-  PyObject *__pyx_2 = 0;
-  PyObject *__pyx_3 = 0;
-  PyObject *__pyx_4 = 0;
-  static char *__pyx_argnames[] = {"ob","extendedClassic",0};
-  __pyx_v_extendedClassic = __pyx_k25;
-  if (!PyArg_ParseTupleAndKeywords(__pyx_args, __pyx_kwds, "O|O", __pyx_argnames, &__pyx_v_ob, &__pyx_v_extendedClassic)) return 0;
-  Py_INCREF(__pyx_v_ob);
-  Py_INCREF(__pyx_v_extendedClassic);
-
-  /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":265 */
-  __pyx_1 = PyClass_Check(__pyx_v_ob);
-  if (__pyx_1) {
-
-    /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":266 */
-    __pyx_2 = __Pyx_GetName(__pyx_m, __pyx_n_classicMRO); if (!__pyx_2) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 266; goto __pyx_L1;}
-    __pyx_3 = PyTuple_New(2); if (!__pyx_3) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 266; goto __pyx_L1;}
-    Py_INCREF(__pyx_v_ob);
-    PyTuple_SET_ITEM(__pyx_3, 0, __pyx_v_ob);
-    Py_INCREF(__pyx_v_extendedClassic);
-    PyTuple_SET_ITEM(__pyx_3, 1, __pyx_v_extendedClassic);
-    __pyx_4 = PyObject_CallObject(__pyx_2, __pyx_3); if (!__pyx_4) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 266; goto __pyx_L1;}
-    Py_DECREF(__pyx_2); __pyx_2 = 0;
-    Py_DECREF(__pyx_3); __pyx_3 = 0;
-    __pyx_r = __pyx_4;
-    __pyx_4 = 0;
-    goto __pyx_L0;
-    goto __pyx_L2;
-  }
-  __pyx_1 = PyType_Check(__pyx_v_ob);
-  if (__pyx_1) {
+  /* "protocols/_speedups.pyx":151
+ * 
+ *     def __get__(self, ob, typ):
+ *         if ob is None:             # <<<<<<<<<<<<<<
+ *             return self
+ *         return PyMethod_New(self.func, ob, typ)
+ */
+  __pyx_t_1 = (__pyx_v_ob == Py_None);
+  __pyx_t_2 = (__pyx_t_1 != 0);
+  if (__pyx_t_2) {
 
-    /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":269 */
-    __pyx_2 = PyObject_GetAttr(__pyx_v_ob, __pyx_n___mro__); if (!__pyx_2) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 269; goto __pyx_L1;}
-    __pyx_r = __pyx_2;
-    __pyx_2 = 0;
-    goto __pyx_L0;
-    goto __pyx_L2;
-  }
-  __pyx_1 = PyObject_TypeCheck(__pyx_v_ob,__pyx_v_9_speedups___ECType);
-  if (__pyx_1) {
-
-    /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":272 */
-    __pyx_3 = __Pyx_GetName(__pyx_m, __pyx_n_extClassMRO); if (!__pyx_3) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 272; goto __pyx_L1;}
-    __pyx_4 = PyTuple_New(2); if (!__pyx_4) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 272; goto __pyx_L1;}
-    Py_INCREF(__pyx_v_ob);
-    PyTuple_SET_ITEM(__pyx_4, 0, __pyx_v_ob);
-    Py_INCREF(__pyx_v_extendedClassic);
-    PyTuple_SET_ITEM(__pyx_4, 1, __pyx_v_extendedClassic);
-    __pyx_2 = PyObject_CallObject(__pyx_3, __pyx_4); if (!__pyx_2) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 272; goto __pyx_L1;}
-    Py_DECREF(__pyx_3); __pyx_3 = 0;
-    Py_DECREF(__pyx_4); __pyx_4 = 0;
-    __pyx_r = __pyx_2;
-    __pyx_2 = 0;
+    /* "protocols/_speedups.pyx":152
+ *     def __get__(self, ob, typ):
+ *         if ob is None:
+ *             return self             # <<<<<<<<<<<<<<
+ *         return PyMethod_New(self.func, ob, typ)
+ * 
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_INCREF(((PyObject *)__pyx_v_self));
+    __pyx_r = ((PyObject *)__pyx_v_self);
     goto __pyx_L0;
-    goto __pyx_L2;
+
+    /* "protocols/_speedups.pyx":151
+ * 
+ *     def __get__(self, ob, typ):
+ *         if ob is None:             # <<<<<<<<<<<<<<
+ *             return self
+ *         return PyMethod_New(self.func, ob, typ)
+ */
   }
-  __pyx_L2:;
 
-  /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":274 */
-  __pyx_3 = PyTuple_New(1); if (!__pyx_3) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 274; goto __pyx_L1;}
-  Py_INCREF(__pyx_v_ob);
-  PyTuple_SET_ITEM(__pyx_3, 0, __pyx_v_ob);
-  __pyx_r = __pyx_3;
-  __pyx_3 = 0;
+  /* "protocols/_speedups.pyx":153
+ *         if ob is None:
+ *             return self
+ *         return PyMethod_New(self.func, ob, typ)             # <<<<<<<<<<<<<<
+ * 
+ *     def __set__(self, ob, value):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_3 = __pyx_v_self->func;
+  __Pyx_INCREF(__pyx_t_3);
+  __pyx_t_4 = PyMethod_New(__pyx_t_3, __pyx_v_ob, __pyx_v_typ); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 153, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_r = __pyx_t_4;
+  __pyx_t_4 = 0;
   goto __pyx_L0;
 
-  __pyx_r = Py_None; Py_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1:;
-  Py_XDECREF(__pyx_2);
-  Py_XDECREF(__pyx_3);
-  Py_XDECREF(__pyx_4);
-  __Pyx_AddTraceback("_speedups.getMRO");
-  __pyx_r = 0;
+  /* "protocols/_speedups.pyx":150
+ *         self.func = func
+ * 
+ *     def __get__(self, ob, typ):             # <<<<<<<<<<<<<<
+ *         if ob is None:
+ *             return self
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_AddTraceback("protocols._speedups.metamethod.__get__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
   __pyx_L0:;
-  Py_DECREF(__pyx_v_ob);
-  Py_DECREF(__pyx_v_extendedClassic);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_n__Protocol__adapters;
-static PyObject *__pyx_n_get;
+/* "protocols/_speedups.pyx":155
+ *         return PyMethod_New(self.func, ob, typ)
+ * 
+ *     def __set__(self, ob, value):             # <<<<<<<<<<<<<<
+ *         raise AttributeError("Read-only attribute")
+ * 
+ */
 
-static PyObject *__pyx_f_9_speedups_Protocol__adapt__(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static PyObject *__pyx_f_9_speedups_Protocol__adapt__(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  PyObject *__pyx_v_self = 0;
-  PyObject *__pyx_v_obj = 0;
-  void (*__pyx_v_tmp);
-  int __pyx_v_i;
-  PyObject *__pyx_v_cls;
-  PyObject *__pyx_v_err;
-  PyObject *__pyx_v_mro;
-  PyObject *__pyx_v_get;
-  PyObject *__pyx_v_factory;
-  PyObject *__pyx_r;
-  int __pyx_1;
-  PyObject *__pyx_2 = 0;
-  PyObject *__pyx_3 = 0;
-  PyObject *__pyx_4 = 0;
-  int __pyx_5;
-  PyObject *__pyx_6 = 0;
-  static char *__pyx_argnames[] = {"self","obj",0};
-  if (!PyArg_ParseTupleAndKeywords(__pyx_args, __pyx_kwds, "OO", __pyx_argnames, &__pyx_v_self, &__pyx_v_obj)) return 0;
-  Py_INCREF(__pyx_v_self);
-  Py_INCREF(__pyx_v_obj);
-  __pyx_v_cls = Py_None; Py_INCREF(Py_None);
-  __pyx_v_err = Py_None; Py_INCREF(Py_None);
-  __pyx_v_mro = Py_None; Py_INCREF(Py_None);
-  __pyx_v_get = Py_None; Py_INCREF(Py_None);
-  __pyx_v_factory = Py_None; Py_INCREF(Py_None);
-
-  /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":293 */
-  __pyx_1 = PyInstance_Check(__pyx_v_obj);
-  if (__pyx_1) {
-
-    /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":294 */
-    __pyx_2 = (PyObject *)((PyInstanceObject (*))__pyx_v_obj)->in_class;
-    Py_INCREF(__pyx_2);
-    Py_DECREF(__pyx_v_cls);
-    __pyx_v_cls = __pyx_2;
-    __pyx_2 = 0;
-    goto __pyx_L2;
-  }
-  /*else*/ {
+/* Python wrapper */
+static int __pyx_pw_9protocols_9_speedups_10metamethod_5__set__(PyObject *__pyx_v_self, PyObject *__pyx_v_ob, PyObject *__pyx_v_value); /*proto*/
+static int __pyx_pw_9protocols_9_speedups_10metamethod_5__set__(PyObject *__pyx_v_self, PyObject *__pyx_v_ob, PyObject *__pyx_v_value) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__set__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_9protocols_9_speedups_10metamethod_4__set__(((struct __pyx_obj_9protocols_9_speedups_metamethod *)__pyx_v_self), ((PyObject *)__pyx_v_ob), ((PyObject *)__pyx_v_value));
 
-    /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":297 */
-    __pyx_2 = __Pyx_GetName(__pyx_m, __pyx_n___class); if (!__pyx_2) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 297; goto __pyx_L1;}
-    __pyx_v_tmp = PyObject_GetAttr(__pyx_v_obj,__pyx_2);
-    Py_DECREF(__pyx_2); __pyx_2 = 0;
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
 
-    /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":299 */
-    __pyx_1 = (__pyx_v_tmp != 0);
-    if (__pyx_1) {
+static int __pyx_pf_9protocols_9_speedups_10metamethod_4__set__(CYTHON_UNUSED struct __pyx_obj_9protocols_9_speedups_metamethod *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v_ob, CYTHON_UNUSED PyObject *__pyx_v_value) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__set__", 0);
 
-      /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":300 */
-      __pyx_2 = (PyObject *)__pyx_v_tmp;
-      Py_INCREF(__pyx_2);
-      Py_DECREF(__pyx_v_cls);
-      __pyx_v_cls = __pyx_2;
-      __pyx_2 = 0;
+  /* "protocols/_speedups.pyx":156
+ * 
+ *     def __set__(self, ob, value):
+ *         raise AttributeError("Read-only attribute")             # <<<<<<<<<<<<<<
+ * 
+ *     def __delete__(self, ob):
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_AttributeError, __pyx_tuple_, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 156, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_Raise(__pyx_t_1, 0, 0, 0);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __PYX_ERR(0, 156, __pyx_L1_error)
 
-      /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":301 */
-      Py_DECREF(((PyObject (*))__pyx_v_tmp));
-      goto __pyx_L3;
-    }
-    __pyx_1 = PyErr_ExceptionMatches(PyExc_AttributeError);
-    if (__pyx_1) {
+  /* "protocols/_speedups.pyx":155
+ *         return PyMethod_New(self.func, ob, typ)
+ * 
+ *     def __set__(self, ob, value):             # <<<<<<<<<<<<<<
+ *         raise AttributeError("Read-only attribute")
+ * 
+ */
 
-      /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":305 */
-      PyErr_Clear();
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("protocols._speedups.metamethod.__set__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
 
-      /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":306 */
-      __pyx_2 = (PyObject *)((PyObject (*))__pyx_v_obj)->ob_type;
-      Py_INCREF(__pyx_2);
-      Py_DECREF(__pyx_v_cls);
-      __pyx_v_cls = __pyx_2;
-      __pyx_2 = 0;
-      goto __pyx_L3;
-    }
-    /*else*/ {
+/* "protocols/_speedups.pyx":158
+ *         raise AttributeError("Read-only attribute")
+ * 
+ *     def __delete__(self, ob):             # <<<<<<<<<<<<<<
+ *         raise AttributeError("Read-only attribute")
+ * 
+ */
 
-      /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":310 */
-      __pyx_2 = __Pyx_GetExcValue(); if (!__pyx_2) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 310; goto __pyx_L1;}
-      Py_DECREF(__pyx_v_err);
-      __pyx_v_err = __pyx_2;
-      __pyx_2 = 0;
+/* Python wrapper */
+static int __pyx_pw_9protocols_9_speedups_10metamethod_7__delete__(PyObject *__pyx_v_self, PyObject *__pyx_v_ob); /*proto*/
+static int __pyx_pw_9protocols_9_speedups_10metamethod_7__delete__(PyObject *__pyx_v_self, PyObject *__pyx_v_ob) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__delete__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_9protocols_9_speedups_10metamethod_6__delete__(((struct __pyx_obj_9protocols_9_speedups_metamethod *)__pyx_v_self), ((PyObject *)__pyx_v_ob));
 
-      /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":311 */
-      __Pyx_ReRaise();
-      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 311; goto __pyx_L1;}
-    }
-    __pyx_L3:;
-  }
-  __pyx_L2:;
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static int __pyx_pf_9protocols_9_speedups_10metamethod_6__delete__(CYTHON_UNUSED struct __pyx_obj_9protocols_9_speedups_metamethod *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v_ob) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__delete__", 0);
 
-  /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":313 */
-  __pyx_v_tmp = ((void (*))0);
+  /* "protocols/_speedups.pyx":159
+ * 
+ *     def __delete__(self, ob):
+ *         raise AttributeError("Read-only attribute")             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_AttributeError, __pyx_tuple_, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 159, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_Raise(__pyx_t_1, 0, 0, 0);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __PYX_ERR(0, 159, __pyx_L1_error)
 
-  /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":315 */
-  __pyx_1 = PyType_Check(__pyx_v_cls);
-  if (__pyx_1) {
+  /* "protocols/_speedups.pyx":158
+ *         raise AttributeError("Read-only attribute")
+ * 
+ *     def __delete__(self, ob):             # <<<<<<<<<<<<<<
+ *         raise AttributeError("Read-only attribute")
+ * 
+ */
 
-    /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":317 */
-    __pyx_v_tmp = ((void (*))((PyTypeObject (*))__pyx_v_cls)->tp_mro);
-    goto __pyx_L4;
-  }
-  __pyx_L4:;
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("protocols._speedups.metamethod.__delete__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
 
-  /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":329 */
-  __pyx_1 = (__pyx_v_tmp != 0);
-  if (__pyx_1) {
+/* "(tree fragment)":1
+ * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
+ *     cdef tuple state
+ *     cdef object _dict
+ */
 
-    /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":330 */
-    __pyx_2 = (PyObject *)__pyx_v_tmp;
-    Py_INCREF(__pyx_2);
-    Py_DECREF(__pyx_v_mro);
-    __pyx_v_mro = __pyx_2;
-    __pyx_2 = 0;
-    goto __pyx_L5;
+/* Python wrapper */
+static PyObject *__pyx_pw_9protocols_9_speedups_10metamethod_9__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static PyObject *__pyx_pw_9protocols_9_speedups_10metamethod_9__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__reduce_cython__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_9protocols_9_speedups_10metamethod_8__reduce_cython__(((struct __pyx_obj_9protocols_9_speedups_metamethod *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_9protocols_9_speedups_10metamethod_8__reduce_cython__(struct __pyx_obj_9protocols_9_speedups_metamethod *__pyx_v_self) {
+  PyObject *__pyx_v_state = 0;
+  PyObject *__pyx_v__dict = 0;
+  int __pyx_v_use_setstate;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__reduce_cython__", 0);
+
+  /* "(tree fragment)":5
+ *     cdef object _dict
+ *     cdef bint use_setstate
+ *     state = (self.func,)             # <<<<<<<<<<<<<<
+ *     _dict = getattr(self, '__dict__', None)
+ *     if _dict is not None:
+ */
+  __pyx_t_1 = PyTuple_New(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 5, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_INCREF(__pyx_v_self->func);
+  __Pyx_GIVEREF(__pyx_v_self->func);
+  PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_v_self->func);
+  __pyx_v_state = ((PyObject*)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "(tree fragment)":6
+ *     cdef bint use_setstate
+ *     state = (self.func,)
+ *     _dict = getattr(self, '__dict__', None)             # <<<<<<<<<<<<<<
+ *     if _dict is not None:
+ *         state += (_dict,)
+ */
+  __pyx_t_1 = __Pyx_GetAttr3(((PyObject *)__pyx_v_self), __pyx_n_s_dict, Py_None); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 6, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_v__dict = __pyx_t_1;
+  __pyx_t_1 = 0;
+
+  /* "(tree fragment)":7
+ *     state = (self.func,)
+ *     _dict = getattr(self, '__dict__', None)
+ *     if _dict is not None:             # <<<<<<<<<<<<<<
+ *         state += (_dict,)
+ *         use_setstate = True
+ */
+  __pyx_t_2 = (__pyx_v__dict != Py_None);
+  __pyx_t_3 = (__pyx_t_2 != 0);
+  if (__pyx_t_3) {
+
+    /* "(tree fragment)":8
+ *     _dict = getattr(self, '__dict__', None)
+ *     if _dict is not None:
+ *         state += (_dict,)             # <<<<<<<<<<<<<<
+ *         use_setstate = True
+ *     else:
+ */
+    __pyx_t_1 = PyTuple_New(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 8, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_INCREF(__pyx_v__dict);
+    __Pyx_GIVEREF(__pyx_v__dict);
+    PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_v__dict);
+    __pyx_t_4 = PyNumber_InPlaceAdd(__pyx_v_state, __pyx_t_1); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 8, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_DECREF_SET(__pyx_v_state, ((PyObject*)__pyx_t_4));
+    __pyx_t_4 = 0;
+
+    /* "(tree fragment)":9
+ *     if _dict is not None:
+ *         state += (_dict,)
+ *         use_setstate = True             # <<<<<<<<<<<<<<
+ *     else:
+ *         use_setstate = self.func is not None
+ */
+    __pyx_v_use_setstate = 1;
+
+    /* "(tree fragment)":7
+ *     state = (self.func,)
+ *     _dict = getattr(self, '__dict__', None)
+ *     if _dict is not None:             # <<<<<<<<<<<<<<
+ *         state += (_dict,)
+ *         use_setstate = True
+ */
+    goto __pyx_L3;
   }
-  __pyx_1 = PyClass_Check(__pyx_v_cls);
-  if (__pyx_1) {
-
-    /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":334 */
-    __pyx_2 = PyList_New(0); if (!__pyx_2) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 334; goto __pyx_L1;}
-    Py_DECREF(__pyx_v_mro);
-    __pyx_v_mro = __pyx_2;
-    __pyx_2 = 0;
-
-    /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":335 */
-    __pyx_2 = __pyx_f_9_speedups_buildClassicMRO(((PyClassObject (*))__pyx_v_cls),((PyListObject (*))__pyx_v_mro)); if (!__pyx_2) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 335; goto __pyx_L1;}
-    Py_DECREF(__pyx_2); __pyx_2 = 0;
-
-    /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":336 */
-    __pyx_2 = (PyObject *)(&PyInstance_Type);
-    Py_INCREF(__pyx_2);
-    __pyx_1 = PyList_Append(((PyListObject (*))__pyx_v_mro),__pyx_2); if (__pyx_1 == (-1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 336; goto __pyx_L1;}
-    Py_DECREF(__pyx_2); __pyx_2 = 0;
-
-    /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":337 */
-    __pyx_2 = (PyObject *)(&PyBaseObject_Type);
-    Py_INCREF(__pyx_2);
-    __pyx_1 = PyList_Append(((PyListObject (*))__pyx_v_mro),__pyx_2); if (__pyx_1 == (-1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 337; goto __pyx_L1;}
-    Py_DECREF(__pyx_2); __pyx_2 = 0;
-    goto __pyx_L5;
+
+  /* "(tree fragment)":11
+ *         use_setstate = True
+ *     else:
+ *         use_setstate = self.func is not None             # <<<<<<<<<<<<<<
+ *     if use_setstate:
+ *         return __pyx_unpickle_metamethod, (type(self), 0x7df4935, None), state
+ */
+  /*else*/ {
+    __pyx_t_3 = (__pyx_v_self->func != Py_None);
+    __pyx_v_use_setstate = __pyx_t_3;
+  }
+  __pyx_L3:;
+
+  /* "(tree fragment)":12
+ *     else:
+ *         use_setstate = self.func is not None
+ *     if use_setstate:             # <<<<<<<<<<<<<<
+ *         return __pyx_unpickle_metamethod, (type(self), 0x7df4935, None), state
+ *     else:
+ */
+  __pyx_t_3 = (__pyx_v_use_setstate != 0);
+  if (__pyx_t_3) {
+
+    /* "(tree fragment)":13
+ *         use_setstate = self.func is not None
+ *     if use_setstate:
+ *         return __pyx_unpickle_metamethod, (type(self), 0x7df4935, None), state             # <<<<<<<<<<<<<<
+ *     else:
+ *         return __pyx_unpickle_metamethod, (type(self), 0x7df4935, state)
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_pyx_unpickle_metamethod); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 13, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_1 = PyObject_Type(((PyObject *)__pyx_v_self)); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 13, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_5 = PyTuple_New(3); if (unlikely(!__pyx_t_5)) __PYX_ERR(1, 13, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_GIVEREF(__pyx_t_1);
+    PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_1);
+    __Pyx_INCREF(__pyx_int_132073781);
+    __Pyx_GIVEREF(__pyx_int_132073781);
+    PyTuple_SET_ITEM(__pyx_t_5, 1, __pyx_int_132073781);
+    __Pyx_INCREF(Py_None);
+    __Pyx_GIVEREF(Py_None);
+    PyTuple_SET_ITEM(__pyx_t_5, 2, Py_None);
+    __pyx_t_1 = 0;
+    __pyx_t_1 = PyTuple_New(3); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 13, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_GIVEREF(__pyx_t_4);
+    PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_t_4);
+    __Pyx_GIVEREF(__pyx_t_5);
+    PyTuple_SET_ITEM(__pyx_t_1, 1, __pyx_t_5);
+    __Pyx_INCREF(__pyx_v_state);
+    __Pyx_GIVEREF(__pyx_v_state);
+    PyTuple_SET_ITEM(__pyx_t_1, 2, __pyx_v_state);
+    __pyx_t_4 = 0;
+    __pyx_t_5 = 0;
+    __pyx_r = __pyx_t_1;
+    __pyx_t_1 = 0;
+    goto __pyx_L0;
+
+    /* "(tree fragment)":12
+ *     else:
+ *         use_setstate = self.func is not None
+ *     if use_setstate:             # <<<<<<<<<<<<<<
+ *         return __pyx_unpickle_metamethod, (type(self), 0x7df4935, None), state
+ *     else:
+ */
   }
+
+  /* "(tree fragment)":15
+ *         return __pyx_unpickle_metamethod, (type(self), 0x7df4935, None), state
+ *     else:
+ *         return __pyx_unpickle_metamethod, (type(self), 0x7df4935, state)             # <<<<<<<<<<<<<<
+ * def __setstate_cython__(self, __pyx_state):
+ *     __pyx_unpickle_metamethod__set_state(self, __pyx_state)
+ */
   /*else*/ {
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_pyx_unpickle_metamethod); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 15, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_5 = PyObject_Type(((PyObject *)__pyx_v_self)); if (unlikely(!__pyx_t_5)) __PYX_ERR(1, 15, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __pyx_t_4 = PyTuple_New(3); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 15, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_GIVEREF(__pyx_t_5);
+    PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_5);
+    __Pyx_INCREF(__pyx_int_132073781);
+    __Pyx_GIVEREF(__pyx_int_132073781);
+    PyTuple_SET_ITEM(__pyx_t_4, 1, __pyx_int_132073781);
+    __Pyx_INCREF(__pyx_v_state);
+    __Pyx_GIVEREF(__pyx_v_state);
+    PyTuple_SET_ITEM(__pyx_t_4, 2, __pyx_v_state);
+    __pyx_t_5 = 0;
+    __pyx_t_5 = PyTuple_New(2); if (unlikely(!__pyx_t_5)) __PYX_ERR(1, 15, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_GIVEREF(__pyx_t_1);
+    PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_1);
+    __Pyx_GIVEREF(__pyx_t_4);
+    PyTuple_SET_ITEM(__pyx_t_5, 1, __pyx_t_4);
+    __pyx_t_1 = 0;
+    __pyx_t_4 = 0;
+    __pyx_r = __pyx_t_5;
+    __pyx_t_5 = 0;
+    goto __pyx_L0;
+  }
+
+  /* "(tree fragment)":1
+ * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
+ *     cdef tuple state
+ *     cdef object _dict
+ */
 
-    /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":341 */
-    __pyx_v_tmp = PyObject_GetAttr(__pyx_v_cls,__pyx_v_9_speedups___mro);
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_AddTraceback("protocols._speedups.metamethod.__reduce_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_state);
+  __Pyx_XDECREF(__pyx_v__dict);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
 
-    /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":342 */
-    __pyx_1 = (__pyx_v_tmp != 0);
-    if (__pyx_1) {
+/* "(tree fragment)":16
+ *     else:
+ *         return __pyx_unpickle_metamethod, (type(self), 0x7df4935, state)
+ * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
+ *     __pyx_unpickle_metamethod__set_state(self, __pyx_state)
+ */
 
-      /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":343 */
-      __pyx_2 = (PyObject *)__pyx_v_tmp;
-      Py_INCREF(__pyx_2);
-      Py_DECREF(__pyx_v_mro);
-      __pyx_v_mro = __pyx_2;
-      __pyx_2 = 0;
+/* Python wrapper */
+static PyObject *__pyx_pw_9protocols_9_speedups_10metamethod_11__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state); /*proto*/
+static PyObject *__pyx_pw_9protocols_9_speedups_10metamethod_11__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__setstate_cython__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_9protocols_9_speedups_10metamethod_10__setstate_cython__(((struct __pyx_obj_9protocols_9_speedups_metamethod *)__pyx_v_self), ((PyObject *)__pyx_v___pyx_state));
 
-      /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":344 */
-      Py_DECREF(((PyObject (*))__pyx_v_tmp));
-      goto __pyx_L6;
-    }
-    __pyx_1 = PyObject_TypeCheck(__pyx_v_cls,__pyx_v_9_speedups___ECType);
-    if (__pyx_1) {
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
 
-      /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":349 */
-      PyErr_Clear();
+static PyObject *__pyx_pf_9protocols_9_speedups_10metamethod_10__setstate_cython__(struct __pyx_obj_9protocols_9_speedups_metamethod *__pyx_v_self, PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__setstate_cython__", 0);
 
-      /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":350 */
-      __pyx_2 = __Pyx_GetName(__pyx_m, __pyx_n_extClassMRO); if (!__pyx_2) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 350; goto __pyx_L1;}
-      __pyx_3 = PyInt_FromLong(1); if (!__pyx_3) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 350; goto __pyx_L1;}
-      __pyx_4 = PyTuple_New(2); if (!__pyx_4) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 350; goto __pyx_L1;}
-      Py_INCREF(__pyx_v_cls);
-      PyTuple_SET_ITEM(__pyx_4, 0, __pyx_v_cls);
-      PyTuple_SET_ITEM(__pyx_4, 1, __pyx_3);
-      __pyx_3 = 0;
-      __pyx_3 = PyObject_CallObject(__pyx_2, __pyx_4); if (!__pyx_3) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 350; goto __pyx_L1;}
-      Py_DECREF(__pyx_2); __pyx_2 = 0;
-      Py_DECREF(__pyx_4); __pyx_4 = 0;
-      Py_DECREF(__pyx_v_mro);
-      __pyx_v_mro = __pyx_3;
-      __pyx_3 = 0;
-      goto __pyx_L6;
-    }
-    /*else*/ {
+  /* "(tree fragment)":17
+ *         return __pyx_unpickle_metamethod, (type(self), 0x7df4935, state)
+ * def __setstate_cython__(self, __pyx_state):
+ *     __pyx_unpickle_metamethod__set_state(self, __pyx_state)             # <<<<<<<<<<<<<<
+ */
+  if (!(likely(PyTuple_CheckExact(__pyx_v___pyx_state))||((__pyx_v___pyx_state) == Py_None)||((void)PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "tuple", Py_TYPE(__pyx_v___pyx_state)->tp_name), 0))) __PYX_ERR(1, 17, __pyx_L1_error)
+  __pyx_t_1 = __pyx_f_9protocols_9_speedups___pyx_unpickle_metamethod__set_state(__pyx_v_self, ((PyObject*)__pyx_v___pyx_state)); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 17, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-      /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":355 */
-      __pyx_2 = __Pyx_GetExcValue(); if (!__pyx_2) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 355; goto __pyx_L1;}
-      Py_DECREF(__pyx_v_err);
-      __pyx_v_err = __pyx_2;
-      __pyx_2 = 0;
+  /* "(tree fragment)":16
+ *     else:
+ *         return __pyx_unpickle_metamethod, (type(self), 0x7df4935, state)
+ * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
+ *     __pyx_unpickle_metamethod__set_state(self, __pyx_state)
+ */
 
-      /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":356 */
-      __Pyx_ReRaise();
-      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 356; goto __pyx_L1;}
-    }
-    __pyx_L6:;
-  }
-  __pyx_L5:;
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("protocols._speedups.metamethod.__setstate_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
 
-  /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":370 */
-  __pyx_4 = PyObject_GetAttr(__pyx_v_self, __pyx_n__Protocol__adapters); if (!__pyx_4) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 370; goto __pyx_L1;}
-  __pyx_3 = PyObject_GetAttr(__pyx_4, __pyx_n_get); if (!__pyx_3) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 370; goto __pyx_L1;}
-  Py_DECREF(__pyx_4); __pyx_4 = 0;
-  Py_DECREF(__pyx_v_get);
-  __pyx_v_get = __pyx_3;
-  __pyx_3 = 0;
-
-  /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":372 */
-  __pyx_1 = PyTuple_Check(__pyx_v_mro);
-  if (__pyx_1) {
-
-    /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":374 */
-    __pyx_1 = PyTuple_GET_SIZE(((PyTupleObject (*))__pyx_v_mro));
-    for (__pyx_v_i = 0; __pyx_v_i < __pyx_1; ++__pyx_v_i) {
-
-      /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":375 */
-      __pyx_2 = (PyObject *)PyTuple_GET_ITEM(((PyTupleObject (*))__pyx_v_mro),__pyx_v_i);
-      Py_INCREF(__pyx_2);
-      Py_DECREF(__pyx_v_cls);
-      __pyx_v_cls = __pyx_2;
-      __pyx_2 = 0;
-
-      /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":376 */
-      __pyx_4 = PyTuple_New(1); if (!__pyx_4) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 376; goto __pyx_L1;}
-      Py_INCREF(__pyx_v_cls);
-      PyTuple_SET_ITEM(__pyx_4, 0, __pyx_v_cls);
-      __pyx_3 = PyObject_CallObject(__pyx_v_get, __pyx_4); if (!__pyx_3) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 376; goto __pyx_L1;}
-      Py_DECREF(__pyx_4); __pyx_4 = 0;
-      Py_DECREF(__pyx_v_factory);
-      __pyx_v_factory = __pyx_3;
-      __pyx_3 = 0;
-
-      /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":377 */
-      __pyx_5 = __pyx_v_factory != Py_None;
-      if (__pyx_5) {
-
-        /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":378 */
-        __pyx_2 = PyInt_FromLong(0); if (!__pyx_2) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 378; goto __pyx_L1;}
-        __pyx_4 = PyObject_GetItem(__pyx_v_factory, __pyx_2); if (!__pyx_4) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 378; goto __pyx_L1;}
-        Py_DECREF(__pyx_2); __pyx_2 = 0;
-        __pyx_3 = PyTuple_New(1); if (!__pyx_3) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 378; goto __pyx_L1;}
-        Py_INCREF(__pyx_v_obj);
-        PyTuple_SET_ITEM(__pyx_3, 0, __pyx_v_obj);
-        __pyx_2 = PyObject_CallObject(__pyx_4, __pyx_3); if (!__pyx_2) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 378; goto __pyx_L1;}
-        Py_DECREF(__pyx_4); __pyx_4 = 0;
-        Py_DECREF(__pyx_3); __pyx_3 = 0;
-        __pyx_r = __pyx_2;
-        __pyx_2 = 0;
-        goto __pyx_L0;
-        goto __pyx_L10;
-      }
-      __pyx_L10:;
-    }
-    goto __pyx_L7;
-  }
-  __pyx_5 = PyList_Check(__pyx_v_mro);
-  if (__pyx_5) {
-
-    /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":382 */
-    __pyx_1 = PyList_GET_SIZE(((PyListObject (*))__pyx_v_mro));
-    for (__pyx_v_i = 0; __pyx_v_i < __pyx_1; ++__pyx_v_i) {
-
-      /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":383 */
-      __pyx_4 = (PyObject *)PyList_GET_ITEM(((PyListObject (*))__pyx_v_mro),__pyx_v_i);
-      Py_INCREF(__pyx_4);
-      Py_DECREF(__pyx_v_cls);
-      __pyx_v_cls = __pyx_4;
-      __pyx_4 = 0;
-
-      /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":384 */
-      __pyx_3 = PyTuple_New(1); if (!__pyx_3) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 384; goto __pyx_L1;}
-      Py_INCREF(__pyx_v_cls);
-      PyTuple_SET_ITEM(__pyx_3, 0, __pyx_v_cls);
-      __pyx_2 = PyObject_CallObject(__pyx_v_get, __pyx_3); if (!__pyx_2) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 384; goto __pyx_L1;}
-      Py_DECREF(__pyx_3); __pyx_3 = 0;
-      Py_DECREF(__pyx_v_factory);
-      __pyx_v_factory = __pyx_2;
-      __pyx_2 = 0;
-
-      /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":385 */
-      __pyx_5 = __pyx_v_factory != Py_None;
-      if (__pyx_5) {
-
-        /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":386 */
-        __pyx_4 = PyInt_FromLong(0); if (!__pyx_4) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 386; goto __pyx_L1;}
-        __pyx_3 = PyObject_GetItem(__pyx_v_factory, __pyx_4); if (!__pyx_3) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 386; goto __pyx_L1;}
-        Py_DECREF(__pyx_4); __pyx_4 = 0;
-        __pyx_2 = PyTuple_New(1); if (!__pyx_2) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 386; goto __pyx_L1;}
-        Py_INCREF(__pyx_v_obj);
-        PyTuple_SET_ITEM(__pyx_2, 0, __pyx_v_obj);
-        __pyx_4 = PyObject_CallObject(__pyx_3, __pyx_2); if (!__pyx_4) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 386; goto __pyx_L1;}
-        Py_DECREF(__pyx_3); __pyx_3 = 0;
-        Py_DECREF(__pyx_2); __pyx_2 = 0;
-        __pyx_r = __pyx_4;
-        __pyx_4 = 0;
-        goto __pyx_L0;
-        goto __pyx_L13;
+/* "protocols/_speedups.pyx":168
+ *     cdef int count
+ * 
+ *     def __init__(self, adapters):             # <<<<<<<<<<<<<<
+ *         self.adapters = tuple(adapters)
+ *         self.count = 0
+ */
+
+/* Python wrapper */
+static int __pyx_pw_9protocols_9_speedups_12AdapterChain_1__init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static int __pyx_pw_9protocols_9_speedups_12AdapterChain_1__init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_adapters = 0;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__init__ (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_adapters,0};
+    PyObject* values[1] = {0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_adapters)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__init__") < 0)) __PYX_ERR(0, 168, __pyx_L3_error)
       }
-      __pyx_L13:;
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 1) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
     }
-    goto __pyx_L7;
+    __pyx_v_adapters = values[0];
   }
-  /*else*/ {
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("__init__", 1, 1, 1, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 168, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("protocols._speedups.AdapterChain.__init__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return -1;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_9protocols_9_speedups_12AdapterChain___init__(((struct __pyx_obj_9protocols_9_speedups_AdapterChain *)__pyx_v_self), __pyx_v_adapters);
 
-    /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":391 */
-    __pyx_3 = PyObject_GetIter(__pyx_v_mro); if (!__pyx_3) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 391; goto __pyx_L1;}
-    for (;;) {
-      __pyx_2 = PyIter_Next(__pyx_3);
-      if (!__pyx_2) {
-        if (PyErr_Occurred()) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 391; goto __pyx_L1;}
-        break;
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static int __pyx_pf_9protocols_9_speedups_12AdapterChain___init__(struct __pyx_obj_9protocols_9_speedups_AdapterChain *__pyx_v_self, PyObject *__pyx_v_adapters) {
+  PyObject *__pyx_v_adapter = NULL;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  Py_ssize_t __pyx_t_2;
+  PyObject *(*__pyx_t_3)(PyObject *);
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  int __pyx_t_7;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__init__", 0);
+
+  /* "protocols/_speedups.pyx":169
+ * 
+ *     def __init__(self, adapters):
+ *         self.adapters = tuple(adapters)             # <<<<<<<<<<<<<<
+ *         self.count = 0
+ *         for adapter in self.adapters:
+ */
+  __pyx_t_1 = __Pyx_PySequence_Tuple(__pyx_v_adapters); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 169, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_GIVEREF(__pyx_t_1);
+  __Pyx_GOTREF(__pyx_v_self->adapters);
+  __Pyx_DECREF(__pyx_v_self->adapters);
+  __pyx_v_self->adapters = __pyx_t_1;
+  __pyx_t_1 = 0;
+
+  /* "protocols/_speedups.pyx":170
+ *     def __init__(self, adapters):
+ *         self.adapters = tuple(adapters)
+ *         self.count = 0             # <<<<<<<<<<<<<<
+ *         for adapter in self.adapters:
+ *             self.count = self.count + getattr(adapter,'__adapterCount__',1)
+ */
+  __pyx_v_self->count = 0;
+
+  /* "protocols/_speedups.pyx":171
+ *         self.adapters = tuple(adapters)
+ *         self.count = 0
+ *         for adapter in self.adapters:             # <<<<<<<<<<<<<<
+ *             self.count = self.count + getattr(adapter,'__adapterCount__',1)
+ * 
+ */
+  if (likely(PyList_CheckExact(__pyx_v_self->adapters)) || PyTuple_CheckExact(__pyx_v_self->adapters)) {
+    __pyx_t_1 = __pyx_v_self->adapters; __Pyx_INCREF(__pyx_t_1); __pyx_t_2 = 0;
+    __pyx_t_3 = NULL;
+  } else {
+    __pyx_t_2 = -1; __pyx_t_1 = PyObject_GetIter(__pyx_v_self->adapters); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 171, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_3 = Py_TYPE(__pyx_t_1)->tp_iternext; if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 171, __pyx_L1_error)
+  }
+  for (;;) {
+    if (likely(!__pyx_t_3)) {
+      if (likely(PyList_CheckExact(__pyx_t_1))) {
+        if (__pyx_t_2 >= PyList_GET_SIZE(__pyx_t_1)) break;
+        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+        __pyx_t_4 = PyList_GET_ITEM(__pyx_t_1, __pyx_t_2); __Pyx_INCREF(__pyx_t_4); __pyx_t_2++; if (unlikely(0 < 0)) __PYX_ERR(0, 171, __pyx_L1_error)
+        #else
+        __pyx_t_4 = PySequence_ITEM(__pyx_t_1, __pyx_t_2); __pyx_t_2++; if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 171, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_4);
+        #endif
+      } else {
+        if (__pyx_t_2 >= PyTuple_GET_SIZE(__pyx_t_1)) break;
+        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+        __pyx_t_4 = PyTuple_GET_ITEM(__pyx_t_1, __pyx_t_2); __Pyx_INCREF(__pyx_t_4); __pyx_t_2++; if (unlikely(0 < 0)) __PYX_ERR(0, 171, __pyx_L1_error)
+        #else
+        __pyx_t_4 = PySequence_ITEM(__pyx_t_1, __pyx_t_2); __pyx_t_2++; if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 171, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_4);
+        #endif
       }
-      Py_DECREF(__pyx_v_cls);
-      __pyx_v_cls = __pyx_2;
-      __pyx_2 = 0;
-
-      /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":392 */
-      __pyx_4 = PyTuple_New(1); if (!__pyx_4) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 392; goto __pyx_L1;}
-      Py_INCREF(__pyx_v_cls);
-      PyTuple_SET_ITEM(__pyx_4, 0, __pyx_v_cls);
-      __pyx_2 = PyObject_CallObject(__pyx_v_get, __pyx_4); if (!__pyx_2) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 392; goto __pyx_L1;}
-      Py_DECREF(__pyx_4); __pyx_4 = 0;
-      Py_DECREF(__pyx_v_factory);
-      __pyx_v_factory = __pyx_2;
-      __pyx_2 = 0;
-
-      /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":393 */
-      __pyx_5 = __pyx_v_factory != Py_None;
-      if (__pyx_5) {
-
-        /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":394 */
-        __pyx_4 = PyInt_FromLong(0); if (!__pyx_4) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 394; goto __pyx_L1;}
-        __pyx_2 = PyObject_GetItem(__pyx_v_factory, __pyx_4); if (!__pyx_2) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 394; goto __pyx_L1;}
-        Py_DECREF(__pyx_4); __pyx_4 = 0;
-        __pyx_4 = PyTuple_New(1); if (!__pyx_4) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 394; goto __pyx_L1;}
-        Py_INCREF(__pyx_v_obj);
-        PyTuple_SET_ITEM(__pyx_4, 0, __pyx_v_obj);
-        __pyx_6 = PyObject_CallObject(__pyx_2, __pyx_4); if (!__pyx_6) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 394; goto __pyx_L1;}
-        Py_DECREF(__pyx_2); __pyx_2 = 0;
-        Py_DECREF(__pyx_4); __pyx_4 = 0;
-        __pyx_r = __pyx_6;
-        __pyx_6 = 0;
-        Py_DECREF(__pyx_3); __pyx_3 = 0;
-        goto __pyx_L0;
-        goto __pyx_L16;
+    } else {
+      __pyx_t_4 = __pyx_t_3(__pyx_t_1);
+      if (unlikely(!__pyx_t_4)) {
+        PyObject* exc_type = PyErr_Occurred();
+        if (exc_type) {
+          if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
+          else __PYX_ERR(0, 171, __pyx_L1_error)
+        }
+        break;
       }
-      __pyx_L16:;
+      __Pyx_GOTREF(__pyx_t_4);
     }
-    Py_DECREF(__pyx_3); __pyx_3 = 0;
+    __Pyx_XDECREF_SET(__pyx_v_adapter, __pyx_t_4);
+    __pyx_t_4 = 0;
+
+    /* "protocols/_speedups.pyx":172
+ *         self.count = 0
+ *         for adapter in self.adapters:
+ *             self.count = self.count + getattr(adapter,'__adapterCount__',1)             # <<<<<<<<<<<<<<
+ * 
+ *     property __adapterCount__:
+ */
+    __pyx_t_4 = __Pyx_PyInt_From_int(__pyx_v_self->count); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 172, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_5 = __Pyx_GetAttr3(__pyx_v_adapter, __pyx_n_s_adapterCount, __pyx_int_1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 172, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __pyx_t_6 = PyNumber_Add(__pyx_t_4, __pyx_t_5); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 172, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __pyx_t_7 = __Pyx_PyInt_As_int(__pyx_t_6); if (unlikely((__pyx_t_7 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 172, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __pyx_v_self->count = __pyx_t_7;
+
+    /* "protocols/_speedups.pyx":171
+ *         self.adapters = tuple(adapters)
+ *         self.count = 0
+ *         for adapter in self.adapters:             # <<<<<<<<<<<<<<
+ *             self.count = self.count + getattr(adapter,'__adapterCount__',1)
+ * 
+ */
   }
-  __pyx_L7:;
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  __pyx_r = Py_None; Py_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1:;
-  Py_XDECREF(__pyx_2);
-  Py_XDECREF(__pyx_3);
-  Py_XDECREF(__pyx_4);
-  Py_XDECREF(__pyx_6);
-  __Pyx_AddTraceback("_speedups.Protocol__adapt__");
+  /* "protocols/_speedups.pyx":168
+ *     cdef int count
+ * 
+ *     def __init__(self, adapters):             # <<<<<<<<<<<<<<
+ *         self.adapters = tuple(adapters)
+ *         self.count = 0
+ */
+
+  /* function exit code */
   __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_AddTraceback("protocols._speedups.AdapterChain.__init__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
   __pyx_L0:;
-  Py_DECREF(__pyx_v_cls);
-  Py_DECREF(__pyx_v_err);
-  Py_DECREF(__pyx_v_mro);
-  Py_DECREF(__pyx_v_get);
-  Py_DECREF(__pyx_v_factory);
-  Py_DECREF(__pyx_v_self);
-  Py_DECREF(__pyx_v_obj);
-  return __pyx_r;
-}
-
-static __Pyx_InternTabEntry __pyx_intern_tab[] = {
-  {&__pyx_n_AdaptationFailure, "AdaptationFailure"},
-  {&__pyx_n_AttributeError, "AttributeError"},
-  {&__pyx_n_DOES_NOT_SUPPORT, "DOES_NOT_SUPPORT"},
-  {&__pyx_n_ExtensionClass, "ExtensionClass"},
-  {&__pyx_n_False, "False"},
-  {&__pyx_n_ImportError, "ImportError"},
-  {&__pyx_n_NO_ADAPTER_NEEDED, "NO_ADAPTER_NEEDED"},
-  {&__pyx_n_Protocol__adapt__, "Protocol__adapt__"},
-  {&__pyx_n_Protocol__call__, "Protocol__call__"},
-  {&__pyx_n_TypeError, "TypeError"},
-  {&__pyx_n__Protocol__adapters, "_Protocol__adapters"},
-  {&__pyx_n___all__, "__all__"},
-  {&__pyx_n___bases__, "__bases__"},
-  {&__pyx_n___class, "__class"},
-  {&__pyx_n___mro__, "__mro__"},
-  {&__pyx_n_adapt, "adapt"},
-  {&__pyx_n_classicMRO, "classicMRO"},
-  {&__pyx_n_exc_info, "exc_info"},
-  {&__pyx_n_extClassMRO, "extClassMRO"},
-  {&__pyx_n_get, "get"},
-  {&__pyx_n_getMRO, "getMRO"},
-  {&__pyx_n_metamethod, "metamethod"},
-  {&__pyx_n_object, "object"},
-  {&__pyx_n_sys, "sys"},
-  {&__pyx_n_tb_next, "tb_next"},
-  {0, 0}
-};
+  __Pyx_XDECREF(__pyx_v_adapter);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
 
-static __Pyx_StringTabEntry __pyx_string_tab[] = {
-  {&__pyx_k11p, __pyx_k11, sizeof(__pyx_k11)},
-  {&__pyx_k26p, __pyx_k26, sizeof(__pyx_k26)},
-  {&__pyx_k27p, __pyx_k27, sizeof(__pyx_k27)},
-  {&__pyx_k28p, __pyx_k28, sizeof(__pyx_k28)},
-  {&__pyx_k29p, __pyx_k29, sizeof(__pyx_k29)},
-  {0, 0, 0}
-};
+/* "protocols/_speedups.pyx":175
+ * 
+ *     property __adapterCount__:
+ *         def __get__(self):             # <<<<<<<<<<<<<<
+ *             return self.count
+ * 
+ */
 
-static PyObject *__pyx_tp_new_9_speedups_metamethod(PyTypeObject *t, PyObject *a, PyObject *k) {
-  PyObject *o = (*t->tp_alloc)(t, 0);
-  struct __pyx_obj_9_speedups_metamethod *p = (struct __pyx_obj_9_speedups_metamethod *)o;
-  p->func = Py_None; Py_INCREF(Py_None);
-  return o;
+/* Python wrapper */
+static PyObject *__pyx_pw_9protocols_9_speedups_12AdapterChain_16__adapterCount___1__get__(PyObject *__pyx_v_self); /*proto*/
+static PyObject *__pyx_pw_9protocols_9_speedups_12AdapterChain_16__adapterCount___1__get__(PyObject *__pyx_v_self) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_9protocols_9_speedups_12AdapterChain_16__adapterCount_____get__(((struct __pyx_obj_9protocols_9_speedups_AdapterChain *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
 }
 
-static void __pyx_tp_dealloc_9_speedups_metamethod(PyObject *o) {
-  struct __pyx_obj_9_speedups_metamethod *p = (struct __pyx_obj_9_speedups_metamethod *)o;
-  Py_XDECREF(p->func);
-  (*o->ob_type->tp_free)(o);
+static PyObject *__pyx_pf_9protocols_9_speedups_12AdapterChain_16__adapterCount_____get__(struct __pyx_obj_9protocols_9_speedups_AdapterChain *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__get__", 0);
+
+  /* "protocols/_speedups.pyx":176
+ *     property __adapterCount__:
+ *         def __get__(self):
+ *             return self.count             # <<<<<<<<<<<<<<
+ * 
+ *     def __call__(self, ob):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_self->count); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 176, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "protocols/_speedups.pyx":175
+ * 
+ *     property __adapterCount__:
+ *         def __get__(self):             # <<<<<<<<<<<<<<
+ *             return self.count
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("protocols._speedups.AdapterChain.__adapterCount__.__get__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
 }
 
-static int __pyx_tp_traverse_9_speedups_metamethod(PyObject *o, visitproc v, void *a) {
-  int e;
-  struct __pyx_obj_9_speedups_metamethod *p = (struct __pyx_obj_9_speedups_metamethod *)o;
-  if (p->func) {
-    e = (*v)(p->func, a); if (e) return e;
+/* "protocols/_speedups.pyx":178
+ *             return self.count
+ * 
+ *     def __call__(self, ob):             # <<<<<<<<<<<<<<
+ *         cdef int i
+ *         for i from 0 <= i < PyTuple_GET_SIZE(<PyTupleObject *>self.adapters):
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_9protocols_9_speedups_12AdapterChain_3__call__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static PyObject *__pyx_pw_9protocols_9_speedups_12AdapterChain_3__call__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_ob = 0;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__call__ (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_ob,0};
+    PyObject* values[1] = {0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_ob)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__call__") < 0)) __PYX_ERR(0, 178, __pyx_L3_error)
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 1) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+    }
+    __pyx_v_ob = values[0];
   }
-  return 0;
-}
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("__call__", 1, 1, 1, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 178, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("protocols._speedups.AdapterChain.__call__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_9protocols_9_speedups_12AdapterChain_2__call__(((struct __pyx_obj_9protocols_9_speedups_AdapterChain *)__pyx_v_self), __pyx_v_ob);
 
-static int __pyx_tp_clear_9_speedups_metamethod(PyObject *o) {
-  struct __pyx_obj_9_speedups_metamethod *p = (struct __pyx_obj_9_speedups_metamethod *)o;
-  Py_XDECREF(p->func);
-  p->func = Py_None; Py_INCREF(Py_None);
-  return 0;
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
 }
 
-static PyObject *__pyx_tp_descr_get_9_speedups_metamethod(PyObject *o, PyObject *i, PyObject *c) {
-  PyObject *r = 0;
-  if (!i) i = Py_None;
-  if (!c) c = Py_None;
-  r = __pyx_f_9_speedups_10metamethod___get__(o, i, c);
-  return r;
-}
+static PyObject *__pyx_pf_9protocols_9_speedups_12AdapterChain_2__call__(struct __pyx_obj_9protocols_9_speedups_AdapterChain *__pyx_v_self, PyObject *__pyx_v_ob) {
+  int __pyx_v_i;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  void *__pyx_t_3;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  int __pyx_t_6;
+  int __pyx_t_7;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__call__", 0);
+  __Pyx_INCREF(__pyx_v_ob);
 
-static int __pyx_tp_descr_set_9_speedups_metamethod(PyObject *o, PyObject *i, PyObject *v) {
-  if (v) {
-    return __pyx_f_9_speedups_10metamethod___set__(o, i, v);
-  }
-  else {
-    return __pyx_f_9_speedups_10metamethod___delete__(o, i);
+  /* "protocols/_speedups.pyx":180
+ *     def __call__(self, ob):
+ *         cdef int i
+ *         for i from 0 <= i < PyTuple_GET_SIZE(<PyTupleObject *>self.adapters):             # <<<<<<<<<<<<<<
+ *             ob = (<object> PyTuple_GET_ITEM(<PyTupleObject *>self.adapters, i))(ob)
+ *             if ob is None:
+ */
+  __pyx_t_1 = PyTuple_GET_SIZE(((PyTupleObject *)__pyx_v_self->adapters));
+  for (__pyx_v_i = 0; __pyx_v_i < __pyx_t_1; __pyx_v_i++) {
+
+    /* "protocols/_speedups.pyx":181
+ *         cdef int i
+ *         for i from 0 <= i < PyTuple_GET_SIZE(<PyTupleObject *>self.adapters):
+ *             ob = (<object> PyTuple_GET_ITEM(<PyTupleObject *>self.adapters, i))(ob)             # <<<<<<<<<<<<<<
+ *             if ob is None:
+ *                 return None
+ */
+    __pyx_t_3 = PyTuple_GET_ITEM(((PyTupleObject *)__pyx_v_self->adapters), __pyx_v_i);
+    __Pyx_INCREF(((PyObject *)__pyx_t_3));
+    __pyx_t_4 = ((PyObject *)__pyx_t_3); __pyx_t_5 = NULL;
+    if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_4))) {
+      __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_4);
+      if (likely(__pyx_t_5)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+        __Pyx_INCREF(__pyx_t_5);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_4, function);
+      }
+    }
+    __pyx_t_2 = (__pyx_t_5) ? __Pyx_PyObject_Call2Args(__pyx_t_4, __pyx_t_5, __pyx_v_ob) : __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_v_ob);
+    __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+    if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 181, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_DECREF_SET(__pyx_v_ob, __pyx_t_2);
+    __pyx_t_2 = 0;
+
+    /* "protocols/_speedups.pyx":182
+ *         for i from 0 <= i < PyTuple_GET_SIZE(<PyTupleObject *>self.adapters):
+ *             ob = (<object> PyTuple_GET_ITEM(<PyTupleObject *>self.adapters, i))(ob)
+ *             if ob is None:             # <<<<<<<<<<<<<<
+ *                 return None
+ *         return ob
+ */
+    __pyx_t_6 = (__pyx_v_ob == Py_None);
+    __pyx_t_7 = (__pyx_t_6 != 0);
+    if (__pyx_t_7) {
+
+      /* "protocols/_speedups.pyx":183
+ *             ob = (<object> PyTuple_GET_ITEM(<PyTupleObject *>self.adapters, i))(ob)
+ *             if ob is None:
+ *                 return None             # <<<<<<<<<<<<<<
+ *         return ob
+ * 
+ */
+      __Pyx_XDECREF(__pyx_r);
+      __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+      goto __pyx_L0;
+
+      /* "protocols/_speedups.pyx":182
+ *         for i from 0 <= i < PyTuple_GET_SIZE(<PyTupleObject *>self.adapters):
+ *             ob = (<object> PyTuple_GET_ITEM(<PyTupleObject *>self.adapters, i))(ob)
+ *             if ob is None:             # <<<<<<<<<<<<<<
+ *                 return None
+ *         return ob
+ */
+    }
   }
+
+  /* "protocols/_speedups.pyx":184
+ *             if ob is None:
+ *                 return None
+ *         return ob             # <<<<<<<<<<<<<<
+ * 
+ *     def __reduce__(self):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v_ob);
+  __pyx_r = __pyx_v_ob;
+  goto __pyx_L0;
+
+  /* "protocols/_speedups.pyx":178
+ *             return self.count
+ * 
+ *     def __call__(self, ob):             # <<<<<<<<<<<<<<
+ *         cdef int i
+ *         for i from 0 <= i < PyTuple_GET_SIZE(<PyTupleObject *>self.adapters):
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_AddTraceback("protocols._speedups.AdapterChain.__call__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_ob);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
 }
 
-static struct PyMethodDef __pyx_methods_9_speedups_metamethod[] = {
-  {0, 0, 0, 0}
-};
+/* "protocols/_speedups.pyx":186
+ *         return ob
+ * 
+ *     def __reduce__(self):             # <<<<<<<<<<<<<<
+ *         return AdapterChain, (self.adapters,)
+ * 
+ */
 
-static PyNumberMethods __pyx_tp_as_number_metamethod = {
-  0, /*nb_add*/
-  0, /*nb_subtract*/
-  0, /*nb_multiply*/
-  0, /*nb_divide*/
-  0, /*nb_remainder*/
-  0, /*nb_divmod*/
-  0, /*nb_power*/
-  0, /*nb_negative*/
-  0, /*nb_positive*/
-  0, /*nb_absolute*/
-  0, /*nb_nonzero*/
-  0, /*nb_invert*/
-  0, /*nb_lshift*/
-  0, /*nb_rshift*/
-  0, /*nb_and*/
-  0, /*nb_xor*/
-  0, /*nb_or*/
-  0, /*nb_coerce*/
-  0, /*nb_int*/
-  0, /*nb_long*/
-  0, /*nb_float*/
-  0, /*nb_oct*/
-  0, /*nb_hex*/
-  0, /*nb_inplace_add*/
-  0, /*nb_inplace_subtract*/
-  0, /*nb_inplace_multiply*/
-  0, /*nb_inplace_divide*/
-  0, /*nb_inplace_remainder*/
-  0, /*nb_inplace_power*/
-  0, /*nb_inplace_lshift*/
-  0, /*nb_inplace_rshift*/
-  0, /*nb_inplace_and*/
-  0, /*nb_inplace_xor*/
-  0, /*nb_inplace_or*/
-  0, /*nb_floor_divide*/
-  0, /*nb_true_divide*/
-  0, /*nb_inplace_floor_divide*/
-  0, /*nb_inplace_true_divide*/
-};
+/* Python wrapper */
+static PyObject *__pyx_pw_9protocols_9_speedups_12AdapterChain_5__reduce__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static PyObject *__pyx_pw_9protocols_9_speedups_12AdapterChain_5__reduce__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__reduce__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_9protocols_9_speedups_12AdapterChain_4__reduce__(((struct __pyx_obj_9protocols_9_speedups_AdapterChain *)__pyx_v_self));
 
-static PySequenceMethods __pyx_tp_as_sequence_metamethod = {
-  0, /*sq_length*/
-  0, /*sq_concat*/
-  0, /*sq_repeat*/
-  0, /*sq_item*/
-  0, /*sq_slice*/
-  0, /*sq_ass_item*/
-  0, /*sq_ass_slice*/
-  0, /*sq_contains*/
-  0, /*sq_inplace_concat*/
-  0, /*sq_inplace_repeat*/
-};
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
 
-static PyMappingMethods __pyx_tp_as_mapping_metamethod = {
-  0, /*mp_length*/
-  0, /*mp_subscript*/
-  0, /*mp_ass_subscript*/
-};
+static PyObject *__pyx_pf_9protocols_9_speedups_12AdapterChain_4__reduce__(struct __pyx_obj_9protocols_9_speedups_AdapterChain *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__reduce__", 0);
 
-static PyBufferProcs __pyx_tp_as_buffer_metamethod = {
-  0, /*bf_getreadbuffer*/
-  0, /*bf_getwritebuffer*/
-  0, /*bf_getsegcount*/
-  0, /*bf_getcharbuffer*/
-};
+  /* "protocols/_speedups.pyx":187
+ * 
+ *     def __reduce__(self):
+ *         return AdapterChain, (self.adapters,)             # <<<<<<<<<<<<<<
+ * 
+ *     def __repr__(self):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = PyTuple_New(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 187, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_INCREF(__pyx_v_self->adapters);
+  __Pyx_GIVEREF(__pyx_v_self->adapters);
+  PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_v_self->adapters);
+  __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 187, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_INCREF(((PyObject *)__pyx_ptype_9protocols_9_speedups_AdapterChain));
+  __Pyx_GIVEREF(((PyObject *)__pyx_ptype_9protocols_9_speedups_AdapterChain));
+  PyTuple_SET_ITEM(__pyx_t_2, 0, ((PyObject *)__pyx_ptype_9protocols_9_speedups_AdapterChain));
+  __Pyx_GIVEREF(__pyx_t_1);
+  PyTuple_SET_ITEM(__pyx_t_2, 1, __pyx_t_1);
+  __pyx_t_1 = 0;
+  __pyx_r = __pyx_t_2;
+  __pyx_t_2 = 0;
+  goto __pyx_L0;
 
-PyTypeObject __pyx_type_9_speedups_metamethod = {
-  PyObject_HEAD_INIT(0)
-  0, /*ob_size*/
-  "_speedups.metamethod", /*tp_name*/
-  sizeof(struct __pyx_obj_9_speedups_metamethod), /*tp_basicsize*/
-  0, /*tp_itemsize*/
-  __pyx_tp_dealloc_9_speedups_metamethod, /*tp_dealloc*/
+  /* "protocols/_speedups.pyx":186
+ *         return ob
+ * 
+ *     def __reduce__(self):             # <<<<<<<<<<<<<<
+ *         return AdapterChain, (self.adapters,)
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_AddTraceback("protocols._speedups.AdapterChain.__reduce__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "protocols/_speedups.pyx":189
+ *         return AdapterChain, (self.adapters,)
+ * 
+ *     def __repr__(self):             # <<<<<<<<<<<<<<
+ *         return "AdapterChain(%r)" % (self.adapters,)
+ * 
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_9protocols_9_speedups_12AdapterChain_7__repr__(PyObject *__pyx_v_self); /*proto*/
+static PyObject *__pyx_pw_9protocols_9_speedups_12AdapterChain_7__repr__(PyObject *__pyx_v_self) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__repr__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_9protocols_9_speedups_12AdapterChain_6__repr__(((struct __pyx_obj_9protocols_9_speedups_AdapterChain *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_9protocols_9_speedups_12AdapterChain_6__repr__(struct __pyx_obj_9protocols_9_speedups_AdapterChain *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__repr__", 0);
+
+  /* "protocols/_speedups.pyx":190
+ * 
+ *     def __repr__(self):
+ *         return "AdapterChain(%r)" % (self.adapters,)             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = PyTuple_New(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 190, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_INCREF(__pyx_v_self->adapters);
+  __Pyx_GIVEREF(__pyx_v_self->adapters);
+  PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_v_self->adapters);
+  __pyx_t_2 = __Pyx_PyString_Format(__pyx_kp_s_AdapterChain_r, __pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 190, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_r = __pyx_t_2;
+  __pyx_t_2 = 0;
+  goto __pyx_L0;
+
+  /* "protocols/_speedups.pyx":189
+ *         return AdapterChain, (self.adapters,)
+ * 
+ *     def __repr__(self):             # <<<<<<<<<<<<<<
+ *         return "AdapterChain(%r)" % (self.adapters,)
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_AddTraceback("protocols._speedups.AdapterChain.__repr__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "protocols/_speedups.pyx":165
+ *     """Adapter factory that applies a sequence of adapters in turn"""
+ * 
+ *     cdef readonly object adapters             # <<<<<<<<<<<<<<
+ *     cdef int count
+ * 
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_9protocols_9_speedups_12AdapterChain_8adapters_1__get__(PyObject *__pyx_v_self); /*proto*/
+static PyObject *__pyx_pw_9protocols_9_speedups_12AdapterChain_8adapters_1__get__(PyObject *__pyx_v_self) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_9protocols_9_speedups_12AdapterChain_8adapters___get__(((struct __pyx_obj_9protocols_9_speedups_AdapterChain *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_9protocols_9_speedups_12AdapterChain_8adapters___get__(struct __pyx_obj_9protocols_9_speedups_AdapterChain *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v_self->adapters);
+  __pyx_r = __pyx_v_self->adapters;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "protocols/_speedups.pyx":198
+ *     cdef readonly object adapter, depth, count, unbound
+ * 
+ *     def __init__(self, adapter, depth):             # <<<<<<<<<<<<<<
+ *         self.adapter = self.unbound = adapter
+ *         self.depth = depth
+ */
+
+/* Python wrapper */
+static int __pyx_pw_9protocols_9_speedups_13AdapterRecord_1__init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static int __pyx_pw_9protocols_9_speedups_13AdapterRecord_1__init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_adapter = 0;
+  PyObject *__pyx_v_depth = 0;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__init__ (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_adapter,&__pyx_n_s_depth,0};
+    PyObject* values[2] = {0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_adapter)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_depth)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("__init__", 1, 2, 2, 1); __PYX_ERR(0, 198, __pyx_L3_error)
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__init__") < 0)) __PYX_ERR(0, 198, __pyx_L3_error)
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 2) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+    }
+    __pyx_v_adapter = values[0];
+    __pyx_v_depth = values[1];
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("__init__", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 198, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("protocols._speedups.AdapterRecord.__init__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return -1;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_9protocols_9_speedups_13AdapterRecord___init__(((struct __pyx_obj_9protocols_9_speedups_AdapterRecord *)__pyx_v_self), __pyx_v_adapter, __pyx_v_depth);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static int __pyx_pf_9protocols_9_speedups_13AdapterRecord___init__(struct __pyx_obj_9protocols_9_speedups_AdapterRecord *__pyx_v_self, PyObject *__pyx_v_adapter, PyObject *__pyx_v_depth) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  int __pyx_t_3;
+  int __pyx_t_4;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__init__", 0);
+
+  /* "protocols/_speedups.pyx":199
+ * 
+ *     def __init__(self, adapter, depth):
+ *         self.adapter = self.unbound = adapter             # <<<<<<<<<<<<<<
+ *         self.depth = depth
+ *         self.count = 1
+ */
+  __Pyx_INCREF(__pyx_v_adapter);
+  __Pyx_GIVEREF(__pyx_v_adapter);
+  __Pyx_GOTREF(__pyx_v_self->adapter);
+  __Pyx_DECREF(__pyx_v_self->adapter);
+  __pyx_v_self->adapter = __pyx_v_adapter;
+  __Pyx_INCREF(__pyx_v_adapter);
+  __Pyx_GIVEREF(__pyx_v_adapter);
+  __Pyx_GOTREF(__pyx_v_self->unbound);
+  __Pyx_DECREF(__pyx_v_self->unbound);
+  __pyx_v_self->unbound = __pyx_v_adapter;
+
+  /* "protocols/_speedups.pyx":200
+ *     def __init__(self, adapter, depth):
+ *         self.adapter = self.unbound = adapter
+ *         self.depth = depth             # <<<<<<<<<<<<<<
+ *         self.count = 1
+ *         if adapter is NO_ADAPTER_NEEDED or adapter is DOES_NOT_SUPPORT:
+ */
+  __Pyx_INCREF(__pyx_v_depth);
+  __Pyx_GIVEREF(__pyx_v_depth);
+  __Pyx_GOTREF(__pyx_v_self->depth);
+  __Pyx_DECREF(__pyx_v_self->depth);
+  __pyx_v_self->depth = __pyx_v_depth;
+
+  /* "protocols/_speedups.pyx":201
+ *         self.adapter = self.unbound = adapter
+ *         self.depth = depth
+ *         self.count = 1             # <<<<<<<<<<<<<<
+ *         if adapter is NO_ADAPTER_NEEDED or adapter is DOES_NOT_SUPPORT:
+ *             return
+ */
+  __Pyx_INCREF(__pyx_int_1);
+  __Pyx_GIVEREF(__pyx_int_1);
+  __Pyx_GOTREF(__pyx_v_self->count);
+  __Pyx_DECREF(__pyx_v_self->count);
+  __pyx_v_self->count = __pyx_int_1;
+
+  /* "protocols/_speedups.pyx":202
+ *         self.depth = depth
+ *         self.count = 1
+ *         if adapter is NO_ADAPTER_NEEDED or adapter is DOES_NOT_SUPPORT:             # <<<<<<<<<<<<<<
+ *             return
+ *         if PyObject_TypeCheck(adapter, AdapterChain):
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_NO_ADAPTER_NEEDED); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 202, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = (__pyx_v_adapter == __pyx_t_2);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_4 = (__pyx_t_3 != 0);
+  if (!__pyx_t_4) {
+  } else {
+    __pyx_t_1 = __pyx_t_4;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_DOES_NOT_SUPPORT); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 202, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_4 = (__pyx_v_adapter == __pyx_t_2);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_3 = (__pyx_t_4 != 0);
+  __pyx_t_1 = __pyx_t_3;
+  __pyx_L4_bool_binop_done:;
+  if (__pyx_t_1) {
+
+    /* "protocols/_speedups.pyx":203
+ *         self.count = 1
+ *         if adapter is NO_ADAPTER_NEEDED or adapter is DOES_NOT_SUPPORT:
+ *             return             # <<<<<<<<<<<<<<
+ *         if PyObject_TypeCheck(adapter, AdapterChain):
+ *             self.count = (<AdapterChain> adapter).count
+ */
+    __pyx_r = 0;
+    goto __pyx_L0;
+
+    /* "protocols/_speedups.pyx":202
+ *         self.depth = depth
+ *         self.count = 1
+ *         if adapter is NO_ADAPTER_NEEDED or adapter is DOES_NOT_SUPPORT:             # <<<<<<<<<<<<<<
+ *             return
+ *         if PyObject_TypeCheck(adapter, AdapterChain):
+ */
+  }
+
+  /* "protocols/_speedups.pyx":204
+ *         if adapter is NO_ADAPTER_NEEDED or adapter is DOES_NOT_SUPPORT:
+ *             return
+ *         if PyObject_TypeCheck(adapter, AdapterChain):             # <<<<<<<<<<<<<<
+ *             self.count = (<AdapterChain> adapter).count
+ *             return
+ */
+  __pyx_t_1 = (PyObject_TypeCheck(__pyx_v_adapter, ((PyObject *)__pyx_ptype_9protocols_9_speedups_AdapterChain)) != 0);
+  if (__pyx_t_1) {
+
+    /* "protocols/_speedups.pyx":205
+ *             return
+ *         if PyObject_TypeCheck(adapter, AdapterChain):
+ *             self.count = (<AdapterChain> adapter).count             # <<<<<<<<<<<<<<
+ *             return
+ *         self.count = getattr(adapter,'__adapterCount__',1)
+ */
+    __pyx_t_2 = __Pyx_PyInt_From_int(((struct __pyx_obj_9protocols_9_speedups_AdapterChain *)__pyx_v_adapter)->count); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 205, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_GIVEREF(__pyx_t_2);
+    __Pyx_GOTREF(__pyx_v_self->count);
+    __Pyx_DECREF(__pyx_v_self->count);
+    __pyx_v_self->count = __pyx_t_2;
+    __pyx_t_2 = 0;
+
+    /* "protocols/_speedups.pyx":206
+ *         if PyObject_TypeCheck(adapter, AdapterChain):
+ *             self.count = (<AdapterChain> adapter).count
+ *             return             # <<<<<<<<<<<<<<
+ *         self.count = getattr(adapter,'__adapterCount__',1)
+ *         self.unbound = getattr(adapter,'__unbound_adapter__',adapter)
+ */
+    __pyx_r = 0;
+    goto __pyx_L0;
+
+    /* "protocols/_speedups.pyx":204
+ *         if adapter is NO_ADAPTER_NEEDED or adapter is DOES_NOT_SUPPORT:
+ *             return
+ *         if PyObject_TypeCheck(adapter, AdapterChain):             # <<<<<<<<<<<<<<
+ *             self.count = (<AdapterChain> adapter).count
+ *             return
+ */
+  }
+
+  /* "protocols/_speedups.pyx":207
+ *             self.count = (<AdapterChain> adapter).count
+ *             return
+ *         self.count = getattr(adapter,'__adapterCount__',1)             # <<<<<<<<<<<<<<
+ *         self.unbound = getattr(adapter,'__unbound_adapter__',adapter)
+ * 
+ */
+  __pyx_t_2 = __Pyx_GetAttr3(__pyx_v_adapter, __pyx_n_s_adapterCount, __pyx_int_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 207, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_GIVEREF(__pyx_t_2);
+  __Pyx_GOTREF(__pyx_v_self->count);
+  __Pyx_DECREF(__pyx_v_self->count);
+  __pyx_v_self->count = __pyx_t_2;
+  __pyx_t_2 = 0;
+
+  /* "protocols/_speedups.pyx":208
+ *             return
+ *         self.count = getattr(adapter,'__adapterCount__',1)
+ *         self.unbound = getattr(adapter,'__unbound_adapter__',adapter)             # <<<<<<<<<<<<<<
+ * 
+ *     def __getitem__(self, index):
+ */
+  __pyx_t_2 = __Pyx_GetAttr3(__pyx_v_adapter, __pyx_n_s_unbound_adapter, __pyx_v_adapter); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 208, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_GIVEREF(__pyx_t_2);
+  __Pyx_GOTREF(__pyx_v_self->unbound);
+  __Pyx_DECREF(__pyx_v_self->unbound);
+  __pyx_v_self->unbound = __pyx_t_2;
+  __pyx_t_2 = 0;
+
+  /* "protocols/_speedups.pyx":198
+ *     cdef readonly object adapter, depth, count, unbound
+ * 
+ *     def __init__(self, adapter, depth):             # <<<<<<<<<<<<<<
+ *         self.adapter = self.unbound = adapter
+ *         self.depth = depth
+ */
+
+  /* function exit code */
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_AddTraceback("protocols._speedups.AdapterRecord.__init__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "protocols/_speedups.pyx":210
+ *         self.unbound = getattr(adapter,'__unbound_adapter__',adapter)
+ * 
+ *     def __getitem__(self, index):             # <<<<<<<<<<<<<<
+ *         return (self.adapter, self.depth)[index]
+ * 
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_9protocols_9_speedups_13AdapterRecord_3__getitem__(PyObject *__pyx_v_self, PyObject *__pyx_v_index); /*proto*/
+static PyObject *__pyx_pw_9protocols_9_speedups_13AdapterRecord_3__getitem__(PyObject *__pyx_v_self, PyObject *__pyx_v_index) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__getitem__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_9protocols_9_speedups_13AdapterRecord_2__getitem__(((struct __pyx_obj_9protocols_9_speedups_AdapterRecord *)__pyx_v_self), ((PyObject *)__pyx_v_index));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_9protocols_9_speedups_13AdapterRecord_2__getitem__(struct __pyx_obj_9protocols_9_speedups_AdapterRecord *__pyx_v_self, PyObject *__pyx_v_index) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__getitem__", 0);
+
+  /* "protocols/_speedups.pyx":211
+ * 
+ *     def __getitem__(self, index):
+ *         return (self.adapter, self.depth)[index]             # <<<<<<<<<<<<<<
+ * 
+ *     def __len__(self):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = PyTuple_New(2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 211, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_INCREF(__pyx_v_self->adapter);
+  __Pyx_GIVEREF(__pyx_v_self->adapter);
+  PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_v_self->adapter);
+  __Pyx_INCREF(__pyx_v_self->depth);
+  __Pyx_GIVEREF(__pyx_v_self->depth);
+  PyTuple_SET_ITEM(__pyx_t_1, 1, __pyx_v_self->depth);
+  __pyx_t_2 = __Pyx_PyObject_GetItem(__pyx_t_1, __pyx_v_index); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 211, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_r = __pyx_t_2;
+  __pyx_t_2 = 0;
+  goto __pyx_L0;
+
+  /* "protocols/_speedups.pyx":210
+ *         self.unbound = getattr(adapter,'__unbound_adapter__',adapter)
+ * 
+ *     def __getitem__(self, index):             # <<<<<<<<<<<<<<
+ *         return (self.adapter, self.depth)[index]
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_AddTraceback("protocols._speedups.AdapterRecord.__getitem__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "protocols/_speedups.pyx":213
+ *         return (self.adapter, self.depth)[index]
+ * 
+ *     def __len__(self):             # <<<<<<<<<<<<<<
+ *         return 2
+ * 
+ */
+
+/* Python wrapper */
+static Py_ssize_t __pyx_pw_9protocols_9_speedups_13AdapterRecord_5__len__(PyObject *__pyx_v_self); /*proto*/
+static Py_ssize_t __pyx_pw_9protocols_9_speedups_13AdapterRecord_5__len__(PyObject *__pyx_v_self) {
+  Py_ssize_t __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__len__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_9protocols_9_speedups_13AdapterRecord_4__len__(((struct __pyx_obj_9protocols_9_speedups_AdapterRecord *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static Py_ssize_t __pyx_pf_9protocols_9_speedups_13AdapterRecord_4__len__(CYTHON_UNUSED struct __pyx_obj_9protocols_9_speedups_AdapterRecord *__pyx_v_self) {
+  Py_ssize_t __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__len__", 0);
+
+  /* "protocols/_speedups.pyx":214
+ * 
+ *     def __len__(self):
+ *         return 2             # <<<<<<<<<<<<<<
+ * 
+ *     def __iter__(self):
+ */
+  __pyx_r = 2;
+  goto __pyx_L0;
+
+  /* "protocols/_speedups.pyx":213
+ *         return (self.adapter, self.depth)[index]
+ * 
+ *     def __len__(self):             # <<<<<<<<<<<<<<
+ *         return 2
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "protocols/_speedups.pyx":216
+ *         return 2
+ * 
+ *     def __iter__(self):             # <<<<<<<<<<<<<<
+ *         return iter((self.adapter, self.depth))
+ * 
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_9protocols_9_speedups_13AdapterRecord_7__iter__(PyObject *__pyx_v_self); /*proto*/
+static PyObject *__pyx_pw_9protocols_9_speedups_13AdapterRecord_7__iter__(PyObject *__pyx_v_self) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__iter__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_9protocols_9_speedups_13AdapterRecord_6__iter__(((struct __pyx_obj_9protocols_9_speedups_AdapterRecord *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_9protocols_9_speedups_13AdapterRecord_6__iter__(struct __pyx_obj_9protocols_9_speedups_AdapterRecord *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__iter__", 0);
+
+  /* "protocols/_speedups.pyx":217
+ * 
+ *     def __iter__(self):
+ *         return iter((self.adapter, self.depth))             # <<<<<<<<<<<<<<
+ * 
+ *     def __reduce__(self):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = PyTuple_New(2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 217, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_INCREF(__pyx_v_self->adapter);
+  __Pyx_GIVEREF(__pyx_v_self->adapter);
+  PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_v_self->adapter);
+  __Pyx_INCREF(__pyx_v_self->depth);
+  __Pyx_GIVEREF(__pyx_v_self->depth);
+  PyTuple_SET_ITEM(__pyx_t_1, 1, __pyx_v_self->depth);
+  __pyx_t_2 = PyObject_GetIter(__pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 217, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_r = __pyx_t_2;
+  __pyx_t_2 = 0;
+  goto __pyx_L0;
+
+  /* "protocols/_speedups.pyx":216
+ *         return 2
+ * 
+ *     def __iter__(self):             # <<<<<<<<<<<<<<
+ *         return iter((self.adapter, self.depth))
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_AddTraceback("protocols._speedups.AdapterRecord.__iter__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "protocols/_speedups.pyx":219
+ *         return iter((self.adapter, self.depth))
+ * 
+ *     def __reduce__(self):             # <<<<<<<<<<<<<<
+ *         return AdapterRecord, (self.adapter, self.depth)
+ * 
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_9protocols_9_speedups_13AdapterRecord_9__reduce__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static PyObject *__pyx_pw_9protocols_9_speedups_13AdapterRecord_9__reduce__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__reduce__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_9protocols_9_speedups_13AdapterRecord_8__reduce__(((struct __pyx_obj_9protocols_9_speedups_AdapterRecord *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_9protocols_9_speedups_13AdapterRecord_8__reduce__(struct __pyx_obj_9protocols_9_speedups_AdapterRecord *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__reduce__", 0);
+
+  /* "protocols/_speedups.pyx":220
+ * 
+ *     def __reduce__(self):
+ *         return AdapterRecord, (self.adapter, self.depth)             # <<<<<<<<<<<<<<
+ * 
+ *     def __repr__(self):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = PyTuple_New(2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 220, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_INCREF(__pyx_v_self->adapter);
+  __Pyx_GIVEREF(__pyx_v_self->adapter);
+  PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_v_self->adapter);
+  __Pyx_INCREF(__pyx_v_self->depth);
+  __Pyx_GIVEREF(__pyx_v_self->depth);
+  PyTuple_SET_ITEM(__pyx_t_1, 1, __pyx_v_self->depth);
+  __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 220, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_INCREF(((PyObject *)__pyx_ptype_9protocols_9_speedups_AdapterRecord));
+  __Pyx_GIVEREF(((PyObject *)__pyx_ptype_9protocols_9_speedups_AdapterRecord));
+  PyTuple_SET_ITEM(__pyx_t_2, 0, ((PyObject *)__pyx_ptype_9protocols_9_speedups_AdapterRecord));
+  __Pyx_GIVEREF(__pyx_t_1);
+  PyTuple_SET_ITEM(__pyx_t_2, 1, __pyx_t_1);
+  __pyx_t_1 = 0;
+  __pyx_r = __pyx_t_2;
+  __pyx_t_2 = 0;
+  goto __pyx_L0;
+
+  /* "protocols/_speedups.pyx":219
+ *         return iter((self.adapter, self.depth))
+ * 
+ *     def __reduce__(self):             # <<<<<<<<<<<<<<
+ *         return AdapterRecord, (self.adapter, self.depth)
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_AddTraceback("protocols._speedups.AdapterRecord.__reduce__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "protocols/_speedups.pyx":222
+ *         return AdapterRecord, (self.adapter, self.depth)
+ * 
+ *     def __repr__(self):             # <<<<<<<<<<<<<<
+ *         return "AdapterRecord(%r, %r)" % (self.adapter, self.depth)
+ * 
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_9protocols_9_speedups_13AdapterRecord_11__repr__(PyObject *__pyx_v_self); /*proto*/
+static PyObject *__pyx_pw_9protocols_9_speedups_13AdapterRecord_11__repr__(PyObject *__pyx_v_self) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__repr__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_9protocols_9_speedups_13AdapterRecord_10__repr__(((struct __pyx_obj_9protocols_9_speedups_AdapterRecord *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_9protocols_9_speedups_13AdapterRecord_10__repr__(struct __pyx_obj_9protocols_9_speedups_AdapterRecord *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__repr__", 0);
+
+  /* "protocols/_speedups.pyx":223
+ * 
+ *     def __repr__(self):
+ *         return "AdapterRecord(%r, %r)" % (self.adapter, self.depth)             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = PyTuple_New(2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 223, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_INCREF(__pyx_v_self->adapter);
+  __Pyx_GIVEREF(__pyx_v_self->adapter);
+  PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_v_self->adapter);
+  __Pyx_INCREF(__pyx_v_self->depth);
+  __Pyx_GIVEREF(__pyx_v_self->depth);
+  PyTuple_SET_ITEM(__pyx_t_1, 1, __pyx_v_self->depth);
+  __pyx_t_2 = __Pyx_PyString_Format(__pyx_kp_s_AdapterRecord_r_r, __pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 223, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_r = __pyx_t_2;
+  __pyx_t_2 = 0;
+  goto __pyx_L0;
+
+  /* "protocols/_speedups.pyx":222
+ *         return AdapterRecord, (self.adapter, self.depth)
+ * 
+ *     def __repr__(self):             # <<<<<<<<<<<<<<
+ *         return "AdapterRecord(%r, %r)" % (self.adapter, self.depth)
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_AddTraceback("protocols._speedups.AdapterRecord.__repr__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "protocols/_speedups.pyx":196
+ *     """An adapter registered at an implication depth, in an adapter registry"""
+ * 
+ *     cdef readonly object adapter, depth, count, unbound             # <<<<<<<<<<<<<<
+ * 
+ *     def __init__(self, adapter, depth):
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_9protocols_9_speedups_13AdapterRecord_7adapter_1__get__(PyObject *__pyx_v_self); /*proto*/
+static PyObject *__pyx_pw_9protocols_9_speedups_13AdapterRecord_7adapter_1__get__(PyObject *__pyx_v_self) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_9protocols_9_speedups_13AdapterRecord_7adapter___get__(((struct __pyx_obj_9protocols_9_speedups_AdapterRecord *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_9protocols_9_speedups_13AdapterRecord_7adapter___get__(struct __pyx_obj_9protocols_9_speedups_AdapterRecord *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v_self->adapter);
+  __pyx_r = __pyx_v_self->adapter;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static PyObject *__pyx_pw_9protocols_9_speedups_13AdapterRecord_5depth_1__get__(PyObject *__pyx_v_self); /*proto*/
+static PyObject *__pyx_pw_9protocols_9_speedups_13AdapterRecord_5depth_1__get__(PyObject *__pyx_v_self) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_9protocols_9_speedups_13AdapterRecord_5depth___get__(((struct __pyx_obj_9protocols_9_speedups_AdapterRecord *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_9protocols_9_speedups_13AdapterRecord_5depth___get__(struct __pyx_obj_9protocols_9_speedups_AdapterRecord *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v_self->depth);
+  __pyx_r = __pyx_v_self->depth;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static PyObject *__pyx_pw_9protocols_9_speedups_13AdapterRecord_5count_1__get__(PyObject *__pyx_v_self); /*proto*/
+static PyObject *__pyx_pw_9protocols_9_speedups_13AdapterRecord_5count_1__get__(PyObject *__pyx_v_self) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_9protocols_9_speedups_13AdapterRecord_5count___get__(((struct __pyx_obj_9protocols_9_speedups_AdapterRecord *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_9protocols_9_speedups_13AdapterRecord_5count___get__(struct __pyx_obj_9protocols_9_speedups_AdapterRecord *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v_self->count);
+  __pyx_r = __pyx_v_self->count;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static PyObject *__pyx_pw_9protocols_9_speedups_13AdapterRecord_7unbound_1__get__(PyObject *__pyx_v_self); /*proto*/
+static PyObject *__pyx_pw_9protocols_9_speedups_13AdapterRecord_7unbound_1__get__(PyObject *__pyx_v_self) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_9protocols_9_speedups_13AdapterRecord_7unbound___get__(((struct __pyx_obj_9protocols_9_speedups_AdapterRecord *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_9protocols_9_speedups_13AdapterRecord_7unbound___get__(struct __pyx_obj_9protocols_9_speedups_AdapterRecord *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v_self->unbound);
+  __pyx_r = __pyx_v_self->unbound;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "protocols/_speedups.pyx":226
+ * 
+ * 
+ * cdef int compareDepths(d1, d2) except -2:             # <<<<<<<<<<<<<<
+ * 
+ *     # -1, 0 or 1 as 'd1' is less than, equal to, or greater than 'd2'
+ */
+
+static int __pyx_f_9protocols_9_speedups_compareDepths(PyObject *__pyx_v_d1, PyObject *__pyx_v_d2) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_t_4;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("compareDepths", 0);
+
+  /* "protocols/_speedups.pyx":230
+ *     # -1, 0 or 1 as 'd1' is less than, equal to, or greater than 'd2'
+ * 
+ *     if PyInt_CheckExact(d1) and PyInt_CheckExact(d2):             # <<<<<<<<<<<<<<
+ *         if PyInt_AS_LONG(d1) < PyInt_AS_LONG(d2):
+ *             return -1
+ */
+  __pyx_t_2 = (PyInt_CheckExact(__pyx_v_d1) != 0);
+  if (__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_2 = (PyInt_CheckExact(__pyx_v_d2) != 0);
+  __pyx_t_1 = __pyx_t_2;
+  __pyx_L4_bool_binop_done:;
+  if (__pyx_t_1) {
+
+    /* "protocols/_speedups.pyx":231
+ * 
+ *     if PyInt_CheckExact(d1) and PyInt_CheckExact(d2):
+ *         if PyInt_AS_LONG(d1) < PyInt_AS_LONG(d2):             # <<<<<<<<<<<<<<
+ *             return -1
+ *         return PyInt_AS_LONG(d1) > PyInt_AS_LONG(d2)
+ */
+    __pyx_t_1 = ((PyInt_AS_LONG(__pyx_v_d1) < PyInt_AS_LONG(__pyx_v_d2)) != 0);
+    if (__pyx_t_1) {
+
+      /* "protocols/_speedups.pyx":232
+ *     if PyInt_CheckExact(d1) and PyInt_CheckExact(d2):
+ *         if PyInt_AS_LONG(d1) < PyInt_AS_LONG(d2):
+ *             return -1             # <<<<<<<<<<<<<<
+ *         return PyInt_AS_LONG(d1) > PyInt_AS_LONG(d2)
+ * 
+ */
+      __pyx_r = -1;
+      goto __pyx_L0;
+
+      /* "protocols/_speedups.pyx":231
+ * 
+ *     if PyInt_CheckExact(d1) and PyInt_CheckExact(d2):
+ *         if PyInt_AS_LONG(d1) < PyInt_AS_LONG(d2):             # <<<<<<<<<<<<<<
+ *             return -1
+ *         return PyInt_AS_LONG(d1) > PyInt_AS_LONG(d2)
+ */
+    }
+
+    /* "protocols/_speedups.pyx":233
+ *         if PyInt_AS_LONG(d1) < PyInt_AS_LONG(d2):
+ *             return -1
+ *         return PyInt_AS_LONG(d1) > PyInt_AS_LONG(d2)             # <<<<<<<<<<<<<<
+ * 
+ *     if d1 < d2:
+ */
+    __pyx_r = (PyInt_AS_LONG(__pyx_v_d1) > PyInt_AS_LONG(__pyx_v_d2));
+    goto __pyx_L0;
+
+    /* "protocols/_speedups.pyx":230
+ *     # -1, 0 or 1 as 'd1' is less than, equal to, or greater than 'd2'
+ * 
+ *     if PyInt_CheckExact(d1) and PyInt_CheckExact(d2):             # <<<<<<<<<<<<<<
+ *         if PyInt_AS_LONG(d1) < PyInt_AS_LONG(d2):
+ *             return -1
+ */
+  }
+
+  /* "protocols/_speedups.pyx":235
+ *         return PyInt_AS_LONG(d1) > PyInt_AS_LONG(d2)
+ * 
+ *     if d1 < d2:             # <<<<<<<<<<<<<<
+ *         return -1
+ *     return d1 > d2
+ */
+  __pyx_t_3 = PyObject_RichCompare(__pyx_v_d1, __pyx_v_d2, Py_LT); __Pyx_XGOTREF(__pyx_t_3); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 235, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely(__pyx_t_1 < 0)) __PYX_ERR(0, 235, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if (__pyx_t_1) {
+
+    /* "protocols/_speedups.pyx":236
+ * 
+ *     if d1 < d2:
+ *         return -1             # <<<<<<<<<<<<<<
+ *     return d1 > d2
+ * 
+ */
+    __pyx_r = -1;
+    goto __pyx_L0;
+
+    /* "protocols/_speedups.pyx":235
+ *         return PyInt_AS_LONG(d1) > PyInt_AS_LONG(d2)
+ * 
+ *     if d1 < d2:             # <<<<<<<<<<<<<<
+ *         return -1
+ *     return d1 > d2
+ */
+  }
+
+  /* "protocols/_speedups.pyx":237
+ *     if d1 < d2:
+ *         return -1
+ *     return d1 > d2             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_t_3 = PyObject_RichCompare(__pyx_v_d1, __pyx_v_d2, Py_GT); __Pyx_XGOTREF(__pyx_t_3); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 237, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_PyInt_As_int(__pyx_t_3); if (unlikely((__pyx_t_4 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 237, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_r = __pyx_t_4;
+  goto __pyx_L0;
+
+  /* "protocols/_speedups.pyx":226
+ * 
+ * 
+ * cdef int compareDepths(d1, d2) except -2:             # <<<<<<<<<<<<<<
+ * 
+ *     # -1, 0 or 1 as 'd1' is less than, equal to, or greater than 'd2'
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_AddTraceback("protocols._speedups.compareDepths", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -2;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "protocols/_speedups.pyx":240
+ * 
+ * 
+ * cdef AdapterRecord minimumRecord(AdapterRecord r1, AdapterRecord r2):             # <<<<<<<<<<<<<<
+ * 
+ *     # '_minimumRecord()' in 'protocols.adapters'
+ */
+
+static struct __pyx_obj_9protocols_9_speedups_AdapterRecord *__pyx_f_9protocols_9_speedups_minimumRecord(struct __pyx_obj_9protocols_9_speedups_AdapterRecord *__pyx_v_r1, struct __pyx_obj_9protocols_9_speedups_AdapterRecord *__pyx_v_r2) {
+  int __pyx_v_cmp;
+  PyObject *__pyx_v_a1 = NULL;
+  PyObject *__pyx_v_a2 = NULL;
+  struct __pyx_obj_9protocols_9_speedups_AdapterRecord *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  int __pyx_t_3;
+  int __pyx_t_4;
+  int __pyx_t_5;
+  int __pyx_t_6;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("minimumRecord", 0);
+
+  /* "protocols/_speedups.pyx":246
+ *     cdef int cmp
+ * 
+ *     cmp = compareDepths(r1.depth, r2.depth)             # <<<<<<<<<<<<<<
+ * 
+ *     if cmp < 0:
+ */
+  __pyx_t_1 = __pyx_v_r1->depth;
+  __Pyx_INCREF(__pyx_t_1);
+  __pyx_t_2 = __pyx_v_r2->depth;
+  __Pyx_INCREF(__pyx_t_2);
+  __pyx_t_3 = __pyx_f_9protocols_9_speedups_compareDepths(__pyx_t_1, __pyx_t_2); if (unlikely(__pyx_t_3 == ((int)-2))) __PYX_ERR(0, 246, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_v_cmp = __pyx_t_3;
+
+  /* "protocols/_speedups.pyx":248
+ *     cmp = compareDepths(r1.depth, r2.depth)
+ * 
+ *     if cmp < 0:             # <<<<<<<<<<<<<<
+ *         return r1
+ *     elif cmp > 0:
+ */
+  __pyx_t_4 = ((__pyx_v_cmp < 0) != 0);
+  if (__pyx_t_4) {
+
+    /* "protocols/_speedups.pyx":249
+ * 
+ *     if cmp < 0:
+ *         return r1             # <<<<<<<<<<<<<<
+ *     elif cmp > 0:
+ *         return r2
+ */
+    __Pyx_XDECREF(((PyObject *)__pyx_r));
+    __Pyx_INCREF(((PyObject *)__pyx_v_r1));
+    __pyx_r = __pyx_v_r1;
+    goto __pyx_L0;
+
+    /* "protocols/_speedups.pyx":248
+ *     cmp = compareDepths(r1.depth, r2.depth)
+ * 
+ *     if cmp < 0:             # <<<<<<<<<<<<<<
+ *         return r1
+ *     elif cmp > 0:
+ */
+  }
+
+  /* "protocols/_speedups.pyx":250
+ *     if cmp < 0:
+ *         return r1
+ *     elif cmp > 0:             # <<<<<<<<<<<<<<
+ *         return r2
+ * 
+ */
+  __pyx_t_4 = ((__pyx_v_cmp > 0) != 0);
+  if (__pyx_t_4) {
+
+    /* "protocols/_speedups.pyx":251
+ *         return r1
+ *     elif cmp > 0:
+ *         return r2             # <<<<<<<<<<<<<<
+ * 
+ *     if r1.unbound is r2.unbound:
+ */
+    __Pyx_XDECREF(((PyObject *)__pyx_r));
+    __Pyx_INCREF(((PyObject *)__pyx_v_r2));
+    __pyx_r = __pyx_v_r2;
+    goto __pyx_L0;
+
+    /* "protocols/_speedups.pyx":250
+ *     if cmp < 0:
+ *         return r1
+ *     elif cmp > 0:             # <<<<<<<<<<<<<<
+ *         return r2
+ * 
+ */
+  }
+
+  /* "protocols/_speedups.pyx":253
+ *         return r2
+ * 
+ *     if r1.unbound is r2.unbound:             # <<<<<<<<<<<<<<
+ *         return r1   # don't care which
+ * 
+ */
+  __pyx_t_4 = (__pyx_v_r1->unbound == __pyx_v_r2->unbound);
+  __pyx_t_5 = (__pyx_t_4 != 0);
+  if (__pyx_t_5) {
+
+    /* "protocols/_speedups.pyx":254
+ * 
+ *     if r1.unbound is r2.unbound:
+ *         return r1   # don't care which             # <<<<<<<<<<<<<<
+ * 
+ *     cmp = compareDepths(r1.count, r2.count)
+ */
+    __Pyx_XDECREF(((PyObject *)__pyx_r));
+    __Pyx_INCREF(((PyObject *)__pyx_v_r1));
+    __pyx_r = __pyx_v_r1;
+    goto __pyx_L0;
+
+    /* "protocols/_speedups.pyx":253
+ *         return r2
+ * 
+ *     if r1.unbound is r2.unbound:             # <<<<<<<<<<<<<<
+ *         return r1   # don't care which
+ * 
+ */
+  }
+
+  /* "protocols/_speedups.pyx":256
+ *         return r1   # don't care which
+ * 
+ *     cmp = compareDepths(r1.count, r2.count)             # <<<<<<<<<<<<<<
+ * 
+ *     if cmp < 0:
+ */
+  __pyx_t_2 = __pyx_v_r1->count;
+  __Pyx_INCREF(__pyx_t_2);
+  __pyx_t_1 = __pyx_v_r2->count;
+  __Pyx_INCREF(__pyx_t_1);
+  __pyx_t_3 = __pyx_f_9protocols_9_speedups_compareDepths(__pyx_t_2, __pyx_t_1); if (unlikely(__pyx_t_3 == ((int)-2))) __PYX_ERR(0, 256, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_v_cmp = __pyx_t_3;
+
+  /* "protocols/_speedups.pyx":258
+ *     cmp = compareDepths(r1.count, r2.count)
+ * 
+ *     if cmp < 0:             # <<<<<<<<<<<<<<
+ *         return r1
+ *     elif cmp > 0:
+ */
+  __pyx_t_5 = ((__pyx_v_cmp < 0) != 0);
+  if (__pyx_t_5) {
+
+    /* "protocols/_speedups.pyx":259
+ * 
+ *     if cmp < 0:
+ *         return r1             # <<<<<<<<<<<<<<
+ *     elif cmp > 0:
+ *         return r2
+ */
+    __Pyx_XDECREF(((PyObject *)__pyx_r));
+    __Pyx_INCREF(((PyObject *)__pyx_v_r1));
+    __pyx_r = __pyx_v_r1;
+    goto __pyx_L0;
+
+    /* "protocols/_speedups.pyx":258
+ *     cmp = compareDepths(r1.count, r2.count)
+ * 
+ *     if cmp < 0:             # <<<<<<<<<<<<<<
+ *         return r1
+ *     elif cmp > 0:
+ */
+  }
+
+  /* "protocols/_speedups.pyx":260
+ *     if cmp < 0:
+ *         return r1
+ *     elif cmp > 0:             # <<<<<<<<<<<<<<
+ *         return r2
+ * 
+ */
+  __pyx_t_5 = ((__pyx_v_cmp > 0) != 0);
+  if (__pyx_t_5) {
+
+    /* "protocols/_speedups.pyx":261
+ *         return r1
+ *     elif cmp > 0:
+ *         return r2             # <<<<<<<<<<<<<<
+ * 
+ *     a1 = r1.adapter
+ */
+    __Pyx_XDECREF(((PyObject *)__pyx_r));
+    __Pyx_INCREF(((PyObject *)__pyx_v_r2));
+    __pyx_r = __pyx_v_r2;
+    goto __pyx_L0;
+
+    /* "protocols/_speedups.pyx":260
+ *     if cmp < 0:
+ *         return r1
+ *     elif cmp > 0:             # <<<<<<<<<<<<<<
+ *         return r2
+ * 
+ */
+  }
+
+  /* "protocols/_speedups.pyx":263
+ *         return r2
+ * 
+ *     a1 = r1.adapter             # <<<<<<<<<<<<<<
+ *     a2 = r2.adapter
+ * 
+ */
+  __pyx_t_1 = __pyx_v_r1->adapter;
+  __Pyx_INCREF(__pyx_t_1);
+  __pyx_v_a1 = __pyx_t_1;
+  __pyx_t_1 = 0;
+
+  /* "protocols/_speedups.pyx":264
+ * 
+ *     a1 = r1.adapter
+ *     a2 = r2.adapter             # <<<<<<<<<<<<<<
+ * 
+ *     if a1 is NO_ADAPTER_NEEDED or a2 is DOES_NOT_SUPPORT:
+ */
+  __pyx_t_1 = __pyx_v_r2->adapter;
+  __Pyx_INCREF(__pyx_t_1);
+  __pyx_v_a2 = __pyx_t_1;
+  __pyx_t_1 = 0;
+
+  /* "protocols/_speedups.pyx":266
+ *     a2 = r2.adapter
+ * 
+ *     if a1 is NO_ADAPTER_NEEDED or a2 is DOES_NOT_SUPPORT:             # <<<<<<<<<<<<<<
+ *         return r1
+ * 
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_NO_ADAPTER_NEEDED); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 266, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_4 = (__pyx_v_a1 == __pyx_t_1);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_6 = (__pyx_t_4 != 0);
+  if (!__pyx_t_6) {
+  } else {
+    __pyx_t_5 = __pyx_t_6;
+    goto __pyx_L7_bool_binop_done;
+  }
+  __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_DOES_NOT_SUPPORT); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 266, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_6 = (__pyx_v_a2 == __pyx_t_1);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_4 = (__pyx_t_6 != 0);
+  __pyx_t_5 = __pyx_t_4;
+  __pyx_L7_bool_binop_done:;
+  if (__pyx_t_5) {
+
+    /* "protocols/_speedups.pyx":267
+ * 
+ *     if a1 is NO_ADAPTER_NEEDED or a2 is DOES_NOT_SUPPORT:
+ *         return r1             # <<<<<<<<<<<<<<
+ * 
+ *     if a1 is DOES_NOT_SUPPORT or a2 is NO_ADAPTER_NEEDED:
+ */
+    __Pyx_XDECREF(((PyObject *)__pyx_r));
+    __Pyx_INCREF(((PyObject *)__pyx_v_r1));
+    __pyx_r = __pyx_v_r1;
+    goto __pyx_L0;
+
+    /* "protocols/_speedups.pyx":266
+ *     a2 = r2.adapter
+ * 
+ *     if a1 is NO_ADAPTER_NEEDED or a2 is DOES_NOT_SUPPORT:             # <<<<<<<<<<<<<<
+ *         return r1
+ * 
+ */
+  }
+
+  /* "protocols/_speedups.pyx":269
+ *         return r1
+ * 
+ *     if a1 is DOES_NOT_SUPPORT or a2 is NO_ADAPTER_NEEDED:             # <<<<<<<<<<<<<<
+ *         return r2
+ * 
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_DOES_NOT_SUPPORT); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 269, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_4 = (__pyx_v_a1 == __pyx_t_1);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_6 = (__pyx_t_4 != 0);
+  if (!__pyx_t_6) {
+  } else {
+    __pyx_t_5 = __pyx_t_6;
+    goto __pyx_L10_bool_binop_done;
+  }
+  __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_NO_ADAPTER_NEEDED); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 269, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_6 = (__pyx_v_a2 == __pyx_t_1);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_4 = (__pyx_t_6 != 0);
+  __pyx_t_5 = __pyx_t_4;
+  __pyx_L10_bool_binop_done:;
+  if (__pyx_t_5) {
+
+    /* "protocols/_speedups.pyx":270
+ * 
+ *     if a1 is DOES_NOT_SUPPORT or a2 is NO_ADAPTER_NEEDED:
+ *         return r2             # <<<<<<<<<<<<<<
+ * 
+ *     # it's ambiguous
+ */
+    __Pyx_XDECREF(((PyObject *)__pyx_r));
+    __Pyx_INCREF(((PyObject *)__pyx_v_r2));
+    __pyx_r = __pyx_v_r2;
+    goto __pyx_L0;
+
+    /* "protocols/_speedups.pyx":269
+ *         return r1
+ * 
+ *     if a1 is DOES_NOT_SUPPORT or a2 is NO_ADAPTER_NEEDED:             # <<<<<<<<<<<<<<
+ *         return r2
+ * 
+ */
+  }
+
+  /* "protocols/_speedups.pyx":273
+ * 
+ *     # it's ambiguous
+ *     raise TypeError("Ambiguous adapter choice", a1, a2, r1.depth, r2.depth)             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_t_1 = PyTuple_New(5); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 273, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_INCREF(__pyx_kp_s_Ambiguous_adapter_choice);
+  __Pyx_GIVEREF(__pyx_kp_s_Ambiguous_adapter_choice);
+  PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_kp_s_Ambiguous_adapter_choice);
+  __Pyx_INCREF(__pyx_v_a1);
+  __Pyx_GIVEREF(__pyx_v_a1);
+  PyTuple_SET_ITEM(__pyx_t_1, 1, __pyx_v_a1);
+  __Pyx_INCREF(__pyx_v_a2);
+  __Pyx_GIVEREF(__pyx_v_a2);
+  PyTuple_SET_ITEM(__pyx_t_1, 2, __pyx_v_a2);
+  __Pyx_INCREF(__pyx_v_r1->depth);
+  __Pyx_GIVEREF(__pyx_v_r1->depth);
+  PyTuple_SET_ITEM(__pyx_t_1, 3, __pyx_v_r1->depth);
+  __Pyx_INCREF(__pyx_v_r2->depth);
+  __Pyx_GIVEREF(__pyx_v_r2->depth);
+  PyTuple_SET_ITEM(__pyx_t_1, 4, __pyx_v_r2->depth);
+  __pyx_t_2 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_t_1, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 273, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_Raise(__pyx_t_2, 0, 0, 0);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __PYX_ERR(0, 273, __pyx_L1_error)
+
+  /* "protocols/_speedups.pyx":240
+ * 
+ * 
+ * cdef AdapterRecord minimumRecord(AdapterRecord r1, AdapterRecord r2):             # <<<<<<<<<<<<<<
+ * 
+ *     # '_minimumRecord()' in 'protocols.adapters'
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_AddTraceback("protocols._speedups.minimumRecord", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_a1);
+  __Pyx_XDECREF(__pyx_v_a2);
+  __Pyx_XGIVEREF((PyObject *)__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "protocols/_speedups.pyx":276
+ * 
+ * 
+ * def minimumAdapter(a1,a2,d1=0,d2=0):             # <<<<<<<<<<<<<<
+ *     """Shortest route to implementation, 'a1' @ depth 'd1', or 'a2' @ 'd2'?"""
+ * 
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_9protocols_9_speedups_5minimumAdapter(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_9protocols_9_speedups_4minimumAdapter[] = "Shortest route to implementation, 'a1' @ depth 'd1', or 'a2' @ 'd2'?";
+static PyMethodDef __pyx_mdef_9protocols_9_speedups_5minimumAdapter = {"minimumAdapter", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_9protocols_9_speedups_5minimumAdapter, METH_VARARGS|METH_KEYWORDS, __pyx_doc_9protocols_9_speedups_4minimumAdapter};
+static PyObject *__pyx_pw_9protocols_9_speedups_5minimumAdapter(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_a1 = 0;
+  PyObject *__pyx_v_a2 = 0;
+  PyObject *__pyx_v_d1 = 0;
+  PyObject *__pyx_v_d2 = 0;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("minimumAdapter (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_a1,&__pyx_n_s_a2,&__pyx_n_s_d1,&__pyx_n_s_d2,0};
+    PyObject* values[4] = {0,0,0,0};
+    values[2] = ((PyObject *)__pyx_int_0);
+    values[3] = ((PyObject *)__pyx_int_0);
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        CYTHON_FALLTHROUGH;
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_a1)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_a2)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("minimumAdapter", 0, 2, 4, 1); __PYX_ERR(0, 276, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  2:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_d1);
+          if (value) { values[2] = value; kw_args--; }
+        }
+        CYTHON_FALLTHROUGH;
+        case  3:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_d2);
+          if (value) { values[3] = value; kw_args--; }
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "minimumAdapter") < 0)) __PYX_ERR(0, 276, __pyx_L3_error)
+      }
+    } else {
+      switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        CYTHON_FALLTHROUGH;
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+    }
+    __pyx_v_a1 = values[0];
+    __pyx_v_a2 = values[1];
+    __pyx_v_d1 = values[2];
+    __pyx_v_d2 = values[3];
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("minimumAdapter", 0, 2, 4, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 276, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("protocols._speedups.minimumAdapter", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_9protocols_9_speedups_4minimumAdapter(__pyx_self, __pyx_v_a1, __pyx_v_a2, __pyx_v_d1, __pyx_v_d2);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_9protocols_9_speedups_4minimumAdapter(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_a1, PyObject *__pyx_v_a2, PyObject *__pyx_v_d1, PyObject *__pyx_v_d2) {
+  int __pyx_v_cmp;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("minimumAdapter", 0);
+
+  /* "protocols/_speedups.pyx":281
+ *     cdef int cmp
+ * 
+ *     cmp = compareDepths(d1, d2)             # <<<<<<<<<<<<<<
+ * 
+ *     if cmp < 0:
+ */
+  __pyx_t_1 = __pyx_f_9protocols_9_speedups_compareDepths(__pyx_v_d1, __pyx_v_d2); if (unlikely(__pyx_t_1 == ((int)-2))) __PYX_ERR(0, 281, __pyx_L1_error)
+  __pyx_v_cmp = __pyx_t_1;
+
+  /* "protocols/_speedups.pyx":283
+ *     cmp = compareDepths(d1, d2)
+ * 
+ *     if cmp < 0:             # <<<<<<<<<<<<<<
+ *         return a1
+ *     elif cmp > 0 :
+ */
+  __pyx_t_2 = ((__pyx_v_cmp < 0) != 0);
+  if (__pyx_t_2) {
+
+    /* "protocols/_speedups.pyx":284
+ * 
+ *     if cmp < 0:
+ *         return a1             # <<<<<<<<<<<<<<
+ *     elif cmp > 0 :
+ *         return a2
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_INCREF(__pyx_v_a1);
+    __pyx_r = __pyx_v_a1;
+    goto __pyx_L0;
+
+    /* "protocols/_speedups.pyx":283
+ *     cmp = compareDepths(d1, d2)
+ * 
+ *     if cmp < 0:             # <<<<<<<<<<<<<<
+ *         return a1
+ *     elif cmp > 0 :
+ */
+  }
+
+  /* "protocols/_speedups.pyx":285
+ *     if cmp < 0:
+ *         return a1
+ *     elif cmp > 0 :             # <<<<<<<<<<<<<<
+ *         return a2
+ *     elif a1 is a2:
+ */
+  __pyx_t_2 = ((__pyx_v_cmp > 0) != 0);
+  if (__pyx_t_2) {
+
+    /* "protocols/_speedups.pyx":286
+ *         return a1
+ *     elif cmp > 0 :
+ *         return a2             # <<<<<<<<<<<<<<
+ *     elif a1 is a2:
+ *         return a1
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_INCREF(__pyx_v_a2);
+    __pyx_r = __pyx_v_a2;
+    goto __pyx_L0;
+
+    /* "protocols/_speedups.pyx":285
+ *     if cmp < 0:
+ *         return a1
+ *     elif cmp > 0 :             # <<<<<<<<<<<<<<
+ *         return a2
+ *     elif a1 is a2:
+ */
+  }
+
+  /* "protocols/_speedups.pyx":287
+ *     elif cmp > 0 :
+ *         return a2
+ *     elif a1 is a2:             # <<<<<<<<<<<<<<
+ *         return a1
+ * 
+ */
+  __pyx_t_2 = (__pyx_v_a1 == __pyx_v_a2);
+  __pyx_t_3 = (__pyx_t_2 != 0);
+  if (__pyx_t_3) {
+
+    /* "protocols/_speedups.pyx":288
+ *         return a2
+ *     elif a1 is a2:
+ *         return a1             # <<<<<<<<<<<<<<
+ * 
+ *     return minimumRecord(AdapterRecord(a1,d1), AdapterRecord(a2,d2)).adapter
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_INCREF(__pyx_v_a1);
+    __pyx_r = __pyx_v_a1;
+    goto __pyx_L0;
+
+    /* "protocols/_speedups.pyx":287
+ *     elif cmp > 0 :
+ *         return a2
+ *     elif a1 is a2:             # <<<<<<<<<<<<<<
+ *         return a1
+ * 
+ */
+  }
+
+  /* "protocols/_speedups.pyx":290
+ *         return a1
+ * 
+ *     return minimumRecord(AdapterRecord(a1,d1), AdapterRecord(a2,d2)).adapter             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_4 = PyTuple_New(2); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 290, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_INCREF(__pyx_v_a1);
+  __Pyx_GIVEREF(__pyx_v_a1);
+  PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_v_a1);
+  __Pyx_INCREF(__pyx_v_d1);
+  __Pyx_GIVEREF(__pyx_v_d1);
+  PyTuple_SET_ITEM(__pyx_t_4, 1, __pyx_v_d1);
+  __pyx_t_5 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_9protocols_9_speedups_AdapterRecord), __pyx_t_4, NULL); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 290, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_4 = PyTuple_New(2); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 290, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_INCREF(__pyx_v_a2);
+  __Pyx_GIVEREF(__pyx_v_a2);
+  PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_v_a2);
+  __Pyx_INCREF(__pyx_v_d2);
+  __Pyx_GIVEREF(__pyx_v_d2);
+  PyTuple_SET_ITEM(__pyx_t_4, 1, __pyx_v_d2);
+  __pyx_t_6 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_9protocols_9_speedups_AdapterRecord), __pyx_t_4, NULL); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 290, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_4 = ((PyObject *)__pyx_f_9protocols_9_speedups_minimumRecord(((struct __pyx_obj_9protocols_9_speedups_AdapterRecord *)__pyx_t_5), ((struct __pyx_obj_9protocols_9_speedups_AdapterRecord *)__pyx_t_6))); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 290, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  __Pyx_INCREF(((struct __pyx_obj_9protocols_9_speedups_AdapterRecord *)__pyx_t_4)->adapter);
+  __pyx_r = ((struct __pyx_obj_9protocols_9_speedups_AdapterRecord *)__pyx_t_4)->adapter;
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  goto __pyx_L0;
+
+  /* "protocols/_speedups.pyx":276
+ * 
+ * 
+ * def minimumAdapter(a1,a2,d1=0,d2=0):             # <<<<<<<<<<<<<<
+ *     """Shortest route to implementation, 'a1' @ depth 'd1', or 'a2' @ 'd2'?"""
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_AddTraceback("protocols._speedups.minimumAdapter", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "protocols/_speedups.pyx":293
+ * 
+ * 
+ * def updateWithSimplestAdapter(mapping, key, adapter, depth):             # <<<<<<<<<<<<<<
+ *     """Replace 'mapping[key]' w/'adapter' @ 'depth', return true if changed"""
+ * 
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_9protocols_9_speedups_7updateWithSimplestAdapter(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_9protocols_9_speedups_6updateWithSimplestAdapter[] = "Replace 'mapping[key]' w/'adapter' @ 'depth', return true if changed";
+static PyMethodDef __pyx_mdef_9protocols_9_speedups_7updateWithSimplestAdapter = {"updateWithSimplestAdapter", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_9protocols_9_speedups_7updateWithSimplestAdapter, METH_VARARGS|METH_KEYWORDS, __pyx_doc_9protocols_9_speedups_6updateWithSimplestAdapter};
+static PyObject *__pyx_pw_9protocols_9_speedups_7updateWithSimplestAdapter(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_mapping = 0;
+  PyObject *__pyx_v_key = 0;
+  PyObject *__pyx_v_adapter = 0;
+  PyObject *__pyx_v_depth = 0;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("updateWithSimplestAdapter (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_mapping,&__pyx_n_s_key,&__pyx_n_s_adapter,&__pyx_n_s_depth,0};
+    PyObject* values[4] = {0,0,0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        CYTHON_FALLTHROUGH;
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_mapping)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_key)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("updateWithSimplestAdapter", 1, 4, 4, 1); __PYX_ERR(0, 293, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  2:
+        if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_adapter)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("updateWithSimplestAdapter", 1, 4, 4, 2); __PYX_ERR(0, 293, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  3:
+        if (likely((values[3] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_depth)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("updateWithSimplestAdapter", 1, 4, 4, 3); __PYX_ERR(0, 293, __pyx_L3_error)
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "updateWithSimplestAdapter") < 0)) __PYX_ERR(0, 293, __pyx_L3_error)
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 4) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+      values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+      values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+    }
+    __pyx_v_mapping = values[0];
+    __pyx_v_key = values[1];
+    __pyx_v_adapter = values[2];
+    __pyx_v_depth = values[3];
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("updateWithSimplestAdapter", 1, 4, 4, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 293, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("protocols._speedups.updateWithSimplestAdapter", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_9protocols_9_speedups_6updateWithSimplestAdapter(__pyx_self, __pyx_v_mapping, __pyx_v_key, __pyx_v_adapter, __pyx_v_depth);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_9protocols_9_speedups_6updateWithSimplestAdapter(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_mapping, PyObject *__pyx_v_key, PyObject *__pyx_v_adapter, PyObject *__pyx_v_depth) {
+  void *__pyx_v_tmp;
+  int __pyx_v_cmp;
+  int __pyx_v_exact;
+  struct __pyx_obj_9protocols_9_speedups_AdapterRecord *__pyx_v_record = 0;
+  PyObject *__pyx_v_old = NULL;
+  struct __pyx_obj_9protocols_9_speedups_AdapterRecord *__pyx_v_new = NULL;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  int __pyx_t_5;
+  PyObject *__pyx_t_6 = NULL;
+  PyObject *__pyx_t_7 = NULL;
+  PyObject *__pyx_t_8 = NULL;
+  int __pyx_t_9;
+  PyObject *__pyx_t_10 = NULL;
+  PyObject *__pyx_t_11 = NULL;
+  int __pyx_t_12;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("updateWithSimplestAdapter", 0);
+
+  /* "protocols/_speedups.pyx":300
+ *     cdef AdapterRecord record
+ * 
+ *     exact = PyDict_CheckExact(mapping)             # <<<<<<<<<<<<<<
+ * 
+ *     if exact:
+ */
+  __pyx_v_exact = PyDict_CheckExact(__pyx_v_mapping);
+
+  /* "protocols/_speedups.pyx":302
+ *     exact = PyDict_CheckExact(mapping)
+ * 
+ *     if exact:             # <<<<<<<<<<<<<<
+ *         tmp = PyDict_GetItem(mapping, key)
+ *         if tmp:
+ */
+  __pyx_t_1 = (__pyx_v_exact != 0);
+  if (__pyx_t_1) {
+
+    /* "protocols/_speedups.pyx":303
+ * 
+ *     if exact:
+ *         tmp = PyDict_GetItem(mapping, key)             # <<<<<<<<<<<<<<
+ *         if tmp:
+ *             old = <object> tmp
+ */
+    __pyx_v_tmp = PyDict_GetItem(__pyx_v_mapping, __pyx_v_key);
+
+    /* "protocols/_speedups.pyx":304
+ *     if exact:
+ *         tmp = PyDict_GetItem(mapping, key)
+ *         if tmp:             # <<<<<<<<<<<<<<
+ *             old = <object> tmp
+ *         else:
+ */
+    __pyx_t_1 = (__pyx_v_tmp != 0);
+    if (__pyx_t_1) {
+
+      /* "protocols/_speedups.pyx":305
+ *         tmp = PyDict_GetItem(mapping, key)
+ *         if tmp:
+ *             old = <object> tmp             # <<<<<<<<<<<<<<
+ *         else:
+ *             old = None
+ */
+      __pyx_t_2 = ((PyObject *)__pyx_v_tmp);
+      __Pyx_INCREF(__pyx_t_2);
+      __pyx_v_old = __pyx_t_2;
+      __pyx_t_2 = 0;
+
+      /* "protocols/_speedups.pyx":304
+ *     if exact:
+ *         tmp = PyDict_GetItem(mapping, key)
+ *         if tmp:             # <<<<<<<<<<<<<<
+ *             old = <object> tmp
+ *         else:
+ */
+      goto __pyx_L4;
+    }
+
+    /* "protocols/_speedups.pyx":307
+ *             old = <object> tmp
+ *         else:
+ *             old = None             # <<<<<<<<<<<<<<
+ *     else:
+ *         old = mapping.get(key)
+ */
+    /*else*/ {
+      __Pyx_INCREF(Py_None);
+      __pyx_v_old = Py_None;
+    }
+    __pyx_L4:;
+
+    /* "protocols/_speedups.pyx":302
+ *     exact = PyDict_CheckExact(mapping)
+ * 
+ *     if exact:             # <<<<<<<<<<<<<<
+ *         tmp = PyDict_GetItem(mapping, key)
+ *         if tmp:
+ */
+    goto __pyx_L3;
+  }
+
+  /* "protocols/_speedups.pyx":309
+ *             old = None
+ *     else:
+ *         old = mapping.get(key)             # <<<<<<<<<<<<<<
+ * 
+ *     if old is not None:
+ */
+  /*else*/ {
+    __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_mapping, __pyx_n_s_get); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 309, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_4 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
+      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+      if (likely(__pyx_t_4)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+        __Pyx_INCREF(__pyx_t_4);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_3, function);
+      }
+    }
+    __pyx_t_2 = (__pyx_t_4) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_4, __pyx_v_key) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_v_key);
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 309, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __pyx_v_old = __pyx_t_2;
+    __pyx_t_2 = 0;
+  }
+  __pyx_L3:;
+
+  /* "protocols/_speedups.pyx":311
+ *         old = mapping.get(key)
+ * 
+ *     if old is not None:             # <<<<<<<<<<<<<<
+ *         if not PyObject_TypeCheck(old, AdapterRecord):
+ *             try:
+ */
+  __pyx_t_1 = (__pyx_v_old != Py_None);
+  __pyx_t_5 = (__pyx_t_1 != 0);
+  if (__pyx_t_5) {
+
+    /* "protocols/_speedups.pyx":312
+ * 
+ *     if old is not None:
+ *         if not PyObject_TypeCheck(old, AdapterRecord):             # <<<<<<<<<<<<<<
+ *             try:
+ *                 old = AdapterRecord(old.adapter, old.depth)
+ */
+    __pyx_t_5 = ((!(PyObject_TypeCheck(__pyx_v_old, ((PyObject *)__pyx_ptype_9protocols_9_speedups_AdapterRecord)) != 0)) != 0);
+    if (__pyx_t_5) {
+
+      /* "protocols/_speedups.pyx":313
+ *     if old is not None:
+ *         if not PyObject_TypeCheck(old, AdapterRecord):
+ *             try:             # <<<<<<<<<<<<<<
+ *                 old = AdapterRecord(old.adapter, old.depth)
+ *             except AttributeError:
+ */
+      {
+        __Pyx_PyThreadState_declare
+        __Pyx_PyThreadState_assign
+        __Pyx_ExceptionSave(&__pyx_t_6, &__pyx_t_7, &__pyx_t_8);
+        __Pyx_XGOTREF(__pyx_t_6);
+        __Pyx_XGOTREF(__pyx_t_7);
+        __Pyx_XGOTREF(__pyx_t_8);
+        /*try:*/ {
+
+          /* "protocols/_speedups.pyx":314
+ *         if not PyObject_TypeCheck(old, AdapterRecord):
+ *             try:
+ *                 old = AdapterRecord(old.adapter, old.depth)             # <<<<<<<<<<<<<<
+ *             except AttributeError:
+ *                 old = AdapterRecord(*old)   # e.g. a tuple from an older pickle
+ */
+          __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_old, __pyx_n_s_adapter); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 314, __pyx_L7_error)
+          __Pyx_GOTREF(__pyx_t_2);
+          __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_old, __pyx_n_s_depth); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 314, __pyx_L7_error)
+          __Pyx_GOTREF(__pyx_t_3);
+          __pyx_t_4 = PyTuple_New(2); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 314, __pyx_L7_error)
+          __Pyx_GOTREF(__pyx_t_4);
+          __Pyx_GIVEREF(__pyx_t_2);
+          PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_2);
+          __Pyx_GIVEREF(__pyx_t_3);
+          PyTuple_SET_ITEM(__pyx_t_4, 1, __pyx_t_3);
+          __pyx_t_2 = 0;
+          __pyx_t_3 = 0;
+          __pyx_t_3 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_9protocols_9_speedups_AdapterRecord), __pyx_t_4, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 314, __pyx_L7_error)
+          __Pyx_GOTREF(__pyx_t_3);
+          __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+          __Pyx_DECREF_SET(__pyx_v_old, __pyx_t_3);
+          __pyx_t_3 = 0;
+
+          /* "protocols/_speedups.pyx":313
+ *     if old is not None:
+ *         if not PyObject_TypeCheck(old, AdapterRecord):
+ *             try:             # <<<<<<<<<<<<<<
+ *                 old = AdapterRecord(old.adapter, old.depth)
+ *             except AttributeError:
+ */
+        }
+        __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+        __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
+        __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
+        goto __pyx_L12_try_end;
+        __pyx_L7_error:;
+        __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
+        __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+        __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+        /* "protocols/_speedups.pyx":315
+ *             try:
+ *                 old = AdapterRecord(old.adapter, old.depth)
+ *             except AttributeError:             # <<<<<<<<<<<<<<
+ *                 old = AdapterRecord(*old)   # e.g. a tuple from an older pickle
+ * 
+ */
+        __pyx_t_9 = __Pyx_PyErr_ExceptionMatches(__pyx_builtin_AttributeError);
+        if (__pyx_t_9) {
+          __Pyx_AddTraceback("protocols._speedups.updateWithSimplestAdapter", __pyx_clineno, __pyx_lineno, __pyx_filename);
+          if (__Pyx_GetException(&__pyx_t_3, &__pyx_t_4, &__pyx_t_2) < 0) __PYX_ERR(0, 315, __pyx_L9_except_error)
+          __Pyx_GOTREF(__pyx_t_3);
+          __Pyx_GOTREF(__pyx_t_4);
+          __Pyx_GOTREF(__pyx_t_2);
+
+          /* "protocols/_speedups.pyx":316
+ *                 old = AdapterRecord(old.adapter, old.depth)
+ *             except AttributeError:
+ *                 old = AdapterRecord(*old)   # e.g. a tuple from an older pickle             # <<<<<<<<<<<<<<
+ * 
+ *         record = old
+ */
+          __pyx_t_10 = __Pyx_PySequence_Tuple(__pyx_v_old); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 316, __pyx_L9_except_error)
+          __Pyx_GOTREF(__pyx_t_10);
+          __pyx_t_11 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_9protocols_9_speedups_AdapterRecord), __pyx_t_10, NULL); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 316, __pyx_L9_except_error)
+          __Pyx_GOTREF(__pyx_t_11);
+          __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+          __Pyx_DECREF_SET(__pyx_v_old, __pyx_t_11);
+          __pyx_t_11 = 0;
+          __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+          __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+          __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
+          goto __pyx_L8_exception_handled;
+        }
+        goto __pyx_L9_except_error;
+        __pyx_L9_except_error:;
+
+        /* "protocols/_speedups.pyx":313
+ *     if old is not None:
+ *         if not PyObject_TypeCheck(old, AdapterRecord):
+ *             try:             # <<<<<<<<<<<<<<
+ *                 old = AdapterRecord(old.adapter, old.depth)
+ *             except AttributeError:
+ */
+        __Pyx_XGIVEREF(__pyx_t_6);
+        __Pyx_XGIVEREF(__pyx_t_7);
+        __Pyx_XGIVEREF(__pyx_t_8);
+        __Pyx_ExceptionReset(__pyx_t_6, __pyx_t_7, __pyx_t_8);
+        goto __pyx_L1_error;
+        __pyx_L8_exception_handled:;
+        __Pyx_XGIVEREF(__pyx_t_6);
+        __Pyx_XGIVEREF(__pyx_t_7);
+        __Pyx_XGIVEREF(__pyx_t_8);
+        __Pyx_ExceptionReset(__pyx_t_6, __pyx_t_7, __pyx_t_8);
+        __pyx_L12_try_end:;
+      }
+
+      /* "protocols/_speedups.pyx":312
+ * 
+ *     if old is not None:
+ *         if not PyObject_TypeCheck(old, AdapterRecord):             # <<<<<<<<<<<<<<
+ *             try:
+ *                 old = AdapterRecord(old.adapter, old.depth)
+ */
+    }
+
+    /* "protocols/_speedups.pyx":318
+ *                 old = AdapterRecord(*old)   # e.g. a tuple from an older pickle
+ * 
+ *         record = old             # <<<<<<<<<<<<<<
+ *         cmp = compareDepths(depth, record.depth)
+ * 
+ */
+    if (!(likely(((__pyx_v_old) == Py_None) || likely(__Pyx_TypeTest(__pyx_v_old, __pyx_ptype_9protocols_9_speedups_AdapterRecord))))) __PYX_ERR(0, 318, __pyx_L1_error)
+    __pyx_t_2 = __pyx_v_old;
+    __Pyx_INCREF(__pyx_t_2);
+    __pyx_v_record = ((struct __pyx_obj_9protocols_9_speedups_AdapterRecord *)__pyx_t_2);
+    __pyx_t_2 = 0;
+
+    /* "protocols/_speedups.pyx":319
+ * 
+ *         record = old
+ *         cmp = compareDepths(depth, record.depth)             # <<<<<<<<<<<<<<
+ * 
+ *         if cmp > 0 or adapter is record.adapter and cmp == 0:
+ */
+    __pyx_t_2 = __pyx_v_record->depth;
+    __Pyx_INCREF(__pyx_t_2);
+    __pyx_t_9 = __pyx_f_9protocols_9_speedups_compareDepths(__pyx_v_depth, __pyx_t_2); if (unlikely(__pyx_t_9 == ((int)-2))) __PYX_ERR(0, 319, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __pyx_v_cmp = __pyx_t_9;
+
+    /* "protocols/_speedups.pyx":321
+ *         cmp = compareDepths(depth, record.depth)
+ * 
+ *         if cmp > 0 or adapter is record.adapter and cmp == 0:             # <<<<<<<<<<<<<<
+ *             return False    # the existing entry is at least as short
+ * 
+ */
+    __pyx_t_1 = ((__pyx_v_cmp > 0) != 0);
+    if (!__pyx_t_1) {
+    } else {
+      __pyx_t_5 = __pyx_t_1;
+      goto __pyx_L16_bool_binop_done;
+    }
+    __pyx_t_1 = (__pyx_v_adapter == __pyx_v_record->adapter);
+    __pyx_t_12 = (__pyx_t_1 != 0);
+    if (__pyx_t_12) {
+    } else {
+      __pyx_t_5 = __pyx_t_12;
+      goto __pyx_L16_bool_binop_done;
+    }
+    __pyx_t_12 = ((__pyx_v_cmp == 0) != 0);
+    __pyx_t_5 = __pyx_t_12;
+    __pyx_L16_bool_binop_done:;
+    if (__pyx_t_5) {
+
+      /* "protocols/_speedups.pyx":322
+ * 
+ *         if cmp > 0 or adapter is record.adapter and cmp == 0:
+ *             return False    # the existing entry is at least as short             # <<<<<<<<<<<<<<
+ * 
+ *         new = AdapterRecord(adapter,depth)
+ */
+      __Pyx_XDECREF(__pyx_r);
+      __Pyx_INCREF(Py_False);
+      __pyx_r = Py_False;
+      goto __pyx_L0;
+
+      /* "protocols/_speedups.pyx":321
+ *         cmp = compareDepths(depth, record.depth)
+ * 
+ *         if cmp > 0 or adapter is record.adapter and cmp == 0:             # <<<<<<<<<<<<<<
+ *             return False    # the existing entry is at least as short
+ * 
+ */
+    }
+
+    /* "protocols/_speedups.pyx":324
+ *             return False    # the existing entry is at least as short
+ * 
+ *         new = AdapterRecord(adapter,depth)             # <<<<<<<<<<<<<<
+ *         if cmp == 0 and minimumRecord(record, new) is record:
+ *             return False
+ */
+    __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 324, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_INCREF(__pyx_v_adapter);
+    __Pyx_GIVEREF(__pyx_v_adapter);
+    PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_v_adapter);
+    __Pyx_INCREF(__pyx_v_depth);
+    __Pyx_GIVEREF(__pyx_v_depth);
+    PyTuple_SET_ITEM(__pyx_t_2, 1, __pyx_v_depth);
+    __pyx_t_4 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_9protocols_9_speedups_AdapterRecord), __pyx_t_2, NULL); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 324, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __pyx_v_new = ((struct __pyx_obj_9protocols_9_speedups_AdapterRecord *)__pyx_t_4);
+    __pyx_t_4 = 0;
+
+    /* "protocols/_speedups.pyx":325
+ * 
+ *         new = AdapterRecord(adapter,depth)
+ *         if cmp == 0 and minimumRecord(record, new) is record:             # <<<<<<<<<<<<<<
+ *             return False
+ *     else:
+ */
+    __pyx_t_12 = ((__pyx_v_cmp == 0) != 0);
+    if (__pyx_t_12) {
+    } else {
+      __pyx_t_5 = __pyx_t_12;
+      goto __pyx_L20_bool_binop_done;
+    }
+    __pyx_t_4 = ((PyObject *)__pyx_f_9protocols_9_speedups_minimumRecord(__pyx_v_record, __pyx_v_new)); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 325, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_12 = (((struct __pyx_obj_9protocols_9_speedups_AdapterRecord *)__pyx_t_4) == __pyx_v_record);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __pyx_t_1 = (__pyx_t_12 != 0);
+    __pyx_t_5 = __pyx_t_1;
+    __pyx_L20_bool_binop_done:;
+    if (__pyx_t_5) {
+
+      /* "protocols/_speedups.pyx":326
+ *         new = AdapterRecord(adapter,depth)
+ *         if cmp == 0 and minimumRecord(record, new) is record:
+ *             return False             # <<<<<<<<<<<<<<
+ *     else:
+ *         new = AdapterRecord(adapter,depth)
+ */
+      __Pyx_XDECREF(__pyx_r);
+      __Pyx_INCREF(Py_False);
+      __pyx_r = Py_False;
+      goto __pyx_L0;
+
+      /* "protocols/_speedups.pyx":325
+ * 
+ *         new = AdapterRecord(adapter,depth)
+ *         if cmp == 0 and minimumRecord(record, new) is record:             # <<<<<<<<<<<<<<
+ *             return False
+ *     else:
+ */
+    }
+
+    /* "protocols/_speedups.pyx":311
+ *         old = mapping.get(key)
+ * 
+ *     if old is not None:             # <<<<<<<<<<<<<<
+ *         if not PyObject_TypeCheck(old, AdapterRecord):
+ *             try:
+ */
+    goto __pyx_L5;
+  }
+
+  /* "protocols/_speedups.pyx":328
+ *             return False
+ *     else:
+ *         new = AdapterRecord(adapter,depth)             # <<<<<<<<<<<<<<
+ * 
+ *     if exact:
+ */
+  /*else*/ {
+    __pyx_t_4 = PyTuple_New(2); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 328, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_INCREF(__pyx_v_adapter);
+    __Pyx_GIVEREF(__pyx_v_adapter);
+    PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_v_adapter);
+    __Pyx_INCREF(__pyx_v_depth);
+    __Pyx_GIVEREF(__pyx_v_depth);
+    PyTuple_SET_ITEM(__pyx_t_4, 1, __pyx_v_depth);
+    __pyx_t_2 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_9protocols_9_speedups_AdapterRecord), __pyx_t_4, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 328, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __pyx_v_new = ((struct __pyx_obj_9protocols_9_speedups_AdapterRecord *)__pyx_t_2);
+    __pyx_t_2 = 0;
+  }
+  __pyx_L5:;
+
+  /* "protocols/_speedups.pyx":330
+ *         new = AdapterRecord(adapter,depth)
+ * 
+ *     if exact:             # <<<<<<<<<<<<<<
+ *         PyDict_SetItem(mapping, key, new)
+ *     else:
+ */
+  __pyx_t_5 = (__pyx_v_exact != 0);
+  if (__pyx_t_5) {
+
+    /* "protocols/_speedups.pyx":331
+ * 
+ *     if exact:
+ *         PyDict_SetItem(mapping, key, new)             # <<<<<<<<<<<<<<
+ *     else:
+ *         mapping[key] = new
+ */
+    __pyx_t_9 = PyDict_SetItem(__pyx_v_mapping, __pyx_v_key, ((PyObject *)__pyx_v_new)); if (unlikely(__pyx_t_9 == ((int)-1))) __PYX_ERR(0, 331, __pyx_L1_error)
+
+    /* "protocols/_speedups.pyx":330
+ *         new = AdapterRecord(adapter,depth)
+ * 
+ *     if exact:             # <<<<<<<<<<<<<<
+ *         PyDict_SetItem(mapping, key, new)
+ *     else:
+ */
+    goto __pyx_L22;
+  }
+
+  /* "protocols/_speedups.pyx":333
+ *         PyDict_SetItem(mapping, key, new)
+ *     else:
+ *         mapping[key] = new             # <<<<<<<<<<<<<<
+ * 
+ *     return True
+ */
+  /*else*/ {
+    if (unlikely(PyObject_SetItem(__pyx_v_mapping, __pyx_v_key, ((PyObject *)__pyx_v_new)) < 0)) __PYX_ERR(0, 333, __pyx_L1_error)
+  }
+  __pyx_L22:;
+
+  /* "protocols/_speedups.pyx":335
+ *         mapping[key] = new
+ * 
+ *     return True             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(Py_True);
+  __pyx_r = Py_True;
+  goto __pyx_L0;
+
+  /* "protocols/_speedups.pyx":293
+ * 
+ * 
+ * def updateWithSimplestAdapter(mapping, key, adapter, depth):             # <<<<<<<<<<<<<<
+ *     """Replace 'mapping[key]' w/'adapter' @ 'depth', return true if changed"""
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_10);
+  __Pyx_XDECREF(__pyx_t_11);
+  __Pyx_AddTraceback("protocols._speedups.updateWithSimplestAdapter", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF((PyObject *)__pyx_v_record);
+  __Pyx_XDECREF(__pyx_v_old);
+  __Pyx_XDECREF((PyObject *)__pyx_v_new);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "protocols/_speedups.pyx":338
+ * 
+ * 
+ * cdef int mayConform(obj):             # <<<<<<<<<<<<<<
+ * 
+ *     # Return false if 'obj' can't possibly have a '__conform__' attribute,
+ */
+
+static int __pyx_f_9protocols_9_speedups_mayConform(PyObject *__pyx_v_obj) {
+  PyTypeObject *__pyx_v_tp;
+  void **__pyx_v_dictptr;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  PyTypeObject *__pyx_t_1;
+  int __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  __Pyx_RefNannySetupContext("mayConform", 0);
+
+  /* "protocols/_speedups.pyx":348
+ *     cdef void **dictptr
+ * 
+ *     tp = (<PyObject *>obj).ob_type             # <<<<<<<<<<<<<<
+ *     if tp.tp_getattro != PyBaseObject_Type.tp_getattro:
+ *         return 1
+ */
+  __pyx_t_1 = ((PyObject *)__pyx_v_obj)->ob_type;
+  __pyx_v_tp = __pyx_t_1;
+
+  /* "protocols/_speedups.pyx":349
+ * 
+ *     tp = (<PyObject *>obj).ob_type
+ *     if tp.tp_getattro != PyBaseObject_Type.tp_getattro:             # <<<<<<<<<<<<<<
+ *         return 1
+ * 
+ */
+  __pyx_t_2 = ((__pyx_v_tp->tp_getattro != PyBaseObject_Type.tp_getattro) != 0);
+  if (__pyx_t_2) {
+
+    /* "protocols/_speedups.pyx":350
+ *     tp = (<PyObject *>obj).ob_type
+ *     if tp.tp_getattro != PyBaseObject_Type.tp_getattro:
+ *         return 1             # <<<<<<<<<<<<<<
+ * 
+ *     if _PyType_Lookup(tp, __conform):
+ */
+    __pyx_r = 1;
+    goto __pyx_L0;
+
+    /* "protocols/_speedups.pyx":349
+ * 
+ *     tp = (<PyObject *>obj).ob_type
+ *     if tp.tp_getattro != PyBaseObject_Type.tp_getattro:             # <<<<<<<<<<<<<<
+ *         return 1
+ * 
+ */
+  }
+
+  /* "protocols/_speedups.pyx":352
+ *         return 1
+ * 
+ *     if _PyType_Lookup(tp, __conform):             # <<<<<<<<<<<<<<
+ *         return 1
+ * 
+ */
+  __pyx_t_3 = __pyx_v_9protocols_9_speedups___conform;
+  __Pyx_INCREF(__pyx_t_3);
+  __pyx_t_2 = (_PyType_Lookup(__pyx_v_tp, __pyx_t_3) != 0);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if (__pyx_t_2) {
+
+    /* "protocols/_speedups.pyx":353
+ * 
+ *     if _PyType_Lookup(tp, __conform):
+ *         return 1             # <<<<<<<<<<<<<<
+ * 
+ *     dictptr = _PyObject_GetDictPtr(obj)
+ */
+    __pyx_r = 1;
+    goto __pyx_L0;
+
+    /* "protocols/_speedups.pyx":352
+ *         return 1
+ * 
+ *     if _PyType_Lookup(tp, __conform):             # <<<<<<<<<<<<<<
+ *         return 1
+ * 
+ */
+  }
+
+  /* "protocols/_speedups.pyx":355
+ *         return 1
+ * 
+ *     dictptr = _PyObject_GetDictPtr(obj)             # <<<<<<<<<<<<<<
+ *     if dictptr:
+ *         if dictptr[0]:
+ */
+  __pyx_v_dictptr = _PyObject_GetDictPtr(__pyx_v_obj);
+
+  /* "protocols/_speedups.pyx":356
+ * 
+ *     dictptr = _PyObject_GetDictPtr(obj)
+ *     if dictptr:             # <<<<<<<<<<<<<<
+ *         if dictptr[0]:
+ *             if PyDict_GetItem(<object> dictptr[0], __conform):
+ */
+  __pyx_t_2 = (__pyx_v_dictptr != 0);
+  if (__pyx_t_2) {
+
+    /* "protocols/_speedups.pyx":357
+ *     dictptr = _PyObject_GetDictPtr(obj)
+ *     if dictptr:
+ *         if dictptr[0]:             # <<<<<<<<<<<<<<
+ *             if PyDict_GetItem(<object> dictptr[0], __conform):
+ *                 return 1
+ */
+    __pyx_t_2 = ((__pyx_v_dictptr[0]) != 0);
+    if (__pyx_t_2) {
+
+      /* "protocols/_speedups.pyx":358
+ *     if dictptr:
+ *         if dictptr[0]:
+ *             if PyDict_GetItem(<object> dictptr[0], __conform):             # <<<<<<<<<<<<<<
+ *                 return 1
+ *     return 0
+ */
+      __pyx_t_3 = ((PyObject *)(__pyx_v_dictptr[0]));
+      __Pyx_INCREF(__pyx_t_3);
+      __pyx_t_4 = __pyx_v_9protocols_9_speedups___conform;
+      __Pyx_INCREF(__pyx_t_4);
+      __pyx_t_2 = (PyDict_GetItem(__pyx_t_3, __pyx_t_4) != 0);
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      if (__pyx_t_2) {
+
+        /* "protocols/_speedups.pyx":359
+ *         if dictptr[0]:
+ *             if PyDict_GetItem(<object> dictptr[0], __conform):
+ *                 return 1             # <<<<<<<<<<<<<<
+ *     return 0
+ * 
+ */
+        __pyx_r = 1;
+        goto __pyx_L0;
+
+        /* "protocols/_speedups.pyx":358
+ *     if dictptr:
+ *         if dictptr[0]:
+ *             if PyDict_GetItem(<object> dictptr[0], __conform):             # <<<<<<<<<<<<<<
+ *                 return 1
+ *     return 0
+ */
+      }
+
+      /* "protocols/_speedups.pyx":357
+ *     dictptr = _PyObject_GetDictPtr(obj)
+ *     if dictptr:
+ *         if dictptr[0]:             # <<<<<<<<<<<<<<
+ *             if PyDict_GetItem(<object> dictptr[0], __conform):
+ *                 return 1
+ */
+    }
+
+    /* "protocols/_speedups.pyx":356
+ * 
+ *     dictptr = _PyObject_GetDictPtr(obj)
+ *     if dictptr:             # <<<<<<<<<<<<<<
+ *         if dictptr[0]:
+ *             if PyDict_GetItem(<object> dictptr[0], __conform):
+ */
+  }
+
+  /* "protocols/_speedups.pyx":360
+ *             if PyDict_GetItem(<object> dictptr[0], __conform):
+ *                 return 1
+ *     return 0             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_r = 0;
+  goto __pyx_L0;
+
+  /* "protocols/_speedups.pyx":338
+ * 
+ * 
+ * cdef int mayConform(obj):             # <<<<<<<<<<<<<<
+ * 
+ *     # Return false if 'obj' can't possibly have a '__conform__' attribute,
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "protocols/_speedups.pyx":363
+ * 
+ * 
+ * cdef object getConform(obj):             # <<<<<<<<<<<<<<
+ * 
+ *     # Return 'obj.__conform__', or None if 'obj' has no __conform__
+ */
+
+static PyObject *__pyx_f_9protocols_9_speedups_getConform(PyObject *__pyx_v_obj) {
+  void *__pyx_v_tmp;
+  PyObject *__pyx_v_meth = NULL;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  int __pyx_t_3;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("getConform", 0);
+
+  /* "protocols/_speedups.pyx":369
+ *     cdef void *tmp
+ * 
+ *     if not mayConform(obj):             # <<<<<<<<<<<<<<
+ *         return None
+ * 
+ */
+  __pyx_t_1 = ((!(__pyx_f_9protocols_9_speedups_mayConform(__pyx_v_obj) != 0)) != 0);
+  if (__pyx_t_1) {
+
+    /* "protocols/_speedups.pyx":370
+ * 
+ *     if not mayConform(obj):
+ *         return None             # <<<<<<<<<<<<<<
+ * 
+ *     tmp = PyObject_GetAttr(obj, __conform)
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+    goto __pyx_L0;
+
+    /* "protocols/_speedups.pyx":369
+ *     cdef void *tmp
+ * 
+ *     if not mayConform(obj):             # <<<<<<<<<<<<<<
+ *         return None
+ * 
+ */
+  }
+
+  /* "protocols/_speedups.pyx":372
+ *         return None
+ * 
+ *     tmp = PyObject_GetAttr(obj, __conform)             # <<<<<<<<<<<<<<
+ *     if tmp:
+ *         meth = <object> tmp
+ */
+  __pyx_t_2 = __pyx_v_9protocols_9_speedups___conform;
+  __Pyx_INCREF(__pyx_t_2);
+  __pyx_v_tmp = PyObject_GetAttr(__pyx_v_obj, __pyx_t_2);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "protocols/_speedups.pyx":373
+ * 
+ *     tmp = PyObject_GetAttr(obj, __conform)
+ *     if tmp:             # <<<<<<<<<<<<<<
+ *         meth = <object> tmp
+ *         Py_DECREF(<PyObject *>tmp)
+ */
+  __pyx_t_1 = (__pyx_v_tmp != 0);
+  if (__pyx_t_1) {
+
+    /* "protocols/_speedups.pyx":374
+ *     tmp = PyObject_GetAttr(obj, __conform)
+ *     if tmp:
+ *         meth = <object> tmp             # <<<<<<<<<<<<<<
+ *         Py_DECREF(<PyObject *>tmp)
+ *         return meth
+ */
+    __pyx_t_2 = ((PyObject *)__pyx_v_tmp);
+    __Pyx_INCREF(__pyx_t_2);
+    __pyx_v_meth = __pyx_t_2;
+    __pyx_t_2 = 0;
+
+    /* "protocols/_speedups.pyx":375
+ *     if tmp:
+ *         meth = <object> tmp
+ *         Py_DECREF(<PyObject *>tmp)             # <<<<<<<<<<<<<<
+ *         return meth
+ *     elif PyErr_ExceptionMatches(PyExc_AttributeError):
+ */
+    Py_DECREF(((PyObject *)__pyx_v_tmp));
+
+    /* "protocols/_speedups.pyx":376
+ *         meth = <object> tmp
+ *         Py_DECREF(<PyObject *>tmp)
+ *         return meth             # <<<<<<<<<<<<<<
+ *     elif PyErr_ExceptionMatches(PyExc_AttributeError):
+ *         PyErr_Clear()
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_INCREF(__pyx_v_meth);
+    __pyx_r = __pyx_v_meth;
+    goto __pyx_L0;
+
+    /* "protocols/_speedups.pyx":373
+ * 
+ *     tmp = PyObject_GetAttr(obj, __conform)
+ *     if tmp:             # <<<<<<<<<<<<<<
+ *         meth = <object> tmp
+ *         Py_DECREF(<PyObject *>tmp)
+ */
+  }
+
+  /* "protocols/_speedups.pyx":377
+ *         Py_DECREF(<PyObject *>tmp)
+ *         return meth
+ *     elif PyErr_ExceptionMatches(PyExc_AttributeError):             # <<<<<<<<<<<<<<
+ *         PyErr_Clear()
+ *         return None
+ */
+  __pyx_t_1 = (PyErr_ExceptionMatches(PyExc_AttributeError) != 0);
+  if (__pyx_t_1) {
+
+    /* "protocols/_speedups.pyx":378
+ *         return meth
+ *     elif PyErr_ExceptionMatches(PyExc_AttributeError):
+ *         PyErr_Clear()             # <<<<<<<<<<<<<<
+ *         return None
+ *     else:
+ */
+    PyErr_Clear();
+
+    /* "protocols/_speedups.pyx":379
+ *     elif PyErr_ExceptionMatches(PyExc_AttributeError):
+ *         PyErr_Clear()
+ *         return None             # <<<<<<<<<<<<<<
+ *     else:
+ *         reraise()
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+    goto __pyx_L0;
+
+    /* "protocols/_speedups.pyx":377
+ *         Py_DECREF(<PyObject *>tmp)
+ *         return meth
+ *     elif PyErr_ExceptionMatches(PyExc_AttributeError):             # <<<<<<<<<<<<<<
+ *         PyErr_Clear()
+ *         return None
+ */
+  }
+
+  /* "protocols/_speedups.pyx":381
+ *         return None
+ *     else:
+ *         reraise()             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  /*else*/ {
+    __pyx_t_3 = __pyx_f_9protocols_9_speedups_reraise(); if (unlikely(__pyx_t_3 == ((int)-1))) __PYX_ERR(0, 381, __pyx_L1_error)
+  }
+
+  /* "protocols/_speedups.pyx":363
+ * 
+ * 
+ * cdef object getConform(obj):             # <<<<<<<<<<<<<<
+ * 
+ *     # Return 'obj.__conform__', or None if 'obj' has no __conform__
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_AddTraceback("protocols._speedups.getConform", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_meth);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "protocols/_speedups.pyx":384
+ * 
+ * 
+ * cdef object callConform(meth, protocol):             # <<<<<<<<<<<<<<
+ * 
+ *     # Return 'meth(protocol)', or None if it's an unsuitable __conform__
+ */
+
+static PyObject *__pyx_f_9protocols_9_speedups_callConform(PyObject *__pyx_v_meth, PyObject *__pyx_v_protocol) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  int __pyx_t_7;
+  PyObject *__pyx_t_8 = NULL;
+  PyObject *__pyx_t_9 = NULL;
+  PyObject *__pyx_t_10 = NULL;
+  int __pyx_t_11;
+  int __pyx_t_12;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("callConform", 0);
+
+  /* "protocols/_speedups.pyx":388
+ *     # Return 'meth(protocol)', or None if it's an unsuitable __conform__
+ * 
+ *     try:             # <<<<<<<<<<<<<<
+ *         return meth(protocol)
+ *     except TypeError:
+ */
+  {
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    __Pyx_ExceptionSave(&__pyx_t_1, &__pyx_t_2, &__pyx_t_3);
+    __Pyx_XGOTREF(__pyx_t_1);
+    __Pyx_XGOTREF(__pyx_t_2);
+    __Pyx_XGOTREF(__pyx_t_3);
+    /*try:*/ {
+
+      /* "protocols/_speedups.pyx":389
+ * 
+ *     try:
+ *         return meth(protocol)             # <<<<<<<<<<<<<<
+ *     except TypeError:
+ *         if exc_info()[2].tb_next is not None:
+ */
+      __Pyx_XDECREF(__pyx_r);
+      __Pyx_INCREF(__pyx_v_meth);
+      __pyx_t_5 = __pyx_v_meth; __pyx_t_6 = NULL;
+      if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_5))) {
+        __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_5);
+        if (likely(__pyx_t_6)) {
+          PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_5);
+          __Pyx_INCREF(__pyx_t_6);
+          __Pyx_INCREF(function);
+          __Pyx_DECREF_SET(__pyx_t_5, function);
+        }
+      }
+      __pyx_t_4 = (__pyx_t_6) ? __Pyx_PyObject_Call2Args(__pyx_t_5, __pyx_t_6, __pyx_v_protocol) : __Pyx_PyObject_CallOneArg(__pyx_t_5, __pyx_v_protocol);
+      __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+      if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 389, __pyx_L3_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      __pyx_r = __pyx_t_4;
+      __pyx_t_4 = 0;
+      goto __pyx_L7_try_return;
+
+      /* "protocols/_speedups.pyx":388
+ *     # Return 'meth(protocol)', or None if it's an unsuitable __conform__
+ * 
+ *     try:             # <<<<<<<<<<<<<<
+ *         return meth(protocol)
+ *     except TypeError:
+ */
+    }
+    __pyx_L3_error:;
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+
+    /* "protocols/_speedups.pyx":390
+ *     try:
+ *         return meth(protocol)
+ *     except TypeError:             # <<<<<<<<<<<<<<
+ *         if exc_info()[2].tb_next is not None:
+ *             raise
+ */
+    __pyx_t_7 = __Pyx_PyErr_ExceptionMatches(__pyx_builtin_TypeError);
+    if (__pyx_t_7) {
+      __Pyx_AddTraceback("protocols._speedups.callConform", __pyx_clineno, __pyx_lineno, __pyx_filename);
+      if (__Pyx_GetException(&__pyx_t_4, &__pyx_t_5, &__pyx_t_6) < 0) __PYX_ERR(0, 390, __pyx_L5_except_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      __Pyx_GOTREF(__pyx_t_5);
+      __Pyx_GOTREF(__pyx_t_6);
+
+      /* "protocols/_speedups.pyx":391
+ *         return meth(protocol)
+ *     except TypeError:
+ *         if exc_info()[2].tb_next is not None:             # <<<<<<<<<<<<<<
+ *             raise
+ * 
+ */
+      __Pyx_GetModuleGlobalName(__pyx_t_9, __pyx_n_s_exc_info); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 391, __pyx_L5_except_error)
+      __Pyx_GOTREF(__pyx_t_9);
+      __pyx_t_10 = NULL;
+      if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_9))) {
+        __pyx_t_10 = PyMethod_GET_SELF(__pyx_t_9);
+        if (likely(__pyx_t_10)) {
+          PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_9);
+          __Pyx_INCREF(__pyx_t_10);
+          __Pyx_INCREF(function);
+          __Pyx_DECREF_SET(__pyx_t_9, function);
+        }
+      }
+      __pyx_t_8 = (__pyx_t_10) ? __Pyx_PyObject_CallOneArg(__pyx_t_9, __pyx_t_10) : __Pyx_PyObject_CallNoArg(__pyx_t_9);
+      __Pyx_XDECREF(__pyx_t_10); __pyx_t_10 = 0;
+      if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 391, __pyx_L5_except_error)
+      __Pyx_GOTREF(__pyx_t_8);
+      __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+      __pyx_t_9 = __Pyx_GetItemInt(__pyx_t_8, 2, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 391, __pyx_L5_except_error)
+      __Pyx_GOTREF(__pyx_t_9);
+      __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+      __pyx_t_8 = __Pyx_PyObject_GetAttrStr(__pyx_t_9, __pyx_n_s_tb_next); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 391, __pyx_L5_except_error)
+      __Pyx_GOTREF(__pyx_t_8);
+      __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+      __pyx_t_11 = (__pyx_t_8 != Py_None);
+      __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+      __pyx_t_12 = (__pyx_t_11 != 0);
+      if (unlikely(__pyx_t_12)) {
+
+        /* "protocols/_speedups.pyx":392
+ *     except TypeError:
+ *         if exc_info()[2].tb_next is not None:
+ *             raise             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+        __Pyx_GIVEREF(__pyx_t_4);
+        __Pyx_GIVEREF(__pyx_t_5);
+        __Pyx_XGIVEREF(__pyx_t_6);
+        __Pyx_ErrRestoreWithState(__pyx_t_4, __pyx_t_5, __pyx_t_6);
+        __pyx_t_4 = 0; __pyx_t_5 = 0; __pyx_t_6 = 0; 
+        __PYX_ERR(0, 392, __pyx_L5_except_error)
+
+        /* "protocols/_speedups.pyx":391
+ *         return meth(protocol)
+ *     except TypeError:
+ *         if exc_info()[2].tb_next is not None:             # <<<<<<<<<<<<<<
+ *             raise
+ * 
+ */
+      }
+      __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+      __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+      __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+      goto __pyx_L4_exception_handled;
+    }
+    goto __pyx_L5_except_error;
+    __pyx_L5_except_error:;
+
+    /* "protocols/_speedups.pyx":388
+ *     # Return 'meth(protocol)', or None if it's an unsuitable __conform__
+ * 
+ *     try:             # <<<<<<<<<<<<<<
+ *         return meth(protocol)
+ *     except TypeError:
+ */
+    __Pyx_XGIVEREF(__pyx_t_1);
+    __Pyx_XGIVEREF(__pyx_t_2);
+    __Pyx_XGIVEREF(__pyx_t_3);
+    __Pyx_ExceptionReset(__pyx_t_1, __pyx_t_2, __pyx_t_3);
+    goto __pyx_L1_error;
+    __pyx_L7_try_return:;
+    __Pyx_XGIVEREF(__pyx_t_1);
+    __Pyx_XGIVEREF(__pyx_t_2);
+    __Pyx_XGIVEREF(__pyx_t_3);
+    __Pyx_ExceptionReset(__pyx_t_1, __pyx_t_2, __pyx_t_3);
+    goto __pyx_L0;
+    __pyx_L4_exception_handled:;
+    __Pyx_XGIVEREF(__pyx_t_1);
+    __Pyx_XGIVEREF(__pyx_t_2);
+    __Pyx_XGIVEREF(__pyx_t_3);
+    __Pyx_ExceptionReset(__pyx_t_1, __pyx_t_2, __pyx_t_3);
+  }
+
+  /* "protocols/_speedups.pyx":384
+ * 
+ * 
+ * cdef object callConform(meth, protocol):             # <<<<<<<<<<<<<<
+ * 
+ *     # Return 'meth(protocol)', or None if it's an unsuitable __conform__
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_8);
+  __Pyx_XDECREF(__pyx_t_9);
+  __Pyx_XDECREF(__pyx_t_10);
+  __Pyx_AddTraceback("protocols._speedups.callConform", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "protocols/_speedups.pyx":395
+ * 
+ * 
+ * cdef object callAdapt(obj, protocol):             # <<<<<<<<<<<<<<
+ * 
+ *     # Return 'protocol.__adapt__(obj)', or None if unavailable/unsuitable
+ */
+
+static PyObject *__pyx_f_9protocols_9_speedups_callAdapt(PyObject *__pyx_v_obj, PyObject *__pyx_v_protocol) {
+  void *__pyx_v_tmp;
+  PyObject *__pyx_v_meth = NULL;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  PyObject *__pyx_t_7 = NULL;
+  int __pyx_t_8;
+  PyObject *__pyx_t_9 = NULL;
+  PyObject *__pyx_t_10 = NULL;
+  PyObject *__pyx_t_11 = NULL;
+  int __pyx_t_12;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("callAdapt", 0);
+
+  /* "protocols/_speedups.pyx":401
+ *     cdef void *tmp
+ * 
+ *     tmp = PyObject_GetAttr(protocol, __adapt)             # <<<<<<<<<<<<<<
+ *     if tmp:
+ *         meth = <object> tmp
+ */
+  __pyx_t_1 = __pyx_v_9protocols_9_speedups___adapt;
+  __Pyx_INCREF(__pyx_t_1);
+  __pyx_v_tmp = PyObject_GetAttr(__pyx_v_protocol, __pyx_t_1);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "protocols/_speedups.pyx":402
+ * 
+ *     tmp = PyObject_GetAttr(protocol, __adapt)
+ *     if tmp:             # <<<<<<<<<<<<<<
+ *         meth = <object> tmp
+ *         Py_DECREF(<PyObject *>tmp)
+ */
+  __pyx_t_2 = (__pyx_v_tmp != 0);
+  if (__pyx_t_2) {
+
+    /* "protocols/_speedups.pyx":403
+ *     tmp = PyObject_GetAttr(protocol, __adapt)
+ *     if tmp:
+ *         meth = <object> tmp             # <<<<<<<<<<<<<<
+ *         Py_DECREF(<PyObject *>tmp)
+ *         try:
+ */
+    __pyx_t_1 = ((PyObject *)__pyx_v_tmp);
+    __Pyx_INCREF(__pyx_t_1);
+    __pyx_v_meth = __pyx_t_1;
+    __pyx_t_1 = 0;
+
+    /* "protocols/_speedups.pyx":404
+ *     if tmp:
+ *         meth = <object> tmp
+ *         Py_DECREF(<PyObject *>tmp)             # <<<<<<<<<<<<<<
+ *         try:
+ *             return meth(obj)
+ */
+    Py_DECREF(((PyObject *)__pyx_v_tmp));
+
+    /* "protocols/_speedups.pyx":405
+ *         meth = <object> tmp
+ *         Py_DECREF(<PyObject *>tmp)
+ *         try:             # <<<<<<<<<<<<<<
+ *             return meth(obj)
+ *         except TypeError:
+ */
+    {
+      __Pyx_PyThreadState_declare
+      __Pyx_PyThreadState_assign
+      __Pyx_ExceptionSave(&__pyx_t_3, &__pyx_t_4, &__pyx_t_5);
+      __Pyx_XGOTREF(__pyx_t_3);
+      __Pyx_XGOTREF(__pyx_t_4);
+      __Pyx_XGOTREF(__pyx_t_5);
+      /*try:*/ {
+
+        /* "protocols/_speedups.pyx":406
+ *         Py_DECREF(<PyObject *>tmp)
+ *         try:
+ *             return meth(obj)             # <<<<<<<<<<<<<<
+ *         except TypeError:
+ *             if exc_info()[2].tb_next is not None:
+ */
+        __Pyx_XDECREF(__pyx_r);
+        __Pyx_INCREF(__pyx_v_meth);
+        __pyx_t_6 = __pyx_v_meth; __pyx_t_7 = NULL;
+        if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_6))) {
+          __pyx_t_7 = PyMethod_GET_SELF(__pyx_t_6);
+          if (likely(__pyx_t_7)) {
+            PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_6);
+            __Pyx_INCREF(__pyx_t_7);
+            __Pyx_INCREF(function);
+            __Pyx_DECREF_SET(__pyx_t_6, function);
+          }
+        }
+        __pyx_t_1 = (__pyx_t_7) ? __Pyx_PyObject_Call2Args(__pyx_t_6, __pyx_t_7, __pyx_v_obj) : __Pyx_PyObject_CallOneArg(__pyx_t_6, __pyx_v_obj);
+        __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
+        if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 406, __pyx_L4_error)
+        __Pyx_GOTREF(__pyx_t_1);
+        __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+        __pyx_r = __pyx_t_1;
+        __pyx_t_1 = 0;
+        goto __pyx_L8_try_return;
+
+        /* "protocols/_speedups.pyx":405
+ *         meth = <object> tmp
+ *         Py_DECREF(<PyObject *>tmp)
+ *         try:             # <<<<<<<<<<<<<<
+ *             return meth(obj)
+ *         except TypeError:
+ */
+      }
+      __pyx_L4_error:;
+      __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
+      __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+      __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
+
+      /* "protocols/_speedups.pyx":407
+ *         try:
+ *             return meth(obj)
+ *         except TypeError:             # <<<<<<<<<<<<<<
+ *             if exc_info()[2].tb_next is not None:
+ *                 raise
+ */
+      __pyx_t_8 = __Pyx_PyErr_ExceptionMatches(__pyx_builtin_TypeError);
+      if (__pyx_t_8) {
+        __Pyx_AddTraceback("protocols._speedups.callAdapt", __pyx_clineno, __pyx_lineno, __pyx_filename);
+        if (__Pyx_GetException(&__pyx_t_1, &__pyx_t_6, &__pyx_t_7) < 0) __PYX_ERR(0, 407, __pyx_L6_except_error)
+        __Pyx_GOTREF(__pyx_t_1);
+        __Pyx_GOTREF(__pyx_t_6);
+        __Pyx_GOTREF(__pyx_t_7);
+
+        /* "protocols/_speedups.pyx":408
+ *             return meth(obj)
+ *         except TypeError:
+ *             if exc_info()[2].tb_next is not None:             # <<<<<<<<<<<<<<
+ *                 raise
+ *     elif PyErr_ExceptionMatches(PyExc_AttributeError):
+ */
+        __Pyx_GetModuleGlobalName(__pyx_t_10, __pyx_n_s_exc_info); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 408, __pyx_L6_except_error)
+        __Pyx_GOTREF(__pyx_t_10);
+        __pyx_t_11 = NULL;
+        if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_10))) {
+          __pyx_t_11 = PyMethod_GET_SELF(__pyx_t_10);
+          if (likely(__pyx_t_11)) {
+            PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_10);
+            __Pyx_INCREF(__pyx_t_11);
+            __Pyx_INCREF(function);
+            __Pyx_DECREF_SET(__pyx_t_10, function);
+          }
+        }
+        __pyx_t_9 = (__pyx_t_11) ? __Pyx_PyObject_CallOneArg(__pyx_t_10, __pyx_t_11) : __Pyx_PyObject_CallNoArg(__pyx_t_10);
+        __Pyx_XDECREF(__pyx_t_11); __pyx_t_11 = 0;
+        if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 408, __pyx_L6_except_error)
+        __Pyx_GOTREF(__pyx_t_9);
+        __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+        __pyx_t_10 = __Pyx_GetItemInt(__pyx_t_9, 2, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 408, __pyx_L6_except_error)
+        __Pyx_GOTREF(__pyx_t_10);
+        __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+        __pyx_t_9 = __Pyx_PyObject_GetAttrStr(__pyx_t_10, __pyx_n_s_tb_next); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 408, __pyx_L6_except_error)
+        __Pyx_GOTREF(__pyx_t_9);
+        __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+        __pyx_t_2 = (__pyx_t_9 != Py_None);
+        __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+        __pyx_t_12 = (__pyx_t_2 != 0);
+        if (unlikely(__pyx_t_12)) {
+
+          /* "protocols/_speedups.pyx":409
+ *         except TypeError:
+ *             if exc_info()[2].tb_next is not None:
+ *                 raise             # <<<<<<<<<<<<<<
+ *     elif PyErr_ExceptionMatches(PyExc_AttributeError):
+ *         PyErr_Clear()
+ */
+          __Pyx_GIVEREF(__pyx_t_1);
+          __Pyx_GIVEREF(__pyx_t_6);
+          __Pyx_XGIVEREF(__pyx_t_7);
+          __Pyx_ErrRestoreWithState(__pyx_t_1, __pyx_t_6, __pyx_t_7);
+          __pyx_t_1 = 0; __pyx_t_6 = 0; __pyx_t_7 = 0; 
+          __PYX_ERR(0, 409, __pyx_L6_except_error)
+
+          /* "protocols/_speedups.pyx":408
+ *             return meth(obj)
+ *         except TypeError:
+ *             if exc_info()[2].tb_next is not None:             # <<<<<<<<<<<<<<
+ *                 raise
+ *     elif PyErr_ExceptionMatches(PyExc_AttributeError):
+ */
+        }
+        __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
+        __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+        __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
+        goto __pyx_L5_exception_handled;
+      }
+      goto __pyx_L6_except_error;
+      __pyx_L6_except_error:;
+
+      /* "protocols/_speedups.pyx":405
+ *         meth = <object> tmp
+ *         Py_DECREF(<PyObject *>tmp)
+ *         try:             # <<<<<<<<<<<<<<
+ *             return meth(obj)
+ *         except TypeError:
+ */
+      __Pyx_XGIVEREF(__pyx_t_3);
+      __Pyx_XGIVEREF(__pyx_t_4);
+      __Pyx_XGIVEREF(__pyx_t_5);
+      __Pyx_ExceptionReset(__pyx_t_3, __pyx_t_4, __pyx_t_5);
+      goto __pyx_L1_error;
+      __pyx_L8_try_return:;
+      __Pyx_XGIVEREF(__pyx_t_3);
+      __Pyx_XGIVEREF(__pyx_t_4);
+      __Pyx_XGIVEREF(__pyx_t_5);
+      __Pyx_ExceptionReset(__pyx_t_3, __pyx_t_4, __pyx_t_5);
+      goto __pyx_L0;
+      __pyx_L5_exception_handled:;
+      __Pyx_XGIVEREF(__pyx_t_3);
+      __Pyx_XGIVEREF(__pyx_t_4);
+      __Pyx_XGIVEREF(__pyx_t_5);
+      __Pyx_ExceptionReset(__pyx_t_3, __pyx_t_4, __pyx_t_5);
+    }
+
+    /* "protocols/_speedups.pyx":402
+ * 
+ *     tmp = PyObject_GetAttr(protocol, __adapt)
+ *     if tmp:             # <<<<<<<<<<<<<<
+ *         meth = <object> tmp
+ *         Py_DECREF(<PyObject *>tmp)
+ */
+    goto __pyx_L3;
+  }
+
+  /* "protocols/_speedups.pyx":410
+ *             if exc_info()[2].tb_next is not None:
+ *                 raise
+ *     elif PyErr_ExceptionMatches(PyExc_AttributeError):             # <<<<<<<<<<<<<<
+ *         PyErr_Clear()
+ *     else:
+ */
+  __pyx_t_12 = (PyErr_ExceptionMatches(PyExc_AttributeError) != 0);
+  if (__pyx_t_12) {
+
+    /* "protocols/_speedups.pyx":411
+ *                 raise
+ *     elif PyErr_ExceptionMatches(PyExc_AttributeError):
+ *         PyErr_Clear()             # <<<<<<<<<<<<<<
+ *     else:
+ *         reraise()
+ */
+    PyErr_Clear();
+
+    /* "protocols/_speedups.pyx":410
+ *             if exc_info()[2].tb_next is not None:
+ *                 raise
+ *     elif PyErr_ExceptionMatches(PyExc_AttributeError):             # <<<<<<<<<<<<<<
+ *         PyErr_Clear()
+ *     else:
+ */
+    goto __pyx_L3;
+  }
+
+  /* "protocols/_speedups.pyx":413
+ *         PyErr_Clear()
+ *     else:
+ *         reraise()             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  /*else*/ {
+    __pyx_t_8 = __pyx_f_9protocols_9_speedups_reraise(); if (unlikely(__pyx_t_8 == ((int)-1))) __PYX_ERR(0, 413, __pyx_L1_error)
+  }
+  __pyx_L3:;
+
+  /* "protocols/_speedups.pyx":395
+ * 
+ * 
+ * cdef object callAdapt(obj, protocol):             # <<<<<<<<<<<<<<
+ * 
+ *     # Return 'protocol.__adapt__(obj)', or None if unavailable/unsuitable
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_XDECREF(__pyx_t_9);
+  __Pyx_XDECREF(__pyx_t_10);
+  __Pyx_XDECREF(__pyx_t_11);
+  __Pyx_AddTraceback("protocols._speedups.callAdapt", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_meth);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "protocols/_speedups.pyx":416
+ * 
+ * 
+ * cdef int isInstanceOf(obj, protocol):             # <<<<<<<<<<<<<<
+ * 
+ *     # We use nested 'if' blocks here because using 'and' causes Pyrex to
+ */
+
+static int __pyx_f_9protocols_9_speedups_isInstanceOf(PyObject *__pyx_v_obj, PyObject *__pyx_v_protocol) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  __Pyx_RefNannySetupContext("isInstanceOf", 0);
+
+  /* "protocols/_speedups.pyx":421
+ *     # convert the return values to Python ints, and then back to booleans!
+ * 
+ *     if PyType_Check(protocol):             # <<<<<<<<<<<<<<
+ *         if PyObject_TypeCheck(obj, protocol):
+ *             return 1
+ */
+  __pyx_t_1 = (PyType_Check(__pyx_v_protocol) != 0);
+  if (__pyx_t_1) {
+
+    /* "protocols/_speedups.pyx":422
+ * 
+ *     if PyType_Check(protocol):
+ *         if PyObject_TypeCheck(obj, protocol):             # <<<<<<<<<<<<<<
+ *             return 1
+ * 
+ */
+    __pyx_t_1 = (PyObject_TypeCheck(__pyx_v_obj, __pyx_v_protocol) != 0);
+    if (__pyx_t_1) {
+
+      /* "protocols/_speedups.pyx":423
+ *     if PyType_Check(protocol):
+ *         if PyObject_TypeCheck(obj, protocol):
+ *             return 1             # <<<<<<<<<<<<<<
+ * 
+ *     if PyClass_Check(protocol):
+ */
+      __pyx_r = 1;
+      goto __pyx_L0;
+
+      /* "protocols/_speedups.pyx":422
+ * 
+ *     if PyType_Check(protocol):
+ *         if PyObject_TypeCheck(obj, protocol):             # <<<<<<<<<<<<<<
+ *             return 1
+ * 
+ */
+    }
+
+    /* "protocols/_speedups.pyx":421
+ *     # convert the return values to Python ints, and then back to booleans!
+ * 
+ *     if PyType_Check(protocol):             # <<<<<<<<<<<<<<
+ *         if PyObject_TypeCheck(obj, protocol):
+ *             return 1
+ */
+  }
+
+  /* "protocols/_speedups.pyx":425
+ *             return 1
+ * 
+ *     if PyClass_Check(protocol):             # <<<<<<<<<<<<<<
+ *         if PyInstance_Check(obj):
+ *             if PyObject_IsInstance(obj,protocol):
+ */
+  __pyx_t_1 = (PyClass_Check(__pyx_v_protocol) != 0);
+  if (__pyx_t_1) {
+
+    /* "protocols/_speedups.pyx":426
+ * 
+ *     if PyClass_Check(protocol):
+ *         if PyInstance_Check(obj):             # <<<<<<<<<<<<<<
+ *             if PyObject_IsInstance(obj,protocol):
+ *                 return 1
+ */
+    __pyx_t_1 = (PyInstance_Check(__pyx_v_obj) != 0);
+    if (__pyx_t_1) {
+
+      /* "protocols/_speedups.pyx":427
+ *     if PyClass_Check(protocol):
+ *         if PyInstance_Check(obj):
+ *             if PyObject_IsInstance(obj,protocol):             # <<<<<<<<<<<<<<
+ *                 return 1
+ * 
+ */
+      __pyx_t_1 = (PyObject_IsInstance(__pyx_v_obj, __pyx_v_protocol) != 0);
+      if (__pyx_t_1) {
+
+        /* "protocols/_speedups.pyx":428
+ *         if PyInstance_Check(obj):
+ *             if PyObject_IsInstance(obj,protocol):
+ *                 return 1             # <<<<<<<<<<<<<<
+ * 
+ *     return 0
+ */
+        __pyx_r = 1;
+        goto __pyx_L0;
+
+        /* "protocols/_speedups.pyx":427
+ *     if PyClass_Check(protocol):
+ *         if PyInstance_Check(obj):
+ *             if PyObject_IsInstance(obj,protocol):             # <<<<<<<<<<<<<<
+ *                 return 1
+ * 
+ */
+      }
+
+      /* "protocols/_speedups.pyx":426
+ * 
+ *     if PyClass_Check(protocol):
+ *         if PyInstance_Check(obj):             # <<<<<<<<<<<<<<
+ *             if PyObject_IsInstance(obj,protocol):
+ *                 return 1
+ */
+    }
+
+    /* "protocols/_speedups.pyx":425
+ *             return 1
+ * 
+ *     if PyClass_Check(protocol):             # <<<<<<<<<<<<<<
+ *         if PyInstance_Check(obj):
+ *             if PyObject_IsInstance(obj,protocol):
+ */
+  }
+
+  /* "protocols/_speedups.pyx":430
+ *                 return 1
+ * 
+ *     return 0             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_r = 0;
+  goto __pyx_L0;
+
+  /* "protocols/_speedups.pyx":416
+ * 
+ * 
+ * cdef int isInstanceOf(obj, protocol):             # <<<<<<<<<<<<<<
+ * 
+ *     # We use nested 'if' blocks here because using 'and' causes Pyrex to
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "protocols/_speedups.pyx":433
+ * 
+ * 
+ * cdef int hasProtocolAdapt(protocol) except -1:             # <<<<<<<<<<<<<<
+ * 
+ *     # Is 'protocol' using the standard 'Protocol.__adapt__'?  If so, we can
+ */
+
+static int __pyx_f_9protocols_9_speedups_hasProtocolAdapt(PyObject *__pyx_v_protocol) {
+  void *__pyx_v_tmp;
+  PyObject *__pyx_v_meth = NULL;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  int __pyx_t_3;
+  int __pyx_t_4;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("hasProtocolAdapt", 0);
+
+  /* "protocols/_speedups.pyx":441
+ *     cdef void *tmp
+ * 
+ *     tmp = PyObject_GetAttr(getClass(protocol), __adapt)             # <<<<<<<<<<<<<<
+ *     if not tmp:
+ *         PyErr_Clear()
+ */
+  __pyx_t_1 = __pyx_f_9protocols_9_speedups_getClass(__pyx_v_protocol); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 441, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __pyx_v_9protocols_9_speedups___adapt;
+  __Pyx_INCREF(__pyx_t_2);
+  __pyx_v_tmp = PyObject_GetAttr(__pyx_t_1, __pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "protocols/_speedups.pyx":442
+ * 
+ *     tmp = PyObject_GetAttr(getClass(protocol), __adapt)
+ *     if not tmp:             # <<<<<<<<<<<<<<
+ *         PyErr_Clear()
+ *         return 0
+ */
+  __pyx_t_3 = ((!(__pyx_v_tmp != 0)) != 0);
+  if (__pyx_t_3) {
+
+    /* "protocols/_speedups.pyx":443
+ *     tmp = PyObject_GetAttr(getClass(protocol), __adapt)
+ *     if not tmp:
+ *         PyErr_Clear()             # <<<<<<<<<<<<<<
+ *         return 0
+ * 
+ */
+    PyErr_Clear();
+
+    /* "protocols/_speedups.pyx":444
+ *     if not tmp:
+ *         PyErr_Clear()
+ *         return 0             # <<<<<<<<<<<<<<
+ * 
+ *     meth = <object> tmp
+ */
+    __pyx_r = 0;
+    goto __pyx_L0;
+
+    /* "protocols/_speedups.pyx":442
+ * 
+ *     tmp = PyObject_GetAttr(getClass(protocol), __adapt)
+ *     if not tmp:             # <<<<<<<<<<<<<<
+ *         PyErr_Clear()
+ *         return 0
+ */
+  }
+
+  /* "protocols/_speedups.pyx":446
+ *         return 0
+ * 
+ *     meth = <object> tmp             # <<<<<<<<<<<<<<
+ *     Py_DECREF(<PyObject *>tmp)
+ * 
+ */
+  __pyx_t_2 = ((PyObject *)__pyx_v_tmp);
+  __Pyx_INCREF(__pyx_t_2);
+  __pyx_v_meth = __pyx_t_2;
+  __pyx_t_2 = 0;
+
+  /* "protocols/_speedups.pyx":447
+ * 
+ *     meth = <object> tmp
+ *     Py_DECREF(<PyObject *>tmp)             # <<<<<<<<<<<<<<
+ * 
+ *     if isinstance(meth, metamethod):
+ */
+  Py_DECREF(((PyObject *)__pyx_v_tmp));
+
+  /* "protocols/_speedups.pyx":449
+ *     Py_DECREF(<PyObject *>tmp)
+ * 
+ *     if isinstance(meth, metamethod):             # <<<<<<<<<<<<<<
+ *         if (<metamethod> meth).func is Protocol__adapt__:
+ *             return 1
+ */
+  __pyx_t_3 = __Pyx_TypeCheck(__pyx_v_meth, __pyx_ptype_9protocols_9_speedups_metamethod); 
+  __pyx_t_4 = (__pyx_t_3 != 0);
+  if (__pyx_t_4) {
+
+    /* "protocols/_speedups.pyx":450
+ * 
+ *     if isinstance(meth, metamethod):
+ *         if (<metamethod> meth).func is Protocol__adapt__:             # <<<<<<<<<<<<<<
+ *             return 1
+ * 
+ */
+    __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_Protocol__adapt); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 450, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_4 = (((struct __pyx_obj_9protocols_9_speedups_metamethod *)__pyx_v_meth)->func == __pyx_t_2);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __pyx_t_3 = (__pyx_t_4 != 0);
+    if (__pyx_t_3) {
+
+      /* "protocols/_speedups.pyx":451
+ *     if isinstance(meth, metamethod):
+ *         if (<metamethod> meth).func is Protocol__adapt__:
+ *             return 1             # <<<<<<<<<<<<<<
+ * 
+ *     return 0
+ */
+      __pyx_r = 1;
+      goto __pyx_L0;
+
+      /* "protocols/_speedups.pyx":450
+ * 
+ *     if isinstance(meth, metamethod):
+ *         if (<metamethod> meth).func is Protocol__adapt__:             # <<<<<<<<<<<<<<
+ *             return 1
+ * 
+ */
+    }
+
+    /* "protocols/_speedups.pyx":449
+ *     Py_DECREF(<PyObject *>tmp)
+ * 
+ *     if isinstance(meth, metamethod):             # <<<<<<<<<<<<<<
+ *         if (<metamethod> meth).func is Protocol__adapt__:
+ *             return 1
+ */
+  }
+
+  /* "protocols/_speedups.pyx":453
+ *             return 1
+ * 
+ *     return 0             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_r = 0;
+  goto __pyx_L0;
+
+  /* "protocols/_speedups.pyx":433
+ * 
+ * 
+ * cdef int hasProtocolAdapt(protocol) except -1:             # <<<<<<<<<<<<<<
+ * 
+ *     # Is 'protocol' using the standard 'Protocol.__adapt__'?  If so, we can
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_AddTraceback("protocols._speedups.hasProtocolAdapt", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_meth);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "protocols/_speedups.pyx":456
+ * 
+ * 
+ * cdef object _adapt(obj, protocol, default):             # <<<<<<<<<<<<<<
+ * 
+ *     if isInstanceOf(obj, protocol):
+ */
+
+static PyObject *__pyx_f_9protocols_9_speedups__adapt(PyObject *__pyx_v_obj, PyObject *__pyx_v_protocol, PyObject *__pyx_v_default) {
+  PyObject *__pyx_v_meth = NULL;
+  PyObject *__pyx_v_result = NULL;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  int __pyx_t_3;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  int __pyx_t_6;
+  PyObject *__pyx_t_7 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("_adapt", 0);
+
+  /* "protocols/_speedups.pyx":458
+ * cdef object _adapt(obj, protocol, default):
+ * 
+ *     if isInstanceOf(obj, protocol):             # <<<<<<<<<<<<<<
+ *         return obj
+ * 
+ */
+  __pyx_t_1 = (__pyx_f_9protocols_9_speedups_isInstanceOf(__pyx_v_obj, __pyx_v_protocol) != 0);
+  if (__pyx_t_1) {
+
+    /* "protocols/_speedups.pyx":459
+ * 
+ *     if isInstanceOf(obj, protocol):
+ *         return obj             # <<<<<<<<<<<<<<
+ * 
+ *     meth = getConform(obj)
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_INCREF(__pyx_v_obj);
+    __pyx_r = __pyx_v_obj;
+    goto __pyx_L0;
+
+    /* "protocols/_speedups.pyx":458
+ * cdef object _adapt(obj, protocol, default):
+ * 
+ *     if isInstanceOf(obj, protocol):             # <<<<<<<<<<<<<<
+ *         return obj
+ * 
+ */
+  }
+
+  /* "protocols/_speedups.pyx":461
+ *         return obj
+ * 
+ *     meth = getConform(obj)             # <<<<<<<<<<<<<<
+ *     if meth is not None:
+ *         result = callConform(meth, protocol)
+ */
+  __pyx_t_2 = __pyx_f_9protocols_9_speedups_getConform(__pyx_v_obj); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 461, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_v_meth = __pyx_t_2;
+  __pyx_t_2 = 0;
+
+  /* "protocols/_speedups.pyx":462
+ * 
+ *     meth = getConform(obj)
+ *     if meth is not None:             # <<<<<<<<<<<<<<
+ *         result = callConform(meth, protocol)
+ *         if result is not None:
+ */
+  __pyx_t_1 = (__pyx_v_meth != Py_None);
+  __pyx_t_3 = (__pyx_t_1 != 0);
+  if (__pyx_t_3) {
+
+    /* "protocols/_speedups.pyx":463
+ *     meth = getConform(obj)
+ *     if meth is not None:
+ *         result = callConform(meth, protocol)             # <<<<<<<<<<<<<<
+ *         if result is not None:
+ *             return result
+ */
+    __pyx_t_2 = __pyx_f_9protocols_9_speedups_callConform(__pyx_v_meth, __pyx_v_protocol); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 463, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_v_result = __pyx_t_2;
+    __pyx_t_2 = 0;
+
+    /* "protocols/_speedups.pyx":464
+ *     if meth is not None:
+ *         result = callConform(meth, protocol)
+ *         if result is not None:             # <<<<<<<<<<<<<<
+ *             return result
+ * 
+ */
+    __pyx_t_3 = (__pyx_v_result != Py_None);
+    __pyx_t_1 = (__pyx_t_3 != 0);
+    if (__pyx_t_1) {
+
+      /* "protocols/_speedups.pyx":465
+ *         result = callConform(meth, protocol)
+ *         if result is not None:
+ *             return result             # <<<<<<<<<<<<<<
+ * 
+ *     result = callAdapt(obj, protocol)
+ */
+      __Pyx_XDECREF(__pyx_r);
+      __Pyx_INCREF(__pyx_v_result);
+      __pyx_r = __pyx_v_result;
+      goto __pyx_L0;
+
+      /* "protocols/_speedups.pyx":464
+ *     if meth is not None:
+ *         result = callConform(meth, protocol)
+ *         if result is not None:             # <<<<<<<<<<<<<<
+ *             return result
+ * 
+ */
+    }
+
+    /* "protocols/_speedups.pyx":462
+ * 
+ *     meth = getConform(obj)
+ *     if meth is not None:             # <<<<<<<<<<<<<<
+ *         result = callConform(meth, protocol)
+ *         if result is not None:
+ */
+  }
+
+  /* "protocols/_speedups.pyx":467
+ *             return result
+ * 
+ *     result = callAdapt(obj, protocol)             # <<<<<<<<<<<<<<
+ *     if result is not None:
+ *         return result
+ */
+  __pyx_t_2 = __pyx_f_9protocols_9_speedups_callAdapt(__pyx_v_obj, __pyx_v_protocol); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 467, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_XDECREF_SET(__pyx_v_result, __pyx_t_2);
+  __pyx_t_2 = 0;
+
+  /* "protocols/_speedups.pyx":468
+ * 
+ *     result = callAdapt(obj, protocol)
+ *     if result is not None:             # <<<<<<<<<<<<<<
+ *         return result
+ * 
+ */
+  __pyx_t_1 = (__pyx_v_result != Py_None);
+  __pyx_t_3 = (__pyx_t_1 != 0);
+  if (__pyx_t_3) {
+
+    /* "protocols/_speedups.pyx":469
+ *     result = callAdapt(obj, protocol)
+ *     if result is not None:
+ *         return result             # <<<<<<<<<<<<<<
+ * 
+ *     if default is _marker:
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_INCREF(__pyx_v_result);
+    __pyx_r = __pyx_v_result;
+    goto __pyx_L0;
+
+    /* "protocols/_speedups.pyx":468
+ * 
+ *     result = callAdapt(obj, protocol)
+ *     if result is not None:             # <<<<<<<<<<<<<<
+ *         return result
+ * 
+ */
+  }
+
+  /* "protocols/_speedups.pyx":471
+ *         return result
+ * 
+ *     if default is _marker:             # <<<<<<<<<<<<<<
+ *         raise AdaptationFailure("Can't adapt", obj, protocol)
+ * 
+ */
+  __pyx_t_3 = (__pyx_v_default == __pyx_v_9protocols_9_speedups__marker);
+  __pyx_t_1 = (__pyx_t_3 != 0);
+  if (unlikely(__pyx_t_1)) {
+
+    /* "protocols/_speedups.pyx":472
+ * 
+ *     if default is _marker:
+ *         raise AdaptationFailure("Can't adapt", obj, protocol)             # <<<<<<<<<<<<<<
+ * 
+ *     return default
+ */
+    __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_AdaptationFailure); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 472, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_5 = NULL;
+    __pyx_t_6 = 0;
+    if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_4))) {
+      __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_4);
+      if (likely(__pyx_t_5)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+        __Pyx_INCREF(__pyx_t_5);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_4, function);
+        __pyx_t_6 = 1;
+      }
+    }
+    #if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(__pyx_t_4)) {
+      PyObject *__pyx_temp[4] = {__pyx_t_5, __pyx_kp_s_Can_t_adapt, __pyx_v_obj, __pyx_v_protocol};
+      __pyx_t_2 = __Pyx_PyFunction_FastCall(__pyx_t_4, __pyx_temp+1-__pyx_t_6, 3+__pyx_t_6); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 472, __pyx_L1_error)
+      __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+      __Pyx_GOTREF(__pyx_t_2);
+    } else
+    #endif
+    #if CYTHON_FAST_PYCCALL
+    if (__Pyx_PyFastCFunction_Check(__pyx_t_4)) {
+      PyObject *__pyx_temp[4] = {__pyx_t_5, __pyx_kp_s_Can_t_adapt, __pyx_v_obj, __pyx_v_protocol};
+      __pyx_t_2 = __Pyx_PyCFunction_FastCall(__pyx_t_4, __pyx_temp+1-__pyx_t_6, 3+__pyx_t_6); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 472, __pyx_L1_error)
+      __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+      __Pyx_GOTREF(__pyx_t_2);
+    } else
+    #endif
+    {
+      __pyx_t_7 = PyTuple_New(3+__pyx_t_6); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 472, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_7);
+      if (__pyx_t_5) {
+        __Pyx_GIVEREF(__pyx_t_5); PyTuple_SET_ITEM(__pyx_t_7, 0, __pyx_t_5); __pyx_t_5 = NULL;
+      }
+      __Pyx_INCREF(__pyx_kp_s_Can_t_adapt);
+      __Pyx_GIVEREF(__pyx_kp_s_Can_t_adapt);
+      PyTuple_SET_ITEM(__pyx_t_7, 0+__pyx_t_6, __pyx_kp_s_Can_t_adapt);
+      __Pyx_INCREF(__pyx_v_obj);
+      __Pyx_GIVEREF(__pyx_v_obj);
+      PyTuple_SET_ITEM(__pyx_t_7, 1+__pyx_t_6, __pyx_v_obj);
+      __Pyx_INCREF(__pyx_v_protocol);
+      __Pyx_GIVEREF(__pyx_v_protocol);
+      PyTuple_SET_ITEM(__pyx_t_7, 2+__pyx_t_6, __pyx_v_protocol);
+      __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_4, __pyx_t_7, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 472, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_2);
+      __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+    }
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_Raise(__pyx_t_2, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __PYX_ERR(0, 472, __pyx_L1_error)
+
+    /* "protocols/_speedups.pyx":471
+ *         return result
+ * 
+ *     if default is _marker:             # <<<<<<<<<<<<<<
+ *         raise AdaptationFailure("Can't adapt", obj, protocol)
+ * 
+ */
+  }
+
+  /* "protocols/_speedups.pyx":474
+ *         raise AdaptationFailure("Can't adapt", obj, protocol)
+ * 
+ *     return default             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v_default);
+  __pyx_r = __pyx_v_default;
+  goto __pyx_L0;
+
+  /* "protocols/_speedups.pyx":456
+ * 
+ * 
+ * cdef object _adapt(obj, protocol, default):             # <<<<<<<<<<<<<<
+ * 
+ *     if isInstanceOf(obj, protocol):
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_AddTraceback("protocols._speedups._adapt", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_meth);
+  __Pyx_XDECREF(__pyx_v_result);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "protocols/_speedups.pyx":477
+ * 
+ * 
+ * cdef object _adaptEach(obj, protocols, default, int first):             # <<<<<<<<<<<<<<
+ * 
+ *     # Adapt 'obj' to each of 'protocols', fetching its __conform__ and class
+ */
+
+static PyObject *__pyx_f_9protocols_9_speedups__adaptEach(PyObject *__pyx_v_obj, PyObject *__pyx_v_protocols, PyObject *__pyx_v_default, int __pyx_v_first) {
+  PyObject *__pyx_v_conform = NULL;
+  PyObject *__pyx_v_cls = NULL;
+  PyObject *__pyx_v_out = NULL;
+  PyObject *__pyx_v_protocol = NULL;
+  PyObject *__pyx_v_result = NULL;
+  PyObject *__pyx_v_factory = NULL;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  Py_ssize_t __pyx_t_2;
+  PyObject *(*__pyx_t_3)(PyObject *);
+  PyObject *__pyx_t_4 = NULL;
+  int __pyx_t_5;
+  int __pyx_t_6;
+  int __pyx_t_7;
+  PyObject *__pyx_t_8 = NULL;
+  PyObject *__pyx_t_9 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("_adaptEach", 0);
+
+  /* "protocols/_speedups.pyx":483
+ *     # 'default'), otherwise return a list of all the results.
+ * 
+ *     conform = getConform(obj)             # <<<<<<<<<<<<<<
+ *     cls = None
+ *     out = []
+ */
+  __pyx_t_1 = __pyx_f_9protocols_9_speedups_getConform(__pyx_v_obj); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 483, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_v_conform = __pyx_t_1;
+  __pyx_t_1 = 0;
+
+  /* "protocols/_speedups.pyx":484
+ * 
+ *     conform = getConform(obj)
+ *     cls = None             # <<<<<<<<<<<<<<
+ *     out = []
+ * 
+ */
+  __Pyx_INCREF(Py_None);
+  __pyx_v_cls = Py_None;
+
+  /* "protocols/_speedups.pyx":485
+ *     conform = getConform(obj)
+ *     cls = None
+ *     out = []             # <<<<<<<<<<<<<<
+ * 
+ *     for protocol in protocols:
+ */
+  __pyx_t_1 = PyList_New(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 485, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_v_out = ((PyObject*)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "protocols/_speedups.pyx":487
+ *     out = []
+ * 
+ *     for protocol in protocols:             # <<<<<<<<<<<<<<
+ * 
+ *         if isInstanceOf(obj, protocol):
+ */
+  if (likely(PyList_CheckExact(__pyx_v_protocols)) || PyTuple_CheckExact(__pyx_v_protocols)) {
+    __pyx_t_1 = __pyx_v_protocols; __Pyx_INCREF(__pyx_t_1); __pyx_t_2 = 0;
+    __pyx_t_3 = NULL;
+  } else {
+    __pyx_t_2 = -1; __pyx_t_1 = PyObject_GetIter(__pyx_v_protocols); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 487, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_3 = Py_TYPE(__pyx_t_1)->tp_iternext; if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 487, __pyx_L1_error)
+  }
+  for (;;) {
+    if (likely(!__pyx_t_3)) {
+      if (likely(PyList_CheckExact(__pyx_t_1))) {
+        if (__pyx_t_2 >= PyList_GET_SIZE(__pyx_t_1)) break;
+        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+        __pyx_t_4 = PyList_GET_ITEM(__pyx_t_1, __pyx_t_2); __Pyx_INCREF(__pyx_t_4); __pyx_t_2++; if (unlikely(0 < 0)) __PYX_ERR(0, 487, __pyx_L1_error)
+        #else
+        __pyx_t_4 = PySequence_ITEM(__pyx_t_1, __pyx_t_2); __pyx_t_2++; if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 487, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_4);
+        #endif
+      } else {
+        if (__pyx_t_2 >= PyTuple_GET_SIZE(__pyx_t_1)) break;
+        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+        __pyx_t_4 = PyTuple_GET_ITEM(__pyx_t_1, __pyx_t_2); __Pyx_INCREF(__pyx_t_4); __pyx_t_2++; if (unlikely(0 < 0)) __PYX_ERR(0, 487, __pyx_L1_error)
+        #else
+        __pyx_t_4 = PySequence_ITEM(__pyx_t_1, __pyx_t_2); __pyx_t_2++; if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 487, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_4);
+        #endif
+      }
+    } else {
+      __pyx_t_4 = __pyx_t_3(__pyx_t_1);
+      if (unlikely(!__pyx_t_4)) {
+        PyObject* exc_type = PyErr_Occurred();
+        if (exc_type) {
+          if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
+          else __PYX_ERR(0, 487, __pyx_L1_error)
+        }
+        break;
+      }
+      __Pyx_GOTREF(__pyx_t_4);
+    }
+    __Pyx_XDECREF_SET(__pyx_v_protocol, __pyx_t_4);
+    __pyx_t_4 = 0;
+
+    /* "protocols/_speedups.pyx":489
+ *     for protocol in protocols:
+ * 
+ *         if isInstanceOf(obj, protocol):             # <<<<<<<<<<<<<<
+ *             result = obj
+ *         else:
+ */
+    __pyx_t_5 = (__pyx_f_9protocols_9_speedups_isInstanceOf(__pyx_v_obj, __pyx_v_protocol) != 0);
+    if (__pyx_t_5) {
+
+      /* "protocols/_speedups.pyx":490
+ * 
+ *         if isInstanceOf(obj, protocol):
+ *             result = obj             # <<<<<<<<<<<<<<
+ *         else:
+ *             result = None
+ */
+      __Pyx_INCREF(__pyx_v_obj);
+      __Pyx_XDECREF_SET(__pyx_v_result, __pyx_v_obj);
+
+      /* "protocols/_speedups.pyx":489
+ *     for protocol in protocols:
+ * 
+ *         if isInstanceOf(obj, protocol):             # <<<<<<<<<<<<<<
+ *             result = obj
+ *         else:
+ */
+      goto __pyx_L5;
+    }
+
+    /* "protocols/_speedups.pyx":492
+ *             result = obj
+ *         else:
+ *             result = None             # <<<<<<<<<<<<<<
+ * 
+ *         if result is None:
+ */
+    /*else*/ {
+      __Pyx_INCREF(Py_None);
+      __Pyx_XDECREF_SET(__pyx_v_result, Py_None);
+    }
+    __pyx_L5:;
+
+    /* "protocols/_speedups.pyx":494
+ *             result = None
+ * 
+ *         if result is None:             # <<<<<<<<<<<<<<
+ *             if conform is not None:
+ *                 result = callConform(conform, protocol)
+ */
+    __pyx_t_5 = (__pyx_v_result == Py_None);
+    __pyx_t_6 = (__pyx_t_5 != 0);
+    if (__pyx_t_6) {
+
+      /* "protocols/_speedups.pyx":495
+ * 
+ *         if result is None:
+ *             if conform is not None:             # <<<<<<<<<<<<<<
+ *                 result = callConform(conform, protocol)
+ * 
+ */
+      __pyx_t_6 = (__pyx_v_conform != Py_None);
+      __pyx_t_5 = (__pyx_t_6 != 0);
+      if (__pyx_t_5) {
+
+        /* "protocols/_speedups.pyx":496
+ *         if result is None:
+ *             if conform is not None:
+ *                 result = callConform(conform, protocol)             # <<<<<<<<<<<<<<
+ * 
+ *         if result is None:
+ */
+        __pyx_t_4 = __pyx_f_9protocols_9_speedups_callConform(__pyx_v_conform, __pyx_v_protocol); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 496, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_4);
+        __Pyx_DECREF_SET(__pyx_v_result, __pyx_t_4);
+        __pyx_t_4 = 0;
+
+        /* "protocols/_speedups.pyx":495
+ * 
+ *         if result is None:
+ *             if conform is not None:             # <<<<<<<<<<<<<<
+ *                 result = callConform(conform, protocol)
+ * 
+ */
+      }
+
+      /* "protocols/_speedups.pyx":494
+ *             result = None
+ * 
+ *         if result is None:             # <<<<<<<<<<<<<<
+ *             if conform is not None:
+ *                 result = callConform(conform, protocol)
+ */
+    }
+
+    /* "protocols/_speedups.pyx":498
+ *                 result = callConform(conform, protocol)
+ * 
+ *         if result is None:             # <<<<<<<<<<<<<<
+ *             if hasProtocolAdapt(protocol):
+ *                 if cls is None:
+ */
+    __pyx_t_5 = (__pyx_v_result == Py_None);
+    __pyx_t_6 = (__pyx_t_5 != 0);
+    if (__pyx_t_6) {
+
+      /* "protocols/_speedups.pyx":499
+ * 
+ *         if result is None:
+ *             if hasProtocolAdapt(protocol):             # <<<<<<<<<<<<<<
+ *                 if cls is None:
+ *                     cls = getClass(obj)
+ */
+      __pyx_t_7 = __pyx_f_9protocols_9_speedups_hasProtocolAdapt(__pyx_v_protocol); if (unlikely(__pyx_t_7 == ((int)-1))) __PYX_ERR(0, 499, __pyx_L1_error)
+      __pyx_t_6 = (__pyx_t_7 != 0);
+      if (__pyx_t_6) {
+
+        /* "protocols/_speedups.pyx":500
+ *         if result is None:
+ *             if hasProtocolAdapt(protocol):
+ *                 if cls is None:             # <<<<<<<<<<<<<<
+ *                     cls = getClass(obj)
+ *                 factory = lookupAdapter(protocol, cls)
+ */
+        __pyx_t_6 = (__pyx_v_cls == Py_None);
+        __pyx_t_5 = (__pyx_t_6 != 0);
+        if (__pyx_t_5) {
+
+          /* "protocols/_speedups.pyx":501
+ *             if hasProtocolAdapt(protocol):
+ *                 if cls is None:
+ *                     cls = getClass(obj)             # <<<<<<<<<<<<<<
+ *                 factory = lookupAdapter(protocol, cls)
+ *                 if factory is not None:
+ */
+          __pyx_t_4 = __pyx_f_9protocols_9_speedups_getClass(__pyx_v_obj); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 501, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_4);
+          __Pyx_DECREF_SET(__pyx_v_cls, __pyx_t_4);
+          __pyx_t_4 = 0;
+
+          /* "protocols/_speedups.pyx":500
+ *         if result is None:
+ *             if hasProtocolAdapt(protocol):
+ *                 if cls is None:             # <<<<<<<<<<<<<<
+ *                     cls = getClass(obj)
+ *                 factory = lookupAdapter(protocol, cls)
+ */
+        }
+
+        /* "protocols/_speedups.pyx":502
+ *                 if cls is None:
+ *                     cls = getClass(obj)
+ *                 factory = lookupAdapter(protocol, cls)             # <<<<<<<<<<<<<<
+ *                 if factory is not None:
+ *                     result = factory(obj)
+ */
+        __pyx_t_4 = __pyx_f_9protocols_9_speedups_lookupAdapter(__pyx_v_protocol, __pyx_v_cls); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 502, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_4);
+        __Pyx_XDECREF_SET(__pyx_v_factory, __pyx_t_4);
+        __pyx_t_4 = 0;
+
+        /* "protocols/_speedups.pyx":503
+ *                     cls = getClass(obj)
+ *                 factory = lookupAdapter(protocol, cls)
+ *                 if factory is not None:             # <<<<<<<<<<<<<<
+ *                     result = factory(obj)
+ *             else:
+ */
+        __pyx_t_5 = (__pyx_v_factory != Py_None);
+        __pyx_t_6 = (__pyx_t_5 != 0);
+        if (__pyx_t_6) {
+
+          /* "protocols/_speedups.pyx":504
+ *                 factory = lookupAdapter(protocol, cls)
+ *                 if factory is not None:
+ *                     result = factory(obj)             # <<<<<<<<<<<<<<
+ *             else:
+ *                 result = callAdapt(obj, protocol)
+ */
+          __Pyx_INCREF(__pyx_v_factory);
+          __pyx_t_8 = __pyx_v_factory; __pyx_t_9 = NULL;
+          if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_8))) {
+            __pyx_t_9 = PyMethod_GET_SELF(__pyx_t_8);
+            if (likely(__pyx_t_9)) {
+              PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_8);
+              __Pyx_INCREF(__pyx_t_9);
+              __Pyx_INCREF(function);
+              __Pyx_DECREF_SET(__pyx_t_8, function);
+            }
+          }
+          __pyx_t_4 = (__pyx_t_9) ? __Pyx_PyObject_Call2Args(__pyx_t_8, __pyx_t_9, __pyx_v_obj) : __Pyx_PyObject_CallOneArg(__pyx_t_8, __pyx_v_obj);
+          __Pyx_XDECREF(__pyx_t_9); __pyx_t_9 = 0;
+          if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 504, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_4);
+          __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+          __Pyx_DECREF_SET(__pyx_v_result, __pyx_t_4);
+          __pyx_t_4 = 0;
+
+          /* "protocols/_speedups.pyx":503
+ *                     cls = getClass(obj)
+ *                 factory = lookupAdapter(protocol, cls)
+ *                 if factory is not None:             # <<<<<<<<<<<<<<
+ *                     result = factory(obj)
+ *             else:
+ */
+        }
+
+        /* "protocols/_speedups.pyx":499
+ * 
+ *         if result is None:
+ *             if hasProtocolAdapt(protocol):             # <<<<<<<<<<<<<<
+ *                 if cls is None:
+ *                     cls = getClass(obj)
+ */
+        goto __pyx_L9;
+      }
+
+      /* "protocols/_speedups.pyx":506
+ *                     result = factory(obj)
+ *             else:
+ *                 result = callAdapt(obj, protocol)             # <<<<<<<<<<<<<<
+ * 
+ *         if result is None:
+ */
+      /*else*/ {
+        __pyx_t_4 = __pyx_f_9protocols_9_speedups_callAdapt(__pyx_v_obj, __pyx_v_protocol); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 506, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_4);
+        __Pyx_DECREF_SET(__pyx_v_result, __pyx_t_4);
+        __pyx_t_4 = 0;
+      }
+      __pyx_L9:;
+
+      /* "protocols/_speedups.pyx":498
+ *                 result = callConform(conform, protocol)
+ * 
+ *         if result is None:             # <<<<<<<<<<<<<<
+ *             if hasProtocolAdapt(protocol):
+ *                 if cls is None:
+ */
+    }
+
+    /* "protocols/_speedups.pyx":508
+ *                 result = callAdapt(obj, protocol)
+ * 
+ *         if result is None:             # <<<<<<<<<<<<<<
+ *             result = default
+ *         elif first:
+ */
+    __pyx_t_6 = (__pyx_v_result == Py_None);
+    __pyx_t_5 = (__pyx_t_6 != 0);
+    if (__pyx_t_5) {
+
+      /* "protocols/_speedups.pyx":509
+ * 
+ *         if result is None:
+ *             result = default             # <<<<<<<<<<<<<<
+ *         elif first:
+ *             return result
+ */
+      __Pyx_INCREF(__pyx_v_default);
+      __Pyx_DECREF_SET(__pyx_v_result, __pyx_v_default);
+
+      /* "protocols/_speedups.pyx":508
+ *                 result = callAdapt(obj, protocol)
+ * 
+ *         if result is None:             # <<<<<<<<<<<<<<
+ *             result = default
+ *         elif first:
+ */
+      goto __pyx_L12;
+    }
+
+    /* "protocols/_speedups.pyx":510
+ *         if result is None:
+ *             result = default
+ *         elif first:             # <<<<<<<<<<<<<<
+ *             return result
+ * 
+ */
+    __pyx_t_5 = (__pyx_v_first != 0);
+    if (__pyx_t_5) {
+
+      /* "protocols/_speedups.pyx":511
+ *             result = default
+ *         elif first:
+ *             return result             # <<<<<<<<<<<<<<
+ * 
+ *         PyList_Append(<PyListObject *>out, result)
+ */
+      __Pyx_XDECREF(__pyx_r);
+      __Pyx_INCREF(__pyx_v_result);
+      __pyx_r = __pyx_v_result;
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      goto __pyx_L0;
+
+      /* "protocols/_speedups.pyx":510
+ *         if result is None:
+ *             result = default
+ *         elif first:             # <<<<<<<<<<<<<<
+ *             return result
+ * 
+ */
+    }
+    __pyx_L12:;
+
+    /* "protocols/_speedups.pyx":513
+ *             return result
+ * 
+ *         PyList_Append(<PyListObject *>out, result)             # <<<<<<<<<<<<<<
+ * 
+ *     if first:
+ */
+    __pyx_t_7 = PyList_Append(((PyListObject *)__pyx_v_out), __pyx_v_result); if (unlikely(__pyx_t_7 == ((int)-1))) __PYX_ERR(0, 513, __pyx_L1_error)
+
+    /* "protocols/_speedups.pyx":487
+ *     out = []
+ * 
+ *     for protocol in protocols:             # <<<<<<<<<<<<<<
+ * 
+ *         if isInstanceOf(obj, protocol):
+ */
+  }
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "protocols/_speedups.pyx":515
+ *         PyList_Append(<PyListObject *>out, result)
+ * 
+ *     if first:             # <<<<<<<<<<<<<<
+ *         if default is _marker:
+ *             raise AdaptationFailure("Can't adapt", obj, protocols)
+ */
+  __pyx_t_5 = (__pyx_v_first != 0);
+  if (__pyx_t_5) {
+
+    /* "protocols/_speedups.pyx":516
+ * 
+ *     if first:
+ *         if default is _marker:             # <<<<<<<<<<<<<<
+ *             raise AdaptationFailure("Can't adapt", obj, protocols)
+ *         return default
+ */
+    __pyx_t_5 = (__pyx_v_default == __pyx_v_9protocols_9_speedups__marker);
+    __pyx_t_6 = (__pyx_t_5 != 0);
+    if (unlikely(__pyx_t_6)) {
+
+      /* "protocols/_speedups.pyx":517
+ *     if first:
+ *         if default is _marker:
+ *             raise AdaptationFailure("Can't adapt", obj, protocols)             # <<<<<<<<<<<<<<
+ *         return default
+ * 
+ */
+      __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_AdaptationFailure); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 517, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      __pyx_t_8 = NULL;
+      __pyx_t_7 = 0;
+      if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_4))) {
+        __pyx_t_8 = PyMethod_GET_SELF(__pyx_t_4);
+        if (likely(__pyx_t_8)) {
+          PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+          __Pyx_INCREF(__pyx_t_8);
+          __Pyx_INCREF(function);
+          __Pyx_DECREF_SET(__pyx_t_4, function);
+          __pyx_t_7 = 1;
+        }
+      }
+      #if CYTHON_FAST_PYCALL
+      if (PyFunction_Check(__pyx_t_4)) {
+        PyObject *__pyx_temp[4] = {__pyx_t_8, __pyx_kp_s_Can_t_adapt, __pyx_v_obj, __pyx_v_protocols};
+        __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_4, __pyx_temp+1-__pyx_t_7, 3+__pyx_t_7); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 517, __pyx_L1_error)
+        __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
+        __Pyx_GOTREF(__pyx_t_1);
+      } else
+      #endif
+      #if CYTHON_FAST_PYCCALL
+      if (__Pyx_PyFastCFunction_Check(__pyx_t_4)) {
+        PyObject *__pyx_temp[4] = {__pyx_t_8, __pyx_kp_s_Can_t_adapt, __pyx_v_obj, __pyx_v_protocols};
+        __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_4, __pyx_temp+1-__pyx_t_7, 3+__pyx_t_7); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 517, __pyx_L1_error)
+        __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
+        __Pyx_GOTREF(__pyx_t_1);
+      } else
+      #endif
+      {
+        __pyx_t_9 = PyTuple_New(3+__pyx_t_7); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 517, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_9);
+        if (__pyx_t_8) {
+          __Pyx_GIVEREF(__pyx_t_8); PyTuple_SET_ITEM(__pyx_t_9, 0, __pyx_t_8); __pyx_t_8 = NULL;
+        }
+        __Pyx_INCREF(__pyx_kp_s_Can_t_adapt);
+        __Pyx_GIVEREF(__pyx_kp_s_Can_t_adapt);
+        PyTuple_SET_ITEM(__pyx_t_9, 0+__pyx_t_7, __pyx_kp_s_Can_t_adapt);
+        __Pyx_INCREF(__pyx_v_obj);
+        __Pyx_GIVEREF(__pyx_v_obj);
+        PyTuple_SET_ITEM(__pyx_t_9, 1+__pyx_t_7, __pyx_v_obj);
+        __Pyx_INCREF(__pyx_v_protocols);
+        __Pyx_GIVEREF(__pyx_v_protocols);
+        PyTuple_SET_ITEM(__pyx_t_9, 2+__pyx_t_7, __pyx_v_protocols);
+        __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_4, __pyx_t_9, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 517, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_1);
+        __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+      }
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      __Pyx_Raise(__pyx_t_1, 0, 0, 0);
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      __PYX_ERR(0, 517, __pyx_L1_error)
+
+      /* "protocols/_speedups.pyx":516
+ * 
+ *     if first:
+ *         if default is _marker:             # <<<<<<<<<<<<<<
+ *             raise AdaptationFailure("Can't adapt", obj, protocols)
+ *         return default
+ */
+    }
+
+    /* "protocols/_speedups.pyx":518
+ *         if default is _marker:
+ *             raise AdaptationFailure("Can't adapt", obj, protocols)
+ *         return default             # <<<<<<<<<<<<<<
+ * 
+ *     return out
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_INCREF(__pyx_v_default);
+    __pyx_r = __pyx_v_default;
+    goto __pyx_L0;
+
+    /* "protocols/_speedups.pyx":515
+ *         PyList_Append(<PyListObject *>out, result)
+ * 
+ *     if first:             # <<<<<<<<<<<<<<
+ *         if default is _marker:
+ *             raise AdaptationFailure("Can't adapt", obj, protocols)
+ */
+  }
+
+  /* "protocols/_speedups.pyx":520
+ *         return default
+ * 
+ *     return out             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v_out);
+  __pyx_r = __pyx_v_out;
+  goto __pyx_L0;
+
+  /* "protocols/_speedups.pyx":477
+ * 
+ * 
+ * cdef object _adaptEach(obj, protocols, default, int first):             # <<<<<<<<<<<<<<
+ * 
+ *     # Adapt 'obj' to each of 'protocols', fetching its __conform__ and class
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_8);
+  __Pyx_XDECREF(__pyx_t_9);
+  __Pyx_AddTraceback("protocols._speedups._adaptEach", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_conform);
+  __Pyx_XDECREF(__pyx_v_cls);
+  __Pyx_XDECREF(__pyx_v_out);
+  __Pyx_XDECREF(__pyx_v_protocol);
+  __Pyx_XDECREF(__pyx_v_result);
+  __Pyx_XDECREF(__pyx_v_factory);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "protocols/_speedups.pyx":523
+ * 
+ * 
+ * def adapt(obj, protocol, default=_marker):             # <<<<<<<<<<<<<<
+ *     """PEP 246-alike: Adapt 'obj' to 'protocol', return 'default'
+ * 
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_9protocols_9_speedups_9adapt(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_9protocols_9_speedups_8adapt[] = "PEP 246-alike: Adapt 'obj' to 'protocol', return 'default'\n\n    If 'default' is not supplied and no implementation is found,\n    raise 'AdaptationFailure'.";
+static PyMethodDef __pyx_mdef_9protocols_9_speedups_9adapt = {"adapt", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_9protocols_9_speedups_9adapt, METH_VARARGS|METH_KEYWORDS, __pyx_doc_9protocols_9_speedups_8adapt};
+static PyObject *__pyx_pw_9protocols_9_speedups_9adapt(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_obj = 0;
+  PyObject *__pyx_v_protocol = 0;
+  PyObject *__pyx_v_default = 0;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("adapt (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_obj,&__pyx_n_s_protocol,&__pyx_n_s_default,0};
+    PyObject* values[3] = {0,0,0};
+    values[2] = __pyx_k__2;
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_obj)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_protocol)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("adapt", 0, 2, 3, 1); __PYX_ERR(0, 523, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  2:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_default);
+          if (value) { values[2] = value; kw_args--; }
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "adapt") < 0)) __PYX_ERR(0, 523, __pyx_L3_error)
+      }
+    } else {
+      switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+    }
+    __pyx_v_obj = values[0];
+    __pyx_v_protocol = values[1];
+    __pyx_v_default = values[2];
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("adapt", 0, 2, 3, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 523, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("protocols._speedups.adapt", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_9protocols_9_speedups_8adapt(__pyx_self, __pyx_v_obj, __pyx_v_protocol, __pyx_v_default);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_9protocols_9_speedups_8adapt(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_obj, PyObject *__pyx_v_protocol, PyObject *__pyx_v_default) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("adapt", 0);
+
+  /* "protocols/_speedups.pyx":529
+ *     raise 'AdaptationFailure'."""
+ * 
+ *     return _adapt(obj,protocol,default)             # <<<<<<<<<<<<<<
+ * 
+ * def Protocol__call__(self, ob, default=_marker):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __pyx_f_9protocols_9_speedups__adapt(__pyx_v_obj, __pyx_v_protocol, __pyx_v_default); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 529, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "protocols/_speedups.pyx":523
+ * 
+ * 
+ * def adapt(obj, protocol, default=_marker):             # <<<<<<<<<<<<<<
+ *     """PEP 246-alike: Adapt 'obj' to 'protocol', return 'default'
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("protocols._speedups.adapt", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "protocols/_speedups.pyx":531
+ *     return _adapt(obj,protocol,default)
+ * 
+ * def Protocol__call__(self, ob, default=_marker):             # <<<<<<<<<<<<<<
+ *     """Adapt to this protocol"""
+ *     return _adapt(ob,self,default)
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_9protocols_9_speedups_11Protocol__call__(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_9protocols_9_speedups_10Protocol__call__[] = "Adapt to this protocol";
+static PyMethodDef __pyx_mdef_9protocols_9_speedups_11Protocol__call__ = {"Protocol__call__", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_9protocols_9_speedups_11Protocol__call__, METH_VARARGS|METH_KEYWORDS, __pyx_doc_9protocols_9_speedups_10Protocol__call__};
+static PyObject *__pyx_pw_9protocols_9_speedups_11Protocol__call__(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_self = 0;
+  PyObject *__pyx_v_ob = 0;
+  PyObject *__pyx_v_default = 0;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("Protocol__call__ (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_self,&__pyx_n_s_ob,&__pyx_n_s_default,0};
+    PyObject* values[3] = {0,0,0};
+    values[2] = __pyx_k__3;
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_self)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_ob)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("Protocol__call__", 0, 2, 3, 1); __PYX_ERR(0, 531, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  2:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_default);
+          if (value) { values[2] = value; kw_args--; }
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "Protocol__call__") < 0)) __PYX_ERR(0, 531, __pyx_L3_error)
+      }
+    } else {
+      switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+    }
+    __pyx_v_self = values[0];
+    __pyx_v_ob = values[1];
+    __pyx_v_default = values[2];
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("Protocol__call__", 0, 2, 3, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 531, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("protocols._speedups.Protocol__call__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_9protocols_9_speedups_10Protocol__call__(__pyx_self, __pyx_v_self, __pyx_v_ob, __pyx_v_default);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_9protocols_9_speedups_10Protocol__call__(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self, PyObject *__pyx_v_ob, PyObject *__pyx_v_default) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("Protocol__call__", 0);
+
+  /* "protocols/_speedups.pyx":533
+ * def Protocol__call__(self, ob, default=_marker):
+ *     """Adapt to this protocol"""
+ *     return _adapt(ob,self,default)             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __pyx_f_9protocols_9_speedups__adapt(__pyx_v_ob, __pyx_v_self, __pyx_v_default); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 533, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "protocols/_speedups.pyx":531
+ *     return _adapt(obj,protocol,default)
+ * 
+ * def Protocol__call__(self, ob, default=_marker):             # <<<<<<<<<<<<<<
+ *     """Adapt to this protocol"""
+ *     return _adapt(ob,self,default)
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("protocols._speedups.Protocol__call__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "protocols/_speedups.pyx":536
+ * 
+ * 
+ * cdef object adaptMany(objects, protocol, default, int strict):             # <<<<<<<<<<<<<<
+ * 
+ *     # 'adapt_many()', or if 'strict' is true, 'ADAPT_SEQUENCE()': return
+ */
+
+static PyObject *__pyx_f_9protocols_9_speedups_adaptMany(PyObject *__pyx_v_objects, PyObject *__pyx_v_protocol, PyObject *__pyx_v_default, int __pyx_v_strict) {
+  void *__pyx_v_tmp;
+  int __pyx_v_i;
+  int __pyx_v_size;
+  int __pyx_v_generic;
+  PyObject *__pyx_v_out = NULL;
+  PyObject *__pyx_v_factories = NULL;
+  PyObject *__pyx_v_ob = NULL;
+  PyObject *__pyx_v_result = NULL;
+  PyObject *__pyx_v_meth = NULL;
+  PyObject *__pyx_v_cls = NULL;
+  PyObject *__pyx_v_factory = NULL;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  PyObject *__pyx_t_4 = NULL;
+  Py_ssize_t __pyx_t_5;
+  PyObject *(*__pyx_t_6)(PyObject *);
+  PyObject *__pyx_t_7 = NULL;
+  PyObject *__pyx_t_8 = NULL;
+  PyObject *__pyx_t_9 = NULL;
+  PyObject *__pyx_t_10 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("adaptMany", 0);
+
+  /* "protocols/_speedups.pyx":546
+ *     cdef int i, size, generic
+ * 
+ *     if PyList_CheckExact(objects) or PyTuple_CheckExact(objects):             # <<<<<<<<<<<<<<
+ *         size = len(objects)
+ *         out = PyList_New(size)
+ */
+  __pyx_t_2 = (PyList_CheckExact(__pyx_v_objects) != 0);
+  if (!__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_2 = (PyTuple_CheckExact(__pyx_v_objects) != 0);
+  __pyx_t_1 = __pyx_t_2;
+  __pyx_L4_bool_binop_done:;
+  if (__pyx_t_1) {
+
+    /* "protocols/_speedups.pyx":547
+ * 
+ *     if PyList_CheckExact(objects) or PyTuple_CheckExact(objects):
+ *         size = len(objects)             # <<<<<<<<<<<<<<
+ *         out = PyList_New(size)
+ *     else:
+ */
+    __pyx_t_3 = PyObject_Length(__pyx_v_objects); if (unlikely(__pyx_t_3 == ((int)-1))) __PYX_ERR(0, 547, __pyx_L1_error)
+    __pyx_v_size = __pyx_t_3;
+
+    /* "protocols/_speedups.pyx":548
+ *     if PyList_CheckExact(objects) or PyTuple_CheckExact(objects):
+ *         size = len(objects)
+ *         out = PyList_New(size)             # <<<<<<<<<<<<<<
+ *     else:
+ *         size = 0
+ */
+    __pyx_t_4 = PyList_New(__pyx_v_size); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 548, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_v_out = __pyx_t_4;
+    __pyx_t_4 = 0;
+
+    /* "protocols/_speedups.pyx":546
+ *     cdef int i, size, generic
+ * 
+ *     if PyList_CheckExact(objects) or PyTuple_CheckExact(objects):             # <<<<<<<<<<<<<<
+ *         size = len(objects)
+ *         out = PyList_New(size)
+ */
+    goto __pyx_L3;
+  }
+
+  /* "protocols/_speedups.pyx":550
+ *         out = PyList_New(size)
+ *     else:
+ *         size = 0             # <<<<<<<<<<<<<<
+ *         out = []
+ * 
+ */
+  /*else*/ {
+    __pyx_v_size = 0;
+
+    /* "protocols/_speedups.pyx":551
+ *     else:
+ *         size = 0
+ *         out = []             # <<<<<<<<<<<<<<
+ * 
+ *     i = 0
+ */
+    __pyx_t_4 = PyList_New(0); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 551, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_v_out = __pyx_t_4;
+    __pyx_t_4 = 0;
+  }
+  __pyx_L3:;
+
+  /* "protocols/_speedups.pyx":553
+ *         out = []
+ * 
+ *     i = 0             # <<<<<<<<<<<<<<
+ *     generic = not hasProtocolAdapt(protocol)
+ *     factories = {}
+ */
+  __pyx_v_i = 0;
+
+  /* "protocols/_speedups.pyx":554
+ * 
+ *     i = 0
+ *     generic = not hasProtocolAdapt(protocol)             # <<<<<<<<<<<<<<
+ *     factories = {}
+ * 
+ */
+  __pyx_t_3 = __pyx_f_9protocols_9_speedups_hasProtocolAdapt(__pyx_v_protocol); if (unlikely(__pyx_t_3 == ((int)-1))) __PYX_ERR(0, 554, __pyx_L1_error)
+  __pyx_v_generic = (!(__pyx_t_3 != 0));
+
+  /* "protocols/_speedups.pyx":555
+ *     i = 0
+ *     generic = not hasProtocolAdapt(protocol)
+ *     factories = {}             # <<<<<<<<<<<<<<
+ * 
+ *     for ob in objects:
+ */
+  __pyx_t_4 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 555, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_v_factories = ((PyObject*)__pyx_t_4);
+  __pyx_t_4 = 0;
+
+  /* "protocols/_speedups.pyx":557
+ *     factories = {}
+ * 
+ *     for ob in objects:             # <<<<<<<<<<<<<<
+ * 
+ *         if generic:
+ */
+  if (likely(PyList_CheckExact(__pyx_v_objects)) || PyTuple_CheckExact(__pyx_v_objects)) {
+    __pyx_t_4 = __pyx_v_objects; __Pyx_INCREF(__pyx_t_4); __pyx_t_5 = 0;
+    __pyx_t_6 = NULL;
+  } else {
+    __pyx_t_5 = -1; __pyx_t_4 = PyObject_GetIter(__pyx_v_objects); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 557, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_6 = Py_TYPE(__pyx_t_4)->tp_iternext; if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 557, __pyx_L1_error)
+  }
+  for (;;) {
+    if (likely(!__pyx_t_6)) {
+      if (likely(PyList_CheckExact(__pyx_t_4))) {
+        if (__pyx_t_5 >= PyList_GET_SIZE(__pyx_t_4)) break;
+        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+        __pyx_t_7 = PyList_GET_ITEM(__pyx_t_4, __pyx_t_5); __Pyx_INCREF(__pyx_t_7); __pyx_t_5++; if (unlikely(0 < 0)) __PYX_ERR(0, 557, __pyx_L1_error)
+        #else
+        __pyx_t_7 = PySequence_ITEM(__pyx_t_4, __pyx_t_5); __pyx_t_5++; if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 557, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_7);
+        #endif
+      } else {
+        if (__pyx_t_5 >= PyTuple_GET_SIZE(__pyx_t_4)) break;
+        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+        __pyx_t_7 = PyTuple_GET_ITEM(__pyx_t_4, __pyx_t_5); __Pyx_INCREF(__pyx_t_7); __pyx_t_5++; if (unlikely(0 < 0)) __PYX_ERR(0, 557, __pyx_L1_error)
+        #else
+        __pyx_t_7 = PySequence_ITEM(__pyx_t_4, __pyx_t_5); __pyx_t_5++; if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 557, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_7);
+        #endif
+      }
+    } else {
+      __pyx_t_7 = __pyx_t_6(__pyx_t_4);
+      if (unlikely(!__pyx_t_7)) {
+        PyObject* exc_type = PyErr_Occurred();
+        if (exc_type) {
+          if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
+          else __PYX_ERR(0, 557, __pyx_L1_error)
+        }
+        break;
+      }
+      __Pyx_GOTREF(__pyx_t_7);
+    }
+    __Pyx_XDECREF_SET(__pyx_v_ob, __pyx_t_7);
+    __pyx_t_7 = 0;
+
+    /* "protocols/_speedups.pyx":559
+ *     for ob in objects:
+ * 
+ *         if generic:             # <<<<<<<<<<<<<<
+ *             result = _adapt(ob, protocol, _failed)
+ * 
+ */
+    __pyx_t_1 = (__pyx_v_generic != 0);
+    if (__pyx_t_1) {
+
+      /* "protocols/_speedups.pyx":560
+ * 
+ *         if generic:
+ *             result = _adapt(ob, protocol, _failed)             # <<<<<<<<<<<<<<
+ * 
+ *         elif isInstanceOf(ob, protocol):
+ */
+      __pyx_t_7 = __pyx_v_9protocols_9_speedups__failed;
+      __Pyx_INCREF(__pyx_t_7);
+      __pyx_t_8 = __pyx_f_9protocols_9_speedups__adapt(__pyx_v_ob, __pyx_v_protocol, __pyx_t_7); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 560, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_8);
+      __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+      __Pyx_XDECREF_SET(__pyx_v_result, __pyx_t_8);
+      __pyx_t_8 = 0;
+
+      /* "protocols/_speedups.pyx":559
+ *     for ob in objects:
+ * 
+ *         if generic:             # <<<<<<<<<<<<<<
+ *             result = _adapt(ob, protocol, _failed)
+ * 
+ */
+      goto __pyx_L8;
+    }
+
+    /* "protocols/_speedups.pyx":562
+ *             result = _adapt(ob, protocol, _failed)
+ * 
+ *         elif isInstanceOf(ob, protocol):             # <<<<<<<<<<<<<<
+ *             result = ob
+ * 
+ */
+    __pyx_t_1 = (__pyx_f_9protocols_9_speedups_isInstanceOf(__pyx_v_ob, __pyx_v_protocol) != 0);
+    if (__pyx_t_1) {
+
+      /* "protocols/_speedups.pyx":563
+ * 
+ *         elif isInstanceOf(ob, protocol):
+ *             result = ob             # <<<<<<<<<<<<<<
+ * 
+ *         else:
+ */
+      __Pyx_INCREF(__pyx_v_ob);
+      __Pyx_XDECREF_SET(__pyx_v_result, __pyx_v_ob);
+
+      /* "protocols/_speedups.pyx":562
+ *             result = _adapt(ob, protocol, _failed)
+ * 
+ *         elif isInstanceOf(ob, protocol):             # <<<<<<<<<<<<<<
+ *             result = ob
+ * 
+ */
+      goto __pyx_L8;
+    }
+
+    /* "protocols/_speedups.pyx":566
+ * 
+ *         else:
+ *             meth = getConform(ob)             # <<<<<<<<<<<<<<
+ *             if meth is not None:
+ *                 result = callConform(meth, protocol)
+ */
+    /*else*/ {
+      __pyx_t_8 = __pyx_f_9protocols_9_speedups_getConform(__pyx_v_ob); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 566, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_8);
+      __Pyx_XDECREF_SET(__pyx_v_meth, __pyx_t_8);
+      __pyx_t_8 = 0;
+
+      /* "protocols/_speedups.pyx":567
+ *         else:
+ *             meth = getConform(ob)
+ *             if meth is not None:             # <<<<<<<<<<<<<<
+ *                 result = callConform(meth, protocol)
+ *             else:
+ */
+      __pyx_t_1 = (__pyx_v_meth != Py_None);
+      __pyx_t_2 = (__pyx_t_1 != 0);
+      if (__pyx_t_2) {
+
+        /* "protocols/_speedups.pyx":568
+ *             meth = getConform(ob)
+ *             if meth is not None:
+ *                 result = callConform(meth, protocol)             # <<<<<<<<<<<<<<
+ *             else:
+ *                 result = None
+ */
+        __pyx_t_8 = __pyx_f_9protocols_9_speedups_callConform(__pyx_v_meth, __pyx_v_protocol); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 568, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_8);
+        __Pyx_XDECREF_SET(__pyx_v_result, __pyx_t_8);
+        __pyx_t_8 = 0;
+
+        /* "protocols/_speedups.pyx":567
+ *         else:
+ *             meth = getConform(ob)
+ *             if meth is not None:             # <<<<<<<<<<<<<<
+ *                 result = callConform(meth, protocol)
+ *             else:
+ */
+        goto __pyx_L9;
+      }
+
+      /* "protocols/_speedups.pyx":570
+ *                 result = callConform(meth, protocol)
+ *             else:
+ *                 result = None             # <<<<<<<<<<<<<<
+ * 
+ *             if result is None:
+ */
+      /*else*/ {
+        __Pyx_INCREF(Py_None);
+        __Pyx_XDECREF_SET(__pyx_v_result, Py_None);
+      }
+      __pyx_L9:;
+
+      /* "protocols/_speedups.pyx":572
+ *                 result = None
+ * 
+ *             if result is None:             # <<<<<<<<<<<<<<
+ *                 cls = getClass(ob)
+ *                 tmp = PyDict_GetItem(factories, cls)
+ */
+      __pyx_t_2 = (__pyx_v_result == Py_None);
+      __pyx_t_1 = (__pyx_t_2 != 0);
+      if (__pyx_t_1) {
+
+        /* "protocols/_speedups.pyx":573
+ * 
+ *             if result is None:
+ *                 cls = getClass(ob)             # <<<<<<<<<<<<<<
+ *                 tmp = PyDict_GetItem(factories, cls)
+ *                 if tmp:
+ */
+        __pyx_t_8 = __pyx_f_9protocols_9_speedups_getClass(__pyx_v_ob); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 573, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_8);
+        __Pyx_XDECREF_SET(__pyx_v_cls, __pyx_t_8);
+        __pyx_t_8 = 0;
+
+        /* "protocols/_speedups.pyx":574
+ *             if result is None:
+ *                 cls = getClass(ob)
+ *                 tmp = PyDict_GetItem(factories, cls)             # <<<<<<<<<<<<<<
+ *                 if tmp:
+ *                     factory = <object> tmp
+ */
+        __pyx_v_tmp = PyDict_GetItem(__pyx_v_factories, __pyx_v_cls);
+
+        /* "protocols/_speedups.pyx":575
+ *                 cls = getClass(ob)
+ *                 tmp = PyDict_GetItem(factories, cls)
+ *                 if tmp:             # <<<<<<<<<<<<<<
+ *                     factory = <object> tmp
+ *                 else:
+ */
+        __pyx_t_1 = (__pyx_v_tmp != 0);
+        if (__pyx_t_1) {
+
+          /* "protocols/_speedups.pyx":576
+ *                 tmp = PyDict_GetItem(factories, cls)
+ *                 if tmp:
+ *                     factory = <object> tmp             # <<<<<<<<<<<<<<
+ *                 else:
+ *                     factory = lookupAdapter(protocol, cls)
+ */
+          __pyx_t_8 = ((PyObject *)__pyx_v_tmp);
+          __Pyx_INCREF(__pyx_t_8);
+          __Pyx_XDECREF_SET(__pyx_v_factory, __pyx_t_8);
+          __pyx_t_8 = 0;
+
+          /* "protocols/_speedups.pyx":575
+ *                 cls = getClass(ob)
+ *                 tmp = PyDict_GetItem(factories, cls)
+ *                 if tmp:             # <<<<<<<<<<<<<<
+ *                     factory = <object> tmp
+ *                 else:
+ */
+          goto __pyx_L11;
+        }
+
+        /* "protocols/_speedups.pyx":578
+ *                     factory = <object> tmp
+ *                 else:
+ *                     factory = lookupAdapter(protocol, cls)             # <<<<<<<<<<<<<<
+ *                     factories[cls] = factory
+ *                 if factory is not None:
+ */
+        /*else*/ {
+          __pyx_t_8 = __pyx_f_9protocols_9_speedups_lookupAdapter(__pyx_v_protocol, __pyx_v_cls); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 578, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_8);
+          __Pyx_XDECREF_SET(__pyx_v_factory, __pyx_t_8);
+          __pyx_t_8 = 0;
+
+          /* "protocols/_speedups.pyx":579
+ *                 else:
+ *                     factory = lookupAdapter(protocol, cls)
+ *                     factories[cls] = factory             # <<<<<<<<<<<<<<
+ *                 if factory is not None:
+ *                     result = factory(ob)
+ */
+          if (unlikely(PyDict_SetItem(__pyx_v_factories, __pyx_v_cls, __pyx_v_factory) < 0)) __PYX_ERR(0, 579, __pyx_L1_error)
+        }
+        __pyx_L11:;
+
+        /* "protocols/_speedups.pyx":580
+ *                     factory = lookupAdapter(protocol, cls)
+ *                     factories[cls] = factory
+ *                 if factory is not None:             # <<<<<<<<<<<<<<
+ *                     result = factory(ob)
+ * 
+ */
+        __pyx_t_1 = (__pyx_v_factory != Py_None);
+        __pyx_t_2 = (__pyx_t_1 != 0);
+        if (__pyx_t_2) {
+
+          /* "protocols/_speedups.pyx":581
+ *                     factories[cls] = factory
+ *                 if factory is not None:
+ *                     result = factory(ob)             # <<<<<<<<<<<<<<
+ * 
+ *             if result is None:
+ */
+          __Pyx_INCREF(__pyx_v_factory);
+          __pyx_t_7 = __pyx_v_factory; __pyx_t_9 = NULL;
+          if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_7))) {
+            __pyx_t_9 = PyMethod_GET_SELF(__pyx_t_7);
+            if (likely(__pyx_t_9)) {
+              PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_7);
+              __Pyx_INCREF(__pyx_t_9);
+              __Pyx_INCREF(function);
+              __Pyx_DECREF_SET(__pyx_t_7, function);
+            }
+          }
+          __pyx_t_8 = (__pyx_t_9) ? __Pyx_PyObject_Call2Args(__pyx_t_7, __pyx_t_9, __pyx_v_ob) : __Pyx_PyObject_CallOneArg(__pyx_t_7, __pyx_v_ob);
+          __Pyx_XDECREF(__pyx_t_9); __pyx_t_9 = 0;
+          if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 581, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_8);
+          __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+          __Pyx_DECREF_SET(__pyx_v_result, __pyx_t_8);
+          __pyx_t_8 = 0;
+
+          /* "protocols/_speedups.pyx":580
+ *                     factory = lookupAdapter(protocol, cls)
+ *                     factories[cls] = factory
+ *                 if factory is not None:             # <<<<<<<<<<<<<<
+ *                     result = factory(ob)
+ * 
+ */
+        }
+
+        /* "protocols/_speedups.pyx":572
+ *                 result = None
+ * 
+ *             if result is None:             # <<<<<<<<<<<<<<
+ *                 cls = getClass(ob)
+ *                 tmp = PyDict_GetItem(factories, cls)
+ */
+      }
+
+      /* "protocols/_speedups.pyx":583
+ *                     result = factory(ob)
+ * 
+ *             if result is None:             # <<<<<<<<<<<<<<
+ *                 result = _failed
+ * 
+ */
+      __pyx_t_2 = (__pyx_v_result == Py_None);
+      __pyx_t_1 = (__pyx_t_2 != 0);
+      if (__pyx_t_1) {
+
+        /* "protocols/_speedups.pyx":584
+ * 
+ *             if result is None:
+ *                 result = _failed             # <<<<<<<<<<<<<<
+ * 
+ *         if result is _failed:
+ */
+        __Pyx_INCREF(__pyx_v_9protocols_9_speedups__failed);
+        __Pyx_DECREF_SET(__pyx_v_result, __pyx_v_9protocols_9_speedups__failed);
+
+        /* "protocols/_speedups.pyx":583
+ *                     result = factory(ob)
+ * 
+ *             if result is None:             # <<<<<<<<<<<<<<
+ *                 result = _failed
+ * 
+ */
+      }
+    }
+    __pyx_L8:;
+
+    /* "protocols/_speedups.pyx":586
+ *                 result = _failed
+ * 
+ *         if result is _failed:             # <<<<<<<<<<<<<<
+ *             if strict:
+ *                 return None     # can't adapt unless all members adapt
+ */
+    __pyx_t_1 = (__pyx_v_result == __pyx_v_9protocols_9_speedups__failed);
+    __pyx_t_2 = (__pyx_t_1 != 0);
+    if (__pyx_t_2) {
+
+      /* "protocols/_speedups.pyx":587
+ * 
+ *         if result is _failed:
+ *             if strict:             # <<<<<<<<<<<<<<
+ *                 return None     # can't adapt unless all members adapt
+ *             if default is _marker:
+ */
+      __pyx_t_2 = (__pyx_v_strict != 0);
+      if (__pyx_t_2) {
+
+        /* "protocols/_speedups.pyx":588
+ *         if result is _failed:
+ *             if strict:
+ *                 return None     # can't adapt unless all members adapt             # <<<<<<<<<<<<<<
+ *             if default is _marker:
+ *                 raise AdaptationFailure("Can't adapt", ob, protocol)
+ */
+        __Pyx_XDECREF(__pyx_r);
+        __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+        goto __pyx_L0;
+
+        /* "protocols/_speedups.pyx":587
+ * 
+ *         if result is _failed:
+ *             if strict:             # <<<<<<<<<<<<<<
+ *                 return None     # can't adapt unless all members adapt
+ *             if default is _marker:
+ */
+      }
+
+      /* "protocols/_speedups.pyx":589
+ *             if strict:
+ *                 return None     # can't adapt unless all members adapt
+ *             if default is _marker:             # <<<<<<<<<<<<<<
+ *                 raise AdaptationFailure("Can't adapt", ob, protocol)
+ *             result = default
+ */
+      __pyx_t_2 = (__pyx_v_default == __pyx_v_9protocols_9_speedups__marker);
+      __pyx_t_1 = (__pyx_t_2 != 0);
+      if (unlikely(__pyx_t_1)) {
+
+        /* "protocols/_speedups.pyx":590
+ *                 return None     # can't adapt unless all members adapt
+ *             if default is _marker:
+ *                 raise AdaptationFailure("Can't adapt", ob, protocol)             # <<<<<<<<<<<<<<
+ *             result = default
+ * 
+ */
+        __Pyx_GetModuleGlobalName(__pyx_t_7, __pyx_n_s_AdaptationFailure); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 590, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_7);
+        __pyx_t_9 = NULL;
+        __pyx_t_3 = 0;
+        if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_7))) {
+          __pyx_t_9 = PyMethod_GET_SELF(__pyx_t_7);
+          if (likely(__pyx_t_9)) {
+            PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_7);
+            __Pyx_INCREF(__pyx_t_9);
+            __Pyx_INCREF(function);
+            __Pyx_DECREF_SET(__pyx_t_7, function);
+            __pyx_t_3 = 1;
+          }
+        }
+        #if CYTHON_FAST_PYCALL
+        if (PyFunction_Check(__pyx_t_7)) {
+          PyObject *__pyx_temp[4] = {__pyx_t_9, __pyx_kp_s_Can_t_adapt, __pyx_v_ob, __pyx_v_protocol};
+          __pyx_t_8 = __Pyx_PyFunction_FastCall(__pyx_t_7, __pyx_temp+1-__pyx_t_3, 3+__pyx_t_3); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 590, __pyx_L1_error)
+          __Pyx_XDECREF(__pyx_t_9); __pyx_t_9 = 0;
+          __Pyx_GOTREF(__pyx_t_8);
+        } else
+        #endif
+        #if CYTHON_FAST_PYCCALL
+        if (__Pyx_PyFastCFunction_Check(__pyx_t_7)) {
+          PyObject *__pyx_temp[4] = {__pyx_t_9, __pyx_kp_s_Can_t_adapt, __pyx_v_ob, __pyx_v_protocol};
+          __pyx_t_8 = __Pyx_PyCFunction_FastCall(__pyx_t_7, __pyx_temp+1-__pyx_t_3, 3+__pyx_t_3); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 590, __pyx_L1_error)
+          __Pyx_XDECREF(__pyx_t_9); __pyx_t_9 = 0;
+          __Pyx_GOTREF(__pyx_t_8);
+        } else
+        #endif
+        {
+          __pyx_t_10 = PyTuple_New(3+__pyx_t_3); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 590, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_10);
+          if (__pyx_t_9) {
+            __Pyx_GIVEREF(__pyx_t_9); PyTuple_SET_ITEM(__pyx_t_10, 0, __pyx_t_9); __pyx_t_9 = NULL;
+          }
+          __Pyx_INCREF(__pyx_kp_s_Can_t_adapt);
+          __Pyx_GIVEREF(__pyx_kp_s_Can_t_adapt);
+          PyTuple_SET_ITEM(__pyx_t_10, 0+__pyx_t_3, __pyx_kp_s_Can_t_adapt);
+          __Pyx_INCREF(__pyx_v_ob);
+          __Pyx_GIVEREF(__pyx_v_ob);
+          PyTuple_SET_ITEM(__pyx_t_10, 1+__pyx_t_3, __pyx_v_ob);
+          __Pyx_INCREF(__pyx_v_protocol);
+          __Pyx_GIVEREF(__pyx_v_protocol);
+          PyTuple_SET_ITEM(__pyx_t_10, 2+__pyx_t_3, __pyx_v_protocol);
+          __pyx_t_8 = __Pyx_PyObject_Call(__pyx_t_7, __pyx_t_10, NULL); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 590, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_8);
+          __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+        }
+        __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+        __Pyx_Raise(__pyx_t_8, 0, 0, 0);
+        __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+        __PYX_ERR(0, 590, __pyx_L1_error)
+
+        /* "protocols/_speedups.pyx":589
+ *             if strict:
+ *                 return None     # can't adapt unless all members adapt
+ *             if default is _marker:             # <<<<<<<<<<<<<<
+ *                 raise AdaptationFailure("Can't adapt", ob, protocol)
+ *             result = default
+ */
+      }
+
+      /* "protocols/_speedups.pyx":591
+ *             if default is _marker:
+ *                 raise AdaptationFailure("Can't adapt", ob, protocol)
+ *             result = default             # <<<<<<<<<<<<<<
+ * 
+ *         if i < size:
+ */
+      __Pyx_INCREF(__pyx_v_default);
+      __Pyx_DECREF_SET(__pyx_v_result, __pyx_v_default);
+
+      /* "protocols/_speedups.pyx":586
+ *                 result = _failed
+ * 
+ *         if result is _failed:             # <<<<<<<<<<<<<<
+ *             if strict:
+ *                 return None     # can't adapt unless all members adapt
+ */
+    }
+
+    /* "protocols/_speedups.pyx":593
+ *             result = default
+ * 
+ *         if i < size:             # <<<<<<<<<<<<<<
+ *             Py_INCREF(result)
+ *             PyList_SET_ITEM(out, i, result)
+ */
+    __pyx_t_1 = ((__pyx_v_i < __pyx_v_size) != 0);
+    if (__pyx_t_1) {
+
+      /* "protocols/_speedups.pyx":594
+ * 
+ *         if i < size:
+ *             Py_INCREF(result)             # <<<<<<<<<<<<<<
+ *             PyList_SET_ITEM(out, i, result)
+ *         else:
+ */
+      Py_INCREF(__pyx_v_result);
+
+      /* "protocols/_speedups.pyx":595
+ *         if i < size:
+ *             Py_INCREF(result)
+ *             PyList_SET_ITEM(out, i, result)             # <<<<<<<<<<<<<<
+ *         else:
+ *             # not preallocated, or 'objects' grew while we were adapting it
+ */
+      PyList_SET_ITEM(__pyx_v_out, __pyx_v_i, __pyx_v_result);
+
+      /* "protocols/_speedups.pyx":593
+ *             result = default
+ * 
+ *         if i < size:             # <<<<<<<<<<<<<<
+ *             Py_INCREF(result)
+ *             PyList_SET_ITEM(out, i, result)
+ */
+      goto __pyx_L17;
+    }
+
+    /* "protocols/_speedups.pyx":598
+ *         else:
+ *             # not preallocated, or 'objects' grew while we were adapting it
+ *             PyList_Append(<PyListObject *>out, result)             # <<<<<<<<<<<<<<
+ * 
+ *         i = i + 1
+ */
+    /*else*/ {
+      __pyx_t_3 = PyList_Append(((PyListObject *)__pyx_v_out), __pyx_v_result); if (unlikely(__pyx_t_3 == ((int)-1))) __PYX_ERR(0, 598, __pyx_L1_error)
+    }
+    __pyx_L17:;
+
+    /* "protocols/_speedups.pyx":600
+ *             PyList_Append(<PyListObject *>out, result)
+ * 
+ *         i = i + 1             # <<<<<<<<<<<<<<
+ * 
+ *     if i < size:
+ */
+    __pyx_v_i = (__pyx_v_i + 1);
+
+    /* "protocols/_speedups.pyx":557
+ *     factories = {}
+ * 
+ *     for ob in objects:             # <<<<<<<<<<<<<<
+ * 
+ *         if generic:
+ */
+  }
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+  /* "protocols/_speedups.pyx":602
+ *         i = i + 1
+ * 
+ *     if i < size:             # <<<<<<<<<<<<<<
+ *         del out[i:]     # 'objects' shrank while we were adapting it
+ * 
+ */
+  __pyx_t_1 = ((__pyx_v_i < __pyx_v_size) != 0);
+  if (__pyx_t_1) {
+
+    /* "protocols/_speedups.pyx":603
+ * 
+ *     if i < size:
+ *         del out[i:]     # 'objects' shrank while we were adapting it             # <<<<<<<<<<<<<<
+ * 
+ *     return out
+ */
+    if (__Pyx_PyObject_DelSlice(__pyx_v_out, __pyx_v_i, 0, NULL, NULL, NULL, 1, 0, 1) < 0) __PYX_ERR(0, 603, __pyx_L1_error)
+
+    /* "protocols/_speedups.pyx":602
+ *         i = i + 1
+ * 
+ *     if i < size:             # <<<<<<<<<<<<<<
+ *         del out[i:]     # 'objects' shrank while we were adapting it
+ * 
+ */
+  }
+
+  /* "protocols/_speedups.pyx":605
+ *         del out[i:]     # 'objects' shrank while we were adapting it
+ * 
+ *     return out             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v_out);
+  __pyx_r = __pyx_v_out;
+  goto __pyx_L0;
+
+  /* "protocols/_speedups.pyx":536
+ * 
+ * 
+ * cdef object adaptMany(objects, protocol, default, int strict):             # <<<<<<<<<<<<<<
+ * 
+ *     # 'adapt_many()', or if 'strict' is true, 'ADAPT_SEQUENCE()': return
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_XDECREF(__pyx_t_8);
+  __Pyx_XDECREF(__pyx_t_9);
+  __Pyx_XDECREF(__pyx_t_10);
+  __Pyx_AddTraceback("protocols._speedups.adaptMany", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_out);
+  __Pyx_XDECREF(__pyx_v_factories);
+  __Pyx_XDECREF(__pyx_v_ob);
+  __Pyx_XDECREF(__pyx_v_result);
+  __Pyx_XDECREF(__pyx_v_meth);
+  __Pyx_XDECREF(__pyx_v_cls);
+  __Pyx_XDECREF(__pyx_v_factory);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "protocols/_speedups.pyx":608
+ * 
+ * 
+ * def adapt_many(objects, protocol, default=_marker):             # <<<<<<<<<<<<<<
+ *     """Return a list of 'objects' adapted to 'protocol' (see 'adapt()')
+ * 
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_9protocols_9_speedups_13adapt_many(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_9protocols_9_speedups_12adapt_many[] = "Return a list of 'objects' adapted to 'protocol' (see 'adapt()')\n\n    If 'protocol' uses the standard 'Protocol.__adapt__', its adapter is\n    looked up only once for each class of object.";
+static PyMethodDef __pyx_mdef_9protocols_9_speedups_13adapt_many = {"adapt_many", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_9protocols_9_speedups_13adapt_many, METH_VARARGS|METH_KEYWORDS, __pyx_doc_9protocols_9_speedups_12adapt_many};
+static PyObject *__pyx_pw_9protocols_9_speedups_13adapt_many(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_objects = 0;
+  PyObject *__pyx_v_protocol = 0;
+  PyObject *__pyx_v_default = 0;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("adapt_many (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_objects,&__pyx_n_s_protocol,&__pyx_n_s_default,0};
+    PyObject* values[3] = {0,0,0};
+    values[2] = __pyx_k__4;
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_objects)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_protocol)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("adapt_many", 0, 2, 3, 1); __PYX_ERR(0, 608, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  2:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_default);
+          if (value) { values[2] = value; kw_args--; }
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "adapt_many") < 0)) __PYX_ERR(0, 608, __pyx_L3_error)
+      }
+    } else {
+      switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+    }
+    __pyx_v_objects = values[0];
+    __pyx_v_protocol = values[1];
+    __pyx_v_default = values[2];
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("adapt_many", 0, 2, 3, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 608, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("protocols._speedups.adapt_many", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_9protocols_9_speedups_12adapt_many(__pyx_self, __pyx_v_objects, __pyx_v_protocol, __pyx_v_default);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_9protocols_9_speedups_12adapt_many(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_objects, PyObject *__pyx_v_protocol, PyObject *__pyx_v_default) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("adapt_many", 0);
+
+  /* "protocols/_speedups.pyx":614
+ *     looked up only once for each class of object."""
+ * 
+ *     return adaptMany(objects, protocol, default, 0)             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __pyx_f_9protocols_9_speedups_adaptMany(__pyx_v_objects, __pyx_v_protocol, __pyx_v_default, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 614, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "protocols/_speedups.pyx":608
+ * 
+ * 
+ * def adapt_many(objects, protocol, default=_marker):             # <<<<<<<<<<<<<<
+ *     """Return a list of 'objects' adapted to 'protocol' (see 'adapt()')
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("protocols._speedups.adapt_many", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "protocols/_speedups.pyx":617
+ * 
+ * 
+ * def ADAPT_SEQUENCE(ob, proto):             # <<<<<<<<<<<<<<
+ *     """Convert iterable 'ob' into list of objects implementing 'proto'"""
+ * 
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_9protocols_9_speedups_15ADAPT_SEQUENCE(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_9protocols_9_speedups_14ADAPT_SEQUENCE[] = "Convert iterable 'ob' into list of objects implementing 'proto'";
+static PyMethodDef __pyx_mdef_9protocols_9_speedups_15ADAPT_SEQUENCE = {"ADAPT_SEQUENCE", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_9protocols_9_speedups_15ADAPT_SEQUENCE, METH_VARARGS|METH_KEYWORDS, __pyx_doc_9protocols_9_speedups_14ADAPT_SEQUENCE};
+static PyObject *__pyx_pw_9protocols_9_speedups_15ADAPT_SEQUENCE(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_ob = 0;
+  PyObject *__pyx_v_proto = 0;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("ADAPT_SEQUENCE (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_ob,&__pyx_n_s_proto,0};
+    PyObject* values[2] = {0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_ob)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_proto)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("ADAPT_SEQUENCE", 1, 2, 2, 1); __PYX_ERR(0, 617, __pyx_L3_error)
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "ADAPT_SEQUENCE") < 0)) __PYX_ERR(0, 617, __pyx_L3_error)
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 2) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+    }
+    __pyx_v_ob = values[0];
+    __pyx_v_proto = values[1];
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("ADAPT_SEQUENCE", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 617, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("protocols._speedups.ADAPT_SEQUENCE", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_9protocols_9_speedups_14ADAPT_SEQUENCE(__pyx_self, __pyx_v_ob, __pyx_v_proto);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_9protocols_9_speedups_14ADAPT_SEQUENCE(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ob, PyObject *__pyx_v_proto) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("ADAPT_SEQUENCE", 0);
+
+  /* "protocols/_speedups.pyx":620
+ *     """Convert iterable 'ob' into list of objects implementing 'proto'"""
+ * 
+ *     return adaptMany(ob, proto.baseProtocol, None, 1)             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_proto, __pyx_n_s_baseProtocol); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 620, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __pyx_f_9protocols_9_speedups_adaptMany(__pyx_v_ob, __pyx_t_1, Py_None, 1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 620, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_r = __pyx_t_2;
+  __pyx_t_2 = 0;
+  goto __pyx_L0;
+
+  /* "protocols/_speedups.pyx":617
+ * 
+ * 
+ * def ADAPT_SEQUENCE(ob, proto):             # <<<<<<<<<<<<<<
+ *     """Convert iterable 'ob' into list of objects implementing 'proto'"""
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_AddTraceback("protocols._speedups.ADAPT_SEQUENCE", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "protocols/_speedups.pyx":623
+ * 
+ * 
+ * def adapt_first(obj, protocols, default=_marker):             # <<<<<<<<<<<<<<
+ *     """Return 'obj' adapted to the first of 'protocols' it can be adapted to
+ * 
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_9protocols_9_speedups_17adapt_first(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_9protocols_9_speedups_16adapt_first[] = "Return 'obj' adapted to the first of 'protocols' it can be adapted to\n\n    If 'obj' can't be adapted to any of them, return 'default', or raise\n    'AdaptationFailure' if no default is given.";
+static PyMethodDef __pyx_mdef_9protocols_9_speedups_17adapt_first = {"adapt_first", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_9protocols_9_speedups_17adapt_first, METH_VARARGS|METH_KEYWORDS, __pyx_doc_9protocols_9_speedups_16adapt_first};
+static PyObject *__pyx_pw_9protocols_9_speedups_17adapt_first(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_obj = 0;
+  PyObject *__pyx_v_protocols = 0;
+  PyObject *__pyx_v_default = 0;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("adapt_first (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_obj,&__pyx_n_s_protocols,&__pyx_n_s_default,0};
+    PyObject* values[3] = {0,0,0};
+    values[2] = __pyx_k__5;
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_obj)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_protocols)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("adapt_first", 0, 2, 3, 1); __PYX_ERR(0, 623, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  2:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_default);
+          if (value) { values[2] = value; kw_args--; }
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "adapt_first") < 0)) __PYX_ERR(0, 623, __pyx_L3_error)
+      }
+    } else {
+      switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+    }
+    __pyx_v_obj = values[0];
+    __pyx_v_protocols = values[1];
+    __pyx_v_default = values[2];
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("adapt_first", 0, 2, 3, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 623, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("protocols._speedups.adapt_first", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_9protocols_9_speedups_16adapt_first(__pyx_self, __pyx_v_obj, __pyx_v_protocols, __pyx_v_default);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_9protocols_9_speedups_16adapt_first(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_obj, PyObject *__pyx_v_protocols, PyObject *__pyx_v_default) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("adapt_first", 0);
+
+  /* "protocols/_speedups.pyx":629
+ *     'AdaptationFailure' if no default is given."""
+ * 
+ *     return _adaptEach(obj, protocols, default, 1)             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __pyx_f_9protocols_9_speedups__adaptEach(__pyx_v_obj, __pyx_v_protocols, __pyx_v_default, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 629, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "protocols/_speedups.pyx":623
+ * 
+ * 
+ * def adapt_first(obj, protocols, default=_marker):             # <<<<<<<<<<<<<<
+ *     """Return 'obj' adapted to the first of 'protocols' it can be adapted to
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("protocols._speedups.adapt_first", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "protocols/_speedups.pyx":632
+ * 
+ * 
+ * def adapt_each(obj, protocols, default=None):             # <<<<<<<<<<<<<<
+ *     """Return a list of 'obj' adapted to each of 'protocols', in order
+ * 
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_9protocols_9_speedups_19adapt_each(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_9protocols_9_speedups_18adapt_each[] = "Return a list of 'obj' adapted to each of 'protocols', in order\n\n    'default' is used in place of any protocol 'obj' can't be adapted to.";
+static PyMethodDef __pyx_mdef_9protocols_9_speedups_19adapt_each = {"adapt_each", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_9protocols_9_speedups_19adapt_each, METH_VARARGS|METH_KEYWORDS, __pyx_doc_9protocols_9_speedups_18adapt_each};
+static PyObject *__pyx_pw_9protocols_9_speedups_19adapt_each(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_obj = 0;
+  PyObject *__pyx_v_protocols = 0;
+  PyObject *__pyx_v_default = 0;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("adapt_each (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_obj,&__pyx_n_s_protocols,&__pyx_n_s_default,0};
+    PyObject* values[3] = {0,0,0};
+    values[2] = ((PyObject *)Py_None);
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_obj)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_protocols)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("adapt_each", 0, 2, 3, 1); __PYX_ERR(0, 632, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  2:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_default);
+          if (value) { values[2] = value; kw_args--; }
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "adapt_each") < 0)) __PYX_ERR(0, 632, __pyx_L3_error)
+      }
+    } else {
+      switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+    }
+    __pyx_v_obj = values[0];
+    __pyx_v_protocols = values[1];
+    __pyx_v_default = values[2];
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("adapt_each", 0, 2, 3, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 632, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("protocols._speedups.adapt_each", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_9protocols_9_speedups_18adapt_each(__pyx_self, __pyx_v_obj, __pyx_v_protocols, __pyx_v_default);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_9protocols_9_speedups_18adapt_each(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_obj, PyObject *__pyx_v_protocols, PyObject *__pyx_v_default) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("adapt_each", 0);
+
+  /* "protocols/_speedups.pyx":637
+ *     'default' is used in place of any protocol 'obj' can't be adapted to."""
+ * 
+ *     return _adaptEach(obj, protocols, default, 0)             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __pyx_f_9protocols_9_speedups__adaptEach(__pyx_v_obj, __pyx_v_protocols, __pyx_v_default, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 637, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "protocols/_speedups.pyx":632
+ * 
+ * 
+ * def adapt_each(obj, protocols, default=None):             # <<<<<<<<<<<<<<
+ *     """Return a list of 'obj' adapted to each of 'protocols', in order
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("protocols._speedups.adapt_each", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "protocols/_speedups.pyx":640
+ * 
+ * 
+ * cdef object InterfaceClass_call(object self, object args, void *kw):             # <<<<<<<<<<<<<<
+ * 
+ *     # tp_call slot for InterfaceClass; this is 'InterfaceClass.__call__',
+ */
+
+static PyObject *__pyx_f_9protocols_9_speedups_InterfaceClass_call(PyObject *__pyx_v_self, PyObject *__pyx_v_args, void *__pyx_v_kw) {
+  int __pyx_v_nargs;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  int __pyx_t_3;
+  int __pyx_t_4;
+  void *__pyx_t_5;
+  void *__pyx_t_6;
+  PyObject *__pyx_t_7 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("InterfaceClass_call", 0);
+
+  /* "protocols/_speedups.pyx":647
+ *     cdef int nargs
+ * 
+ *     if getattr(self, __init) is not _interfaceInit:             # <<<<<<<<<<<<<<
+ *         return PyType_Type.tp_call(self, args, kw)
+ * 
+ */
+  __pyx_t_1 = __pyx_v_9protocols_9_speedups___init;
+  __Pyx_INCREF(__pyx_t_1);
+  __pyx_t_2 = __Pyx_GetAttr(__pyx_v_self, __pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 647, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_3 = (__pyx_t_2 != __pyx_v_9protocols_9_speedups__interfaceInit);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_4 = (__pyx_t_3 != 0);
+  if (__pyx_t_4) {
+
+    /* "protocols/_speedups.pyx":648
+ * 
+ *     if getattr(self, __init) is not _interfaceInit:
+ *         return PyType_Type.tp_call(self, args, kw)             # <<<<<<<<<<<<<<
+ * 
+ *     nargs = PyTuple_GET_SIZE(<PyTupleObject *>args)
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_2 = PyType_Type.tp_call(__pyx_v_self, __pyx_v_args, __pyx_v_kw); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 648, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_r = __pyx_t_2;
+    __pyx_t_2 = 0;
+    goto __pyx_L0;
+
+    /* "protocols/_speedups.pyx":647
+ *     cdef int nargs
+ * 
+ *     if getattr(self, __init) is not _interfaceInit:             # <<<<<<<<<<<<<<
+ *         return PyType_Type.tp_call(self, args, kw)
+ * 
+ */
+  }
+
+  /* "protocols/_speedups.pyx":650
+ *         return PyType_Type.tp_call(self, args, kw)
+ * 
+ *     nargs = PyTuple_GET_SIZE(<PyTupleObject *>args)             # <<<<<<<<<<<<<<
+ *     if kw == NULL:
+ *         if nargs == 1:
+ */
+  __pyx_v_nargs = PyTuple_GET_SIZE(((PyTupleObject *)__pyx_v_args));
+
+  /* "protocols/_speedups.pyx":651
+ * 
+ *     nargs = PyTuple_GET_SIZE(<PyTupleObject *>args)
+ *     if kw == NULL:             # <<<<<<<<<<<<<<
+ *         if nargs == 1:
+ *             return _adapt(
+ */
+  __pyx_t_4 = ((__pyx_v_kw == NULL) != 0);
+  if (__pyx_t_4) {
+
+    /* "protocols/_speedups.pyx":652
+ *     nargs = PyTuple_GET_SIZE(<PyTupleObject *>args)
+ *     if kw == NULL:
+ *         if nargs == 1:             # <<<<<<<<<<<<<<
+ *             return _adapt(
+ *                 <object> PyTuple_GET_ITEM(<PyTupleObject *>args, 0),
+ */
+    switch (__pyx_v_nargs) {
+      case 1:
+
+      /* "protocols/_speedups.pyx":653
+ *     if kw == NULL:
+ *         if nargs == 1:
+ *             return _adapt(             # <<<<<<<<<<<<<<
+ *                 <object> PyTuple_GET_ITEM(<PyTupleObject *>args, 0),
+ *                 self, _marker
+ */
+      __Pyx_XDECREF(__pyx_r);
+
+      /* "protocols/_speedups.pyx":654
+ *         if nargs == 1:
+ *             return _adapt(
+ *                 <object> PyTuple_GET_ITEM(<PyTupleObject *>args, 0),             # <<<<<<<<<<<<<<
+ *                 self, _marker
+ *             )
+ */
+      __pyx_t_5 = PyTuple_GET_ITEM(((PyTupleObject *)__pyx_v_args), 0);
+
+      /* "protocols/_speedups.pyx":655
+ *             return _adapt(
+ *                 <object> PyTuple_GET_ITEM(<PyTupleObject *>args, 0),
+ *                 self, _marker             # <<<<<<<<<<<<<<
+ *             )
+ *         elif nargs == 2:
+ */
+      __pyx_t_2 = __pyx_v_9protocols_9_speedups__marker;
+      __Pyx_INCREF(__pyx_t_2);
+
+      /* "protocols/_speedups.pyx":653
+ *     if kw == NULL:
+ *         if nargs == 1:
+ *             return _adapt(             # <<<<<<<<<<<<<<
+ *                 <object> PyTuple_GET_ITEM(<PyTupleObject *>args, 0),
+ *                 self, _marker
+ */
+      __pyx_t_1 = __pyx_f_9protocols_9_speedups__adapt(((PyObject *)__pyx_t_5), __pyx_v_self, __pyx_t_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 653, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+      __pyx_r = __pyx_t_1;
+      __pyx_t_1 = 0;
+      goto __pyx_L0;
+
+      /* "protocols/_speedups.pyx":652
+ *     nargs = PyTuple_GET_SIZE(<PyTupleObject *>args)
+ *     if kw == NULL:
+ *         if nargs == 1:             # <<<<<<<<<<<<<<
+ *             return _adapt(
+ *                 <object> PyTuple_GET_ITEM(<PyTupleObject *>args, 0),
+ */
+      break;
+      case 2:
+
+      /* "protocols/_speedups.pyx":658
+ *             )
+ *         elif nargs == 2:
+ *             return _adapt(             # <<<<<<<<<<<<<<
+ *                 <object> PyTuple_GET_ITEM(<PyTupleObject *>args, 0), self,
+ *                 <object> PyTuple_GET_ITEM(<PyTupleObject *>args, 1)
+ */
+      __Pyx_XDECREF(__pyx_r);
+
+      /* "protocols/_speedups.pyx":659
+ *         elif nargs == 2:
+ *             return _adapt(
+ *                 <object> PyTuple_GET_ITEM(<PyTupleObject *>args, 0), self,             # <<<<<<<<<<<<<<
+ *                 <object> PyTuple_GET_ITEM(<PyTupleObject *>args, 1)
+ *             )
+ */
+      __pyx_t_5 = PyTuple_GET_ITEM(((PyTupleObject *)__pyx_v_args), 0);
+
+      /* "protocols/_speedups.pyx":660
+ *             return _adapt(
+ *                 <object> PyTuple_GET_ITEM(<PyTupleObject *>args, 0), self,
+ *                 <object> PyTuple_GET_ITEM(<PyTupleObject *>args, 1)             # <<<<<<<<<<<<<<
+ *             )
+ * 
+ */
+      __pyx_t_6 = PyTuple_GET_ITEM(((PyTupleObject *)__pyx_v_args), 1);
+
+      /* "protocols/_speedups.pyx":658
+ *             )
+ *         elif nargs == 2:
+ *             return _adapt(             # <<<<<<<<<<<<<<
+ *                 <object> PyTuple_GET_ITEM(<PyTupleObject *>args, 0), self,
+ *                 <object> PyTuple_GET_ITEM(<PyTupleObject *>args, 1)
+ */
+      __pyx_t_1 = __pyx_f_9protocols_9_speedups__adapt(((PyObject *)__pyx_t_5), __pyx_v_self, ((PyObject *)__pyx_t_6)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 658, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      __pyx_r = __pyx_t_1;
+      __pyx_t_1 = 0;
+      goto __pyx_L0;
+
+      /* "protocols/_speedups.pyx":657
+ *                 self, _marker
+ *             )
+ *         elif nargs == 2:             # <<<<<<<<<<<<<<
+ *             return _adapt(
+ *                 <object> PyTuple_GET_ITEM(<PyTupleObject *>args, 0), self,
+ */
+      break;
+      default: break;
+    }
+
+    /* "protocols/_speedups.pyx":651
+ * 
+ *     nargs = PyTuple_GET_SIZE(<PyTupleObject *>args)
+ *     if kw == NULL:             # <<<<<<<<<<<<<<
+ *         if nargs == 1:
+ *             return _adapt(
+ */
+  }
+
+  /* "protocols/_speedups.pyx":664
+ * 
+ *     # Keyword or bad arguments; let the Python version sort them out
+ *     return PyObject_Call(_interfaceCall, (self,) + args, kw)             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __pyx_v_9protocols_9_speedups__interfaceCall;
+  __Pyx_INCREF(__pyx_t_1);
+  __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 664, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_INCREF(__pyx_v_self);
+  __Pyx_GIVEREF(__pyx_v_self);
+  PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_v_self);
+  __pyx_t_7 = PyNumber_Add(__pyx_t_2, __pyx_v_args); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 664, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = PyObject_Call(__pyx_t_1, __pyx_t_7, __pyx_v_kw); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 664, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_r = __pyx_t_2;
+  __pyx_t_2 = 0;
+  goto __pyx_L0;
+
+  /* "protocols/_speedups.pyx":640
+ * 
+ * 
+ * cdef object InterfaceClass_call(object self, object args, void *kw):             # <<<<<<<<<<<<<<
+ * 
+ *     # tp_call slot for InterfaceClass; this is 'InterfaceClass.__call__',
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_AddTraceback("protocols._speedups.InterfaceClass_call", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "protocols/_speedups.pyx":667
+ * 
+ * 
+ * def installInterfaceCall(InterfaceClass, Interface):             # <<<<<<<<<<<<<<
+ *     """Put a C version of 'InterfaceClass.__call__' in its tp_call slot
+ * 
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_9protocols_9_speedups_21installInterfaceCall(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_9protocols_9_speedups_20installInterfaceCall[] = "Put a C version of 'InterfaceClass.__call__' in its tp_call slot\n\n    The Python-level '__call__' is kept for explicit calls; subclasses of\n    'InterfaceClass' use it too, since they don't inherit the slot.";
+static PyMethodDef __pyx_mdef_9protocols_9_speedups_21installInterfaceCall = {"installInterfaceCall", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_9protocols_9_speedups_21installInterfaceCall, METH_VARARGS|METH_KEYWORDS, __pyx_doc_9protocols_9_speedups_20installInterfaceCall};
+static PyObject *__pyx_pw_9protocols_9_speedups_21installInterfaceCall(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_InterfaceClass = 0;
+  PyObject *__pyx_v_Interface = 0;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("installInterfaceCall (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_InterfaceClass,&__pyx_n_s_Interface,0};
+    PyObject* values[2] = {0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_InterfaceClass)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_Interface)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("installInterfaceCall", 1, 2, 2, 1); __PYX_ERR(0, 667, __pyx_L3_error)
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "installInterfaceCall") < 0)) __PYX_ERR(0, 667, __pyx_L3_error)
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 2) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+    }
+    __pyx_v_InterfaceClass = values[0];
+    __pyx_v_Interface = values[1];
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("installInterfaceCall", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 667, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("protocols._speedups.installInterfaceCall", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_9protocols_9_speedups_20installInterfaceCall(__pyx_self, __pyx_v_InterfaceClass, __pyx_v_Interface);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_9protocols_9_speedups_20installInterfaceCall(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_InterfaceClass, PyObject *__pyx_v_Interface) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("installInterfaceCall", 0);
+
+  /* "protocols/_speedups.pyx":675
+ *     global _interfaceInit, _interfaceCall
+ * 
+ *     _interfaceInit = Interface.__init__             # <<<<<<<<<<<<<<
+ *     _interfaceCall = InterfaceClass.__dict__['__call__']
+ *     (<PyTypeObject *>InterfaceClass).tp_call = <ternaryfunc> InterfaceClass_call
+ */
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_Interface, __pyx_n_s_init); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 675, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_XGOTREF(__pyx_v_9protocols_9_speedups__interfaceInit);
+  __Pyx_DECREF_SET(__pyx_v_9protocols_9_speedups__interfaceInit, __pyx_t_1);
+  __Pyx_GIVEREF(__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "protocols/_speedups.pyx":676
+ * 
+ *     _interfaceInit = Interface.__init__
+ *     _interfaceCall = InterfaceClass.__dict__['__call__']             # <<<<<<<<<<<<<<
+ *     (<PyTypeObject *>InterfaceClass).tp_call = <ternaryfunc> InterfaceClass_call
+ * 
+ */
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_InterfaceClass, __pyx_n_s_dict); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 676, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __Pyx_PyObject_Dict_GetItem(__pyx_t_1, __pyx_n_s_call); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 676, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_XGOTREF(__pyx_v_9protocols_9_speedups__interfaceCall);
+  __Pyx_DECREF_SET(__pyx_v_9protocols_9_speedups__interfaceCall, __pyx_t_2);
+  __Pyx_GIVEREF(__pyx_t_2);
+  __pyx_t_2 = 0;
+
+  /* "protocols/_speedups.pyx":677
+ *     _interfaceInit = Interface.__init__
+ *     _interfaceCall = InterfaceClass.__dict__['__call__']
+ *     (<PyTypeObject *>InterfaceClass).tp_call = <ternaryfunc> InterfaceClass_call             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  ((PyTypeObject *)__pyx_v_InterfaceClass)->tp_call = ((ternaryfunc)__pyx_f_9protocols_9_speedups_InterfaceClass_call);
+
+  /* "protocols/_speedups.pyx":667
+ * 
+ * 
+ * def installInterfaceCall(InterfaceClass, Interface):             # <<<<<<<<<<<<<<
+ *     """Put a C version of 'InterfaceClass.__call__' in its tp_call slot
+ * 
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_AddTraceback("protocols._speedups.installInterfaceCall", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "protocols/_speedups.pyx":680
+ * 
+ * 
+ * cdef buildClassicMRO(PyClassObject *cls, PyListObject *list):             # <<<<<<<<<<<<<<
+ * 
+ *     cdef PyTupleObject *bases
+ */
+
+static PyObject *__pyx_f_9protocols_9_speedups_buildClassicMRO(PyClassObject *__pyx_v_cls, PyListObject *__pyx_v_list) {
+  PyTupleObject *__pyx_v_bases;
+  int __pyx_v_i;
+  PyObject *__pyx_v_tmp = NULL;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  PyTupleObject *__pyx_t_2;
+  int __pyx_t_3;
+  void *__pyx_t_4;
+  PyObject *__pyx_t_5 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("buildClassicMRO", 0);
+
+  /* "protocols/_speedups.pyx":685
+ *     cdef int i
+ * 
+ *     PyList_Append(list, <object> cls)             # <<<<<<<<<<<<<<
+ *     bases = cls.cl_bases
+ * 
+ */
+  __pyx_t_1 = PyList_Append(__pyx_v_list, ((PyObject *)__pyx_v_cls)); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(0, 685, __pyx_L1_error)
+
+  /* "protocols/_speedups.pyx":686
+ * 
+ *     PyList_Append(list, <object> cls)
+ *     bases = cls.cl_bases             # <<<<<<<<<<<<<<
+ * 
+ *     if bases:
+ */
+  __pyx_t_2 = __pyx_v_cls->cl_bases;
+  __pyx_v_bases = __pyx_t_2;
+
+  /* "protocols/_speedups.pyx":688
+ *     bases = cls.cl_bases
+ * 
+ *     if bases:             # <<<<<<<<<<<<<<
+ *         for i from 0 <= i < PyTuple_GET_SIZE(bases):
+ *             tmp = <object> PyTuple_GET_ITEM(bases, i)
+ */
+  __pyx_t_3 = (__pyx_v_bases != 0);
+  if (__pyx_t_3) {
+
+    /* "protocols/_speedups.pyx":689
+ * 
+ *     if bases:
+ *         for i from 0 <= i < PyTuple_GET_SIZE(bases):             # <<<<<<<<<<<<<<
+ *             tmp = <object> PyTuple_GET_ITEM(bases, i)
+ *             buildClassicMRO(<PyClassObject *>tmp, list)
+ */
+    __pyx_t_1 = PyTuple_GET_SIZE(__pyx_v_bases);
+    for (__pyx_v_i = 0; __pyx_v_i < __pyx_t_1; __pyx_v_i++) {
+
+      /* "protocols/_speedups.pyx":690
+ *     if bases:
+ *         for i from 0 <= i < PyTuple_GET_SIZE(bases):
+ *             tmp = <object> PyTuple_GET_ITEM(bases, i)             # <<<<<<<<<<<<<<
+ *             buildClassicMRO(<PyClassObject *>tmp, list)
+ * 
+ */
+      __pyx_t_4 = PyTuple_GET_ITEM(__pyx_v_bases, __pyx_v_i);
+      __pyx_t_5 = ((PyObject *)__pyx_t_4);
+      __Pyx_INCREF(__pyx_t_5);
+      __Pyx_XDECREF_SET(__pyx_v_tmp, __pyx_t_5);
+      __pyx_t_5 = 0;
+
+      /* "protocols/_speedups.pyx":691
+ *         for i from 0 <= i < PyTuple_GET_SIZE(bases):
+ *             tmp = <object> PyTuple_GET_ITEM(bases, i)
+ *             buildClassicMRO(<PyClassObject *>tmp, list)             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+      __pyx_t_5 = __pyx_f_9protocols_9_speedups_buildClassicMRO(((PyClassObject *)__pyx_v_tmp), __pyx_v_list); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 691, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    }
+
+    /* "protocols/_speedups.pyx":688
+ *     bases = cls.cl_bases
+ * 
+ *     if bases:             # <<<<<<<<<<<<<<
+ *         for i from 0 <= i < PyTuple_GET_SIZE(bases):
+ *             tmp = <object> PyTuple_GET_ITEM(bases, i)
+ */
+  }
+
+  /* "protocols/_speedups.pyx":680
+ * 
+ * 
+ * cdef buildClassicMRO(PyClassObject *cls, PyListObject *list):             # <<<<<<<<<<<<<<
+ * 
+ *     cdef PyTupleObject *bases
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_AddTraceback("protocols._speedups.buildClassicMRO", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_tmp);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "protocols/_speedups.pyx":694
+ * 
+ * 
+ * cdef object basesOf(cls):             # <<<<<<<<<<<<<<
+ *     if PyClass_Check(cls):
+ *         return <object> (<PyClassObject *>cls).cl_bases
+ */
+
+static PyObject *__pyx_f_9protocols_9_speedups_basesOf(PyObject *__pyx_v_cls) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("basesOf", 0);
+
+  /* "protocols/_speedups.pyx":695
+ * 
+ * cdef object basesOf(cls):
+ *     if PyClass_Check(cls):             # <<<<<<<<<<<<<<
+ *         return <object> (<PyClassObject *>cls).cl_bases
+ *     return cls.__bases__
+ */
+  __pyx_t_1 = (PyClass_Check(__pyx_v_cls) != 0);
+  if (__pyx_t_1) {
+
+    /* "protocols/_speedups.pyx":696
+ * cdef object basesOf(cls):
+ *     if PyClass_Check(cls):
+ *         return <object> (<PyClassObject *>cls).cl_bases             # <<<<<<<<<<<<<<
+ *     return cls.__bases__
+ * 
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_INCREF(((PyObject *)((PyClassObject *)__pyx_v_cls)->cl_bases));
+    __pyx_r = ((PyObject *)((PyClassObject *)__pyx_v_cls)->cl_bases);
+    goto __pyx_L0;
+
+    /* "protocols/_speedups.pyx":695
+ * 
+ * cdef object basesOf(cls):
+ *     if PyClass_Check(cls):             # <<<<<<<<<<<<<<
+ *         return <object> (<PyClassObject *>cls).cl_bases
+ *     return cls.__bases__
+ */
+  }
+
+  /* "protocols/_speedups.pyx":697
+ *     if PyClass_Check(cls):
+ *         return <object> (<PyClassObject *>cls).cl_bases
+ *     return cls.__bases__             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_cls, __pyx_n_s_bases); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 697, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_r = __pyx_t_2;
+  __pyx_t_2 = 0;
+  goto __pyx_L0;
+
+  /* "protocols/_speedups.pyx":694
+ * 
+ * 
+ * cdef object basesOf(cls):             # <<<<<<<<<<<<<<
+ *     if PyClass_Check(cls):
+ *         return <object> (<PyClassObject *>cls).cl_bases
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_AddTraceback("protocols._speedups.basesOf", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "protocols/_speedups.pyx":700
+ * 
+ * 
+ * cdef int hasBases(cls, void *bases) except -1:             # <<<<<<<<<<<<<<
+ * 
+ *     # Are 'bases' still the '__bases__' of 'cls'?
+ */
+
+static int __pyx_f_9protocols_9_speedups_hasBases(PyObject *__pyx_v_cls, void *__pyx_v_bases) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  int __pyx_t_3;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("hasBases", 0);
+
+  /* "protocols/_speedups.pyx":704
+ *     # Are 'bases' still the '__bases__' of 'cls'?
+ * 
+ *     if PyClass_Check(cls):             # <<<<<<<<<<<<<<
+ *         return <void *> ((<PyClassObject *>cls).cl_bases) == bases
+ * 
+ */
+  __pyx_t_1 = (PyClass_Check(__pyx_v_cls) != 0);
+  if (__pyx_t_1) {
+
+    /* "protocols/_speedups.pyx":705
+ * 
+ *     if PyClass_Check(cls):
+ *         return <void *> ((<PyClassObject *>cls).cl_bases) == bases             # <<<<<<<<<<<<<<
+ * 
+ *     return PyObject_RichCompareBool(cls.__bases__, <object> bases, Py_EQ)
+ */
+    __pyx_r = (((void *)((PyClassObject *)__pyx_v_cls)->cl_bases) == __pyx_v_bases);
+    goto __pyx_L0;
+
+    /* "protocols/_speedups.pyx":704
+ *     # Are 'bases' still the '__bases__' of 'cls'?
+ * 
+ *     if PyClass_Check(cls):             # <<<<<<<<<<<<<<
+ *         return <void *> ((<PyClassObject *>cls).cl_bases) == bases
+ * 
+ */
+  }
+
+  /* "protocols/_speedups.pyx":707
+ *         return <void *> ((<PyClassObject *>cls).cl_bases) == bases
+ * 
+ *     return PyObject_RichCompareBool(cls.__bases__, <object> bases, Py_EQ)             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_cls, __pyx_n_s_bases); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 707, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = PyObject_RichCompareBool(__pyx_t_2, ((PyObject *)__pyx_v_bases), Py_EQ); if (unlikely(__pyx_t_3 == ((int)-1))) __PYX_ERR(0, 707, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_r = __pyx_t_3;
+  goto __pyx_L0;
+
+  /* "protocols/_speedups.pyx":700
+ * 
+ * 
+ * cdef int hasBases(cls, void *bases) except -1:             # <<<<<<<<<<<<<<
+ * 
+ *     # Are 'bases' still the '__bases__' of 'cls'?
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_AddTraceback("protocols._speedups.hasBases", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "protocols/_speedups.pyx":710
+ * 
+ * 
+ * cdef int sameClassicBases(cls, cached) except -1:             # <<<<<<<<<<<<<<
+ * 
+ *     # Are the '__bases__' of 'cls' and the classes in its cached MRO still
+ */
+
+static int __pyx_f_9protocols_9_speedups_sameClassicBases(PyObject *__pyx_v_cls, PyObject *__pyx_v_cached) {
+  PyTupleObject *__pyx_v_classes;
+  PyListObject *__pyx_v_bases;
+  int __pyx_v_i;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  void *__pyx_t_3;
+  int __pyx_t_4;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("sameClassicBases", 0);
+
+  /* "protocols/_speedups.pyx":719
+ *     cdef int i
+ * 
+ *     if not hasBases(cls, PyTuple_GET_ITEM(<PyTupleObject *>cached, 0)):             # <<<<<<<<<<<<<<
+ *         return 0
+ * 
+ */
+  __pyx_t_1 = __pyx_f_9protocols_9_speedups_hasBases(__pyx_v_cls, PyTuple_GET_ITEM(((PyTupleObject *)__pyx_v_cached), 0)); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(0, 719, __pyx_L1_error)
+  __pyx_t_2 = ((!(__pyx_t_1 != 0)) != 0);
+  if (__pyx_t_2) {
+
+    /* "protocols/_speedups.pyx":720
+ * 
+ *     if not hasBases(cls, PyTuple_GET_ITEM(<PyTupleObject *>cached, 0)):
+ *         return 0             # <<<<<<<<<<<<<<
+ * 
+ *     classes = <PyTupleObject *> PyTuple_GET_ITEM(<PyTupleObject *>cached, 1)
+ */
+    __pyx_r = 0;
+    goto __pyx_L0;
+
+    /* "protocols/_speedups.pyx":719
+ *     cdef int i
+ * 
+ *     if not hasBases(cls, PyTuple_GET_ITEM(<PyTupleObject *>cached, 0)):             # <<<<<<<<<<<<<<
+ *         return 0
+ * 
+ */
+  }
+
+  /* "protocols/_speedups.pyx":722
+ *         return 0
+ * 
+ *     classes = <PyTupleObject *> PyTuple_GET_ITEM(<PyTupleObject *>cached, 1)             # <<<<<<<<<<<<<<
+ *     bases = <PyListObject *> PyTuple_GET_ITEM(<PyTupleObject *>cached, 2)
+ * 
+ */
+  __pyx_v_classes = ((PyTupleObject *)PyTuple_GET_ITEM(((PyTupleObject *)__pyx_v_cached), 1));
+
+  /* "protocols/_speedups.pyx":723
+ * 
+ *     classes = <PyTupleObject *> PyTuple_GET_ITEM(<PyTupleObject *>cached, 1)
+ *     bases = <PyListObject *> PyTuple_GET_ITEM(<PyTupleObject *>cached, 2)             # <<<<<<<<<<<<<<
+ * 
+ *     for i from 0 <= i < PyTuple_GET_SIZE(classes):
+ */
+  __pyx_v_bases = ((PyListObject *)PyTuple_GET_ITEM(((PyTupleObject *)__pyx_v_cached), 2));
+
+  /* "protocols/_speedups.pyx":725
+ *     bases = <PyListObject *> PyTuple_GET_ITEM(<PyTupleObject *>cached, 2)
+ * 
+ *     for i from 0 <= i < PyTuple_GET_SIZE(classes):             # <<<<<<<<<<<<<<
+ *         if not hasBases(
+ *             <object> PyTuple_GET_ITEM(classes, i), PyList_GET_ITEM(bases, i)
+ */
+  __pyx_t_1 = PyTuple_GET_SIZE(__pyx_v_classes);
+  for (__pyx_v_i = 0; __pyx_v_i < __pyx_t_1; __pyx_v_i++) {
+
+    /* "protocols/_speedups.pyx":727
+ *     for i from 0 <= i < PyTuple_GET_SIZE(classes):
+ *         if not hasBases(
+ *             <object> PyTuple_GET_ITEM(classes, i), PyList_GET_ITEM(bases, i)             # <<<<<<<<<<<<<<
+ *         ):
+ *             return 0
+ */
+    __pyx_t_3 = PyTuple_GET_ITEM(__pyx_v_classes, __pyx_v_i);
+
+    /* "protocols/_speedups.pyx":726
+ * 
+ *     for i from 0 <= i < PyTuple_GET_SIZE(classes):
+ *         if not hasBases(             # <<<<<<<<<<<<<<
+ *             <object> PyTuple_GET_ITEM(classes, i), PyList_GET_ITEM(bases, i)
+ *         ):
+ */
+    __pyx_t_4 = __pyx_f_9protocols_9_speedups_hasBases(((PyObject *)__pyx_t_3), PyList_GET_ITEM(__pyx_v_bases, __pyx_v_i)); if (unlikely(__pyx_t_4 == ((int)-1))) __PYX_ERR(0, 726, __pyx_L1_error)
+    __pyx_t_2 = ((!(__pyx_t_4 != 0)) != 0);
+    if (__pyx_t_2) {
+
+      /* "protocols/_speedups.pyx":729
+ *             <object> PyTuple_GET_ITEM(classes, i), PyList_GET_ITEM(bases, i)
+ *         ):
+ *             return 0             # <<<<<<<<<<<<<<
+ * 
+ *     return 1
+ */
+      __pyx_r = 0;
+      goto __pyx_L0;
+
+      /* "protocols/_speedups.pyx":726
+ * 
+ *     for i from 0 <= i < PyTuple_GET_SIZE(classes):
+ *         if not hasBases(             # <<<<<<<<<<<<<<
+ *             <object> PyTuple_GET_ITEM(classes, i), PyList_GET_ITEM(bases, i)
+ *         ):
+ */
+    }
+  }
+
+  /* "protocols/_speedups.pyx":731
+ *             return 0
+ * 
+ *     return 1             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_r = 1;
+  goto __pyx_L0;
+
+  /* "protocols/_speedups.pyx":710
+ * 
+ * 
+ * cdef int sameClassicBases(cls, cached) except -1:             # <<<<<<<<<<<<<<
+ * 
+ *     # Are the '__bases__' of 'cls' and the classes in its cached MRO still
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("protocols._speedups.sameClassicBases", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "protocols/_speedups.pyx":734
+ * 
+ * 
+ * cdef object classicBases(cls):             # <<<<<<<<<<<<<<
+ * 
+ *     # '_classicBases()' in 'protocols.advice', for classic classes and
+ */
+
+static PyObject *__pyx_f_9protocols_9_speedups_classicBases(PyObject *__pyx_v_cls) {
+  void *__pyx_v_tmp;
+  PyObject *__pyx_v_key = NULL;
+  PyObject *__pyx_v_mro = NULL;
+  PyObject *__pyx_v_classes = NULL;
+  PyObject *__pyx_v_bases = NULL;
+  PyObject *__pyx_v_klass = NULL;
+  PyObject *__pyx_v_result = NULL;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  int __pyx_t_5;
+  int __pyx_t_6;
+  PyObject *__pyx_t_7 = NULL;
+  PyObject *__pyx_t_8 = NULL;
+  Py_ssize_t __pyx_t_9;
+  PyTypeObject *__pyx_t_10;
+  PyTypeObject *__pyx_t_11;
+  int __pyx_t_12;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("classicBases", 0);
+
+  /* "protocols/_speedups.pyx":744
+ *     cdef void *tmp
+ * 
+ *     try:             # <<<<<<<<<<<<<<
+ *         key = PyWeakref_NewRef(cls, NULL)
+ *     except TypeError:
+ */
+  {
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    __Pyx_ExceptionSave(&__pyx_t_1, &__pyx_t_2, &__pyx_t_3);
+    __Pyx_XGOTREF(__pyx_t_1);
+    __Pyx_XGOTREF(__pyx_t_2);
+    __Pyx_XGOTREF(__pyx_t_3);
+    /*try:*/ {
+
+      /* "protocols/_speedups.pyx":745
+ * 
+ *     try:
+ *         key = PyWeakref_NewRef(cls, NULL)             # <<<<<<<<<<<<<<
+ *     except TypeError:
+ *         key = None      # not weakly referenceable, so don't cache it
+ */
+      __pyx_t_4 = PyWeakref_NewRef(__pyx_v_cls, NULL); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 745, __pyx_L3_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      __pyx_v_key = __pyx_t_4;
+      __pyx_t_4 = 0;
+
+      /* "protocols/_speedups.pyx":744
+ *     cdef void *tmp
+ * 
+ *     try:             # <<<<<<<<<<<<<<
+ *         key = PyWeakref_NewRef(cls, NULL)
+ *     except TypeError:
+ */
+    }
+
+    /* "protocols/_speedups.pyx":749
+ *         key = None      # not weakly referenceable, so don't cache it
+ *     else:
+ *         tmp = PyDict_GetItem(_classicMROData, key)             # <<<<<<<<<<<<<<
+ *         if tmp:
+ *             if sameClassicBases(cls, <object> tmp):
+ */
+    /*else:*/ {
+      __pyx_t_4 = __pyx_v_9protocols_9_speedups__classicMROData;
+      __Pyx_INCREF(__pyx_t_4);
+      __pyx_v_tmp = PyDict_GetItem(__pyx_t_4, __pyx_v_key);
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+      /* "protocols/_speedups.pyx":750
+ *     else:
+ *         tmp = PyDict_GetItem(_classicMROData, key)
+ *         if tmp:             # <<<<<<<<<<<<<<
+ *             if sameClassicBases(cls, <object> tmp):
+ *                 return <object> tmp
+ */
+      __pyx_t_5 = (__pyx_v_tmp != 0);
+      if (__pyx_t_5) {
+
+        /* "protocols/_speedups.pyx":751
+ *         tmp = PyDict_GetItem(_classicMROData, key)
+ *         if tmp:
+ *             if sameClassicBases(cls, <object> tmp):             # <<<<<<<<<<<<<<
+ *                 return <object> tmp
+ * 
+ */
+        __pyx_t_6 = __pyx_f_9protocols_9_speedups_sameClassicBases(__pyx_v_cls, ((PyObject *)__pyx_v_tmp)); if (unlikely(__pyx_t_6 == ((int)-1))) __PYX_ERR(0, 751, __pyx_L5_except_error)
+        __pyx_t_5 = (__pyx_t_6 != 0);
+        if (__pyx_t_5) {
+
+          /* "protocols/_speedups.pyx":752
+ *         if tmp:
+ *             if sameClassicBases(cls, <object> tmp):
+ *                 return <object> tmp             # <<<<<<<<<<<<<<
+ * 
+ *     mro = []
+ */
+          __Pyx_XDECREF(__pyx_r);
+          __Pyx_INCREF(((PyObject *)__pyx_v_tmp));
+          __pyx_r = ((PyObject *)__pyx_v_tmp);
+          goto __pyx_L6_except_return;
+
+          /* "protocols/_speedups.pyx":751
+ *         tmp = PyDict_GetItem(_classicMROData, key)
+ *         if tmp:
+ *             if sameClassicBases(cls, <object> tmp):             # <<<<<<<<<<<<<<
+ *                 return <object> tmp
+ * 
+ */
+        }
+
+        /* "protocols/_speedups.pyx":750
+ *     else:
+ *         tmp = PyDict_GetItem(_classicMROData, key)
+ *         if tmp:             # <<<<<<<<<<<<<<
+ *             if sameClassicBases(cls, <object> tmp):
+ *                 return <object> tmp
+ */
+      }
+    }
+    __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+    goto __pyx_L8_try_end;
+    __pyx_L3_error:;
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+    /* "protocols/_speedups.pyx":746
+ *     try:
+ *         key = PyWeakref_NewRef(cls, NULL)
+ *     except TypeError:             # <<<<<<<<<<<<<<
+ *         key = None      # not weakly referenceable, so don't cache it
+ *     else:
+ */
+    __pyx_t_6 = __Pyx_PyErr_ExceptionMatches(__pyx_builtin_TypeError);
+    if (__pyx_t_6) {
+      __Pyx_AddTraceback("protocols._speedups.classicBases", __pyx_clineno, __pyx_lineno, __pyx_filename);
+      if (__Pyx_GetException(&__pyx_t_4, &__pyx_t_7, &__pyx_t_8) < 0) __PYX_ERR(0, 746, __pyx_L5_except_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      __Pyx_GOTREF(__pyx_t_7);
+      __Pyx_GOTREF(__pyx_t_8);
+
+      /* "protocols/_speedups.pyx":747
+ *         key = PyWeakref_NewRef(cls, NULL)
+ *     except TypeError:
+ *         key = None      # not weakly referenceable, so don't cache it             # <<<<<<<<<<<<<<
+ *     else:
+ *         tmp = PyDict_GetItem(_classicMROData, key)
+ */
+      __Pyx_INCREF(Py_None);
+      __Pyx_XDECREF_SET(__pyx_v_key, Py_None);
+      __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+      __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
+      __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
+      goto __pyx_L4_exception_handled;
+    }
+    goto __pyx_L5_except_error;
+    __pyx_L5_except_error:;
+
+    /* "protocols/_speedups.pyx":744
+ *     cdef void *tmp
+ * 
+ *     try:             # <<<<<<<<<<<<<<
+ *         key = PyWeakref_NewRef(cls, NULL)
+ *     except TypeError:
+ */
+    __Pyx_XGIVEREF(__pyx_t_1);
+    __Pyx_XGIVEREF(__pyx_t_2);
+    __Pyx_XGIVEREF(__pyx_t_3);
+    __Pyx_ExceptionReset(__pyx_t_1, __pyx_t_2, __pyx_t_3);
+    goto __pyx_L1_error;
+    __pyx_L6_except_return:;
+    __Pyx_XGIVEREF(__pyx_t_1);
+    __Pyx_XGIVEREF(__pyx_t_2);
+    __Pyx_XGIVEREF(__pyx_t_3);
+    __Pyx_ExceptionReset(__pyx_t_1, __pyx_t_2, __pyx_t_3);
+    goto __pyx_L0;
+    __pyx_L4_exception_handled:;
+    __Pyx_XGIVEREF(__pyx_t_1);
+    __Pyx_XGIVEREF(__pyx_t_2);
+    __Pyx_XGIVEREF(__pyx_t_3);
+    __Pyx_ExceptionReset(__pyx_t_1, __pyx_t_2, __pyx_t_3);
+    __pyx_L8_try_end:;
+  }
+
+  /* "protocols/_speedups.pyx":754
+ *                 return <object> tmp
+ * 
+ *     mro = []             # <<<<<<<<<<<<<<
+ *     if PyClass_Check(cls):
+ *         buildClassicMRO(<PyClassObject *>cls, <PyListObject *>mro)
+ */
+  __pyx_t_8 = PyList_New(0); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 754, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_8);
+  __pyx_v_mro = ((PyObject*)__pyx_t_8);
+  __pyx_t_8 = 0;
+
+  /* "protocols/_speedups.pyx":755
+ * 
+ *     mro = []
+ *     if PyClass_Check(cls):             # <<<<<<<<<<<<<<
+ *         buildClassicMRO(<PyClassObject *>cls, <PyListObject *>mro)
+ *     else:
+ */
+  __pyx_t_5 = (PyClass_Check(__pyx_v_cls) != 0);
+  if (__pyx_t_5) {
+
+    /* "protocols/_speedups.pyx":756
+ *     mro = []
+ *     if PyClass_Check(cls):
+ *         buildClassicMRO(<PyClassObject *>cls, <PyListObject *>mro)             # <<<<<<<<<<<<<<
+ *     else:
+ *         buildECMRO(cls, <PyListObject *>mro)
+ */
+    __pyx_t_8 = __pyx_f_9protocols_9_speedups_buildClassicMRO(((PyClassObject *)__pyx_v_cls), ((PyListObject *)__pyx_v_mro)); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 756, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_8);
+    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+
+    /* "protocols/_speedups.pyx":755
+ * 
+ *     mro = []
+ *     if PyClass_Check(cls):             # <<<<<<<<<<<<<<
+ *         buildClassicMRO(<PyClassObject *>cls, <PyListObject *>mro)
+ *     else:
+ */
+    goto __pyx_L13;
+  }
+
+  /* "protocols/_speedups.pyx":758
+ *         buildClassicMRO(<PyClassObject *>cls, <PyListObject *>mro)
+ *     else:
+ *         buildECMRO(cls, <PyListObject *>mro)             # <<<<<<<<<<<<<<
+ * 
+ *     classes = tuple(mro[1:])
+ */
+  /*else*/ {
+    __pyx_t_8 = __pyx_f_9protocols_9_speedups_buildECMRO(__pyx_v_cls, ((PyListObject *)__pyx_v_mro)); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 758, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_8);
+    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+  }
+  __pyx_L13:;
+
+  /* "protocols/_speedups.pyx":760
+ *         buildECMRO(cls, <PyListObject *>mro)
+ * 
+ *     classes = tuple(mro[1:])             # <<<<<<<<<<<<<<
+ *     bases = []
+ *     for klass in classes:
+ */
+  __pyx_t_8 = __Pyx_PyList_GetSlice(__pyx_v_mro, 1, PY_SSIZE_T_MAX); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 760, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_8);
+  __pyx_t_7 = PyList_AsTuple(((PyObject*)__pyx_t_8)); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 760, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+  __pyx_v_classes = ((PyObject*)__pyx_t_7);
+  __pyx_t_7 = 0;
+
+  /* "protocols/_speedups.pyx":761
+ * 
+ *     classes = tuple(mro[1:])
+ *     bases = []             # <<<<<<<<<<<<<<
+ *     for klass in classes:
+ *         PyList_Append(<PyListObject *>bases, basesOf(klass))
+ */
+  __pyx_t_7 = PyList_New(0); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 761, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_7);
+  __pyx_v_bases = ((PyObject*)__pyx_t_7);
+  __pyx_t_7 = 0;
+
+  /* "protocols/_speedups.pyx":762
+ *     classes = tuple(mro[1:])
+ *     bases = []
+ *     for klass in classes:             # <<<<<<<<<<<<<<
+ *         PyList_Append(<PyListObject *>bases, basesOf(klass))
+ * 
+ */
+  __pyx_t_7 = __pyx_v_classes; __Pyx_INCREF(__pyx_t_7); __pyx_t_9 = 0;
+  for (;;) {
+    if (__pyx_t_9 >= PyTuple_GET_SIZE(__pyx_t_7)) break;
+    #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+    __pyx_t_8 = PyTuple_GET_ITEM(__pyx_t_7, __pyx_t_9); __Pyx_INCREF(__pyx_t_8); __pyx_t_9++; if (unlikely(0 < 0)) __PYX_ERR(0, 762, __pyx_L1_error)
+    #else
+    __pyx_t_8 = PySequence_ITEM(__pyx_t_7, __pyx_t_9); __pyx_t_9++; if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 762, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_8);
+    #endif
+    __Pyx_XDECREF_SET(__pyx_v_klass, __pyx_t_8);
+    __pyx_t_8 = 0;
+
+    /* "protocols/_speedups.pyx":763
+ *     bases = []
+ *     for klass in classes:
+ *         PyList_Append(<PyListObject *>bases, basesOf(klass))             # <<<<<<<<<<<<<<
+ * 
+ *     result = (
+ */
+    __pyx_t_8 = __pyx_f_9protocols_9_speedups_basesOf(__pyx_v_klass); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 763, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_8);
+    __pyx_t_6 = PyList_Append(((PyListObject *)__pyx_v_bases), __pyx_t_8); if (unlikely(__pyx_t_6 == ((int)-1))) __PYX_ERR(0, 763, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+
+    /* "protocols/_speedups.pyx":762
+ *     classes = tuple(mro[1:])
+ *     bases = []
+ *     for klass in classes:             # <<<<<<<<<<<<<<
+ *         PyList_Append(<PyListObject *>bases, basesOf(klass))
+ * 
+ */
+  }
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+
+  /* "protocols/_speedups.pyx":766
+ * 
+ *     result = (
+ *         basesOf(cls), classes, bases,             # <<<<<<<<<<<<<<
+ *         classes + (<object> &PyInstance_Type, <object> &PyBaseObject_Type)
+ *     )
+ */
+  __pyx_t_7 = __pyx_f_9protocols_9_speedups_basesOf(__pyx_v_cls); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 766, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_7);
+
+  /* "protocols/_speedups.pyx":767
+ *     result = (
+ *         basesOf(cls), classes, bases,
+ *         classes + (<object> &PyInstance_Type, <object> &PyBaseObject_Type)             # <<<<<<<<<<<<<<
+ *     )
+ * 
+ */
+  __pyx_t_10 = (&PyInstance_Type);
+  __pyx_t_11 = (&PyBaseObject_Type);
+  __pyx_t_8 = PyTuple_New(2); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 767, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_8);
+  __Pyx_INCREF(((PyObject *)__pyx_t_10));
+  __Pyx_GIVEREF(((PyObject *)__pyx_t_10));
+  PyTuple_SET_ITEM(__pyx_t_8, 0, ((PyObject *)__pyx_t_10));
+  __Pyx_INCREF(((PyObject *)__pyx_t_11));
+  __Pyx_GIVEREF(((PyObject *)__pyx_t_11));
+  PyTuple_SET_ITEM(__pyx_t_8, 1, ((PyObject *)__pyx_t_11));
+  __pyx_t_4 = PyNumber_Add(__pyx_v_classes, __pyx_t_8); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 767, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+
+  /* "protocols/_speedups.pyx":766
+ * 
+ *     result = (
+ *         basesOf(cls), classes, bases,             # <<<<<<<<<<<<<<
+ *         classes + (<object> &PyInstance_Type, <object> &PyBaseObject_Type)
+ *     )
+ */
+  __pyx_t_8 = PyTuple_New(4); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 766, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_8);
+  __Pyx_GIVEREF(__pyx_t_7);
+  PyTuple_SET_ITEM(__pyx_t_8, 0, __pyx_t_7);
+  __Pyx_INCREF(__pyx_v_classes);
+  __Pyx_GIVEREF(__pyx_v_classes);
+  PyTuple_SET_ITEM(__pyx_t_8, 1, __pyx_v_classes);
+  __Pyx_INCREF(__pyx_v_bases);
+  __Pyx_GIVEREF(__pyx_v_bases);
+  PyTuple_SET_ITEM(__pyx_t_8, 2, __pyx_v_bases);
+  __Pyx_GIVEREF(__pyx_t_4);
+  PyTuple_SET_ITEM(__pyx_t_8, 3, __pyx_t_4);
+  __pyx_t_7 = 0;
+  __pyx_t_4 = 0;
+  __pyx_v_result = ((PyObject*)__pyx_t_8);
+  __pyx_t_8 = 0;
+
+  /* "protocols/_speedups.pyx":770
+ *     )
+ * 
+ *     if key is not None:             # <<<<<<<<<<<<<<
+ *         _classicMROs[cls] = result
+ * 
+ */
+  __pyx_t_5 = (__pyx_v_key != Py_None);
+  __pyx_t_12 = (__pyx_t_5 != 0);
+  if (__pyx_t_12) {
+
+    /* "protocols/_speedups.pyx":771
+ * 
+ *     if key is not None:
+ *         _classicMROs[cls] = result             # <<<<<<<<<<<<<<
+ * 
+ *     return result
+ */
+    if (unlikely(PyObject_SetItem(__pyx_v_9protocols_9_speedups__classicMROs, __pyx_v_cls, __pyx_v_result) < 0)) __PYX_ERR(0, 771, __pyx_L1_error)
+
+    /* "protocols/_speedups.pyx":770
+ *     )
+ * 
+ *     if key is not None:             # <<<<<<<<<<<<<<
+ *         _classicMROs[cls] = result
+ * 
+ */
+  }
+
+  /* "protocols/_speedups.pyx":773
+ *         _classicMROs[cls] = result
+ * 
+ *     return result             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v_result);
+  __pyx_r = __pyx_v_result;
+  goto __pyx_L0;
+
+  /* "protocols/_speedups.pyx":734
+ * 
+ * 
+ * cdef object classicBases(cls):             # <<<<<<<<<<<<<<
+ * 
+ *     # '_classicBases()' in 'protocols.advice', for classic classes and
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_XDECREF(__pyx_t_8);
+  __Pyx_AddTraceback("protocols._speedups.classicBases", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_key);
+  __Pyx_XDECREF(__pyx_v_mro);
+  __Pyx_XDECREF(__pyx_v_classes);
+  __Pyx_XDECREF(__pyx_v_bases);
+  __Pyx_XDECREF(__pyx_v_klass);
+  __Pyx_XDECREF(__pyx_v_result);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "protocols/_speedups.pyx":776
+ * 
+ * 
+ * cdef object cachedMRO(cls, extendedClassic):             # <<<<<<<<<<<<<<
+ *     cached = classicBases(cls)
+ *     if extendedClassic:
+ */
+
+static PyObject *__pyx_f_9protocols_9_speedups_cachedMRO(PyObject *__pyx_v_cls, PyObject *__pyx_v_extendedClassic) {
+  PyObject *__pyx_v_cached = NULL;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_t_2;
+  void *__pyx_t_3;
+  PyObject *__pyx_t_4 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("cachedMRO", 0);
+
+  /* "protocols/_speedups.pyx":777
+ * 
+ * cdef object cachedMRO(cls, extendedClassic):
+ *     cached = classicBases(cls)             # <<<<<<<<<<<<<<
+ *     if extendedClassic:
+ *         return (cls,) + <object> PyTuple_GET_ITEM(<PyTupleObject *>cached, 3)
+ */
+  __pyx_t_1 = __pyx_f_9protocols_9_speedups_classicBases(__pyx_v_cls); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 777, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_v_cached = __pyx_t_1;
+  __pyx_t_1 = 0;
+
+  /* "protocols/_speedups.pyx":778
+ * cdef object cachedMRO(cls, extendedClassic):
+ *     cached = classicBases(cls)
+ *     if extendedClassic:             # <<<<<<<<<<<<<<
+ *         return (cls,) + <object> PyTuple_GET_ITEM(<PyTupleObject *>cached, 3)
+ *     return (cls,) + <object> PyTuple_GET_ITEM(<PyTupleObject *>cached, 1)
+ */
+  __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_v_extendedClassic); if (unlikely(__pyx_t_2 < 0)) __PYX_ERR(0, 778, __pyx_L1_error)
+  if (__pyx_t_2) {
+
+    /* "protocols/_speedups.pyx":779
+ *     cached = classicBases(cls)
+ *     if extendedClassic:
+ *         return (cls,) + <object> PyTuple_GET_ITEM(<PyTupleObject *>cached, 3)             # <<<<<<<<<<<<<<
+ *     return (cls,) + <object> PyTuple_GET_ITEM(<PyTupleObject *>cached, 1)
+ * 
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_1 = PyTuple_New(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 779, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_INCREF(__pyx_v_cls);
+    __Pyx_GIVEREF(__pyx_v_cls);
+    PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_v_cls);
+    __pyx_t_3 = PyTuple_GET_ITEM(((PyTupleObject *)__pyx_v_cached), 3);
+    __pyx_t_4 = PyNumber_Add(__pyx_t_1, ((PyObject *)__pyx_t_3)); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 779, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_r = __pyx_t_4;
+    __pyx_t_4 = 0;
+    goto __pyx_L0;
+
+    /* "protocols/_speedups.pyx":778
+ * cdef object cachedMRO(cls, extendedClassic):
+ *     cached = classicBases(cls)
+ *     if extendedClassic:             # <<<<<<<<<<<<<<
+ *         return (cls,) + <object> PyTuple_GET_ITEM(<PyTupleObject *>cached, 3)
+ *     return (cls,) + <object> PyTuple_GET_ITEM(<PyTupleObject *>cached, 1)
+ */
+  }
+
+  /* "protocols/_speedups.pyx":780
+ *     if extendedClassic:
+ *         return (cls,) + <object> PyTuple_GET_ITEM(<PyTupleObject *>cached, 3)
+ *     return (cls,) + <object> PyTuple_GET_ITEM(<PyTupleObject *>cached, 1)             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 780, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_INCREF(__pyx_v_cls);
+  __Pyx_GIVEREF(__pyx_v_cls);
+  PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_v_cls);
+  __pyx_t_3 = PyTuple_GET_ITEM(((PyTupleObject *)__pyx_v_cached), 1);
+  __pyx_t_1 = PyNumber_Add(__pyx_t_4, ((PyObject *)__pyx_t_3)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 780, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "protocols/_speedups.pyx":776
+ * 
+ * 
+ * cdef object cachedMRO(cls, extendedClassic):             # <<<<<<<<<<<<<<
+ *     cached = classicBases(cls)
+ *     if extendedClassic:
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_AddTraceback("protocols._speedups.cachedMRO", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_cached);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "protocols/_speedups.pyx":783
+ * 
+ * 
+ * def classicMRO(ob, extendedClassic=False):             # <<<<<<<<<<<<<<
+ * 
+ *     if PyClass_Check(ob):
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_9protocols_9_speedups_23classicMRO(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static PyMethodDef __pyx_mdef_9protocols_9_speedups_23classicMRO = {"classicMRO", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_9protocols_9_speedups_23classicMRO, METH_VARARGS|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_9protocols_9_speedups_23classicMRO(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_ob = 0;
+  PyObject *__pyx_v_extendedClassic = 0;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("classicMRO (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_ob,&__pyx_n_s_extendedClassic,0};
+    PyObject* values[2] = {0,0};
+    values[1] = ((PyObject *)Py_False);
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_ob)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_extendedClassic);
+          if (value) { values[1] = value; kw_args--; }
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "classicMRO") < 0)) __PYX_ERR(0, 783, __pyx_L3_error)
+      }
+    } else {
+      switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+    }
+    __pyx_v_ob = values[0];
+    __pyx_v_extendedClassic = values[1];
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("classicMRO", 0, 1, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 783, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("protocols._speedups.classicMRO", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_9protocols_9_speedups_22classicMRO(__pyx_self, __pyx_v_ob, __pyx_v_extendedClassic);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_9protocols_9_speedups_22classicMRO(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ob, PyObject *__pyx_v_extendedClassic) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("classicMRO", 0);
+
+  /* "protocols/_speedups.pyx":785
+ * def classicMRO(ob, extendedClassic=False):
+ * 
+ *     if PyClass_Check(ob):             # <<<<<<<<<<<<<<
+ *         return cachedMRO(ob, extendedClassic)
+ * 
+ */
+  __pyx_t_1 = (PyClass_Check(__pyx_v_ob) != 0);
+  if (__pyx_t_1) {
+
+    /* "protocols/_speedups.pyx":786
+ * 
+ *     if PyClass_Check(ob):
+ *         return cachedMRO(ob, extendedClassic)             # <<<<<<<<<<<<<<
+ * 
+ *     raise TypeError("Not a classic class", ob)
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_2 = __pyx_f_9protocols_9_speedups_cachedMRO(__pyx_v_ob, __pyx_v_extendedClassic); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 786, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_r = __pyx_t_2;
+    __pyx_t_2 = 0;
+    goto __pyx_L0;
+
+    /* "protocols/_speedups.pyx":785
+ * def classicMRO(ob, extendedClassic=False):
+ * 
+ *     if PyClass_Check(ob):             # <<<<<<<<<<<<<<
+ *         return cachedMRO(ob, extendedClassic)
+ * 
+ */
+  }
+
+  /* "protocols/_speedups.pyx":788
+ *         return cachedMRO(ob, extendedClassic)
+ * 
+ *     raise TypeError("Not a classic class", ob)             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 788, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_INCREF(__pyx_kp_s_Not_a_classic_class);
+  __Pyx_GIVEREF(__pyx_kp_s_Not_a_classic_class);
+  PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_kp_s_Not_a_classic_class);
+  __Pyx_INCREF(__pyx_v_ob);
+  __Pyx_GIVEREF(__pyx_v_ob);
+  PyTuple_SET_ITEM(__pyx_t_2, 1, __pyx_v_ob);
+  __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_t_2, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 788, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_Raise(__pyx_t_3, 0, 0, 0);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __PYX_ERR(0, 788, __pyx_L1_error)
+
+  /* "protocols/_speedups.pyx":783
+ * 
+ * 
+ * def classicMRO(ob, extendedClassic=False):             # <<<<<<<<<<<<<<
+ * 
+ *     if PyClass_Check(ob):
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_AddTraceback("protocols._speedups.classicMRO", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "protocols/_speedups.pyx":791
+ * 
+ * 
+ * cdef buildECMRO(object cls, PyListObject *list):             # <<<<<<<<<<<<<<
+ *     PyList_Append(list, cls)
+ *     for i in cls.__bases__:
+ */
+
+static PyObject *__pyx_f_9protocols_9_speedups_buildECMRO(PyObject *__pyx_v_cls, PyListObject *__pyx_v_list) {
+  PyObject *__pyx_v_i = NULL;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  Py_ssize_t __pyx_t_4;
+  PyObject *(*__pyx_t_5)(PyObject *);
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("buildECMRO", 0);
+
+  /* "protocols/_speedups.pyx":792
+ * 
+ * cdef buildECMRO(object cls, PyListObject *list):
+ *     PyList_Append(list, cls)             # <<<<<<<<<<<<<<
+ *     for i in cls.__bases__:
+ *         buildECMRO(i, list)
+ */
+  __pyx_t_1 = PyList_Append(__pyx_v_list, __pyx_v_cls); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(0, 792, __pyx_L1_error)
+
+  /* "protocols/_speedups.pyx":793
+ * cdef buildECMRO(object cls, PyListObject *list):
+ *     PyList_Append(list, cls)
+ *     for i in cls.__bases__:             # <<<<<<<<<<<<<<
+ *         buildECMRO(i, list)
+ * 
+ */
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_cls, __pyx_n_s_bases); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 793, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (likely(PyList_CheckExact(__pyx_t_2)) || PyTuple_CheckExact(__pyx_t_2)) {
+    __pyx_t_3 = __pyx_t_2; __Pyx_INCREF(__pyx_t_3); __pyx_t_4 = 0;
+    __pyx_t_5 = NULL;
+  } else {
+    __pyx_t_4 = -1; __pyx_t_3 = PyObject_GetIter(__pyx_t_2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 793, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_5 = Py_TYPE(__pyx_t_3)->tp_iternext; if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 793, __pyx_L1_error)
+  }
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  for (;;) {
+    if (likely(!__pyx_t_5)) {
+      if (likely(PyList_CheckExact(__pyx_t_3))) {
+        if (__pyx_t_4 >= PyList_GET_SIZE(__pyx_t_3)) break;
+        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+        __pyx_t_2 = PyList_GET_ITEM(__pyx_t_3, __pyx_t_4); __Pyx_INCREF(__pyx_t_2); __pyx_t_4++; if (unlikely(0 < 0)) __PYX_ERR(0, 793, __pyx_L1_error)
+        #else
+        __pyx_t_2 = PySequence_ITEM(__pyx_t_3, __pyx_t_4); __pyx_t_4++; if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 793, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_2);
+        #endif
+      } else {
+        if (__pyx_t_4 >= PyTuple_GET_SIZE(__pyx_t_3)) break;
+        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+        __pyx_t_2 = PyTuple_GET_ITEM(__pyx_t_3, __pyx_t_4); __Pyx_INCREF(__pyx_t_2); __pyx_t_4++; if (unlikely(0 < 0)) __PYX_ERR(0, 793, __pyx_L1_error)
+        #else
+        __pyx_t_2 = PySequence_ITEM(__pyx_t_3, __pyx_t_4); __pyx_t_4++; if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 793, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_2);
+        #endif
+      }
+    } else {
+      __pyx_t_2 = __pyx_t_5(__pyx_t_3);
+      if (unlikely(!__pyx_t_2)) {
+        PyObject* exc_type = PyErr_Occurred();
+        if (exc_type) {
+          if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
+          else __PYX_ERR(0, 793, __pyx_L1_error)
+        }
+        break;
+      }
+      __Pyx_GOTREF(__pyx_t_2);
+    }
+    __Pyx_XDECREF_SET(__pyx_v_i, __pyx_t_2);
+    __pyx_t_2 = 0;
+
+    /* "protocols/_speedups.pyx":794
+ *     PyList_Append(list, cls)
+ *     for i in cls.__bases__:
+ *         buildECMRO(i, list)             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+    __pyx_t_2 = __pyx_f_9protocols_9_speedups_buildECMRO(__pyx_v_i, __pyx_v_list); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 794, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+    /* "protocols/_speedups.pyx":793
+ * cdef buildECMRO(object cls, PyListObject *list):
+ *     PyList_Append(list, cls)
+ *     for i in cls.__bases__:             # <<<<<<<<<<<<<<
+ *         buildECMRO(i, list)
+ * 
+ */
+  }
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+  /* "protocols/_speedups.pyx":791
+ * 
+ * 
+ * cdef buildECMRO(object cls, PyListObject *list):             # <<<<<<<<<<<<<<
+ *     PyList_Append(list, cls)
+ *     for i in cls.__bases__:
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_AddTraceback("protocols._speedups.buildECMRO", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_i);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "protocols/_speedups.pyx":797
+ * 
+ * 
+ * def extClassMRO(ob, extendedClassic=False):             # <<<<<<<<<<<<<<
+ *     return cachedMRO(ob, extendedClassic)
+ * 
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_9protocols_9_speedups_25extClassMRO(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static PyMethodDef __pyx_mdef_9protocols_9_speedups_25extClassMRO = {"extClassMRO", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_9protocols_9_speedups_25extClassMRO, METH_VARARGS|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_9protocols_9_speedups_25extClassMRO(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_ob = 0;
+  PyObject *__pyx_v_extendedClassic = 0;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("extClassMRO (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_ob,&__pyx_n_s_extendedClassic,0};
+    PyObject* values[2] = {0,0};
+    values[1] = ((PyObject *)Py_False);
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_ob)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_extendedClassic);
+          if (value) { values[1] = value; kw_args--; }
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "extClassMRO") < 0)) __PYX_ERR(0, 797, __pyx_L3_error)
+      }
+    } else {
+      switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+    }
+    __pyx_v_ob = values[0];
+    __pyx_v_extendedClassic = values[1];
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("extClassMRO", 0, 1, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 797, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("protocols._speedups.extClassMRO", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_9protocols_9_speedups_24extClassMRO(__pyx_self, __pyx_v_ob, __pyx_v_extendedClassic);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_9protocols_9_speedups_24extClassMRO(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ob, PyObject *__pyx_v_extendedClassic) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("extClassMRO", 0);
+
+  /* "protocols/_speedups.pyx":798
+ * 
+ * def extClassMRO(ob, extendedClassic=False):
+ *     return cachedMRO(ob, extendedClassic)             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __pyx_f_9protocols_9_speedups_cachedMRO(__pyx_v_ob, __pyx_v_extendedClassic); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 798, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "protocols/_speedups.pyx":797
+ * 
+ * 
+ * def extClassMRO(ob, extendedClassic=False):             # <<<<<<<<<<<<<<
+ *     return cachedMRO(ob, extendedClassic)
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("protocols._speedups.extClassMRO", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "protocols/_speedups.pyx":802
+ * 
+ * 
+ * def getMRO(ob, extendedClassic=False):             # <<<<<<<<<<<<<<
+ * 
+ *     if PyClass_Check(ob):
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_9protocols_9_speedups_27getMRO(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static PyMethodDef __pyx_mdef_9protocols_9_speedups_27getMRO = {"getMRO", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_9protocols_9_speedups_27getMRO, METH_VARARGS|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_9protocols_9_speedups_27getMRO(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_ob = 0;
+  PyObject *__pyx_v_extendedClassic = 0;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("getMRO (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_ob,&__pyx_n_s_extendedClassic,0};
+    PyObject* values[2] = {0,0};
+    values[1] = ((PyObject *)Py_False);
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_ob)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_extendedClassic);
+          if (value) { values[1] = value; kw_args--; }
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "getMRO") < 0)) __PYX_ERR(0, 802, __pyx_L3_error)
+      }
+    } else {
+      switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+    }
+    __pyx_v_ob = values[0];
+    __pyx_v_extendedClassic = values[1];
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("getMRO", 0, 1, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 802, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("protocols._speedups.getMRO", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_9protocols_9_speedups_26getMRO(__pyx_self, __pyx_v_ob, __pyx_v_extendedClassic);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_9protocols_9_speedups_26getMRO(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ob, PyObject *__pyx_v_extendedClassic) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  int __pyx_t_5;
+  PyObject *__pyx_t_6 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("getMRO", 0);
+
+  /* "protocols/_speedups.pyx":804
+ * def getMRO(ob, extendedClassic=False):
+ * 
+ *     if PyClass_Check(ob):             # <<<<<<<<<<<<<<
+ *         return classicMRO(ob,extendedClassic)
+ * 
+ */
+  __pyx_t_1 = (PyClass_Check(__pyx_v_ob) != 0);
+  if (__pyx_t_1) {
+
+    /* "protocols/_speedups.pyx":805
+ * 
+ *     if PyClass_Check(ob):
+ *         return classicMRO(ob,extendedClassic)             # <<<<<<<<<<<<<<
+ * 
+ *     elif PyType_Check(ob):
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_classicMRO); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 805, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_4 = NULL;
+    __pyx_t_5 = 0;
+    if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
+      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+      if (likely(__pyx_t_4)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+        __Pyx_INCREF(__pyx_t_4);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_3, function);
+        __pyx_t_5 = 1;
+      }
+    }
+    #if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(__pyx_t_3)) {
+      PyObject *__pyx_temp[3] = {__pyx_t_4, __pyx_v_ob, __pyx_v_extendedClassic};
+      __pyx_t_2 = __Pyx_PyFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_5, 2+__pyx_t_5); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 805, __pyx_L1_error)
+      __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+      __Pyx_GOTREF(__pyx_t_2);
+    } else
+    #endif
+    #if CYTHON_FAST_PYCCALL
+    if (__Pyx_PyFastCFunction_Check(__pyx_t_3)) {
+      PyObject *__pyx_temp[3] = {__pyx_t_4, __pyx_v_ob, __pyx_v_extendedClassic};
+      __pyx_t_2 = __Pyx_PyCFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_5, 2+__pyx_t_5); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 805, __pyx_L1_error)
+      __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+      __Pyx_GOTREF(__pyx_t_2);
+    } else
+    #endif
+    {
+      __pyx_t_6 = PyTuple_New(2+__pyx_t_5); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 805, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_6);
+      if (__pyx_t_4) {
+        __Pyx_GIVEREF(__pyx_t_4); PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_t_4); __pyx_t_4 = NULL;
+      }
+      __Pyx_INCREF(__pyx_v_ob);
+      __Pyx_GIVEREF(__pyx_v_ob);
+      PyTuple_SET_ITEM(__pyx_t_6, 0+__pyx_t_5, __pyx_v_ob);
+      __Pyx_INCREF(__pyx_v_extendedClassic);
+      __Pyx_GIVEREF(__pyx_v_extendedClassic);
+      PyTuple_SET_ITEM(__pyx_t_6, 1+__pyx_t_5, __pyx_v_extendedClassic);
+      __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_6, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 805, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_2);
+      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    }
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __pyx_r = __pyx_t_2;
+    __pyx_t_2 = 0;
+    goto __pyx_L0;
+
+    /* "protocols/_speedups.pyx":804
+ * def getMRO(ob, extendedClassic=False):
+ * 
+ *     if PyClass_Check(ob):             # <<<<<<<<<<<<<<
+ *         return classicMRO(ob,extendedClassic)
+ * 
+ */
+  }
+
+  /* "protocols/_speedups.pyx":807
+ *         return classicMRO(ob,extendedClassic)
+ * 
+ *     elif PyType_Check(ob):             # <<<<<<<<<<<<<<
+ *         return ob.__mro__
+ * 
+ */
+  __pyx_t_1 = (PyType_Check(__pyx_v_ob) != 0);
+  if (__pyx_t_1) {
+
+    /* "protocols/_speedups.pyx":808
+ * 
+ *     elif PyType_Check(ob):
+ *         return ob.__mro__             # <<<<<<<<<<<<<<
+ * 
+ *     elif PyObject_TypeCheck(ob,__ECType):
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_ob, __pyx_n_s_mro); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 808, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_r = __pyx_t_2;
+    __pyx_t_2 = 0;
+    goto __pyx_L0;
+
+    /* "protocols/_speedups.pyx":807
+ *         return classicMRO(ob,extendedClassic)
+ * 
+ *     elif PyType_Check(ob):             # <<<<<<<<<<<<<<
+ *         return ob.__mro__
+ * 
+ */
+  }
+
+  /* "protocols/_speedups.pyx":810
+ *         return ob.__mro__
+ * 
+ *     elif PyObject_TypeCheck(ob,__ECType):             # <<<<<<<<<<<<<<
+ *         return extClassMRO(ob, extendedClassic)
+ * 
+ */
+  __pyx_t_2 = __pyx_v_9protocols_9_speedups___ECType;
+  __Pyx_INCREF(__pyx_t_2);
+  __pyx_t_1 = (PyObject_TypeCheck(__pyx_v_ob, __pyx_t_2) != 0);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  if (__pyx_t_1) {
+
+    /* "protocols/_speedups.pyx":811
+ * 
+ *     elif PyObject_TypeCheck(ob,__ECType):
+ *         return extClassMRO(ob, extendedClassic)             # <<<<<<<<<<<<<<
+ * 
+ *     return ob,
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_extClassMRO); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 811, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_6 = NULL;
+    __pyx_t_5 = 0;
+    if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
+      __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_3);
+      if (likely(__pyx_t_6)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+        __Pyx_INCREF(__pyx_t_6);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_3, function);
+        __pyx_t_5 = 1;
+      }
+    }
+    #if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(__pyx_t_3)) {
+      PyObject *__pyx_temp[3] = {__pyx_t_6, __pyx_v_ob, __pyx_v_extendedClassic};
+      __pyx_t_2 = __Pyx_PyFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_5, 2+__pyx_t_5); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 811, __pyx_L1_error)
+      __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+      __Pyx_GOTREF(__pyx_t_2);
+    } else
+    #endif
+    #if CYTHON_FAST_PYCCALL
+    if (__Pyx_PyFastCFunction_Check(__pyx_t_3)) {
+      PyObject *__pyx_temp[3] = {__pyx_t_6, __pyx_v_ob, __pyx_v_extendedClassic};
+      __pyx_t_2 = __Pyx_PyCFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_5, 2+__pyx_t_5); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 811, __pyx_L1_error)
+      __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+      __Pyx_GOTREF(__pyx_t_2);
+    } else
+    #endif
+    {
+      __pyx_t_4 = PyTuple_New(2+__pyx_t_5); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 811, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      if (__pyx_t_6) {
+        __Pyx_GIVEREF(__pyx_t_6); PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_6); __pyx_t_6 = NULL;
+      }
+      __Pyx_INCREF(__pyx_v_ob);
+      __Pyx_GIVEREF(__pyx_v_ob);
+      PyTuple_SET_ITEM(__pyx_t_4, 0+__pyx_t_5, __pyx_v_ob);
+      __Pyx_INCREF(__pyx_v_extendedClassic);
+      __Pyx_GIVEREF(__pyx_v_extendedClassic);
+      PyTuple_SET_ITEM(__pyx_t_4, 1+__pyx_t_5, __pyx_v_extendedClassic);
+      __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_4, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 811, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_2);
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    }
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __pyx_r = __pyx_t_2;
+    __pyx_t_2 = 0;
+    goto __pyx_L0;
+
+    /* "protocols/_speedups.pyx":810
+ *         return ob.__mro__
+ * 
+ *     elif PyObject_TypeCheck(ob,__ECType):             # <<<<<<<<<<<<<<
+ *         return extClassMRO(ob, extendedClassic)
+ * 
+ */
+  }
+
+  /* "protocols/_speedups.pyx":813
+ *         return extClassMRO(ob, extendedClassic)
+ * 
+ *     return ob,             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 813, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_INCREF(__pyx_v_ob);
+  __Pyx_GIVEREF(__pyx_v_ob);
+  PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_v_ob);
+  __pyx_r = __pyx_t_2;
+  __pyx_t_2 = 0;
+  goto __pyx_L0;
+
+  /* "protocols/_speedups.pyx":802
+ * 
+ * 
+ * def getMRO(ob, extendedClassic=False):             # <<<<<<<<<<<<<<
+ * 
+ *     if PyClass_Check(ob):
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_AddTraceback("protocols._speedups.getMRO", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "protocols/_speedups.pyx":827
+ * 
+ * 
+ * cdef object getClass(obj):             # <<<<<<<<<<<<<<
+ * 
+ *     cdef void *tmp
+ */
+
+static PyObject *__pyx_f_9protocols_9_speedups_getClass(PyObject *__pyx_v_obj) {
+  void *__pyx_v_tmp;
+  PyTypeObject *__pyx_v_tp;
+  PyObject *__pyx_v_cls = NULL;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  PyTypeObject *__pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_t_4;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("getClass", 0);
+
+  /* "protocols/_speedups.pyx":832
+ *     cdef PyTypeObject *tp
+ * 
+ *     if PyInstance_Check(obj):             # <<<<<<<<<<<<<<
+ *         return <object> ((<PyInstanceObject *>obj).in_class)
+ * 
+ */
+  __pyx_t_1 = (PyInstance_Check(__pyx_v_obj) != 0);
+  if (__pyx_t_1) {
+
+    /* "protocols/_speedups.pyx":833
+ * 
+ *     if PyInstance_Check(obj):
+ *         return <object> ((<PyInstanceObject *>obj).in_class)             # <<<<<<<<<<<<<<
+ * 
+ *     # If the type uses the generic getattr and inherits 'object.__class__',
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_INCREF(((PyObject *)((PyInstanceObject *)__pyx_v_obj)->in_class));
+    __pyx_r = ((PyObject *)((PyInstanceObject *)__pyx_v_obj)->in_class);
+    goto __pyx_L0;
+
+    /* "protocols/_speedups.pyx":832
+ *     cdef PyTypeObject *tp
+ * 
+ *     if PyInstance_Check(obj):             # <<<<<<<<<<<<<<
+ *         return <object> ((<PyInstanceObject *>obj).in_class)
+ * 
+ */
+  }
+
+  /* "protocols/_speedups.pyx":839
+ *     # (This check is cheap, since '_PyType_Lookup()' uses the type's
+ *     # attribute cache, which is also invalidated if the class changes.)
+ *     tp = (<PyObject *>obj).ob_type             # <<<<<<<<<<<<<<
+ *     if tp.tp_getattro == PyBaseObject_Type.tp_getattro:
+ *         if _PyType_Lookup(tp, __class) == _objectClass:
+ */
+  __pyx_t_2 = ((PyObject *)__pyx_v_obj)->ob_type;
+  __pyx_v_tp = __pyx_t_2;
+
+  /* "protocols/_speedups.pyx":840
+ *     # attribute cache, which is also invalidated if the class changes.)
+ *     tp = (<PyObject *>obj).ob_type
+ *     if tp.tp_getattro == PyBaseObject_Type.tp_getattro:             # <<<<<<<<<<<<<<
+ *         if _PyType_Lookup(tp, __class) == _objectClass:
+ *             return <object> tp
+ */
+  __pyx_t_1 = ((__pyx_v_tp->tp_getattro == PyBaseObject_Type.tp_getattro) != 0);
+  if (__pyx_t_1) {
+
+    /* "protocols/_speedups.pyx":841
+ *     tp = (<PyObject *>obj).ob_type
+ *     if tp.tp_getattro == PyBaseObject_Type.tp_getattro:
+ *         if _PyType_Lookup(tp, __class) == _objectClass:             # <<<<<<<<<<<<<<
+ *             return <object> tp
+ * 
+ */
+    __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_class); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 841, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_1 = ((_PyType_Lookup(__pyx_v_tp, __pyx_t_3) == __pyx_v_9protocols_9_speedups__objectClass) != 0);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    if (__pyx_t_1) {
+
+      /* "protocols/_speedups.pyx":842
+ *     if tp.tp_getattro == PyBaseObject_Type.tp_getattro:
+ *         if _PyType_Lookup(tp, __class) == _objectClass:
+ *             return <object> tp             # <<<<<<<<<<<<<<
+ * 
+ *     # Otherwise use __class__ instead of type to support proxies
+ */
+      __Pyx_XDECREF(__pyx_r);
+      __Pyx_INCREF(((PyObject *)__pyx_v_tp));
+      __pyx_r = ((PyObject *)__pyx_v_tp);
+      goto __pyx_L0;
+
+      /* "protocols/_speedups.pyx":841
+ *     tp = (<PyObject *>obj).ob_type
+ *     if tp.tp_getattro == PyBaseObject_Type.tp_getattro:
+ *         if _PyType_Lookup(tp, __class) == _objectClass:             # <<<<<<<<<<<<<<
+ *             return <object> tp
+ * 
+ */
+    }
+
+    /* "protocols/_speedups.pyx":840
+ *     # attribute cache, which is also invalidated if the class changes.)
+ *     tp = (<PyObject *>obj).ob_type
+ *     if tp.tp_getattro == PyBaseObject_Type.tp_getattro:             # <<<<<<<<<<<<<<
+ *         if _PyType_Lookup(tp, __class) == _objectClass:
+ *             return <object> tp
+ */
+  }
+
+  /* "protocols/_speedups.pyx":845
+ * 
+ *     # Otherwise use __class__ instead of type to support proxies
+ *     tmp = PyObject_GetAttr(obj, __class)             # <<<<<<<<<<<<<<
+ * 
+ *     if tmp:
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_class); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 845, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_v_tmp = PyObject_GetAttr(__pyx_v_obj, __pyx_t_3);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+  /* "protocols/_speedups.pyx":847
+ *     tmp = PyObject_GetAttr(obj, __class)
+ * 
+ *     if tmp:             # <<<<<<<<<<<<<<
+ *         cls = <object> tmp
+ *         Py_DECREF(<PyObject *>tmp)
+ */
+  __pyx_t_1 = (__pyx_v_tmp != 0);
+  if (__pyx_t_1) {
+
+    /* "protocols/_speedups.pyx":848
+ * 
+ *     if tmp:
+ *         cls = <object> tmp             # <<<<<<<<<<<<<<
+ *         Py_DECREF(<PyObject *>tmp)
+ *         return cls
+ */
+    __pyx_t_3 = ((PyObject *)__pyx_v_tmp);
+    __Pyx_INCREF(__pyx_t_3);
+    __pyx_v_cls = __pyx_t_3;
+    __pyx_t_3 = 0;
+
+    /* "protocols/_speedups.pyx":849
+ *     if tmp:
+ *         cls = <object> tmp
+ *         Py_DECREF(<PyObject *>tmp)             # <<<<<<<<<<<<<<
+ *         return cls
+ * 
+ */
+    Py_DECREF(((PyObject *)__pyx_v_tmp));
+
+    /* "protocols/_speedups.pyx":850
+ *         cls = <object> tmp
+ *         Py_DECREF(<PyObject *>tmp)
+ *         return cls             # <<<<<<<<<<<<<<
+ * 
+ *     elif PyErr_ExceptionMatches(PyExc_AttributeError):
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_INCREF(__pyx_v_cls);
+    __pyx_r = __pyx_v_cls;
+    goto __pyx_L0;
+
+    /* "protocols/_speedups.pyx":847
+ *     tmp = PyObject_GetAttr(obj, __class)
+ * 
+ *     if tmp:             # <<<<<<<<<<<<<<
+ *         cls = <object> tmp
+ *         Py_DECREF(<PyObject *>tmp)
+ */
+  }
+
+  /* "protocols/_speedups.pyx":852
+ *         return cls
+ * 
+ *     elif PyErr_ExceptionMatches(PyExc_AttributeError):             # <<<<<<<<<<<<<<
+ *         # Some object have no __class__; use their type
+ *         PyErr_Clear()
+ */
+  __pyx_t_1 = (PyErr_ExceptionMatches(PyExc_AttributeError) != 0);
+  if (__pyx_t_1) {
+
+    /* "protocols/_speedups.pyx":854
+ *     elif PyErr_ExceptionMatches(PyExc_AttributeError):
+ *         # Some object have no __class__; use their type
+ *         PyErr_Clear()             # <<<<<<<<<<<<<<
+ *         return <object> (<PyObject *>obj).ob_type
+ * 
+ */
+    PyErr_Clear();
+
+    /* "protocols/_speedups.pyx":855
+ *         # Some object have no __class__; use their type
+ *         PyErr_Clear()
+ *         return <object> (<PyObject *>obj).ob_type             # <<<<<<<<<<<<<<
+ * 
+ *     else:
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_INCREF(((PyObject *)((PyObject *)__pyx_v_obj)->ob_type));
+    __pyx_r = ((PyObject *)((PyObject *)__pyx_v_obj)->ob_type);
+    goto __pyx_L0;
+
+    /* "protocols/_speedups.pyx":852
+ *         return cls
+ * 
+ *     elif PyErr_ExceptionMatches(PyExc_AttributeError):             # <<<<<<<<<<<<<<
+ *         # Some object have no __class__; use their type
+ *         PyErr_Clear()
+ */
+  }
+
+  /* "protocols/_speedups.pyx":859
+ *     else:
+ *         # Some other error, pass it on up the line
+ *         reraise()             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  /*else*/ {
+    __pyx_t_4 = __pyx_f_9protocols_9_speedups_reraise(); if (unlikely(__pyx_t_4 == ((int)-1))) __PYX_ERR(0, 859, __pyx_L1_error)
+  }
+
+  /* "protocols/_speedups.pyx":827
+ * 
+ * 
+ * cdef object getClass(obj):             # <<<<<<<<<<<<<<
+ * 
+ *     cdef void *tmp
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_AddTraceback("protocols._speedups.getClass", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_cls);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "protocols/_speedups.pyx":862
+ * 
+ * 
+ * cdef object classMRO(cls):             # <<<<<<<<<<<<<<
+ * 
+ *     # Return the MRO used to look up adapters for instances of 'cls'
+ */
+
+static PyObject *__pyx_f_9protocols_9_speedups_classMRO(PyObject *__pyx_v_cls) {
+  void *__pyx_v_tmp;
+  PyObject *__pyx_v_mro = NULL;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  int __pyx_t_3;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("classMRO", 0);
+
+  /* "protocols/_speedups.pyx":868
+ *     cdef void *tmp
+ * 
+ *     if PyType_Check(cls):             # <<<<<<<<<<<<<<
+ *         # It's a type, we can use its mro directly
+ *         tmp = <void *> ((<PyTypeObject *>cls).tp_mro)
+ */
+  __pyx_t_1 = (PyType_Check(__pyx_v_cls) != 0);
+  if (__pyx_t_1) {
+
+    /* "protocols/_speedups.pyx":870
+ *     if PyType_Check(cls):
+ *         # It's a type, we can use its mro directly
+ *         tmp = <void *> ((<PyTypeObject *>cls).tp_mro)             # <<<<<<<<<<<<<<
+ *         if tmp:
+ *             return <object> tmp
+ */
+    __pyx_v_tmp = ((void *)((PyTypeObject *)__pyx_v_cls)->tp_mro);
+
+    /* "protocols/_speedups.pyx":871
+ *         # It's a type, we can use its mro directly
+ *         tmp = <void *> ((<PyTypeObject *>cls).tp_mro)
+ *         if tmp:             # <<<<<<<<<<<<<<
+ *             return <object> tmp
+ * 
+ */
+    __pyx_t_1 = (__pyx_v_tmp != 0);
+    if (__pyx_t_1) {
+
+      /* "protocols/_speedups.pyx":872
+ *         tmp = <void *> ((<PyTypeObject *>cls).tp_mro)
+ *         if tmp:
+ *             return <object> tmp             # <<<<<<<<<<<<<<
+ * 
+ *     if PyClass_Check(cls):
+ */
+      __Pyx_XDECREF(__pyx_r);
+      __Pyx_INCREF(((PyObject *)__pyx_v_tmp));
+      __pyx_r = ((PyObject *)__pyx_v_tmp);
+      goto __pyx_L0;
+
+      /* "protocols/_speedups.pyx":871
+ *         # It's a type, we can use its mro directly
+ *         tmp = <void *> ((<PyTypeObject *>cls).tp_mro)
+ *         if tmp:             # <<<<<<<<<<<<<<
+ *             return <object> tmp
+ * 
+ */
+    }
+
+    /* "protocols/_speedups.pyx":868
+ *     cdef void *tmp
+ * 
+ *     if PyType_Check(cls):             # <<<<<<<<<<<<<<
+ *         # It's a type, we can use its mro directly
+ *         tmp = <void *> ((<PyTypeObject *>cls).tp_mro)
+ */
+  }
+
+  /* "protocols/_speedups.pyx":874
+ *             return <object> tmp
+ * 
+ *     if PyClass_Check(cls):             # <<<<<<<<<<<<<<
+ *         # It's a classic class, use its cached MRO
+ *         return cachedMRO(cls, 1)
+ */
+  __pyx_t_1 = (PyClass_Check(__pyx_v_cls) != 0);
+  if (__pyx_t_1) {
+
+    /* "protocols/_speedups.pyx":876
+ *     if PyClass_Check(cls):
+ *         # It's a classic class, use its cached MRO
+ *         return cachedMRO(cls, 1)             # <<<<<<<<<<<<<<
+ * 
+ *     # Fallback to getting __mro__ (for e.g. security proxies/ExtensionClass)
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_2 = __pyx_f_9protocols_9_speedups_cachedMRO(__pyx_v_cls, __pyx_int_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 876, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_r = __pyx_t_2;
+    __pyx_t_2 = 0;
+    goto __pyx_L0;
+
+    /* "protocols/_speedups.pyx":874
+ *             return <object> tmp
+ * 
+ *     if PyClass_Check(cls):             # <<<<<<<<<<<<<<
+ *         # It's a classic class, use its cached MRO
+ *         return cachedMRO(cls, 1)
+ */
+  }
+
+  /* "protocols/_speedups.pyx":879
+ * 
+ *     # Fallback to getting __mro__ (for e.g. security proxies/ExtensionClass)
+ *     tmp = PyObject_GetAttr(cls, __mro)             # <<<<<<<<<<<<<<
+ *     if tmp:
+ *         mro = <object> tmp
+ */
+  __pyx_t_2 = __pyx_v_9protocols_9_speedups___mro;
+  __Pyx_INCREF(__pyx_t_2);
+  __pyx_v_tmp = PyObject_GetAttr(__pyx_v_cls, __pyx_t_2);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "protocols/_speedups.pyx":880
+ *     # Fallback to getting __mro__ (for e.g. security proxies/ExtensionClass)
+ *     tmp = PyObject_GetAttr(cls, __mro)
+ *     if tmp:             # <<<<<<<<<<<<<<
+ *         mro = <object> tmp
+ *         Py_DECREF(<PyObject *>tmp)
+ */
+  __pyx_t_1 = (__pyx_v_tmp != 0);
+  if (__pyx_t_1) {
+
+    /* "protocols/_speedups.pyx":881
+ *     tmp = PyObject_GetAttr(cls, __mro)
+ *     if tmp:
+ *         mro = <object> tmp             # <<<<<<<<<<<<<<
+ *         Py_DECREF(<PyObject *>tmp)
+ *         return mro
+ */
+    __pyx_t_2 = ((PyObject *)__pyx_v_tmp);
+    __Pyx_INCREF(__pyx_t_2);
+    __pyx_v_mro = __pyx_t_2;
+    __pyx_t_2 = 0;
+
+    /* "protocols/_speedups.pyx":882
+ *     if tmp:
+ *         mro = <object> tmp
+ *         Py_DECREF(<PyObject *>tmp)             # <<<<<<<<<<<<<<
+ *         return mro
+ * 
+ */
+    Py_DECREF(((PyObject *)__pyx_v_tmp));
+
+    /* "protocols/_speedups.pyx":883
+ *         mro = <object> tmp
+ *         Py_DECREF(<PyObject *>tmp)
+ *         return mro             # <<<<<<<<<<<<<<
+ * 
+ *     # No __mro__?  Is it an ExtensionClass?
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_INCREF(__pyx_v_mro);
+    __pyx_r = __pyx_v_mro;
+    goto __pyx_L0;
+
+    /* "protocols/_speedups.pyx":880
+ *     # Fallback to getting __mro__ (for e.g. security proxies/ExtensionClass)
+ *     tmp = PyObject_GetAttr(cls, __mro)
+ *     if tmp:             # <<<<<<<<<<<<<<
+ *         mro = <object> tmp
+ *         Py_DECREF(<PyObject *>tmp)
+ */
+  }
+
+  /* "protocols/_speedups.pyx":886
+ * 
+ *     # No __mro__?  Is it an ExtensionClass?
+ *     elif PyObject_TypeCheck(cls,__ECType):             # <<<<<<<<<<<<<<
+ *         # Yep, toss out the error and compute a reasonable MRO
+ *         PyErr_Clear()
+ */
+  __pyx_t_2 = __pyx_v_9protocols_9_speedups___ECType;
+  __Pyx_INCREF(__pyx_t_2);
+  __pyx_t_1 = (PyObject_TypeCheck(__pyx_v_cls, __pyx_t_2) != 0);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  if (__pyx_t_1) {
+
+    /* "protocols/_speedups.pyx":888
+ *     elif PyObject_TypeCheck(cls,__ECType):
+ *         # Yep, toss out the error and compute a reasonable MRO
+ *         PyErr_Clear()             # <<<<<<<<<<<<<<
+ *         return cachedMRO(cls, 1)
+ * 
+ */
+    PyErr_Clear();
+
+    /* "protocols/_speedups.pyx":889
+ *         # Yep, toss out the error and compute a reasonable MRO
+ *         PyErr_Clear()
+ *         return cachedMRO(cls, 1)             # <<<<<<<<<<<<<<
+ * 
+ *     # Okay, we give up...  reraise the error so somebody smarter than us
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_2 = __pyx_f_9protocols_9_speedups_cachedMRO(__pyx_v_cls, __pyx_int_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 889, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_r = __pyx_t_2;
+    __pyx_t_2 = 0;
+    goto __pyx_L0;
+
+    /* "protocols/_speedups.pyx":886
+ * 
+ *     # No __mro__?  Is it an ExtensionClass?
+ *     elif PyObject_TypeCheck(cls,__ECType):             # <<<<<<<<<<<<<<
+ *         # Yep, toss out the error and compute a reasonable MRO
+ *         PyErr_Clear()
+ */
+  }
+
+  /* "protocols/_speedups.pyx":894
+ *     # can figure it out.  :(
+ *     else:
+ *         reraise()             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  /*else*/ {
+    __pyx_t_3 = __pyx_f_9protocols_9_speedups_reraise(); if (unlikely(__pyx_t_3 == ((int)-1))) __PYX_ERR(0, 894, __pyx_L1_error)
+  }
+
+  /* "protocols/_speedups.pyx":862
+ * 
+ * 
+ * cdef object classMRO(cls):             # <<<<<<<<<<<<<<
+ * 
+ *     # Return the MRO used to look up adapters for instances of 'cls'
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_AddTraceback("protocols._speedups.classMRO", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_mro);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "protocols/_speedups.pyx":897
+ * 
+ * 
+ * cdef int sameBases(bases, mro):             # <<<<<<<<<<<<<<
+ * 
+ *     # Is tuple 'bases' the same as tuple 'mro' without its first item?
+ */
+
+static int __pyx_f_9protocols_9_speedups_sameBases(PyObject *__pyx_v_bases, PyObject *__pyx_v_mro) {
+  int __pyx_v_i;
+  int __pyx_v_size;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  __Pyx_RefNannySetupContext("sameBases", 0);
+
+  /* "protocols/_speedups.pyx":903
+ *     cdef int i, size
+ * 
+ *     size = PyTuple_GET_SIZE(<PyTupleObject *>bases)             # <<<<<<<<<<<<<<
+ * 
+ *     if size <> PyTuple_GET_SIZE(<PyTupleObject *>mro) - 1:
+ */
+  __pyx_v_size = PyTuple_GET_SIZE(((PyTupleObject *)__pyx_v_bases));
+
+  /* "protocols/_speedups.pyx":905
+ *     size = PyTuple_GET_SIZE(<PyTupleObject *>bases)
+ * 
+ *     if size <> PyTuple_GET_SIZE(<PyTupleObject *>mro) - 1:             # <<<<<<<<<<<<<<
+ *         return 0
+ * 
+ */
+  __pyx_t_1 = ((__pyx_v_size != (PyTuple_GET_SIZE(((PyTupleObject *)__pyx_v_mro)) - 1)) != 0);
+  if (__pyx_t_1) {
+
+    /* "protocols/_speedups.pyx":906
+ * 
+ *     if size <> PyTuple_GET_SIZE(<PyTupleObject *>mro) - 1:
+ *         return 0             # <<<<<<<<<<<<<<
+ * 
+ *     for i from 0 <= i < size:
+ */
+    __pyx_r = 0;
+    goto __pyx_L0;
+
+    /* "protocols/_speedups.pyx":905
+ *     size = PyTuple_GET_SIZE(<PyTupleObject *>bases)
+ * 
+ *     if size <> PyTuple_GET_SIZE(<PyTupleObject *>mro) - 1:             # <<<<<<<<<<<<<<
+ *         return 0
+ * 
+ */
+  }
+
+  /* "protocols/_speedups.pyx":908
+ *         return 0
+ * 
+ *     for i from 0 <= i < size:             # <<<<<<<<<<<<<<
+ *         if PyTuple_GET_ITEM(<PyTupleObject *>bases, i) <> \
+ *            PyTuple_GET_ITEM(<PyTupleObject *>mro, i+1):
+ */
+  __pyx_t_2 = __pyx_v_size;
+  for (__pyx_v_i = 0; __pyx_v_i < __pyx_t_2; __pyx_v_i++) {
+
+    /* "protocols/_speedups.pyx":909
+ * 
+ *     for i from 0 <= i < size:
+ *         if PyTuple_GET_ITEM(<PyTupleObject *>bases, i) <> \             # <<<<<<<<<<<<<<
+ *            PyTuple_GET_ITEM(<PyTupleObject *>mro, i+1):
+ *             return 0
+ */
+    __pyx_t_1 = ((PyTuple_GET_ITEM(((PyTupleObject *)__pyx_v_bases), __pyx_v_i) != PyTuple_GET_ITEM(((PyTupleObject *)__pyx_v_mro), (__pyx_v_i + 1))) != 0);
+    if (__pyx_t_1) {
+
+      /* "protocols/_speedups.pyx":911
+ *         if PyTuple_GET_ITEM(<PyTupleObject *>bases, i) <> \
+ *            PyTuple_GET_ITEM(<PyTupleObject *>mro, i+1):
+ *             return 0             # <<<<<<<<<<<<<<
+ * 
+ *     return 1
+ */
+      __pyx_r = 0;
+      goto __pyx_L0;
+
+      /* "protocols/_speedups.pyx":909
+ * 
+ *     for i from 0 <= i < size:
+ *         if PyTuple_GET_ITEM(<PyTupleObject *>bases, i) <> \             # <<<<<<<<<<<<<<
+ *            PyTuple_GET_ITEM(<PyTupleObject *>mro, i+1):
+ *             return 0
+ */
+    }
+  }
+
+  /* "protocols/_speedups.pyx":913
+ *             return 0
+ * 
+ *     return 1             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_r = 1;
+  goto __pyx_L0;
+
+  /* "protocols/_speedups.pyx":897
+ * 
+ * 
+ * cdef int sameBases(bases, mro):             # <<<<<<<<<<<<<<
+ * 
+ *     # Is tuple 'bases' the same as tuple 'mro' without its first item?
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "protocols/_speedups.pyx":916
+ * 
+ * 
+ * cdef void *registryEntry(adapters, klass):             # <<<<<<<<<<<<<<
+ * 
+ *     # Return the (borrowed) '__adapters' entry for 'klass', or NULL
+ */
+
+static void *__pyx_f_9protocols_9_speedups_registryEntry(PyObject *__pyx_v_adapters, PyObject *__pyx_v_klass) {
+  void *__pyx_r;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("registryEntry", 0);
+
+  /* "protocols/_speedups.pyx":920
+ *     # Return the (borrowed) '__adapters' entry for 'klass', or NULL
+ * 
+ *     return PyDict_GetItem(adapters, PyLong_FromVoidPtr(<void *>klass))             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_t_1 = PyLong_FromVoidPtr(((void *)__pyx_v_klass)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 920, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = PyDict_GetItem(__pyx_v_adapters, __pyx_t_1);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "protocols/_speedups.pyx":916
+ * 
+ * 
+ * cdef void *registryEntry(adapters, klass):             # <<<<<<<<<<<<<<
+ * 
+ *     # Return the (borrowed) '__adapters' entry for 'klass', or NULL
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_WriteUnraisable("protocols._speedups.registryEntry", __pyx_clineno, __pyx_lineno, __pyx_filename, 1, 0);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "protocols/_speedups.pyx":923
+ * 
+ * 
+ * cdef object recordAdapter(record):             # <<<<<<<<<<<<<<
+ *     # A record's adapter; older pickles may have left '(adapter, depth)' tuples
+ *     if PyObject_TypeCheck(record, AdapterRecord):
+ */
+
+static PyObject *__pyx_f_9protocols_9_speedups_recordAdapter(PyObject *__pyx_v_record) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("recordAdapter", 0);
+
+  /* "protocols/_speedups.pyx":925
+ * cdef object recordAdapter(record):
+ *     # A record's adapter; older pickles may have left '(adapter, depth)' tuples
+ *     if PyObject_TypeCheck(record, AdapterRecord):             # <<<<<<<<<<<<<<
+ *         return (<AdapterRecord> record).adapter
+ *     elif PyTuple_Check(record):
+ */
+  __pyx_t_1 = (PyObject_TypeCheck(__pyx_v_record, ((PyObject *)__pyx_ptype_9protocols_9_speedups_AdapterRecord)) != 0);
+  if (__pyx_t_1) {
+
+    /* "protocols/_speedups.pyx":926
+ *     # A record's adapter; older pickles may have left '(adapter, depth)' tuples
+ *     if PyObject_TypeCheck(record, AdapterRecord):
+ *         return (<AdapterRecord> record).adapter             # <<<<<<<<<<<<<<
+ *     elif PyTuple_Check(record):
+ *         return record[0]
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_INCREF(((struct __pyx_obj_9protocols_9_speedups_AdapterRecord *)__pyx_v_record)->adapter);
+    __pyx_r = ((struct __pyx_obj_9protocols_9_speedups_AdapterRecord *)__pyx_v_record)->adapter;
+    goto __pyx_L0;
+
+    /* "protocols/_speedups.pyx":925
+ * cdef object recordAdapter(record):
+ *     # A record's adapter; older pickles may have left '(adapter, depth)' tuples
+ *     if PyObject_TypeCheck(record, AdapterRecord):             # <<<<<<<<<<<<<<
+ *         return (<AdapterRecord> record).adapter
+ *     elif PyTuple_Check(record):
+ */
+  }
+
+  /* "protocols/_speedups.pyx":927
+ *     if PyObject_TypeCheck(record, AdapterRecord):
+ *         return (<AdapterRecord> record).adapter
+ *     elif PyTuple_Check(record):             # <<<<<<<<<<<<<<
+ *         return record[0]
+ *     return record.adapter
+ */
+  __pyx_t_1 = (PyTuple_Check(__pyx_v_record) != 0);
+  if (__pyx_t_1) {
+
+    /* "protocols/_speedups.pyx":928
+ *         return (<AdapterRecord> record).adapter
+ *     elif PyTuple_Check(record):
+ *         return record[0]             # <<<<<<<<<<<<<<
+ *     return record.adapter
+ * 
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_2 = __Pyx_GetItemInt(__pyx_v_record, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 928, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_r = __pyx_t_2;
+    __pyx_t_2 = 0;
+    goto __pyx_L0;
+
+    /* "protocols/_speedups.pyx":927
+ *     if PyObject_TypeCheck(record, AdapterRecord):
+ *         return (<AdapterRecord> record).adapter
+ *     elif PyTuple_Check(record):             # <<<<<<<<<<<<<<
+ *         return record[0]
+ *     return record.adapter
+ */
+  }
+
+  /* "protocols/_speedups.pyx":929
+ *     elif PyTuple_Check(record):
+ *         return record[0]
+ *     return record.adapter             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_record, __pyx_n_s_adapter); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 929, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_r = __pyx_t_2;
+  __pyx_t_2 = 0;
+  goto __pyx_L0;
+
+  /* "protocols/_speedups.pyx":923
+ * 
+ * 
+ * cdef object recordAdapter(record):             # <<<<<<<<<<<<<<
+ *     # A record's adapter; older pickles may have left '(adapter, depth)' tuples
+ *     if PyObject_TypeCheck(record, AdapterRecord):
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_AddTraceback("protocols._speedups.recordAdapter", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "protocols/_speedups.pyx":932
+ * 
+ * 
+ * cdef object lookupAdapter(self, cls):             # <<<<<<<<<<<<<<
+ * 
+ *     # Return the adapter registered with 'self' for 'cls' or its bases
+ */
+
+static PyObject *__pyx_f_9protocols_9_speedups_lookupAdapter(PyObject *__pyx_v_self, PyObject *__pyx_v_cls) {
+  void *__pyx_v_cached;
+  void *__pyx_v_entry;
+  int __pyx_v_i;
+  PyObject *__pyx_v_changes = NULL;
+  PyObject *__pyx_v_adapters = NULL;
+  PyObject *__pyx_v_lookups = NULL;
+  PyObject *__pyx_v_cache = NULL;
+  PyObject *__pyx_v_classic = NULL;
+  PyObject *__pyx_v_mro = NULL;
+  PyObject *__pyx_v_klass = NULL;
+  PyObject *__pyx_v_factory = NULL;
+  PyObject *__pyx_v_key = NULL;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  void *__pyx_t_4;
+  int __pyx_t_5;
+  PyObject *__pyx_t_6 = NULL;
+  PyObject *__pyx_t_7 = NULL;
+  Py_ssize_t __pyx_t_8;
+  PyObject *(*__pyx_t_9)(PyObject *);
+  PyObject *__pyx_t_10 = NULL;
+  PyObject *__pyx_t_11 = NULL;
+  PyObject *__pyx_t_12 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("lookupAdapter", 0);
+
+  /* "protocols/_speedups.pyx":940
+ *     cdef int i
+ * 
+ *     changes = self._Protocol__changes             # <<<<<<<<<<<<<<
+ *     adapters = self._Protocol__adapters
+ * 
+ */
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_Protocol__changes); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 940, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_v_changes = __pyx_t_1;
+  __pyx_t_1 = 0;
+
+  /* "protocols/_speedups.pyx":941
+ * 
+ *     changes = self._Protocol__changes
+ *     adapters = self._Protocol__adapters             # <<<<<<<<<<<<<<
+ * 
+ *     if not adapters:
+ */
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_Protocol__adapters); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 941, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_v_adapters = __pyx_t_1;
+  __pyx_t_1 = 0;
+
+  /* "protocols/_speedups.pyx":943
+ *     adapters = self._Protocol__adapters
+ * 
+ *     if not adapters:             # <<<<<<<<<<<<<<
+ *         if not self._Protocol__pendingSources:
+ *             return None     # nothing registered, so nothing to look up
+ */
+  __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_v_adapters); if (unlikely(__pyx_t_2 < 0)) __PYX_ERR(0, 943, __pyx_L1_error)
+  __pyx_t_3 = ((!__pyx_t_2) != 0);
+  if (__pyx_t_3) {
+
+    /* "protocols/_speedups.pyx":944
+ * 
+ *     if not adapters:
+ *         if not self._Protocol__pendingSources:             # <<<<<<<<<<<<<<
+ *             return None     # nothing registered, so nothing to look up
+ *         adapters = {}
+ */
+    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_Protocol__pendingSources); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 944, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_3 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely(__pyx_t_3 < 0)) __PYX_ERR(0, 944, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_t_2 = ((!__pyx_t_3) != 0);
+    if (__pyx_t_2) {
+
+      /* "protocols/_speedups.pyx":945
+ *     if not adapters:
+ *         if not self._Protocol__pendingSources:
+ *             return None     # nothing registered, so nothing to look up             # <<<<<<<<<<<<<<
+ *         adapters = {}
+ * 
+ */
+      __Pyx_XDECREF(__pyx_r);
+      __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+      goto __pyx_L0;
+
+      /* "protocols/_speedups.pyx":944
+ * 
+ *     if not adapters:
+ *         if not self._Protocol__pendingSources:             # <<<<<<<<<<<<<<
+ *             return None     # nothing registered, so nothing to look up
+ *         adapters = {}
+ */
+    }
+
+    /* "protocols/_speedups.pyx":946
+ *         if not self._Protocol__pendingSources:
+ *             return None     # nothing registered, so nothing to look up
+ *         adapters = {}             # <<<<<<<<<<<<<<
+ * 
+ *     lookups = self._Protocol__cache
+ */
+    __pyx_t_1 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 946, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF_SET(__pyx_v_adapters, __pyx_t_1);
+    __pyx_t_1 = 0;
+
+    /* "protocols/_speedups.pyx":943
+ *     adapters = self._Protocol__adapters
+ * 
+ *     if not adapters:             # <<<<<<<<<<<<<<
+ *         if not self._Protocol__pendingSources:
+ *             return None     # nothing registered, so nothing to look up
+ */
+  }
+
+  /* "protocols/_speedups.pyx":948
+ *         adapters = {}
+ * 
+ *     lookups = self._Protocol__cache             # <<<<<<<<<<<<<<
+ *     cache = classic = None
+ * 
+ */
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_Protocol__cache); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 948, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_v_lookups = __pyx_t_1;
+  __pyx_t_1 = 0;
+
+  /* "protocols/_speedups.pyx":949
+ * 
+ *     lookups = self._Protocol__cache
+ *     cache = classic = None             # <<<<<<<<<<<<<<
+ * 
+ *     if PyClass_Check(cls):
+ */
+  __Pyx_INCREF(Py_None);
+  __pyx_v_cache = Py_None;
+  __Pyx_INCREF(Py_None);
+  __pyx_v_classic = Py_None;
+
+  /* "protocols/_speedups.pyx":951
+ *     cache = classic = None
+ * 
+ *     if PyClass_Check(cls):             # <<<<<<<<<<<<<<
+ *         # Cached lookups for classic classes are valid as long as the
+ *         # '__bases__' in their cached MRO are unchanged, so we needn't
+ */
+  __pyx_t_2 = (PyClass_Check(__pyx_v_cls) != 0);
+  if (__pyx_t_2) {
+
+    /* "protocols/_speedups.pyx":955
+ *         # '__bases__' in their cached MRO are unchanged, so we needn't
+ *         # fetch the MRO to check them
+ *         cache = lookups             # <<<<<<<<<<<<<<
+ *         cached = PyDict_GetItem(cache, PyLong_FromVoidPtr(<void *>cls))
+ *         if cached:
+ */
+    __Pyx_INCREF(__pyx_v_lookups);
+    __Pyx_DECREF_SET(__pyx_v_cache, __pyx_v_lookups);
+
+    /* "protocols/_speedups.pyx":956
+ *         # fetch the MRO to check them
+ *         cache = lookups
+ *         cached = PyDict_GetItem(cache, PyLong_FromVoidPtr(<void *>cls))             # <<<<<<<<<<<<<<
+ *         if cached:
+ *             if sameClassicBases(
+ */
+    __pyx_t_1 = PyLong_FromVoidPtr(((void *)__pyx_v_cls)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 956, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_v_cached = PyDict_GetItem(__pyx_v_cache, __pyx_t_1);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+    /* "protocols/_speedups.pyx":957
+ *         cache = lookups
+ *         cached = PyDict_GetItem(cache, PyLong_FromVoidPtr(<void *>cls))
+ *         if cached:             # <<<<<<<<<<<<<<
+ *             if sameClassicBases(
+ *                 cls, <object> PyTuple_GET_ITEM(<PyTupleObject *>cached, 0)
+ */
+    __pyx_t_2 = (__pyx_v_cached != 0);
+    if (__pyx_t_2) {
+
+      /* "protocols/_speedups.pyx":959
+ *         if cached:
+ *             if sameClassicBases(
+ *                 cls, <object> PyTuple_GET_ITEM(<PyTupleObject *>cached, 0)             # <<<<<<<<<<<<<<
+ *             ):
+ *                 return <object> PyTuple_GET_ITEM(<PyTupleObject *>cached, 1)
+ */
+      __pyx_t_4 = PyTuple_GET_ITEM(((PyTupleObject *)__pyx_v_cached), 0);
+
+      /* "protocols/_speedups.pyx":958
+ *         cached = PyDict_GetItem(cache, PyLong_FromVoidPtr(<void *>cls))
+ *         if cached:
+ *             if sameClassicBases(             # <<<<<<<<<<<<<<
+ *                 cls, <object> PyTuple_GET_ITEM(<PyTupleObject *>cached, 0)
+ *             ):
+ */
+      __pyx_t_5 = __pyx_f_9protocols_9_speedups_sameClassicBases(__pyx_v_cls, ((PyObject *)__pyx_t_4)); if (unlikely(__pyx_t_5 == ((int)-1))) __PYX_ERR(0, 958, __pyx_L1_error)
+      __pyx_t_2 = (__pyx_t_5 != 0);
+      if (__pyx_t_2) {
+
+        /* "protocols/_speedups.pyx":961
+ *                 cls, <object> PyTuple_GET_ITEM(<PyTupleObject *>cached, 0)
+ *             ):
+ *                 return <object> PyTuple_GET_ITEM(<PyTupleObject *>cached, 1)             # <<<<<<<<<<<<<<
+ * 
+ *         classic = classicBases(cls)
+ */
+        __Pyx_XDECREF(__pyx_r);
+        __pyx_t_4 = PyTuple_GET_ITEM(((PyTupleObject *)__pyx_v_cached), 1);
+        __Pyx_INCREF(((PyObject *)__pyx_t_4));
+        __pyx_r = ((PyObject *)__pyx_t_4);
+        goto __pyx_L0;
+
+        /* "protocols/_speedups.pyx":958
+ *         cached = PyDict_GetItem(cache, PyLong_FromVoidPtr(<void *>cls))
+ *         if cached:
+ *             if sameClassicBases(             # <<<<<<<<<<<<<<
+ *                 cls, <object> PyTuple_GET_ITEM(<PyTupleObject *>cached, 0)
+ *             ):
+ */
+      }
+
+      /* "protocols/_speedups.pyx":957
+ *         cache = lookups
+ *         cached = PyDict_GetItem(cache, PyLong_FromVoidPtr(<void *>cls))
+ *         if cached:             # <<<<<<<<<<<<<<
+ *             if sameClassicBases(
+ *                 cls, <object> PyTuple_GET_ITEM(<PyTupleObject *>cached, 0)
+ */
+    }
+
+    /* "protocols/_speedups.pyx":963
+ *                 return <object> PyTuple_GET_ITEM(<PyTupleObject *>cached, 1)
+ * 
+ *         classic = classicBases(cls)             # <<<<<<<<<<<<<<
+ *         mro = (cls,) + <object> PyTuple_GET_ITEM(<PyTupleObject *>classic, 3)
+ * 
+ */
+    __pyx_t_1 = __pyx_f_9protocols_9_speedups_classicBases(__pyx_v_cls); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 963, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF_SET(__pyx_v_classic, __pyx_t_1);
+    __pyx_t_1 = 0;
+
+    /* "protocols/_speedups.pyx":964
+ * 
+ *         classic = classicBases(cls)
+ *         mro = (cls,) + <object> PyTuple_GET_ITEM(<PyTupleObject *>classic, 3)             # <<<<<<<<<<<<<<
+ * 
+ *     else:
+ */
+    __pyx_t_1 = PyTuple_New(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 964, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_INCREF(__pyx_v_cls);
+    __Pyx_GIVEREF(__pyx_v_cls);
+    PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_v_cls);
+    __pyx_t_4 = PyTuple_GET_ITEM(((PyTupleObject *)__pyx_v_classic), 3);
+    __pyx_t_6 = PyNumber_Add(__pyx_t_1, ((PyObject *)__pyx_t_4)); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 964, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_v_mro = __pyx_t_6;
+    __pyx_t_6 = 0;
+
+    /* "protocols/_speedups.pyx":951
+ *     cache = classic = None
+ * 
+ *     if PyClass_Check(cls):             # <<<<<<<<<<<<<<
+ *         # Cached lookups for classic classes are valid as long as the
+ *         # '__bases__' in their cached MRO are unchanged, so we needn't
+ */
+    goto __pyx_L5;
+  }
+
+  /* "protocols/_speedups.pyx":967
+ * 
+ *     else:
+ *         mro = classMRO(cls)             # <<<<<<<<<<<<<<
+ * 
+ *         if PyType_Check(cls) and \
+ */
+  /*else*/ {
+    __pyx_t_6 = __pyx_f_9protocols_9_speedups_classMRO(__pyx_v_cls); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 967, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __pyx_v_mro = __pyx_t_6;
+    __pyx_t_6 = 0;
+
+    /* "protocols/_speedups.pyx":969
+ *         mro = classMRO(cls)
+ * 
+ *         if PyType_Check(cls) and \             # <<<<<<<<<<<<<<
+ *            <void *> mro == <void *> ((<PyTypeObject *>cls).tp_mro):
+ *             # Cached lookups are only valid as long as the MRO is unchanged
+ */
+    __pyx_t_3 = (PyType_Check(__pyx_v_cls) != 0);
+    if (__pyx_t_3) {
+    } else {
+      __pyx_t_2 = __pyx_t_3;
+      goto __pyx_L9_bool_binop_done;
+    }
+
+    /* "protocols/_speedups.pyx":970
+ * 
+ *         if PyType_Check(cls) and \
+ *            <void *> mro == <void *> ((<PyTypeObject *>cls).tp_mro):             # <<<<<<<<<<<<<<
+ *             # Cached lookups are only valid as long as the MRO is unchanged
+ *             cache = lookups
+ */
+    __pyx_t_3 = ((((void *)__pyx_v_mro) == ((void *)((PyTypeObject *)__pyx_v_cls)->tp_mro)) != 0);
+    __pyx_t_2 = __pyx_t_3;
+    __pyx_L9_bool_binop_done:;
+
+    /* "protocols/_speedups.pyx":969
+ *         mro = classMRO(cls)
+ * 
+ *         if PyType_Check(cls) and \             # <<<<<<<<<<<<<<
+ *            <void *> mro == <void *> ((<PyTypeObject *>cls).tp_mro):
+ *             # Cached lookups are only valid as long as the MRO is unchanged
+ */
+    if (__pyx_t_2) {
+
+      /* "protocols/_speedups.pyx":972
+ *            <void *> mro == <void *> ((<PyTypeObject *>cls).tp_mro):
+ *             # Cached lookups are only valid as long as the MRO is unchanged
+ *             cache = lookups             # <<<<<<<<<<<<<<
+ *             cached = PyDict_GetItem(cache, PyLong_FromVoidPtr(<void *>cls))
+ *             if cached:
+ */
+      __Pyx_INCREF(__pyx_v_lookups);
+      __Pyx_DECREF_SET(__pyx_v_cache, __pyx_v_lookups);
+
+      /* "protocols/_speedups.pyx":973
+ *             # Cached lookups are only valid as long as the MRO is unchanged
+ *             cache = lookups
+ *             cached = PyDict_GetItem(cache, PyLong_FromVoidPtr(<void *>cls))             # <<<<<<<<<<<<<<
+ *             if cached:
+ *                 if sameBases(
+ */
+      __pyx_t_6 = PyLong_FromVoidPtr(((void *)__pyx_v_cls)); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 973, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_6);
+      __pyx_v_cached = PyDict_GetItem(__pyx_v_cache, __pyx_t_6);
+      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+
+      /* "protocols/_speedups.pyx":974
+ *             cache = lookups
+ *             cached = PyDict_GetItem(cache, PyLong_FromVoidPtr(<void *>cls))
+ *             if cached:             # <<<<<<<<<<<<<<
+ *                 if sameBases(
+ *                     <object> PyTuple_GET_ITEM(<PyTupleObject *>cached, 0), mro
+ */
+      __pyx_t_2 = (__pyx_v_cached != 0);
+      if (__pyx_t_2) {
+
+        /* "protocols/_speedups.pyx":976
+ *             if cached:
+ *                 if sameBases(
+ *                     <object> PyTuple_GET_ITEM(<PyTupleObject *>cached, 0), mro             # <<<<<<<<<<<<<<
+ *                 ):
+ *                     return <object> PyTuple_GET_ITEM(<PyTupleObject *>cached, 1)
+ */
+        __pyx_t_4 = PyTuple_GET_ITEM(((PyTupleObject *)__pyx_v_cached), 0);
+
+        /* "protocols/_speedups.pyx":975
+ *             cached = PyDict_GetItem(cache, PyLong_FromVoidPtr(<void *>cls))
+ *             if cached:
+ *                 if sameBases(             # <<<<<<<<<<<<<<
+ *                     <object> PyTuple_GET_ITEM(<PyTupleObject *>cached, 0), mro
+ *                 ):
+ */
+        __pyx_t_2 = (__pyx_f_9protocols_9_speedups_sameBases(((PyObject *)__pyx_t_4), __pyx_v_mro) != 0);
+        if (__pyx_t_2) {
+
+          /* "protocols/_speedups.pyx":978
+ *                     <object> PyTuple_GET_ITEM(<PyTupleObject *>cached, 0), mro
+ *                 ):
+ *                     return <object> PyTuple_GET_ITEM(<PyTupleObject *>cached, 1)             # <<<<<<<<<<<<<<
+ * 
+ *     if self._Protocol__pendingSources and self._Protocol__applyPending(mro):
+ */
+          __Pyx_XDECREF(__pyx_r);
+          __pyx_t_4 = PyTuple_GET_ITEM(((PyTupleObject *)__pyx_v_cached), 1);
+          __Pyx_INCREF(((PyObject *)__pyx_t_4));
+          __pyx_r = ((PyObject *)__pyx_t_4);
+          goto __pyx_L0;
+
+          /* "protocols/_speedups.pyx":975
+ *             cached = PyDict_GetItem(cache, PyLong_FromVoidPtr(<void *>cls))
+ *             if cached:
+ *                 if sameBases(             # <<<<<<<<<<<<<<
+ *                     <object> PyTuple_GET_ITEM(<PyTupleObject *>cached, 0), mro
+ *                 ):
+ */
+        }
+
+        /* "protocols/_speedups.pyx":974
+ *             cache = lookups
+ *             cached = PyDict_GetItem(cache, PyLong_FromVoidPtr(<void *>cls))
+ *             if cached:             # <<<<<<<<<<<<<<
+ *                 if sameBases(
+ *                     <object> PyTuple_GET_ITEM(<PyTupleObject *>cached, 0), mro
+ */
+      }
+
+      /* "protocols/_speedups.pyx":969
+ *         mro = classMRO(cls)
+ * 
+ *         if PyType_Check(cls) and \             # <<<<<<<<<<<<<<
+ *            <void *> mro == <void *> ((<PyTypeObject *>cls).tp_mro):
+ *             # Cached lookups are only valid as long as the MRO is unchanged
+ */
+    }
+  }
+  __pyx_L5:;
+
+  /* "protocols/_speedups.pyx":980
+ *                     return <object> PyTuple_GET_ITEM(<PyTupleObject *>cached, 1)
+ * 
+ *     if self._Protocol__pendingSources and self._Protocol__applyPending(mro):             # <<<<<<<<<<<<<<
+ *         # Something was declared, so look again
+ *         return lookupAdapter(self, cls)
+ */
+  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_Protocol__pendingSources); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 980, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_t_3 = __Pyx_PyObject_IsTrue(__pyx_t_6); if (unlikely(__pyx_t_3 < 0)) __PYX_ERR(0, 980, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (__pyx_t_3) {
+  } else {
+    __pyx_t_2 = __pyx_t_3;
+    goto __pyx_L14_bool_binop_done;
+  }
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_Protocol__applyPending); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 980, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_7 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_1))) {
+    __pyx_t_7 = PyMethod_GET_SELF(__pyx_t_1);
+    if (likely(__pyx_t_7)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_1);
+      __Pyx_INCREF(__pyx_t_7);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_1, function);
+    }
+  }
+  __pyx_t_6 = (__pyx_t_7) ? __Pyx_PyObject_Call2Args(__pyx_t_1, __pyx_t_7, __pyx_v_mro) : __Pyx_PyObject_CallOneArg(__pyx_t_1, __pyx_v_mro);
+  __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
+  if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 980, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_3 = __Pyx_PyObject_IsTrue(__pyx_t_6); if (unlikely(__pyx_t_3 < 0)) __PYX_ERR(0, 980, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  __pyx_t_2 = __pyx_t_3;
+  __pyx_L14_bool_binop_done:;
+  if (__pyx_t_2) {
+
+    /* "protocols/_speedups.pyx":982
+ *     if self._Protocol__pendingSources and self._Protocol__applyPending(mro):
+ *         # Something was declared, so look again
+ *         return lookupAdapter(self, cls)             # <<<<<<<<<<<<<<
+ * 
+ *     entry = NULL
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_6 = __pyx_f_9protocols_9_speedups_lookupAdapter(__pyx_v_self, __pyx_v_cls); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 982, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __pyx_r = __pyx_t_6;
+    __pyx_t_6 = 0;
+    goto __pyx_L0;
+
+    /* "protocols/_speedups.pyx":980
+ *                     return <object> PyTuple_GET_ITEM(<PyTupleObject *>cached, 1)
+ * 
+ *     if self._Protocol__pendingSources and self._Protocol__applyPending(mro):             # <<<<<<<<<<<<<<
+ *         # Something was declared, so look again
+ *         return lookupAdapter(self, cls)
+ */
+  }
+
+  /* "protocols/_speedups.pyx":984
+ *         return lookupAdapter(self, cls)
+ * 
+ *     entry = NULL             # <<<<<<<<<<<<<<
+ * 
+ *     if PyTuple_Check(mro):
+ */
+  __pyx_v_entry = NULL;
+
+  /* "protocols/_speedups.pyx":986
+ *     entry = NULL
+ * 
+ *     if PyTuple_Check(mro):             # <<<<<<<<<<<<<<
+ *         #print "tuple",mro
+ *         for i from 0 <= i < PyTuple_GET_SIZE(<PyTupleObject *>mro):
+ */
+  __pyx_t_2 = (PyTuple_Check(__pyx_v_mro) != 0);
+  if (__pyx_t_2) {
+
+    /* "protocols/_speedups.pyx":988
+ *     if PyTuple_Check(mro):
+ *         #print "tuple",mro
+ *         for i from 0 <= i < PyTuple_GET_SIZE(<PyTupleObject *>mro):             # <<<<<<<<<<<<<<
+ *             entry = registryEntry(
+ *                 adapters, <object> PyTuple_GET_ITEM(<PyTupleObject *>mro, i)
+ */
+    __pyx_t_5 = PyTuple_GET_SIZE(((PyTupleObject *)__pyx_v_mro));
+    for (__pyx_v_i = 0; __pyx_v_i < __pyx_t_5; __pyx_v_i++) {
+
+      /* "protocols/_speedups.pyx":990
+ *         for i from 0 <= i < PyTuple_GET_SIZE(<PyTupleObject *>mro):
+ *             entry = registryEntry(
+ *                 adapters, <object> PyTuple_GET_ITEM(<PyTupleObject *>mro, i)             # <<<<<<<<<<<<<<
+ *             )
+ *             if entry:
+ */
+      __pyx_t_4 = PyTuple_GET_ITEM(((PyTupleObject *)__pyx_v_mro), __pyx_v_i);
+
+      /* "protocols/_speedups.pyx":989
+ *         #print "tuple",mro
+ *         for i from 0 <= i < PyTuple_GET_SIZE(<PyTupleObject *>mro):
+ *             entry = registryEntry(             # <<<<<<<<<<<<<<
+ *                 adapters, <object> PyTuple_GET_ITEM(<PyTupleObject *>mro, i)
+ *             )
+ */
+      __pyx_v_entry = __pyx_f_9protocols_9_speedups_registryEntry(__pyx_v_adapters, ((PyObject *)__pyx_t_4));
+
+      /* "protocols/_speedups.pyx":992
+ *                 adapters, <object> PyTuple_GET_ITEM(<PyTupleObject *>mro, i)
+ *             )
+ *             if entry:             # <<<<<<<<<<<<<<
+ *                 break
+ * 
+ */
+      __pyx_t_2 = (__pyx_v_entry != 0);
+      if (__pyx_t_2) {
+
+        /* "protocols/_speedups.pyx":993
+ *             )
+ *             if entry:
+ *                 break             # <<<<<<<<<<<<<<
+ * 
+ *     elif PyList_Check(mro):
+ */
+        goto __pyx_L18_break;
+
+        /* "protocols/_speedups.pyx":992
+ *                 adapters, <object> PyTuple_GET_ITEM(<PyTupleObject *>mro, i)
+ *             )
+ *             if entry:             # <<<<<<<<<<<<<<
+ *                 break
+ * 
+ */
+      }
+    }
+    __pyx_L18_break:;
+
+    /* "protocols/_speedups.pyx":986
+ *     entry = NULL
+ * 
+ *     if PyTuple_Check(mro):             # <<<<<<<<<<<<<<
+ *         #print "tuple",mro
+ *         for i from 0 <= i < PyTuple_GET_SIZE(<PyTupleObject *>mro):
+ */
+    goto __pyx_L16;
+  }
+
+  /* "protocols/_speedups.pyx":995
+ *                 break
+ * 
+ *     elif PyList_Check(mro):             # <<<<<<<<<<<<<<
+ *         #print "list",mro
+ *         for i from 0 <= i < PyList_GET_SIZE(<PyListObject *>mro):
+ */
+  __pyx_t_2 = (PyList_Check(__pyx_v_mro) != 0);
+  if (__pyx_t_2) {
+
+    /* "protocols/_speedups.pyx":997
+ *     elif PyList_Check(mro):
+ *         #print "list",mro
+ *         for i from 0 <= i < PyList_GET_SIZE(<PyListObject *>mro):             # <<<<<<<<<<<<<<
+ *             entry = registryEntry(
+ *                 adapters, <object> PyList_GET_ITEM(<PyListObject *>mro, i)
+ */
+    __pyx_t_5 = PyList_GET_SIZE(((PyListObject *)__pyx_v_mro));
+    for (__pyx_v_i = 0; __pyx_v_i < __pyx_t_5; __pyx_v_i++) {
+
+      /* "protocols/_speedups.pyx":999
+ *         for i from 0 <= i < PyList_GET_SIZE(<PyListObject *>mro):
+ *             entry = registryEntry(
+ *                 adapters, <object> PyList_GET_ITEM(<PyListObject *>mro, i)             # <<<<<<<<<<<<<<
+ *             )
+ *             if entry:
+ */
+      __pyx_t_4 = PyList_GET_ITEM(((PyListObject *)__pyx_v_mro), __pyx_v_i);
+
+      /* "protocols/_speedups.pyx":998
+ *         #print "list",mro
+ *         for i from 0 <= i < PyList_GET_SIZE(<PyListObject *>mro):
+ *             entry = registryEntry(             # <<<<<<<<<<<<<<
+ *                 adapters, <object> PyList_GET_ITEM(<PyListObject *>mro, i)
+ *             )
+ */
+      __pyx_v_entry = __pyx_f_9protocols_9_speedups_registryEntry(__pyx_v_adapters, ((PyObject *)__pyx_t_4));
+
+      /* "protocols/_speedups.pyx":1001
+ *                 adapters, <object> PyList_GET_ITEM(<PyListObject *>mro, i)
+ *             )
+ *             if entry:             # <<<<<<<<<<<<<<
+ *                 break
+ * 
+ */
+      __pyx_t_2 = (__pyx_v_entry != 0);
+      if (__pyx_t_2) {
+
+        /* "protocols/_speedups.pyx":1002
+ *             )
+ *             if entry:
+ *                 break             # <<<<<<<<<<<<<<
+ * 
+ *     else:
+ */
+        goto __pyx_L21_break;
+
+        /* "protocols/_speedups.pyx":1001
+ *                 adapters, <object> PyList_GET_ITEM(<PyListObject *>mro, i)
+ *             )
+ *             if entry:             # <<<<<<<<<<<<<<
+ *                 break
+ * 
+ */
+      }
+    }
+    __pyx_L21_break:;
+
+    /* "protocols/_speedups.pyx":995
+ *                 break
+ * 
+ *     elif PyList_Check(mro):             # <<<<<<<<<<<<<<
+ *         #print "list",mro
+ *         for i from 0 <= i < PyList_GET_SIZE(<PyListObject *>mro):
+ */
+    goto __pyx_L16;
+  }
+
+  /* "protocols/_speedups.pyx":1006
+ *     else:
+ *         #print "other",mro
+ *         for klass in mro:             # <<<<<<<<<<<<<<
+ *             entry = registryEntry(adapters, klass)
+ *             if entry:
+ */
+  /*else*/ {
+    if (likely(PyList_CheckExact(__pyx_v_mro)) || PyTuple_CheckExact(__pyx_v_mro)) {
+      __pyx_t_6 = __pyx_v_mro; __Pyx_INCREF(__pyx_t_6); __pyx_t_8 = 0;
+      __pyx_t_9 = NULL;
+    } else {
+      __pyx_t_8 = -1; __pyx_t_6 = PyObject_GetIter(__pyx_v_mro); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 1006, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_6);
+      __pyx_t_9 = Py_TYPE(__pyx_t_6)->tp_iternext; if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 1006, __pyx_L1_error)
+    }
+    for (;;) {
+      if (likely(!__pyx_t_9)) {
+        if (likely(PyList_CheckExact(__pyx_t_6))) {
+          if (__pyx_t_8 >= PyList_GET_SIZE(__pyx_t_6)) break;
+          #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+          __pyx_t_1 = PyList_GET_ITEM(__pyx_t_6, __pyx_t_8); __Pyx_INCREF(__pyx_t_1); __pyx_t_8++; if (unlikely(0 < 0)) __PYX_ERR(0, 1006, __pyx_L1_error)
+          #else
+          __pyx_t_1 = PySequence_ITEM(__pyx_t_6, __pyx_t_8); __pyx_t_8++; if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 1006, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_1);
+          #endif
+        } else {
+          if (__pyx_t_8 >= PyTuple_GET_SIZE(__pyx_t_6)) break;
+          #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+          __pyx_t_1 = PyTuple_GET_ITEM(__pyx_t_6, __pyx_t_8); __Pyx_INCREF(__pyx_t_1); __pyx_t_8++; if (unlikely(0 < 0)) __PYX_ERR(0, 1006, __pyx_L1_error)
+          #else
+          __pyx_t_1 = PySequence_ITEM(__pyx_t_6, __pyx_t_8); __pyx_t_8++; if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 1006, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_1);
+          #endif
+        }
+      } else {
+        __pyx_t_1 = __pyx_t_9(__pyx_t_6);
+        if (unlikely(!__pyx_t_1)) {
+          PyObject* exc_type = PyErr_Occurred();
+          if (exc_type) {
+            if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
+            else __PYX_ERR(0, 1006, __pyx_L1_error)
+          }
+          break;
+        }
+        __Pyx_GOTREF(__pyx_t_1);
+      }
+      __Pyx_XDECREF_SET(__pyx_v_klass, __pyx_t_1);
+      __pyx_t_1 = 0;
+
+      /* "protocols/_speedups.pyx":1007
+ *         #print "other",mro
+ *         for klass in mro:
+ *             entry = registryEntry(adapters, klass)             # <<<<<<<<<<<<<<
+ *             if entry:
+ *                 break
+ */
+      __pyx_v_entry = __pyx_f_9protocols_9_speedups_registryEntry(__pyx_v_adapters, __pyx_v_klass);
+
+      /* "protocols/_speedups.pyx":1008
+ *         for klass in mro:
+ *             entry = registryEntry(adapters, klass)
+ *             if entry:             # <<<<<<<<<<<<<<
+ *                 break
+ * 
+ */
+      __pyx_t_2 = (__pyx_v_entry != 0);
+      if (__pyx_t_2) {
+
+        /* "protocols/_speedups.pyx":1009
+ *             entry = registryEntry(adapters, klass)
+ *             if entry:
+ *                 break             # <<<<<<<<<<<<<<
+ * 
+ *     factory = None
+ */
+        goto __pyx_L24_break;
+
+        /* "protocols/_speedups.pyx":1008
+ *         for klass in mro:
+ *             entry = registryEntry(adapters, klass)
+ *             if entry:             # <<<<<<<<<<<<<<
+ *                 break
+ * 
+ */
+      }
+
+      /* "protocols/_speedups.pyx":1006
+ *     else:
+ *         #print "other",mro
+ *         for klass in mro:             # <<<<<<<<<<<<<<
+ *             entry = registryEntry(adapters, klass)
+ *             if entry:
+ */
+    }
+    __pyx_L24_break:;
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  }
+  __pyx_L16:;
+
+  /* "protocols/_speedups.pyx":1011
+ *                 break
+ * 
+ *     factory = None             # <<<<<<<<<<<<<<
+ * 
+ *     if entry:
+ */
+  __Pyx_INCREF(Py_None);
+  __pyx_v_factory = Py_None;
+
+  /* "protocols/_speedups.pyx":1013
+ *     factory = None
+ * 
+ *     if entry:             # <<<<<<<<<<<<<<
+ *         factory = recordAdapter(<object> entry)
+ * 
+ */
+  __pyx_t_2 = (__pyx_v_entry != 0);
+  if (__pyx_t_2) {
+
+    /* "protocols/_speedups.pyx":1014
+ * 
+ *     if entry:
+ *         factory = recordAdapter(<object> entry)             # <<<<<<<<<<<<<<
+ * 
+ *     if cache is not None:
+ */
+    __pyx_t_6 = __pyx_f_9protocols_9_speedups_recordAdapter(((PyObject *)__pyx_v_entry)); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 1014, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __Pyx_DECREF_SET(__pyx_v_factory, __pyx_t_6);
+    __pyx_t_6 = 0;
+
+    /* "protocols/_speedups.pyx":1013
+ *     factory = None
+ * 
+ *     if entry:             # <<<<<<<<<<<<<<
+ *         factory = recordAdapter(<object> entry)
+ * 
+ */
+  }
+
+  /* "protocols/_speedups.pyx":1016
+ *         factory = recordAdapter(<object> entry)
+ * 
+ *     if cache is not None:             # <<<<<<<<<<<<<<
+ *         # Misses are cached too, to skip the MRO walk next time.  The cache
+ *         # is keyed by id and doesn't hold 'cls', so it won't keep it alive.
+ */
+  __pyx_t_2 = (__pyx_v_cache != Py_None);
+  __pyx_t_3 = (__pyx_t_2 != 0);
+  if (__pyx_t_3) {
+
+    /* "protocols/_speedups.pyx":1019
+ *         # Misses are cached too, to skip the MRO walk next time.  The cache
+ *         # is keyed by id and doesn't hold 'cls', so it won't keep it alive.
+ *         key = self._Protocol__cacheKey(cls)             # <<<<<<<<<<<<<<
+ *         if classic is not None:
+ *             cache[key] = classic, factory
+ */
+    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_Protocol__cacheKey); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 1019, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_7 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_1))) {
+      __pyx_t_7 = PyMethod_GET_SELF(__pyx_t_1);
+      if (likely(__pyx_t_7)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_1);
+        __Pyx_INCREF(__pyx_t_7);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_1, function);
+      }
+    }
+    __pyx_t_6 = (__pyx_t_7) ? __Pyx_PyObject_Call2Args(__pyx_t_1, __pyx_t_7, __pyx_v_cls) : __Pyx_PyObject_CallOneArg(__pyx_t_1, __pyx_v_cls);
+    __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
+    if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 1019, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_v_key = __pyx_t_6;
+    __pyx_t_6 = 0;
+
+    /* "protocols/_speedups.pyx":1020
+ *         # is keyed by id and doesn't hold 'cls', so it won't keep it alive.
+ *         key = self._Protocol__cacheKey(cls)
+ *         if classic is not None:             # <<<<<<<<<<<<<<
+ *             cache[key] = classic, factory
+ *         else:
+ */
+    __pyx_t_3 = (__pyx_v_classic != Py_None);
+    __pyx_t_2 = (__pyx_t_3 != 0);
+    if (__pyx_t_2) {
+
+      /* "protocols/_speedups.pyx":1021
+ *         key = self._Protocol__cacheKey(cls)
+ *         if classic is not None:
+ *             cache[key] = classic, factory             # <<<<<<<<<<<<<<
+ *         else:
+ *             cache[key] = mro[1:], factory
+ */
+      __pyx_t_6 = PyTuple_New(2); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 1021, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_6);
+      __Pyx_INCREF(__pyx_v_classic);
+      __Pyx_GIVEREF(__pyx_v_classic);
+      PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_v_classic);
+      __Pyx_INCREF(__pyx_v_factory);
+      __Pyx_GIVEREF(__pyx_v_factory);
+      PyTuple_SET_ITEM(__pyx_t_6, 1, __pyx_v_factory);
+      if (unlikely(PyObject_SetItem(__pyx_v_cache, __pyx_v_key, __pyx_t_6) < 0)) __PYX_ERR(0, 1021, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+
+      /* "protocols/_speedups.pyx":1020
+ *         # is keyed by id and doesn't hold 'cls', so it won't keep it alive.
+ *         key = self._Protocol__cacheKey(cls)
+ *         if classic is not None:             # <<<<<<<<<<<<<<
+ *             cache[key] = classic, factory
+ *         else:
+ */
+      goto __pyx_L28;
+    }
+
+    /* "protocols/_speedups.pyx":1023
+ *             cache[key] = classic, factory
+ *         else:
+ *             cache[key] = mro[1:], factory             # <<<<<<<<<<<<<<
+ * 
+ *         if self._Protocol__changes != changes:
+ */
+    /*else*/ {
+      __pyx_t_6 = __Pyx_PyObject_GetSlice(__pyx_v_mro, 1, 0, NULL, NULL, &__pyx_slice__6, 1, 0, 1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 1023, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_6);
+      __pyx_t_1 = PyTuple_New(2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 1023, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      __Pyx_GIVEREF(__pyx_t_6);
+      PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_t_6);
+      __Pyx_INCREF(__pyx_v_factory);
+      __Pyx_GIVEREF(__pyx_v_factory);
+      PyTuple_SET_ITEM(__pyx_t_1, 1, __pyx_v_factory);
+      __pyx_t_6 = 0;
+      if (unlikely(PyObject_SetItem(__pyx_v_cache, __pyx_v_key, __pyx_t_1) < 0)) __PYX_ERR(0, 1023, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    }
+    __pyx_L28:;
+
+    /* "protocols/_speedups.pyx":1025
+ *             cache[key] = mro[1:], factory
+ * 
+ *         if self._Protocol__changes != changes:             # <<<<<<<<<<<<<<
+ *             # A change made during the lookup may have been missed, and its
+ *             # writer may have discarded the cached lookups before we stored
+ */
+    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_Protocol__changes); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 1025, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_6 = PyObject_RichCompare(__pyx_t_1, __pyx_v_changes, Py_NE); __Pyx_XGOTREF(__pyx_t_6); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 1025, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_t_6); if (unlikely(__pyx_t_2 < 0)) __PYX_ERR(0, 1025, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    if (__pyx_t_2) {
+
+      /* "protocols/_speedups.pyx":1028
+ *             # A change made during the lookup may have been missed, and its
+ *             # writer may have discarded the cached lookups before we stored
+ *             try:             # <<<<<<<<<<<<<<
+ *                 del cache[key]
+ *             except KeyError:
+ */
+      {
+        __Pyx_PyThreadState_declare
+        __Pyx_PyThreadState_assign
+        __Pyx_ExceptionSave(&__pyx_t_10, &__pyx_t_11, &__pyx_t_12);
+        __Pyx_XGOTREF(__pyx_t_10);
+        __Pyx_XGOTREF(__pyx_t_11);
+        __Pyx_XGOTREF(__pyx_t_12);
+        /*try:*/ {
+
+          /* "protocols/_speedups.pyx":1029
+ *             # writer may have discarded the cached lookups before we stored
+ *             try:
+ *                 del cache[key]             # <<<<<<<<<<<<<<
+ *             except KeyError:
+ *                 pass
+ */
+          if (unlikely(PyObject_DelItem(__pyx_v_cache, __pyx_v_key) < 0)) __PYX_ERR(0, 1029, __pyx_L30_error)
+
+          /* "protocols/_speedups.pyx":1028
+ *             # A change made during the lookup may have been missed, and its
+ *             # writer may have discarded the cached lookups before we stored
+ *             try:             # <<<<<<<<<<<<<<
+ *                 del cache[key]
+ *             except KeyError:
+ */
+        }
+        __Pyx_XDECREF(__pyx_t_10); __pyx_t_10 = 0;
+        __Pyx_XDECREF(__pyx_t_11); __pyx_t_11 = 0;
+        __Pyx_XDECREF(__pyx_t_12); __pyx_t_12 = 0;
+        goto __pyx_L35_try_end;
+        __pyx_L30_error:;
+        __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
+        __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+        __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
+
+        /* "protocols/_speedups.pyx":1030
+ *             try:
+ *                 del cache[key]
+ *             except KeyError:             # <<<<<<<<<<<<<<
+ *                 pass
+ * 
+ */
+        __pyx_t_5 = __Pyx_PyErr_ExceptionMatches(__pyx_builtin_KeyError);
+        if (__pyx_t_5) {
+          __Pyx_ErrRestore(0,0,0);
+          goto __pyx_L31_exception_handled;
+        }
+        goto __pyx_L32_except_error;
+        __pyx_L32_except_error:;
+
+        /* "protocols/_speedups.pyx":1028
+ *             # A change made during the lookup may have been missed, and its
+ *             # writer may have discarded the cached lookups before we stored
+ *             try:             # <<<<<<<<<<<<<<
+ *                 del cache[key]
+ *             except KeyError:
+ */
+        __Pyx_XGIVEREF(__pyx_t_10);
+        __Pyx_XGIVEREF(__pyx_t_11);
+        __Pyx_XGIVEREF(__pyx_t_12);
+        __Pyx_ExceptionReset(__pyx_t_10, __pyx_t_11, __pyx_t_12);
+        goto __pyx_L1_error;
+        __pyx_L31_exception_handled:;
+        __Pyx_XGIVEREF(__pyx_t_10);
+        __Pyx_XGIVEREF(__pyx_t_11);
+        __Pyx_XGIVEREF(__pyx_t_12);
+        __Pyx_ExceptionReset(__pyx_t_10, __pyx_t_11, __pyx_t_12);
+        __pyx_L35_try_end:;
+      }
+
+      /* "protocols/_speedups.pyx":1025
+ *             cache[key] = mro[1:], factory
+ * 
+ *         if self._Protocol__changes != changes:             # <<<<<<<<<<<<<<
+ *             # A change made during the lookup may have been missed, and its
+ *             # writer may have discarded the cached lookups before we stored
+ */
+    }
+
+    /* "protocols/_speedups.pyx":1016
+ *         factory = recordAdapter(<object> entry)
+ * 
+ *     if cache is not None:             # <<<<<<<<<<<<<<
+ *         # Misses are cached too, to skip the MRO walk next time.  The cache
+ *         # is keyed by id and doesn't hold 'cls', so it won't keep it alive.
+ */
+  }
+
+  /* "protocols/_speedups.pyx":1033
+ *                 pass
+ * 
+ *     return factory             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v_factory);
+  __pyx_r = __pyx_v_factory;
+  goto __pyx_L0;
+
+  /* "protocols/_speedups.pyx":932
+ * 
+ * 
+ * cdef object lookupAdapter(self, cls):             # <<<<<<<<<<<<<<
+ * 
+ *     # Return the adapter registered with 'self' for 'cls' or its bases
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_AddTraceback("protocols._speedups.lookupAdapter", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_changes);
+  __Pyx_XDECREF(__pyx_v_adapters);
+  __Pyx_XDECREF(__pyx_v_lookups);
+  __Pyx_XDECREF(__pyx_v_cache);
+  __Pyx_XDECREF(__pyx_v_classic);
+  __Pyx_XDECREF(__pyx_v_mro);
+  __Pyx_XDECREF(__pyx_v_klass);
+  __Pyx_XDECREF(__pyx_v_factory);
+  __Pyx_XDECREF(__pyx_v_key);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "protocols/_speedups.pyx":1036
+ * 
+ * 
+ * def Protocol_getAdapterForType(self, typ):             # <<<<<<<<<<<<<<
+ *     """Return the adapter for instances of 'typ' (incl. bases), or 'None'"""
+ *     return lookupAdapter(self, typ)
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_9protocols_9_speedups_29Protocol_getAdapterForType(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_9protocols_9_speedups_28Protocol_getAdapterForType[] = "Return the adapter for instances of 'typ' (incl. bases), or 'None'";
+static PyMethodDef __pyx_mdef_9protocols_9_speedups_29Protocol_getAdapterForType = {"Protocol_getAdapterForType", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_9protocols_9_speedups_29Protocol_getAdapterForType, METH_VARARGS|METH_KEYWORDS, __pyx_doc_9protocols_9_speedups_28Protocol_getAdapterForType};
+static PyObject *__pyx_pw_9protocols_9_speedups_29Protocol_getAdapterForType(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_self = 0;
+  PyObject *__pyx_v_typ = 0;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("Protocol_getAdapterForType (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_self,&__pyx_n_s_typ,0};
+    PyObject* values[2] = {0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_self)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_typ)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("Protocol_getAdapterForType", 1, 2, 2, 1); __PYX_ERR(0, 1036, __pyx_L3_error)
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "Protocol_getAdapterForType") < 0)) __PYX_ERR(0, 1036, __pyx_L3_error)
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 2) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+    }
+    __pyx_v_self = values[0];
+    __pyx_v_typ = values[1];
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("Protocol_getAdapterForType", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 1036, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("protocols._speedups.Protocol_getAdapterForType", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_9protocols_9_speedups_28Protocol_getAdapterForType(__pyx_self, __pyx_v_self, __pyx_v_typ);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_9protocols_9_speedups_28Protocol_getAdapterForType(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self, PyObject *__pyx_v_typ) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("Protocol_getAdapterForType", 0);
+
+  /* "protocols/_speedups.pyx":1038
+ * def Protocol_getAdapterForType(self, typ):
+ *     """Return the adapter for instances of 'typ' (incl. bases), or 'None'"""
+ *     return lookupAdapter(self, typ)             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __pyx_f_9protocols_9_speedups_lookupAdapter(__pyx_v_self, __pyx_v_typ); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 1038, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "protocols/_speedups.pyx":1036
+ * 
+ * 
+ * def Protocol_getAdapterForType(self, typ):             # <<<<<<<<<<<<<<
+ *     """Return the adapter for instances of 'typ' (incl. bases), or 'None'"""
+ *     return lookupAdapter(self, typ)
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("protocols._speedups.Protocol_getAdapterForType", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "protocols/_speedups.pyx":1041
+ * 
+ * 
+ * def Protocol__adapt__(self, obj):             # <<<<<<<<<<<<<<
+ * 
+ *     if not self._Protocol__adapters and not self._Protocol__pendingSources:
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_9protocols_9_speedups_31Protocol__adapt__(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static PyMethodDef __pyx_mdef_9protocols_9_speedups_31Protocol__adapt__ = {"Protocol__adapt__", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_9protocols_9_speedups_31Protocol__adapt__, METH_VARARGS|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_9protocols_9_speedups_31Protocol__adapt__(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_self = 0;
+  PyObject *__pyx_v_obj = 0;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("Protocol__adapt__ (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_self,&__pyx_n_s_obj,0};
+    PyObject* values[2] = {0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_self)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_obj)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("Protocol__adapt__", 1, 2, 2, 1); __PYX_ERR(0, 1041, __pyx_L3_error)
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "Protocol__adapt__") < 0)) __PYX_ERR(0, 1041, __pyx_L3_error)
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 2) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+    }
+    __pyx_v_self = values[0];
+    __pyx_v_obj = values[1];
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("Protocol__adapt__", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 1041, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("protocols._speedups.Protocol__adapt__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_9protocols_9_speedups_30Protocol__adapt__(__pyx_self, __pyx_v_self, __pyx_v_obj);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_9protocols_9_speedups_30Protocol__adapt__(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self, PyObject *__pyx_v_obj) {
+  PyObject *__pyx_v_cls = NULL;
+  PyObject *__pyx_v_factory = NULL;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  int __pyx_t_3;
+  int __pyx_t_4;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("Protocol__adapt__", 0);
+
+  /* "protocols/_speedups.pyx":1043
+ * def Protocol__adapt__(self, obj):
+ * 
+ *     if not self._Protocol__adapters and not self._Protocol__pendingSources:             # <<<<<<<<<<<<<<
+ *         return None     # fast path for protocols with nothing registered
+ * 
+ */
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_Protocol__adapters); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 1043, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = __Pyx_PyObject_IsTrue(__pyx_t_2); if (unlikely(__pyx_t_3 < 0)) __PYX_ERR(0, 1043, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_4 = ((!__pyx_t_3) != 0);
+  if (__pyx_t_4) {
+  } else {
+    __pyx_t_1 = __pyx_t_4;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_Protocol__pendingSources); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 1043, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_4 = __Pyx_PyObject_IsTrue(__pyx_t_2); if (unlikely(__pyx_t_4 < 0)) __PYX_ERR(0, 1043, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_3 = ((!__pyx_t_4) != 0);
+  __pyx_t_1 = __pyx_t_3;
+  __pyx_L4_bool_binop_done:;
+  if (__pyx_t_1) {
+
+    /* "protocols/_speedups.pyx":1044
+ * 
+ *     if not self._Protocol__adapters and not self._Protocol__pendingSources:
+ *         return None     # fast path for protocols with nothing registered             # <<<<<<<<<<<<<<
+ * 
+ *     cls = getClass(obj)
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+    goto __pyx_L0;
+
+    /* "protocols/_speedups.pyx":1043
+ * def Protocol__adapt__(self, obj):
+ * 
+ *     if not self._Protocol__adapters and not self._Protocol__pendingSources:             # <<<<<<<<<<<<<<
+ *         return None     # fast path for protocols with nothing registered
+ * 
+ */
+  }
+
+  /* "protocols/_speedups.pyx":1046
+ *         return None     # fast path for protocols with nothing registered
+ * 
+ *     cls = getClass(obj)             # <<<<<<<<<<<<<<
+ *     factory = lookupAdapter(self, cls)
+ * 
+ */
+  __pyx_t_2 = __pyx_f_9protocols_9_speedups_getClass(__pyx_v_obj); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 1046, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_v_cls = __pyx_t_2;
+  __pyx_t_2 = 0;
+
+  /* "protocols/_speedups.pyx":1047
+ * 
+ *     cls = getClass(obj)
+ *     factory = lookupAdapter(self, cls)             # <<<<<<<<<<<<<<
+ * 
+ *     if factory is not None:
+ */
+  __pyx_t_2 = __pyx_f_9protocols_9_speedups_lookupAdapter(__pyx_v_self, __pyx_v_cls); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 1047, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_v_factory = __pyx_t_2;
+  __pyx_t_2 = 0;
+
+  /* "protocols/_speedups.pyx":1049
+ *     factory = lookupAdapter(self, cls)
+ * 
+ *     if factory is not None:             # <<<<<<<<<<<<<<
+ *         return factory(obj)
+ * 
+ */
+  __pyx_t_1 = (__pyx_v_factory != Py_None);
+  __pyx_t_3 = (__pyx_t_1 != 0);
+  if (__pyx_t_3) {
+
+    /* "protocols/_speedups.pyx":1050
+ * 
+ *     if factory is not None:
+ *         return factory(obj)             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_INCREF(__pyx_v_factory);
+    __pyx_t_5 = __pyx_v_factory; __pyx_t_6 = NULL;
+    if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_5))) {
+      __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_5);
+      if (likely(__pyx_t_6)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_5);
+        __Pyx_INCREF(__pyx_t_6);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_5, function);
+      }
+    }
+    __pyx_t_2 = (__pyx_t_6) ? __Pyx_PyObject_Call2Args(__pyx_t_5, __pyx_t_6, __pyx_v_obj) : __Pyx_PyObject_CallOneArg(__pyx_t_5, __pyx_v_obj);
+    __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+    if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 1050, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __pyx_r = __pyx_t_2;
+    __pyx_t_2 = 0;
+    goto __pyx_L0;
+
+    /* "protocols/_speedups.pyx":1049
+ *     factory = lookupAdapter(self, cls)
+ * 
+ *     if factory is not None:             # <<<<<<<<<<<<<<
+ *         return factory(obj)
+ * 
+ */
+  }
+
+  /* "protocols/_speedups.pyx":1041
+ * 
+ * 
+ * def Protocol__adapt__(self, obj):             # <<<<<<<<<<<<<<
+ * 
+ *     if not self._Protocol__adapters and not self._Protocol__pendingSources:
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_AddTraceback("protocols._speedups.Protocol__adapt__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_cls);
+  __Pyx_XDECREF(__pyx_v_factory);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "protocols/_speedups.pyx":1061
+ * 
+ * 
+ * cdef object declarationMRO(ob):             # <<<<<<<<<<<<<<
+ * 
+ *     # 'getMRO(ob)': the objects whose declarations apply to 'ob'
+ */
+
+static PyObject *__pyx_f_9protocols_9_speedups_declarationMRO(PyObject *__pyx_v_ob) {
+  void *__pyx_v_tmp;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("declarationMRO", 0);
+
+  /* "protocols/_speedups.pyx":1067
+ *     cdef void *tmp
+ * 
+ *     if PyClass_Check(ob):             # <<<<<<<<<<<<<<
+ *         return cachedMRO(ob, 0)
+ * 
+ */
+  __pyx_t_1 = (PyClass_Check(__pyx_v_ob) != 0);
+  if (__pyx_t_1) {
+
+    /* "protocols/_speedups.pyx":1068
+ * 
+ *     if PyClass_Check(ob):
+ *         return cachedMRO(ob, 0)             # <<<<<<<<<<<<<<
+ * 
+ *     elif PyType_Check(ob):
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_2 = __pyx_f_9protocols_9_speedups_cachedMRO(__pyx_v_ob, __pyx_int_0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 1068, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_r = __pyx_t_2;
+    __pyx_t_2 = 0;
+    goto __pyx_L0;
+
+    /* "protocols/_speedups.pyx":1067
+ *     cdef void *tmp
+ * 
+ *     if PyClass_Check(ob):             # <<<<<<<<<<<<<<
+ *         return cachedMRO(ob, 0)
+ * 
+ */
+  }
+
+  /* "protocols/_speedups.pyx":1070
+ *         return cachedMRO(ob, 0)
+ * 
+ *     elif PyType_Check(ob):             # <<<<<<<<<<<<<<
+ *         tmp = <void *> ((<PyTypeObject *>ob).tp_mro)
+ *         if tmp:
+ */
+  __pyx_t_1 = (PyType_Check(__pyx_v_ob) != 0);
+  if (__pyx_t_1) {
+
+    /* "protocols/_speedups.pyx":1071
+ * 
+ *     elif PyType_Check(ob):
+ *         tmp = <void *> ((<PyTypeObject *>ob).tp_mro)             # <<<<<<<<<<<<<<
+ *         if tmp:
+ *             return <object> tmp
+ */
+    __pyx_v_tmp = ((void *)((PyTypeObject *)__pyx_v_ob)->tp_mro);
+
+    /* "protocols/_speedups.pyx":1072
+ *     elif PyType_Check(ob):
+ *         tmp = <void *> ((<PyTypeObject *>ob).tp_mro)
+ *         if tmp:             # <<<<<<<<<<<<<<
+ *             return <object> tmp
+ *         return ob.__mro__
+ */
+    __pyx_t_1 = (__pyx_v_tmp != 0);
+    if (__pyx_t_1) {
+
+      /* "protocols/_speedups.pyx":1073
+ *         tmp = <void *> ((<PyTypeObject *>ob).tp_mro)
+ *         if tmp:
+ *             return <object> tmp             # <<<<<<<<<<<<<<
+ *         return ob.__mro__
+ * 
+ */
+      __Pyx_XDECREF(__pyx_r);
+      __Pyx_INCREF(((PyObject *)__pyx_v_tmp));
+      __pyx_r = ((PyObject *)__pyx_v_tmp);
+      goto __pyx_L0;
+
+      /* "protocols/_speedups.pyx":1072
+ *     elif PyType_Check(ob):
+ *         tmp = <void *> ((<PyTypeObject *>ob).tp_mro)
+ *         if tmp:             # <<<<<<<<<<<<<<
+ *             return <object> tmp
+ *         return ob.__mro__
+ */
+    }
+
+    /* "protocols/_speedups.pyx":1074
+ *         if tmp:
+ *             return <object> tmp
+ *         return ob.__mro__             # <<<<<<<<<<<<<<
+ * 
+ *     elif PyObject_TypeCheck(ob,__ECType):
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_ob, __pyx_n_s_mro); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 1074, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_r = __pyx_t_2;
+    __pyx_t_2 = 0;
+    goto __pyx_L0;
+
+    /* "protocols/_speedups.pyx":1070
+ *         return cachedMRO(ob, 0)
+ * 
+ *     elif PyType_Check(ob):             # <<<<<<<<<<<<<<
+ *         tmp = <void *> ((<PyTypeObject *>ob).tp_mro)
+ *         if tmp:
+ */
+  }
+
+  /* "protocols/_speedups.pyx":1076
+ *         return ob.__mro__
+ * 
+ *     elif PyObject_TypeCheck(ob,__ECType):             # <<<<<<<<<<<<<<
+ *         return extClassMRO(ob)
+ * 
+ */
+  __pyx_t_2 = __pyx_v_9protocols_9_speedups___ECType;
+  __Pyx_INCREF(__pyx_t_2);
+  __pyx_t_1 = (PyObject_TypeCheck(__pyx_v_ob, __pyx_t_2) != 0);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  if (__pyx_t_1) {
+
+    /* "protocols/_speedups.pyx":1077
+ * 
+ *     elif PyObject_TypeCheck(ob,__ECType):
+ *         return extClassMRO(ob)             # <<<<<<<<<<<<<<
+ * 
+ *     return (ob,)
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_extClassMRO); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 1077, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_4 = NULL;
+    if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
+      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+      if (likely(__pyx_t_4)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+        __Pyx_INCREF(__pyx_t_4);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_3, function);
+      }
+    }
+    __pyx_t_2 = (__pyx_t_4) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_4, __pyx_v_ob) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_v_ob);
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 1077, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __pyx_r = __pyx_t_2;
+    __pyx_t_2 = 0;
+    goto __pyx_L0;
+
+    /* "protocols/_speedups.pyx":1076
+ *         return ob.__mro__
+ * 
+ *     elif PyObject_TypeCheck(ob,__ECType):             # <<<<<<<<<<<<<<
+ *         return extClassMRO(ob)
+ * 
+ */
+  }
+
+  /* "protocols/_speedups.pyx":1079
+ *         return extClassMRO(ob)
+ * 
+ *     return (ob,)             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 1079, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_INCREF(__pyx_v_ob);
+  __Pyx_GIVEREF(__pyx_v_ob);
+  PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_v_ob);
+  __pyx_r = __pyx_t_2;
+  __pyx_t_2 = 0;
+  goto __pyx_L0;
+
+  /* "protocols/_speedups.pyx":1061
+ * 
+ * 
+ * cdef object declarationMRO(ob):             # <<<<<<<<<<<<<<
+ * 
+ *     # 'getMRO(ob)': the objects whose declarations apply to 'ob'
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_AddTraceback("protocols._speedups.declarationMRO", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "protocols/_speedups.pyx":1082
+ * 
+ * 
+ * cdef object declared(ob, name):             # <<<<<<<<<<<<<<
+ * 
+ *     # 'ob.__dict__.get(name)', reading the dictionary directly if possible
+ */
+
+static PyObject *__pyx_f_9protocols_9_speedups_declared(PyObject *__pyx_v_ob, PyObject *__pyx_v_name) {
+  void **__pyx_v_dictptr;
+  void *__pyx_v_tmp;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  void *__pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("declared", 0);
+
+  /* "protocols/_speedups.pyx":1089
+ *     cdef void *tmp
+ * 
+ *     dictptr = NULL             # <<<<<<<<<<<<<<
+ *     tmp = NULL
+ * 
+ */
+  __pyx_v_dictptr = NULL;
+
+  /* "protocols/_speedups.pyx":1090
+ * 
+ *     dictptr = NULL
+ *     tmp = NULL             # <<<<<<<<<<<<<<
+ * 
+ *     if PyClass_Check(ob):
+ */
+  __pyx_v_tmp = NULL;
+
+  /* "protocols/_speedups.pyx":1092
+ *     tmp = NULL
+ * 
+ *     if PyClass_Check(ob):             # <<<<<<<<<<<<<<
+ *         tmp = (<PyClassObject *>ob).cl_dict
+ *     elif PyInstance_Check(ob):
+ */
+  __pyx_t_1 = (PyClass_Check(__pyx_v_ob) != 0);
+  if (__pyx_t_1) {
+
+    /* "protocols/_speedups.pyx":1093
+ * 
+ *     if PyClass_Check(ob):
+ *         tmp = (<PyClassObject *>ob).cl_dict             # <<<<<<<<<<<<<<
+ *     elif PyInstance_Check(ob):
+ *         tmp = (<PyInstanceObject *>ob).in_dict
+ */
+    __pyx_t_2 = ((PyClassObject *)__pyx_v_ob)->cl_dict;
+    __pyx_v_tmp = __pyx_t_2;
+
+    /* "protocols/_speedups.pyx":1092
+ *     tmp = NULL
+ * 
+ *     if PyClass_Check(ob):             # <<<<<<<<<<<<<<
+ *         tmp = (<PyClassObject *>ob).cl_dict
+ *     elif PyInstance_Check(ob):
+ */
+    goto __pyx_L3;
+  }
+
+  /* "protocols/_speedups.pyx":1094
+ *     if PyClass_Check(ob):
+ *         tmp = (<PyClassObject *>ob).cl_dict
+ *     elif PyInstance_Check(ob):             # <<<<<<<<<<<<<<
+ *         tmp = (<PyInstanceObject *>ob).in_dict
+ *     elif PyType_Check(ob):
+ */
+  __pyx_t_1 = (PyInstance_Check(__pyx_v_ob) != 0);
+  if (__pyx_t_1) {
+
+    /* "protocols/_speedups.pyx":1095
+ *         tmp = (<PyClassObject *>ob).cl_dict
+ *     elif PyInstance_Check(ob):
+ *         tmp = (<PyInstanceObject *>ob).in_dict             # <<<<<<<<<<<<<<
+ *     elif PyType_Check(ob):
+ *         tmp = (<PyTypeObject *>ob).tp_dict
+ */
+    __pyx_t_2 = ((PyInstanceObject *)__pyx_v_ob)->in_dict;
+    __pyx_v_tmp = __pyx_t_2;
+
+    /* "protocols/_speedups.pyx":1094
+ *     if PyClass_Check(ob):
+ *         tmp = (<PyClassObject *>ob).cl_dict
+ *     elif PyInstance_Check(ob):             # <<<<<<<<<<<<<<
+ *         tmp = (<PyInstanceObject *>ob).in_dict
+ *     elif PyType_Check(ob):
+ */
+    goto __pyx_L3;
+  }
+
+  /* "protocols/_speedups.pyx":1096
+ *     elif PyInstance_Check(ob):
+ *         tmp = (<PyInstanceObject *>ob).in_dict
+ *     elif PyType_Check(ob):             # <<<<<<<<<<<<<<
+ *         tmp = (<PyTypeObject *>ob).tp_dict
+ *     else:
+ */
+  __pyx_t_1 = (PyType_Check(__pyx_v_ob) != 0);
+  if (__pyx_t_1) {
+
+    /* "protocols/_speedups.pyx":1097
+ *         tmp = (<PyInstanceObject *>ob).in_dict
+ *     elif PyType_Check(ob):
+ *         tmp = (<PyTypeObject *>ob).tp_dict             # <<<<<<<<<<<<<<
+ *     else:
+ *         dictptr = _PyObject_GetDictPtr(ob)
+ */
+    __pyx_t_2 = ((PyTypeObject *)__pyx_v_ob)->tp_dict;
+    __pyx_v_tmp = __pyx_t_2;
+
+    /* "protocols/_speedups.pyx":1096
+ *     elif PyInstance_Check(ob):
+ *         tmp = (<PyInstanceObject *>ob).in_dict
+ *     elif PyType_Check(ob):             # <<<<<<<<<<<<<<
+ *         tmp = (<PyTypeObject *>ob).tp_dict
+ *     else:
+ */
+    goto __pyx_L3;
+  }
+
+  /* "protocols/_speedups.pyx":1099
+ *         tmp = (<PyTypeObject *>ob).tp_dict
+ *     else:
+ *         dictptr = _PyObject_GetDictPtr(ob)             # <<<<<<<<<<<<<<
+ *         if dictptr:
+ *             tmp = dictptr[0]
+ */
+  /*else*/ {
+    __pyx_v_dictptr = _PyObject_GetDictPtr(__pyx_v_ob);
+
+    /* "protocols/_speedups.pyx":1100
+ *     else:
+ *         dictptr = _PyObject_GetDictPtr(ob)
+ *         if dictptr:             # <<<<<<<<<<<<<<
+ *             tmp = dictptr[0]
+ * 
+ */
+    __pyx_t_1 = (__pyx_v_dictptr != 0);
+    if (__pyx_t_1) {
+
+      /* "protocols/_speedups.pyx":1101
+ *         dictptr = _PyObject_GetDictPtr(ob)
+ *         if dictptr:
+ *             tmp = dictptr[0]             # <<<<<<<<<<<<<<
+ * 
+ *     if tmp:
+ */
+      __pyx_v_tmp = (__pyx_v_dictptr[0]);
+
+      /* "protocols/_speedups.pyx":1100
+ *     else:
+ *         dictptr = _PyObject_GetDictPtr(ob)
+ *         if dictptr:             # <<<<<<<<<<<<<<
+ *             tmp = dictptr[0]
+ * 
+ */
+    }
+  }
+  __pyx_L3:;
+
+  /* "protocols/_speedups.pyx":1103
+ *             tmp = dictptr[0]
+ * 
+ *     if tmp:             # <<<<<<<<<<<<<<
+ *         tmp = PyDict_GetItem(<object> tmp, name)
+ *         if tmp:
+ */
+  __pyx_t_1 = (__pyx_v_tmp != 0);
+  if (__pyx_t_1) {
+
+    /* "protocols/_speedups.pyx":1104
+ * 
+ *     if tmp:
+ *         tmp = PyDict_GetItem(<object> tmp, name)             # <<<<<<<<<<<<<<
+ *         if tmp:
+ *             return <object> tmp
+ */
+    __pyx_v_tmp = PyDict_GetItem(((PyObject *)__pyx_v_tmp), __pyx_v_name);
+
+    /* "protocols/_speedups.pyx":1105
+ *     if tmp:
+ *         tmp = PyDict_GetItem(<object> tmp, name)
+ *         if tmp:             # <<<<<<<<<<<<<<
+ *             return <object> tmp
+ *         return None
+ */
+    __pyx_t_1 = (__pyx_v_tmp != 0);
+    if (__pyx_t_1) {
+
+      /* "protocols/_speedups.pyx":1106
+ *         tmp = PyDict_GetItem(<object> tmp, name)
+ *         if tmp:
+ *             return <object> tmp             # <<<<<<<<<<<<<<
+ *         return None
+ * 
+ */
+      __Pyx_XDECREF(__pyx_r);
+      __Pyx_INCREF(((PyObject *)__pyx_v_tmp));
+      __pyx_r = ((PyObject *)__pyx_v_tmp);
+      goto __pyx_L0;
+
+      /* "protocols/_speedups.pyx":1105
+ *     if tmp:
+ *         tmp = PyDict_GetItem(<object> tmp, name)
+ *         if tmp:             # <<<<<<<<<<<<<<
+ *             return <object> tmp
+ *         return None
+ */
+    }
+
+    /* "protocols/_speedups.pyx":1107
+ *         if tmp:
+ *             return <object> tmp
+ *         return None             # <<<<<<<<<<<<<<
+ * 
+ *     return ob.__dict__.get(name)
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+    goto __pyx_L0;
+
+    /* "protocols/_speedups.pyx":1103
+ *             tmp = dictptr[0]
+ * 
+ *     if tmp:             # <<<<<<<<<<<<<<
+ *         tmp = PyDict_GetItem(<object> tmp, name)
+ *         if tmp:
+ */
+  }
+
+  /* "protocols/_speedups.pyx":1109
+ *         return None
+ * 
+ *     return ob.__dict__.get(name)             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_ob, __pyx_n_s_dict); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 1109, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_get); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 1109, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_4 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_5))) {
+    __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_5);
+    if (likely(__pyx_t_4)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_5);
+      __Pyx_INCREF(__pyx_t_4);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_5, function);
+    }
+  }
+  __pyx_t_3 = (__pyx_t_4) ? __Pyx_PyObject_Call2Args(__pyx_t_5, __pyx_t_4, __pyx_v_name) : __Pyx_PyObject_CallOneArg(__pyx_t_5, __pyx_v_name);
+  __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+  if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 1109, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_r = __pyx_t_3;
+  __pyx_t_3 = 0;
+  goto __pyx_L0;
+
+  /* "protocols/_speedups.pyx":1082
+ * 
+ * 
+ * cdef object declared(ob, name):             # <<<<<<<<<<<<<<
+ * 
+ *     # 'ob.__dict__.get(name)', reading the dictionary directly if possible
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_AddTraceback("protocols._speedups.declared", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "protocols/_speedups.pyx":1112
+ * 
+ * 
+ * cdef object providedRecord(ob, protocol):             # <<<<<<<<<<<<<<
+ * 
+ *     # The record for 'protocol' in 'ob.__protocols_provided__', or 'None'
+ */
+
+static PyObject *__pyx_f_9protocols_9_speedups_providedRecord(PyObject *__pyx_v_ob, PyObject *__pyx_v_protocol) {
+  void *__pyx_v_tmp;
+  int __pyx_v_i;
+  int __pyx_v_size;
+  PyObject *__pyx_v_conf = NULL;
+  PyObject *__pyx_v_key = NULL;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  int __pyx_t_3;
+  int __pyx_t_4;
+  long __pyx_t_5;
+  void *__pyx_t_6;
+  int __pyx_t_7;
+  int __pyx_t_8;
+  PyObject *__pyx_t_9 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("providedRecord", 0);
+
+  /* "protocols/_speedups.pyx":1119
+ *     cdef int i, size
+ * 
+ *     conf = declared(ob, __provided)             # <<<<<<<<<<<<<<
+ * 
+ *     if conf is None:
+ */
+  __pyx_t_1 = __pyx_v_9protocols_9_speedups___provided;
+  __Pyx_INCREF(__pyx_t_1);
+  __pyx_t_2 = __pyx_f_9protocols_9_speedups_declared(__pyx_v_ob, __pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 1119, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_v_conf = __pyx_t_2;
+  __pyx_t_2 = 0;
+
+  /* "protocols/_speedups.pyx":1121
+ *     conf = declared(ob, __provided)
+ * 
+ *     if conf is None:             # <<<<<<<<<<<<<<
+ *         return None
+ * 
+ */
+  __pyx_t_3 = (__pyx_v_conf == Py_None);
+  __pyx_t_4 = (__pyx_t_3 != 0);
+  if (__pyx_t_4) {
+
+    /* "protocols/_speedups.pyx":1122
+ * 
+ *     if conf is None:
+ *         return None             # <<<<<<<<<<<<<<
+ * 
+ *     elif PyTuple_Check(conf):
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+    goto __pyx_L0;
+
+    /* "protocols/_speedups.pyx":1121
+ *     conf = declared(ob, __provided)
+ * 
+ *     if conf is None:             # <<<<<<<<<<<<<<
+ *         return None
+ * 
+ */
+  }
+
+  /* "protocols/_speedups.pyx":1124
+ *         return None
+ * 
+ *     elif PyTuple_Check(conf):             # <<<<<<<<<<<<<<
+ *         # a 'providedRegistry': (protocol, record, protocol, record, ...)
+ *         size = PyTuple_GET_SIZE(<PyTupleObject *>conf)
+ */
+  __pyx_t_4 = (PyTuple_Check(__pyx_v_conf) != 0);
+  if (__pyx_t_4) {
+
+    /* "protocols/_speedups.pyx":1126
+ *     elif PyTuple_Check(conf):
+ *         # a 'providedRegistry': (protocol, record, protocol, record, ...)
+ *         size = PyTuple_GET_SIZE(<PyTupleObject *>conf)             # <<<<<<<<<<<<<<
+ *         for i from 0 <= i < size-1 by 2:
+ *             key = <object> PyTuple_GET_ITEM(<PyTupleObject *>conf, i)
+ */
+    __pyx_v_size = PyTuple_GET_SIZE(((PyTupleObject *)__pyx_v_conf));
+
+    /* "protocols/_speedups.pyx":1127
+ *         # a 'providedRegistry': (protocol, record, protocol, record, ...)
+ *         size = PyTuple_GET_SIZE(<PyTupleObject *>conf)
+ *         for i from 0 <= i < size-1 by 2:             # <<<<<<<<<<<<<<
+ *             key = <object> PyTuple_GET_ITEM(<PyTupleObject *>conf, i)
+ *             if key is protocol or PyObject_RichCompareBool(key,protocol,Py_EQ):
+ */
+    __pyx_t_5 = (__pyx_v_size - 1);
+    for (__pyx_v_i = 0; __pyx_v_i < __pyx_t_5; __pyx_v_i+=2) {
+
+      /* "protocols/_speedups.pyx":1128
+ *         size = PyTuple_GET_SIZE(<PyTupleObject *>conf)
+ *         for i from 0 <= i < size-1 by 2:
+ *             key = <object> PyTuple_GET_ITEM(<PyTupleObject *>conf, i)             # <<<<<<<<<<<<<<
+ *             if key is protocol or PyObject_RichCompareBool(key,protocol,Py_EQ):
+ *                 return <object> PyTuple_GET_ITEM(<PyTupleObject *>conf, i+1)
+ */
+      __pyx_t_6 = PyTuple_GET_ITEM(((PyTupleObject *)__pyx_v_conf), __pyx_v_i);
+      __pyx_t_2 = ((PyObject *)__pyx_t_6);
+      __Pyx_INCREF(__pyx_t_2);
+      __Pyx_XDECREF_SET(__pyx_v_key, __pyx_t_2);
+      __pyx_t_2 = 0;
+
+      /* "protocols/_speedups.pyx":1129
+ *         for i from 0 <= i < size-1 by 2:
+ *             key = <object> PyTuple_GET_ITEM(<PyTupleObject *>conf, i)
+ *             if key is protocol or PyObject_RichCompareBool(key,protocol,Py_EQ):             # <<<<<<<<<<<<<<
+ *                 return <object> PyTuple_GET_ITEM(<PyTupleObject *>conf, i+1)
+ *         return None
+ */
+      __pyx_t_3 = (__pyx_v_key == __pyx_v_protocol);
+      __pyx_t_7 = (__pyx_t_3 != 0);
+      if (!__pyx_t_7) {
+      } else {
+        __pyx_t_4 = __pyx_t_7;
+        goto __pyx_L7_bool_binop_done;
+      }
+      __pyx_t_8 = PyObject_RichCompareBool(__pyx_v_key, __pyx_v_protocol, Py_EQ); if (unlikely(__pyx_t_8 == ((int)-1))) __PYX_ERR(0, 1129, __pyx_L1_error)
+      __pyx_t_7 = (__pyx_t_8 != 0);
+      __pyx_t_4 = __pyx_t_7;
+      __pyx_L7_bool_binop_done:;
+      if (__pyx_t_4) {
+
+        /* "protocols/_speedups.pyx":1130
+ *             key = <object> PyTuple_GET_ITEM(<PyTupleObject *>conf, i)
+ *             if key is protocol or PyObject_RichCompareBool(key,protocol,Py_EQ):
+ *                 return <object> PyTuple_GET_ITEM(<PyTupleObject *>conf, i+1)             # <<<<<<<<<<<<<<
+ *         return None
+ * 
+ */
+        __Pyx_XDECREF(__pyx_r);
+        __pyx_t_6 = PyTuple_GET_ITEM(((PyTupleObject *)__pyx_v_conf), (__pyx_v_i + 1));
+        __Pyx_INCREF(((PyObject *)__pyx_t_6));
+        __pyx_r = ((PyObject *)__pyx_t_6);
+        goto __pyx_L0;
+
+        /* "protocols/_speedups.pyx":1129
+ *         for i from 0 <= i < size-1 by 2:
+ *             key = <object> PyTuple_GET_ITEM(<PyTupleObject *>conf, i)
+ *             if key is protocol or PyObject_RichCompareBool(key,protocol,Py_EQ):             # <<<<<<<<<<<<<<
+ *                 return <object> PyTuple_GET_ITEM(<PyTupleObject *>conf, i+1)
+ *         return None
+ */
+      }
+    }
+
+    /* "protocols/_speedups.pyx":1131
+ *             if key is protocol or PyObject_RichCompareBool(key,protocol,Py_EQ):
+ *                 return <object> PyTuple_GET_ITEM(<PyTupleObject *>conf, i+1)
+ *         return None             # <<<<<<<<<<<<<<
+ * 
+ *     elif PyDict_Check(conf):
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+    goto __pyx_L0;
+
+    /* "protocols/_speedups.pyx":1124
+ *         return None
+ * 
+ *     elif PyTuple_Check(conf):             # <<<<<<<<<<<<<<
+ *         # a 'providedRegistry': (protocol, record, protocol, record, ...)
+ *         size = PyTuple_GET_SIZE(<PyTupleObject *>conf)
+ */
+  }
+
+  /* "protocols/_speedups.pyx":1133
+ *         return None
+ * 
+ *     elif PyDict_Check(conf):             # <<<<<<<<<<<<<<
+ *         tmp = PyDict_GetItem(conf, protocol)
+ *         if tmp:
+ */
+  __pyx_t_4 = (PyDict_Check(__pyx_v_conf) != 0);
+  if (__pyx_t_4) {
+
+    /* "protocols/_speedups.pyx":1134
+ * 
+ *     elif PyDict_Check(conf):
+ *         tmp = PyDict_GetItem(conf, protocol)             # <<<<<<<<<<<<<<
+ *         if tmp:
+ *             return <object> tmp
+ */
+    __pyx_v_tmp = PyDict_GetItem(__pyx_v_conf, __pyx_v_protocol);
+
+    /* "protocols/_speedups.pyx":1135
+ *     elif PyDict_Check(conf):
+ *         tmp = PyDict_GetItem(conf, protocol)
+ *         if tmp:             # <<<<<<<<<<<<<<
+ *             return <object> tmp
+ *         return None
+ */
+    __pyx_t_4 = (__pyx_v_tmp != 0);
+    if (__pyx_t_4) {
+
+      /* "protocols/_speedups.pyx":1136
+ *         tmp = PyDict_GetItem(conf, protocol)
+ *         if tmp:
+ *             return <object> tmp             # <<<<<<<<<<<<<<
+ *         return None
+ * 
+ */
+      __Pyx_XDECREF(__pyx_r);
+      __Pyx_INCREF(((PyObject *)__pyx_v_tmp));
+      __pyx_r = ((PyObject *)__pyx_v_tmp);
+      goto __pyx_L0;
+
+      /* "protocols/_speedups.pyx":1135
+ *     elif PyDict_Check(conf):
+ *         tmp = PyDict_GetItem(conf, protocol)
+ *         if tmp:             # <<<<<<<<<<<<<<
+ *             return <object> tmp
+ *         return None
+ */
+    }
+
+    /* "protocols/_speedups.pyx":1137
+ *         if tmp:
+ *             return <object> tmp
+ *         return None             # <<<<<<<<<<<<<<
+ * 
+ *     elif conf:
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+    goto __pyx_L0;
+
+    /* "protocols/_speedups.pyx":1133
+ *         return None
+ * 
+ *     elif PyDict_Check(conf):             # <<<<<<<<<<<<<<
+ *         tmp = PyDict_GetItem(conf, protocol)
+ *         if tmp:
+ */
+  }
+
+  /* "protocols/_speedups.pyx":1139
+ *         return None
+ * 
+ *     elif conf:             # <<<<<<<<<<<<<<
+ *         return conf.get(protocol)
+ * 
+ */
+  __pyx_t_4 = __Pyx_PyObject_IsTrue(__pyx_v_conf); if (unlikely(__pyx_t_4 < 0)) __PYX_ERR(0, 1139, __pyx_L1_error)
+  if (__pyx_t_4) {
+
+    /* "protocols/_speedups.pyx":1140
+ * 
+ *     elif conf:
+ *         return conf.get(protocol)             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_conf, __pyx_n_s_get); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 1140, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_9 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_1))) {
+      __pyx_t_9 = PyMethod_GET_SELF(__pyx_t_1);
+      if (likely(__pyx_t_9)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_1);
+        __Pyx_INCREF(__pyx_t_9);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_1, function);
+      }
+    }
+    __pyx_t_2 = (__pyx_t_9) ? __Pyx_PyObject_Call2Args(__pyx_t_1, __pyx_t_9, __pyx_v_protocol) : __Pyx_PyObject_CallOneArg(__pyx_t_1, __pyx_v_protocol);
+    __Pyx_XDECREF(__pyx_t_9); __pyx_t_9 = 0;
+    if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 1140, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_r = __pyx_t_2;
+    __pyx_t_2 = 0;
+    goto __pyx_L0;
+
+    /* "protocols/_speedups.pyx":1139
+ *         return None
+ * 
+ *     elif conf:             # <<<<<<<<<<<<<<
+ *         return conf.get(protocol)
+ * 
+ */
+  }
+
+  /* "protocols/_speedups.pyx":1112
+ * 
+ * 
+ * cdef object providedRecord(ob, protocol):             # <<<<<<<<<<<<<<
+ * 
+ *     # The record for 'protocol' in 'ob.__protocols_provided__', or 'None'
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_9);
+  __Pyx_AddTraceback("protocols._speedups.providedRecord", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_conf);
+  __Pyx_XDECREF(__pyx_v_key);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "protocols/_speedups.pyx":1143
+ * 
+ * 
+ * def ProviderMixin__conform__(self, protocol):             # <<<<<<<<<<<<<<
+ *     """Adapt 'self' using its (or its bases') '__protocols_provided__'"""
+ * 
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_9protocols_9_speedups_33ProviderMixin__conform__(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_9protocols_9_speedups_32ProviderMixin__conform__[] = "Adapt 'self' using its (or its bases') '__protocols_provided__'";
+static PyMethodDef __pyx_mdef_9protocols_9_speedups_33ProviderMixin__conform__ = {"ProviderMixin__conform__", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_9protocols_9_speedups_33ProviderMixin__conform__, METH_VARARGS|METH_KEYWORDS, __pyx_doc_9protocols_9_speedups_32ProviderMixin__conform__};
+static PyObject *__pyx_pw_9protocols_9_speedups_33ProviderMixin__conform__(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_self = 0;
+  PyObject *__pyx_v_protocol = 0;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("ProviderMixin__conform__ (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_self,&__pyx_n_s_protocol,0};
+    PyObject* values[2] = {0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_self)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_protocol)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("ProviderMixin__conform__", 1, 2, 2, 1); __PYX_ERR(0, 1143, __pyx_L3_error)
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "ProviderMixin__conform__") < 0)) __PYX_ERR(0, 1143, __pyx_L3_error)
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 2) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+    }
+    __pyx_v_self = values[0];
+    __pyx_v_protocol = values[1];
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("ProviderMixin__conform__", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 1143, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("protocols._speedups.ProviderMixin__conform__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_9protocols_9_speedups_32ProviderMixin__conform__(__pyx_self, __pyx_v_self, __pyx_v_protocol);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_9protocols_9_speedups_32ProviderMixin__conform__(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self, PyObject *__pyx_v_protocol) {
+  int __pyx_v_i;
+  PyObject *__pyx_v_mro = NULL;
+  PyObject *__pyx_v_record = NULL;
+  PyObject *__pyx_v_cls = NULL;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  void *__pyx_t_4;
+  int __pyx_t_5;
+  PyObject *__pyx_t_6 = NULL;
+  PyObject *__pyx_t_7 = NULL;
+  Py_ssize_t __pyx_t_8;
+  PyObject *(*__pyx_t_9)(PyObject *);
+  PyObject *__pyx_t_10 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("ProviderMixin__conform__", 0);
+
+  /* "protocols/_speedups.pyx":1148
+ *     cdef int i
+ * 
+ *     mro = declarationMRO(self)             # <<<<<<<<<<<<<<
+ * 
+ *     if PyTuple_Check(mro):
+ */
+  __pyx_t_1 = __pyx_f_9protocols_9_speedups_declarationMRO(__pyx_v_self); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 1148, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_v_mro = __pyx_t_1;
+  __pyx_t_1 = 0;
+
+  /* "protocols/_speedups.pyx":1150
+ *     mro = declarationMRO(self)
+ * 
+ *     if PyTuple_Check(mro):             # <<<<<<<<<<<<<<
+ *         for i from 0 <= i < PyTuple_GET_SIZE(<PyTupleObject *>mro):
+ *             record = providedRecord(
+ */
+  __pyx_t_2 = (PyTuple_Check(__pyx_v_mro) != 0);
+  if (__pyx_t_2) {
+
+    /* "protocols/_speedups.pyx":1151
+ * 
+ *     if PyTuple_Check(mro):
+ *         for i from 0 <= i < PyTuple_GET_SIZE(<PyTupleObject *>mro):             # <<<<<<<<<<<<<<
+ *             record = providedRecord(
+ *                 <object> PyTuple_GET_ITEM(<PyTupleObject *>mro, i), protocol
+ */
+    __pyx_t_3 = PyTuple_GET_SIZE(((PyTupleObject *)__pyx_v_mro));
+    for (__pyx_v_i = 0; __pyx_v_i < __pyx_t_3; __pyx_v_i++) {
+
+      /* "protocols/_speedups.pyx":1153
+ *         for i from 0 <= i < PyTuple_GET_SIZE(<PyTupleObject *>mro):
+ *             record = providedRecord(
+ *                 <object> PyTuple_GET_ITEM(<PyTupleObject *>mro, i), protocol             # <<<<<<<<<<<<<<
+ *             )
+ *             if record is not None:
+ */
+      __pyx_t_4 = PyTuple_GET_ITEM(((PyTupleObject *)__pyx_v_mro), __pyx_v_i);
+
+      /* "protocols/_speedups.pyx":1152
+ *     if PyTuple_Check(mro):
+ *         for i from 0 <= i < PyTuple_GET_SIZE(<PyTupleObject *>mro):
+ *             record = providedRecord(             # <<<<<<<<<<<<<<
+ *                 <object> PyTuple_GET_ITEM(<PyTupleObject *>mro, i), protocol
+ *             )
+ */
+      __pyx_t_1 = __pyx_f_9protocols_9_speedups_providedRecord(((PyObject *)__pyx_t_4), __pyx_v_protocol); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 1152, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      __Pyx_XDECREF_SET(__pyx_v_record, __pyx_t_1);
+      __pyx_t_1 = 0;
+
+      /* "protocols/_speedups.pyx":1155
+ *                 <object> PyTuple_GET_ITEM(<PyTupleObject *>mro, i), protocol
+ *             )
+ *             if record is not None:             # <<<<<<<<<<<<<<
+ *                 return recordAdapter(record)(self)
+ *     else:
+ */
+      __pyx_t_2 = (__pyx_v_record != Py_None);
+      __pyx_t_5 = (__pyx_t_2 != 0);
+      if (__pyx_t_5) {
+
+        /* "protocols/_speedups.pyx":1156
+ *             )
+ *             if record is not None:
+ *                 return recordAdapter(record)(self)             # <<<<<<<<<<<<<<
+ *     else:
+ *         for cls in mro:
+ */
+        __Pyx_XDECREF(__pyx_r);
+        __pyx_t_6 = __pyx_f_9protocols_9_speedups_recordAdapter(__pyx_v_record); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 1156, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_6);
+        __pyx_t_7 = NULL;
+        if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_6))) {
+          __pyx_t_7 = PyMethod_GET_SELF(__pyx_t_6);
+          if (likely(__pyx_t_7)) {
+            PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_6);
+            __Pyx_INCREF(__pyx_t_7);
+            __Pyx_INCREF(function);
+            __Pyx_DECREF_SET(__pyx_t_6, function);
+          }
+        }
+        __pyx_t_1 = (__pyx_t_7) ? __Pyx_PyObject_Call2Args(__pyx_t_6, __pyx_t_7, __pyx_v_self) : __Pyx_PyObject_CallOneArg(__pyx_t_6, __pyx_v_self);
+        __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
+        if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 1156, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_1);
+        __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+        __pyx_r = __pyx_t_1;
+        __pyx_t_1 = 0;
+        goto __pyx_L0;
+
+        /* "protocols/_speedups.pyx":1155
+ *                 <object> PyTuple_GET_ITEM(<PyTupleObject *>mro, i), protocol
+ *             )
+ *             if record is not None:             # <<<<<<<<<<<<<<
+ *                 return recordAdapter(record)(self)
+ *     else:
+ */
+      }
+    }
+
+    /* "protocols/_speedups.pyx":1150
+ *     mro = declarationMRO(self)
+ * 
+ *     if PyTuple_Check(mro):             # <<<<<<<<<<<<<<
+ *         for i from 0 <= i < PyTuple_GET_SIZE(<PyTupleObject *>mro):
+ *             record = providedRecord(
+ */
+    goto __pyx_L3;
+  }
+
+  /* "protocols/_speedups.pyx":1158
+ *                 return recordAdapter(record)(self)
+ *     else:
+ *         for cls in mro:             # <<<<<<<<<<<<<<
+ *             record = providedRecord(cls, protocol)
+ *             if record is not None:
+ */
+  /*else*/ {
+    if (likely(PyList_CheckExact(__pyx_v_mro)) || PyTuple_CheckExact(__pyx_v_mro)) {
+      __pyx_t_1 = __pyx_v_mro; __Pyx_INCREF(__pyx_t_1); __pyx_t_8 = 0;
+      __pyx_t_9 = NULL;
+    } else {
+      __pyx_t_8 = -1; __pyx_t_1 = PyObject_GetIter(__pyx_v_mro); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 1158, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      __pyx_t_9 = Py_TYPE(__pyx_t_1)->tp_iternext; if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 1158, __pyx_L1_error)
+    }
+    for (;;) {
+      if (likely(!__pyx_t_9)) {
+        if (likely(PyList_CheckExact(__pyx_t_1))) {
+          if (__pyx_t_8 >= PyList_GET_SIZE(__pyx_t_1)) break;
+          #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+          __pyx_t_6 = PyList_GET_ITEM(__pyx_t_1, __pyx_t_8); __Pyx_INCREF(__pyx_t_6); __pyx_t_8++; if (unlikely(0 < 0)) __PYX_ERR(0, 1158, __pyx_L1_error)
+          #else
+          __pyx_t_6 = PySequence_ITEM(__pyx_t_1, __pyx_t_8); __pyx_t_8++; if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 1158, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_6);
+          #endif
+        } else {
+          if (__pyx_t_8 >= PyTuple_GET_SIZE(__pyx_t_1)) break;
+          #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+          __pyx_t_6 = PyTuple_GET_ITEM(__pyx_t_1, __pyx_t_8); __Pyx_INCREF(__pyx_t_6); __pyx_t_8++; if (unlikely(0 < 0)) __PYX_ERR(0, 1158, __pyx_L1_error)
+          #else
+          __pyx_t_6 = PySequence_ITEM(__pyx_t_1, __pyx_t_8); __pyx_t_8++; if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 1158, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_6);
+          #endif
+        }
+      } else {
+        __pyx_t_6 = __pyx_t_9(__pyx_t_1);
+        if (unlikely(!__pyx_t_6)) {
+          PyObject* exc_type = PyErr_Occurred();
+          if (exc_type) {
+            if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
+            else __PYX_ERR(0, 1158, __pyx_L1_error)
+          }
+          break;
+        }
+        __Pyx_GOTREF(__pyx_t_6);
+      }
+      __Pyx_XDECREF_SET(__pyx_v_cls, __pyx_t_6);
+      __pyx_t_6 = 0;
+
+      /* "protocols/_speedups.pyx":1159
+ *     else:
+ *         for cls in mro:
+ *             record = providedRecord(cls, protocol)             # <<<<<<<<<<<<<<
+ *             if record is not None:
+ *                 return recordAdapter(record)(self)
+ */
+      __pyx_t_6 = __pyx_f_9protocols_9_speedups_providedRecord(__pyx_v_cls, __pyx_v_protocol); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 1159, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_6);
+      __Pyx_XDECREF_SET(__pyx_v_record, __pyx_t_6);
+      __pyx_t_6 = 0;
+
+      /* "protocols/_speedups.pyx":1160
+ *         for cls in mro:
+ *             record = providedRecord(cls, protocol)
+ *             if record is not None:             # <<<<<<<<<<<<<<
+ *                 return recordAdapter(record)(self)
+ * 
+ */
+      __pyx_t_5 = (__pyx_v_record != Py_None);
+      __pyx_t_2 = (__pyx_t_5 != 0);
+      if (__pyx_t_2) {
+
+        /* "protocols/_speedups.pyx":1161
+ *             record = providedRecord(cls, protocol)
+ *             if record is not None:
+ *                 return recordAdapter(record)(self)             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+        __Pyx_XDECREF(__pyx_r);
+        __pyx_t_7 = __pyx_f_9protocols_9_speedups_recordAdapter(__pyx_v_record); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 1161, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_7);
+        __pyx_t_10 = NULL;
+        if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_7))) {
+          __pyx_t_10 = PyMethod_GET_SELF(__pyx_t_7);
+          if (likely(__pyx_t_10)) {
+            PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_7);
+            __Pyx_INCREF(__pyx_t_10);
+            __Pyx_INCREF(function);
+            __Pyx_DECREF_SET(__pyx_t_7, function);
+          }
+        }
+        __pyx_t_6 = (__pyx_t_10) ? __Pyx_PyObject_Call2Args(__pyx_t_7, __pyx_t_10, __pyx_v_self) : __Pyx_PyObject_CallOneArg(__pyx_t_7, __pyx_v_self);
+        __Pyx_XDECREF(__pyx_t_10); __pyx_t_10 = 0;
+        if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 1161, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_6);
+        __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+        __pyx_r = __pyx_t_6;
+        __pyx_t_6 = 0;
+        __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+        goto __pyx_L0;
+
+        /* "protocols/_speedups.pyx":1160
+ *         for cls in mro:
+ *             record = providedRecord(cls, protocol)
+ *             if record is not None:             # <<<<<<<<<<<<<<
+ *                 return recordAdapter(record)(self)
+ * 
+ */
+      }
+
+      /* "protocols/_speedups.pyx":1158
+ *                 return recordAdapter(record)(self)
+ *     else:
+ *         for cls in mro:             # <<<<<<<<<<<<<<
+ *             record = providedRecord(cls, protocol)
+ *             if record is not None:
+ */
+    }
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  }
+  __pyx_L3:;
+
+  /* "protocols/_speedups.pyx":1143
+ * 
+ * 
+ * def ProviderMixin__conform__(self, protocol):             # <<<<<<<<<<<<<<
+ *     """Adapt 'self' using its (or its bases') '__protocols_provided__'"""
+ * 
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_XDECREF(__pyx_t_10);
+  __Pyx_AddTraceback("protocols._speedups.ProviderMixin__conform__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_mro);
+  __Pyx_XDECREF(__pyx_v_record);
+  __Pyx_XDECREF(__pyx_v_cls);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "protocols/_speedups.pyx":1164
+ * 
+ * 
+ * cdef object registryRecord(cls, protocol):             # <<<<<<<<<<<<<<
+ * 
+ *     # The record for 'protocol' in 'cls.__conform__', if it's a registry
+ */
+
+static PyObject *__pyx_f_9protocols_9_speedups_registryRecord(PyObject *__pyx_v_cls, PyObject *__pyx_v_protocol) {
+  void *__pyx_v_tmp;
+  PyObject *__pyx_v_conf = NULL;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  int __pyx_t_3;
+  int __pyx_t_4;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("registryRecord", 0);
+
+  /* "protocols/_speedups.pyx":1170
+ *     cdef void *tmp
+ * 
+ *     conf = declared(cls, __conform)             # <<<<<<<<<<<<<<
+ * 
+ *     if conf is None:
+ */
+  __pyx_t_1 = __pyx_v_9protocols_9_speedups___conform;
+  __Pyx_INCREF(__pyx_t_1);
+  __pyx_t_2 = __pyx_f_9protocols_9_speedups_declared(__pyx_v_cls, __pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 1170, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_v_conf = __pyx_t_2;
+  __pyx_t_2 = 0;
+
+  /* "protocols/_speedups.pyx":1172
+ *     conf = declared(cls, __conform)
+ * 
+ *     if conf is None:             # <<<<<<<<<<<<<<
+ *         return None
+ * 
+ */
+  __pyx_t_3 = (__pyx_v_conf == Py_None);
+  __pyx_t_4 = (__pyx_t_3 != 0);
+  if (__pyx_t_4) {
+
+    /* "protocols/_speedups.pyx":1173
+ * 
+ *     if conf is None:
+ *         return None             # <<<<<<<<<<<<<<
+ * 
+ *     if not PyObject_IsInstance(conf, _conformsRegistry):
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+    goto __pyx_L0;
+
+    /* "protocols/_speedups.pyx":1172
+ *     conf = declared(cls, __conform)
+ * 
+ *     if conf is None:             # <<<<<<<<<<<<<<
+ *         return None
+ * 
+ */
+  }
+
+  /* "protocols/_speedups.pyx":1175
+ *         return None
+ * 
+ *     if not PyObject_IsInstance(conf, _conformsRegistry):             # <<<<<<<<<<<<<<
+ *         raise TypeError("Incompatible __conform__ in base class", conf, cls)
+ * 
+ */
+  __pyx_t_2 = __pyx_v_9protocols_9_speedups__conformsRegistry;
+  __Pyx_INCREF(__pyx_t_2);
+  __pyx_t_4 = ((!(PyObject_IsInstance(__pyx_v_conf, __pyx_t_2) != 0)) != 0);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  if (unlikely(__pyx_t_4)) {
+
+    /* "protocols/_speedups.pyx":1176
+ * 
+ *     if not PyObject_IsInstance(conf, _conformsRegistry):
+ *         raise TypeError("Incompatible __conform__ in base class", conf, cls)             # <<<<<<<<<<<<<<
+ * 
+ *     tmp = PyDict_GetItem(conf, protocol)
+ */
+    __pyx_t_2 = PyTuple_New(3); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 1176, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_INCREF(__pyx_kp_s_Incompatible___conform___in_base);
+    __Pyx_GIVEREF(__pyx_kp_s_Incompatible___conform___in_base);
+    PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_kp_s_Incompatible___conform___in_base);
+    __Pyx_INCREF(__pyx_v_conf);
+    __Pyx_GIVEREF(__pyx_v_conf);
+    PyTuple_SET_ITEM(__pyx_t_2, 1, __pyx_v_conf);
+    __Pyx_INCREF(__pyx_v_cls);
+    __Pyx_GIVEREF(__pyx_v_cls);
+    PyTuple_SET_ITEM(__pyx_t_2, 2, __pyx_v_cls);
+    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_t_2, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 1176, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_Raise(__pyx_t_1, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __PYX_ERR(0, 1176, __pyx_L1_error)
+
+    /* "protocols/_speedups.pyx":1175
+ *         return None
+ * 
+ *     if not PyObject_IsInstance(conf, _conformsRegistry):             # <<<<<<<<<<<<<<
+ *         raise TypeError("Incompatible __conform__ in base class", conf, cls)
+ * 
+ */
+  }
+
+  /* "protocols/_speedups.pyx":1178
+ *         raise TypeError("Incompatible __conform__ in base class", conf, cls)
+ * 
+ *     tmp = PyDict_GetItem(conf, protocol)             # <<<<<<<<<<<<<<
+ *     if tmp:
+ *         return <object> tmp
+ */
+  __pyx_v_tmp = PyDict_GetItem(__pyx_v_conf, __pyx_v_protocol);
+
+  /* "protocols/_speedups.pyx":1179
+ * 
+ *     tmp = PyDict_GetItem(conf, protocol)
+ *     if tmp:             # <<<<<<<<<<<<<<
+ *         return <object> tmp
+ * 
+ */
+  __pyx_t_4 = (__pyx_v_tmp != 0);
+  if (__pyx_t_4) {
+
+    /* "protocols/_speedups.pyx":1180
+ *     tmp = PyDict_GetItem(conf, protocol)
+ *     if tmp:
+ *         return <object> tmp             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_INCREF(((PyObject *)__pyx_v_tmp));
+    __pyx_r = ((PyObject *)__pyx_v_tmp);
+    goto __pyx_L0;
+
+    /* "protocols/_speedups.pyx":1179
+ * 
+ *     tmp = PyDict_GetItem(conf, protocol)
+ *     if tmp:             # <<<<<<<<<<<<<<
+ *         return <object> tmp
+ * 
+ */
+  }
+
+  /* "protocols/_speedups.pyx":1164
+ * 
+ * 
+ * cdef object registryRecord(cls, protocol):             # <<<<<<<<<<<<<<
+ * 
+ *     # The record for 'protocol' in 'cls.__conform__', if it's a registry
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_AddTraceback("protocols._speedups.registryRecord", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_conf);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "protocols/_speedups.pyx":1183
+ * 
+ * 
+ * def conformsRegistry_findImplementation(self,subject,protocol,checkSelf=True):             # <<<<<<<<<<<<<<
+ * 
+ *     cdef int i
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_9protocols_9_speedups_35conformsRegistry_findImplementation(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static PyMethodDef __pyx_mdef_9protocols_9_speedups_35conformsRegistry_findImplementation = {"conformsRegistry_findImplementation", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_9protocols_9_speedups_35conformsRegistry_findImplementation, METH_VARARGS|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_9protocols_9_speedups_35conformsRegistry_findImplementation(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  CYTHON_UNUSED PyObject *__pyx_v_self = 0;
+  PyObject *__pyx_v_subject = 0;
+  PyObject *__pyx_v_protocol = 0;
+  CYTHON_UNUSED PyObject *__pyx_v_checkSelf = 0;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("conformsRegistry_findImplementation (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_self,&__pyx_n_s_subject,&__pyx_n_s_protocol,&__pyx_n_s_checkSelf,0};
+    PyObject* values[4] = {0,0,0,0};
+    values[3] = ((PyObject *)Py_True);
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        CYTHON_FALLTHROUGH;
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_self)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_subject)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("conformsRegistry_findImplementation", 0, 3, 4, 1); __PYX_ERR(0, 1183, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  2:
+        if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_protocol)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("conformsRegistry_findImplementation", 0, 3, 4, 2); __PYX_ERR(0, 1183, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  3:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_checkSelf);
+          if (value) { values[3] = value; kw_args--; }
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "conformsRegistry_findImplementation") < 0)) __PYX_ERR(0, 1183, __pyx_L3_error)
+      }
+    } else {
+      switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        CYTHON_FALLTHROUGH;
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+    }
+    __pyx_v_self = values[0];
+    __pyx_v_subject = values[1];
+    __pyx_v_protocol = values[2];
+    __pyx_v_checkSelf = values[3];
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("conformsRegistry_findImplementation", 0, 3, 4, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 1183, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("protocols._speedups.conformsRegistry_findImplementation", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_9protocols_9_speedups_34conformsRegistry_findImplementation(__pyx_self, __pyx_v_self, __pyx_v_subject, __pyx_v_protocol, __pyx_v_checkSelf);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_9protocols_9_speedups_34conformsRegistry_findImplementation(CYTHON_UNUSED PyObject *__pyx_self, CYTHON_UNUSED PyObject *__pyx_v_self, PyObject *__pyx_v_subject, PyObject *__pyx_v_protocol, CYTHON_UNUSED PyObject *__pyx_v_checkSelf) {
+  int __pyx_v_i;
+  PyObject *__pyx_v_mro = NULL;
+  PyObject *__pyx_v_record = NULL;
+  PyObject *__pyx_v_cls = NULL;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  void *__pyx_t_4;
+  int __pyx_t_5;
+  PyObject *__pyx_t_6 = NULL;
+  PyObject *__pyx_t_7 = NULL;
+  Py_ssize_t __pyx_t_8;
+  PyObject *(*__pyx_t_9)(PyObject *);
+  PyObject *__pyx_t_10 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("conformsRegistry_findImplementation", 0);
+
+  /* "protocols/_speedups.pyx":1187
+ *     cdef int i
+ * 
+ *     mro = declarationMRO(subject)             # <<<<<<<<<<<<<<
+ * 
+ *     if PyTuple_Check(mro):
+ */
+  __pyx_t_1 = __pyx_f_9protocols_9_speedups_declarationMRO(__pyx_v_subject); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 1187, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_v_mro = __pyx_t_1;
+  __pyx_t_1 = 0;
+
+  /* "protocols/_speedups.pyx":1189
+ *     mro = declarationMRO(subject)
+ * 
+ *     if PyTuple_Check(mro):             # <<<<<<<<<<<<<<
+ *         for i from 0 <= i < PyTuple_GET_SIZE(<PyTupleObject *>mro):
+ *             record = registryRecord(
+ */
+  __pyx_t_2 = (PyTuple_Check(__pyx_v_mro) != 0);
+  if (__pyx_t_2) {
+
+    /* "protocols/_speedups.pyx":1190
+ * 
+ *     if PyTuple_Check(mro):
+ *         for i from 0 <= i < PyTuple_GET_SIZE(<PyTupleObject *>mro):             # <<<<<<<<<<<<<<
+ *             record = registryRecord(
+ *                 <object> PyTuple_GET_ITEM(<PyTupleObject *>mro, i), protocol
+ */
+    __pyx_t_3 = PyTuple_GET_SIZE(((PyTupleObject *)__pyx_v_mro));
+    for (__pyx_v_i = 0; __pyx_v_i < __pyx_t_3; __pyx_v_i++) {
+
+      /* "protocols/_speedups.pyx":1192
+ *         for i from 0 <= i < PyTuple_GET_SIZE(<PyTupleObject *>mro):
+ *             record = registryRecord(
+ *                 <object> PyTuple_GET_ITEM(<PyTupleObject *>mro, i), protocol             # <<<<<<<<<<<<<<
+ *             )
+ *             if record is not None:
+ */
+      __pyx_t_4 = PyTuple_GET_ITEM(((PyTupleObject *)__pyx_v_mro), __pyx_v_i);
+
+      /* "protocols/_speedups.pyx":1191
+ *     if PyTuple_Check(mro):
+ *         for i from 0 <= i < PyTuple_GET_SIZE(<PyTupleObject *>mro):
+ *             record = registryRecord(             # <<<<<<<<<<<<<<
+ *                 <object> PyTuple_GET_ITEM(<PyTupleObject *>mro, i), protocol
+ *             )
+ */
+      __pyx_t_1 = __pyx_f_9protocols_9_speedups_registryRecord(((PyObject *)__pyx_t_4), __pyx_v_protocol); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 1191, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      __Pyx_XDECREF_SET(__pyx_v_record, __pyx_t_1);
+      __pyx_t_1 = 0;
+
+      /* "protocols/_speedups.pyx":1194
+ *                 <object> PyTuple_GET_ITEM(<PyTupleObject *>mro, i), protocol
+ *             )
+ *             if record is not None:             # <<<<<<<<<<<<<<
+ *                 return recordAdapter(record)(subject)
+ *     else:
+ */
+      __pyx_t_2 = (__pyx_v_record != Py_None);
+      __pyx_t_5 = (__pyx_t_2 != 0);
+      if (__pyx_t_5) {
+
+        /* "protocols/_speedups.pyx":1195
+ *             )
+ *             if record is not None:
+ *                 return recordAdapter(record)(subject)             # <<<<<<<<<<<<<<
+ *     else:
+ *         for cls in mro:
+ */
+        __Pyx_XDECREF(__pyx_r);
+        __pyx_t_6 = __pyx_f_9protocols_9_speedups_recordAdapter(__pyx_v_record); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 1195, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_6);
+        __pyx_t_7 = NULL;
+        if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_6))) {
+          __pyx_t_7 = PyMethod_GET_SELF(__pyx_t_6);
+          if (likely(__pyx_t_7)) {
+            PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_6);
+            __Pyx_INCREF(__pyx_t_7);
+            __Pyx_INCREF(function);
+            __Pyx_DECREF_SET(__pyx_t_6, function);
+          }
+        }
+        __pyx_t_1 = (__pyx_t_7) ? __Pyx_PyObject_Call2Args(__pyx_t_6, __pyx_t_7, __pyx_v_subject) : __Pyx_PyObject_CallOneArg(__pyx_t_6, __pyx_v_subject);
+        __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
+        if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 1195, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_1);
+        __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+        __pyx_r = __pyx_t_1;
+        __pyx_t_1 = 0;
+        goto __pyx_L0;
+
+        /* "protocols/_speedups.pyx":1194
+ *                 <object> PyTuple_GET_ITEM(<PyTupleObject *>mro, i), protocol
+ *             )
+ *             if record is not None:             # <<<<<<<<<<<<<<
+ *                 return recordAdapter(record)(subject)
+ *     else:
+ */
+      }
+    }
+
+    /* "protocols/_speedups.pyx":1189
+ *     mro = declarationMRO(subject)
+ * 
+ *     if PyTuple_Check(mro):             # <<<<<<<<<<<<<<
+ *         for i from 0 <= i < PyTuple_GET_SIZE(<PyTupleObject *>mro):
+ *             record = registryRecord(
+ */
+    goto __pyx_L3;
+  }
+
+  /* "protocols/_speedups.pyx":1197
+ *                 return recordAdapter(record)(subject)
+ *     else:
+ *         for cls in mro:             # <<<<<<<<<<<<<<
+ *             record = registryRecord(cls, protocol)
+ *             if record is not None:
+ */
+  /*else*/ {
+    if (likely(PyList_CheckExact(__pyx_v_mro)) || PyTuple_CheckExact(__pyx_v_mro)) {
+      __pyx_t_1 = __pyx_v_mro; __Pyx_INCREF(__pyx_t_1); __pyx_t_8 = 0;
+      __pyx_t_9 = NULL;
+    } else {
+      __pyx_t_8 = -1; __pyx_t_1 = PyObject_GetIter(__pyx_v_mro); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 1197, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      __pyx_t_9 = Py_TYPE(__pyx_t_1)->tp_iternext; if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 1197, __pyx_L1_error)
+    }
+    for (;;) {
+      if (likely(!__pyx_t_9)) {
+        if (likely(PyList_CheckExact(__pyx_t_1))) {
+          if (__pyx_t_8 >= PyList_GET_SIZE(__pyx_t_1)) break;
+          #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+          __pyx_t_6 = PyList_GET_ITEM(__pyx_t_1, __pyx_t_8); __Pyx_INCREF(__pyx_t_6); __pyx_t_8++; if (unlikely(0 < 0)) __PYX_ERR(0, 1197, __pyx_L1_error)
+          #else
+          __pyx_t_6 = PySequence_ITEM(__pyx_t_1, __pyx_t_8); __pyx_t_8++; if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 1197, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_6);
+          #endif
+        } else {
+          if (__pyx_t_8 >= PyTuple_GET_SIZE(__pyx_t_1)) break;
+          #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+          __pyx_t_6 = PyTuple_GET_ITEM(__pyx_t_1, __pyx_t_8); __Pyx_INCREF(__pyx_t_6); __pyx_t_8++; if (unlikely(0 < 0)) __PYX_ERR(0, 1197, __pyx_L1_error)
+          #else
+          __pyx_t_6 = PySequence_ITEM(__pyx_t_1, __pyx_t_8); __pyx_t_8++; if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 1197, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_6);
+          #endif
+        }
+      } else {
+        __pyx_t_6 = __pyx_t_9(__pyx_t_1);
+        if (unlikely(!__pyx_t_6)) {
+          PyObject* exc_type = PyErr_Occurred();
+          if (exc_type) {
+            if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
+            else __PYX_ERR(0, 1197, __pyx_L1_error)
+          }
+          break;
+        }
+        __Pyx_GOTREF(__pyx_t_6);
+      }
+      __Pyx_XDECREF_SET(__pyx_v_cls, __pyx_t_6);
+      __pyx_t_6 = 0;
+
+      /* "protocols/_speedups.pyx":1198
+ *     else:
+ *         for cls in mro:
+ *             record = registryRecord(cls, protocol)             # <<<<<<<<<<<<<<
+ *             if record is not None:
+ *                 return recordAdapter(record)(subject)
+ */
+      __pyx_t_6 = __pyx_f_9protocols_9_speedups_registryRecord(__pyx_v_cls, __pyx_v_protocol); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 1198, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_6);
+      __Pyx_XDECREF_SET(__pyx_v_record, __pyx_t_6);
+      __pyx_t_6 = 0;
+
+      /* "protocols/_speedups.pyx":1199
+ *         for cls in mro:
+ *             record = registryRecord(cls, protocol)
+ *             if record is not None:             # <<<<<<<<<<<<<<
+ *                 return recordAdapter(record)(subject)
+ * 
+ */
+      __pyx_t_5 = (__pyx_v_record != Py_None);
+      __pyx_t_2 = (__pyx_t_5 != 0);
+      if (__pyx_t_2) {
+
+        /* "protocols/_speedups.pyx":1200
+ *             record = registryRecord(cls, protocol)
+ *             if record is not None:
+ *                 return recordAdapter(record)(subject)             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+        __Pyx_XDECREF(__pyx_r);
+        __pyx_t_7 = __pyx_f_9protocols_9_speedups_recordAdapter(__pyx_v_record); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 1200, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_7);
+        __pyx_t_10 = NULL;
+        if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_7))) {
+          __pyx_t_10 = PyMethod_GET_SELF(__pyx_t_7);
+          if (likely(__pyx_t_10)) {
+            PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_7);
+            __Pyx_INCREF(__pyx_t_10);
+            __Pyx_INCREF(function);
+            __Pyx_DECREF_SET(__pyx_t_7, function);
+          }
+        }
+        __pyx_t_6 = (__pyx_t_10) ? __Pyx_PyObject_Call2Args(__pyx_t_7, __pyx_t_10, __pyx_v_subject) : __Pyx_PyObject_CallOneArg(__pyx_t_7, __pyx_v_subject);
+        __Pyx_XDECREF(__pyx_t_10); __pyx_t_10 = 0;
+        if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 1200, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_6);
+        __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+        __pyx_r = __pyx_t_6;
+        __pyx_t_6 = 0;
+        __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+        goto __pyx_L0;
+
+        /* "protocols/_speedups.pyx":1199
+ *         for cls in mro:
+ *             record = registryRecord(cls, protocol)
+ *             if record is not None:             # <<<<<<<<<<<<<<
+ *                 return recordAdapter(record)(subject)
+ * 
+ */
+      }
+
+      /* "protocols/_speedups.pyx":1197
+ *                 return recordAdapter(record)(subject)
+ *     else:
+ *         for cls in mro:             # <<<<<<<<<<<<<<
+ *             record = registryRecord(cls, protocol)
+ *             if record is not None:
+ */
+    }
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  }
+  __pyx_L3:;
+
+  /* "protocols/_speedups.pyx":1183
+ * 
+ * 
+ * def conformsRegistry_findImplementation(self,subject,protocol,checkSelf=True):             # <<<<<<<<<<<<<<
+ * 
+ *     cdef int i
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_XDECREF(__pyx_t_10);
+  __Pyx_AddTraceback("protocols._speedups.conformsRegistry_findImplementation", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_mro);
+  __Pyx_XDECREF(__pyx_v_record);
+  __Pyx_XDECREF(__pyx_v_cls);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "protocols/_speedups.pyx":1203
+ * 
+ * 
+ * def conformsRegistry__call__(self, protocol):             # <<<<<<<<<<<<<<
+ * 
+ *     cdef void *tmp
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_9protocols_9_speedups_37conformsRegistry__call__(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static PyMethodDef __pyx_mdef_9protocols_9_speedups_37conformsRegistry__call__ = {"conformsRegistry__call__", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_9protocols_9_speedups_37conformsRegistry__call__, METH_VARARGS|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_9protocols_9_speedups_37conformsRegistry__call__(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_self = 0;
+  PyObject *__pyx_v_protocol = 0;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("conformsRegistry__call__ (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_self,&__pyx_n_s_protocol,0};
+    PyObject* values[2] = {0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_self)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_protocol)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("conformsRegistry__call__", 1, 2, 2, 1); __PYX_ERR(0, 1203, __pyx_L3_error)
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "conformsRegistry__call__") < 0)) __PYX_ERR(0, 1203, __pyx_L3_error)
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 2) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+    }
+    __pyx_v_self = values[0];
+    __pyx_v_protocol = values[1];
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("conformsRegistry__call__", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 1203, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("protocols._speedups.conformsRegistry__call__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_9protocols_9_speedups_36conformsRegistry__call__(__pyx_self, __pyx_v_self, __pyx_v_protocol);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_9protocols_9_speedups_36conformsRegistry__call__(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self, PyObject *__pyx_v_protocol) {
+  void *__pyx_v_tmp;
+  PyObject *__pyx_v_subject = NULL;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  int __pyx_t_5;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("conformsRegistry__call__", 0);
+
+  /* "protocols/_speedups.pyx":1207
+ *     cdef void *tmp
+ * 
+ *     tmp = PyDict_GetItem(self, protocol)             # <<<<<<<<<<<<<<
+ * 
+ *     if tmp:
+ */
+  __pyx_v_tmp = PyDict_GetItem(__pyx_v_self, __pyx_v_protocol);
+
+  /* "protocols/_speedups.pyx":1209
+ *     tmp = PyDict_GetItem(self, protocol)
+ * 
+ *     if tmp:             # <<<<<<<<<<<<<<
+ *         subject = self.subject()
+ *         if subject is not None:
+ */
+  __pyx_t_1 = (__pyx_v_tmp != 0);
+  if (__pyx_t_1) {
+
+    /* "protocols/_speedups.pyx":1210
+ * 
+ *     if tmp:
+ *         subject = self.subject()             # <<<<<<<<<<<<<<
+ *         if subject is not None:
+ *             return recordAdapter(<object> tmp)(subject)
+ */
+    __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_subject); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 1210, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_4 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
+      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+      if (likely(__pyx_t_4)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+        __Pyx_INCREF(__pyx_t_4);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_3, function);
+      }
+    }
+    __pyx_t_2 = (__pyx_t_4) ? __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_4) : __Pyx_PyObject_CallNoArg(__pyx_t_3);
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 1210, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __pyx_v_subject = __pyx_t_2;
+    __pyx_t_2 = 0;
+
+    /* "protocols/_speedups.pyx":1211
+ *     if tmp:
+ *         subject = self.subject()
+ *         if subject is not None:             # <<<<<<<<<<<<<<
+ *             return recordAdapter(<object> tmp)(subject)
+ * 
+ */
+    __pyx_t_1 = (__pyx_v_subject != Py_None);
+    __pyx_t_5 = (__pyx_t_1 != 0);
+    if (__pyx_t_5) {
+
+      /* "protocols/_speedups.pyx":1212
+ *         subject = self.subject()
+ *         if subject is not None:
+ *             return recordAdapter(<object> tmp)(subject)             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+      __Pyx_XDECREF(__pyx_r);
+      __pyx_t_3 = __pyx_f_9protocols_9_speedups_recordAdapter(((PyObject *)__pyx_v_tmp)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 1212, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+      __pyx_t_4 = NULL;
+      if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
+        __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+        if (likely(__pyx_t_4)) {
+          PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+          __Pyx_INCREF(__pyx_t_4);
+          __Pyx_INCREF(function);
+          __Pyx_DECREF_SET(__pyx_t_3, function);
+        }
+      }
+      __pyx_t_2 = (__pyx_t_4) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_4, __pyx_v_subject) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_v_subject);
+      __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+      if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 1212, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_2);
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      __pyx_r = __pyx_t_2;
+      __pyx_t_2 = 0;
+      goto __pyx_L0;
+
+      /* "protocols/_speedups.pyx":1211
+ *     if tmp:
+ *         subject = self.subject()
+ *         if subject is not None:             # <<<<<<<<<<<<<<
+ *             return recordAdapter(<object> tmp)(subject)
+ * 
+ */
+    }
+
+    /* "protocols/_speedups.pyx":1209
+ *     tmp = PyDict_GetItem(self, protocol)
+ * 
+ *     if tmp:             # <<<<<<<<<<<<<<
+ *         subject = self.subject()
+ *         if subject is not None:
+ */
+  }
+
+  /* "protocols/_speedups.pyx":1203
+ * 
+ * 
+ * def conformsRegistry__call__(self, protocol):             # <<<<<<<<<<<<<<
+ * 
+ *     cdef void *tmp
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_AddTraceback("protocols._speedups.conformsRegistry__call__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_subject);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "protocols/_speedups.pyx":1215
+ * 
+ * 
+ * def installConformsRegistry(conformsRegistry):             # <<<<<<<<<<<<<<
+ *     """Use C versions of 'conformsRegistry' methods
+ * 
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_9protocols_9_speedups_39installConformsRegistry(PyObject *__pyx_self, PyObject *__pyx_v_conformsRegistry); /*proto*/
+static char __pyx_doc_9protocols_9_speedups_38installConformsRegistry[] = "Use C versions of 'conformsRegistry' methods\n\n    'conformsRegistry' is also remembered, to check for incompatible\n    '__conform__' methods in base classes.";
+static PyMethodDef __pyx_mdef_9protocols_9_speedups_39installConformsRegistry = {"installConformsRegistry", (PyCFunction)__pyx_pw_9protocols_9_speedups_39installConformsRegistry, METH_O, __pyx_doc_9protocols_9_speedups_38installConformsRegistry};
+static PyObject *__pyx_pw_9protocols_9_speedups_39installConformsRegistry(PyObject *__pyx_self, PyObject *__pyx_v_conformsRegistry) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("installConformsRegistry (wrapper)", 0);
+  __pyx_r = __pyx_pf_9protocols_9_speedups_38installConformsRegistry(__pyx_self, ((PyObject *)__pyx_v_conformsRegistry));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_9protocols_9_speedups_38installConformsRegistry(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_conformsRegistry) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("installConformsRegistry", 0);
+
+  /* "protocols/_speedups.pyx":1223
+ *     global _conformsRegistry
+ * 
+ *     _conformsRegistry = conformsRegistry             # <<<<<<<<<<<<<<
+ * 
+ *     conformsRegistry.__call__ = PyMethod_NewUnbound(
+ */
+  __Pyx_INCREF(__pyx_v_conformsRegistry);
+  __Pyx_XGOTREF(__pyx_v_9protocols_9_speedups__conformsRegistry);
+  __Pyx_DECREF_SET(__pyx_v_9protocols_9_speedups__conformsRegistry, __pyx_v_conformsRegistry);
+  __Pyx_GIVEREF(__pyx_v_conformsRegistry);
+
+  /* "protocols/_speedups.pyx":1226
+ * 
+ *     conformsRegistry.__call__ = PyMethod_NewUnbound(
+ *         conformsRegistry__call__, NULL, conformsRegistry             # <<<<<<<<<<<<<<
+ *     )
+ *     conformsRegistry.findImplementation = PyMethod_NewUnbound(
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_conformsRegistry__call); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 1226, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+
+  /* "protocols/_speedups.pyx":1225
+ *     _conformsRegistry = conformsRegistry
+ * 
+ *     conformsRegistry.__call__ = PyMethod_NewUnbound(             # <<<<<<<<<<<<<<
+ *         conformsRegistry__call__, NULL, conformsRegistry
+ *     )
+ */
+  __pyx_t_2 = PyMethod_New(__pyx_t_1, NULL, __pyx_v_conformsRegistry); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 1225, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  if (__Pyx_PyObject_SetAttrStr(__pyx_v_conformsRegistry, __pyx_n_s_call, __pyx_t_2) < 0) __PYX_ERR(0, 1225, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "protocols/_speedups.pyx":1229
+ *     )
+ *     conformsRegistry.findImplementation = PyMethod_NewUnbound(
+ *         conformsRegistry_findImplementation, NULL, conformsRegistry             # <<<<<<<<<<<<<<
+ *     )
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_conformsRegistry_findImplementat); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 1229, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+
+  /* "protocols/_speedups.pyx":1228
+ *         conformsRegistry__call__, NULL, conformsRegistry
+ *     )
+ *     conformsRegistry.findImplementation = PyMethod_NewUnbound(             # <<<<<<<<<<<<<<
+ *         conformsRegistry_findImplementation, NULL, conformsRegistry
+ *     )
+ */
+  __pyx_t_1 = PyMethod_New(__pyx_t_2, NULL, __pyx_v_conformsRegistry); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 1228, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  if (__Pyx_PyObject_SetAttrStr(__pyx_v_conformsRegistry, __pyx_n_s_findImplementation, __pyx_t_1) < 0) __PYX_ERR(0, 1228, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "protocols/_speedups.pyx":1215
+ * 
+ * 
+ * def installConformsRegistry(conformsRegistry):             # <<<<<<<<<<<<<<
+ *     """Use C versions of 'conformsRegistry' methods
+ * 
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_AddTraceback("protocols._speedups.installConformsRegistry", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "(tree fragment)":1
+ * def __pyx_unpickle_metamethod(__pyx_type, long __pyx_checksum, __pyx_state):             # <<<<<<<<<<<<<<
+ *     cdef object __pyx_PickleError
+ *     cdef object __pyx_result
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_9protocols_9_speedups_41__pyx_unpickle_metamethod(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static PyMethodDef __pyx_mdef_9protocols_9_speedups_41__pyx_unpickle_metamethod = {"__pyx_unpickle_metamethod", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_9protocols_9_speedups_41__pyx_unpickle_metamethod, METH_VARARGS|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_9protocols_9_speedups_41__pyx_unpickle_metamethod(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v___pyx_type = 0;
+  long __pyx_v___pyx_checksum;
+  PyObject *__pyx_v___pyx_state = 0;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__pyx_unpickle_metamethod (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_pyx_type,&__pyx_n_s_pyx_checksum,&__pyx_n_s_pyx_state,0};
+    PyObject* values[3] = {0,0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_pyx_type)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_pyx_checksum)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("__pyx_unpickle_metamethod", 1, 3, 3, 1); __PYX_ERR(1, 1, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  2:
+        if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_pyx_state)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("__pyx_unpickle_metamethod", 1, 3, 3, 2); __PYX_ERR(1, 1, __pyx_L3_error)
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__pyx_unpickle_metamethod") < 0)) __PYX_ERR(1, 1, __pyx_L3_error)
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 3) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+      values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+    }
+    __pyx_v___pyx_type = values[0];
+    __pyx_v___pyx_checksum = __Pyx_PyInt_As_long(values[1]); if (unlikely((__pyx_v___pyx_checksum == (long)-1) && PyErr_Occurred())) __PYX_ERR(1, 1, __pyx_L3_error)
+    __pyx_v___pyx_state = values[2];
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("__pyx_unpickle_metamethod", 1, 3, 3, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(1, 1, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("protocols._speedups.__pyx_unpickle_metamethod", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_9protocols_9_speedups_40__pyx_unpickle_metamethod(__pyx_self, __pyx_v___pyx_type, __pyx_v___pyx_checksum, __pyx_v___pyx_state);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_9protocols_9_speedups_40__pyx_unpickle_metamethod(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v___pyx_type, long __pyx_v___pyx_checksum, PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_v___pyx_PickleError = 0;
+  PyObject *__pyx_v___pyx_result = 0;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__pyx_unpickle_metamethod", 0);
+
+  /* "(tree fragment)":4
+ *     cdef object __pyx_PickleError
+ *     cdef object __pyx_result
+ *     if __pyx_checksum not in (0x7df4935, 0xf638272, 0x99fdb36):             # <<<<<<<<<<<<<<
+ *         from pickle import PickleError as __pyx_PickleError
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x7df4935, 0xf638272, 0x99fdb36) = (func))" % __pyx_checksum)
+ */
+  __pyx_t_1 = __Pyx_PyInt_From_long(__pyx_v___pyx_checksum); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 4, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = (__Pyx_PySequence_ContainsTF(__pyx_t_1, __pyx_tuple__7, Py_NE)); if (unlikely(__pyx_t_2 < 0)) __PYX_ERR(1, 4, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_3 = (__pyx_t_2 != 0);
+  if (__pyx_t_3) {
+
+    /* "(tree fragment)":5
+ *     cdef object __pyx_result
+ *     if __pyx_checksum not in (0x7df4935, 0xf638272, 0x99fdb36):
+ *         from pickle import PickleError as __pyx_PickleError             # <<<<<<<<<<<<<<
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x7df4935, 0xf638272, 0x99fdb36) = (func))" % __pyx_checksum)
+ *     __pyx_result = metamethod.__new__(__pyx_type)
+ */
+    __pyx_t_1 = PyList_New(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 5, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_INCREF(__pyx_n_s_PickleError);
+    __Pyx_GIVEREF(__pyx_n_s_PickleError);
+    PyList_SET_ITEM(__pyx_t_1, 0, __pyx_n_s_PickleError);
+    __pyx_t_4 = __Pyx_Import(__pyx_n_s_pickle, __pyx_t_1, -1); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 5, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_t_1 = __Pyx_ImportFrom(__pyx_t_4, __pyx_n_s_PickleError); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 5, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_INCREF(__pyx_t_1);
+    __pyx_v___pyx_PickleError = __pyx_t_1;
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+    /* "(tree fragment)":6
+ *     if __pyx_checksum not in (0x7df4935, 0xf638272, 0x99fdb36):
+ *         from pickle import PickleError as __pyx_PickleError
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x7df4935, 0xf638272, 0x99fdb36) = (func))" % __pyx_checksum)             # <<<<<<<<<<<<<<
+ *     __pyx_result = metamethod.__new__(__pyx_type)
+ *     if __pyx_state is not None:
+ */
+    __pyx_t_1 = __Pyx_PyInt_From_long(__pyx_v___pyx_checksum); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 6, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_5 = __Pyx_PyString_Format(__pyx_kp_s_Incompatible_checksums_0x_x_vs_0, __pyx_t_1); if (unlikely(!__pyx_t_5)) __PYX_ERR(1, 6, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_INCREF(__pyx_v___pyx_PickleError);
+    __pyx_t_1 = __pyx_v___pyx_PickleError; __pyx_t_6 = NULL;
+    if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_1))) {
+      __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_1);
+      if (likely(__pyx_t_6)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_1);
+        __Pyx_INCREF(__pyx_t_6);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_1, function);
+      }
+    }
+    __pyx_t_4 = (__pyx_t_6) ? __Pyx_PyObject_Call2Args(__pyx_t_1, __pyx_t_6, __pyx_t_5) : __Pyx_PyObject_CallOneArg(__pyx_t_1, __pyx_t_5);
+    __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 6, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_Raise(__pyx_t_4, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __PYX_ERR(1, 6, __pyx_L1_error)
+
+    /* "(tree fragment)":4
+ *     cdef object __pyx_PickleError
+ *     cdef object __pyx_result
+ *     if __pyx_checksum not in (0x7df4935, 0xf638272, 0x99fdb36):             # <<<<<<<<<<<<<<
+ *         from pickle import PickleError as __pyx_PickleError
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x7df4935, 0xf638272, 0x99fdb36) = (func))" % __pyx_checksum)
+ */
+  }
+
+  /* "(tree fragment)":7
+ *         from pickle import PickleError as __pyx_PickleError
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x7df4935, 0xf638272, 0x99fdb36) = (func))" % __pyx_checksum)
+ *     __pyx_result = metamethod.__new__(__pyx_type)             # <<<<<<<<<<<<<<
+ *     if __pyx_state is not None:
+ *         __pyx_unpickle_metamethod__set_state(<metamethod> __pyx_result, __pyx_state)
+ */
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_ptype_9protocols_9_speedups_metamethod), __pyx_n_s_new); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 7, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_5 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_1))) {
+    __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_1);
+    if (likely(__pyx_t_5)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_1);
+      __Pyx_INCREF(__pyx_t_5);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_1, function);
+    }
+  }
+  __pyx_t_4 = (__pyx_t_5) ? __Pyx_PyObject_Call2Args(__pyx_t_1, __pyx_t_5, __pyx_v___pyx_type) : __Pyx_PyObject_CallOneArg(__pyx_t_1, __pyx_v___pyx_type);
+  __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+  if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 7, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_v___pyx_result = __pyx_t_4;
+  __pyx_t_4 = 0;
+
+  /* "(tree fragment)":8
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x7df4935, 0xf638272, 0x99fdb36) = (func))" % __pyx_checksum)
+ *     __pyx_result = metamethod.__new__(__pyx_type)
+ *     if __pyx_state is not None:             # <<<<<<<<<<<<<<
+ *         __pyx_unpickle_metamethod__set_state(<metamethod> __pyx_result, __pyx_state)
+ *     return __pyx_result
+ */
+  __pyx_t_3 = (__pyx_v___pyx_state != Py_None);
+  __pyx_t_2 = (__pyx_t_3 != 0);
+  if (__pyx_t_2) {
+
+    /* "(tree fragment)":9
+ *     __pyx_result = metamethod.__new__(__pyx_type)
+ *     if __pyx_state is not None:
+ *         __pyx_unpickle_metamethod__set_state(<metamethod> __pyx_result, __pyx_state)             # <<<<<<<<<<<<<<
+ *     return __pyx_result
+ * cdef __pyx_unpickle_metamethod__set_state(metamethod __pyx_result, tuple __pyx_state):
+ */
+    if (!(likely(PyTuple_CheckExact(__pyx_v___pyx_state))||((__pyx_v___pyx_state) == Py_None)||((void)PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "tuple", Py_TYPE(__pyx_v___pyx_state)->tp_name), 0))) __PYX_ERR(1, 9, __pyx_L1_error)
+    __pyx_t_4 = __pyx_f_9protocols_9_speedups___pyx_unpickle_metamethod__set_state(((struct __pyx_obj_9protocols_9_speedups_metamethod *)__pyx_v___pyx_result), ((PyObject*)__pyx_v___pyx_state)); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 9, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+    /* "(tree fragment)":8
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x7df4935, 0xf638272, 0x99fdb36) = (func))" % __pyx_checksum)
+ *     __pyx_result = metamethod.__new__(__pyx_type)
+ *     if __pyx_state is not None:             # <<<<<<<<<<<<<<
+ *         __pyx_unpickle_metamethod__set_state(<metamethod> __pyx_result, __pyx_state)
+ *     return __pyx_result
+ */
+  }
+
+  /* "(tree fragment)":10
+ *     if __pyx_state is not None:
+ *         __pyx_unpickle_metamethod__set_state(<metamethod> __pyx_result, __pyx_state)
+ *     return __pyx_result             # <<<<<<<<<<<<<<
+ * cdef __pyx_unpickle_metamethod__set_state(metamethod __pyx_result, tuple __pyx_state):
+ *     __pyx_result.func = __pyx_state[0]
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v___pyx_result);
+  __pyx_r = __pyx_v___pyx_result;
+  goto __pyx_L0;
+
+  /* "(tree fragment)":1
+ * def __pyx_unpickle_metamethod(__pyx_type, long __pyx_checksum, __pyx_state):             # <<<<<<<<<<<<<<
+ *     cdef object __pyx_PickleError
+ *     cdef object __pyx_result
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_AddTraceback("protocols._speedups.__pyx_unpickle_metamethod", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v___pyx_PickleError);
+  __Pyx_XDECREF(__pyx_v___pyx_result);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "(tree fragment)":11
+ *         __pyx_unpickle_metamethod__set_state(<metamethod> __pyx_result, __pyx_state)
+ *     return __pyx_result
+ * cdef __pyx_unpickle_metamethod__set_state(metamethod __pyx_result, tuple __pyx_state):             # <<<<<<<<<<<<<<
+ *     __pyx_result.func = __pyx_state[0]
+ *     if len(__pyx_state) > 1 and hasattr(__pyx_result, '__dict__'):
+ */
+
+static PyObject *__pyx_f_9protocols_9_speedups___pyx_unpickle_metamethod__set_state(struct __pyx_obj_9protocols_9_speedups_metamethod *__pyx_v___pyx_result, PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  int __pyx_t_4;
+  int __pyx_t_5;
+  PyObject *__pyx_t_6 = NULL;
+  PyObject *__pyx_t_7 = NULL;
+  PyObject *__pyx_t_8 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__pyx_unpickle_metamethod__set_state", 0);
+
+  /* "(tree fragment)":12
+ *     return __pyx_result
+ * cdef __pyx_unpickle_metamethod__set_state(metamethod __pyx_result, tuple __pyx_state):
+ *     __pyx_result.func = __pyx_state[0]             # <<<<<<<<<<<<<<
+ *     if len(__pyx_state) > 1 and hasattr(__pyx_result, '__dict__'):
+ *         __pyx_result.__dict__.update(__pyx_state[1])
+ */
+  if (unlikely(__pyx_v___pyx_state == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+    __PYX_ERR(1, 12, __pyx_L1_error)
+  }
+  __pyx_t_1 = __Pyx_GetItemInt_Tuple(__pyx_v___pyx_state, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 12, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_GIVEREF(__pyx_t_1);
+  __Pyx_GOTREF(__pyx_v___pyx_result->func);
+  __Pyx_DECREF(__pyx_v___pyx_result->func);
+  __pyx_v___pyx_result->func = __pyx_t_1;
+  __pyx_t_1 = 0;
+
+  /* "(tree fragment)":13
+ * cdef __pyx_unpickle_metamethod__set_state(metamethod __pyx_result, tuple __pyx_state):
+ *     __pyx_result.func = __pyx_state[0]
+ *     if len(__pyx_state) > 1 and hasattr(__pyx_result, '__dict__'):             # <<<<<<<<<<<<<<
+ *         __pyx_result.__dict__.update(__pyx_state[1])
+ */
+  __pyx_t_3 = PyObject_Length(__pyx_v___pyx_state); if (unlikely(__pyx_t_3 == ((int)-1))) __PYX_ERR(1, 13, __pyx_L1_error)
+  __pyx_t_4 = ((__pyx_t_3 > 1) != 0);
+  if (__pyx_t_4) {
+  } else {
+    __pyx_t_2 = __pyx_t_4;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_4 = __Pyx_HasAttr(((PyObject *)__pyx_v___pyx_result), __pyx_n_s_dict); if (unlikely(__pyx_t_4 == ((int)-1))) __PYX_ERR(1, 13, __pyx_L1_error)
+  __pyx_t_5 = (__pyx_t_4 != 0);
+  __pyx_t_2 = __pyx_t_5;
+  __pyx_L4_bool_binop_done:;
+  if (__pyx_t_2) {
+
+    /* "(tree fragment)":14
+ *     __pyx_result.func = __pyx_state[0]
+ *     if len(__pyx_state) > 1 and hasattr(__pyx_result, '__dict__'):
+ *         __pyx_result.__dict__.update(__pyx_state[1])             # <<<<<<<<<<<<<<
+ */
+    __pyx_t_6 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v___pyx_result), __pyx_n_s_dict); if (unlikely(!__pyx_t_6)) __PYX_ERR(1, 14, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __pyx_t_7 = __Pyx_PyObject_GetAttrStr(__pyx_t_6, __pyx_n_s_update); if (unlikely(!__pyx_t_7)) __PYX_ERR(1, 14, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_7);
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    if (unlikely(__pyx_v___pyx_state == Py_None)) {
+      PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+      __PYX_ERR(1, 14, __pyx_L1_error)
+    }
+    __pyx_t_6 = __Pyx_GetItemInt_Tuple(__pyx_v___pyx_state, 1, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_6)) __PYX_ERR(1, 14, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __pyx_t_8 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_7))) {
+      __pyx_t_8 = PyMethod_GET_SELF(__pyx_t_7);
+      if (likely(__pyx_t_8)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_7);
+        __Pyx_INCREF(__pyx_t_8);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_7, function);
+      }
+    }
+    __pyx_t_1 = (__pyx_t_8) ? __Pyx_PyObject_Call2Args(__pyx_t_7, __pyx_t_8, __pyx_t_6) : __Pyx_PyObject_CallOneArg(__pyx_t_7, __pyx_t_6);
+    __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 14, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+    /* "(tree fragment)":13
+ * cdef __pyx_unpickle_metamethod__set_state(metamethod __pyx_result, tuple __pyx_state):
+ *     __pyx_result.func = __pyx_state[0]
+ *     if len(__pyx_state) > 1 and hasattr(__pyx_result, '__dict__'):             # <<<<<<<<<<<<<<
+ *         __pyx_result.__dict__.update(__pyx_state[1])
+ */
+  }
+
+  /* "(tree fragment)":11
+ *         __pyx_unpickle_metamethod__set_state(<metamethod> __pyx_result, __pyx_state)
+ *     return __pyx_result
+ * cdef __pyx_unpickle_metamethod__set_state(metamethod __pyx_result, tuple __pyx_state):             # <<<<<<<<<<<<<<
+ *     __pyx_result.func = __pyx_state[0]
+ *     if len(__pyx_state) > 1 and hasattr(__pyx_result, '__dict__'):
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_XDECREF(__pyx_t_8);
+  __Pyx_AddTraceback("protocols._speedups.__pyx_unpickle_metamethod__set_state", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_tp_new_9protocols_9_speedups_metamethod(PyTypeObject *t, CYTHON_UNUSED PyObject *a, CYTHON_UNUSED PyObject *k) {
+  struct __pyx_obj_9protocols_9_speedups_metamethod *p;
+  PyObject *o;
+  if (likely((t->tp_flags & Py_TPFLAGS_IS_ABSTRACT) == 0)) {
+    o = (*t->tp_alloc)(t, 0);
+  } else {
+    o = (PyObject *) PyBaseObject_Type.tp_new(t, __pyx_empty_tuple, 0);
+  }
+  if (unlikely(!o)) return 0;
+  p = ((struct __pyx_obj_9protocols_9_speedups_metamethod *)o);
+  p->func = Py_None; Py_INCREF(Py_None);
+  return o;
+}
+
+static void __pyx_tp_dealloc_9protocols_9_speedups_metamethod(PyObject *o) {
+  struct __pyx_obj_9protocols_9_speedups_metamethod *p = (struct __pyx_obj_9protocols_9_speedups_metamethod *)o;
+  #if CYTHON_USE_TP_FINALIZE
+  if (unlikely(PyType_HasFeature(Py_TYPE(o), Py_TPFLAGS_HAVE_FINALIZE) && Py_TYPE(o)->tp_finalize) && !__Pyx_PyObject_GC_IsFinalized(o)) {
+    if (PyObject_CallFinalizerFromDealloc(o)) return;
+  }
+  #endif
+  PyObject_GC_UnTrack(o);
+  Py_CLEAR(p->func);
+  (*Py_TYPE(o)->tp_free)(o);
+}
+
+static int __pyx_tp_traverse_9protocols_9_speedups_metamethod(PyObject *o, visitproc v, void *a) {
+  int e;
+  struct __pyx_obj_9protocols_9_speedups_metamethod *p = (struct __pyx_obj_9protocols_9_speedups_metamethod *)o;
+  if (p->func) {
+    e = (*v)(p->func, a); if (e) return e;
+  }
+  return 0;
+}
+
+static int __pyx_tp_clear_9protocols_9_speedups_metamethod(PyObject *o) {
+  PyObject* tmp;
+  struct __pyx_obj_9protocols_9_speedups_metamethod *p = (struct __pyx_obj_9protocols_9_speedups_metamethod *)o;
+  tmp = ((PyObject*)p->func);
+  p->func = Py_None; Py_INCREF(Py_None);
+  Py_XDECREF(tmp);
+  return 0;
+}
+
+static PyObject *__pyx_tp_descr_get_9protocols_9_speedups_metamethod(PyObject *o, PyObject *i, PyObject *c) {
+  PyObject *r = 0;
+  if (!i) i = Py_None;
+  if (!c) c = Py_None;
+  r = __pyx_pw_9protocols_9_speedups_10metamethod_3__get__(o, i, c);
+  return r;
+}
+
+static int __pyx_tp_descr_set_9protocols_9_speedups_metamethod(PyObject *o, PyObject *i, PyObject *v) {
+  if (v) {
+    return __pyx_pw_9protocols_9_speedups_10metamethod_5__set__(o, i, v);
+  }
+  else {
+    return __pyx_pw_9protocols_9_speedups_10metamethod_7__delete__(o, i);
+  }
+}
+
+static PyMethodDef __pyx_methods_9protocols_9_speedups_metamethod[] = {
+  {"__reduce_cython__", (PyCFunction)__pyx_pw_9protocols_9_speedups_10metamethod_9__reduce_cython__, METH_NOARGS, 0},
+  {"__setstate_cython__", (PyCFunction)__pyx_pw_9protocols_9_speedups_10metamethod_11__setstate_cython__, METH_O, 0},
+  {0, 0, 0, 0}
+};
+
+static PyTypeObject __pyx_type_9protocols_9_speedups_metamethod = {
+  PyVarObject_HEAD_INIT(0, 0)
+  "protocols._speedups.metamethod", /*tp_name*/
+  sizeof(struct __pyx_obj_9protocols_9_speedups_metamethod), /*tp_basicsize*/
+  0, /*tp_itemsize*/
+  __pyx_tp_dealloc_9protocols_9_speedups_metamethod, /*tp_dealloc*/
+  #if PY_VERSION_HEX < 0x030800b4
   0, /*tp_print*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b4
+  0, /*tp_vectorcall_offset*/
+  #endif
   0, /*tp_getattr*/
   0, /*tp_setattr*/
+  #if PY_MAJOR_VERSION < 3
   0, /*tp_compare*/
+  #endif
+  #if PY_MAJOR_VERSION >= 3
+  0, /*tp_as_async*/
+  #endif
   0, /*tp_repr*/
-  &__pyx_tp_as_number_metamethod, /*tp_as_number*/
-  &__pyx_tp_as_sequence_metamethod, /*tp_as_sequence*/
-  &__pyx_tp_as_mapping_metamethod, /*tp_as_mapping*/
+  0, /*tp_as_number*/
+  0, /*tp_as_sequence*/
+  0, /*tp_as_mapping*/
   0, /*tp_hash*/
   0, /*tp_call*/
   0, /*tp_str*/
   0, /*tp_getattro*/
   0, /*tp_setattro*/
-  &__pyx_tp_as_buffer_metamethod, /*tp_as_buffer*/
-  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_HAVE_GC, /*tp_flags*/
+  0, /*tp_as_buffer*/
+  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_HAVE_GC, /*tp_flags*/
   "Wrapper for metaclass method that might be confused w/instance method", /*tp_doc*/
-  __pyx_tp_traverse_9_speedups_metamethod, /*tp_traverse*/
-  __pyx_tp_clear_9_speedups_metamethod, /*tp_clear*/
+  __pyx_tp_traverse_9protocols_9_speedups_metamethod, /*tp_traverse*/
+  __pyx_tp_clear_9protocols_9_speedups_metamethod, /*tp_clear*/
   0, /*tp_richcompare*/
   0, /*tp_weaklistoffset*/
   0, /*tp_iter*/
   0, /*tp_iternext*/
-  __pyx_methods_9_speedups_metamethod, /*tp_methods*/
+  __pyx_methods_9protocols_9_speedups_metamethod, /*tp_methods*/
   0, /*tp_members*/
   0, /*tp_getset*/
   0, /*tp_base*/
   0, /*tp_dict*/
-  __pyx_tp_descr_get_9_speedups_metamethod, /*tp_descr_get*/
-  __pyx_tp_descr_set_9_speedups_metamethod, /*tp_descr_set*/
+  __pyx_tp_descr_get_9protocols_9_speedups_metamethod, /*tp_descr_get*/
+  __pyx_tp_descr_set_9protocols_9_speedups_metamethod, /*tp_descr_set*/
+  0, /*tp_dictoffset*/
+  __pyx_pw_9protocols_9_speedups_10metamethod_1__init__, /*tp_init*/
+  0, /*tp_alloc*/
+  __pyx_tp_new_9protocols_9_speedups_metamethod, /*tp_new*/
+  0, /*tp_free*/
+  0, /*tp_is_gc*/
+  0, /*tp_bases*/
+  0, /*tp_mro*/
+  0, /*tp_cache*/
+  0, /*tp_subclasses*/
+  0, /*tp_weaklist*/
+  0, /*tp_del*/
+  0, /*tp_version_tag*/
+  #if PY_VERSION_HEX >= 0x030400a1
+  0, /*tp_finalize*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b1 && (!CYTHON_COMPILING_IN_PYPY || PYPY_VERSION_NUM >= 0x07030800)
+  0, /*tp_vectorcall*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b4 && PY_VERSION_HEX < 0x03090000
+  0, /*tp_print*/
+  #endif
+  #if CYTHON_COMPILING_IN_PYPY && PY_VERSION_HEX >= 0x03090000 && PY_VERSION_HEX < 0x030a0000
+  0, /*tp_pypy_flags*/
+  #endif
+};
+
+static PyObject *__pyx_tp_new_9protocols_9_speedups_AdapterChain(PyTypeObject *t, CYTHON_UNUSED PyObject *a, CYTHON_UNUSED PyObject *k) {
+  struct __pyx_obj_9protocols_9_speedups_AdapterChain *p;
+  PyObject *o;
+  if (likely((t->tp_flags & Py_TPFLAGS_IS_ABSTRACT) == 0)) {
+    o = (*t->tp_alloc)(t, 0);
+  } else {
+    o = (PyObject *) PyBaseObject_Type.tp_new(t, __pyx_empty_tuple, 0);
+  }
+  if (unlikely(!o)) return 0;
+  p = ((struct __pyx_obj_9protocols_9_speedups_AdapterChain *)o);
+  p->adapters = Py_None; Py_INCREF(Py_None);
+  return o;
+}
+
+static void __pyx_tp_dealloc_9protocols_9_speedups_AdapterChain(PyObject *o) {
+  struct __pyx_obj_9protocols_9_speedups_AdapterChain *p = (struct __pyx_obj_9protocols_9_speedups_AdapterChain *)o;
+  #if CYTHON_USE_TP_FINALIZE
+  if (unlikely(PyType_HasFeature(Py_TYPE(o), Py_TPFLAGS_HAVE_FINALIZE) && Py_TYPE(o)->tp_finalize) && !__Pyx_PyObject_GC_IsFinalized(o)) {
+    if (PyObject_CallFinalizerFromDealloc(o)) return;
+  }
+  #endif
+  PyObject_GC_UnTrack(o);
+  Py_CLEAR(p->adapters);
+  (*Py_TYPE(o)->tp_free)(o);
+}
+
+static int __pyx_tp_traverse_9protocols_9_speedups_AdapterChain(PyObject *o, visitproc v, void *a) {
+  int e;
+  struct __pyx_obj_9protocols_9_speedups_AdapterChain *p = (struct __pyx_obj_9protocols_9_speedups_AdapterChain *)o;
+  if (p->adapters) {
+    e = (*v)(p->adapters, a); if (e) return e;
+  }
+  return 0;
+}
+
+static int __pyx_tp_clear_9protocols_9_speedups_AdapterChain(PyObject *o) {
+  PyObject* tmp;
+  struct __pyx_obj_9protocols_9_speedups_AdapterChain *p = (struct __pyx_obj_9protocols_9_speedups_AdapterChain *)o;
+  tmp = ((PyObject*)p->adapters);
+  p->adapters = Py_None; Py_INCREF(Py_None);
+  Py_XDECREF(tmp);
+  return 0;
+}
+
+static PyObject *__pyx_getprop_9protocols_9_speedups_12AdapterChain___adapterCount__(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_9protocols_9_speedups_12AdapterChain_16__adapterCount___1__get__(o);
+}
+
+static PyObject *__pyx_getprop_9protocols_9_speedups_12AdapterChain_adapters(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_9protocols_9_speedups_12AdapterChain_8adapters_1__get__(o);
+}
+
+static PyMethodDef __pyx_methods_9protocols_9_speedups_AdapterChain[] = {
+  {"__reduce__", (PyCFunction)__pyx_pw_9protocols_9_speedups_12AdapterChain_5__reduce__, METH_NOARGS, 0},
+  {0, 0, 0, 0}
+};
+
+static struct PyGetSetDef __pyx_getsets_9protocols_9_speedups_AdapterChain[] = {
+  {(char *)"__adapterCount__", __pyx_getprop_9protocols_9_speedups_12AdapterChain___adapterCount__, 0, (char *)0, 0},
+  {(char *)"adapters", __pyx_getprop_9protocols_9_speedups_12AdapterChain_adapters, 0, (char *)0, 0},
+  {0, 0, 0, 0, 0}
+};
+
+static PyTypeObject __pyx_type_9protocols_9_speedups_AdapterChain = {
+  PyVarObject_HEAD_INIT(0, 0)
+  "protocols._speedups.AdapterChain", /*tp_name*/
+  sizeof(struct __pyx_obj_9protocols_9_speedups_AdapterChain), /*tp_basicsize*/
+  0, /*tp_itemsize*/
+  __pyx_tp_dealloc_9protocols_9_speedups_AdapterChain, /*tp_dealloc*/
+  #if PY_VERSION_HEX < 0x030800b4
+  0, /*tp_print*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b4
+  0, /*tp_vectorcall_offset*/
+  #endif
+  0, /*tp_getattr*/
+  0, /*tp_setattr*/
+  #if PY_MAJOR_VERSION < 3
+  0, /*tp_compare*/
+  #endif
+  #if PY_MAJOR_VERSION >= 3
+  0, /*tp_as_async*/
+  #endif
+  __pyx_pw_9protocols_9_speedups_12AdapterChain_7__repr__, /*tp_repr*/
+  0, /*tp_as_number*/
+  0, /*tp_as_sequence*/
+  0, /*tp_as_mapping*/
+  0, /*tp_hash*/
+  __pyx_pw_9protocols_9_speedups_12AdapterChain_3__call__, /*tp_call*/
+  0, /*tp_str*/
+  0, /*tp_getattro*/
+  0, /*tp_setattro*/
+  0, /*tp_as_buffer*/
+  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_HAVE_GC, /*tp_flags*/
+  "Adapter factory that applies a sequence of adapters in turn", /*tp_doc*/
+  __pyx_tp_traverse_9protocols_9_speedups_AdapterChain, /*tp_traverse*/
+  __pyx_tp_clear_9protocols_9_speedups_AdapterChain, /*tp_clear*/
+  0, /*tp_richcompare*/
+  0, /*tp_weaklistoffset*/
+  0, /*tp_iter*/
+  0, /*tp_iternext*/
+  __pyx_methods_9protocols_9_speedups_AdapterChain, /*tp_methods*/
+  0, /*tp_members*/
+  __pyx_getsets_9protocols_9_speedups_AdapterChain, /*tp_getset*/
+  0, /*tp_base*/
+  0, /*tp_dict*/
+  0, /*tp_descr_get*/
+  0, /*tp_descr_set*/
+  0, /*tp_dictoffset*/
+  __pyx_pw_9protocols_9_speedups_12AdapterChain_1__init__, /*tp_init*/
+  0, /*tp_alloc*/
+  __pyx_tp_new_9protocols_9_speedups_AdapterChain, /*tp_new*/
+  0, /*tp_free*/
+  0, /*tp_is_gc*/
+  0, /*tp_bases*/
+  0, /*tp_mro*/
+  0, /*tp_cache*/
+  0, /*tp_subclasses*/
+  0, /*tp_weaklist*/
+  0, /*tp_del*/
+  0, /*tp_version_tag*/
+  #if PY_VERSION_HEX >= 0x030400a1
+  0, /*tp_finalize*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b1 && (!CYTHON_COMPILING_IN_PYPY || PYPY_VERSION_NUM >= 0x07030800)
+  0, /*tp_vectorcall*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b4 && PY_VERSION_HEX < 0x03090000
+  0, /*tp_print*/
+  #endif
+  #if CYTHON_COMPILING_IN_PYPY && PY_VERSION_HEX >= 0x03090000 && PY_VERSION_HEX < 0x030a0000
+  0, /*tp_pypy_flags*/
+  #endif
+};
+
+static PyObject *__pyx_tp_new_9protocols_9_speedups_AdapterRecord(PyTypeObject *t, CYTHON_UNUSED PyObject *a, CYTHON_UNUSED PyObject *k) {
+  struct __pyx_obj_9protocols_9_speedups_AdapterRecord *p;
+  PyObject *o;
+  if (likely((t->tp_flags & Py_TPFLAGS_IS_ABSTRACT) == 0)) {
+    o = (*t->tp_alloc)(t, 0);
+  } else {
+    o = (PyObject *) PyBaseObject_Type.tp_new(t, __pyx_empty_tuple, 0);
+  }
+  if (unlikely(!o)) return 0;
+  p = ((struct __pyx_obj_9protocols_9_speedups_AdapterRecord *)o);
+  p->adapter = Py_None; Py_INCREF(Py_None);
+  p->depth = Py_None; Py_INCREF(Py_None);
+  p->count = Py_None; Py_INCREF(Py_None);
+  p->unbound = Py_None; Py_INCREF(Py_None);
+  return o;
+}
+
+static void __pyx_tp_dealloc_9protocols_9_speedups_AdapterRecord(PyObject *o) {
+  struct __pyx_obj_9protocols_9_speedups_AdapterRecord *p = (struct __pyx_obj_9protocols_9_speedups_AdapterRecord *)o;
+  #if CYTHON_USE_TP_FINALIZE
+  if (unlikely(PyType_HasFeature(Py_TYPE(o), Py_TPFLAGS_HAVE_FINALIZE) && Py_TYPE(o)->tp_finalize) && !__Pyx_PyObject_GC_IsFinalized(o)) {
+    if (PyObject_CallFinalizerFromDealloc(o)) return;
+  }
+  #endif
+  PyObject_GC_UnTrack(o);
+  Py_CLEAR(p->adapter);
+  Py_CLEAR(p->depth);
+  Py_CLEAR(p->count);
+  Py_CLEAR(p->unbound);
+  (*Py_TYPE(o)->tp_free)(o);
+}
+
+static int __pyx_tp_traverse_9protocols_9_speedups_AdapterRecord(PyObject *o, visitproc v, void *a) {
+  int e;
+  struct __pyx_obj_9protocols_9_speedups_AdapterRecord *p = (struct __pyx_obj_9protocols_9_speedups_AdapterRecord *)o;
+  if (p->adapter) {
+    e = (*v)(p->adapter, a); if (e) return e;
+  }
+  if (p->depth) {
+    e = (*v)(p->depth, a); if (e) return e;
+  }
+  if (p->count) {
+    e = (*v)(p->count, a); if (e) return e;
+  }
+  if (p->unbound) {
+    e = (*v)(p->unbound, a); if (e) return e;
+  }
+  return 0;
+}
+
+static int __pyx_tp_clear_9protocols_9_speedups_AdapterRecord(PyObject *o) {
+  PyObject* tmp;
+  struct __pyx_obj_9protocols_9_speedups_AdapterRecord *p = (struct __pyx_obj_9protocols_9_speedups_AdapterRecord *)o;
+  tmp = ((PyObject*)p->adapter);
+  p->adapter = Py_None; Py_INCREF(Py_None);
+  Py_XDECREF(tmp);
+  tmp = ((PyObject*)p->depth);
+  p->depth = Py_None; Py_INCREF(Py_None);
+  Py_XDECREF(tmp);
+  tmp = ((PyObject*)p->count);
+  p->count = Py_None; Py_INCREF(Py_None);
+  Py_XDECREF(tmp);
+  tmp = ((PyObject*)p->unbound);
+  p->unbound = Py_None; Py_INCREF(Py_None);
+  Py_XDECREF(tmp);
+  return 0;
+}
+static PyObject *__pyx_sq_item_9protocols_9_speedups_AdapterRecord(PyObject *o, Py_ssize_t i) {
+  PyObject *r;
+  PyObject *x = PyInt_FromSsize_t(i); if(!x) return 0;
+  r = Py_TYPE(o)->tp_as_mapping->mp_subscript(o, x);
+  Py_DECREF(x);
+  return r;
+}
+
+static PyObject *__pyx_getprop_9protocols_9_speedups_13AdapterRecord_adapter(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_9protocols_9_speedups_13AdapterRecord_7adapter_1__get__(o);
+}
+
+static PyObject *__pyx_getprop_9protocols_9_speedups_13AdapterRecord_depth(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_9protocols_9_speedups_13AdapterRecord_5depth_1__get__(o);
+}
+
+static PyObject *__pyx_getprop_9protocols_9_speedups_13AdapterRecord_count(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_9protocols_9_speedups_13AdapterRecord_5count_1__get__(o);
+}
+
+static PyObject *__pyx_getprop_9protocols_9_speedups_13AdapterRecord_unbound(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_9protocols_9_speedups_13AdapterRecord_7unbound_1__get__(o);
+}
+
+static PyMethodDef __pyx_methods_9protocols_9_speedups_AdapterRecord[] = {
+  {"__reduce__", (PyCFunction)__pyx_pw_9protocols_9_speedups_13AdapterRecord_9__reduce__, METH_NOARGS, 0},
+  {0, 0, 0, 0}
+};
+
+static struct PyGetSetDef __pyx_getsets_9protocols_9_speedups_AdapterRecord[] = {
+  {(char *)"adapter", __pyx_getprop_9protocols_9_speedups_13AdapterRecord_adapter, 0, (char *)0, 0},
+  {(char *)"depth", __pyx_getprop_9protocols_9_speedups_13AdapterRecord_depth, 0, (char *)0, 0},
+  {(char *)"count", __pyx_getprop_9protocols_9_speedups_13AdapterRecord_count, 0, (char *)0, 0},
+  {(char *)"unbound", __pyx_getprop_9protocols_9_speedups_13AdapterRecord_unbound, 0, (char *)0, 0},
+  {0, 0, 0, 0, 0}
+};
+
+static PySequenceMethods __pyx_tp_as_sequence_AdapterRecord = {
+  __pyx_pw_9protocols_9_speedups_13AdapterRecord_5__len__, /*sq_length*/
+  0, /*sq_concat*/
+  0, /*sq_repeat*/
+  __pyx_sq_item_9protocols_9_speedups_AdapterRecord, /*sq_item*/
+  0, /*sq_slice*/
+  0, /*sq_ass_item*/
+  0, /*sq_ass_slice*/
+  0, /*sq_contains*/
+  0, /*sq_inplace_concat*/
+  0, /*sq_inplace_repeat*/
+};
+
+static PyMappingMethods __pyx_tp_as_mapping_AdapterRecord = {
+  __pyx_pw_9protocols_9_speedups_13AdapterRecord_5__len__, /*mp_length*/
+  __pyx_pw_9protocols_9_speedups_13AdapterRecord_3__getitem__, /*mp_subscript*/
+  0, /*mp_ass_subscript*/
+};
+
+static PyTypeObject __pyx_type_9protocols_9_speedups_AdapterRecord = {
+  PyVarObject_HEAD_INIT(0, 0)
+  "protocols._speedups.AdapterRecord", /*tp_name*/
+  sizeof(struct __pyx_obj_9protocols_9_speedups_AdapterRecord), /*tp_basicsize*/
+  0, /*tp_itemsize*/
+  __pyx_tp_dealloc_9protocols_9_speedups_AdapterRecord, /*tp_dealloc*/
+  #if PY_VERSION_HEX < 0x030800b4
+  0, /*tp_print*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b4
+  0, /*tp_vectorcall_offset*/
+  #endif
+  0, /*tp_getattr*/
+  0, /*tp_setattr*/
+  #if PY_MAJOR_VERSION < 3
+  0, /*tp_compare*/
+  #endif
+  #if PY_MAJOR_VERSION >= 3
+  0, /*tp_as_async*/
+  #endif
+  __pyx_pw_9protocols_9_speedups_13AdapterRecord_11__repr__, /*tp_repr*/
+  0, /*tp_as_number*/
+  &__pyx_tp_as_sequence_AdapterRecord, /*tp_as_sequence*/
+  &__pyx_tp_as_mapping_AdapterRecord, /*tp_as_mapping*/
+  0, /*tp_hash*/
+  0, /*tp_call*/
+  0, /*tp_str*/
+  0, /*tp_getattro*/
+  0, /*tp_setattro*/
+  0, /*tp_as_buffer*/
+  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_HAVE_GC, /*tp_flags*/
+  "An adapter registered at an implication depth, in an adapter registry", /*tp_doc*/
+  __pyx_tp_traverse_9protocols_9_speedups_AdapterRecord, /*tp_traverse*/
+  __pyx_tp_clear_9protocols_9_speedups_AdapterRecord, /*tp_clear*/
+  0, /*tp_richcompare*/
+  0, /*tp_weaklistoffset*/
+  __pyx_pw_9protocols_9_speedups_13AdapterRecord_7__iter__, /*tp_iter*/
+  0, /*tp_iternext*/
+  __pyx_methods_9protocols_9_speedups_AdapterRecord, /*tp_methods*/
+  0, /*tp_members*/
+  __pyx_getsets_9protocols_9_speedups_AdapterRecord, /*tp_getset*/
+  0, /*tp_base*/
+  0, /*tp_dict*/
+  0, /*tp_descr_get*/
+  0, /*tp_descr_set*/
   0, /*tp_dictoffset*/
-  __pyx_f_9_speedups_10metamethod___init__, /*tp_init*/
+  __pyx_pw_9protocols_9_speedups_13AdapterRecord_1__init__, /*tp_init*/
   0, /*tp_alloc*/
-  __pyx_tp_new_9_speedups_metamethod, /*tp_new*/
+  __pyx_tp_new_9protocols_9_speedups_AdapterRecord, /*tp_new*/
   0, /*tp_free*/
   0, /*tp_is_gc*/
   0, /*tp_bases*/
@@ -1594,430 +16466,4298 @@ PyTypeObject __pyx_type_9_speedups_metamethod = {
   0, /*tp_cache*/
   0, /*tp_subclasses*/
   0, /*tp_weaklist*/
+  0, /*tp_del*/
+  0, /*tp_version_tag*/
+  #if PY_VERSION_HEX >= 0x030400a1
+  0, /*tp_finalize*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b1 && (!CYTHON_COMPILING_IN_PYPY || PYPY_VERSION_NUM >= 0x07030800)
+  0, /*tp_vectorcall*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b4 && PY_VERSION_HEX < 0x03090000
+  0, /*tp_print*/
+  #endif
+  #if CYTHON_COMPILING_IN_PYPY && PY_VERSION_HEX >= 0x03090000 && PY_VERSION_HEX < 0x030a0000
+  0, /*tp_pypy_flags*/
+  #endif
+};
+
+static PyMethodDef __pyx_methods[] = {
+  {0, 0, 0, 0}
+};
+
+#if PY_MAJOR_VERSION >= 3
+#if CYTHON_PEP489_MULTI_PHASE_INIT
+static PyObject* __pyx_pymod_create(PyObject *spec, PyModuleDef *def); /*proto*/
+static int __pyx_pymod_exec__speedups(PyObject* module); /*proto*/
+static PyModuleDef_Slot __pyx_moduledef_slots[] = {
+  {Py_mod_create, (void*)__pyx_pymod_create},
+  {Py_mod_exec, (void*)__pyx_pymod_exec__speedups},
+  {0, NULL}
+};
+#endif
+
+static struct PyModuleDef __pyx_moduledef = {
+    PyModuleDef_HEAD_INIT,
+    "_speedups",
+    __pyx_k_C_Speedups_for_commonly_used_ope, /* m_doc */
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+    0, /* m_size */
+  #else
+    -1, /* m_size */
+  #endif
+    __pyx_methods /* m_methods */,
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+    __pyx_moduledef_slots, /* m_slots */
+  #else
+    NULL, /* m_reload */
+  #endif
+    NULL, /* m_traverse */
+    NULL, /* m_clear */
+    NULL /* m_free */
+};
+#endif
+#ifndef CYTHON_SMALL_CODE
+#if defined(__clang__)
+    #define CYTHON_SMALL_CODE
+#elif defined(__GNUC__) && (__GNUC__ > 4 || (__GNUC__ == 4 && __GNUC_MINOR__ >= 3))
+    #define CYTHON_SMALL_CODE __attribute__((cold))
+#else
+    #define CYTHON_SMALL_CODE
+#endif
+#endif
+
+static __Pyx_StringTabEntry __pyx_string_tab[] = {
+  {&__pyx_n_s_ADAPT_SEQUENCE, __pyx_k_ADAPT_SEQUENCE, sizeof(__pyx_k_ADAPT_SEQUENCE), 0, 0, 1, 1},
+  {&__pyx_n_s_AdaptationFailure, __pyx_k_AdaptationFailure, sizeof(__pyx_k_AdaptationFailure), 0, 0, 1, 1},
+  {&__pyx_n_s_AdapterChain, __pyx_k_AdapterChain, sizeof(__pyx_k_AdapterChain), 0, 0, 1, 1},
+  {&__pyx_kp_s_AdapterChain_r, __pyx_k_AdapterChain_r, sizeof(__pyx_k_AdapterChain_r), 0, 0, 1, 0},
+  {&__pyx_n_s_AdapterRecord, __pyx_k_AdapterRecord, sizeof(__pyx_k_AdapterRecord), 0, 0, 1, 1},
+  {&__pyx_kp_s_AdapterRecord_r_r, __pyx_k_AdapterRecord_r_r, sizeof(__pyx_k_AdapterRecord_r_r), 0, 0, 1, 0},
+  {&__pyx_kp_s_Ambiguous_adapter_choice, __pyx_k_Ambiguous_adapter_choice, sizeof(__pyx_k_Ambiguous_adapter_choice), 0, 0, 1, 0},
+  {&__pyx_n_s_AttributeError, __pyx_k_AttributeError, sizeof(__pyx_k_AttributeError), 0, 0, 1, 1},
+  {&__pyx_kp_s_Can_t_adapt, __pyx_k_Can_t_adapt, sizeof(__pyx_k_Can_t_adapt), 0, 0, 1, 0},
+  {&__pyx_n_s_DOES_NOT_SUPPORT, __pyx_k_DOES_NOT_SUPPORT, sizeof(__pyx_k_DOES_NOT_SUPPORT), 0, 0, 1, 1},
+  {&__pyx_n_s_ExtensionClass, __pyx_k_ExtensionClass, sizeof(__pyx_k_ExtensionClass), 0, 0, 1, 1},
+  {&__pyx_n_s_ImportError, __pyx_k_ImportError, sizeof(__pyx_k_ImportError), 0, 0, 1, 1},
+  {&__pyx_kp_s_Incompatible___conform___in_base, __pyx_k_Incompatible___conform___in_base, sizeof(__pyx_k_Incompatible___conform___in_base), 0, 0, 1, 0},
+  {&__pyx_kp_s_Incompatible_checksums_0x_x_vs_0, __pyx_k_Incompatible_checksums_0x_x_vs_0, sizeof(__pyx_k_Incompatible_checksums_0x_x_vs_0), 0, 0, 1, 0},
+  {&__pyx_n_s_Interface, __pyx_k_Interface, sizeof(__pyx_k_Interface), 0, 0, 1, 1},
+  {&__pyx_n_s_InterfaceClass, __pyx_k_InterfaceClass, sizeof(__pyx_k_InterfaceClass), 0, 0, 1, 1},
+  {&__pyx_n_s_KeyError, __pyx_k_KeyError, sizeof(__pyx_k_KeyError), 0, 0, 1, 1},
+  {&__pyx_n_s_NO_ADAPTER_NEEDED, __pyx_k_NO_ADAPTER_NEEDED, sizeof(__pyx_k_NO_ADAPTER_NEEDED), 0, 0, 1, 1},
+  {&__pyx_kp_s_Not_a_classic_class, __pyx_k_Not_a_classic_class, sizeof(__pyx_k_Not_a_classic_class), 0, 0, 1, 0},
+  {&__pyx_n_s_PickleError, __pyx_k_PickleError, sizeof(__pyx_k_PickleError), 0, 0, 1, 1},
+  {&__pyx_n_s_Protocol__adapt, __pyx_k_Protocol__adapt, sizeof(__pyx_k_Protocol__adapt), 0, 0, 1, 1},
+  {&__pyx_n_s_Protocol__adapters, __pyx_k_Protocol__adapters, sizeof(__pyx_k_Protocol__adapters), 0, 0, 1, 1},
+  {&__pyx_n_s_Protocol__applyPending, __pyx_k_Protocol__applyPending, sizeof(__pyx_k_Protocol__applyPending), 0, 0, 1, 1},
+  {&__pyx_n_s_Protocol__cache, __pyx_k_Protocol__cache, sizeof(__pyx_k_Protocol__cache), 0, 0, 1, 1},
+  {&__pyx_n_s_Protocol__cacheKey, __pyx_k_Protocol__cacheKey, sizeof(__pyx_k_Protocol__cacheKey), 0, 0, 1, 1},
+  {&__pyx_n_s_Protocol__call, __pyx_k_Protocol__call, sizeof(__pyx_k_Protocol__call), 0, 0, 1, 1},
+  {&__pyx_n_s_Protocol__changes, __pyx_k_Protocol__changes, sizeof(__pyx_k_Protocol__changes), 0, 0, 1, 1},
+  {&__pyx_n_s_Protocol__pendingSources, __pyx_k_Protocol__pendingSources, sizeof(__pyx_k_Protocol__pendingSources), 0, 0, 1, 1},
+  {&__pyx_n_s_Protocol_getAdapterForType, __pyx_k_Protocol_getAdapterForType, sizeof(__pyx_k_Protocol_getAdapterForType), 0, 0, 1, 1},
+  {&__pyx_n_s_ProviderMixin__conform, __pyx_k_ProviderMixin__conform, sizeof(__pyx_k_ProviderMixin__conform), 0, 0, 1, 1},
+  {&__pyx_kp_s_Read_only_attribute, __pyx_k_Read_only_attribute, sizeof(__pyx_k_Read_only_attribute), 0, 0, 1, 0},
+  {&__pyx_n_s_TypeError, __pyx_k_TypeError, sizeof(__pyx_k_TypeError), 0, 0, 1, 1},
+  {&__pyx_n_s_WeakKeyDictionary, __pyx_k_WeakKeyDictionary, sizeof(__pyx_k_WeakKeyDictionary), 0, 0, 1, 1},
+  {&__pyx_n_s_a1, __pyx_k_a1, sizeof(__pyx_k_a1), 0, 0, 1, 1},
+  {&__pyx_n_s_a2, __pyx_k_a2, sizeof(__pyx_k_a2), 0, 0, 1, 1},
+  {&__pyx_n_s_adapt, __pyx_k_adapt, sizeof(__pyx_k_adapt), 0, 0, 1, 1},
+  {&__pyx_n_s_adapt_each, __pyx_k_adapt_each, sizeof(__pyx_k_adapt_each), 0, 0, 1, 1},
+  {&__pyx_n_s_adapt_first, __pyx_k_adapt_first, sizeof(__pyx_k_adapt_first), 0, 0, 1, 1},
+  {&__pyx_n_s_adapt_many, __pyx_k_adapt_many, sizeof(__pyx_k_adapt_many), 0, 0, 1, 1},
+  {&__pyx_n_s_adapter, __pyx_k_adapter, sizeof(__pyx_k_adapter), 0, 0, 1, 1},
+  {&__pyx_n_s_adapterCount, __pyx_k_adapterCount, sizeof(__pyx_k_adapterCount), 0, 0, 1, 1},
+  {&__pyx_n_s_adapters, __pyx_k_adapters, sizeof(__pyx_k_adapters), 0, 0, 1, 1},
+  {&__pyx_n_s_all, __pyx_k_all, sizeof(__pyx_k_all), 0, 0, 1, 1},
+  {&__pyx_n_s_baseProtocol, __pyx_k_baseProtocol, sizeof(__pyx_k_baseProtocol), 0, 0, 1, 1},
+  {&__pyx_n_s_bases, __pyx_k_bases, sizeof(__pyx_k_bases), 0, 0, 1, 1},
+  {&__pyx_n_s_call, __pyx_k_call, sizeof(__pyx_k_call), 0, 0, 1, 1},
+  {&__pyx_n_s_checkSelf, __pyx_k_checkSelf, sizeof(__pyx_k_checkSelf), 0, 0, 1, 1},
+  {&__pyx_n_s_class, __pyx_k_class, sizeof(__pyx_k_class), 0, 0, 1, 1},
+  {&__pyx_n_s_classicMRO, __pyx_k_classicMRO, sizeof(__pyx_k_classicMRO), 0, 0, 1, 1},
+  {&__pyx_n_s_cline_in_traceback, __pyx_k_cline_in_traceback, sizeof(__pyx_k_cline_in_traceback), 0, 0, 1, 1},
+  {&__pyx_n_s_cls, __pyx_k_cls, sizeof(__pyx_k_cls), 0, 0, 1, 1},
+  {&__pyx_n_s_cmp, __pyx_k_cmp, sizeof(__pyx_k_cmp), 0, 0, 1, 1},
+  {&__pyx_n_s_conformsRegistry, __pyx_k_conformsRegistry, sizeof(__pyx_k_conformsRegistry), 0, 0, 1, 1},
+  {&__pyx_n_s_conformsRegistry__call, __pyx_k_conformsRegistry__call, sizeof(__pyx_k_conformsRegistry__call), 0, 0, 1, 1},
+  {&__pyx_n_s_conformsRegistry_findImplementat, __pyx_k_conformsRegistry_findImplementat, sizeof(__pyx_k_conformsRegistry_findImplementat), 0, 0, 1, 1},
+  {&__pyx_n_s_d1, __pyx_k_d1, sizeof(__pyx_k_d1), 0, 0, 1, 1},
+  {&__pyx_n_s_d2, __pyx_k_d2, sizeof(__pyx_k_d2), 0, 0, 1, 1},
+  {&__pyx_n_s_data, __pyx_k_data, sizeof(__pyx_k_data), 0, 0, 1, 1},
+  {&__pyx_n_s_default, __pyx_k_default, sizeof(__pyx_k_default), 0, 0, 1, 1},
+  {&__pyx_n_s_depth, __pyx_k_depth, sizeof(__pyx_k_depth), 0, 0, 1, 1},
+  {&__pyx_n_s_dict, __pyx_k_dict, sizeof(__pyx_k_dict), 0, 0, 1, 1},
+  {&__pyx_n_s_exact, __pyx_k_exact, sizeof(__pyx_k_exact), 0, 0, 1, 1},
+  {&__pyx_n_s_exc_info, __pyx_k_exc_info, sizeof(__pyx_k_exc_info), 0, 0, 1, 1},
+  {&__pyx_n_s_extClassMRO, __pyx_k_extClassMRO, sizeof(__pyx_k_extClassMRO), 0, 0, 1, 1},
+  {&__pyx_n_s_extendedClassic, __pyx_k_extendedClassic, sizeof(__pyx_k_extendedClassic), 0, 0, 1, 1},
+  {&__pyx_n_s_factory, __pyx_k_factory, sizeof(__pyx_k_factory), 0, 0, 1, 1},
+  {&__pyx_n_s_findImplementation, __pyx_k_findImplementation, sizeof(__pyx_k_findImplementation), 0, 0, 1, 1},
+  {&__pyx_n_s_func, __pyx_k_func, sizeof(__pyx_k_func), 0, 0, 1, 1},
+  {&__pyx_n_s_get, __pyx_k_get, sizeof(__pyx_k_get), 0, 0, 1, 1},
+  {&__pyx_n_s_getMRO, __pyx_k_getMRO, sizeof(__pyx_k_getMRO), 0, 0, 1, 1},
+  {&__pyx_n_s_getstate, __pyx_k_getstate, sizeof(__pyx_k_getstate), 0, 0, 1, 1},
+  {&__pyx_n_s_i, __pyx_k_i, sizeof(__pyx_k_i), 0, 0, 1, 1},
+  {&__pyx_n_s_import, __pyx_k_import, sizeof(__pyx_k_import), 0, 0, 1, 1},
+  {&__pyx_n_s_init, __pyx_k_init, sizeof(__pyx_k_init), 0, 0, 1, 1},
+  {&__pyx_n_s_installConformsRegistry, __pyx_k_installConformsRegistry, sizeof(__pyx_k_installConformsRegistry), 0, 0, 1, 1},
+  {&__pyx_n_s_installInterfaceCall, __pyx_k_installInterfaceCall, sizeof(__pyx_k_installInterfaceCall), 0, 0, 1, 1},
+  {&__pyx_n_s_key, __pyx_k_key, sizeof(__pyx_k_key), 0, 0, 1, 1},
+  {&__pyx_n_s_main, __pyx_k_main, sizeof(__pyx_k_main), 0, 0, 1, 1},
+  {&__pyx_n_s_mapping, __pyx_k_mapping, sizeof(__pyx_k_mapping), 0, 0, 1, 1},
+  {&__pyx_n_s_metamethod, __pyx_k_metamethod, sizeof(__pyx_k_metamethod), 0, 0, 1, 1},
+  {&__pyx_n_s_minimumAdapter, __pyx_k_minimumAdapter, sizeof(__pyx_k_minimumAdapter), 0, 0, 1, 1},
+  {&__pyx_n_s_mro, __pyx_k_mro, sizeof(__pyx_k_mro), 0, 0, 1, 1},
+  {&__pyx_n_s_mro_2, __pyx_k_mro_2, sizeof(__pyx_k_mro_2), 0, 0, 1, 1},
+  {&__pyx_n_s_name, __pyx_k_name, sizeof(__pyx_k_name), 0, 0, 1, 1},
+  {&__pyx_n_s_new, __pyx_k_new, sizeof(__pyx_k_new), 0, 0, 1, 1},
+  {&__pyx_n_s_new_2, __pyx_k_new_2, sizeof(__pyx_k_new_2), 0, 0, 1, 1},
+  {&__pyx_n_s_ob, __pyx_k_ob, sizeof(__pyx_k_ob), 0, 0, 1, 1},
+  {&__pyx_n_s_obj, __pyx_k_obj, sizeof(__pyx_k_obj), 0, 0, 1, 1},
+  {&__pyx_n_s_object, __pyx_k_object, sizeof(__pyx_k_object), 0, 0, 1, 1},
+  {&__pyx_n_s_objects, __pyx_k_objects, sizeof(__pyx_k_objects), 0, 0, 1, 1},
+  {&__pyx_n_s_old, __pyx_k_old, sizeof(__pyx_k_old), 0, 0, 1, 1},
+  {&__pyx_n_s_pickle, __pyx_k_pickle, sizeof(__pyx_k_pickle), 0, 0, 1, 1},
+  {&__pyx_n_s_proto, __pyx_k_proto, sizeof(__pyx_k_proto), 0, 0, 1, 1},
+  {&__pyx_n_s_protocol, __pyx_k_protocol, sizeof(__pyx_k_protocol), 0, 0, 1, 1},
+  {&__pyx_n_s_protocols, __pyx_k_protocols, sizeof(__pyx_k_protocols), 0, 0, 1, 1},
+  {&__pyx_n_s_protocols__speedups, __pyx_k_protocols__speedups, sizeof(__pyx_k_protocols__speedups), 0, 0, 1, 1},
+  {&__pyx_n_s_protocols_adapters, __pyx_k_protocols_adapters, sizeof(__pyx_k_protocols_adapters), 0, 0, 1, 1},
+  {&__pyx_n_s_pyx_PickleError, __pyx_k_pyx_PickleError, sizeof(__pyx_k_pyx_PickleError), 0, 0, 1, 1},
+  {&__pyx_n_s_pyx_checksum, __pyx_k_pyx_checksum, sizeof(__pyx_k_pyx_checksum), 0, 0, 1, 1},
+  {&__pyx_n_s_pyx_result, __pyx_k_pyx_result, sizeof(__pyx_k_pyx_result), 0, 0, 1, 1},
+  {&__pyx_n_s_pyx_state, __pyx_k_pyx_state, sizeof(__pyx_k_pyx_state), 0, 0, 1, 1},
+  {&__pyx_n_s_pyx_type, __pyx_k_pyx_type, sizeof(__pyx_k_pyx_type), 0, 0, 1, 1},
+  {&__pyx_n_s_pyx_unpickle_metamethod, __pyx_k_pyx_unpickle_metamethod, sizeof(__pyx_k_pyx_unpickle_metamethod), 0, 0, 1, 1},
+  {&__pyx_n_s_record, __pyx_k_record, sizeof(__pyx_k_record), 0, 0, 1, 1},
+  {&__pyx_n_s_reduce, __pyx_k_reduce, sizeof(__pyx_k_reduce), 0, 0, 1, 1},
+  {&__pyx_n_s_reduce_cython, __pyx_k_reduce_cython, sizeof(__pyx_k_reduce_cython), 0, 0, 1, 1},
+  {&__pyx_n_s_reduce_ex, __pyx_k_reduce_ex, sizeof(__pyx_k_reduce_ex), 0, 0, 1, 1},
+  {&__pyx_n_s_self, __pyx_k_self, sizeof(__pyx_k_self), 0, 0, 1, 1},
+  {&__pyx_n_s_setstate, __pyx_k_setstate, sizeof(__pyx_k_setstate), 0, 0, 1, 1},
+  {&__pyx_n_s_setstate_cython, __pyx_k_setstate_cython, sizeof(__pyx_k_setstate_cython), 0, 0, 1, 1},
+  {&__pyx_kp_s_speedups_pyx, __pyx_k_speedups_pyx, sizeof(__pyx_k_speedups_pyx), 0, 0, 1, 0},
+  {&__pyx_kp_s_stringsource, __pyx_k_stringsource, sizeof(__pyx_k_stringsource), 0, 0, 1, 0},
+  {&__pyx_n_s_subject, __pyx_k_subject, sizeof(__pyx_k_subject), 0, 0, 1, 1},
+  {&__pyx_n_s_sys, __pyx_k_sys, sizeof(__pyx_k_sys), 0, 0, 1, 1},
+  {&__pyx_n_s_tb_next, __pyx_k_tb_next, sizeof(__pyx_k_tb_next), 0, 0, 1, 1},
+  {&__pyx_n_s_test, __pyx_k_test, sizeof(__pyx_k_test), 0, 0, 1, 1},
+  {&__pyx_n_s_tmp, __pyx_k_tmp, sizeof(__pyx_k_tmp), 0, 0, 1, 1},
+  {&__pyx_n_s_typ, __pyx_k_typ, sizeof(__pyx_k_typ), 0, 0, 1, 1},
+  {&__pyx_n_s_unbound_adapter, __pyx_k_unbound_adapter, sizeof(__pyx_k_unbound_adapter), 0, 0, 1, 1},
+  {&__pyx_n_s_update, __pyx_k_update, sizeof(__pyx_k_update), 0, 0, 1, 1},
+  {&__pyx_n_s_updateWithSimplestAdapter, __pyx_k_updateWithSimplestAdapter, sizeof(__pyx_k_updateWithSimplestAdapter), 0, 0, 1, 1},
+  {&__pyx_n_s_weakref, __pyx_k_weakref, sizeof(__pyx_k_weakref), 0, 0, 1, 1},
+  {0, 0, 0, 0, 0, 0, 0}
 };
+static CYTHON_SMALL_CODE int __Pyx_InitCachedBuiltins(void) {
+  __pyx_builtin_ImportError = __Pyx_GetBuiltinName(__pyx_n_s_ImportError); if (!__pyx_builtin_ImportError) __PYX_ERR(0, 105, __pyx_L1_error)
+  __pyx_builtin_object = __Pyx_GetBuiltinName(__pyx_n_s_object); if (!__pyx_builtin_object) __PYX_ERR(0, 106, __pyx_L1_error)
+  __pyx_builtin_AttributeError = __Pyx_GetBuiltinName(__pyx_n_s_AttributeError); if (!__pyx_builtin_AttributeError) __PYX_ERR(0, 156, __pyx_L1_error)
+  __pyx_builtin_TypeError = __Pyx_GetBuiltinName(__pyx_n_s_TypeError); if (!__pyx_builtin_TypeError) __PYX_ERR(0, 273, __pyx_L1_error)
+  __pyx_builtin_KeyError = __Pyx_GetBuiltinName(__pyx_n_s_KeyError); if (!__pyx_builtin_KeyError) __PYX_ERR(0, 1030, __pyx_L1_error)
+  return 0;
+  __pyx_L1_error:;
+  return -1;
+}
+
+static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_InitCachedConstants", 0);
+
+  /* "protocols/_speedups.pyx":156
+ * 
+ *     def __set__(self, ob, value):
+ *         raise AttributeError("Read-only attribute")             # <<<<<<<<<<<<<<
+ * 
+ *     def __delete__(self, ob):
+ */
+  __pyx_tuple_ = PyTuple_Pack(1, __pyx_kp_s_Read_only_attribute); if (unlikely(!__pyx_tuple_)) __PYX_ERR(0, 156, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple_);
+  __Pyx_GIVEREF(__pyx_tuple_);
+
+  /* "protocols/_speedups.pyx":1023
+ *             cache[key] = classic, factory
+ *         else:
+ *             cache[key] = mro[1:], factory             # <<<<<<<<<<<<<<
+ * 
+ *         if self._Protocol__changes != changes:
+ */
+  __pyx_slice__6 = PySlice_New(__pyx_int_1, Py_None, Py_None); if (unlikely(!__pyx_slice__6)) __PYX_ERR(0, 1023, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_slice__6);
+  __Pyx_GIVEREF(__pyx_slice__6);
+
+  /* "(tree fragment)":4
+ *     cdef object __pyx_PickleError
+ *     cdef object __pyx_result
+ *     if __pyx_checksum not in (0x7df4935, 0xf638272, 0x99fdb36):             # <<<<<<<<<<<<<<
+ *         from pickle import PickleError as __pyx_PickleError
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x7df4935, 0xf638272, 0x99fdb36) = (func))" % __pyx_checksum)
+ */
+  __pyx_tuple__7 = PyTuple_Pack(3, __pyx_int_132073781, __pyx_int_258179698, __pyx_int_161471286); if (unlikely(!__pyx_tuple__7)) __PYX_ERR(1, 4, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__7);
+  __Pyx_GIVEREF(__pyx_tuple__7);
+
+  /* "protocols/_speedups.pyx":133
+ * # Fundamental Adapters
+ * 
+ * def NO_ADAPTER_NEEDED(obj, protocol=None):             # <<<<<<<<<<<<<<
+ *     """Assume 'obj' implements 'protocol' directly"""
+ *     return obj
+ */
+  __pyx_tuple__8 = PyTuple_Pack(2, __pyx_n_s_obj, __pyx_n_s_protocol); if (unlikely(!__pyx_tuple__8)) __PYX_ERR(0, 133, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__8);
+  __Pyx_GIVEREF(__pyx_tuple__8);
+  __pyx_codeobj__9 = (PyObject*)__Pyx_PyCode_New(2, 0, 2, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__8, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_speedups_pyx, __pyx_n_s_NO_ADAPTER_NEEDED, 133, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__9)) __PYX_ERR(0, 133, __pyx_L1_error)
+
+  /* "protocols/_speedups.pyx":137
+ *     return obj
+ * 
+ * def DOES_NOT_SUPPORT(obj, protocol=None):             # <<<<<<<<<<<<<<
+ *     """Prevent 'obj' from supporting 'protocol'"""
+ *     return None
+ */
+  __pyx_tuple__10 = PyTuple_Pack(2, __pyx_n_s_obj, __pyx_n_s_protocol); if (unlikely(!__pyx_tuple__10)) __PYX_ERR(0, 137, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__10);
+  __Pyx_GIVEREF(__pyx_tuple__10);
+  __pyx_codeobj__11 = (PyObject*)__Pyx_PyCode_New(2, 0, 2, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__10, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_speedups_pyx, __pyx_n_s_DOES_NOT_SUPPORT, 137, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__11)) __PYX_ERR(0, 137, __pyx_L1_error)
+
+  /* "protocols/_speedups.pyx":276
+ * 
+ * 
+ * def minimumAdapter(a1,a2,d1=0,d2=0):             # <<<<<<<<<<<<<<
+ *     """Shortest route to implementation, 'a1' @ depth 'd1', or 'a2' @ 'd2'?"""
+ * 
+ */
+  __pyx_tuple__12 = PyTuple_Pack(5, __pyx_n_s_a1, __pyx_n_s_a2, __pyx_n_s_d1, __pyx_n_s_d2, __pyx_n_s_cmp); if (unlikely(!__pyx_tuple__12)) __PYX_ERR(0, 276, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__12);
+  __Pyx_GIVEREF(__pyx_tuple__12);
+  __pyx_codeobj__13 = (PyObject*)__Pyx_PyCode_New(4, 0, 5, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__12, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_speedups_pyx, __pyx_n_s_minimumAdapter, 276, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__13)) __PYX_ERR(0, 276, __pyx_L1_error)
+
+  /* "protocols/_speedups.pyx":293
+ * 
+ * 
+ * def updateWithSimplestAdapter(mapping, key, adapter, depth):             # <<<<<<<<<<<<<<
+ *     """Replace 'mapping[key]' w/'adapter' @ 'depth', return true if changed"""
+ * 
+ */
+  __pyx_tuple__14 = PyTuple_Pack(10, __pyx_n_s_mapping, __pyx_n_s_key, __pyx_n_s_adapter, __pyx_n_s_depth, __pyx_n_s_tmp, __pyx_n_s_cmp, __pyx_n_s_exact, __pyx_n_s_record, __pyx_n_s_old, __pyx_n_s_new_2); if (unlikely(!__pyx_tuple__14)) __PYX_ERR(0, 293, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__14);
+  __Pyx_GIVEREF(__pyx_tuple__14);
+  __pyx_codeobj__15 = (PyObject*)__Pyx_PyCode_New(4, 0, 10, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__14, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_speedups_pyx, __pyx_n_s_updateWithSimplestAdapter, 293, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__15)) __PYX_ERR(0, 293, __pyx_L1_error)
+
+  /* "protocols/_speedups.pyx":523
+ * 
+ * 
+ * def adapt(obj, protocol, default=_marker):             # <<<<<<<<<<<<<<
+ *     """PEP 246-alike: Adapt 'obj' to 'protocol', return 'default'
+ * 
+ */
+  __pyx_tuple__16 = PyTuple_Pack(3, __pyx_n_s_obj, __pyx_n_s_protocol, __pyx_n_s_default); if (unlikely(!__pyx_tuple__16)) __PYX_ERR(0, 523, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__16);
+  __Pyx_GIVEREF(__pyx_tuple__16);
+  __pyx_codeobj__17 = (PyObject*)__Pyx_PyCode_New(3, 0, 3, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__16, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_speedups_pyx, __pyx_n_s_adapt, 523, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__17)) __PYX_ERR(0, 523, __pyx_L1_error)
+
+  /* "protocols/_speedups.pyx":531
+ *     return _adapt(obj,protocol,default)
+ * 
+ * def Protocol__call__(self, ob, default=_marker):             # <<<<<<<<<<<<<<
+ *     """Adapt to this protocol"""
+ *     return _adapt(ob,self,default)
+ */
+  __pyx_tuple__18 = PyTuple_Pack(3, __pyx_n_s_self, __pyx_n_s_ob, __pyx_n_s_default); if (unlikely(!__pyx_tuple__18)) __PYX_ERR(0, 531, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__18);
+  __Pyx_GIVEREF(__pyx_tuple__18);
+  __pyx_codeobj__19 = (PyObject*)__Pyx_PyCode_New(3, 0, 3, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__18, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_speedups_pyx, __pyx_n_s_Protocol__call, 531, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__19)) __PYX_ERR(0, 531, __pyx_L1_error)
+
+  /* "protocols/_speedups.pyx":608
+ * 
+ * 
+ * def adapt_many(objects, protocol, default=_marker):             # <<<<<<<<<<<<<<
+ *     """Return a list of 'objects' adapted to 'protocol' (see 'adapt()')
+ * 
+ */
+  __pyx_tuple__20 = PyTuple_Pack(3, __pyx_n_s_objects, __pyx_n_s_protocol, __pyx_n_s_default); if (unlikely(!__pyx_tuple__20)) __PYX_ERR(0, 608, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__20);
+  __Pyx_GIVEREF(__pyx_tuple__20);
+  __pyx_codeobj__21 = (PyObject*)__Pyx_PyCode_New(3, 0, 3, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__20, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_speedups_pyx, __pyx_n_s_adapt_many, 608, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__21)) __PYX_ERR(0, 608, __pyx_L1_error)
+
+  /* "protocols/_speedups.pyx":617
+ * 
+ * 
+ * def ADAPT_SEQUENCE(ob, proto):             # <<<<<<<<<<<<<<
+ *     """Convert iterable 'ob' into list of objects implementing 'proto'"""
+ * 
+ */
+  __pyx_tuple__22 = PyTuple_Pack(2, __pyx_n_s_ob, __pyx_n_s_proto); if (unlikely(!__pyx_tuple__22)) __PYX_ERR(0, 617, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__22);
+  __Pyx_GIVEREF(__pyx_tuple__22);
+  __pyx_codeobj__23 = (PyObject*)__Pyx_PyCode_New(2, 0, 2, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__22, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_speedups_pyx, __pyx_n_s_ADAPT_SEQUENCE, 617, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__23)) __PYX_ERR(0, 617, __pyx_L1_error)
+
+  /* "protocols/_speedups.pyx":623
+ * 
+ * 
+ * def adapt_first(obj, protocols, default=_marker):             # <<<<<<<<<<<<<<
+ *     """Return 'obj' adapted to the first of 'protocols' it can be adapted to
+ * 
+ */
+  __pyx_tuple__24 = PyTuple_Pack(3, __pyx_n_s_obj, __pyx_n_s_protocols, __pyx_n_s_default); if (unlikely(!__pyx_tuple__24)) __PYX_ERR(0, 623, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__24);
+  __Pyx_GIVEREF(__pyx_tuple__24);
+  __pyx_codeobj__25 = (PyObject*)__Pyx_PyCode_New(3, 0, 3, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__24, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_speedups_pyx, __pyx_n_s_adapt_first, 623, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__25)) __PYX_ERR(0, 623, __pyx_L1_error)
+
+  /* "protocols/_speedups.pyx":632
+ * 
+ * 
+ * def adapt_each(obj, protocols, default=None):             # <<<<<<<<<<<<<<
+ *     """Return a list of 'obj' adapted to each of 'protocols', in order
+ * 
+ */
+  __pyx_tuple__26 = PyTuple_Pack(3, __pyx_n_s_obj, __pyx_n_s_protocols, __pyx_n_s_default); if (unlikely(!__pyx_tuple__26)) __PYX_ERR(0, 632, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__26);
+  __Pyx_GIVEREF(__pyx_tuple__26);
+  __pyx_codeobj__27 = (PyObject*)__Pyx_PyCode_New(3, 0, 3, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__26, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_speedups_pyx, __pyx_n_s_adapt_each, 632, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__27)) __PYX_ERR(0, 632, __pyx_L1_error)
+
+  /* "protocols/_speedups.pyx":667
+ * 
+ * 
+ * def installInterfaceCall(InterfaceClass, Interface):             # <<<<<<<<<<<<<<
+ *     """Put a C version of 'InterfaceClass.__call__' in its tp_call slot
+ * 
+ */
+  __pyx_tuple__28 = PyTuple_Pack(2, __pyx_n_s_InterfaceClass, __pyx_n_s_Interface); if (unlikely(!__pyx_tuple__28)) __PYX_ERR(0, 667, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__28);
+  __Pyx_GIVEREF(__pyx_tuple__28);
+  __pyx_codeobj__29 = (PyObject*)__Pyx_PyCode_New(2, 0, 2, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__28, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_speedups_pyx, __pyx_n_s_installInterfaceCall, 667, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__29)) __PYX_ERR(0, 667, __pyx_L1_error)
+
+  /* "protocols/_speedups.pyx":783
+ * 
+ * 
+ * def classicMRO(ob, extendedClassic=False):             # <<<<<<<<<<<<<<
+ * 
+ *     if PyClass_Check(ob):
+ */
+  __pyx_tuple__30 = PyTuple_Pack(2, __pyx_n_s_ob, __pyx_n_s_extendedClassic); if (unlikely(!__pyx_tuple__30)) __PYX_ERR(0, 783, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__30);
+  __Pyx_GIVEREF(__pyx_tuple__30);
+  __pyx_codeobj__31 = (PyObject*)__Pyx_PyCode_New(2, 0, 2, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__30, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_speedups_pyx, __pyx_n_s_classicMRO, 783, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__31)) __PYX_ERR(0, 783, __pyx_L1_error)
+
+  /* "protocols/_speedups.pyx":797
+ * 
+ * 
+ * def extClassMRO(ob, extendedClassic=False):             # <<<<<<<<<<<<<<
+ *     return cachedMRO(ob, extendedClassic)
+ * 
+ */
+  __pyx_tuple__32 = PyTuple_Pack(2, __pyx_n_s_ob, __pyx_n_s_extendedClassic); if (unlikely(!__pyx_tuple__32)) __PYX_ERR(0, 797, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__32);
+  __Pyx_GIVEREF(__pyx_tuple__32);
+  __pyx_codeobj__33 = (PyObject*)__Pyx_PyCode_New(2, 0, 2, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__32, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_speedups_pyx, __pyx_n_s_extClassMRO, 797, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__33)) __PYX_ERR(0, 797, __pyx_L1_error)
+
+  /* "protocols/_speedups.pyx":802
+ * 
+ * 
+ * def getMRO(ob, extendedClassic=False):             # <<<<<<<<<<<<<<
+ * 
+ *     if PyClass_Check(ob):
+ */
+  __pyx_tuple__34 = PyTuple_Pack(2, __pyx_n_s_ob, __pyx_n_s_extendedClassic); if (unlikely(!__pyx_tuple__34)) __PYX_ERR(0, 802, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__34);
+  __Pyx_GIVEREF(__pyx_tuple__34);
+  __pyx_codeobj__35 = (PyObject*)__Pyx_PyCode_New(2, 0, 2, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__34, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_speedups_pyx, __pyx_n_s_getMRO, 802, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__35)) __PYX_ERR(0, 802, __pyx_L1_error)
+
+  /* "protocols/_speedups.pyx":1036
+ * 
+ * 
+ * def Protocol_getAdapterForType(self, typ):             # <<<<<<<<<<<<<<
+ *     """Return the adapter for instances of 'typ' (incl. bases), or 'None'"""
+ *     return lookupAdapter(self, typ)
+ */
+  __pyx_tuple__36 = PyTuple_Pack(2, __pyx_n_s_self, __pyx_n_s_typ); if (unlikely(!__pyx_tuple__36)) __PYX_ERR(0, 1036, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__36);
+  __Pyx_GIVEREF(__pyx_tuple__36);
+  __pyx_codeobj__37 = (PyObject*)__Pyx_PyCode_New(2, 0, 2, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__36, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_speedups_pyx, __pyx_n_s_Protocol_getAdapterForType, 1036, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__37)) __PYX_ERR(0, 1036, __pyx_L1_error)
+
+  /* "protocols/_speedups.pyx":1041
+ * 
+ * 
+ * def Protocol__adapt__(self, obj):             # <<<<<<<<<<<<<<
+ * 
+ *     if not self._Protocol__adapters and not self._Protocol__pendingSources:
+ */
+  __pyx_tuple__38 = PyTuple_Pack(4, __pyx_n_s_self, __pyx_n_s_obj, __pyx_n_s_cls, __pyx_n_s_factory); if (unlikely(!__pyx_tuple__38)) __PYX_ERR(0, 1041, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__38);
+  __Pyx_GIVEREF(__pyx_tuple__38);
+  __pyx_codeobj__39 = (PyObject*)__Pyx_PyCode_New(2, 0, 4, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__38, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_speedups_pyx, __pyx_n_s_Protocol__adapt, 1041, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__39)) __PYX_ERR(0, 1041, __pyx_L1_error)
+
+  /* "protocols/_speedups.pyx":1143
+ * 
+ * 
+ * def ProviderMixin__conform__(self, protocol):             # <<<<<<<<<<<<<<
+ *     """Adapt 'self' using its (or its bases') '__protocols_provided__'"""
+ * 
+ */
+  __pyx_tuple__40 = PyTuple_Pack(6, __pyx_n_s_self, __pyx_n_s_protocol, __pyx_n_s_i, __pyx_n_s_mro_2, __pyx_n_s_record, __pyx_n_s_cls); if (unlikely(!__pyx_tuple__40)) __PYX_ERR(0, 1143, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__40);
+  __Pyx_GIVEREF(__pyx_tuple__40);
+  __pyx_codeobj__41 = (PyObject*)__Pyx_PyCode_New(2, 0, 6, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__40, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_speedups_pyx, __pyx_n_s_ProviderMixin__conform, 1143, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__41)) __PYX_ERR(0, 1143, __pyx_L1_error)
+
+  /* "protocols/_speedups.pyx":1183
+ * 
+ * 
+ * def conformsRegistry_findImplementation(self,subject,protocol,checkSelf=True):             # <<<<<<<<<<<<<<
+ * 
+ *     cdef int i
+ */
+  __pyx_tuple__42 = PyTuple_Pack(8, __pyx_n_s_self, __pyx_n_s_subject, __pyx_n_s_protocol, __pyx_n_s_checkSelf, __pyx_n_s_i, __pyx_n_s_mro_2, __pyx_n_s_record, __pyx_n_s_cls); if (unlikely(!__pyx_tuple__42)) __PYX_ERR(0, 1183, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__42);
+  __Pyx_GIVEREF(__pyx_tuple__42);
+  __pyx_codeobj__43 = (PyObject*)__Pyx_PyCode_New(4, 0, 8, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__42, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_speedups_pyx, __pyx_n_s_conformsRegistry_findImplementat, 1183, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__43)) __PYX_ERR(0, 1183, __pyx_L1_error)
+
+  /* "protocols/_speedups.pyx":1203
+ * 
+ * 
+ * def conformsRegistry__call__(self, protocol):             # <<<<<<<<<<<<<<
+ * 
+ *     cdef void *tmp
+ */
+  __pyx_tuple__44 = PyTuple_Pack(4, __pyx_n_s_self, __pyx_n_s_protocol, __pyx_n_s_tmp, __pyx_n_s_subject); if (unlikely(!__pyx_tuple__44)) __PYX_ERR(0, 1203, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__44);
+  __Pyx_GIVEREF(__pyx_tuple__44);
+  __pyx_codeobj__45 = (PyObject*)__Pyx_PyCode_New(2, 0, 4, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__44, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_speedups_pyx, __pyx_n_s_conformsRegistry__call, 1203, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__45)) __PYX_ERR(0, 1203, __pyx_L1_error)
+
+  /* "protocols/_speedups.pyx":1215
+ * 
+ * 
+ * def installConformsRegistry(conformsRegistry):             # <<<<<<<<<<<<<<
+ *     """Use C versions of 'conformsRegistry' methods
+ * 
+ */
+  __pyx_tuple__46 = PyTuple_Pack(1, __pyx_n_s_conformsRegistry); if (unlikely(!__pyx_tuple__46)) __PYX_ERR(0, 1215, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__46);
+  __Pyx_GIVEREF(__pyx_tuple__46);
+  __pyx_codeobj__47 = (PyObject*)__Pyx_PyCode_New(1, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__46, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_speedups_pyx, __pyx_n_s_installConformsRegistry, 1215, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__47)) __PYX_ERR(0, 1215, __pyx_L1_error)
+
+  /* "(tree fragment)":1
+ * def __pyx_unpickle_metamethod(__pyx_type, long __pyx_checksum, __pyx_state):             # <<<<<<<<<<<<<<
+ *     cdef object __pyx_PickleError
+ *     cdef object __pyx_result
+ */
+  __pyx_tuple__48 = PyTuple_Pack(5, __pyx_n_s_pyx_type, __pyx_n_s_pyx_checksum, __pyx_n_s_pyx_state, __pyx_n_s_pyx_PickleError, __pyx_n_s_pyx_result); if (unlikely(!__pyx_tuple__48)) __PYX_ERR(1, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__48);
+  __Pyx_GIVEREF(__pyx_tuple__48);
+  __pyx_codeobj__49 = (PyObject*)__Pyx_PyCode_New(3, 0, 5, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__48, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_stringsource, __pyx_n_s_pyx_unpickle_metamethod, 1, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__49)) __PYX_ERR(1, 1, __pyx_L1_error)
+  __Pyx_RefNannyFinishContext();
+  return 0;
+  __pyx_L1_error:;
+  __Pyx_RefNannyFinishContext();
+  return -1;
+}
+
+static CYTHON_SMALL_CODE int __Pyx_InitGlobals(void) {
+  if (__Pyx_InitStrings(__pyx_string_tab) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_0 = PyInt_FromLong(0); if (unlikely(!__pyx_int_0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_1 = PyInt_FromLong(1); if (unlikely(!__pyx_int_1)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_132073781 = PyInt_FromLong(132073781L); if (unlikely(!__pyx_int_132073781)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_161471286 = PyInt_FromLong(161471286L); if (unlikely(!__pyx_int_161471286)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_258179698 = PyInt_FromLong(258179698L); if (unlikely(!__pyx_int_258179698)) __PYX_ERR(0, 1, __pyx_L1_error)
+  return 0;
+  __pyx_L1_error:;
+  return -1;
+}
+
+static CYTHON_SMALL_CODE int __Pyx_modinit_global_init_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_variable_export_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_function_export_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_type_init_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_type_import_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_variable_import_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_function_import_code(void); /*proto*/
+
+static int __Pyx_modinit_global_init_code(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_modinit_global_init_code", 0);
+  /*--- Global init code ---*/
+  __pyx_v_9protocols_9_speedups__marker = Py_None; Py_INCREF(Py_None);
+  __pyx_v_9protocols_9_speedups__failed = Py_None; Py_INCREF(Py_None);
+  __pyx_v_9protocols_9_speedups___conform = Py_None; Py_INCREF(Py_None);
+  __pyx_v_9protocols_9_speedups___adapt = Py_None; Py_INCREF(Py_None);
+  __pyx_v_9protocols_9_speedups___mro = Py_None; Py_INCREF(Py_None);
+  __pyx_v_9protocols_9_speedups___init = Py_None; Py_INCREF(Py_None);
+  __pyx_v_9protocols_9_speedups___ECType = Py_None; Py_INCREF(Py_None);
+  __pyx_v_9protocols_9_speedups__interfaceInit = Py_None; Py_INCREF(Py_None);
+  __pyx_v_9protocols_9_speedups__interfaceCall = Py_None; Py_INCREF(Py_None);
+  __pyx_v_9protocols_9_speedups__classicMROs = Py_None; Py_INCREF(Py_None);
+  __pyx_v_9protocols_9_speedups__classicMROData = Py_None; Py_INCREF(Py_None);
+  __pyx_v_9protocols_9_speedups___provided = Py_None; Py_INCREF(Py_None);
+  __pyx_v_9protocols_9_speedups__conformsRegistry = Py_None; Py_INCREF(Py_None);
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+static int __Pyx_modinit_variable_export_code(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_modinit_variable_export_code", 0);
+  /*--- Variable export code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+static int __Pyx_modinit_function_export_code(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_modinit_function_export_code", 0);
+  /*--- Function export code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+static int __Pyx_modinit_type_init_code(void) {
+  __Pyx_RefNannyDeclarations
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__Pyx_modinit_type_init_code", 0);
+  /*--- Type init code ---*/
+  if (PyType_Ready(&__pyx_type_9protocols_9_speedups_metamethod) < 0) __PYX_ERR(0, 142, __pyx_L1_error)
+  #if PY_VERSION_HEX < 0x030800B1
+  __pyx_type_9protocols_9_speedups_metamethod.tp_print = 0;
+  #endif
+  if ((CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP) && likely(!__pyx_type_9protocols_9_speedups_metamethod.tp_dictoffset && __pyx_type_9protocols_9_speedups_metamethod.tp_getattro == PyObject_GenericGetAttr)) {
+    __pyx_type_9protocols_9_speedups_metamethod.tp_getattro = __Pyx_PyObject_GenericGetAttr;
+  }
+  if (PyObject_SetAttr(__pyx_m, __pyx_n_s_metamethod, (PyObject *)&__pyx_type_9protocols_9_speedups_metamethod) < 0) __PYX_ERR(0, 142, __pyx_L1_error)
+  if (__Pyx_setup_reduce((PyObject*)&__pyx_type_9protocols_9_speedups_metamethod) < 0) __PYX_ERR(0, 142, __pyx_L1_error)
+  __pyx_ptype_9protocols_9_speedups_metamethod = &__pyx_type_9protocols_9_speedups_metamethod;
+  if (PyType_Ready(&__pyx_type_9protocols_9_speedups_AdapterChain) < 0) __PYX_ERR(0, 162, __pyx_L1_error)
+  #if PY_VERSION_HEX < 0x030800B1
+  __pyx_type_9protocols_9_speedups_AdapterChain.tp_print = 0;
+  #endif
+  if ((CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP) && likely(!__pyx_type_9protocols_9_speedups_AdapterChain.tp_dictoffset && __pyx_type_9protocols_9_speedups_AdapterChain.tp_getattro == PyObject_GenericGetAttr)) {
+    __pyx_type_9protocols_9_speedups_AdapterChain.tp_getattro = __Pyx_PyObject_GenericGetAttr;
+  }
+  if (PyObject_SetAttr(__pyx_m, __pyx_n_s_AdapterChain, (PyObject *)&__pyx_type_9protocols_9_speedups_AdapterChain) < 0) __PYX_ERR(0, 162, __pyx_L1_error)
+  __pyx_ptype_9protocols_9_speedups_AdapterChain = &__pyx_type_9protocols_9_speedups_AdapterChain;
+  if (PyType_Ready(&__pyx_type_9protocols_9_speedups_AdapterRecord) < 0) __PYX_ERR(0, 193, __pyx_L1_error)
+  #if PY_VERSION_HEX < 0x030800B1
+  __pyx_type_9protocols_9_speedups_AdapterRecord.tp_print = 0;
+  #endif
+  if ((CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP) && likely(!__pyx_type_9protocols_9_speedups_AdapterRecord.tp_dictoffset && __pyx_type_9protocols_9_speedups_AdapterRecord.tp_getattro == PyObject_GenericGetAttr)) {
+    __pyx_type_9protocols_9_speedups_AdapterRecord.tp_getattro = __Pyx_PyObject_GenericGetAttr;
+  }
+  if (PyObject_SetAttr(__pyx_m, __pyx_n_s_AdapterRecord, (PyObject *)&__pyx_type_9protocols_9_speedups_AdapterRecord) < 0) __PYX_ERR(0, 193, __pyx_L1_error)
+  __pyx_ptype_9protocols_9_speedups_AdapterRecord = &__pyx_type_9protocols_9_speedups_AdapterRecord;
+  __Pyx_RefNannyFinishContext();
+  return 0;
+  __pyx_L1_error:;
+  __Pyx_RefNannyFinishContext();
+  return -1;
+}
+
+static int __Pyx_modinit_type_import_code(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_modinit_type_import_code", 0);
+  /*--- Type import code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+static int __Pyx_modinit_variable_import_code(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_modinit_variable_import_code", 0);
+  /*--- Variable import code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+static int __Pyx_modinit_function_import_code(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_modinit_function_import_code", 0);
+  /*--- Function import code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+
+#ifndef CYTHON_NO_PYINIT_EXPORT
+#define __Pyx_PyMODINIT_FUNC PyMODINIT_FUNC
+#elif PY_MAJOR_VERSION < 3
+#ifdef __cplusplus
+#define __Pyx_PyMODINIT_FUNC extern "C" void
+#else
+#define __Pyx_PyMODINIT_FUNC void
+#endif
+#else
+#ifdef __cplusplus
+#define __Pyx_PyMODINIT_FUNC extern "C" PyObject *
+#else
+#define __Pyx_PyMODINIT_FUNC PyObject *
+#endif
+#endif
+
+
+#if PY_MAJOR_VERSION < 3
+__Pyx_PyMODINIT_FUNC init_speedups(void) CYTHON_SMALL_CODE; /*proto*/
+__Pyx_PyMODINIT_FUNC init_speedups(void)
+#else
+__Pyx_PyMODINIT_FUNC PyInit__speedups(void) CYTHON_SMALL_CODE; /*proto*/
+__Pyx_PyMODINIT_FUNC PyInit__speedups(void)
+#if CYTHON_PEP489_MULTI_PHASE_INIT
+{
+  return PyModuleDef_Init(&__pyx_moduledef);
+}
+static CYTHON_SMALL_CODE int __Pyx_check_single_interpreter(void) {
+    #if PY_VERSION_HEX >= 0x030700A1
+    static PY_INT64_T main_interpreter_id = -1;
+    PY_INT64_T current_id = PyInterpreterState_GetID(PyThreadState_Get()->interp);
+    if (main_interpreter_id == -1) {
+        main_interpreter_id = current_id;
+        return (unlikely(current_id == -1)) ? -1 : 0;
+    } else if (unlikely(main_interpreter_id != current_id))
+    #else
+    static PyInterpreterState *main_interpreter = NULL;
+    PyInterpreterState *current_interpreter = PyThreadState_Get()->interp;
+    if (!main_interpreter) {
+        main_interpreter = current_interpreter;
+    } else if (unlikely(main_interpreter != current_interpreter))
+    #endif
+    {
+        PyErr_SetString(
+            PyExc_ImportError,
+            "Interpreter change detected - this module can only be loaded into one interpreter per process.");
+        return -1;
+    }
+    return 0;
+}
+static CYTHON_SMALL_CODE int __Pyx_copy_spec_to_module(PyObject *spec, PyObject *moddict, const char* from_name, const char* to_name, int allow_none) {
+    PyObject *value = PyObject_GetAttrString(spec, from_name);
+    int result = 0;
+    if (likely(value)) {
+        if (allow_none || value != Py_None) {
+            result = PyDict_SetItemString(moddict, to_name, value);
+        }
+        Py_DECREF(value);
+    } else if (PyErr_ExceptionMatches(PyExc_AttributeError)) {
+        PyErr_Clear();
+    } else {
+        result = -1;
+    }
+    return result;
+}
+static CYTHON_SMALL_CODE PyObject* __pyx_pymod_create(PyObject *spec, CYTHON_UNUSED PyModuleDef *def) {
+    PyObject *module = NULL, *moddict, *modname;
+    if (__Pyx_check_single_interpreter())
+        return NULL;
+    if (__pyx_m)
+        return __Pyx_NewRef(__pyx_m);
+    modname = PyObject_GetAttrString(spec, "name");
+    if (unlikely(!modname)) goto bad;
+    module = PyModule_NewObject(modname);
+    Py_DECREF(modname);
+    if (unlikely(!module)) goto bad;
+    moddict = PyModule_GetDict(module);
+    if (unlikely(!moddict)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "loader", "__loader__", 1) < 0)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "origin", "__file__", 1) < 0)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "parent", "__package__", 1) < 0)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "submodule_search_locations", "__path__", 0) < 0)) goto bad;
+    return module;
+bad:
+    Py_XDECREF(module);
+    return NULL;
+}
+
+
+static CYTHON_SMALL_CODE int __pyx_pymod_exec__speedups(PyObject *__pyx_pyinit_module)
+#endif
+#endif
+{
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  int __pyx_t_6;
+  PyObject *__pyx_t_7 = NULL;
+  PyObject *__pyx_t_8 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannyDeclarations
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+  if (__pyx_m) {
+    if (__pyx_m == __pyx_pyinit_module) return 0;
+    PyErr_SetString(PyExc_RuntimeError, "Module '_speedups' has already been imported. Re-initialisation is not supported.");
+    return -1;
+  }
+  #elif PY_MAJOR_VERSION >= 3
+  if (__pyx_m) return __Pyx_NewRef(__pyx_m);
+  #endif
+  #if CYTHON_REFNANNY
+__Pyx_RefNanny = __Pyx_RefNannyImportAPI("refnanny");
+if (!__Pyx_RefNanny) {
+  PyErr_Clear();
+  __Pyx_RefNanny = __Pyx_RefNannyImportAPI("Cython.Runtime.refnanny");
+  if (!__Pyx_RefNanny)
+      Py_FatalError("failed to import 'refnanny' module");
+}
+#endif
+  __Pyx_RefNannySetupContext("__Pyx_PyMODINIT_FUNC PyInit__speedups(void)", 0);
+  if (__Pyx_check_binary_version() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #ifdef __Pxy_PyFrame_Initialize_Offsets
+  __Pxy_PyFrame_Initialize_Offsets();
+  #endif
+  __pyx_empty_tuple = PyTuple_New(0); if (unlikely(!__pyx_empty_tuple)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_empty_bytes = PyBytes_FromStringAndSize("", 0); if (unlikely(!__pyx_empty_bytes)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_empty_unicode = PyUnicode_FromStringAndSize("", 0); if (unlikely(!__pyx_empty_unicode)) __PYX_ERR(0, 1, __pyx_L1_error)
+  #ifdef __Pyx_CyFunction_USED
+  if (__pyx_CyFunction_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  #ifdef __Pyx_FusedFunction_USED
+  if (__pyx_FusedFunction_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  #ifdef __Pyx_Coroutine_USED
+  if (__pyx_Coroutine_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  #ifdef __Pyx_Generator_USED
+  if (__pyx_Generator_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  #ifdef __Pyx_AsyncGen_USED
+  if (__pyx_AsyncGen_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  #ifdef __Pyx_StopAsyncIteration_USED
+  if (__pyx_StopAsyncIteration_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  /*--- Library function declarations ---*/
+  /*--- Threads initialization code ---*/
+  #if defined(WITH_THREAD) && PY_VERSION_HEX < 0x030700F0 && defined(__PYX_FORCE_INIT_THREADS) && __PYX_FORCE_INIT_THREADS
+  PyEval_InitThreads();
+  #endif
+  /*--- Module creation code ---*/
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+  __pyx_m = __pyx_pyinit_module;
+  Py_INCREF(__pyx_m);
+  #else
+  #if PY_MAJOR_VERSION < 3
+  __pyx_m = Py_InitModule4("_speedups", __pyx_methods, __pyx_k_C_Speedups_for_commonly_used_ope, 0, PYTHON_API_VERSION); Py_XINCREF(__pyx_m);
+  #else
+  __pyx_m = PyModule_Create(&__pyx_moduledef);
+  #endif
+  if (unlikely(!__pyx_m)) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  __pyx_d = PyModule_GetDict(__pyx_m); if (unlikely(!__pyx_d)) __PYX_ERR(0, 1, __pyx_L1_error)
+  Py_INCREF(__pyx_d);
+  __pyx_b = PyImport_AddModule(__Pyx_BUILTIN_MODULE_NAME); if (unlikely(!__pyx_b)) __PYX_ERR(0, 1, __pyx_L1_error)
+  Py_INCREF(__pyx_b);
+  __pyx_cython_runtime = PyImport_AddModule((char *) "cython_runtime"); if (unlikely(!__pyx_cython_runtime)) __PYX_ERR(0, 1, __pyx_L1_error)
+  Py_INCREF(__pyx_cython_runtime);
+  if (PyObject_SetAttrString(__pyx_m, "__builtins__", __pyx_b) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  /*--- Initialize various global constants etc. ---*/
+  if (__Pyx_InitGlobals() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #if PY_MAJOR_VERSION < 3 && (__PYX_DEFAULT_STRING_ENCODING_IS_ASCII || __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT)
+  if (__Pyx_init_sys_getdefaultencoding_params() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  if (__pyx_module_is_main_protocols___speedups) {
+    if (PyObject_SetAttr(__pyx_m, __pyx_n_s_name, __pyx_n_s_main) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  }
+  #if PY_MAJOR_VERSION >= 3
+  {
+    PyObject *modules = PyImport_GetModuleDict(); if (unlikely(!modules)) __PYX_ERR(0, 1, __pyx_L1_error)
+    if (!PyDict_GetItemString(modules, "protocols._speedups")) {
+      if (unlikely(PyDict_SetItemString(modules, "protocols._speedups", __pyx_m) < 0)) __PYX_ERR(0, 1, __pyx_L1_error)
+    }
+  }
+  #endif
+  /*--- Builtin init code ---*/
+  if (__Pyx_InitCachedBuiltins() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  /*--- Constants init code ---*/
+  if (__Pyx_InitCachedConstants() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  /*--- Global type/function init code ---*/
+  (void)__Pyx_modinit_global_init_code();
+  (void)__Pyx_modinit_variable_export_code();
+  (void)__Pyx_modinit_function_export_code();
+  if (unlikely(__Pyx_modinit_type_init_code() < 0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  (void)__Pyx_modinit_type_import_code();
+  (void)__Pyx_modinit_variable_import_code();
+  (void)__Pyx_modinit_function_import_code();
+  /*--- Execution code ---*/
+  #if defined(__Pyx_Generator_USED) || defined(__Pyx_Coroutine_USED)
+  if (__Pyx_patch_abc() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+
+  /* "protocols/_speedups.pyx":3
+ * """C Speedups for commonly-used operations"""
+ * 
+ * __all__ = [             # <<<<<<<<<<<<<<
+ *     'NO_ADAPTER_NEEDED', 'DOES_NOT_SUPPORT',
+ *     'adapt', 'Protocol__adapt__', 'metamethod', 'classicMRO', 'getMRO',
+ */
+  __pyx_t_1 = PyList_New(20); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 3, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_INCREF(__pyx_n_s_NO_ADAPTER_NEEDED);
+  __Pyx_GIVEREF(__pyx_n_s_NO_ADAPTER_NEEDED);
+  PyList_SET_ITEM(__pyx_t_1, 0, __pyx_n_s_NO_ADAPTER_NEEDED);
+  __Pyx_INCREF(__pyx_n_s_DOES_NOT_SUPPORT);
+  __Pyx_GIVEREF(__pyx_n_s_DOES_NOT_SUPPORT);
+  PyList_SET_ITEM(__pyx_t_1, 1, __pyx_n_s_DOES_NOT_SUPPORT);
+  __Pyx_INCREF(__pyx_n_s_adapt);
+  __Pyx_GIVEREF(__pyx_n_s_adapt);
+  PyList_SET_ITEM(__pyx_t_1, 2, __pyx_n_s_adapt);
+  __Pyx_INCREF(__pyx_n_s_Protocol__adapt);
+  __Pyx_GIVEREF(__pyx_n_s_Protocol__adapt);
+  PyList_SET_ITEM(__pyx_t_1, 3, __pyx_n_s_Protocol__adapt);
+  __Pyx_INCREF(__pyx_n_s_metamethod);
+  __Pyx_GIVEREF(__pyx_n_s_metamethod);
+  PyList_SET_ITEM(__pyx_t_1, 4, __pyx_n_s_metamethod);
+  __Pyx_INCREF(__pyx_n_s_classicMRO);
+  __Pyx_GIVEREF(__pyx_n_s_classicMRO);
+  PyList_SET_ITEM(__pyx_t_1, 5, __pyx_n_s_classicMRO);
+  __Pyx_INCREF(__pyx_n_s_getMRO);
+  __Pyx_GIVEREF(__pyx_n_s_getMRO);
+  PyList_SET_ITEM(__pyx_t_1, 6, __pyx_n_s_getMRO);
+  __Pyx_INCREF(__pyx_n_s_Protocol__call);
+  __Pyx_GIVEREF(__pyx_n_s_Protocol__call);
+  PyList_SET_ITEM(__pyx_t_1, 7, __pyx_n_s_Protocol__call);
+  __Pyx_INCREF(__pyx_n_s_installInterfaceCall);
+  __Pyx_GIVEREF(__pyx_n_s_installInterfaceCall);
+  PyList_SET_ITEM(__pyx_t_1, 8, __pyx_n_s_installInterfaceCall);
+  __Pyx_INCREF(__pyx_n_s_AdapterChain);
+  __Pyx_GIVEREF(__pyx_n_s_AdapterChain);
+  PyList_SET_ITEM(__pyx_t_1, 9, __pyx_n_s_AdapterChain);
+  __Pyx_INCREF(__pyx_n_s_Protocol_getAdapterForType);
+  __Pyx_GIVEREF(__pyx_n_s_Protocol_getAdapterForType);
+  PyList_SET_ITEM(__pyx_t_1, 10, __pyx_n_s_Protocol_getAdapterForType);
+  __Pyx_INCREF(__pyx_n_s_adapt_many);
+  __Pyx_GIVEREF(__pyx_n_s_adapt_many);
+  PyList_SET_ITEM(__pyx_t_1, 11, __pyx_n_s_adapt_many);
+  __Pyx_INCREF(__pyx_n_s_adapt_first);
+  __Pyx_GIVEREF(__pyx_n_s_adapt_first);
+  PyList_SET_ITEM(__pyx_t_1, 12, __pyx_n_s_adapt_first);
+  __Pyx_INCREF(__pyx_n_s_adapt_each);
+  __Pyx_GIVEREF(__pyx_n_s_adapt_each);
+  PyList_SET_ITEM(__pyx_t_1, 13, __pyx_n_s_adapt_each);
+  __Pyx_INCREF(__pyx_n_s_AdapterRecord);
+  __Pyx_GIVEREF(__pyx_n_s_AdapterRecord);
+  PyList_SET_ITEM(__pyx_t_1, 14, __pyx_n_s_AdapterRecord);
+  __Pyx_INCREF(__pyx_n_s_ProviderMixin__conform);
+  __Pyx_GIVEREF(__pyx_n_s_ProviderMixin__conform);
+  PyList_SET_ITEM(__pyx_t_1, 15, __pyx_n_s_ProviderMixin__conform);
+  __Pyx_INCREF(__pyx_n_s_installConformsRegistry);
+  __Pyx_GIVEREF(__pyx_n_s_installConformsRegistry);
+  PyList_SET_ITEM(__pyx_t_1, 16, __pyx_n_s_installConformsRegistry);
+  __Pyx_INCREF(__pyx_n_s_minimumAdapter);
+  __Pyx_GIVEREF(__pyx_n_s_minimumAdapter);
+  PyList_SET_ITEM(__pyx_t_1, 17, __pyx_n_s_minimumAdapter);
+  __Pyx_INCREF(__pyx_n_s_updateWithSimplestAdapter);
+  __Pyx_GIVEREF(__pyx_n_s_updateWithSimplestAdapter);
+  PyList_SET_ITEM(__pyx_t_1, 18, __pyx_n_s_updateWithSimplestAdapter);
+  __Pyx_INCREF(__pyx_n_s_ADAPT_SEQUENCE);
+  __Pyx_GIVEREF(__pyx_n_s_ADAPT_SEQUENCE);
+  PyList_SET_ITEM(__pyx_t_1, 19, __pyx_n_s_ADAPT_SEQUENCE);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_all, __pyx_t_1) < 0) __PYX_ERR(0, 3, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "protocols/_speedups.pyx":98
+ * cdef object _classicMROs, _classicMROData
+ * cdef void *_objectClass
+ * from sys import exc_info             # <<<<<<<<<<<<<<
+ * from weakref import WeakKeyDictionary
+ * from protocols.adapters import AdaptationFailure
+ */
+  __pyx_t_1 = PyList_New(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 98, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_INCREF(__pyx_n_s_exc_info);
+  __Pyx_GIVEREF(__pyx_n_s_exc_info);
+  PyList_SET_ITEM(__pyx_t_1, 0, __pyx_n_s_exc_info);
+  __pyx_t_2 = __Pyx_Import(__pyx_n_s_sys, __pyx_t_1, -1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 98, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = __Pyx_ImportFrom(__pyx_t_2, __pyx_n_s_exc_info); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 98, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_exc_info, __pyx_t_1) < 0) __PYX_ERR(0, 98, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "protocols/_speedups.pyx":99
+ * cdef void *_objectClass
+ * from sys import exc_info
+ * from weakref import WeakKeyDictionary             # <<<<<<<<<<<<<<
+ * from protocols.adapters import AdaptationFailure
+ * 
+ */
+  __pyx_t_2 = PyList_New(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 99, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_INCREF(__pyx_n_s_WeakKeyDictionary);
+  __Pyx_GIVEREF(__pyx_n_s_WeakKeyDictionary);
+  PyList_SET_ITEM(__pyx_t_2, 0, __pyx_n_s_WeakKeyDictionary);
+  __pyx_t_1 = __Pyx_Import(__pyx_n_s_weakref, __pyx_t_2, -1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 99, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = __Pyx_ImportFrom(__pyx_t_1, __pyx_n_s_WeakKeyDictionary); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 99, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_WeakKeyDictionary, __pyx_t_2) < 0) __PYX_ERR(0, 99, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "protocols/_speedups.pyx":100
+ * from sys import exc_info
+ * from weakref import WeakKeyDictionary
+ * from protocols.adapters import AdaptationFailure             # <<<<<<<<<<<<<<
+ * 
+ * try:
+ */
+  __pyx_t_1 = PyList_New(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 100, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_INCREF(__pyx_n_s_AdaptationFailure);
+  __Pyx_GIVEREF(__pyx_n_s_AdaptationFailure);
+  PyList_SET_ITEM(__pyx_t_1, 0, __pyx_n_s_AdaptationFailure);
+  __pyx_t_2 = __Pyx_Import(__pyx_n_s_protocols_adapters, __pyx_t_1, -1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 100, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = __Pyx_ImportFrom(__pyx_t_2, __pyx_n_s_AdaptationFailure); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 100, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_AdaptationFailure, __pyx_t_1) < 0) __PYX_ERR(0, 100, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "protocols/_speedups.pyx":102
+ * from protocols.adapters import AdaptationFailure
+ * 
+ * try:             # <<<<<<<<<<<<<<
+ *     from ExtensionClass import ExtensionClass
+ *     __ECType = ExtensionClass
+ */
+  {
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    __Pyx_ExceptionSave(&__pyx_t_3, &__pyx_t_4, &__pyx_t_5);
+    __Pyx_XGOTREF(__pyx_t_3);
+    __Pyx_XGOTREF(__pyx_t_4);
+    __Pyx_XGOTREF(__pyx_t_5);
+    /*try:*/ {
+
+      /* "protocols/_speedups.pyx":103
+ * 
+ * try:
+ *     from ExtensionClass import ExtensionClass             # <<<<<<<<<<<<<<
+ *     __ECType = ExtensionClass
+ * except ImportError:
+ */
+      __pyx_t_2 = PyList_New(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 103, __pyx_L2_error)
+      __Pyx_GOTREF(__pyx_t_2);
+      __Pyx_INCREF(__pyx_n_s_ExtensionClass);
+      __Pyx_GIVEREF(__pyx_n_s_ExtensionClass);
+      PyList_SET_ITEM(__pyx_t_2, 0, __pyx_n_s_ExtensionClass);
+      __pyx_t_1 = __Pyx_Import(__pyx_n_s_ExtensionClass, __pyx_t_2, -1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 103, __pyx_L2_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+      __pyx_t_2 = __Pyx_ImportFrom(__pyx_t_1, __pyx_n_s_ExtensionClass); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 103, __pyx_L2_error)
+      __Pyx_GOTREF(__pyx_t_2);
+      if (PyDict_SetItem(__pyx_d, __pyx_n_s_ExtensionClass, __pyx_t_2) < 0) __PYX_ERR(0, 103, __pyx_L2_error)
+      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+      /* "protocols/_speedups.pyx":104
+ * try:
+ *     from ExtensionClass import ExtensionClass
+ *     __ECType = ExtensionClass             # <<<<<<<<<<<<<<
+ * except ImportError:
+ *     __ECType = type(object)
+ */
+      __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_ExtensionClass); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 104, __pyx_L2_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      __Pyx_XGOTREF(__pyx_v_9protocols_9_speedups___ECType);
+      __Pyx_DECREF_SET(__pyx_v_9protocols_9_speedups___ECType, __pyx_t_1);
+      __Pyx_GIVEREF(__pyx_t_1);
+      __pyx_t_1 = 0;
+
+      /* "protocols/_speedups.pyx":102
+ * from protocols.adapters import AdaptationFailure
+ * 
+ * try:             # <<<<<<<<<<<<<<
+ *     from ExtensionClass import ExtensionClass
+ *     __ECType = ExtensionClass
+ */
+    }
+    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+    goto __pyx_L7_try_end;
+    __pyx_L2_error:;
+    __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+    /* "protocols/_speedups.pyx":105
+ *     from ExtensionClass import ExtensionClass
+ *     __ECType = ExtensionClass
+ * except ImportError:             # <<<<<<<<<<<<<<
+ *     __ECType = type(object)
+ * 
+ */
+    __pyx_t_6 = __Pyx_PyErr_ExceptionMatches(__pyx_builtin_ImportError);
+    if (__pyx_t_6) {
+      __Pyx_AddTraceback("protocols._speedups", __pyx_clineno, __pyx_lineno, __pyx_filename);
+      if (__Pyx_GetException(&__pyx_t_1, &__pyx_t_2, &__pyx_t_7) < 0) __PYX_ERR(0, 105, __pyx_L4_except_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      __Pyx_GOTREF(__pyx_t_2);
+      __Pyx_GOTREF(__pyx_t_7);
+
+      /* "protocols/_speedups.pyx":106
+ *     __ECType = ExtensionClass
+ * except ImportError:
+ *     __ECType = type(object)             # <<<<<<<<<<<<<<
+ * 
+ * _marker    = object()
+ */
+      __pyx_t_8 = PyObject_Type(__pyx_builtin_object); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 106, __pyx_L4_except_error)
+      __Pyx_GOTREF(__pyx_t_8);
+      __Pyx_XGOTREF(__pyx_v_9protocols_9_speedups___ECType);
+      __Pyx_DECREF_SET(__pyx_v_9protocols_9_speedups___ECType, __pyx_t_8);
+      __Pyx_GIVEREF(__pyx_t_8);
+      __pyx_t_8 = 0;
+      __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
+      __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
+      __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
+      goto __pyx_L3_exception_handled;
+    }
+    goto __pyx_L4_except_error;
+    __pyx_L4_except_error:;
+
+    /* "protocols/_speedups.pyx":102
+ * from protocols.adapters import AdaptationFailure
+ * 
+ * try:             # <<<<<<<<<<<<<<
+ *     from ExtensionClass import ExtensionClass
+ *     __ECType = ExtensionClass
+ */
+    __Pyx_XGIVEREF(__pyx_t_3);
+    __Pyx_XGIVEREF(__pyx_t_4);
+    __Pyx_XGIVEREF(__pyx_t_5);
+    __Pyx_ExceptionReset(__pyx_t_3, __pyx_t_4, __pyx_t_5);
+    goto __pyx_L1_error;
+    __pyx_L3_exception_handled:;
+    __Pyx_XGIVEREF(__pyx_t_3);
+    __Pyx_XGIVEREF(__pyx_t_4);
+    __Pyx_XGIVEREF(__pyx_t_5);
+    __Pyx_ExceptionReset(__pyx_t_3, __pyx_t_4, __pyx_t_5);
+    __pyx_L7_try_end:;
+  }
+
+  /* "protocols/_speedups.pyx":108
+ *     __ECType = type(object)
+ * 
+ * _marker    = object()             # <<<<<<<<<<<<<<
+ * _failed    = object()
+ * __conform  = PyString_InternFromString("__conform__")
+ */
+  __pyx_t_7 = __Pyx_PyObject_CallNoArg(__pyx_builtin_object); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 108, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_XGOTREF(__pyx_v_9protocols_9_speedups__marker);
+  __Pyx_DECREF_SET(__pyx_v_9protocols_9_speedups__marker, __pyx_t_7);
+  __Pyx_GIVEREF(__pyx_t_7);
+  __pyx_t_7 = 0;
+
+  /* "protocols/_speedups.pyx":109
+ * 
+ * _marker    = object()
+ * _failed    = object()             # <<<<<<<<<<<<<<
+ * __conform  = PyString_InternFromString("__conform__")
+ * __adapt    = PyString_InternFromString("__adapt__")
+ */
+  __pyx_t_7 = __Pyx_PyObject_CallNoArg(__pyx_builtin_object); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 109, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_XGOTREF(__pyx_v_9protocols_9_speedups__failed);
+  __Pyx_DECREF_SET(__pyx_v_9protocols_9_speedups__failed, __pyx_t_7);
+  __Pyx_GIVEREF(__pyx_t_7);
+  __pyx_t_7 = 0;
+
+  /* "protocols/_speedups.pyx":110
+ * _marker    = object()
+ * _failed    = object()
+ * __conform  = PyString_InternFromString("__conform__")             # <<<<<<<<<<<<<<
+ * __adapt    = PyString_InternFromString("__adapt__")
+ * __class    = PyString_InternFromString("__class__")
+ */
+  __pyx_t_7 = PyString_InternFromString(((char *)"__conform__")); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 110, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_XGOTREF(__pyx_v_9protocols_9_speedups___conform);
+  __Pyx_DECREF_SET(__pyx_v_9protocols_9_speedups___conform, __pyx_t_7);
+  __Pyx_GIVEREF(__pyx_t_7);
+  __pyx_t_7 = 0;
+
+  /* "protocols/_speedups.pyx":111
+ * _failed    = object()
+ * __conform  = PyString_InternFromString("__conform__")
+ * __adapt    = PyString_InternFromString("__adapt__")             # <<<<<<<<<<<<<<
+ * __class    = PyString_InternFromString("__class__")
+ * __mro      = PyString_InternFromString("__mro__")
+ */
+  __pyx_t_7 = PyString_InternFromString(((char *)"__adapt__")); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 111, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_XGOTREF(__pyx_v_9protocols_9_speedups___adapt);
+  __Pyx_DECREF_SET(__pyx_v_9protocols_9_speedups___adapt, __pyx_t_7);
+  __Pyx_GIVEREF(__pyx_t_7);
+  __pyx_t_7 = 0;
+
+  /* "protocols/_speedups.pyx":112
+ * __conform  = PyString_InternFromString("__conform__")
+ * __adapt    = PyString_InternFromString("__adapt__")
+ * __class    = PyString_InternFromString("__class__")             # <<<<<<<<<<<<<<
+ * __mro      = PyString_InternFromString("__mro__")
+ * __init     = PyString_InternFromString("__init__")
+ */
+  __pyx_t_7 = PyString_InternFromString(((char *)"__class__")); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 112, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_7);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_class, __pyx_t_7) < 0) __PYX_ERR(0, 112, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+
+  /* "protocols/_speedups.pyx":113
+ * __adapt    = PyString_InternFromString("__adapt__")
+ * __class    = PyString_InternFromString("__class__")
+ * __mro      = PyString_InternFromString("__mro__")             # <<<<<<<<<<<<<<
+ * __init     = PyString_InternFromString("__init__")
+ * 
+ */
+  __pyx_t_7 = PyString_InternFromString(((char *)"__mro__")); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 113, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_XGOTREF(__pyx_v_9protocols_9_speedups___mro);
+  __Pyx_DECREF_SET(__pyx_v_9protocols_9_speedups___mro, __pyx_t_7);
+  __Pyx_GIVEREF(__pyx_t_7);
+  __pyx_t_7 = 0;
+
+  /* "protocols/_speedups.pyx":114
+ * __class    = PyString_InternFromString("__class__")
+ * __mro      = PyString_InternFromString("__mro__")
+ * __init     = PyString_InternFromString("__init__")             # <<<<<<<<<<<<<<
+ * 
+ * # 'object.__class__', the descriptor most types inherit
+ */
+  __pyx_t_7 = PyString_InternFromString(((char *)"__init__")); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 114, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_XGOTREF(__pyx_v_9protocols_9_speedups___init);
+  __Pyx_DECREF_SET(__pyx_v_9protocols_9_speedups___init, __pyx_t_7);
+  __Pyx_GIVEREF(__pyx_t_7);
+  __pyx_t_7 = 0;
+
+  /* "protocols/_speedups.pyx":117
+ * 
+ * # 'object.__class__', the descriptor most types inherit
+ * _objectClass = _PyType_Lookup(&PyBaseObject_Type, __class)             # <<<<<<<<<<<<<<
+ * 
+ * _classicMROs = WeakKeyDictionary()
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_7, __pyx_n_s_class); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 117, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_7);
+  __pyx_v_9protocols_9_speedups__objectClass = _PyType_Lookup((&PyBaseObject_Type), __pyx_t_7);
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+
+  /* "protocols/_speedups.pyx":119
+ * _objectClass = _PyType_Lookup(&PyBaseObject_Type, __class)
+ * 
+ * _classicMROs = WeakKeyDictionary()             # <<<<<<<<<<<<<<
+ * _classicMROData = _classicMROs.data
+ * 
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_7, __pyx_n_s_WeakKeyDictionary); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 119, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_7);
+  __pyx_t_2 = __Pyx_PyObject_CallNoArg(__pyx_t_7); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 119, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __Pyx_XGOTREF(__pyx_v_9protocols_9_speedups__classicMROs);
+  __Pyx_DECREF_SET(__pyx_v_9protocols_9_speedups__classicMROs, __pyx_t_2);
+  __Pyx_GIVEREF(__pyx_t_2);
+  __pyx_t_2 = 0;
+
+  /* "protocols/_speedups.pyx":120
+ * 
+ * _classicMROs = WeakKeyDictionary()
+ * _classicMROData = _classicMROs.data             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_9protocols_9_speedups__classicMROs, __pyx_n_s_data); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 120, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_XGOTREF(__pyx_v_9protocols_9_speedups__classicMROData);
+  __Pyx_DECREF_SET(__pyx_v_9protocols_9_speedups__classicMROData, __pyx_t_2);
+  __Pyx_GIVEREF(__pyx_t_2);
+  __pyx_t_2 = 0;
+
+  /* "protocols/_speedups.pyx":133
+ * # Fundamental Adapters
+ * 
+ * def NO_ADAPTER_NEEDED(obj, protocol=None):             # <<<<<<<<<<<<<<
+ *     """Assume 'obj' implements 'protocol' directly"""
+ *     return obj
+ */
+  __pyx_t_2 = PyCFunction_NewEx(&__pyx_mdef_9protocols_9_speedups_1NO_ADAPTER_NEEDED, NULL, __pyx_n_s_protocols__speedups); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 133, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_NO_ADAPTER_NEEDED, __pyx_t_2) < 0) __PYX_ERR(0, 133, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "protocols/_speedups.pyx":137
+ *     return obj
+ * 
+ * def DOES_NOT_SUPPORT(obj, protocol=None):             # <<<<<<<<<<<<<<
+ *     """Prevent 'obj' from supporting 'protocol'"""
+ *     return None
+ */
+  __pyx_t_2 = PyCFunction_NewEx(&__pyx_mdef_9protocols_9_speedups_3DOES_NOT_SUPPORT, NULL, __pyx_n_s_protocols__speedups); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 137, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_DOES_NOT_SUPPORT, __pyx_t_2) < 0) __PYX_ERR(0, 137, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "protocols/_speedups.pyx":276
+ * 
+ * 
+ * def minimumAdapter(a1,a2,d1=0,d2=0):             # <<<<<<<<<<<<<<
+ *     """Shortest route to implementation, 'a1' @ depth 'd1', or 'a2' @ 'd2'?"""
+ * 
+ */
+  __pyx_t_2 = PyCFunction_NewEx(&__pyx_mdef_9protocols_9_speedups_5minimumAdapter, NULL, __pyx_n_s_protocols__speedups); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 276, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_minimumAdapter, __pyx_t_2) < 0) __PYX_ERR(0, 276, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "protocols/_speedups.pyx":293
+ * 
+ * 
+ * def updateWithSimplestAdapter(mapping, key, adapter, depth):             # <<<<<<<<<<<<<<
+ *     """Replace 'mapping[key]' w/'adapter' @ 'depth', return true if changed"""
+ * 
+ */
+  __pyx_t_2 = PyCFunction_NewEx(&__pyx_mdef_9protocols_9_speedups_7updateWithSimplestAdapter, NULL, __pyx_n_s_protocols__speedups); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 293, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_updateWithSimplestAdapter, __pyx_t_2) < 0) __PYX_ERR(0, 293, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "protocols/_speedups.pyx":523
+ * 
+ * 
+ * def adapt(obj, protocol, default=_marker):             # <<<<<<<<<<<<<<
+ *     """PEP 246-alike: Adapt 'obj' to 'protocol', return 'default'
+ * 
+ */
+  __Pyx_INCREF(__pyx_v_9protocols_9_speedups__marker);
+  __pyx_k__2 = __pyx_v_9protocols_9_speedups__marker;
+  __Pyx_GIVEREF(__pyx_v_9protocols_9_speedups__marker);
+  __pyx_t_2 = PyCFunction_NewEx(&__pyx_mdef_9protocols_9_speedups_9adapt, NULL, __pyx_n_s_protocols__speedups); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 523, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_adapt, __pyx_t_2) < 0) __PYX_ERR(0, 523, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "protocols/_speedups.pyx":531
+ *     return _adapt(obj,protocol,default)
+ * 
+ * def Protocol__call__(self, ob, default=_marker):             # <<<<<<<<<<<<<<
+ *     """Adapt to this protocol"""
+ *     return _adapt(ob,self,default)
+ */
+  __Pyx_INCREF(__pyx_v_9protocols_9_speedups__marker);
+  __pyx_k__3 = __pyx_v_9protocols_9_speedups__marker;
+  __Pyx_GIVEREF(__pyx_v_9protocols_9_speedups__marker);
+  __pyx_t_2 = PyCFunction_NewEx(&__pyx_mdef_9protocols_9_speedups_11Protocol__call__, NULL, __pyx_n_s_protocols__speedups); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 531, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_Protocol__call, __pyx_t_2) < 0) __PYX_ERR(0, 531, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "protocols/_speedups.pyx":608
+ * 
+ * 
+ * def adapt_many(objects, protocol, default=_marker):             # <<<<<<<<<<<<<<
+ *     """Return a list of 'objects' adapted to 'protocol' (see 'adapt()')
+ * 
+ */
+  __Pyx_INCREF(__pyx_v_9protocols_9_speedups__marker);
+  __pyx_k__4 = __pyx_v_9protocols_9_speedups__marker;
+  __Pyx_GIVEREF(__pyx_v_9protocols_9_speedups__marker);
+  __pyx_t_2 = PyCFunction_NewEx(&__pyx_mdef_9protocols_9_speedups_13adapt_many, NULL, __pyx_n_s_protocols__speedups); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 608, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_adapt_many, __pyx_t_2) < 0) __PYX_ERR(0, 608, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "protocols/_speedups.pyx":617
+ * 
+ * 
+ * def ADAPT_SEQUENCE(ob, proto):             # <<<<<<<<<<<<<<
+ *     """Convert iterable 'ob' into list of objects implementing 'proto'"""
+ * 
+ */
+  __pyx_t_2 = PyCFunction_NewEx(&__pyx_mdef_9protocols_9_speedups_15ADAPT_SEQUENCE, NULL, __pyx_n_s_protocols__speedups); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 617, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_ADAPT_SEQUENCE, __pyx_t_2) < 0) __PYX_ERR(0, 617, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "protocols/_speedups.pyx":623
+ * 
+ * 
+ * def adapt_first(obj, protocols, default=_marker):             # <<<<<<<<<<<<<<
+ *     """Return 'obj' adapted to the first of 'protocols' it can be adapted to
+ * 
+ */
+  __Pyx_INCREF(__pyx_v_9protocols_9_speedups__marker);
+  __pyx_k__5 = __pyx_v_9protocols_9_speedups__marker;
+  __Pyx_GIVEREF(__pyx_v_9protocols_9_speedups__marker);
+  __pyx_t_2 = PyCFunction_NewEx(&__pyx_mdef_9protocols_9_speedups_17adapt_first, NULL, __pyx_n_s_protocols__speedups); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 623, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_adapt_first, __pyx_t_2) < 0) __PYX_ERR(0, 623, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "protocols/_speedups.pyx":632
+ * 
+ * 
+ * def adapt_each(obj, protocols, default=None):             # <<<<<<<<<<<<<<
+ *     """Return a list of 'obj' adapted to each of 'protocols', in order
+ * 
+ */
+  __pyx_t_2 = PyCFunction_NewEx(&__pyx_mdef_9protocols_9_speedups_19adapt_each, NULL, __pyx_n_s_protocols__speedups); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 632, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_adapt_each, __pyx_t_2) < 0) __PYX_ERR(0, 632, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "protocols/_speedups.pyx":667
+ * 
+ * 
+ * def installInterfaceCall(InterfaceClass, Interface):             # <<<<<<<<<<<<<<
+ *     """Put a C version of 'InterfaceClass.__call__' in its tp_call slot
+ * 
+ */
+  __pyx_t_2 = PyCFunction_NewEx(&__pyx_mdef_9protocols_9_speedups_21installInterfaceCall, NULL, __pyx_n_s_protocols__speedups); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 667, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_installInterfaceCall, __pyx_t_2) < 0) __PYX_ERR(0, 667, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "protocols/_speedups.pyx":783
+ * 
+ * 
+ * def classicMRO(ob, extendedClassic=False):             # <<<<<<<<<<<<<<
+ * 
+ *     if PyClass_Check(ob):
+ */
+  __pyx_t_2 = PyCFunction_NewEx(&__pyx_mdef_9protocols_9_speedups_23classicMRO, NULL, __pyx_n_s_protocols__speedups); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 783, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_classicMRO, __pyx_t_2) < 0) __PYX_ERR(0, 783, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "protocols/_speedups.pyx":797
+ * 
+ * 
+ * def extClassMRO(ob, extendedClassic=False):             # <<<<<<<<<<<<<<
+ *     return cachedMRO(ob, extendedClassic)
+ * 
+ */
+  __pyx_t_2 = PyCFunction_NewEx(&__pyx_mdef_9protocols_9_speedups_25extClassMRO, NULL, __pyx_n_s_protocols__speedups); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 797, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_extClassMRO, __pyx_t_2) < 0) __PYX_ERR(0, 797, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "protocols/_speedups.pyx":802
+ * 
+ * 
+ * def getMRO(ob, extendedClassic=False):             # <<<<<<<<<<<<<<
+ * 
+ *     if PyClass_Check(ob):
+ */
+  __pyx_t_2 = PyCFunction_NewEx(&__pyx_mdef_9protocols_9_speedups_27getMRO, NULL, __pyx_n_s_protocols__speedups); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 802, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_getMRO, __pyx_t_2) < 0) __PYX_ERR(0, 802, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "protocols/_speedups.pyx":1036
+ * 
+ * 
+ * def Protocol_getAdapterForType(self, typ):             # <<<<<<<<<<<<<<
+ *     """Return the adapter for instances of 'typ' (incl. bases), or 'None'"""
+ *     return lookupAdapter(self, typ)
+ */
+  __pyx_t_2 = PyCFunction_NewEx(&__pyx_mdef_9protocols_9_speedups_29Protocol_getAdapterForType, NULL, __pyx_n_s_protocols__speedups); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 1036, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_Protocol_getAdapterForType, __pyx_t_2) < 0) __PYX_ERR(0, 1036, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "protocols/_speedups.pyx":1041
+ * 
+ * 
+ * def Protocol__adapt__(self, obj):             # <<<<<<<<<<<<<<
+ * 
+ *     if not self._Protocol__adapters and not self._Protocol__pendingSources:
+ */
+  __pyx_t_2 = PyCFunction_NewEx(&__pyx_mdef_9protocols_9_speedups_31Protocol__adapt__, NULL, __pyx_n_s_protocols__speedups); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 1041, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_Protocol__adapt, __pyx_t_2) < 0) __PYX_ERR(0, 1041, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "protocols/_speedups.pyx":1057
+ * 
+ * cdef object __provided, _conformsRegistry
+ * __provided = PyString_InternFromString("__protocols_provided__")             # <<<<<<<<<<<<<<
+ * _conformsRegistry = None
+ * 
+ */
+  __pyx_t_2 = PyString_InternFromString(((char *)"__protocols_provided__")); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 1057, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_XGOTREF(__pyx_v_9protocols_9_speedups___provided);
+  __Pyx_DECREF_SET(__pyx_v_9protocols_9_speedups___provided, __pyx_t_2);
+  __Pyx_GIVEREF(__pyx_t_2);
+  __pyx_t_2 = 0;
+
+  /* "protocols/_speedups.pyx":1058
+ * cdef object __provided, _conformsRegistry
+ * __provided = PyString_InternFromString("__protocols_provided__")
+ * _conformsRegistry = None             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_INCREF(Py_None);
+  __Pyx_XGOTREF(__pyx_v_9protocols_9_speedups__conformsRegistry);
+  __Pyx_DECREF_SET(__pyx_v_9protocols_9_speedups__conformsRegistry, Py_None);
+  __Pyx_GIVEREF(Py_None);
+
+  /* "protocols/_speedups.pyx":1143
+ * 
+ * 
+ * def ProviderMixin__conform__(self, protocol):             # <<<<<<<<<<<<<<
+ *     """Adapt 'self' using its (or its bases') '__protocols_provided__'"""
+ * 
+ */
+  __pyx_t_2 = PyCFunction_NewEx(&__pyx_mdef_9protocols_9_speedups_33ProviderMixin__conform__, NULL, __pyx_n_s_protocols__speedups); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 1143, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_ProviderMixin__conform, __pyx_t_2) < 0) __PYX_ERR(0, 1143, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "protocols/_speedups.pyx":1183
+ * 
+ * 
+ * def conformsRegistry_findImplementation(self,subject,protocol,checkSelf=True):             # <<<<<<<<<<<<<<
+ * 
+ *     cdef int i
+ */
+  __pyx_t_2 = PyCFunction_NewEx(&__pyx_mdef_9protocols_9_speedups_35conformsRegistry_findImplementation, NULL, __pyx_n_s_protocols__speedups); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 1183, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_conformsRegistry_findImplementat, __pyx_t_2) < 0) __PYX_ERR(0, 1183, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "protocols/_speedups.pyx":1203
+ * 
+ * 
+ * def conformsRegistry__call__(self, protocol):             # <<<<<<<<<<<<<<
+ * 
+ *     cdef void *tmp
+ */
+  __pyx_t_2 = PyCFunction_NewEx(&__pyx_mdef_9protocols_9_speedups_37conformsRegistry__call__, NULL, __pyx_n_s_protocols__speedups); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 1203, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_conformsRegistry__call, __pyx_t_2) < 0) __PYX_ERR(0, 1203, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "protocols/_speedups.pyx":1215
+ * 
+ * 
+ * def installConformsRegistry(conformsRegistry):             # <<<<<<<<<<<<<<
+ *     """Use C versions of 'conformsRegistry' methods
+ * 
+ */
+  __pyx_t_2 = PyCFunction_NewEx(&__pyx_mdef_9protocols_9_speedups_39installConformsRegistry, NULL, __pyx_n_s_protocols__speedups); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 1215, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_installConformsRegistry, __pyx_t_2) < 0) __PYX_ERR(0, 1215, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "(tree fragment)":1
+ * def __pyx_unpickle_metamethod(__pyx_type, long __pyx_checksum, __pyx_state):             # <<<<<<<<<<<<<<
+ *     cdef object __pyx_PickleError
+ *     cdef object __pyx_result
+ */
+  __pyx_t_2 = PyCFunction_NewEx(&__pyx_mdef_9protocols_9_speedups_41__pyx_unpickle_metamethod, NULL, __pyx_n_s_protocols__speedups); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_pyx_unpickle_metamethod, __pyx_t_2) < 0) __PYX_ERR(1, 1, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "protocols/_speedups.pyx":1
+ * """C Speedups for commonly-used operations"""             # <<<<<<<<<<<<<<
+ * 
+ * __all__ = [
+ */
+  __pyx_t_2 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_test, __pyx_t_2) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /*--- Wrapped vars code ---*/
+
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_XDECREF(__pyx_t_8);
+  if (__pyx_m) {
+    if (__pyx_d) {
+      __Pyx_AddTraceback("init protocols._speedups", __pyx_clineno, __pyx_lineno, __pyx_filename);
+    }
+    Py_CLEAR(__pyx_m);
+  } else if (!PyErr_Occurred()) {
+    PyErr_SetString(PyExc_ImportError, "init protocols._speedups");
+  }
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+  return (__pyx_m != NULL) ? 0 : -1;
+  #elif PY_MAJOR_VERSION >= 3
+  return __pyx_m;
+  #else
+  return;
+  #endif
+}
+
+/* --- Runtime support code --- */
+/* Refnanny */
+#if CYTHON_REFNANNY
+static __Pyx_RefNannyAPIStruct *__Pyx_RefNannyImportAPI(const char *modname) {
+    PyObject *m = NULL, *p = NULL;
+    void *r = NULL;
+    m = PyImport_ImportModule(modname);
+    if (!m) goto end;
+    p = PyObject_GetAttrString(m, "RefNannyAPI");
+    if (!p) goto end;
+    r = PyLong_AsVoidPtr(p);
+end:
+    Py_XDECREF(p);
+    Py_XDECREF(m);
+    return (__Pyx_RefNannyAPIStruct *)r;
+}
+#endif
+
+/* PyObjectGetAttrStr */
+#if CYTHON_USE_TYPE_SLOTS
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStr(PyObject* obj, PyObject* attr_name) {
+    PyTypeObject* tp = Py_TYPE(obj);
+    if (likely(tp->tp_getattro))
+        return tp->tp_getattro(obj, attr_name);
+#if PY_MAJOR_VERSION < 3
+    if (likely(tp->tp_getattr))
+        return tp->tp_getattr(obj, PyString_AS_STRING(attr_name));
+#endif
+    return PyObject_GetAttr(obj, attr_name);
+}
+#endif
+
+/* GetBuiltinName */
+static PyObject *__Pyx_GetBuiltinName(PyObject *name) {
+    PyObject* result = __Pyx_PyObject_GetAttrStr(__pyx_b, name);
+    if (unlikely(!result)) {
+        PyErr_Format(PyExc_NameError,
+#if PY_MAJOR_VERSION >= 3
+            "name '%U' is not defined", name);
+#else
+            "name '%.200s' is not defined", PyString_AS_STRING(name));
+#endif
+    }
+    return result;
+}
+
+/* RaiseDoubleKeywords */
+static void __Pyx_RaiseDoubleKeywordsError(
+    const char* func_name,
+    PyObject* kw_name)
+{
+    PyErr_Format(PyExc_TypeError,
+        #if PY_MAJOR_VERSION >= 3
+        "%s() got multiple values for keyword argument '%U'", func_name, kw_name);
+        #else
+        "%s() got multiple values for keyword argument '%s'", func_name,
+        PyString_AsString(kw_name));
+        #endif
+}
+
+/* ParseKeywords */
+static int __Pyx_ParseOptionalKeywords(
+    PyObject *kwds,
+    PyObject **argnames[],
+    PyObject *kwds2,
+    PyObject *values[],
+    Py_ssize_t num_pos_args,
+    const char* function_name)
+{
+    PyObject *key = 0, *value = 0;
+    Py_ssize_t pos = 0;
+    PyObject*** name;
+    PyObject*** first_kw_arg = argnames + num_pos_args;
+    while (PyDict_Next(kwds, &pos, &key, &value)) {
+        name = first_kw_arg;
+        while (*name && (**name != key)) name++;
+        if (*name) {
+            values[name-argnames] = value;
+            continue;
+        }
+        name = first_kw_arg;
+        #if PY_MAJOR_VERSION < 3
+        if (likely(PyString_Check(key))) {
+            while (*name) {
+                if ((CYTHON_COMPILING_IN_PYPY || PyString_GET_SIZE(**name) == PyString_GET_SIZE(key))
+                        && _PyString_Eq(**name, key)) {
+                    values[name-argnames] = value;
+                    break;
+                }
+                name++;
+            }
+            if (*name) continue;
+            else {
+                PyObject*** argname = argnames;
+                while (argname != first_kw_arg) {
+                    if ((**argname == key) || (
+                            (CYTHON_COMPILING_IN_PYPY || PyString_GET_SIZE(**argname) == PyString_GET_SIZE(key))
+                             && _PyString_Eq(**argname, key))) {
+                        goto arg_passed_twice;
+                    }
+                    argname++;
+                }
+            }
+        } else
+        #endif
+        if (likely(PyUnicode_Check(key))) {
+            while (*name) {
+                int cmp = (**name == key) ? 0 :
+                #if !CYTHON_COMPILING_IN_PYPY && PY_MAJOR_VERSION >= 3
+                    (__Pyx_PyUnicode_GET_LENGTH(**name) != __Pyx_PyUnicode_GET_LENGTH(key)) ? 1 :
+                #endif
+                    PyUnicode_Compare(**name, key);
+                if (cmp < 0 && unlikely(PyErr_Occurred())) goto bad;
+                if (cmp == 0) {
+                    values[name-argnames] = value;
+                    break;
+                }
+                name++;
+            }
+            if (*name) continue;
+            else {
+                PyObject*** argname = argnames;
+                while (argname != first_kw_arg) {
+                    int cmp = (**argname == key) ? 0 :
+                    #if !CYTHON_COMPILING_IN_PYPY && PY_MAJOR_VERSION >= 3
+                        (__Pyx_PyUnicode_GET_LENGTH(**argname) != __Pyx_PyUnicode_GET_LENGTH(key)) ? 1 :
+                    #endif
+                        PyUnicode_Compare(**argname, key);
+                    if (cmp < 0 && unlikely(PyErr_Occurred())) goto bad;
+                    if (cmp == 0) goto arg_passed_twice;
+                    argname++;
+                }
+            }
+        } else
+            goto invalid_keyword_type;
+        if (kwds2) {
+            if (unlikely(PyDict_SetItem(kwds2, key, value))) goto bad;
+        } else {
+            goto invalid_keyword;
+        }
+    }
+    return 0;
+arg_passed_twice:
+    __Pyx_RaiseDoubleKeywordsError(function_name, key);
+    goto bad;
+invalid_keyword_type:
+    PyErr_Format(PyExc_TypeError,
+        "%.200s() keywords must be strings", function_name);
+    goto bad;
+invalid_keyword:
+    PyErr_Format(PyExc_TypeError,
+    #if PY_MAJOR_VERSION < 3
+        "%.200s() got an unexpected keyword argument '%.200s'",
+        function_name, PyString_AsString(key));
+    #else
+        "%s() got an unexpected keyword argument '%U'",
+        function_name, key);
+    #endif
+bad:
+    return -1;
+}
+
+/* RaiseArgTupleInvalid */
+static void __Pyx_RaiseArgtupleInvalid(
+    const char* func_name,
+    int exact,
+    Py_ssize_t num_min,
+    Py_ssize_t num_max,
+    Py_ssize_t num_found)
+{
+    Py_ssize_t num_expected;
+    const char *more_or_less;
+    if (num_found < num_min) {
+        num_expected = num_min;
+        more_or_less = "at least";
+    } else {
+        num_expected = num_max;
+        more_or_less = "at most";
+    }
+    if (exact) {
+        more_or_less = "exactly";
+    }
+    PyErr_Format(PyExc_TypeError,
+                 "%.200s() takes %.8s %" CYTHON_FORMAT_SSIZE_T "d positional argument%.1s (%" CYTHON_FORMAT_SSIZE_T "d given)",
+                 func_name, more_or_less, num_expected,
+                 (num_expected == 1) ? "" : "s", num_found);
+}
+
+/* PyObjectCall */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_Call(PyObject *func, PyObject *arg, PyObject *kw) {
+    PyObject *result;
+    ternaryfunc call = Py_TYPE(func)->tp_call;
+    if (unlikely(!call))
+        return PyObject_Call(func, arg, kw);
+    if (unlikely(Py_EnterRecursiveCall((char*)" while calling a Python object")))
+        return NULL;
+    result = (*call)(func, arg, kw);
+    Py_LeaveRecursiveCall();
+    if (unlikely(!result) && unlikely(!PyErr_Occurred())) {
+        PyErr_SetString(
+            PyExc_SystemError,
+            "NULL result without error in PyObject_Call");
+    }
+    return result;
+}
+#endif
+
+/* PyErrFetchRestore */
+#if CYTHON_FAST_THREAD_STATE
+static CYTHON_INLINE void __Pyx_ErrRestoreInState(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb) {
+    PyObject *tmp_type, *tmp_value, *tmp_tb;
+    tmp_type = tstate->curexc_type;
+    tmp_value = tstate->curexc_value;
+    tmp_tb = tstate->curexc_traceback;
+    tstate->curexc_type = type;
+    tstate->curexc_value = value;
+    tstate->curexc_traceback = tb;
+    Py_XDECREF(tmp_type);
+    Py_XDECREF(tmp_value);
+    Py_XDECREF(tmp_tb);
+}
+static CYTHON_INLINE void __Pyx_ErrFetchInState(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb) {
+    *type = tstate->curexc_type;
+    *value = tstate->curexc_value;
+    *tb = tstate->curexc_traceback;
+    tstate->curexc_type = 0;
+    tstate->curexc_value = 0;
+    tstate->curexc_traceback = 0;
+}
+#endif
+
+/* RaiseException */
+#if PY_MAJOR_VERSION < 3
+static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb,
+                        CYTHON_UNUSED PyObject *cause) {
+    __Pyx_PyThreadState_declare
+    Py_XINCREF(type);
+    if (!value || value == Py_None)
+        value = NULL;
+    else
+        Py_INCREF(value);
+    if (!tb || tb == Py_None)
+        tb = NULL;
+    else {
+        Py_INCREF(tb);
+        if (!PyTraceBack_Check(tb)) {
+            PyErr_SetString(PyExc_TypeError,
+                "raise: arg 3 must be a traceback or None");
+            goto raise_error;
+        }
+    }
+    if (PyType_Check(type)) {
+#if CYTHON_COMPILING_IN_PYPY
+        if (!value) {
+            Py_INCREF(Py_None);
+            value = Py_None;
+        }
+#endif
+        PyErr_NormalizeException(&type, &value, &tb);
+    } else {
+        if (value) {
+            PyErr_SetString(PyExc_TypeError,
+                "instance exception may not have a separate value");
+            goto raise_error;
+        }
+        value = type;
+        type = (PyObject*) Py_TYPE(type);
+        Py_INCREF(type);
+        if (!PyType_IsSubtype((PyTypeObject *)type, (PyTypeObject *)PyExc_BaseException)) {
+            PyErr_SetString(PyExc_TypeError,
+                "raise: exception class must be a subclass of BaseException");
+            goto raise_error;
+        }
+    }
+    __Pyx_PyThreadState_assign
+    __Pyx_ErrRestore(type, value, tb);
+    return;
+raise_error:
+    Py_XDECREF(value);
+    Py_XDECREF(type);
+    Py_XDECREF(tb);
+    return;
+}
+#else
+static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject *cause) {
+    PyObject* owned_instance = NULL;
+    if (tb == Py_None) {
+        tb = 0;
+    } else if (tb && !PyTraceBack_Check(tb)) {
+        PyErr_SetString(PyExc_TypeError,
+            "raise: arg 3 must be a traceback or None");
+        goto bad;
+    }
+    if (value == Py_None)
+        value = 0;
+    if (PyExceptionInstance_Check(type)) {
+        if (value) {
+            PyErr_SetString(PyExc_TypeError,
+                "instance exception may not have a separate value");
+            goto bad;
+        }
+        value = type;
+        type = (PyObject*) Py_TYPE(value);
+    } else if (PyExceptionClass_Check(type)) {
+        PyObject *instance_class = NULL;
+        if (value && PyExceptionInstance_Check(value)) {
+            instance_class = (PyObject*) Py_TYPE(value);
+            if (instance_class != type) {
+                int is_subclass = PyObject_IsSubclass(instance_class, type);
+                if (!is_subclass) {
+                    instance_class = NULL;
+                } else if (unlikely(is_subclass == -1)) {
+                    goto bad;
+                } else {
+                    type = instance_class;
+                }
+            }
+        }
+        if (!instance_class) {
+            PyObject *args;
+            if (!value)
+                args = PyTuple_New(0);
+            else if (PyTuple_Check(value)) {
+                Py_INCREF(value);
+                args = value;
+            } else
+                args = PyTuple_Pack(1, value);
+            if (!args)
+                goto bad;
+            owned_instance = PyObject_Call(type, args, NULL);
+            Py_DECREF(args);
+            if (!owned_instance)
+                goto bad;
+            value = owned_instance;
+            if (!PyExceptionInstance_Check(value)) {
+                PyErr_Format(PyExc_TypeError,
+                             "calling %R should have returned an instance of "
+                             "BaseException, not %R",
+                             type, Py_TYPE(value));
+                goto bad;
+            }
+        }
+    } else {
+        PyErr_SetString(PyExc_TypeError,
+            "raise: exception class must be a subclass of BaseException");
+        goto bad;
+    }
+    if (cause) {
+        PyObject *fixed_cause;
+        if (cause == Py_None) {
+            fixed_cause = NULL;
+        } else if (PyExceptionClass_Check(cause)) {
+            fixed_cause = PyObject_CallObject(cause, NULL);
+            if (fixed_cause == NULL)
+                goto bad;
+        } else if (PyExceptionInstance_Check(cause)) {
+            fixed_cause = cause;
+            Py_INCREF(fixed_cause);
+        } else {
+            PyErr_SetString(PyExc_TypeError,
+                            "exception causes must derive from "
+                            "BaseException");
+            goto bad;
+        }
+        PyException_SetCause(value, fixed_cause);
+    }
+    PyErr_SetObject(type, value);
+    if (tb) {
+#if CYTHON_FAST_THREAD_STATE
+        PyThreadState *tstate = __Pyx_PyThreadState_Current;
+        PyObject* tmp_tb = tstate->curexc_traceback;
+        if (tb != tmp_tb) {
+            Py_INCREF(tb);
+            tstate->curexc_traceback = tb;
+            Py_XDECREF(tmp_tb);
+        }
+#else
+        PyObject *tmp_type, *tmp_value, *tmp_tb;
+        PyErr_Fetch(&tmp_type, &tmp_value, &tmp_tb);
+        Py_INCREF(tb);
+        PyErr_Restore(tmp_type, tmp_value, tb);
+        Py_XDECREF(tmp_tb);
+#endif
+    }
+bad:
+    Py_XDECREF(owned_instance);
+    return;
+}
+#endif
+
+/* PyErrExceptionMatches */
+#if CYTHON_FAST_THREAD_STATE
+static int __Pyx_PyErr_ExceptionMatchesTuple(PyObject *exc_type, PyObject *tuple) {
+    Py_ssize_t i, n;
+    n = PyTuple_GET_SIZE(tuple);
+#if PY_MAJOR_VERSION >= 3
+    for (i=0; i<n; i++) {
+        if (exc_type == PyTuple_GET_ITEM(tuple, i)) return 1;
+    }
+#endif
+    for (i=0; i<n; i++) {
+        if (__Pyx_PyErr_GivenExceptionMatches(exc_type, PyTuple_GET_ITEM(tuple, i))) return 1;
+    }
+    return 0;
+}
+static CYTHON_INLINE int __Pyx_PyErr_ExceptionMatchesInState(PyThreadState* tstate, PyObject* err) {
+    PyObject *exc_type = tstate->curexc_type;
+    if (exc_type == err) return 1;
+    if (unlikely(!exc_type)) return 0;
+    if (unlikely(PyTuple_Check(err)))
+        return __Pyx_PyErr_ExceptionMatchesTuple(exc_type, err);
+    return __Pyx_PyErr_GivenExceptionMatches(exc_type, err);
+}
+#endif
+
+/* GetAttr */
+static CYTHON_INLINE PyObject *__Pyx_GetAttr(PyObject *o, PyObject *n) {
+#if CYTHON_USE_TYPE_SLOTS
+#if PY_MAJOR_VERSION >= 3
+    if (likely(PyUnicode_Check(n)))
+#else
+    if (likely(PyString_Check(n)))
+#endif
+        return __Pyx_PyObject_GetAttrStr(o, n);
+#endif
+    return PyObject_GetAttr(o, n);
+}
+
+/* GetAttr3 */
+static PyObject *__Pyx_GetAttr3Default(PyObject *d) {
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    if (unlikely(!__Pyx_PyErr_ExceptionMatches(PyExc_AttributeError)))
+        return NULL;
+    __Pyx_PyErr_Clear();
+    Py_INCREF(d);
+    return d;
+}
+static CYTHON_INLINE PyObject *__Pyx_GetAttr3(PyObject *o, PyObject *n, PyObject *d) {
+    PyObject *r = __Pyx_GetAttr(o, n);
+    return (likely(r)) ? r : __Pyx_GetAttr3Default(d);
+}
+
+/* PyDictVersioning */
+#if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_TYPE_SLOTS
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_tp_dict_version(PyObject *obj) {
+    PyObject *dict = Py_TYPE(obj)->tp_dict;
+    return likely(dict) ? __PYX_GET_DICT_VERSION(dict) : 0;
+}
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_object_dict_version(PyObject *obj) {
+    PyObject **dictptr = NULL;
+    Py_ssize_t offset = Py_TYPE(obj)->tp_dictoffset;
+    if (offset) {
+#if CYTHON_COMPILING_IN_CPYTHON
+        dictptr = (likely(offset > 0)) ? (PyObject **) ((char *)obj + offset) : _PyObject_GetDictPtr(obj);
+#else
+        dictptr = _PyObject_GetDictPtr(obj);
+#endif
+    }
+    return (dictptr && *dictptr) ? __PYX_GET_DICT_VERSION(*dictptr) : 0;
+}
+static CYTHON_INLINE int __Pyx_object_dict_version_matches(PyObject* obj, PY_UINT64_T tp_dict_version, PY_UINT64_T obj_dict_version) {
+    PyObject *dict = Py_TYPE(obj)->tp_dict;
+    if (unlikely(!dict) || unlikely(tp_dict_version != __PYX_GET_DICT_VERSION(dict)))
+        return 0;
+    return obj_dict_version == __Pyx_get_object_dict_version(obj);
+}
+#endif
+
+/* GetModuleGlobalName */
+#if CYTHON_USE_DICT_VERSIONS
+static PyObject *__Pyx__GetModuleGlobalName(PyObject *name, PY_UINT64_T *dict_version, PyObject **dict_cached_value)
+#else
+static CYTHON_INLINE PyObject *__Pyx__GetModuleGlobalName(PyObject *name)
+#endif
+{
+    PyObject *result;
+#if !CYTHON_AVOID_BORROWED_REFS
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030500A1
+    result = _PyDict_GetItem_KnownHash(__pyx_d, name, ((PyASCIIObject *) name)->hash);
+    __PYX_UPDATE_DICT_CACHE(__pyx_d, result, *dict_cached_value, *dict_version)
+    if (likely(result)) {
+        return __Pyx_NewRef(result);
+    } else if (unlikely(PyErr_Occurred())) {
+        return NULL;
+    }
+#else
+    result = PyDict_GetItem(__pyx_d, name);
+    __PYX_UPDATE_DICT_CACHE(__pyx_d, result, *dict_cached_value, *dict_version)
+    if (likely(result)) {
+        return __Pyx_NewRef(result);
+    }
+#endif
+#else
+    result = PyObject_GetItem(__pyx_d, name);
+    __PYX_UPDATE_DICT_CACHE(__pyx_d, result, *dict_cached_value, *dict_version)
+    if (likely(result)) {
+        return __Pyx_NewRef(result);
+    }
+    PyErr_Clear();
+#endif
+    return __Pyx_GetBuiltinName(name);
+}
+
+/* PyCFunctionFastCall */
+#if CYTHON_FAST_PYCCALL
+static CYTHON_INLINE PyObject * __Pyx_PyCFunction_FastCall(PyObject *func_obj, PyObject **args, Py_ssize_t nargs) {
+    PyCFunctionObject *func = (PyCFunctionObject*)func_obj;
+    PyCFunction meth = PyCFunction_GET_FUNCTION(func);
+    PyObject *self = PyCFunction_GET_SELF(func);
+    int flags = PyCFunction_GET_FLAGS(func);
+    assert(PyCFunction_Check(func));
+    assert(METH_FASTCALL == (flags & ~(METH_CLASS | METH_STATIC | METH_COEXIST | METH_KEYWORDS | METH_STACKLESS)));
+    assert(nargs >= 0);
+    assert(nargs == 0 || args != NULL);
+    /* _PyCFunction_FastCallDict() must not be called with an exception set,
+       because it may clear it (directly or indirectly) and so the
+       caller loses its exception */
+    assert(!PyErr_Occurred());
+    if ((PY_VERSION_HEX < 0x030700A0) || unlikely(flags & METH_KEYWORDS)) {
+        return (*((__Pyx_PyCFunctionFastWithKeywords)(void*)meth)) (self, args, nargs, NULL);
+    } else {
+        return (*((__Pyx_PyCFunctionFast)(void*)meth)) (self, args, nargs);
+    }
+}
+#endif
 
-static struct PyMethodDef __pyx_methods[] = {
-  {"NO_ADAPTER_NEEDED", (PyCFunction)__pyx_f_9_speedups_NO_ADAPTER_NEEDED, METH_VARARGS|METH_KEYWORDS, __pyx_doc_9_speedups_NO_ADAPTER_NEEDED},
-  {"DOES_NOT_SUPPORT", (PyCFunction)__pyx_f_9_speedups_DOES_NOT_SUPPORT, METH_VARARGS|METH_KEYWORDS, __pyx_doc_9_speedups_DOES_NOT_SUPPORT},
-  {"adapt", (PyCFunction)__pyx_f_9_speedups_adapt, METH_VARARGS|METH_KEYWORDS, __pyx_doc_9_speedups_adapt},
-  {"Protocol__call__", (PyCFunction)__pyx_f_9_speedups_Protocol__call__, METH_VARARGS|METH_KEYWORDS, __pyx_doc_9_speedups_Protocol__call__},
-  {"classicMRO", (PyCFunction)__pyx_f_9_speedups_classicMRO, METH_VARARGS|METH_KEYWORDS, 0},
-  {"extClassMRO", (PyCFunction)__pyx_f_9_speedups_extClassMRO, METH_VARARGS|METH_KEYWORDS, 0},
-  {"getMRO", (PyCFunction)__pyx_f_9_speedups_getMRO, METH_VARARGS|METH_KEYWORDS, 0},
-  {"Protocol__adapt__", (PyCFunction)__pyx_f_9_speedups_Protocol__adapt__, METH_VARARGS|METH_KEYWORDS, 0},
-  {0, 0, 0, 0}
-};
+/* PyFunctionFastCall */
+#if CYTHON_FAST_PYCALL
+static PyObject* __Pyx_PyFunction_FastCallNoKw(PyCodeObject *co, PyObject **args, Py_ssize_t na,
+                                               PyObject *globals) {
+    PyFrameObject *f;
+    PyThreadState *tstate = __Pyx_PyThreadState_Current;
+    PyObject **fastlocals;
+    Py_ssize_t i;
+    PyObject *result;
+    assert(globals != NULL);
+    /* XXX Perhaps we should create a specialized
+       PyFrame_New() that doesn't take locals, but does
+       take builtins without sanity checking them.
+       */
+    assert(tstate != NULL);
+    f = PyFrame_New(tstate, co, globals, NULL);
+    if (f == NULL) {
+        return NULL;
+    }
+    fastlocals = __Pyx_PyFrame_GetLocalsplus(f);
+    for (i = 0; i < na; i++) {
+        Py_INCREF(*args);
+        fastlocals[i] = *args++;
+    }
+    result = PyEval_EvalFrameEx(f,0);
+    ++tstate->recursion_depth;
+    Py_DECREF(f);
+    --tstate->recursion_depth;
+    return result;
+}
+#if 1 || PY_VERSION_HEX < 0x030600B1
+static PyObject *__Pyx_PyFunction_FastCallDict(PyObject *func, PyObject **args, Py_ssize_t nargs, PyObject *kwargs) {
+    PyCodeObject *co = (PyCodeObject *)PyFunction_GET_CODE(func);
+    PyObject *globals = PyFunction_GET_GLOBALS(func);
+    PyObject *argdefs = PyFunction_GET_DEFAULTS(func);
+    PyObject *closure;
+#if PY_MAJOR_VERSION >= 3
+    PyObject *kwdefs;
+#endif
+    PyObject *kwtuple, **k;
+    PyObject **d;
+    Py_ssize_t nd;
+    Py_ssize_t nk;
+    PyObject *result;
+    assert(kwargs == NULL || PyDict_Check(kwargs));
+    nk = kwargs ? PyDict_Size(kwargs) : 0;
+    if (Py_EnterRecursiveCall((char*)" while calling a Python object")) {
+        return NULL;
+    }
+    if (
+#if PY_MAJOR_VERSION >= 3
+            co->co_kwonlyargcount == 0 &&
+#endif
+            likely(kwargs == NULL || nk == 0) &&
+            co->co_flags == (CO_OPTIMIZED | CO_NEWLOCALS | CO_NOFREE)) {
+        if (argdefs == NULL && co->co_argcount == nargs) {
+            result = __Pyx_PyFunction_FastCallNoKw(co, args, nargs, globals);
+            goto done;
+        }
+        else if (nargs == 0 && argdefs != NULL
+                 && co->co_argcount == Py_SIZE(argdefs)) {
+            /* function called with no arguments, but all parameters have
+               a default value: use default values as arguments .*/
+            args = &PyTuple_GET_ITEM(argdefs, 0);
+            result =__Pyx_PyFunction_FastCallNoKw(co, args, Py_SIZE(argdefs), globals);
+            goto done;
+        }
+    }
+    if (kwargs != NULL) {
+        Py_ssize_t pos, i;
+        kwtuple = PyTuple_New(2 * nk);
+        if (kwtuple == NULL) {
+            result = NULL;
+            goto done;
+        }
+        k = &PyTuple_GET_ITEM(kwtuple, 0);
+        pos = i = 0;
+        while (PyDict_Next(kwargs, &pos, &k[i], &k[i+1])) {
+            Py_INCREF(k[i]);
+            Py_INCREF(k[i+1]);
+            i += 2;
+        }
+        nk = i / 2;
+    }
+    else {
+        kwtuple = NULL;
+        k = NULL;
+    }
+    closure = PyFunction_GET_CLOSURE(func);
+#if PY_MAJOR_VERSION >= 3
+    kwdefs = PyFunction_GET_KW_DEFAULTS(func);
+#endif
+    if (argdefs != NULL) {
+        d = &PyTuple_GET_ITEM(argdefs, 0);
+        nd = Py_SIZE(argdefs);
+    }
+    else {
+        d = NULL;
+        nd = 0;
+    }
+#if PY_MAJOR_VERSION >= 3
+    result = PyEval_EvalCodeEx((PyObject*)co, globals, (PyObject *)NULL,
+                               args, (int)nargs,
+                               k, (int)nk,
+                               d, (int)nd, kwdefs, closure);
+#else
+    result = PyEval_EvalCodeEx(co, globals, (PyObject *)NULL,
+                               args, (int)nargs,
+                               k, (int)nk,
+                               d, (int)nd, closure);
+#endif
+    Py_XDECREF(kwtuple);
+done:
+    Py_LeaveRecursiveCall();
+    return result;
+}
+#endif
+#endif
 
-static void __pyx_init_filenames(void); /*proto*/
-
-PyMODINIT_FUNC init_speedups(void); /*proto*/
-PyMODINIT_FUNC init_speedups(void) {
-  PyObject *__pyx_1 = 0;
-  PyObject *__pyx_2 = 0;
-  int __pyx_3;
-  PyObject *__pyx_4 = 0;
-  __pyx_init_filenames();
-  __pyx_m = Py_InitModule4("_speedups", __pyx_methods, __pyx_mdoc, 0, PYTHON_API_VERSION);
-  if (!__pyx_m) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; goto __pyx_L1;};
-  __pyx_b = PyImport_AddModule("__builtin__");
-  if (!__pyx_b) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; goto __pyx_L1;};
-  if (PyObject_SetAttrString(__pyx_m, "__builtins__", __pyx_b) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; goto __pyx_L1;};
-  if (__Pyx_InternStrings(__pyx_intern_tab) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; goto __pyx_L1;};
-  if (__Pyx_InitStrings(__pyx_string_tab) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; goto __pyx_L1;};
-  __pyx_v_9_speedups__marker = Py_None; Py_INCREF(Py_None);
-  __pyx_v_9_speedups___conform = Py_None; Py_INCREF(Py_None);
-  __pyx_v_9_speedups___adapt = Py_None; Py_INCREF(Py_None);
-  __pyx_v_9_speedups___mro = Py_None; Py_INCREF(Py_None);
-  __pyx_v_9_speedups___ECType = Py_None; Py_INCREF(Py_None);
-  __pyx_type_9_speedups_metamethod.tp_free = _PyObject_GC_Del;
-  if (PyType_Ready(&__pyx_type_9_speedups_metamethod) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 94; goto __pyx_L1;}
-  if (PyObject_SetAttrString(__pyx_m, "metamethod", (PyObject *)&__pyx_type_9_speedups_metamethod) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 94; goto __pyx_L1;}
-  __pyx_ptype_9_speedups_metamethod = &__pyx_type_9_speedups_metamethod;
-
-  /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":3 */
-  __pyx_1 = PyList_New(8); if (!__pyx_1) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 3; goto __pyx_L1;}
-  Py_INCREF(__pyx_n_NO_ADAPTER_NEEDED);
-  PyList_SET_ITEM(__pyx_1, 0, __pyx_n_NO_ADAPTER_NEEDED);
-  Py_INCREF(__pyx_n_DOES_NOT_SUPPORT);
-  PyList_SET_ITEM(__pyx_1, 1, __pyx_n_DOES_NOT_SUPPORT);
-  Py_INCREF(__pyx_n_adapt);
-  PyList_SET_ITEM(__pyx_1, 2, __pyx_n_adapt);
-  Py_INCREF(__pyx_n_Protocol__adapt__);
-  PyList_SET_ITEM(__pyx_1, 3, __pyx_n_Protocol__adapt__);
-  Py_INCREF(__pyx_n_metamethod);
-  PyList_SET_ITEM(__pyx_1, 4, __pyx_n_metamethod);
-  Py_INCREF(__pyx_n_classicMRO);
-  PyList_SET_ITEM(__pyx_1, 5, __pyx_n_classicMRO);
-  Py_INCREF(__pyx_n_getMRO);
-  PyList_SET_ITEM(__pyx_1, 6, __pyx_n_getMRO);
-  Py_INCREF(__pyx_n_Protocol__call__);
-  PyList_SET_ITEM(__pyx_1, 7, __pyx_n_Protocol__call__);
-  if (PyObject_SetAttr(__pyx_m, __pyx_n___all__, __pyx_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 3; goto __pyx_L1;}
-  Py_DECREF(__pyx_1); __pyx_1 = 0;
-
-  /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":64 */
-  __pyx_1 = PyList_New(1); if (!__pyx_1) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 64; goto __pyx_L1;}
-  Py_INCREF(__pyx_n_exc_info);
-  PyList_SET_ITEM(__pyx_1, 0, __pyx_n_exc_info);
-  __pyx_2 = __Pyx_Import(__pyx_n_sys, __pyx_1); if (!__pyx_2) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 64; goto __pyx_L1;}
-  Py_DECREF(__pyx_1); __pyx_1 = 0;
-  __pyx_1 = PyObject_GetAttr(__pyx_2, __pyx_n_exc_info); if (!__pyx_1) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 64; goto __pyx_L1;}
-  if (PyObject_SetAttr(__pyx_m, __pyx_n_exc_info, __pyx_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 64; goto __pyx_L1;}
-  Py_DECREF(__pyx_1); __pyx_1 = 0;
-  Py_DECREF(__pyx_2); __pyx_2 = 0;
-
-  /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":65 */
-  __pyx_2 = PyList_New(1); if (!__pyx_2) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 65; goto __pyx_L1;}
-  Py_INCREF(__pyx_n_AdaptationFailure);
-  PyList_SET_ITEM(__pyx_2, 0, __pyx_n_AdaptationFailure);
-  __pyx_1 = __Pyx_Import(__pyx_k11p, __pyx_2); if (!__pyx_1) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 65; goto __pyx_L1;}
-  Py_DECREF(__pyx_2); __pyx_2 = 0;
-  __pyx_2 = PyObject_GetAttr(__pyx_1, __pyx_n_AdaptationFailure); if (!__pyx_2) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 65; goto __pyx_L1;}
-  if (PyObject_SetAttr(__pyx_m, __pyx_n_AdaptationFailure, __pyx_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 65; goto __pyx_L1;}
-  Py_DECREF(__pyx_2); __pyx_2 = 0;
-  Py_DECREF(__pyx_1); __pyx_1 = 0;
-
-  /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":67 */
-  /*try:*/ {
-
-    /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":68 */
-    __pyx_1 = PyList_New(1); if (!__pyx_1) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 68; goto __pyx_L17;}
-    Py_INCREF(__pyx_n_ExtensionClass);
-    PyList_SET_ITEM(__pyx_1, 0, __pyx_n_ExtensionClass);
-    __pyx_2 = __Pyx_Import(__pyx_n_ExtensionClass, __pyx_1); if (!__pyx_2) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 68; goto __pyx_L17;}
-    Py_DECREF(__pyx_1); __pyx_1 = 0;
-    __pyx_1 = PyObject_GetAttr(__pyx_2, __pyx_n_ExtensionClass); if (!__pyx_1) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 68; goto __pyx_L17;}
-    if (PyObject_SetAttr(__pyx_m, __pyx_n_ExtensionClass, __pyx_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 68; goto __pyx_L17;}
-    Py_DECREF(__pyx_1); __pyx_1 = 0;
-    Py_DECREF(__pyx_2); __pyx_2 = 0;
-
-    /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":69 */
-    __pyx_2 = __Pyx_GetName(__pyx_m, __pyx_n_ExtensionClass); if (!__pyx_2) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 69; goto __pyx_L17;}
-    Py_DECREF(__pyx_v_9_speedups___ECType);
-    __pyx_v_9_speedups___ECType = __pyx_2;
-    __pyx_2 = 0;
-  }
-  goto __pyx_L18;
-  __pyx_L17:;
-  Py_XDECREF(__pyx_1); __pyx_1 = 0;
-  Py_XDECREF(__pyx_2); __pyx_2 = 0;
-
-  /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":70 */
-  __pyx_1 = __Pyx_GetName(__pyx_b, __pyx_n_ImportError); if (!__pyx_1) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 70; goto __pyx_L1;}
-  __pyx_3 = PyErr_ExceptionMatches(__pyx_1);
-  Py_DECREF(__pyx_1); __pyx_1 = 0;
-  if (__pyx_3) {
-    __Pyx_AddTraceback("_speedups");
-    __pyx_2 = __Pyx_GetExcValue(); if (!__pyx_2) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 70; goto __pyx_L1;}
-    Py_DECREF(__pyx_2); __pyx_2 = 0;
-
-    /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":71 */
-    __pyx_1 = __Pyx_GetName(__pyx_b, __pyx_n_object); if (!__pyx_1) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 71; goto __pyx_L1;}
-    __pyx_2 = PyObject_Type(__pyx_1); if (!__pyx_2) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 71; goto __pyx_L1;}
-    Py_DECREF(__pyx_1); __pyx_1 = 0;
-    Py_DECREF(__pyx_v_9_speedups___ECType);
-    __pyx_v_9_speedups___ECType = __pyx_2;
-    __pyx_2 = 0;
-    goto __pyx_L18;
-  }
-  goto __pyx_L1;
-  __pyx_L18:;
-
-  /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":73 */
-  __pyx_1 = __Pyx_GetName(__pyx_b, __pyx_n_object); if (!__pyx_1) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 73; goto __pyx_L1;}
-  __pyx_2 = PyObject_CallObject(__pyx_1, 0); if (!__pyx_2) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 73; goto __pyx_L1;}
-  Py_DECREF(__pyx_1); __pyx_1 = 0;
-  Py_DECREF(__pyx_v_9_speedups__marker);
-  __pyx_v_9_speedups__marker = __pyx_2;
-  __pyx_2 = 0;
-
-  /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":74 */
-  __pyx_1 = PyString_InternFromString(__pyx_k15); if (!__pyx_1) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 74; goto __pyx_L1;}
-  Py_DECREF(__pyx_v_9_speedups___conform);
-  __pyx_v_9_speedups___conform = __pyx_1;
-  __pyx_1 = 0;
-
-  /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":75 */
-  __pyx_2 = PyString_InternFromString(__pyx_k16); if (!__pyx_2) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 75; goto __pyx_L1;}
-  Py_DECREF(__pyx_v_9_speedups___adapt);
-  __pyx_v_9_speedups___adapt = __pyx_2;
-  __pyx_2 = 0;
-
-  /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":76 */
-  __pyx_1 = PyString_InternFromString(__pyx_k17); if (!__pyx_1) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 76; goto __pyx_L1;}
-  if (PyObject_SetAttr(__pyx_m, __pyx_n___class, __pyx_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 76; goto __pyx_L1;}
-  Py_DECREF(__pyx_1); __pyx_1 = 0;
-
-  /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":77 */
-  __pyx_2 = PyString_InternFromString(__pyx_k18); if (!__pyx_2) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 77; goto __pyx_L1;}
-  Py_DECREF(__pyx_v_9_speedups___mro);
-  __pyx_v_9_speedups___mro = __pyx_2;
-  __pyx_2 = 0;
-
-  /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":85 */
-  Py_INCREF(Py_None);
-  __pyx_k19 = Py_None;
-
-  /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":89 */
-  Py_INCREF(Py_None);
-  __pyx_k20 = Py_None;
-
-  /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":188 */
-  Py_INCREF(__pyx_v_9_speedups__marker);
-  __pyx_k21 = __pyx_v_9_speedups__marker;
-
-  /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":196 */
-  Py_INCREF(__pyx_v_9_speedups__marker);
-  __pyx_k22 = __pyx_v_9_speedups__marker;
-
-  /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":220 */
-  __pyx_1 = __Pyx_GetName(__pyx_b, __pyx_n_False); if (!__pyx_1) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 220; goto __pyx_L1;}
-  __pyx_k23 = __pyx_1;
-  __pyx_1 = 0;
-
-  /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":253 */
-  __pyx_2 = __Pyx_GetName(__pyx_b, __pyx_n_False); if (!__pyx_2) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 253; goto __pyx_L1;}
-  __pyx_k24 = __pyx_2;
-  __pyx_2 = 0;
-
-  /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":263 */
-  __pyx_4 = __Pyx_GetName(__pyx_b, __pyx_n_False); if (!__pyx_4) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 263; goto __pyx_L1;}
-  __pyx_k25 = __pyx_4;
-  __pyx_4 = 0;
-
-  /* "/home/pje/projects/PyProtocols/src/protocols/_speedups.pyx":288 */
-  return;
-  __pyx_L1:;
-  Py_XDECREF(__pyx_1);
-  Py_XDECREF(__pyx_2);
-  Py_XDECREF(__pyx_4);
-  __Pyx_AddTraceback("_speedups");
+/* PyObjectCall2Args */
+static CYTHON_UNUSED PyObject* __Pyx_PyObject_Call2Args(PyObject* function, PyObject* arg1, PyObject* arg2) {
+    PyObject *args, *result = NULL;
+    #if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(function)) {
+        PyObject *args[2] = {arg1, arg2};
+        return __Pyx_PyFunction_FastCall(function, args, 2);
+    }
+    #endif
+    #if CYTHON_FAST_PYCCALL
+    if (__Pyx_PyFastCFunction_Check(function)) {
+        PyObject *args[2] = {arg1, arg2};
+        return __Pyx_PyCFunction_FastCall(function, args, 2);
+    }
+    #endif
+    args = PyTuple_New(2);
+    if (unlikely(!args)) goto done;
+    Py_INCREF(arg1);
+    PyTuple_SET_ITEM(args, 0, arg1);
+    Py_INCREF(arg2);
+    PyTuple_SET_ITEM(args, 1, arg2);
+    Py_INCREF(function);
+    result = __Pyx_PyObject_Call(function, args, NULL);
+    Py_DECREF(args);
+    Py_DECREF(function);
+done:
+    return result;
 }
 
-static char *__pyx_filenames[] = {
-  "_speedups.pyx",
-};
+/* PyObjectCallMethO */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallMethO(PyObject *func, PyObject *arg) {
+    PyObject *self, *result;
+    PyCFunction cfunc;
+    cfunc = PyCFunction_GET_FUNCTION(func);
+    self = PyCFunction_GET_SELF(func);
+    if (unlikely(Py_EnterRecursiveCall((char*)" while calling a Python object")))
+        return NULL;
+    result = cfunc(self, arg);
+    Py_LeaveRecursiveCall();
+    if (unlikely(!result) && unlikely(!PyErr_Occurred())) {
+        PyErr_SetString(
+            PyExc_SystemError,
+            "NULL result without error in PyObject_Call");
+    }
+    return result;
+}
+#endif
+
+/* PyObjectCallOneArg */
+#if CYTHON_COMPILING_IN_CPYTHON
+static PyObject* __Pyx__PyObject_CallOneArg(PyObject *func, PyObject *arg) {
+    PyObject *result;
+    PyObject *args = PyTuple_New(1);
+    if (unlikely(!args)) return NULL;
+    Py_INCREF(arg);
+    PyTuple_SET_ITEM(args, 0, arg);
+    result = __Pyx_PyObject_Call(func, args, NULL);
+    Py_DECREF(args);
+    return result;
+}
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObject *arg) {
+#if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(func)) {
+        return __Pyx_PyFunction_FastCall(func, &arg, 1);
+    }
+#endif
+    if (likely(PyCFunction_Check(func))) {
+        if (likely(PyCFunction_GET_FLAGS(func) & METH_O)) {
+            return __Pyx_PyObject_CallMethO(func, arg);
+#if CYTHON_FAST_PYCCALL
+        } else if (__Pyx_PyFastCFunction_Check(func)) {
+            return __Pyx_PyCFunction_FastCall(func, &arg, 1);
+#endif
+        }
+    }
+    return __Pyx__PyObject_CallOneArg(func, arg);
+}
+#else
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObject *arg) {
+    PyObject *result;
+    PyObject *args = PyTuple_Pack(1, arg);
+    if (unlikely(!args)) return NULL;
+    result = __Pyx_PyObject_Call(func, args, NULL);
+    Py_DECREF(args);
+    return result;
+}
+#endif
+
+/* GetItemInt */
+static PyObject *__Pyx_GetItemInt_Generic(PyObject *o, PyObject* j) {
+    PyObject *r;
+    if (!j) return NULL;
+    r = PyObject_GetItem(o, j);
+    Py_DECREF(j);
+    return r;
+}
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_List_Fast(PyObject *o, Py_ssize_t i,
+                                                              CYTHON_NCP_UNUSED int wraparound,
+                                                              CYTHON_NCP_UNUSED int boundscheck) {
+#if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+    Py_ssize_t wrapped_i = i;
+    if (wraparound & unlikely(i < 0)) {
+        wrapped_i += PyList_GET_SIZE(o);
+    }
+    if ((!boundscheck) || likely(__Pyx_is_valid_index(wrapped_i, PyList_GET_SIZE(o)))) {
+        PyObject *r = PyList_GET_ITEM(o, wrapped_i);
+        Py_INCREF(r);
+        return r;
+    }
+    return __Pyx_GetItemInt_Generic(o, PyInt_FromSsize_t(i));
+#else
+    return PySequence_GetItem(o, i);
+#endif
+}
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Tuple_Fast(PyObject *o, Py_ssize_t i,
+                                                              CYTHON_NCP_UNUSED int wraparound,
+                                                              CYTHON_NCP_UNUSED int boundscheck) {
+#if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+    Py_ssize_t wrapped_i = i;
+    if (wraparound & unlikely(i < 0)) {
+        wrapped_i += PyTuple_GET_SIZE(o);
+    }
+    if ((!boundscheck) || likely(__Pyx_is_valid_index(wrapped_i, PyTuple_GET_SIZE(o)))) {
+        PyObject *r = PyTuple_GET_ITEM(o, wrapped_i);
+        Py_INCREF(r);
+        return r;
+    }
+    return __Pyx_GetItemInt_Generic(o, PyInt_FromSsize_t(i));
+#else
+    return PySequence_GetItem(o, i);
+#endif
+}
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Fast(PyObject *o, Py_ssize_t i, int is_list,
+                                                     CYTHON_NCP_UNUSED int wraparound,
+                                                     CYTHON_NCP_UNUSED int boundscheck) {
+#if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS && CYTHON_USE_TYPE_SLOTS
+    if (is_list || PyList_CheckExact(o)) {
+        Py_ssize_t n = ((!wraparound) | likely(i >= 0)) ? i : i + PyList_GET_SIZE(o);
+        if ((!boundscheck) || (likely(__Pyx_is_valid_index(n, PyList_GET_SIZE(o))))) {
+            PyObject *r = PyList_GET_ITEM(o, n);
+            Py_INCREF(r);
+            return r;
+        }
+    }
+    else if (PyTuple_CheckExact(o)) {
+        Py_ssize_t n = ((!wraparound) | likely(i >= 0)) ? i : i + PyTuple_GET_SIZE(o);
+        if ((!boundscheck) || likely(__Pyx_is_valid_index(n, PyTuple_GET_SIZE(o)))) {
+            PyObject *r = PyTuple_GET_ITEM(o, n);
+            Py_INCREF(r);
+            return r;
+        }
+    } else {
+        PySequenceMethods *m = Py_TYPE(o)->tp_as_sequence;
+        if (likely(m && m->sq_item)) {
+            if (wraparound && unlikely(i < 0) && likely(m->sq_length)) {
+                Py_ssize_t l = m->sq_length(o);
+                if (likely(l >= 0)) {
+                    i += l;
+                } else {
+                    if (!PyErr_ExceptionMatches(PyExc_OverflowError))
+                        return NULL;
+                    PyErr_Clear();
+                }
+            }
+            return m->sq_item(o, i);
+        }
+    }
+#else
+    if (is_list || PySequence_Check(o)) {
+        return PySequence_GetItem(o, i);
+    }
+#endif
+    return __Pyx_GetItemInt_Generic(o, PyInt_FromSsize_t(i));
+}
+
+/* ObjectGetItem */
+#if CYTHON_USE_TYPE_SLOTS
+static PyObject *__Pyx_PyObject_GetIndex(PyObject *obj, PyObject* index) {
+    PyObject *runerr = NULL;
+    Py_ssize_t key_value;
+    PySequenceMethods *m = Py_TYPE(obj)->tp_as_sequence;
+    if (unlikely(!(m && m->sq_item))) {
+        PyErr_Format(PyExc_TypeError, "'%.200s' object is not subscriptable", Py_TYPE(obj)->tp_name);
+        return NULL;
+    }
+    key_value = __Pyx_PyIndex_AsSsize_t(index);
+    if (likely(key_value != -1 || !(runerr = PyErr_Occurred()))) {
+        return __Pyx_GetItemInt_Fast(obj, key_value, 0, 1, 1);
+    }
+    if (PyErr_GivenExceptionMatches(runerr, PyExc_OverflowError)) {
+        PyErr_Clear();
+        PyErr_Format(PyExc_IndexError, "cannot fit '%.200s' into an index-sized integer", Py_TYPE(index)->tp_name);
+    }
+    return NULL;
+}
+static PyObject *__Pyx_PyObject_GetItem(PyObject *obj, PyObject* key) {
+    PyMappingMethods *m = Py_TYPE(obj)->tp_as_mapping;
+    if (likely(m && m->mp_subscript)) {
+        return m->mp_subscript(obj, key);
+    }
+    return __Pyx_PyObject_GetIndex(obj, key);
+}
+#endif
+
+/* GetTopmostException */
+#if CYTHON_USE_EXC_INFO_STACK
+static _PyErr_StackItem *
+__Pyx_PyErr_GetTopmostException(PyThreadState *tstate)
+{
+    _PyErr_StackItem *exc_info = tstate->exc_info;
+    while ((exc_info->exc_type == NULL || exc_info->exc_type == Py_None) &&
+           exc_info->previous_item != NULL)
+    {
+        exc_info = exc_info->previous_item;
+    }
+    return exc_info;
+}
+#endif
+
+/* SaveResetException */
+#if CYTHON_FAST_THREAD_STATE
+static CYTHON_INLINE void __Pyx__ExceptionSave(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb) {
+    #if CYTHON_USE_EXC_INFO_STACK
+    _PyErr_StackItem *exc_info = __Pyx_PyErr_GetTopmostException(tstate);
+    *type = exc_info->exc_type;
+    *value = exc_info->exc_value;
+    *tb = exc_info->exc_traceback;
+    #else
+    *type = tstate->exc_type;
+    *value = tstate->exc_value;
+    *tb = tstate->exc_traceback;
+    #endif
+    Py_XINCREF(*type);
+    Py_XINCREF(*value);
+    Py_XINCREF(*tb);
+}
+static CYTHON_INLINE void __Pyx__ExceptionReset(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb) {
+    PyObject *tmp_type, *tmp_value, *tmp_tb;
+    #if CYTHON_USE_EXC_INFO_STACK
+    _PyErr_StackItem *exc_info = tstate->exc_info;
+    tmp_type = exc_info->exc_type;
+    tmp_value = exc_info->exc_value;
+    tmp_tb = exc_info->exc_traceback;
+    exc_info->exc_type = type;
+    exc_info->exc_value = value;
+    exc_info->exc_traceback = tb;
+    #else
+    tmp_type = tstate->exc_type;
+    tmp_value = tstate->exc_value;
+    tmp_tb = tstate->exc_traceback;
+    tstate->exc_type = type;
+    tstate->exc_value = value;
+    tstate->exc_traceback = tb;
+    #endif
+    Py_XDECREF(tmp_type);
+    Py_XDECREF(tmp_value);
+    Py_XDECREF(tmp_tb);
+}
+#endif
+
+/* GetException */
+#if CYTHON_FAST_THREAD_STATE
+static int __Pyx__GetException(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb)
+#else
+static int __Pyx_GetException(PyObject **type, PyObject **value, PyObject **tb)
+#endif
+{
+    PyObject *local_type, *local_value, *local_tb;
+#if CYTHON_FAST_THREAD_STATE
+    PyObject *tmp_type, *tmp_value, *tmp_tb;
+    local_type = tstate->curexc_type;
+    local_value = tstate->curexc_value;
+    local_tb = tstate->curexc_traceback;
+    tstate->curexc_type = 0;
+    tstate->curexc_value = 0;
+    tstate->curexc_traceback = 0;
+#else
+    PyErr_Fetch(&local_type, &local_value, &local_tb);
+#endif
+    PyErr_NormalizeException(&local_type, &local_value, &local_tb);
+#if CYTHON_FAST_THREAD_STATE
+    if (unlikely(tstate->curexc_type))
+#else
+    if (unlikely(PyErr_Occurred()))
+#endif
+        goto bad;
+    #if PY_MAJOR_VERSION >= 3
+    if (local_tb) {
+        if (unlikely(PyException_SetTraceback(local_value, local_tb) < 0))
+            goto bad;
+    }
+    #endif
+    Py_XINCREF(local_tb);
+    Py_XINCREF(local_type);
+    Py_XINCREF(local_value);
+    *type = local_type;
+    *value = local_value;
+    *tb = local_tb;
+#if CYTHON_FAST_THREAD_STATE
+    #if CYTHON_USE_EXC_INFO_STACK
+    {
+        _PyErr_StackItem *exc_info = tstate->exc_info;
+        tmp_type = exc_info->exc_type;
+        tmp_value = exc_info->exc_value;
+        tmp_tb = exc_info->exc_traceback;
+        exc_info->exc_type = local_type;
+        exc_info->exc_value = local_value;
+        exc_info->exc_traceback = local_tb;
+    }
+    #else
+    tmp_type = tstate->exc_type;
+    tmp_value = tstate->exc_value;
+    tmp_tb = tstate->exc_traceback;
+    tstate->exc_type = local_type;
+    tstate->exc_value = local_value;
+    tstate->exc_traceback = local_tb;
+    #endif
+    Py_XDECREF(tmp_type);
+    Py_XDECREF(tmp_value);
+    Py_XDECREF(tmp_tb);
+#else
+    PyErr_SetExcInfo(local_type, local_value, local_tb);
+#endif
+    return 0;
+bad:
+    *type = 0;
+    *value = 0;
+    *tb = 0;
+    Py_XDECREF(local_type);
+    Py_XDECREF(local_value);
+    Py_XDECREF(local_tb);
+    return -1;
+}
+
+/* ExtTypeTest */
+static CYTHON_INLINE int __Pyx_TypeTest(PyObject *obj, PyTypeObject *type) {
+    if (unlikely(!type)) {
+        PyErr_SetString(PyExc_SystemError, "Missing type object");
+        return 0;
+    }
+    if (likely(__Pyx_TypeCheck(obj, type)))
+        return 1;
+    PyErr_Format(PyExc_TypeError, "Cannot convert %.200s to %.200s",
+                 Py_TYPE(obj)->tp_name, type->tp_name);
+    return 0;
+}
+
+/* PyObjectCallNoArg */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallNoArg(PyObject *func) {
+#if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(func)) {
+        return __Pyx_PyFunction_FastCall(func, NULL, 0);
+    }
+#endif
+#if defined(__Pyx_CyFunction_USED) && defined(NDEBUG)
+    if (likely(PyCFunction_Check(func) || __Pyx_CyFunction_Check(func)))
+#else
+    if (likely(PyCFunction_Check(func)))
+#endif
+    {
+        if (likely(PyCFunction_GET_FLAGS(func) & METH_NOARGS)) {
+            return __Pyx_PyObject_CallMethO(func, NULL);
+        }
+    }
+    return __Pyx_PyObject_Call(func, __pyx_empty_tuple, NULL);
+}
+#endif
+
+/* SliceObject */
+static CYTHON_INLINE int __Pyx_PyObject_SetSlice(PyObject* obj, PyObject* value,
+        Py_ssize_t cstart, Py_ssize_t cstop,
+        PyObject** _py_start, PyObject** _py_stop, PyObject** _py_slice,
+        int has_cstart, int has_cstop, CYTHON_UNUSED int wraparound) {
+#if CYTHON_USE_TYPE_SLOTS
+    PyMappingMethods* mp;
+#if PY_MAJOR_VERSION < 3
+    PySequenceMethods* ms = Py_TYPE(obj)->tp_as_sequence;
+    if (likely(ms && ms->sq_ass_slice)) {
+        if (!has_cstart) {
+            if (_py_start && (*_py_start != Py_None)) {
+                cstart = __Pyx_PyIndex_AsSsize_t(*_py_start);
+                if ((cstart == (Py_ssize_t)-1) && PyErr_Occurred()) goto bad;
+            } else
+                cstart = 0;
+        }
+        if (!has_cstop) {
+            if (_py_stop && (*_py_stop != Py_None)) {
+                cstop = __Pyx_PyIndex_AsSsize_t(*_py_stop);
+                if ((cstop == (Py_ssize_t)-1) && PyErr_Occurred()) goto bad;
+            } else
+                cstop = PY_SSIZE_T_MAX;
+        }
+        if (wraparound && unlikely((cstart < 0) | (cstop < 0)) && likely(ms->sq_length)) {
+            Py_ssize_t l = ms->sq_length(obj);
+            if (likely(l >= 0)) {
+                if (cstop < 0) {
+                    cstop += l;
+                    if (cstop < 0) cstop = 0;
+                }
+                if (cstart < 0) {
+                    cstart += l;
+                    if (cstart < 0) cstart = 0;
+                }
+            } else {
+                if (!PyErr_ExceptionMatches(PyExc_OverflowError))
+                    goto bad;
+                PyErr_Clear();
+            }
+        }
+        return ms->sq_ass_slice(obj, cstart, cstop, value);
+    }
+#endif
+    mp = Py_TYPE(obj)->tp_as_mapping;
+    if (likely(mp && mp->mp_ass_subscript))
+#endif
+    {
+        int result;
+        PyObject *py_slice, *py_start, *py_stop;
+        if (_py_slice) {
+            py_slice = *_py_slice;
+        } else {
+            PyObject* owned_start = NULL;
+            PyObject* owned_stop = NULL;
+            if (_py_start) {
+                py_start = *_py_start;
+            } else {
+                if (has_cstart) {
+                    owned_start = py_start = PyInt_FromSsize_t(cstart);
+                    if (unlikely(!py_start)) goto bad;
+                } else
+                    py_start = Py_None;
+            }
+            if (_py_stop) {
+                py_stop = *_py_stop;
+            } else {
+                if (has_cstop) {
+                    owned_stop = py_stop = PyInt_FromSsize_t(cstop);
+                    if (unlikely(!py_stop)) {
+                        Py_XDECREF(owned_start);
+                        goto bad;
+                    }
+                } else
+                    py_stop = Py_None;
+            }
+            py_slice = PySlice_New(py_start, py_stop, Py_None);
+            Py_XDECREF(owned_start);
+            Py_XDECREF(owned_stop);
+            if (unlikely(!py_slice)) goto bad;
+        }
+#if CYTHON_USE_TYPE_SLOTS
+        result = mp->mp_ass_subscript(obj, py_slice, value);
+#else
+        result = value ? PyObject_SetItem(obj, py_slice, value) : PyObject_DelItem(obj, py_slice);
+#endif
+        if (!_py_slice) {
+            Py_DECREF(py_slice);
+        }
+        return result;
+    }
+    PyErr_Format(PyExc_TypeError,
+        "'%.200s' object does not support slice %.10s",
+        Py_TYPE(obj)->tp_name, value ? "assignment" : "deletion");
+bad:
+    return -1;
+}
+
+/* DictGetItem */
+#if PY_MAJOR_VERSION >= 3 && !CYTHON_COMPILING_IN_PYPY
+static PyObject *__Pyx_PyDict_GetItem(PyObject *d, PyObject* key) {
+    PyObject *value;
+    value = PyDict_GetItemWithError(d, key);
+    if (unlikely(!value)) {
+        if (!PyErr_Occurred()) {
+            if (unlikely(PyTuple_Check(key))) {
+                PyObject* args = PyTuple_Pack(1, key);
+                if (likely(args)) {
+                    PyErr_SetObject(PyExc_KeyError, args);
+                    Py_DECREF(args);
+                }
+            } else {
+                PyErr_SetObject(PyExc_KeyError, key);
+            }
+        }
+        return NULL;
+    }
+    Py_INCREF(value);
+    return value;
+}
+#endif
+
+/* SliceTupleAndList */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE void __Pyx_crop_slice(Py_ssize_t* _start, Py_ssize_t* _stop, Py_ssize_t* _length) {
+    Py_ssize_t start = *_start, stop = *_stop, length = *_length;
+    if (start < 0) {
+        start += length;
+        if (start < 0)
+            start = 0;
+    }
+    if (stop < 0)
+        stop += length;
+    else if (stop > length)
+        stop = length;
+    *_length = stop - start;
+    *_start = start;
+    *_stop = stop;
+}
+static CYTHON_INLINE void __Pyx_copy_object_array(PyObject** CYTHON_RESTRICT src, PyObject** CYTHON_RESTRICT dest, Py_ssize_t length) {
+    PyObject *v;
+    Py_ssize_t i;
+    for (i = 0; i < length; i++) {
+        v = dest[i] = src[i];
+        Py_INCREF(v);
+    }
+}
+static CYTHON_INLINE PyObject* __Pyx_PyList_GetSlice(
+            PyObject* src, Py_ssize_t start, Py_ssize_t stop) {
+    PyObject* dest;
+    Py_ssize_t length = PyList_GET_SIZE(src);
+    __Pyx_crop_slice(&start, &stop, &length);
+    if (unlikely(length <= 0))
+        return PyList_New(0);
+    dest = PyList_New(length);
+    if (unlikely(!dest))
+        return NULL;
+    __Pyx_copy_object_array(
+        ((PyListObject*)src)->ob_item + start,
+        ((PyListObject*)dest)->ob_item,
+        length);
+    return dest;
+}
+static CYTHON_INLINE PyObject* __Pyx_PyTuple_GetSlice(
+            PyObject* src, Py_ssize_t start, Py_ssize_t stop) {
+    PyObject* dest;
+    Py_ssize_t length = PyTuple_GET_SIZE(src);
+    __Pyx_crop_slice(&start, &stop, &length);
+    if (unlikely(length <= 0))
+        return PyTuple_New(0);
+    dest = PyTuple_New(length);
+    if (unlikely(!dest))
+        return NULL;
+    __Pyx_copy_object_array(
+        ((PyTupleObject*)src)->ob_item + start,
+        ((PyTupleObject*)dest)->ob_item,
+        length);
+    return dest;
+}
+#endif
+
+/* WriteUnraisableException */
+static void __Pyx_WriteUnraisable(const char *name, CYTHON_UNUSED int clineno,
+                                  CYTHON_UNUSED int lineno, CYTHON_UNUSED const char *filename,
+                                  int full_traceback, CYTHON_UNUSED int nogil) {
+    PyObject *old_exc, *old_val, *old_tb;
+    PyObject *ctx;
+    __Pyx_PyThreadState_declare
+#ifdef WITH_THREAD
+    PyGILState_STATE state;
+    if (nogil)
+        state = PyGILState_Ensure();
+    else state = (PyGILState_STATE)0;
+#endif
+    __Pyx_PyThreadState_assign
+    __Pyx_ErrFetch(&old_exc, &old_val, &old_tb);
+    if (full_traceback) {
+        Py_XINCREF(old_exc);
+        Py_XINCREF(old_val);
+        Py_XINCREF(old_tb);
+        __Pyx_ErrRestore(old_exc, old_val, old_tb);
+        PyErr_PrintEx(1);
+    }
+    #if PY_MAJOR_VERSION < 3
+    ctx = PyString_FromString(name);
+    #else
+    ctx = PyUnicode_FromString(name);
+    #endif
+    __Pyx_ErrRestore(old_exc, old_val, old_tb);
+    if (!ctx) {
+        PyErr_WriteUnraisable(Py_None);
+    } else {
+        PyErr_WriteUnraisable(ctx);
+        Py_DECREF(ctx);
+    }
+#ifdef WITH_THREAD
+    if (nogil)
+        PyGILState_Release(state);
+#endif
+}
+
+/* SliceObject */
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetSlice(PyObject* obj,
+        Py_ssize_t cstart, Py_ssize_t cstop,
+        PyObject** _py_start, PyObject** _py_stop, PyObject** _py_slice,
+        int has_cstart, int has_cstop, CYTHON_UNUSED int wraparound) {
+#if CYTHON_USE_TYPE_SLOTS
+    PyMappingMethods* mp;
+#if PY_MAJOR_VERSION < 3
+    PySequenceMethods* ms = Py_TYPE(obj)->tp_as_sequence;
+    if (likely(ms && ms->sq_slice)) {
+        if (!has_cstart) {
+            if (_py_start && (*_py_start != Py_None)) {
+                cstart = __Pyx_PyIndex_AsSsize_t(*_py_start);
+                if ((cstart == (Py_ssize_t)-1) && PyErr_Occurred()) goto bad;
+            } else
+                cstart = 0;
+        }
+        if (!has_cstop) {
+            if (_py_stop && (*_py_stop != Py_None)) {
+                cstop = __Pyx_PyIndex_AsSsize_t(*_py_stop);
+                if ((cstop == (Py_ssize_t)-1) && PyErr_Occurred()) goto bad;
+            } else
+                cstop = PY_SSIZE_T_MAX;
+        }
+        if (wraparound && unlikely((cstart < 0) | (cstop < 0)) && likely(ms->sq_length)) {
+            Py_ssize_t l = ms->sq_length(obj);
+            if (likely(l >= 0)) {
+                if (cstop < 0) {
+                    cstop += l;
+                    if (cstop < 0) cstop = 0;
+                }
+                if (cstart < 0) {
+                    cstart += l;
+                    if (cstart < 0) cstart = 0;
+                }
+            } else {
+                if (!PyErr_ExceptionMatches(PyExc_OverflowError))
+                    goto bad;
+                PyErr_Clear();
+            }
+        }
+        return ms->sq_slice(obj, cstart, cstop);
+    }
+#endif
+    mp = Py_TYPE(obj)->tp_as_mapping;
+    if (likely(mp && mp->mp_subscript))
+#endif
+    {
+        PyObject* result;
+        PyObject *py_slice, *py_start, *py_stop;
+        if (_py_slice) {
+            py_slice = *_py_slice;
+        } else {
+            PyObject* owned_start = NULL;
+            PyObject* owned_stop = NULL;
+            if (_py_start) {
+                py_start = *_py_start;
+            } else {
+                if (has_cstart) {
+                    owned_start = py_start = PyInt_FromSsize_t(cstart);
+                    if (unlikely(!py_start)) goto bad;
+                } else
+                    py_start = Py_None;
+            }
+            if (_py_stop) {
+                py_stop = *_py_stop;
+            } else {
+                if (has_cstop) {
+                    owned_stop = py_stop = PyInt_FromSsize_t(cstop);
+                    if (unlikely(!py_stop)) {
+                        Py_XDECREF(owned_start);
+                        goto bad;
+                    }
+                } else
+                    py_stop = Py_None;
+            }
+            py_slice = PySlice_New(py_start, py_stop, Py_None);
+            Py_XDECREF(owned_start);
+            Py_XDECREF(owned_stop);
+            if (unlikely(!py_slice)) goto bad;
+        }
+#if CYTHON_USE_TYPE_SLOTS
+        result = mp->mp_subscript(obj, py_slice);
+#else
+        result = PyObject_GetItem(obj, py_slice);
+#endif
+        if (!_py_slice) {
+            Py_DECREF(py_slice);
+        }
+        return result;
+    }
+    PyErr_Format(PyExc_TypeError,
+        "'%.200s' object is unsliceable", Py_TYPE(obj)->tp_name);
+bad:
+    return NULL;
+}
+
+/* PyObjectSetAttrStr */
+#if CYTHON_USE_TYPE_SLOTS
+static CYTHON_INLINE int __Pyx_PyObject_SetAttrStr(PyObject* obj, PyObject* attr_name, PyObject* value) {
+    PyTypeObject* tp = Py_TYPE(obj);
+    if (likely(tp->tp_setattro))
+        return tp->tp_setattro(obj, attr_name, value);
+#if PY_MAJOR_VERSION < 3
+    if (likely(tp->tp_setattr))
+        return tp->tp_setattr(obj, PyString_AS_STRING(attr_name), value);
+#endif
+    return PyObject_SetAttr(obj, attr_name, value);
+}
+#endif
+
+/* Import */
+static PyObject *__Pyx_Import(PyObject *name, PyObject *from_list, int level) {
+    PyObject *empty_list = 0;
+    PyObject *module = 0;
+    PyObject *global_dict = 0;
+    PyObject *empty_dict = 0;
+    PyObject *list;
+    #if PY_MAJOR_VERSION < 3
+    PyObject *py_import;
+    py_import = __Pyx_PyObject_GetAttrStr(__pyx_b, __pyx_n_s_import);
+    if (!py_import)
+        goto bad;
+    #endif
+    if (from_list)
+        list = from_list;
+    else {
+        empty_list = PyList_New(0);
+        if (!empty_list)
+            goto bad;
+        list = empty_list;
+    }
+    global_dict = PyModule_GetDict(__pyx_m);
+    if (!global_dict)
+        goto bad;
+    empty_dict = PyDict_New();
+    if (!empty_dict)
+        goto bad;
+    {
+        #if PY_MAJOR_VERSION >= 3
+        if (level == -1) {
+            if ((1) && (strchr(__Pyx_MODULE_NAME, '.'))) {
+                module = PyImport_ImportModuleLevelObject(
+                    name, global_dict, empty_dict, list, 1);
+                if (!module) {
+                    if (!PyErr_ExceptionMatches(PyExc_ImportError))
+                        goto bad;
+                    PyErr_Clear();
+                }
+            }
+            level = 0;
+        }
+        #endif
+        if (!module) {
+            #if PY_MAJOR_VERSION < 3
+            PyObject *py_level = PyInt_FromLong(level);
+            if (!py_level)
+                goto bad;
+            module = PyObject_CallFunctionObjArgs(py_import,
+                name, global_dict, empty_dict, list, py_level, (PyObject *)NULL);
+            Py_DECREF(py_level);
+            #else
+            module = PyImport_ImportModuleLevelObject(
+                name, global_dict, empty_dict, list, level);
+            #endif
+        }
+    }
+bad:
+    #if PY_MAJOR_VERSION < 3
+    Py_XDECREF(py_import);
+    #endif
+    Py_XDECREF(empty_list);
+    Py_XDECREF(empty_dict);
+    return module;
+}
+
+/* ImportFrom */
+static PyObject* __Pyx_ImportFrom(PyObject* module, PyObject* name) {
+    PyObject* value = __Pyx_PyObject_GetAttrStr(module, name);
+    if (unlikely(!value) && PyErr_ExceptionMatches(PyExc_AttributeError)) {
+        PyErr_Format(PyExc_ImportError,
+        #if PY_MAJOR_VERSION < 3
+            "cannot import name %.230s", PyString_AS_STRING(name));
+        #else
+            "cannot import name %S", name);
+        #endif
+    }
+    return value;
+}
+
+/* HasAttr */
+static CYTHON_INLINE int __Pyx_HasAttr(PyObject *o, PyObject *n) {
+    PyObject *r;
+    if (unlikely(!__Pyx_PyBaseString_Check(n))) {
+        PyErr_SetString(PyExc_TypeError,
+                        "hasattr(): attribute name must be string");
+        return -1;
+    }
+    r = __Pyx_GetAttr(o, n);
+    if (unlikely(!r)) {
+        PyErr_Clear();
+        return 0;
+    } else {
+        Py_DECREF(r);
+        return 1;
+    }
+}
+
+/* PyObject_GenericGetAttrNoDict */
+#if CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP && PY_VERSION_HEX < 0x03070000
+static PyObject *__Pyx_RaiseGenericGetAttributeError(PyTypeObject *tp, PyObject *attr_name) {
+    PyErr_Format(PyExc_AttributeError,
+#if PY_MAJOR_VERSION >= 3
+                 "'%.50s' object has no attribute '%U'",
+                 tp->tp_name, attr_name);
+#else
+                 "'%.50s' object has no attribute '%.400s'",
+                 tp->tp_name, PyString_AS_STRING(attr_name));
+#endif
+    return NULL;
+}
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GenericGetAttrNoDict(PyObject* obj, PyObject* attr_name) {
+    PyObject *descr;
+    PyTypeObject *tp = Py_TYPE(obj);
+    if (unlikely(!PyString_Check(attr_name))) {
+        return PyObject_GenericGetAttr(obj, attr_name);
+    }
+    assert(!tp->tp_dictoffset);
+    descr = _PyType_Lookup(tp, attr_name);
+    if (unlikely(!descr)) {
+        return __Pyx_RaiseGenericGetAttributeError(tp, attr_name);
+    }
+    Py_INCREF(descr);
+    #if PY_MAJOR_VERSION < 3
+    if (likely(PyType_HasFeature(Py_TYPE(descr), Py_TPFLAGS_HAVE_CLASS)))
+    #endif
+    {
+        descrgetfunc f = Py_TYPE(descr)->tp_descr_get;
+        if (unlikely(f)) {
+            PyObject *res = f(descr, obj, (PyObject *)tp);
+            Py_DECREF(descr);
+            return res;
+        }
+    }
+    return descr;
+}
+#endif
+
+/* PyObject_GenericGetAttr */
+#if CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP && PY_VERSION_HEX < 0x03070000
+static PyObject* __Pyx_PyObject_GenericGetAttr(PyObject* obj, PyObject* attr_name) {
+    if (unlikely(Py_TYPE(obj)->tp_dictoffset)) {
+        return PyObject_GenericGetAttr(obj, attr_name);
+    }
+    return __Pyx_PyObject_GenericGetAttrNoDict(obj, attr_name);
+}
+#endif
+
+/* PyObjectGetAttrStrNoError */
+static void __Pyx_PyObject_GetAttrStr_ClearAttributeError(void) {
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    if (likely(__Pyx_PyErr_ExceptionMatches(PyExc_AttributeError)))
+        __Pyx_PyErr_Clear();
+}
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStrNoError(PyObject* obj, PyObject* attr_name) {
+    PyObject *result;
+#if CYTHON_COMPILING_IN_CPYTHON && CYTHON_USE_TYPE_SLOTS && PY_VERSION_HEX >= 0x030700B1
+    PyTypeObject* tp = Py_TYPE(obj);
+    if (likely(tp->tp_getattro == PyObject_GenericGetAttr)) {
+        return _PyObject_GenericGetAttrWithDict(obj, attr_name, NULL, 1);
+    }
+#endif
+    result = __Pyx_PyObject_GetAttrStr(obj, attr_name);
+    if (unlikely(!result)) {
+        __Pyx_PyObject_GetAttrStr_ClearAttributeError();
+    }
+    return result;
+}
+
+/* SetupReduce */
+static int __Pyx_setup_reduce_is_named(PyObject* meth, PyObject* name) {
+  int ret;
+  PyObject *name_attr;
+  name_attr = __Pyx_PyObject_GetAttrStr(meth, __pyx_n_s_name);
+  if (likely(name_attr)) {
+      ret = PyObject_RichCompareBool(name_attr, name, Py_EQ);
+  } else {
+      ret = -1;
+  }
+  if (unlikely(ret < 0)) {
+      PyErr_Clear();
+      ret = 0;
+  }
+  Py_XDECREF(name_attr);
+  return ret;
+}
+static int __Pyx_setup_reduce(PyObject* type_obj) {
+    int ret = 0;
+    PyObject *object_reduce = NULL;
+    PyObject *object_getstate = NULL;
+    PyObject *object_reduce_ex = NULL;
+    PyObject *reduce = NULL;
+    PyObject *reduce_ex = NULL;
+    PyObject *reduce_cython = NULL;
+    PyObject *setstate = NULL;
+    PyObject *setstate_cython = NULL;
+    PyObject *getstate = NULL;
+#if CYTHON_USE_PYTYPE_LOOKUP
+    getstate = _PyType_Lookup((PyTypeObject*)type_obj, __pyx_n_s_getstate);
+#else
+    getstate = __Pyx_PyObject_GetAttrStrNoError(type_obj, __pyx_n_s_getstate);
+    if (!getstate && PyErr_Occurred()) {
+        goto __PYX_BAD;
+    }
+#endif
+    if (getstate) {
+#if CYTHON_USE_PYTYPE_LOOKUP
+        object_getstate = _PyType_Lookup(&PyBaseObject_Type, __pyx_n_s_getstate);
+#else
+        object_getstate = __Pyx_PyObject_GetAttrStrNoError((PyObject*)&PyBaseObject_Type, __pyx_n_s_getstate);
+        if (!object_getstate && PyErr_Occurred()) {
+            goto __PYX_BAD;
+        }
+#endif
+        if (object_getstate != getstate) {
+            goto __PYX_GOOD;
+        }
+    }
+#if CYTHON_USE_PYTYPE_LOOKUP
+    object_reduce_ex = _PyType_Lookup(&PyBaseObject_Type, __pyx_n_s_reduce_ex); if (!object_reduce_ex) goto __PYX_BAD;
+#else
+    object_reduce_ex = __Pyx_PyObject_GetAttrStr((PyObject*)&PyBaseObject_Type, __pyx_n_s_reduce_ex); if (!object_reduce_ex) goto __PYX_BAD;
+#endif
+    reduce_ex = __Pyx_PyObject_GetAttrStr(type_obj, __pyx_n_s_reduce_ex); if (unlikely(!reduce_ex)) goto __PYX_BAD;
+    if (reduce_ex == object_reduce_ex) {
+#if CYTHON_USE_PYTYPE_LOOKUP
+        object_reduce = _PyType_Lookup(&PyBaseObject_Type, __pyx_n_s_reduce); if (!object_reduce) goto __PYX_BAD;
+#else
+        object_reduce = __Pyx_PyObject_GetAttrStr((PyObject*)&PyBaseObject_Type, __pyx_n_s_reduce); if (!object_reduce) goto __PYX_BAD;
+#endif
+        reduce = __Pyx_PyObject_GetAttrStr(type_obj, __pyx_n_s_reduce); if (unlikely(!reduce)) goto __PYX_BAD;
+        if (reduce == object_reduce || __Pyx_setup_reduce_is_named(reduce, __pyx_n_s_reduce_cython)) {
+            reduce_cython = __Pyx_PyObject_GetAttrStrNoError(type_obj, __pyx_n_s_reduce_cython);
+            if (likely(reduce_cython)) {
+                ret = PyDict_SetItem(((PyTypeObject*)type_obj)->tp_dict, __pyx_n_s_reduce, reduce_cython); if (unlikely(ret < 0)) goto __PYX_BAD;
+                ret = PyDict_DelItem(((PyTypeObject*)type_obj)->tp_dict, __pyx_n_s_reduce_cython); if (unlikely(ret < 0)) goto __PYX_BAD;
+            } else if (reduce == object_reduce || PyErr_Occurred()) {
+                goto __PYX_BAD;
+            }
+            setstate = __Pyx_PyObject_GetAttrStr(type_obj, __pyx_n_s_setstate);
+            if (!setstate) PyErr_Clear();
+            if (!setstate || __Pyx_setup_reduce_is_named(setstate, __pyx_n_s_setstate_cython)) {
+                setstate_cython = __Pyx_PyObject_GetAttrStrNoError(type_obj, __pyx_n_s_setstate_cython);
+                if (likely(setstate_cython)) {
+                    ret = PyDict_SetItem(((PyTypeObject*)type_obj)->tp_dict, __pyx_n_s_setstate, setstate_cython); if (unlikely(ret < 0)) goto __PYX_BAD;
+                    ret = PyDict_DelItem(((PyTypeObject*)type_obj)->tp_dict, __pyx_n_s_setstate_cython); if (unlikely(ret < 0)) goto __PYX_BAD;
+                } else if (!setstate || PyErr_Occurred()) {
+                    goto __PYX_BAD;
+                }
+            }
+            PyType_Modified((PyTypeObject*)type_obj);
+        }
+    }
+    goto __PYX_GOOD;
+__PYX_BAD:
+    if (!PyErr_Occurred())
+        PyErr_Format(PyExc_RuntimeError, "Unable to initialize pickling for %s", ((PyTypeObject*)type_obj)->tp_name);
+    ret = -1;
+__PYX_GOOD:
+#if !CYTHON_USE_PYTYPE_LOOKUP
+    Py_XDECREF(object_reduce);
+    Py_XDECREF(object_reduce_ex);
+    Py_XDECREF(object_getstate);
+    Py_XDECREF(getstate);
+#endif
+    Py_XDECREF(reduce);
+    Py_XDECREF(reduce_ex);
+    Py_XDECREF(reduce_cython);
+    Py_XDECREF(setstate);
+    Py_XDECREF(setstate_cython);
+    return ret;
+}
 
-/* Runtime support code */
+/* CLineInTraceback */
+#ifndef CYTHON_CLINE_IN_TRACEBACK
+static int __Pyx_CLineForTraceback(CYTHON_UNUSED PyThreadState *tstate, int c_line) {
+    PyObject *use_cline;
+    PyObject *ptype, *pvalue, *ptraceback;
+#if CYTHON_COMPILING_IN_CPYTHON
+    PyObject **cython_runtime_dict;
+#endif
+    if (unlikely(!__pyx_cython_runtime)) {
+        return c_line;
+    }
+    __Pyx_ErrFetchInState(tstate, &ptype, &pvalue, &ptraceback);
+#if CYTHON_COMPILING_IN_CPYTHON
+    cython_runtime_dict = _PyObject_GetDictPtr(__pyx_cython_runtime);
+    if (likely(cython_runtime_dict)) {
+        __PYX_PY_DICT_LOOKUP_IF_MODIFIED(
+            use_cline, *cython_runtime_dict,
+            __Pyx_PyDict_GetItemStr(*cython_runtime_dict, __pyx_n_s_cline_in_traceback))
+    } else
+#endif
+    {
+      PyObject *use_cline_obj = __Pyx_PyObject_GetAttrStr(__pyx_cython_runtime, __pyx_n_s_cline_in_traceback);
+      if (use_cline_obj) {
+        use_cline = PyObject_Not(use_cline_obj) ? Py_False : Py_True;
+        Py_DECREF(use_cline_obj);
+      } else {
+        PyErr_Clear();
+        use_cline = NULL;
+      }
+    }
+    if (!use_cline) {
+        c_line = 0;
+        (void) PyObject_SetAttr(__pyx_cython_runtime, __pyx_n_s_cline_in_traceback, Py_False);
+    }
+    else if (use_cline == Py_False || (use_cline != Py_True && PyObject_Not(use_cline) != 0)) {
+        c_line = 0;
+    }
+    __Pyx_ErrRestoreInState(tstate, ptype, pvalue, ptraceback);
+    return c_line;
+}
+#endif
 
-static void __pyx_init_filenames(void) {
-  __pyx_f = __pyx_filenames;
+/* CodeObjectCache */
+static int __pyx_bisect_code_objects(__Pyx_CodeObjectCacheEntry* entries, int count, int code_line) {
+    int start = 0, mid = 0, end = count - 1;
+    if (end >= 0 && code_line > entries[end].code_line) {
+        return count;
+    }
+    while (start < end) {
+        mid = start + (end - start) / 2;
+        if (code_line < entries[mid].code_line) {
+            end = mid;
+        } else if (code_line > entries[mid].code_line) {
+             start = mid + 1;
+        } else {
+            return mid;
+        }
+    }
+    if (code_line <= entries[mid].code_line) {
+        return mid;
+    } else {
+        return mid + 1;
+    }
+}
+static PyCodeObject *__pyx_find_code_object(int code_line) {
+    PyCodeObject* code_object;
+    int pos;
+    if (unlikely(!code_line) || unlikely(!__pyx_code_cache.entries)) {
+        return NULL;
+    }
+    pos = __pyx_bisect_code_objects(__pyx_code_cache.entries, __pyx_code_cache.count, code_line);
+    if (unlikely(pos >= __pyx_code_cache.count) || unlikely(__pyx_code_cache.entries[pos].code_line != code_line)) {
+        return NULL;
+    }
+    code_object = __pyx_code_cache.entries[pos].code_object;
+    Py_INCREF(code_object);
+    return code_object;
+}
+static void __pyx_insert_code_object(int code_line, PyCodeObject* code_object) {
+    int pos, i;
+    __Pyx_CodeObjectCacheEntry* entries = __pyx_code_cache.entries;
+    if (unlikely(!code_line)) {
+        return;
+    }
+    if (unlikely(!entries)) {
+        entries = (__Pyx_CodeObjectCacheEntry*)PyMem_Malloc(64*sizeof(__Pyx_CodeObjectCacheEntry));
+        if (likely(entries)) {
+            __pyx_code_cache.entries = entries;
+            __pyx_code_cache.max_count = 64;
+            __pyx_code_cache.count = 1;
+            entries[0].code_line = code_line;
+            entries[0].code_object = code_object;
+            Py_INCREF(code_object);
+        }
+        return;
+    }
+    pos = __pyx_bisect_code_objects(__pyx_code_cache.entries, __pyx_code_cache.count, code_line);
+    if ((pos < __pyx_code_cache.count) && unlikely(__pyx_code_cache.entries[pos].code_line == code_line)) {
+        PyCodeObject* tmp = entries[pos].code_object;
+        entries[pos].code_object = code_object;
+        Py_DECREF(tmp);
+        return;
+    }
+    if (__pyx_code_cache.count == __pyx_code_cache.max_count) {
+        int new_max = __pyx_code_cache.max_count + 64;
+        entries = (__Pyx_CodeObjectCacheEntry*)PyMem_Realloc(
+            __pyx_code_cache.entries, ((size_t)new_max) * sizeof(__Pyx_CodeObjectCacheEntry));
+        if (unlikely(!entries)) {
+            return;
+        }
+        __pyx_code_cache.entries = entries;
+        __pyx_code_cache.max_count = new_max;
+    }
+    for (i=__pyx_code_cache.count; i>pos; i--) {
+        entries[i] = entries[i-1];
+    }
+    entries[pos].code_line = code_line;
+    entries[pos].code_object = code_object;
+    __pyx_code_cache.count++;
+    Py_INCREF(code_object);
 }
 
-static PyObject *__Pyx_Import(PyObject *name, PyObject *from_list) {
-    PyObject *__import__ = 0;
-    PyObject *empty_list = 0;
-    PyObject *module = 0;
-    PyObject *global_dict = 0;
-    PyObject *empty_dict = 0;
-    PyObject *list;
-    __import__ = PyObject_GetAttrString(__pyx_b, "__import__");
-    if (!__import__)
-        goto bad;
-    if (from_list)
-        list = from_list;
+/* AddTraceback */
+#include "compile.h"
+#include "frameobject.h"
+#include "traceback.h"
+#if PY_VERSION_HEX >= 0x030b00a6
+  #ifndef Py_BUILD_CORE
+    #define Py_BUILD_CORE 1
+  #endif
+  #include "internal/pycore_frame.h"
+#endif
+static PyCodeObject* __Pyx_CreateCodeObjectForTraceback(
+            const char *funcname, int c_line,
+            int py_line, const char *filename) {
+    PyCodeObject *py_code = NULL;
+    PyObject *py_funcname = NULL;
+    #if PY_MAJOR_VERSION < 3
+    PyObject *py_srcfile = NULL;
+    py_srcfile = PyString_FromString(filename);
+    if (!py_srcfile) goto bad;
+    #endif
+    if (c_line) {
+        #if PY_MAJOR_VERSION < 3
+        py_funcname = PyString_FromFormat( "%s (%s:%d)", funcname, __pyx_cfilenm, c_line);
+        if (!py_funcname) goto bad;
+        #else
+        py_funcname = PyUnicode_FromFormat( "%s (%s:%d)", funcname, __pyx_cfilenm, c_line);
+        if (!py_funcname) goto bad;
+        funcname = PyUnicode_AsUTF8(py_funcname);
+        if (!funcname) goto bad;
+        #endif
+    }
     else {
-        empty_list = PyList_New(0);
-        if (!empty_list)
+        #if PY_MAJOR_VERSION < 3
+        py_funcname = PyString_FromString(funcname);
+        if (!py_funcname) goto bad;
+        #endif
+    }
+    #if PY_MAJOR_VERSION < 3
+    py_code = __Pyx_PyCode_New(
+        0,
+        0,
+        0,
+        0,
+        0,
+        __pyx_empty_bytes, /*PyObject *code,*/
+        __pyx_empty_tuple, /*PyObject *consts,*/
+        __pyx_empty_tuple, /*PyObject *names,*/
+        __pyx_empty_tuple, /*PyObject *varnames,*/
+        __pyx_empty_tuple, /*PyObject *freevars,*/
+        __pyx_empty_tuple, /*PyObject *cellvars,*/
+        py_srcfile,   /*PyObject *filename,*/
+        py_funcname,  /*PyObject *name,*/
+        py_line,
+        __pyx_empty_bytes  /*PyObject *lnotab*/
+    );
+    Py_DECREF(py_srcfile);
+    #else
+    py_code = PyCode_NewEmpty(filename, funcname, py_line);
+    #endif
+    Py_XDECREF(py_funcname);  // XDECREF since it's only set on Py3 if cline
+    return py_code;
+bad:
+    Py_XDECREF(py_funcname);
+    #if PY_MAJOR_VERSION < 3
+    Py_XDECREF(py_srcfile);
+    #endif
+    return NULL;
+}
+static void __Pyx_AddTraceback(const char *funcname, int c_line,
+                               int py_line, const char *filename) {
+    PyCodeObject *py_code = 0;
+    PyFrameObject *py_frame = 0;
+    PyThreadState *tstate = __Pyx_PyThreadState_Current;
+    PyObject *ptype, *pvalue, *ptraceback;
+    if (c_line) {
+        c_line = __Pyx_CLineForTraceback(tstate, c_line);
+    }
+    py_code = __pyx_find_code_object(c_line ? -c_line : py_line);
+    if (!py_code) {
+        __Pyx_ErrFetchInState(tstate, &ptype, &pvalue, &ptraceback);
+        py_code = __Pyx_CreateCodeObjectForTraceback(
+            funcname, c_line, py_line, filename);
+        if (!py_code) {
+            /* If the code object creation fails, then we should clear the
+               fetched exception references and propagate the new exception */
+            Py_XDECREF(ptype);
+            Py_XDECREF(pvalue);
+            Py_XDECREF(ptraceback);
             goto bad;
-        list = empty_list;
+        }
+        __Pyx_ErrRestoreInState(tstate, ptype, pvalue, ptraceback);
+        __pyx_insert_code_object(c_line ? -c_line : py_line, py_code);
     }
-    global_dict = PyModule_GetDict(__pyx_m);
-    if (!global_dict)
-        goto bad;
-    empty_dict = PyDict_New();
-    if (!empty_dict)
-        goto bad;
-    module = PyObject_CallFunction(__import__, "OOOO",
-        name, global_dict, empty_dict, list);
+    py_frame = PyFrame_New(
+        tstate,            /*PyThreadState *tstate,*/
+        py_code,           /*PyCodeObject *code,*/
+        __pyx_d,    /*PyObject *globals,*/
+        0                  /*PyObject *locals*/
+    );
+    if (!py_frame) goto bad;
+    __Pyx_PyFrame_SetLineNumber(py_frame, py_line);
+    PyTraceBack_Here(py_frame);
 bad:
-    Py_XDECREF(empty_list);
-    Py_XDECREF(__import__);
-    Py_XDECREF(empty_dict);
-    return module;
+    Py_XDECREF(py_code);
+    Py_XDECREF(py_frame);
 }
 
-static PyObject *__Pyx_GetName(PyObject *dict, PyObject *name) {
-    PyObject *result;
-    result = PyObject_GetAttr(dict, name);
-    if (!result)
-        PyErr_SetObject(PyExc_NameError, name);
-    return result;
+/* CIntFromPyVerify */
+#define __PYX_VERIFY_RETURN_INT(target_type, func_type, func_value)\
+    __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, 0)
+#define __PYX_VERIFY_RETURN_INT_EXC(target_type, func_type, func_value)\
+    __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, 1)
+#define __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, exc)\
+    {\
+        func_type value = func_value;\
+        if (sizeof(target_type) < sizeof(func_type)) {\
+            if (unlikely(value != (func_type) (target_type) value)) {\
+                func_type zero = 0;\
+                if (exc && unlikely(value == (func_type)-1 && PyErr_Occurred()))\
+                    return (target_type) -1;\
+                if (is_unsigned && unlikely(value < zero))\
+                    goto raise_neg_overflow;\
+                else\
+                    goto raise_overflow;\
+            }\
+        }\
+        return (target_type) value;\
+    }
+
+/* CIntFromPy */
+static CYTHON_INLINE long __Pyx_PyInt_As_long(PyObject *x) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const long neg_one = (long) -1, const_zero = (long) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+#if PY_MAJOR_VERSION < 3
+    if (likely(PyInt_Check(x))) {
+        if (sizeof(long) < sizeof(long)) {
+            __PYX_VERIFY_RETURN_INT(long, long, PyInt_AS_LONG(x))
+        } else {
+            long val = PyInt_AS_LONG(x);
+            if (is_unsigned && unlikely(val < 0)) {
+                goto raise_neg_overflow;
+            }
+            return (long) val;
+        }
+    } else
+#endif
+    if (likely(PyLong_Check(x))) {
+        if (is_unsigned) {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (long) 0;
+                case  1: __PYX_VERIFY_RETURN_INT(long, digit, digits[0])
+                case 2:
+                    if (8 * sizeof(long) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) >= 2 * PyLong_SHIFT) {
+                            return (long) (((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(long) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) >= 3 * PyLong_SHIFT) {
+                            return (long) (((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(long) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) >= 4 * PyLong_SHIFT) {
+                            return (long) (((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
+                        }
+                    }
+                    break;
+            }
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030C00A7
+            if (unlikely(Py_SIZE(x) < 0)) {
+                goto raise_neg_overflow;
+            }
+#else
+            {
+                int result = PyObject_RichCompareBool(x, Py_False, Py_LT);
+                if (unlikely(result < 0))
+                    return (long) -1;
+                if (unlikely(result == 1))
+                    goto raise_neg_overflow;
+            }
+#endif
+            if (sizeof(long) <= sizeof(unsigned long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(long, unsigned long, PyLong_AsUnsignedLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(long) <= sizeof(unsigned PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(long, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
+#endif
+            }
+        } else {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (long) 0;
+                case -1: __PYX_VERIFY_RETURN_INT(long, sdigit, (sdigit) (-(sdigit)digits[0]))
+                case  1: __PYX_VERIFY_RETURN_INT(long,  digit, +digits[0])
+                case -2:
+                    if (8 * sizeof(long) - 1 > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
+                            return (long) (((long)-1)*(((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case 2:
+                    if (8 * sizeof(long) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
+                            return (long) ((((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case -3:
+                    if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
+                            return (long) (((long)-1)*(((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(long) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
+                            return (long) ((((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case -4:
+                    if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 4 * PyLong_SHIFT) {
+                            return (long) (((long)-1)*(((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(long) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 4 * PyLong_SHIFT) {
+                            return (long) ((((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+            }
+#endif
+            if (sizeof(long) <= sizeof(long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(long, long, PyLong_AsLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(long) <= sizeof(PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(long, PY_LONG_LONG, PyLong_AsLongLong(x))
+#endif
+            }
+        }
+        {
+#if CYTHON_COMPILING_IN_PYPY && !defined(_PyLong_AsByteArray)
+            PyErr_SetString(PyExc_RuntimeError,
+                            "_PyLong_AsByteArray() not available in PyPy, cannot convert large numbers");
+#else
+            long val;
+            PyObject *v = __Pyx_PyNumber_IntOrLong(x);
+ #if PY_MAJOR_VERSION < 3
+            if (likely(v) && !PyLong_Check(v)) {
+                PyObject *tmp = v;
+                v = PyNumber_Long(tmp);
+                Py_DECREF(tmp);
+            }
+ #endif
+            if (likely(v)) {
+                int one = 1; int is_little = (int)*(unsigned char *)&one;
+                unsigned char *bytes = (unsigned char *)&val;
+                int ret = _PyLong_AsByteArray((PyLongObject *)v,
+                                              bytes, sizeof(val),
+                                              is_little, !is_unsigned);
+                Py_DECREF(v);
+                if (likely(!ret))
+                    return val;
+            }
+#endif
+            return (long) -1;
+        }
+    } else {
+        long val;
+        PyObject *tmp = __Pyx_PyNumber_IntOrLong(x);
+        if (!tmp) return (long) -1;
+        val = __Pyx_PyInt_As_long(tmp);
+        Py_DECREF(tmp);
+        return val;
+    }
+raise_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "value too large to convert to long");
+    return (long) -1;
+raise_neg_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "can't convert negative value to long");
+    return (long) -1;
 }
 
-static PyObject *__Pyx_GetExcValue(void) {
-    PyObject *type = 0, *value = 0, *tb = 0;
-    PyObject *result = 0;
-    PyThreadState *tstate = PyThreadState_Get();
-    PyErr_Fetch(&type, &value, &tb);
-    PyErr_NormalizeException(&type, &value, &tb);
-    if (PyErr_Occurred())
-        goto bad;
-    if (!value) {
-        value = Py_None;
-        Py_INCREF(value);
+/* CIntToPy */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_int(int value) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const int neg_one = (int) -1, const_zero = (int) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        if (sizeof(int) < sizeof(long)) {
+            return PyInt_FromLong((long) value);
+        } else if (sizeof(int) <= sizeof(unsigned long)) {
+            return PyLong_FromUnsignedLong((unsigned long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(int) <= sizeof(unsigned PY_LONG_LONG)) {
+            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
+#endif
+        }
+    } else {
+        if (sizeof(int) <= sizeof(long)) {
+            return PyInt_FromLong((long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(int) <= sizeof(PY_LONG_LONG)) {
+            return PyLong_FromLongLong((PY_LONG_LONG) value);
+#endif
+        }
+    }
+    {
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        unsigned char *bytes = (unsigned char *)&value;
+        return _PyLong_FromByteArray(bytes, sizeof(int),
+                                     little, !is_unsigned);
     }
-    Py_XDECREF(tstate->exc_type);
-    Py_XDECREF(tstate->exc_value);
-    Py_XDECREF(tstate->exc_traceback);
-    tstate->exc_type = type;
-    tstate->exc_value = value;
-    tstate->exc_traceback = tb;
-    result = value;
-    Py_XINCREF(result);
-    type = 0;
-    value = 0;
-    tb = 0;
-bad:
-    Py_XDECREF(type);
-    Py_XDECREF(value);
-    Py_XDECREF(tb);
-    return result;
 }
 
-static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb) {
-    Py_XINCREF(type);
-    Py_XINCREF(value);
-    Py_XINCREF(tb);
-    /* First, check the traceback argument, replacing None with NULL. */
-    if (tb == Py_None) {
-        Py_DECREF(tb);
-        tb = 0;
+/* CIntFromPy */
+static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *x) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const int neg_one = (int) -1, const_zero = (int) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+#if PY_MAJOR_VERSION < 3
+    if (likely(PyInt_Check(x))) {
+        if (sizeof(int) < sizeof(long)) {
+            __PYX_VERIFY_RETURN_INT(int, long, PyInt_AS_LONG(x))
+        } else {
+            long val = PyInt_AS_LONG(x);
+            if (is_unsigned && unlikely(val < 0)) {
+                goto raise_neg_overflow;
+            }
+            return (int) val;
+        }
+    } else
+#endif
+    if (likely(PyLong_Check(x))) {
+        if (is_unsigned) {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (int) 0;
+                case  1: __PYX_VERIFY_RETURN_INT(int, digit, digits[0])
+                case 2:
+                    if (8 * sizeof(int) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) >= 2 * PyLong_SHIFT) {
+                            return (int) (((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(int) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) >= 3 * PyLong_SHIFT) {
+                            return (int) (((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(int) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) >= 4 * PyLong_SHIFT) {
+                            return (int) (((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
+                        }
+                    }
+                    break;
+            }
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030C00A7
+            if (unlikely(Py_SIZE(x) < 0)) {
+                goto raise_neg_overflow;
+            }
+#else
+            {
+                int result = PyObject_RichCompareBool(x, Py_False, Py_LT);
+                if (unlikely(result < 0))
+                    return (int) -1;
+                if (unlikely(result == 1))
+                    goto raise_neg_overflow;
+            }
+#endif
+            if (sizeof(int) <= sizeof(unsigned long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int, unsigned long, PyLong_AsUnsignedLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(int) <= sizeof(unsigned PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
+#endif
+            }
+        } else {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (int) 0;
+                case -1: __PYX_VERIFY_RETURN_INT(int, sdigit, (sdigit) (-(sdigit)digits[0]))
+                case  1: __PYX_VERIFY_RETURN_INT(int,  digit, +digits[0])
+                case -2:
+                    if (8 * sizeof(int) - 1 > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 2 * PyLong_SHIFT) {
+                            return (int) (((int)-1)*(((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case 2:
+                    if (8 * sizeof(int) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 2 * PyLong_SHIFT) {
+                            return (int) ((((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case -3:
+                    if (8 * sizeof(int) - 1 > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 3 * PyLong_SHIFT) {
+                            return (int) (((int)-1)*(((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(int) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 3 * PyLong_SHIFT) {
+                            return (int) ((((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case -4:
+                    if (8 * sizeof(int) - 1 > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 4 * PyLong_SHIFT) {
+                            return (int) (((int)-1)*(((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(int) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 4 * PyLong_SHIFT) {
+                            return (int) ((((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+            }
+#endif
+            if (sizeof(int) <= sizeof(long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int, long, PyLong_AsLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(int) <= sizeof(PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int, PY_LONG_LONG, PyLong_AsLongLong(x))
+#endif
+            }
+        }
+        {
+#if CYTHON_COMPILING_IN_PYPY && !defined(_PyLong_AsByteArray)
+            PyErr_SetString(PyExc_RuntimeError,
+                            "_PyLong_AsByteArray() not available in PyPy, cannot convert large numbers");
+#else
+            int val;
+            PyObject *v = __Pyx_PyNumber_IntOrLong(x);
+ #if PY_MAJOR_VERSION < 3
+            if (likely(v) && !PyLong_Check(v)) {
+                PyObject *tmp = v;
+                v = PyNumber_Long(tmp);
+                Py_DECREF(tmp);
+            }
+ #endif
+            if (likely(v)) {
+                int one = 1; int is_little = (int)*(unsigned char *)&one;
+                unsigned char *bytes = (unsigned char *)&val;
+                int ret = _PyLong_AsByteArray((PyLongObject *)v,
+                                              bytes, sizeof(val),
+                                              is_little, !is_unsigned);
+                Py_DECREF(v);
+                if (likely(!ret))
+                    return val;
+            }
+#endif
+            return (int) -1;
+        }
+    } else {
+        int val;
+        PyObject *tmp = __Pyx_PyNumber_IntOrLong(x);
+        if (!tmp) return (int) -1;
+        val = __Pyx_PyInt_As_int(tmp);
+        Py_DECREF(tmp);
+        return val;
     }
-    else if (tb != NULL && !PyTraceBack_Check(tb)) {
-        PyErr_SetString(PyExc_TypeError,
-            "raise: arg 3 must be a traceback or None");
-        goto raise_error;
+raise_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "value too large to convert to int");
+    return (int) -1;
+raise_neg_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "can't convert negative value to int");
+    return (int) -1;
+}
+
+/* CIntToPy */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const long neg_one = (long) -1, const_zero = (long) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        if (sizeof(long) < sizeof(long)) {
+            return PyInt_FromLong((long) value);
+        } else if (sizeof(long) <= sizeof(unsigned long)) {
+            return PyLong_FromUnsignedLong((unsigned long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(long) <= sizeof(unsigned PY_LONG_LONG)) {
+            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
+#endif
+        }
+    } else {
+        if (sizeof(long) <= sizeof(long)) {
+            return PyInt_FromLong((long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(long) <= sizeof(PY_LONG_LONG)) {
+            return PyLong_FromLongLong((PY_LONG_LONG) value);
+#endif
+        }
     }
-    /* Next, replace a missing value with None */
-    if (value == NULL) {
-        value = Py_None;
-        Py_INCREF(value);
+    {
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        unsigned char *bytes = (unsigned char *)&value;
+        return _PyLong_FromByteArray(bytes, sizeof(long),
+                                     little, !is_unsigned);
     }
-    /* Next, repeatedly, replace a tuple exception with its first item */
-    while (PyTuple_Check(type) && PyTuple_Size(type) > 0) {
-        PyObject *tmp = type;
-        type = PyTuple_GET_ITEM(type, 0);
-        Py_INCREF(type);
-        Py_DECREF(tmp);
+}
+
+/* FastTypeChecks */
+#if CYTHON_COMPILING_IN_CPYTHON
+static int __Pyx_InBases(PyTypeObject *a, PyTypeObject *b) {
+    while (a) {
+        a = a->tp_base;
+        if (a == b)
+            return 1;
     }
-    if (PyString_Check(type)) {
-        if (PyErr_Warn(PyExc_DeprecationWarning,
-                "raising a string exception is deprecated"))
-            goto raise_error;
+    return b == &PyBaseObject_Type;
+}
+static CYTHON_INLINE int __Pyx_IsSubtype(PyTypeObject *a, PyTypeObject *b) {
+    PyObject *mro;
+    if (a == b) return 1;
+    mro = a->tp_mro;
+    if (likely(mro)) {
+        Py_ssize_t i, n;
+        n = PyTuple_GET_SIZE(mro);
+        for (i = 0; i < n; i++) {
+            if (PyTuple_GET_ITEM(mro, i) == (PyObject *)b)
+                return 1;
+        }
+        return 0;
     }
-    else if (PyType_Check(type) || PyClass_Check(type))
-        ; /*PyErr_NormalizeException(&type, &value, &tb);*/
-    else {
-        /* Raising an instance.  The value should be a dummy. */
-        if (value != Py_None) {
-            PyErr_SetString(PyExc_TypeError,
-                "instance exception may not have a separate value");
-            goto raise_error;
+    return __Pyx_InBases(a, b);
+}
+#if PY_MAJOR_VERSION == 2
+static int __Pyx_inner_PyErr_GivenExceptionMatches2(PyObject *err, PyObject* exc_type1, PyObject* exc_type2) {
+    PyObject *exception, *value, *tb;
+    int res;
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    __Pyx_ErrFetch(&exception, &value, &tb);
+    res = exc_type1 ? PyObject_IsSubclass(err, exc_type1) : 0;
+    if (unlikely(res == -1)) {
+        PyErr_WriteUnraisable(err);
+        res = 0;
+    }
+    if (!res) {
+        res = PyObject_IsSubclass(err, exc_type2);
+        if (unlikely(res == -1)) {
+            PyErr_WriteUnraisable(err);
+            res = 0;
         }
-        /* Normalize to raise <class>, <instance> */
-        Py_DECREF(value);
-        value = type;
-        if (PyInstance_Check(type))
-            type = (PyObject*) ((PyInstanceObject*)type)->in_class;
-        else
-            type = (PyObject*) type->ob_type;
-        Py_INCREF(type);
     }
-    PyErr_Restore(type, value, tb);
-    return;
-raise_error:
-    Py_XDECREF(value);
-    Py_XDECREF(type);
-    Py_XDECREF(tb);
-    return;
+    __Pyx_ErrRestore(exception, value, tb);
+    return res;
 }
-
-static void __Pyx_ReRaise(void) {
-    PyThreadState *tstate = PyThreadState_Get();
-    PyObject *type = tstate->exc_type;
-    PyObject *value = tstate->exc_value;
-    PyObject *tb = tstate->exc_traceback;
-    Py_XINCREF(type);
-    Py_XINCREF(value);
-    Py_XINCREF(tb);
-    PyErr_Restore(type, value, tb);
+#else
+static CYTHON_INLINE int __Pyx_inner_PyErr_GivenExceptionMatches2(PyObject *err, PyObject* exc_type1, PyObject *exc_type2) {
+    int res = exc_type1 ? __Pyx_IsSubtype((PyTypeObject*)err, (PyTypeObject*)exc_type1) : 0;
+    if (!res) {
+        res = __Pyx_IsSubtype((PyTypeObject*)err, (PyTypeObject*)exc_type2);
+    }
+    return res;
+}
+#endif
+static int __Pyx_PyErr_GivenExceptionMatchesTuple(PyObject *exc_type, PyObject *tuple) {
+    Py_ssize_t i, n;
+    assert(PyExceptionClass_Check(exc_type));
+    n = PyTuple_GET_SIZE(tuple);
+#if PY_MAJOR_VERSION >= 3
+    for (i=0; i<n; i++) {
+        if (exc_type == PyTuple_GET_ITEM(tuple, i)) return 1;
+    }
+#endif
+    for (i=0; i<n; i++) {
+        PyObject *t = PyTuple_GET_ITEM(tuple, i);
+        #if PY_MAJOR_VERSION < 3
+        if (likely(exc_type == t)) return 1;
+        #endif
+        if (likely(PyExceptionClass_Check(t))) {
+            if (__Pyx_inner_PyErr_GivenExceptionMatches2(exc_type, NULL, t)) return 1;
+        } else {
+        }
+    }
+    return 0;
 }
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches(PyObject *err, PyObject* exc_type) {
+    if (likely(err == exc_type)) return 1;
+    if (likely(PyExceptionClass_Check(err))) {
+        if (likely(PyExceptionClass_Check(exc_type))) {
+            return __Pyx_inner_PyErr_GivenExceptionMatches2(err, NULL, exc_type);
+        } else if (likely(PyTuple_Check(exc_type))) {
+            return __Pyx_PyErr_GivenExceptionMatchesTuple(err, exc_type);
+        } else {
+        }
+    }
+    return PyErr_GivenExceptionMatches(err, exc_type);
+}
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches2(PyObject *err, PyObject *exc_type1, PyObject *exc_type2) {
+    assert(PyExceptionClass_Check(exc_type1));
+    assert(PyExceptionClass_Check(exc_type2));
+    if (likely(err == exc_type1 || err == exc_type2)) return 1;
+    if (likely(PyExceptionClass_Check(err))) {
+        return __Pyx_inner_PyErr_GivenExceptionMatches2(err, exc_type1, exc_type2);
+    }
+    return (PyErr_GivenExceptionMatches(err, exc_type1) || PyErr_GivenExceptionMatches(err, exc_type2));
+}
+#endif
 
-static int __Pyx_InternStrings(__Pyx_InternTabEntry *t) {
-    while (t->p) {
-        *t->p = PyString_InternFromString(t->s);
-        if (!*t->p)
-            return -1;
-        ++t;
+/* CheckBinaryVersion */
+static int __Pyx_check_binary_version(void) {
+    char ctversion[5];
+    int same=1, i, found_dot;
+    const char* rt_from_call = Py_GetVersion();
+    PyOS_snprintf(ctversion, 5, "%d.%d", PY_MAJOR_VERSION, PY_MINOR_VERSION);
+    found_dot = 0;
+    for (i = 0; i < 4; i++) {
+        if (!ctversion[i]) {
+            same = (rt_from_call[i] < '0' || rt_from_call[i] > '9');
+            break;
+        }
+        if (rt_from_call[i] != ctversion[i]) {
+            same = 0;
+            break;
+        }
+    }
+    if (!same) {
+        char rtversion[5] = {'\0'};
+        char message[200];
+        for (i=0; i<4; ++i) {
+            if (rt_from_call[i] == '.') {
+                if (found_dot) break;
+                found_dot = 1;
+            } else if (rt_from_call[i] < '0' || rt_from_call[i] > '9') {
+                break;
+            }
+            rtversion[i] = rt_from_call[i];
+        }
+        PyOS_snprintf(message, sizeof(message),
+                      "compiletime version %s of module '%.100s' "
+                      "does not match runtime version %s",
+                      ctversion, __Pyx_MODULE_NAME, rtversion);
+        return PyErr_WarnEx(NULL, message, 1);
     }
     return 0;
 }
 
+/* InitStrings */
 static int __Pyx_InitStrings(__Pyx_StringTabEntry *t) {
     while (t->p) {
-        *t->p = PyString_FromStringAndSize(t->s, t->n - 1);
+        #if PY_MAJOR_VERSION < 3
+        if (t->is_unicode) {
+            *t->p = PyUnicode_DecodeUTF8(t->s, t->n - 1, NULL);
+        } else if (t->intern) {
+            *t->p = PyString_InternFromString(t->s);
+        } else {
+            *t->p = PyString_FromStringAndSize(t->s, t->n - 1);
+        }
+        #else
+        if (t->is_unicode | t->is_str) {
+            if (t->intern) {
+                *t->p = PyUnicode_InternFromString(t->s);
+            } else if (t->encoding) {
+                *t->p = PyUnicode_Decode(t->s, t->n - 1, t->encoding, NULL);
+            } else {
+                *t->p = PyUnicode_FromStringAndSize(t->s, t->n - 1);
+            }
+        } else {
+            *t->p = PyBytes_FromStringAndSize(t->s, t->n - 1);
+        }
+        #endif
         if (!*t->p)
             return -1;
+        if (PyObject_Hash(*t->p) == -1)
+            return -1;
         ++t;
     }
     return 0;
 }
 
-#include "compile.h"
-#include "frameobject.h"
-#include "traceback.h"
-
-static void __Pyx_AddTraceback(char *funcname) {
-    PyObject *py_srcfile = 0;
-    PyObject *py_funcname = 0;
-    PyObject *py_globals = 0;
-    PyObject *empty_tuple = 0;
-    PyObject *empty_string = 0;
-    PyCodeObject *py_code = 0;
-    PyFrameObject *py_frame = 0;
-    
-    py_srcfile = PyString_FromString(__pyx_filename);
-    if (!py_srcfile) goto bad;
-    py_funcname = PyString_FromString(funcname);
-    if (!py_funcname) goto bad;
-    py_globals = PyModule_GetDict(__pyx_m);
-    if (!py_globals) goto bad;
-    empty_tuple = PyTuple_New(0);
-    if (!empty_tuple) goto bad;
-    empty_string = PyString_FromString("");
-    if (!empty_string) goto bad;
-    py_code = PyCode_New(
-        0,            /*int argcount,*/
-        0,            /*int nlocals,*/
-        0,            /*int stacksize,*/
-        0,            /*int flags,*/
-        empty_string, /*PyObject *code,*/
-        empty_tuple,  /*PyObject *consts,*/
-        empty_tuple,  /*PyObject *names,*/
-        empty_tuple,  /*PyObject *varnames,*/
-        empty_tuple,  /*PyObject *freevars,*/
-        empty_tuple,  /*PyObject *cellvars,*/
-        py_srcfile,   /*PyObject *filename,*/
-        py_funcname,  /*PyObject *name,*/
-        __pyx_lineno,   /*int firstlineno,*/
-        empty_string  /*PyObject *lnotab*/
-    );
-    if (!py_code) goto bad;
-    py_frame = PyFrame_New(
-        PyThreadState_Get(), /*PyThreadState *tstate,*/
-        py_code,             /*PyCodeObject *code,*/
-        py_globals,          /*PyObject *globals,*/
-        0                    /*PyObject *locals*/
-    );
-    if (!py_frame) goto bad;
-    py_frame->f_lineno = __pyx_lineno;
-    PyTraceBack_Here(py_frame);
-bad:
-    Py_XDECREF(py_srcfile);
-    Py_XDECREF(py_funcname);
-    Py_XDECREF(empty_tuple);
-    Py_XDECREF(empty_string);
-    Py_XDECREF(py_code);
-    Py_XDECREF(py_frame);
+static CYTHON_INLINE PyObject* __Pyx_PyUnicode_FromString(const char* c_str) {
+    return __Pyx_PyUnicode_FromStringAndSize(c_str, (Py_ssize_t)strlen(c_str));
+}
+static CYTHON_INLINE const char* __Pyx_PyObject_AsString(PyObject* o) {
+    Py_ssize_t ignore;
+    return __Pyx_PyObject_AsStringAndSize(o, &ignore);
+}
+#if __PYX_DEFAULT_STRING_ENCODING_IS_ASCII || __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT
+#if !CYTHON_PEP393_ENABLED
+static const char* __Pyx_PyUnicode_AsStringAndSize(PyObject* o, Py_ssize_t *length) {
+    char* defenc_c;
+    PyObject* defenc = _PyUnicode_AsDefaultEncodedString(o, NULL);
+    if (!defenc) return NULL;
+    defenc_c = PyBytes_AS_STRING(defenc);
+#if __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
+    {
+        char* end = defenc_c + PyBytes_GET_SIZE(defenc);
+        char* c;
+        for (c = defenc_c; c < end; c++) {
+            if ((unsigned char) (*c) >= 128) {
+                PyUnicode_AsASCIIString(o);
+                return NULL;
+            }
+        }
+    }
+#endif
+    *length = PyBytes_GET_SIZE(defenc);
+    return defenc_c;
+}
+#else
+static CYTHON_INLINE const char* __Pyx_PyUnicode_AsStringAndSize(PyObject* o, Py_ssize_t *length) {
+    if (unlikely(__Pyx_PyUnicode_READY(o) == -1)) return NULL;
+#if __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
+    if (likely(PyUnicode_IS_ASCII(o))) {
+        *length = PyUnicode_GET_LENGTH(o);
+        return PyUnicode_AsUTF8(o);
+    } else {
+        PyUnicode_AsASCIIString(o);
+        return NULL;
+    }
+#else
+    return PyUnicode_AsUTF8AndSize(o, length);
+#endif
+}
+#endif
+#endif
+static CYTHON_INLINE const char* __Pyx_PyObject_AsStringAndSize(PyObject* o, Py_ssize_t *length) {
+#if __PYX_DEFAULT_STRING_ENCODING_IS_ASCII || __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT
+    if (
+#if PY_MAJOR_VERSION < 3 && __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
+            __Pyx_sys_getdefaultencoding_not_ascii &&
+#endif
+            PyUnicode_Check(o)) {
+        return __Pyx_PyUnicode_AsStringAndSize(o, length);
+    } else
+#endif
+#if (!CYTHON_COMPILING_IN_PYPY) || (defined(PyByteArray_AS_STRING) && defined(PyByteArray_GET_SIZE))
+    if (PyByteArray_Check(o)) {
+        *length = PyByteArray_GET_SIZE(o);
+        return PyByteArray_AS_STRING(o);
+    } else
+#endif
+    {
+        char* result;
+        int r = PyBytes_AsStringAndSize(o, &result, length);
+        if (unlikely(r < 0)) {
+            return NULL;
+        } else {
+            return result;
+        }
+    }
+}
+static CYTHON_INLINE int __Pyx_PyObject_IsTrue(PyObject* x) {
+   int is_true = x == Py_True;
+   if (is_true | (x == Py_False) | (x == Py_None)) return is_true;
+   else return PyObject_IsTrue(x);
+}
+static CYTHON_INLINE int __Pyx_PyObject_IsTrueAndDecref(PyObject* x) {
+    int retval;
+    if (unlikely(!x)) return -1;
+    retval = __Pyx_PyObject_IsTrue(x);
+    Py_DECREF(x);
+    return retval;
 }
+static PyObject* __Pyx_PyNumber_IntOrLongWrongResultType(PyObject* result, const char* type_name) {
+#if PY_MAJOR_VERSION >= 3
+    if (PyLong_Check(result)) {
+        if (PyErr_WarnFormat(PyExc_DeprecationWarning, 1,
+                "__int__ returned non-int (type %.200s).  "
+                "The ability to return an instance of a strict subclass of int "
+                "is deprecated, and may be removed in a future version of Python.",
+                Py_TYPE(result)->tp_name)) {
+            Py_DECREF(result);
+            return NULL;
+        }
+        return result;
+    }
+#endif
+    PyErr_Format(PyExc_TypeError,
+                 "__%.4s__ returned non-%.4s (type %.200s)",
+                 type_name, type_name, Py_TYPE(result)->tp_name);
+    Py_DECREF(result);
+    return NULL;
+}
+static CYTHON_INLINE PyObject* __Pyx_PyNumber_IntOrLong(PyObject* x) {
+#if CYTHON_USE_TYPE_SLOTS
+  PyNumberMethods *m;
+#endif
+  const char *name = NULL;
+  PyObject *res = NULL;
+#if PY_MAJOR_VERSION < 3
+  if (likely(PyInt_Check(x) || PyLong_Check(x)))
+#else
+  if (likely(PyLong_Check(x)))
+#endif
+    return __Pyx_NewRef(x);
+#if CYTHON_USE_TYPE_SLOTS
+  m = Py_TYPE(x)->tp_as_number;
+  #if PY_MAJOR_VERSION < 3
+  if (m && m->nb_int) {
+    name = "int";
+    res = m->nb_int(x);
+  }
+  else if (m && m->nb_long) {
+    name = "long";
+    res = m->nb_long(x);
+  }
+  #else
+  if (likely(m && m->nb_int)) {
+    name = "int";
+    res = m->nb_int(x);
+  }
+  #endif
+#else
+  if (!PyBytes_CheckExact(x) && !PyUnicode_CheckExact(x)) {
+    res = PyNumber_Int(x);
+  }
+#endif
+  if (likely(res)) {
+#if PY_MAJOR_VERSION < 3
+    if (unlikely(!PyInt_Check(res) && !PyLong_Check(res))) {
+#else
+    if (unlikely(!PyLong_CheckExact(res))) {
+#endif
+        return __Pyx_PyNumber_IntOrLongWrongResultType(res, name);
+    }
+  }
+  else if (!PyErr_Occurred()) {
+    PyErr_SetString(PyExc_TypeError,
+                    "an integer is required");
+  }
+  return res;
+}
+static CYTHON_INLINE Py_ssize_t __Pyx_PyIndex_AsSsize_t(PyObject* b) {
+  Py_ssize_t ival;
+  PyObject *x;
+#if PY_MAJOR_VERSION < 3
+  if (likely(PyInt_CheckExact(b))) {
+    if (sizeof(Py_ssize_t) >= sizeof(long))
+        return PyInt_AS_LONG(b);
+    else
+        return PyInt_AsSsize_t(b);
+  }
+#endif
+  if (likely(PyLong_CheckExact(b))) {
+    #if CYTHON_USE_PYLONG_INTERNALS
+    const digit* digits = ((PyLongObject*)b)->ob_digit;
+    const Py_ssize_t size = Py_SIZE(b);
+    if (likely(__Pyx_sst_abs(size) <= 1)) {
+        ival = likely(size) ? digits[0] : 0;
+        if (size == -1) ival = -ival;
+        return ival;
+    } else {
+      switch (size) {
+         case 2:
+           if (8 * sizeof(Py_ssize_t) > 2 * PyLong_SHIFT) {
+             return (Py_ssize_t) (((((size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+         case -2:
+           if (8 * sizeof(Py_ssize_t) > 2 * PyLong_SHIFT) {
+             return -(Py_ssize_t) (((((size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+         case 3:
+           if (8 * sizeof(Py_ssize_t) > 3 * PyLong_SHIFT) {
+             return (Py_ssize_t) (((((((size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+         case -3:
+           if (8 * sizeof(Py_ssize_t) > 3 * PyLong_SHIFT) {
+             return -(Py_ssize_t) (((((((size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+         case 4:
+           if (8 * sizeof(Py_ssize_t) > 4 * PyLong_SHIFT) {
+             return (Py_ssize_t) (((((((((size_t)digits[3]) << PyLong_SHIFT) | (size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+         case -4:
+           if (8 * sizeof(Py_ssize_t) > 4 * PyLong_SHIFT) {
+             return -(Py_ssize_t) (((((((((size_t)digits[3]) << PyLong_SHIFT) | (size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+      }
+    }
+    #endif
+    return PyLong_AsSsize_t(b);
+  }
+  x = PyNumber_Index(b);
+  if (!x) return -1;
+  ival = PyInt_AsSsize_t(x);
+  Py_DECREF(x);
+  return ival;
+}
+static CYTHON_INLINE Py_hash_t __Pyx_PyIndex_AsHash_t(PyObject* o) {
+  if (sizeof(Py_hash_t) == sizeof(Py_ssize_t)) {
+    return (Py_hash_t) __Pyx_PyIndex_AsSsize_t(o);
+#if PY_MAJOR_VERSION < 3
+  } else if (likely(PyInt_CheckExact(o))) {
+    return PyInt_AS_LONG(o);
+#endif
+  } else {
+    Py_ssize_t ival;
+    PyObject *x;
+    x = PyNumber_Index(o);
+    if (!x) return -1;
+    ival = PyInt_AsLong(x);
+    Py_DECREF(x);
+    return ival;
+  }
+}
+static CYTHON_INLINE PyObject * __Pyx_PyBool_FromLong(long b) {
+  return b ? __Pyx_NewRef(Py_True) : __Pyx_NewRef(Py_False);
+}
+static CYTHON_INLINE PyObject * __Pyx_PyInt_FromSize_t(size_t ival) {
+    return PyInt_FromSize_t(ival);
+}
+
+
+#endif /* Py_PYTHON_H */
@@ -3,7 +3,11 @@
 __all__ = [
     'NO_ADAPTER_NEEDED', 'DOES_NOT_SUPPORT',
     'adapt', 'Protocol__adapt__', 'metamethod', 'classicMRO', 'getMRO',
-    'Protocol__call__',
+    'Protocol__call__', 'installInterfaceCall', 'AdapterChain',
+    'Protocol_getAdapterForType', 'adapt_many', 'adapt_first', 'adapt_each',
+    'AdapterRecord', 'ProviderMixin__conform__',
+    'installConformsRegistry', 'minimumAdapter', 'updateWithSimplestAdapter',
+    'ADAPT_SEQUENCE',
 ]
 
 cdef extern from "Python.h":
@@ -12,14 +16,23 @@ cdef extern from "Python.h":
     int PyInstance_Check(object ob)
     int PyObject_TypeCheck(object ob, object tp)
     int PyObject_IsInstance(object inst, object cls)
+    int PyDict_Check(object ob)
+    int PyDict_CheckExact(object ob)
+    int PyInt_CheckExact(object ob)
+    long PyInt_AS_LONG(object ob)
+    int PyDict_SetItem(object dict, object key, object value) except -1
     int PyErr_ExceptionMatches(void *exc)
+    void *PyErr_Occurred()
 
     void *PyExc_AttributeError
     void *PyObject_GetAttr(object ob, object attr)
     void PyErr_Clear()
 
     object PyString_InternFromString(char *v)
+    object PyLong_FromVoidPtr(void *p)
+    object PyWeakref_NewRef(object ob, void *callback)
     object PyMethod_New(object func, object self, object cls)
+    object PyMethod_NewUnbound "PyMethod_New" (object func, void *s, object c)
 
     ctypedef struct PyTupleObject:
         void *ob_item   # we don't use this, but we can't use 'pass' here
@@ -27,25 +40,39 @@ cdef extern from "Python.h":
     ctypedef struct PyListObject:
         void *ob_item   # we don't use this, but we can't use 'pass' here
 
+    ctypedef object (*ternaryfunc)(object, object, void *)
+
     ctypedef struct PyTypeObject:
         PyTupleObject *tp_mro
+        void *tp_dict
+        void *tp_getattro
+        ternaryfunc tp_call
 
     ctypedef struct PyObject:
         PyTypeObject *ob_type
 
     ctypedef struct PyClassObject:
         PyTupleObject *cl_bases
+        void *cl_dict
 
     ctypedef struct PyInstanceObject:
         PyClassObject *in_class
+        void *in_dict
 
     int PyObject_IsSubclass(PyClassObject *derived, object cls)
     int PyList_Append(PyListObject *list, object item) except -1
+    object PyList_New(int size)
+    void PyList_SET_ITEM(object list, int pos, object item)  # steals 'item'
+    void Py_INCREF(object ob)
     int PyTuple_GET_SIZE(PyTupleObject *p)
     int PyList_GET_SIZE(PyListObject *p)
     int PyTuple_Check(object op)
     int PyList_Check(object op)
+    int PyTuple_CheckExact(object op)
+    int PyList_CheckExact(object op)
     int len "PyObject_Length" (object o) except -1
+    int PyObject_RichCompareBool(object a, object b, int op) except -1
+    int Py_EQ
     object type "PyObject_Type" (object o)
 
     # These macros return borrowed references, so we make them void *
@@ -53,15 +80,23 @@ cdef extern from "Python.h":
     void * PyTuple_GET_ITEM(PyTupleObject *p, int pos)
     void * PyList_GET_ITEM(PyListObject *p, int pos)
     void * PyDict_GetItem(object dict,object key)
+    void * _PyType_Lookup(PyTypeObject *type, object name)
+    void ** _PyObject_GetDictPtr(object ob)
 
     PyTypeObject PyInstance_Type
     PyTypeObject PyBaseObject_Type
+    PyTypeObject PyType_Type
+
+    object PyObject_Call(object callable, object args, void *kw)
 
     void Py_DECREF(PyObject *p)
-    object __Pyx_GetExcValue()
 
-cdef object _marker, __conform, __adapt, __mro, __ECType
+cdef object _marker, _failed, __conform, __adapt, __mro, __init, __ECType
+cdef object _interfaceInit, _interfaceCall
+cdef object _classicMROs, _classicMROData
+cdef void *_objectClass
 from sys import exc_info
+from weakref import WeakKeyDictionary
 from protocols.adapters import AdaptationFailure
 
 try:
@@ -71,10 +106,23 @@ except ImportError:
     __ECType = type(object)
 
 _marker    = object()
+_failed    = object()
 __conform  = PyString_InternFromString("__conform__")
 __adapt    = PyString_InternFromString("__adapt__")
 __class    = PyString_InternFromString("__class__")
 __mro      = PyString_InternFromString("__mro__")
+__init     = PyString_InternFromString("__init__")
+
+# 'object.__class__', the descriptor most types inherit
+_objectClass = _PyType_Lookup(&PyBaseObject_Type, __class)
+
+_classicMROs = WeakKeyDictionary()
+_classicMROData = _classicMROs.data
+
+
+cdef int reraise() except -1:
+    # Pass on the error a C API call has already set
+    return -1
 
 
 
@@ -111,73 +159,314 @@ cdef class metamethod:
         raise AttributeError("Read-only attribute")
 
 
+cdef class AdapterChain:
+    """Adapter factory that applies a sequence of adapters in turn"""
 
+    cdef readonly object adapters
+    cdef int count
 
+    def __init__(self, adapters):
+        self.adapters = tuple(adapters)
+        self.count = 0
+        for adapter in self.adapters:
+            self.count = self.count + getattr(adapter,'__adapterCount__',1)
 
+    property __adapterCount__:
+        def __get__(self):
+            return self.count
 
+    def __call__(self, ob):
+        cdef int i
+        for i from 0 <= i < PyTuple_GET_SIZE(<PyTupleObject *>self.adapters):
+            ob = (<object> PyTuple_GET_ITEM(<PyTupleObject *>self.adapters, i))(ob)
+            if ob is None:
+                return None
+        return ob
 
+    def __reduce__(self):
+        return AdapterChain, (self.adapters,)
 
+    def __repr__(self):
+        return "AdapterChain(%r)" % (self.adapters,)
 
 
+cdef class AdapterRecord:
+    """An adapter registered at an implication depth, in an adapter registry"""
 
+    cdef readonly object adapter, depth, count, unbound
 
-cdef object _adapt(obj, protocol, default):
+    def __init__(self, adapter, depth):
+        self.adapter = self.unbound = adapter
+        self.depth = depth
+        self.count = 1
+        if adapter is NO_ADAPTER_NEEDED or adapter is DOES_NOT_SUPPORT:
+            return
+        if PyObject_TypeCheck(adapter, AdapterChain):
+            self.count = (<AdapterChain> adapter).count
+            return
+        self.count = getattr(adapter,'__adapterCount__',1)
+        self.unbound = getattr(adapter,'__unbound_adapter__',adapter)
+
+    def __getitem__(self, index):
+        return (self.adapter, self.depth)[index]
+
+    def __len__(self):
+        return 2
+
+    def __iter__(self):
+        return iter((self.adapter, self.depth))
+
+    def __reduce__(self):
+        return AdapterRecord, (self.adapter, self.depth)
+
+    def __repr__(self):
+        return "AdapterRecord(%r, %r)" % (self.adapter, self.depth)
+
+
+cdef int compareDepths(d1, d2) except -2:
+
+    # -1, 0 or 1 as 'd1' is less than, equal to, or greater than 'd2'
+
+    if PyInt_CheckExact(d1) and PyInt_CheckExact(d2):
+        if PyInt_AS_LONG(d1) < PyInt_AS_LONG(d2):
+            return -1
+        return PyInt_AS_LONG(d1) > PyInt_AS_LONG(d2)
+
+    if d1 < d2:
+        return -1
+    return d1 > d2
+
+
+cdef AdapterRecord minimumRecord(AdapterRecord r1, AdapterRecord r2):
+
+    # '_minimumRecord()' in 'protocols.adapters'
+
+    cdef int cmp
+
+    cmp = compareDepths(r1.depth, r2.depth)
+
+    if cmp < 0:
+        return r1
+    elif cmp > 0:
+        return r2
+
+    if r1.unbound is r2.unbound:
+        return r1   # don't care which
+
+    cmp = compareDepths(r1.count, r2.count)
+
+    if cmp < 0:
+        return r1
+    elif cmp > 0:
+        return r2
+
+    a1 = r1.adapter
+    a2 = r2.adapter
+
+    if a1 is NO_ADAPTER_NEEDED or a2 is DOES_NOT_SUPPORT:
+        return r1
+
+    if a1 is DOES_NOT_SUPPORT or a2 is NO_ADAPTER_NEEDED:
+        return r2
+
+    # it's ambiguous
+    raise TypeError("Ambiguous adapter choice", a1, a2, r1.depth, r2.depth)
+
+
+def minimumAdapter(a1,a2,d1=0,d2=0):
+    """Shortest route to implementation, 'a1' @ depth 'd1', or 'a2' @ 'd2'?"""
+
+    cdef int cmp
+
+    cmp = compareDepths(d1, d2)
+
+    if cmp < 0:
+        return a1
+    elif cmp > 0 :
+        return a2
+    elif a1 is a2:
+        return a1
+
+    return minimumRecord(AdapterRecord(a1,d1), AdapterRecord(a2,d2)).adapter
 
-    # We use nested 'if' blocks here because using 'and' causes Pyrex to
-    # convert the return values to Python ints, and then back to booleans!
+
+def updateWithSimplestAdapter(mapping, key, adapter, depth):
+    """Replace 'mapping[key]' w/'adapter' @ 'depth', return true if changed"""
 
     cdef void *tmp
+    cdef int cmp, exact
+    cdef AdapterRecord record
 
-    if PyType_Check(protocol):
-        if PyObject_TypeCheck(obj, protocol):
-            return obj
+    exact = PyDict_CheckExact(mapping)
 
-    if PyClass_Check(protocol):
-        if PyInstance_Check(obj):
-            if PyObject_IsInstance(obj,protocol):
-                return obj
+    if exact:
+        tmp = PyDict_GetItem(mapping, key)
+        if tmp:
+            old = <object> tmp
+        else:
+            old = None
+    else:
+        old = mapping.get(key)
+
+    if old is not None:
+        if not PyObject_TypeCheck(old, AdapterRecord):
+            try:
+                old = AdapterRecord(old.adapter, old.depth)
+            except AttributeError:
+                old = AdapterRecord(*old)   # e.g. a tuple from an older pickle
+
+        record = old
+        cmp = compareDepths(depth, record.depth)
+
+        if cmp > 0 or adapter is record.adapter and cmp == 0:
+            return False    # the existing entry is at least as short
+
+        new = AdapterRecord(adapter,depth)
+        if cmp == 0 and minimumRecord(record, new) is record:
+            return False
+    else:
+        new = AdapterRecord(adapter,depth)
+
+    if exact:
+        PyDict_SetItem(mapping, key, new)
+    else:
+        mapping[key] = new
+
+    return True
+
+
+cdef int mayConform(obj):
+
+    # Return false if 'obj' can't possibly have a '__conform__' attribute,
+    # so _adapt() doesn't need to create and discard an AttributeError.
+    # This is only decidable for objects using the generic getattr; classic
+    # instances and objects w/custom '__getattr__' are assumed to conform.
+
+    cdef PyTypeObject *tp
+    cdef void **dictptr
+
+    tp = (<PyObject *>obj).ob_type
+    if tp.tp_getattro != PyBaseObject_Type.tp_getattro:
+        return 1
+
+    if _PyType_Lookup(tp, __conform):
+        return 1
+
+    dictptr = _PyObject_GetDictPtr(obj)
+    if dictptr:
+        if dictptr[0]:
+            if PyDict_GetItem(<object> dictptr[0], __conform):
+                return 1
+    return 0
+
+
+cdef object getConform(obj):
+
+    # Return 'obj.__conform__', or None if 'obj' has no __conform__
+
+    cdef void *tmp
+
+    if not mayConform(obj):
+        return None
 
     tmp = PyObject_GetAttr(obj, __conform)
     if tmp:
         meth = <object> tmp
         Py_DECREF(<PyObject *>tmp)
-        try:
-            result = meth(protocol)
-            if result is not None:
-                return result
-        except TypeError:
-            if exc_info()[2].tb_next is not None:
-                raise
+        return meth
     elif PyErr_ExceptionMatches(PyExc_AttributeError):
         PyErr_Clear()
+        return None
     else:
-        err = __Pyx_GetExcValue()
-        raise
+        reraise()
 
 
+cdef object callConform(meth, protocol):
 
+    # Return 'meth(protocol)', or None if it's an unsuitable __conform__
 
+    try:
+        return meth(protocol)
+    except TypeError:
+        if exc_info()[2].tb_next is not None:
+            raise
 
 
+cdef object callAdapt(obj, protocol):
 
+    # Return 'protocol.__adapt__(obj)', or None if unavailable/unsuitable
 
+    cdef void *tmp
 
     tmp = PyObject_GetAttr(protocol, __adapt)
     if tmp:
         meth = <object> tmp
         Py_DECREF(<PyObject *>tmp)
         try:
-            result = meth(obj)
-            if result is not None:
-                return result
+            return meth(obj)
         except TypeError:
             if exc_info()[2].tb_next is not None:
                 raise
     elif PyErr_ExceptionMatches(PyExc_AttributeError):
         PyErr_Clear()
     else:
-        err = __Pyx_GetExcValue()
-        raise
+        reraise()
+
+
+cdef int isInstanceOf(obj, protocol):
+
+    # We use nested 'if' blocks here because using 'and' causes Pyrex to
+    # convert the return values to Python ints, and then back to booleans!
+
+    if PyType_Check(protocol):
+        if PyObject_TypeCheck(obj, protocol):
+            return 1
+
+    if PyClass_Check(protocol):
+        if PyInstance_Check(obj):
+            if PyObject_IsInstance(obj,protocol):
+                return 1
+
+    return 0
+
+
+cdef int hasProtocolAdapt(protocol) except -1:
+
+    # Is 'protocol' using the standard 'Protocol.__adapt__'?  If so, we can
+    # look up its adapters by class, instead of calling '__adapt__'.  (Its
+    # class, not its type, as 'Protocol' instances are classic instances.)
+
+    cdef void *tmp
+
+    tmp = PyObject_GetAttr(getClass(protocol), __adapt)
+    if not tmp:
+        PyErr_Clear()
+        return 0
+
+    meth = <object> tmp
+    Py_DECREF(<PyObject *>tmp)
+
+    if isinstance(meth, metamethod):
+        if (<metamethod> meth).func is Protocol__adapt__:
+            return 1
+
+    return 0
+
+
+cdef object _adapt(obj, protocol, default):
+
+    if isInstanceOf(obj, protocol):
+        return obj
+
+    meth = getConform(obj)
+    if meth is not None:
+        result = callConform(meth, protocol)
+        if result is not None:
+            return result
+
+    result = callAdapt(obj, protocol)
+    if result is not None:
+        return result
 
     if default is _marker:
         raise AdaptationFailure("Can't adapt", obj, protocol)
@@ -185,6 +474,52 @@ cdef object _adapt(obj, protocol, default):
     return default
 
 
+cdef object _adaptEach(obj, protocols, default, int first):
+
+    # Adapt 'obj' to each of 'protocols', fetching its __conform__ and class
+    # only once.  If 'first' is true, return the first result found (or
+    # 'default'), otherwise return a list of all the results.
+
+    conform = getConform(obj)
+    cls = None
+    out = []
+
+    for protocol in protocols:
+
+        if isInstanceOf(obj, protocol):
+            result = obj
+        else:
+            result = None
+
+        if result is None:
+            if conform is not None:
+                result = callConform(conform, protocol)
+
+        if result is None:
+            if hasProtocolAdapt(protocol):
+                if cls is None:
+                    cls = getClass(obj)
+                factory = lookupAdapter(protocol, cls)
+                if factory is not None:
+                    result = factory(obj)
+            else:
+                result = callAdapt(obj, protocol)
+
+        if result is None:
+            result = default
+        elif first:
+            return result
+
+        PyList_Append(<PyListObject *>out, result)
+
+    if first:
+        if default is _marker:
+            raise AdaptationFailure("Can't adapt", obj, protocols)
+        return default
+
+    return out
+
+
 def adapt(obj, protocol, default=_marker):
     """PEP 246-alike: Adapt 'obj' to 'protocol', return 'default'
 
@@ -198,9 +533,148 @@ def Protocol__call__(self, ob, default=_marker):
     return _adapt(ob,self,default)
 
 
+cdef object adaptMany(objects, protocol, default, int strict):
+
+    # 'adapt_many()', or if 'strict' is true, 'ADAPT_SEQUENCE()': return
+    # None as soon as one of 'objects' can't be adapted.  Lists and tuples
+    # get an output list of the right size up front (but not subclasses,
+    # whose '__len__' might not match what they iterate over).
+
+    cdef void *tmp
+    cdef int i, size, generic
+
+    if PyList_CheckExact(objects) or PyTuple_CheckExact(objects):
+        size = len(objects)
+        out = PyList_New(size)
+    else:
+        size = 0
+        out = []
+
+    i = 0
+    generic = not hasProtocolAdapt(protocol)
+    factories = {}
+
+    for ob in objects:
+
+        if generic:
+            result = _adapt(ob, protocol, _failed)
+
+        elif isInstanceOf(ob, protocol):
+            result = ob
+
+        else:
+            meth = getConform(ob)
+            if meth is not None:
+                result = callConform(meth, protocol)
+            else:
+                result = None
+
+            if result is None:
+                cls = getClass(ob)
+                tmp = PyDict_GetItem(factories, cls)
+                if tmp:
+                    factory = <object> tmp
+                else:
+                    factory = lookupAdapter(protocol, cls)
+                    factories[cls] = factory
+                if factory is not None:
+                    result = factory(ob)
+
+            if result is None:
+                result = _failed
+
+        if result is _failed:
+            if strict:
+                return None     # can't adapt unless all members adapt
+            if default is _marker:
+                raise AdaptationFailure("Can't adapt", ob, protocol)
+            result = default
+
+        if i < size:
+            Py_INCREF(result)
+            PyList_SET_ITEM(out, i, result)
+        else:
+            # not preallocated, or 'objects' grew while we were adapting it
+            PyList_Append(<PyListObject *>out, result)
+
+        i = i + 1
+
+    if i < size:
+        del out[i:]     # 'objects' shrank while we were adapting it
+
+    return out
+
+
+def adapt_many(objects, protocol, default=_marker):
+    """Return a list of 'objects' adapted to 'protocol' (see 'adapt()')
+
+    If 'protocol' uses the standard 'Protocol.__adapt__', its adapter is
+    looked up only once for each class of object."""
+
+    return adaptMany(objects, protocol, default, 0)
+
+
+def ADAPT_SEQUENCE(ob, proto):
+    """Convert iterable 'ob' into list of objects implementing 'proto'"""
+
+    return adaptMany(ob, proto.baseProtocol, None, 1)
+
+
+def adapt_first(obj, protocols, default=_marker):
+    """Return 'obj' adapted to the first of 'protocols' it can be adapted to
+
+    If 'obj' can't be adapted to any of them, return 'default', or raise
+    'AdaptationFailure' if no default is given."""
+
+    return _adaptEach(obj, protocols, default, 1)
+
+
+def adapt_each(obj, protocols, default=None):
+    """Return a list of 'obj' adapted to each of 'protocols', in order
+
+    'default' is used in place of any protocol 'obj' can't be adapted to."""
+
+    return _adaptEach(obj, protocols, default, 0)
+
+
+cdef object InterfaceClass_call(object self, object args, void *kw):
+
+    # tp_call slot for InterfaceClass; this is 'InterfaceClass.__call__',
+    # but without the Python frame and the bound 'Protocol.__call__' method
 
+    cdef int nargs
 
+    if getattr(self, __init) is not _interfaceInit:
+        return PyType_Type.tp_call(self, args, kw)
 
+    nargs = PyTuple_GET_SIZE(<PyTupleObject *>args)
+    if kw == NULL:
+        if nargs == 1:
+            return _adapt(
+                <object> PyTuple_GET_ITEM(<PyTupleObject *>args, 0),
+                self, _marker
+            )
+        elif nargs == 2:
+            return _adapt(
+                <object> PyTuple_GET_ITEM(<PyTupleObject *>args, 0), self,
+                <object> PyTuple_GET_ITEM(<PyTupleObject *>args, 1)
+            )
+
+    # Keyword or bad arguments; let the Python version sort them out
+    return PyObject_Call(_interfaceCall, (self,) + args, kw)
+
+
+def installInterfaceCall(InterfaceClass, Interface):
+    """Put a C version of 'InterfaceClass.__call__' in its tp_call slot
+
+    The Python-level '__call__' is kept for explicit calls; subclasses of
+    'InterfaceClass' use it too, since they don't inherit the slot."""
+
+    global _interfaceInit, _interfaceCall
+
+    _interfaceInit = Interface.__init__
+    _interfaceCall = InterfaceClass.__dict__['__call__']
+    (<PyTypeObject *>InterfaceClass).tp_call = <ternaryfunc> InterfaceClass_call
 
 
 cdef buildClassicMRO(PyClassObject *cls, PyListObject *list):
@@ -217,31 +691,101 @@ cdef buildClassicMRO(PyClassObject *cls, PyListObject *list):
             buildClassicMRO(<PyClassObject *>tmp, list)
 
 
-def classicMRO(ob, extendedClassic=False):
+cdef object basesOf(cls):
+    if PyClass_Check(cls):
+        return <object> (<PyClassObject *>cls).cl_bases
+    return cls.__bases__
 
-    if PyClass_Check(ob):
-        mro = []
-        buildClassicMRO(<PyClassObject *>ob, <PyListObject *>mro)
-        if extendedClassic:
-            PyList_Append(<PyListObject *>mro, <object> &PyInstance_Type)
-            PyList_Append(<PyListObject *>mro, <object> &PyBaseObject_Type)
-        return mro
 
-    raise TypeError("Not a classic class", ob)
+cdef int hasBases(cls, void *bases) except -1:
 
+    # Are 'bases' still the '__bases__' of 'cls'?
 
+    if PyClass_Check(cls):
+        return <void *> ((<PyClassObject *>cls).cl_bases) == bases
 
+    return PyObject_RichCompareBool(cls.__bases__, <object> bases, Py_EQ)
 
 
+cdef int sameClassicBases(cls, cached) except -1:
 
+    # Are the '__bases__' of 'cls' and the classes in its cached MRO still
+    # the ones in 'cached'?
 
+    cdef PyTupleObject *classes
+    cdef PyListObject *bases
+    cdef int i
+
+    if not hasBases(cls, PyTuple_GET_ITEM(<PyTupleObject *>cached, 0)):
+        return 0
 
+    classes = <PyTupleObject *> PyTuple_GET_ITEM(<PyTupleObject *>cached, 1)
+    bases = <PyListObject *> PyTuple_GET_ITEM(<PyTupleObject *>cached, 2)
 
+    for i from 0 <= i < PyTuple_GET_SIZE(classes):
+        if not hasBases(
+            <object> PyTuple_GET_ITEM(classes, i), PyList_GET_ITEM(bases, i)
+        ):
+            return 0
 
+    return 1
 
 
+cdef object classicBases(cls):
 
+    # '_classicBases()' in 'protocols.advice', for classic classes and
+    # ExtensionClasses: '(cls.__bases__, classes, bases, extended)', where
+    # 'classes' is the MRO without 'cls', 'bases' their '__bases__', and
+    # 'extended' is 'classes' plus 'InstanceType' and 'object'.  Cached
+    # until some '__bases__' change, without referring to 'cls'.
 
+    cdef void *tmp
+
+    try:
+        key = PyWeakref_NewRef(cls, NULL)
+    except TypeError:
+        key = None      # not weakly referenceable, so don't cache it
+    else:
+        tmp = PyDict_GetItem(_classicMROData, key)
+        if tmp:
+            if sameClassicBases(cls, <object> tmp):
+                return <object> tmp
+
+    mro = []
+    if PyClass_Check(cls):
+        buildClassicMRO(<PyClassObject *>cls, <PyListObject *>mro)
+    else:
+        buildECMRO(cls, <PyListObject *>mro)
+
+    classes = tuple(mro[1:])
+    bases = []
+    for klass in classes:
+        PyList_Append(<PyListObject *>bases, basesOf(klass))
+
+    result = (
+        basesOf(cls), classes, bases,
+        classes + (<object> &PyInstance_Type, <object> &PyBaseObject_Type)
+    )
+
+    if key is not None:
+        _classicMROs[cls] = result
+
+    return result
+
+
+cdef object cachedMRO(cls, extendedClassic):
+    cached = classicBases(cls)
+    if extendedClassic:
+        return (cls,) + <object> PyTuple_GET_ITEM(<PyTupleObject *>cached, 3)
+    return (cls,) + <object> PyTuple_GET_ITEM(<PyTupleObject *>cached, 1)
+
+
+def classicMRO(ob, extendedClassic=False):
+
+    if PyClass_Check(ob):
+        return cachedMRO(ob, extendedClassic)
+
+    raise TypeError("Not a classic class", ob)
 
 
 cdef buildECMRO(object cls, PyListObject *list):
@@ -251,12 +795,7 @@ cdef buildECMRO(object cls, PyListObject *list):
 
 
 def extClassMRO(ob, extendedClassic=False):
-    mro = []
-    buildECMRO(ob, <PyListObject *>mro)
-    if extendedClassic:
-        PyList_Append(<PyListObject *>mro, <object> &PyInstance_Type)
-        PyList_Append(<PyListObject *>mro, <object> &PyBaseObject_Type)
-    return mro
+    return cachedMRO(ob, extendedClassic)
 
 
 
@@ -285,126 +824,407 @@ def getMRO(ob, extendedClassic=False):
 
 
 
-def Protocol__adapt__(self, obj):
+cdef object getClass(obj):
 
     cdef void *tmp
-    cdef int i
+    cdef PyTypeObject *tp
 
     if PyInstance_Check(obj):
-        cls = <object> ((<PyInstanceObject *>obj).in_class)
+        return <object> ((<PyInstanceObject *>obj).in_class)
+
+    # If the type uses the generic getattr and inherits 'object.__class__',
+    # '__class__' is just the type, and we can skip the attribute lookup.
+    # (This check is cheap, since '_PyType_Lookup()' uses the type's
+    # attribute cache, which is also invalidated if the class changes.)
+    tp = (<PyObject *>obj).ob_type
+    if tp.tp_getattro == PyBaseObject_Type.tp_getattro:
+        if _PyType_Lookup(tp, __class) == _objectClass:
+            return <object> tp
+
+    # Otherwise use __class__ instead of type to support proxies
+    tmp = PyObject_GetAttr(obj, __class)
+
+    if tmp:
+        cls = <object> tmp
+        Py_DECREF(<PyObject *>tmp)
+        return cls
+
+    elif PyErr_ExceptionMatches(PyExc_AttributeError):
+        # Some object have no __class__; use their type
+        PyErr_Clear()
+        return <object> (<PyObject *>obj).ob_type
+
     else:
-        # We use __class__ instead of type to support proxies
-        tmp = PyObject_GetAttr(obj, __class)
+        # Some other error, pass it on up the line
+        reraise()
 
-        if tmp:
-            cls = <object> tmp
-            Py_DECREF(<PyObject *>tmp)
 
-        elif PyErr_ExceptionMatches(PyExc_AttributeError):
-            # Some object have no __class__; use their type
-            PyErr_Clear()
-            cls = <object> (<PyObject *>obj).ob_type
+cdef object classMRO(cls):
 
-        else:
-            # Some other error, pass it on up the line
-            err = __Pyx_GetExcValue()
-            raise
+    # Return the MRO used to look up adapters for instances of 'cls'
 
-    tmp = <void *>0
+    cdef void *tmp
 
     if PyType_Check(cls):
         # It's a type, we can use its mro directly
         tmp = <void *> ((<PyTypeObject *>cls).tp_mro)
+        if tmp:
+            return <object> tmp
 
+    if PyClass_Check(cls):
+        # It's a classic class, use its cached MRO
+        return cachedMRO(cls, 1)
 
+    # Fallback to getting __mro__ (for e.g. security proxies/ExtensionClass)
+    tmp = PyObject_GetAttr(cls, __mro)
+    if tmp:
+        mro = <object> tmp
+        Py_DECREF(<PyObject *>tmp)
+        return mro
 
+    # No __mro__?  Is it an ExtensionClass?
+    elif PyObject_TypeCheck(cls,__ECType):
+        # Yep, toss out the error and compute a reasonable MRO
+        PyErr_Clear()
+        return cachedMRO(cls, 1)
 
+    # Okay, we give up...  reraise the error so somebody smarter than us
+    # can figure it out.  :(
+    else:
+        reraise()
 
 
+cdef int sameBases(bases, mro):
 
+    # Is tuple 'bases' the same as tuple 'mro' without its first item?
 
+    cdef int i, size
 
+    size = PyTuple_GET_SIZE(<PyTupleObject *>bases)
 
+    if size <> PyTuple_GET_SIZE(<PyTupleObject *>mro) - 1:
+        return 0
 
-    if tmp:
-        mro = <object> tmp
+    for i from 0 <= i < size:
+        if PyTuple_GET_ITEM(<PyTupleObject *>bases, i) <> \
+           PyTuple_GET_ITEM(<PyTupleObject *>mro, i+1):
+            return 0
 
-    elif PyClass_Check(cls):
-        # It's a classic class, build up its MRO
-        mro = []
-        buildClassicMRO(<PyClassObject *>cls, <PyListObject *>mro)
-        PyList_Append(<PyListObject *>mro, <object> &PyInstance_Type)
-        PyList_Append(<PyListObject *>mro, <object> &PyBaseObject_Type)
+    return 1
 
-    else:
-        # Fallback to getting __mro__ (for e.g. security proxies/ExtensionClass)
-        tmp = PyObject_GetAttr(cls, __mro)
-        if tmp:
-            mro = <object> tmp
-            Py_DECREF(<PyObject *>tmp)
 
-        # No __mro__?  Is it an ExtensionClass?
-        elif PyObject_TypeCheck(cls,__ECType):
-            # Yep, toss out the error and compute a reasonable MRO
-            PyErr_Clear()
-            mro = extClassMRO(cls, 1)
+cdef void *registryEntry(adapters, klass):
 
-        # Okay, we give up...  reraise the error so somebody smarter than us
-        # can figure it out.  :(
-        else:
-            err = __Pyx_GetExcValue()
-            raise
+    # Return the (borrowed) '__adapters' entry for 'klass', or NULL
 
+    return PyDict_GetItem(adapters, PyLong_FromVoidPtr(<void *>klass))
 
 
+cdef object recordAdapter(record):
+    # A record's adapter; older pickles may have left '(adapter, depth)' tuples
+    if PyObject_TypeCheck(record, AdapterRecord):
+        return (<AdapterRecord> record).adapter
+    elif PyTuple_Check(record):
+        return record[0]
+    return record.adapter
 
 
+cdef object lookupAdapter(self, cls):
 
+    # Return the adapter registered with 'self' for 'cls' or its bases
 
+    cdef void *cached
+    cdef void *entry
+    cdef int i
+
+    changes = self._Protocol__changes
+    adapters = self._Protocol__adapters
+
+    if not adapters:
+        if not self._Protocol__pendingSources:
+            return None     # nothing registered, so nothing to look up
+        adapters = {}
 
+    lookups = self._Protocol__cache
+    cache = classic = None
 
+    if PyClass_Check(cls):
+        # Cached lookups for classic classes are valid as long as the
+        # '__bases__' in their cached MRO are unchanged, so we needn't
+        # fetch the MRO to check them
+        cache = lookups
+        cached = PyDict_GetItem(cache, PyLong_FromVoidPtr(<void *>cls))
+        if cached:
+            if sameClassicBases(
+                cls, <object> PyTuple_GET_ITEM(<PyTupleObject *>cached, 0)
+            ):
+                return <object> PyTuple_GET_ITEM(<PyTupleObject *>cached, 1)
 
+        classic = classicBases(cls)
+        mro = (cls,) + <object> PyTuple_GET_ITEM(<PyTupleObject *>classic, 3)
+
+    else:
+        mro = classMRO(cls)
 
+        if PyType_Check(cls) and \
+           <void *> mro == <void *> ((<PyTypeObject *>cls).tp_mro):
+            # Cached lookups are only valid as long as the MRO is unchanged
+            cache = lookups
+            cached = PyDict_GetItem(cache, PyLong_FromVoidPtr(<void *>cls))
+            if cached:
+                if sameBases(
+                    <object> PyTuple_GET_ITEM(<PyTupleObject *>cached, 0), mro
+                ):
+                    return <object> PyTuple_GET_ITEM(<PyTupleObject *>cached, 1)
 
+    if self._Protocol__pendingSources and self._Protocol__applyPending(mro):
+        # Something was declared, so look again
+        return lookupAdapter(self, cls)
 
-    get = self._Protocol__adapters.get
+    entry = NULL
 
     if PyTuple_Check(mro):
         #print "tuple",mro
         for i from 0 <= i < PyTuple_GET_SIZE(<PyTupleObject *>mro):
-            cls = <object> PyTuple_GET_ITEM(<PyTupleObject *>mro, i)
-            factory=get(cls)
-            if factory is not None:
-                return factory[0](obj)
+            entry = registryEntry(
+                adapters, <object> PyTuple_GET_ITEM(<PyTupleObject *>mro, i)
+            )
+            if entry:
+                break
 
     elif PyList_Check(mro):
         #print "list",mro
         for i from 0 <= i < PyList_GET_SIZE(<PyListObject *>mro):
-            cls = <object> PyList_GET_ITEM(<PyListObject *>mro, i)
-            factory=get(cls)
-            if factory is not None:
-                return factory[0](obj)
+            entry = registryEntry(
+                adapters, <object> PyList_GET_ITEM(<PyListObject *>mro, i)
+            )
+            if entry:
+                break
 
     else:
         #print "other",mro
+        for klass in mro:
+            entry = registryEntry(adapters, klass)
+            if entry:
+                break
+
+    factory = None
+
+    if entry:
+        factory = recordAdapter(<object> entry)
+
+    if cache is not None:
+        # Misses are cached too, to skip the MRO walk next time.  The cache
+        # is keyed by id and doesn't hold 'cls', so it won't keep it alive.
+        key = self._Protocol__cacheKey(cls)
+        if classic is not None:
+            cache[key] = classic, factory
+        else:
+            cache[key] = mro[1:], factory
+
+        if self._Protocol__changes != changes:
+            # A change made during the lookup may have been missed, and its
+            # writer may have discarded the cached lookups before we stored
+            try:
+                del cache[key]
+            except KeyError:
+                pass
+
+    return factory
+
 
+def Protocol_getAdapterForType(self, typ):
+    """Return the adapter for instances of 'typ' (incl. bases), or 'None'"""
+    return lookupAdapter(self, typ)
+
+
+def Protocol__adapt__(self, obj):
+
+    if not self._Protocol__adapters and not self._Protocol__pendingSources:
+        return None     # fast path for protocols with nothing registered
+
+    cls = getClass(obj)
+    factory = lookupAdapter(self, cls)
+
+    if factory is not None:
+        return factory(obj)
+
+
+# Per-object and per-class declarations ('ProviderMixin' and
+# 'conformsRegistry' in 'protocols.classic')
+
+cdef object __provided, _conformsRegistry
+__provided = PyString_InternFromString("__protocols_provided__")
+_conformsRegistry = None
+
+
+cdef object declarationMRO(ob):
+
+    # 'getMRO(ob)': the objects whose declarations apply to 'ob'
+
+    cdef void *tmp
+
+    if PyClass_Check(ob):
+        return cachedMRO(ob, 0)
+
+    elif PyType_Check(ob):
+        tmp = <void *> ((<PyTypeObject *>ob).tp_mro)
+        if tmp:
+            return <object> tmp
+        return ob.__mro__
+
+    elif PyObject_TypeCheck(ob,__ECType):
+        return extClassMRO(ob)
+
+    return (ob,)
+
+
+cdef object declared(ob, name):
+
+    # 'ob.__dict__.get(name)', reading the dictionary directly if possible
+
+    cdef void **dictptr
+    cdef void *tmp
+
+    dictptr = NULL
+    tmp = NULL
+
+    if PyClass_Check(ob):
+        tmp = (<PyClassObject *>ob).cl_dict
+    elif PyInstance_Check(ob):
+        tmp = (<PyInstanceObject *>ob).in_dict
+    elif PyType_Check(ob):
+        tmp = (<PyTypeObject *>ob).tp_dict
+    else:
+        dictptr = _PyObject_GetDictPtr(ob)
+        if dictptr:
+            tmp = dictptr[0]
+
+    if tmp:
+        tmp = PyDict_GetItem(<object> tmp, name)
+        if tmp:
+            return <object> tmp
+        return None
+
+    return ob.__dict__.get(name)
+
+
+cdef object providedRecord(ob, protocol):
+
+    # The record for 'protocol' in 'ob.__protocols_provided__', or 'None'
+
+    cdef void *tmp
+    cdef int i, size
+
+    conf = declared(ob, __provided)
+
+    if conf is None:
+        return None
+
+    elif PyTuple_Check(conf):
+        # a 'providedRegistry': (protocol, record, protocol, record, ...)
+        size = PyTuple_GET_SIZE(<PyTupleObject *>conf)
+        for i from 0 <= i < size-1 by 2:
+            key = <object> PyTuple_GET_ITEM(<PyTupleObject *>conf, i)
+            if key is protocol or PyObject_RichCompareBool(key,protocol,Py_EQ):
+                return <object> PyTuple_GET_ITEM(<PyTupleObject *>conf, i+1)
+        return None
+
+    elif PyDict_Check(conf):
+        tmp = PyDict_GetItem(conf, protocol)
+        if tmp:
+            return <object> tmp
+        return None
+
+    elif conf:
+        return conf.get(protocol)
+
+
+def ProviderMixin__conform__(self, protocol):
+    """Adapt 'self' using its (or its bases') '__protocols_provided__'"""
+
+    cdef int i
+
+    mro = declarationMRO(self)
+
+    if PyTuple_Check(mro):
+        for i from 0 <= i < PyTuple_GET_SIZE(<PyTupleObject *>mro):
+            record = providedRecord(
+                <object> PyTuple_GET_ITEM(<PyTupleObject *>mro, i), protocol
+            )
+            if record is not None:
+                return recordAdapter(record)(self)
+    else:
         for cls in mro:
-            factory=get(cls)
-            if factory is not None:
-                return factory[0](obj)
+            record = providedRecord(cls, protocol)
+            if record is not None:
+                return recordAdapter(record)(self)
+
+
+cdef object registryRecord(cls, protocol):
+
+    # The record for 'protocol' in 'cls.__conform__', if it's a registry
+
+    cdef void *tmp
+
+    conf = declared(cls, __conform)
+
+    if conf is None:
+        return None
+
+    if not PyObject_IsInstance(conf, _conformsRegistry):
+        raise TypeError("Incompatible __conform__ in base class", conf, cls)
 
+    tmp = PyDict_GetItem(conf, protocol)
+    if tmp:
+        return <object> tmp
 
 
+def conformsRegistry_findImplementation(self,subject,protocol,checkSelf=True):
 
+    cdef int i
 
+    mro = declarationMRO(subject)
+
+    if PyTuple_Check(mro):
+        for i from 0 <= i < PyTuple_GET_SIZE(<PyTupleObject *>mro):
+            record = registryRecord(
+                <object> PyTuple_GET_ITEM(<PyTupleObject *>mro, i), protocol
+            )
+            if record is not None:
+                return recordAdapter(record)(subject)
+    else:
+        for cls in mro:
+            record = registryRecord(cls, protocol)
+            if record is not None:
+                return recordAdapter(record)(subject)
 
 
+def conformsRegistry__call__(self, protocol):
 
+    cdef void *tmp
 
+    tmp = PyDict_GetItem(self, protocol)
 
+    if tmp:
+        subject = self.subject()
+        if subject is not None:
+            return recordAdapter(<object> tmp)(subject)
 
 
+def installConformsRegistry(conformsRegistry):
+    """Use C versions of 'conformsRegistry' methods
 
+    'conformsRegistry' is also remembered, to check for incompatible
+    '__conform__' methods in base classes."""
 
+    global _conformsRegistry
 
+    _conformsRegistry = conformsRegistry
 
+    conformsRegistry.__call__ = PyMethod_NewUnbound(
+        conformsRegistry__call__, NULL, conformsRegistry
+    )
+    conformsRegistry.findImplementation = PyMethod_NewUnbound(
+        conformsRegistry_findImplementation, NULL, conformsRegistry
+    )
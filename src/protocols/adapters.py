@@ -3,10 +3,12 @@
 __all__ = [
     'NO_ADAPTER_NEEDED','DOES_NOT_SUPPORT', 'Adapter',
     'minimumAdapter', 'composeAdapters', 'updateWithSimplestAdapter',
-    'StickyAdapter', 'AdaptationFailure', 'bindAdapter',
+    'StickyAdapter', 'AdaptationFailure', 'bindAdapter', 'AdapterChain',
+    'AdapterCache', 'AdapterRecord',
 ]
 
 from types import FunctionType,ClassType,MethodType
+from weakref import ref
 
 try:
     PendingDeprecationWarning
@@ -66,9 +68,80 @@ class StickyAdapter(object):
         declareAdapter(lambda s: self, provides, forObjects=[ob])
 
 
+class AdapterCache(object):
 
+    """Adapter factory that reuses the adapters made for recent subjects
 
+    Adapters made by 'factory' are remembered for up to 'size' subjects, for
+    as long as each subject lives.  When the cache is full, the least
+    recently used subjects are forgotten first.  Note that an adapter that
+    refers to its subject will keep the subject alive until it's evicted.
+    Subjects that can't be weakly referenced aren't cached.
+    """
+
+    __slots__ = (
+        'factory', 'size', 'entries', 'clock',
+        '__adapterCount__', '__unbound_adapter__',
+    )
+
+    def __init__(self, factory, size):
+        self.factory = factory
+        self.size = size
+        self.entries = {}   # id(subject) -> [weakref, adapter, lastUsed]
+        self.clock = 0
+
+        # Declaring the same factory again shouldn't be ambiguous
+        self.__adapterCount__ = getattr(factory,'__adapterCount__',1)
+        self.__unbound_adapter__ = getattr(
+            factory,'__unbound_adapter__',factory
+        )
+
+    def __call__(self, ob):
+
+        key = id(ob)
+        entries = self.entries
+        entry = entries.get(key)
+        self.clock = clock = self.clock + 1
+
+        if entry is not None and entry[0]() is ob:
+            entry[2] = clock
+            return entry[1]
 
+        adapter = self.factory(ob)
+        if adapter is None:
+            return None
+
+        def forget(wr):
+            # Only remove the entry if it's still the one for this weakref,
+            # since 'key' may have been reused by a newer subject
+            if entries.get(key,(None,))[0] is wr:
+                try:
+                    del entries[key]
+                except KeyError:
+                    pass
+
+        try:
+            entries[key] = [ref(ob,forget), adapter, clock]
+        except TypeError:
+            return adapter  # not weakly referenceable
+
+        if len(entries)>self.size:
+            self.evict()
+
+        return adapter
+
+    def evict(self):
+        """Forget the least recently used quarter (or so) of the subjects"""
+
+        keep = self.size - (self.size+3)//4
+        byAge = [(entry[2],key) for key,entry in self.entries.items()]
+        byAge.sort()
+
+        for lastUsed,key in byAge[:len(byAge)-keep]:
+            try:
+                del self.entries[key]
+            except KeyError:
+                pass    # subject died meanwhile
 
 
 
@@ -82,6 +155,46 @@ class StickyAdapter(object):
 
 # Adapter "arithmetic"
 
+class AdapterRecord(object):
+
+    """An adapter registered at an implication depth, in an adapter registry
+
+    The adapter's chain length and unbound identity are looked up once, when
+    the record is made, so that comparing records doesn't have to.  Records
+    can be unpacked and indexed like '(adapter, depth)' tuples.
+    """
+
+    __slots__ = 'adapter', 'depth', 'count', 'unbound'
+
+    def __init__(self, adapter, depth):
+        self.adapter = self.unbound = adapter
+        self.depth = depth
+        self.count = 1
+        if adapter is not NO_ADAPTER_NEEDED and adapter is not DOES_NOT_SUPPORT:
+            self.count = getattr(adapter,'__adapterCount__',1)
+            self.unbound = getattr(adapter,'__unbound_adapter__',adapter)
+
+    def __getitem__(self, index):
+        return (self.adapter, self.depth)[index]
+
+    def __len__(self):
+        return 2
+
+    def __iter__(self):
+        return iter((self.adapter, self.depth))
+
+    def __reduce__(self):
+        return AdapterRecord, (self.adapter, self.depth)
+
+    def __repr__(self):
+        return "AdapterRecord(%r, %r)" % (self.adapter, self.depth)
+
+try:
+    from _speedups import AdapterRecord
+except ImportError:
+    pass
+
+
 def minimumAdapter(a1,a2,d1=0,d2=0):
 
     """Shortest route to implementation, 'a1' @ depth 'd1', or 'a2' @ 'd2'?
@@ -96,31 +209,73 @@ def minimumAdapter(a1,a2,d1=0,d2=0):
     TypeError is raised.
     """
 
+    return _minimumRecord(AdapterRecord(a1,d1), AdapterRecord(a2,d2)).adapter
+
+
+def _minimumRecord(r1,r2):
+
+    """Return the preferable of two 'AdapterRecord's (see 'minimumAdapter')"""
+
+    d1 = r1.depth
+    d2 = r2.depth
+
     if d1<d2:
-        return a1
+        return r1
     elif d2<d1:
-        return a2
+        return r2
 
-    if getattr(a1,'__unbound_adapter__',a1) is getattr(a2,'__unbound_adapter__',a2):
-        return a1   # don't care which
+    if r1.unbound is r2.unbound:
+        return r1   # don't care which
 
-    a1ct = getattr(a1,'__adapterCount__',1)
-    a2ct = getattr(a2,'__adapterCount__',1)
+    if r1.count<r2.count:
+        return r1
+    elif r2.count<r1.count:
+        return r2
 
-    if a1ct<a2ct:
-        return a1
-    elif a2ct<a1ct:
-        return a2
+    a1 = r1.adapter
+    a2 = r2.adapter
 
     if a1 is NO_ADAPTER_NEEDED or a2 is DOES_NOT_SUPPORT:
-        return a1
+        return r1
 
     if a1 is DOES_NOT_SUPPORT or a2 is NO_ADAPTER_NEEDED:
-        return a2
+        return r2
 
     # it's ambiguous
     raise TypeError("Ambiguous adapter choice", a1, a2, d1, d2)
 
+class AdapterChain(object):
+
+    """Adapter factory that applies a sequence of adapters in turn"""
+
+    __slots__ = 'adapters', '__adapterCount__'
+
+    def __init__(self, adapters):
+        self.adapters = adapters = tuple(adapters)
+        count = 0
+        for adapter in adapters:
+            count += getattr(adapter,'__adapterCount__',1)
+        self.__adapterCount__ = count
+
+    def __call__(self, ob):
+        for adapter in self.adapters:
+            ob = adapter(ob)
+            if ob is None:
+                return None
+        return ob
+
+    def __reduce__(self):
+        return AdapterChain, (self.adapters,)
+
+    def __repr__(self):
+        return "AdapterChain(%r)" % (self.adapters,)
+
+try:
+    from _speedups import AdapterChain
+except ImportError:
+    pass
+
+
 def composeAdapters(baseAdapter, baseProtocol, extendingAdapter):
 
     """Return the composition of 'baseAdapter'+'extendingAdapter'"""
@@ -135,24 +290,22 @@ def composeAdapters(baseAdapter, baseProtocol, extendingAdapter):
     if extendingAdapter is NO_ADAPTER_NEEDED:
         return baseAdapter
 
-    def newAdapter(ob):
-        ob = baseAdapter(ob)
-        if ob is not None:
-            return extendingAdapter(ob)
-
-    newAdapter.__adapterCount__ = (
-        getattr(extendingAdapter,'__adapterCount__',1)+
-        getattr(baseAdapter,'__adapterCount__',1)
-    )
-
-    return newAdapter
-
-
-
-
+    # Concatenate short chains, so that implication paths mostly run as a
+    # single loop, rather than as nested calls.  A long chain is kept as one
+    # step of the new one instead, or composing each step of a deep path
+    # would copy the whole path again.
+    adapters = ()
 
+    for adapter in baseAdapter, extendingAdapter:
+        if isinstance(adapter,AdapterChain) and \
+           len(adapter.adapters) < _flatChainSize:
+            adapters += adapter.adapters
+        else:
+            adapters += (adapter,)
 
+    return AdapterChain(adapters)
 
+_flatChainSize = 8     # longest chain whose steps are copied into another
 
 
 
@@ -165,6 +318,9 @@ def composeAdapters(baseAdapter, baseProtocol, extendingAdapter):
 def bindAdapter(adapter,proto):
     """Backward compatibility: wrap 'adapter' to support old 2-arg signature"""
 
+    if isinstance(adapter,AdapterChain):
+        return adapter  # its steps were bound when they were declared
+
     maxargs = 2; f = adapter; tries = 10
 
     while not isinstance(f,FunctionType) and tries:
@@ -207,18 +363,32 @@ def updateWithSimplestAdapter(mapping, key, adapter, depth):
 
     """Replace 'mapping[key]' w/'adapter' @ 'depth', return true if changed"""
 
-    new = adapter
     old = mapping.get(key)
 
     if old is not None:
-        old, oldDepth = old
-        new = minimumAdapter(old,adapter,oldDepth,depth)
-        if old is new and depth>=oldDepth:
+        try:
+            oldDepth = old.depth
+        except AttributeError:
+            old = AdapterRecord(*old)   # e.g. a tuple from an older pickle
+            oldDepth = old.depth
+
+        if depth>oldDepth or adapter is old.adapter and depth==oldDepth:
+            return False    # the existing entry is at least as short
+
+        new = AdapterRecord(adapter,depth)
+        if depth==oldDepth and _minimumRecord(old,new) is old:
             return False
+    else:
+        new = AdapterRecord(adapter,depth)
 
-    mapping[key] = new, depth
+    mapping[key] = new
     return True
 
+try:
+    from _speedups import minimumAdapter, updateWithSimplestAdapter
+except ImportError:
+    pass
+
 
 
 
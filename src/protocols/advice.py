@@ -91,19 +91,56 @@ except ImportError:
 else:
     ClassicTypes = ClassType, ExtensionClass
 
-def classicMRO(ob, extendedClassic=False):
-    stack = []
-    push = stack.insert
-    pop = stack.pop
-    push(0,ob)
+from weakref import WeakKeyDictionary
+_classicMROs = WeakKeyDictionary()
+
+def _classicBases(ob):
+    """Return '(ob.__bases__, classes, bases, extended)' for classic MRO
+
+    'classes' is the classic MRO of 'ob' without 'ob' itself, 'bases' lists
+    their '__bases__', and 'extended' is 'classes' plus 'InstanceType' and
+    'object'.  The result is cached until one of the '__bases__' changes;
+    it doesn't refer to 'ob', so the cache won't keep 'ob' alive."""
+
+    try:
+        cached = _classicMROs[ob]
+    except KeyError:
+        cached = None
+    except TypeError:
+        cached = ()     # not weakly referenceable, so don't cache it
+
+    if cached:
+        obBases, classes, bases, extended = cached
+        if ob.__bases__ is obBases and [
+            cls.__bases__ for cls in classes
+        ] == bases:
+            return cached
+
+    classes = []
+    stack = list(ob.__bases__)
+    stack.reverse()
     while stack:
-        cls = pop()
-        yield cls
-        p = len(stack)
-        for b in cls.__bases__: push(p,b)
+        cls = stack.pop()
+        classes.append(cls)
+        bases = list(cls.__bases__)
+        bases.reverse()
+        stack.extend(bases)
+
+    classes = tuple(classes)
+    result = (
+        ob.__bases__, classes, [cls.__bases__ for cls in classes],
+        classes + (InstanceType, object)
+    )
+
+    if cached is None:
+        _classicMROs[ob] = result
+
+    return result
+
+def classicMRO(ob, extendedClassic=False):
     if extendedClassic:
-        yield InstanceType
-        yield object
+        return (ob,) + _classicBases(ob)[3]
+    return (ob,) + _classicBases(ob)[1]
 
 def getMRO(ob, extendedClassic=False):
     if isinstance(ob,ClassicTypes):
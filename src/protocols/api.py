@@ -3,7 +3,10 @@
 __all__ = [
     'adapt', 'declareAdapterForType', 'declareAdapterForProtocol',
     'declareAdapterForObject', 'advise', 'declareImplementation',
-    'declareAdapter', 'adviseObject',
+    'declareAdapter', 'adviseObject', 'adapt_many', 'adapt_first',
+    'adapt_each', 'beginDeclarations', 'commitDeclarations',
+    'protocolsProvidedBy', 'typesProviding', 'getImplication',
+    'impliedSubset', 'allImpliedProtocols',
 ]
 
 _marker = object()
@@ -13,10 +16,15 @@ from types import ClassType
 ClassTypes = ClassType, type
 
 from adapters import NO_ADAPTER_NEEDED, DOES_NOT_SUPPORT, AdaptationFailure
-from adapters import bindAdapter
+from adapters import bindAdapter, AdapterCache
+from advice import classicMRO, mkRef
 from peak.util.decorators import decorate_class, frameinfo
 from interfaces import IOpenProtocol, IOpenProvider, IOpenImplementor
 from interfaces import Protocol, InterfaceClass
+from interfaces import _openBatches, _commitImplications, _sendNotices
+from interfaces import get_ident
+from interfaces import _pendingProtocols, _propagateImplications
+from interfaces import _protocolsByClass, _impliedPaths
 
 
 
@@ -85,6 +93,157 @@ try:
 except ImportError:
     pass
 
+
+def adapt_many(objects, protocol, default=_marker):
+
+    """Return a list of 'objects' adapted to 'protocol' (see 'adapt()')
+
+    If 'protocol' uses the standard 'Protocol.__adapt__', its adapter is
+    looked up only once for each class of object."""
+
+    cls = getattr(protocol,'__class__',None)  # classic classes have none
+
+    if getattr(cls,'__adapt__',None) is not _protocolAdapt:
+        return [adapt(ob,protocol,default) for ob in objects]
+
+    isClass = isinstance(protocol,ClassTypes)
+    factories = {}
+    out = []
+
+    for ob in objects:
+
+        if isClass and isinstance(ob,protocol):
+            out.append(ob)
+            continue
+
+        try:
+            _conform = ob.__conform__
+        except AttributeError:
+            result = None
+        else:
+            try:
+                result = _conform(protocol)
+            except TypeError:
+                if exc_info()[2].tb_next is not None:
+                    raise
+                result = None
+
+        if result is None:
+            try:
+                typ = ob.__class__
+            except AttributeError:
+                typ = type(ob)
+            try:
+                factory = factories[typ]
+            except KeyError:
+                factory = factories[typ] = protocol.getAdapterForType(typ)
+            if factory is not None:
+                result = factory(ob)
+
+        if result is None:
+            if default is _marker:
+                raise AdaptationFailure("Can't adapt", ob, protocol)
+            result = default
+
+        out.append(result)
+
+    return out
+
+
+def _adaptEach(obj, protocols, default, first):
+
+    """Adapt 'obj' to each of 'protocols', w/one __conform__ and class lookup
+
+    If 'first' is true, return the first result found (or 'default'),
+    otherwise return a list of all the results."""
+
+    try:
+        _conform = obj.__conform__
+    except AttributeError:
+        _conform = None
+
+    typ = None
+    out = []
+
+    for protocol in protocols:
+
+        if isinstance(protocol,ClassTypes) and isinstance(obj,protocol):
+            result = obj
+        else:
+            result = None
+
+        if result is None and _conform is not None:
+            try:
+                result = _conform(protocol)
+            except TypeError:
+                if exc_info()[2].tb_next is not None:
+                    raise
+
+        if result is None:
+            # (Classic classes have no '__class__')
+            cls = getattr(protocol,'__class__',None)
+            if getattr(cls,'__adapt__',None) is _protocolAdapt:
+                if typ is None:
+                    try:
+                        typ = obj.__class__
+                    except AttributeError:
+                        typ = type(obj)
+                factory = protocol.getAdapterForType(typ)
+                if factory is not None:
+                    result = factory(obj)
+            else:
+                try:
+                    _adapt = protocol.__adapt__
+                except AttributeError:
+                    pass
+                else:
+                    try:
+                        result = _adapt(obj)
+                    except TypeError:
+                        if exc_info()[2].tb_next is not None:
+                            raise
+
+        if result is None:
+            result = default
+        elif first:
+            return result
+
+        out.append(result)
+
+    if first:
+        if default is _marker:
+            raise AdaptationFailure("Can't adapt", obj, protocols)
+        return default
+
+    return out
+
+
+def adapt_first(obj, protocols, default=_marker):
+
+    """Return 'obj' adapted to the first of 'protocols' it can be adapted to
+
+    If 'obj' can't be adapted to any of them, return 'default', or raise
+    'AdaptationFailure' if no default is given."""
+
+    return _adaptEach(obj, protocols, default, True)
+
+
+def adapt_each(obj, protocols, default=None):
+
+    """Return a list of 'obj' adapted to each of 'protocols', in order
+
+    'default' is used in place of any protocol 'obj' can't be adapted to."""
+
+    return _adaptEach(obj, protocols, default, False)
+
+
+_protocolAdapt = Protocol.__dict__['__adapt__']
+
+try:
+    from _speedups import adapt_many, adapt_first, adapt_each
+except ImportError:
+    pass
+
 # Fundamental, explicit interface/adapter declaration API:
 #   All declarations should end up passing through these three routines.
 
@@ -111,6 +270,155 @@ def declareAdapterForObject(protocol, adapter, ob, depth=1):
     """Declare that 'adapter' adapts 'ob' to 'protocol'"""
     adapt(protocol,IOpenProtocol).registerObject(ob,bindAdapter(adapter,protocol),depth)
 
+def beginDeclarations():
+    """Start a batch of declarations; call 'commitDeclarations()' to end it
+
+    Until the outermost batch is committed, the adapters that classes get by
+    implication are only computed if they're looked up, and implication
+    listeners aren't notified.  Batches can be nested, and only apply to the
+    declarations made by the thread that started them."""
+
+    thread = get_ident()
+    _openBatches[thread] = _openBatches.get(thread,0)+1
+
+
+def commitDeclarations():
+    """End a batch of declarations started with 'beginDeclarations()'"""
+
+    thread = get_ident()
+    count = _openBatches.get(thread)
+
+    if not count:
+        raise RuntimeError("No declaration batch in progress")
+
+    if count>1:
+        _openBatches[thread] = count-1
+        return
+
+    try:
+        try:
+            _commitImplications()
+        finally:
+            del _openBatches[thread]
+    finally:
+        _sendNotices()
+
+
+def protocolsProvidedBy(klass):
+    """Return a list of the protocols instances of 'klass' can be adapted to
+
+    Only protocols that have an adapter (or 'NO_ADAPTER_NEEDED') registered
+    for 'klass' or one of its base classes are included, and the search takes
+    time proportional to the number of such registrations."""
+
+    if _pendingProtocols:
+        _propagateImplications(klass)
+
+    try:
+        mro = klass.__mro__
+    except AttributeError:
+        mro = classicMRO(klass,extendedClassic=True)
+
+    seen = {}
+    out = []
+
+    for base in mro:
+        key = id(base)
+        for protoKey, ref in _protocolsByClass.get(key,{}).items():
+            if protoKey in seen:
+                continue    # a closer base's registration takes precedence
+            seen[protoKey] = True
+            proto = ref()
+            if proto is None:
+                continue
+            record = proto._Protocol__adapters.get(key)
+            if record is not None and record.adapter is not DOES_NOT_SUPPORT:
+                out.append(proto)
+
+    return out
+
+
+def typesProviding(protocol):
+    """Return a list of the classes registered as supporting 'protocol'
+
+    The list includes types with an adapter (or 'NO_ADAPTER_NEEDED') registered
+    for 'protocol', either directly or by implication, but not their
+    subclasses.  Types are only known for protocols that use 'Protocol'
+    registries."""
+
+    protocol = adapt(protocol, IOpenProtocol, None)
+
+    if not isinstance(protocol, Protocol):
+        return []
+
+    if protocol._Protocol__pendingSources:
+        # Only declarations that could register a type w/'protocol' matter
+        protocol._Protocol__applyPending(None)
+
+    adapters = protocol._Protocol__adapters
+    out = []
+
+    if adapters:
+        classes = protocol._Protocol__classes
+        for key, record in adapters.items():
+            if record.adapter is not DOES_NOT_SUPPORT:
+                klass = classes.get(key)
+                if klass is not None:
+                    klass = klass()
+                if klass is not None:
+                    out.append(klass)
+
+    return out
+
+
+def getImplication(source, target):
+    """Return '(adapter,depth)' by which 'source' implies 'target', or 'None'
+
+    The simplest of the adapters that 'source' implies 'target' by, directly
+    or through other protocols, is returned.  'source' implies itself with
+    'NO_ADAPTER_NEEDED' at depth 0.  Only the implications of 'Protocol'
+    instances (including interfaces) are followed."""
+
+    if source is target:
+        return NO_ADAPTER_NEEDED, 0
+
+    if isinstance(source, Protocol):
+        record = _impliedPaths(source).get(mkRef(target))
+        if record is not None:
+            return record.adapter, record.depth
+
+
+def impliedSubset(source, protocols):
+    """Return a list of those 'protocols' that 'source' implies (or is)"""
+
+    if not isinstance(source, Protocol):
+        return [proto for proto in protocols if proto is source]
+
+    paths = _impliedPaths(source)
+
+    return [
+        proto for proto in protocols
+            if proto is source or mkRef(proto) in paths
+    ]
+
+
+def allImpliedProtocols(source):
+    """Return a list of '(protocol,(adapter,depth))' for all 'source' implies
+
+    This is like 'source.getImpliedProtocols()', but includes the protocols
+    implied by other implied protocols, with the simplest adapter for each."""
+
+    out = []
+
+    if isinstance(source, Protocol):
+        for ref, record in _impliedPaths(source).items():
+            proto = ref()
+            if proto is not None:
+                out.append((proto, (record.adapter, record.depth)))
+
+    return out
+
+
 # Bootstrap APIs to work with Protocol and InterfaceClass, without needing to
 # give Protocol a '__conform__' method that's hardwired to IOpenProtocol.
 # Note that InterfaceClass has to be registered first, so that when the
@@ -126,20 +434,29 @@ IOpenProtocol.registerImplementation(Protocol)          # NEVER DO THIS!!
 def declareAdapter(factory, provides,
     forTypes=(),
     forProtocols=(),
-    forObjects=()
+    forObjects=(),
+    memoize=0
 ):
-    """'factory' is an IAdapterFactory providing 'provides' protocols"""
+    """'factory' is an IAdapterFactory providing 'provides' protocols
+
+    If 'memoize' is non-zero, the adapters made for each protocol are reused
+    for up to that many recently adapted subjects (see 'AdapterCache')."""
 
     for protocol in provides:
 
+        adapter = factory
+
+        if memoize and factory is not NO_ADAPTER_NEEDED:
+            adapter = AdapterCache(bindAdapter(factory,protocol), memoize)
+
         for typ in forTypes:
-            declareAdapterForType(protocol, factory, typ)
+            declareAdapterForType(protocol, adapter, typ)
 
         for proto in forProtocols:
-            declareAdapterForProtocol(protocol, factory, proto)
+            declareAdapterForProtocol(protocol, adapter, proto)
 
         for ob in forObjects:
-            declareAdapterForObject(protocol, factory, ob)
+            declareAdapterForObject(protocol, adapter, ob)
 
 
 def declareImplementation(typ, instancesProvide=(), instancesDoNotProvide=()):
@@ -199,6 +516,7 @@ def advise(**kw):
     protocolIsSubsetOf = kw.setdefault('protocolIsSubsetOf',())
     factoryMethod = kw.setdefault('factoryMethod',None)
     equivalentProtocols = kw.setdefault('equivalentProtocols',())
+    memoize = kw.setdefault('memoize',0)
 
 
 
@@ -206,7 +524,7 @@ def advise(**kw):
     map(kw.__delitem__,"classProvides classDoesNotProvide instancesProvide"
         " instancesDoNotProvide asAdapterForTypes asAdapterForProtocols"
         " protocolExtends protocolIsSubsetOf factoryMethod equivalentProtocols"
-        .split())
+        " memoize".split())
 
     for k in kw:
         raise TypeError(
@@ -237,12 +555,17 @@ def advise(**kw):
                 factory = klass
 
             declareAdapter(factory, instancesProvide,
-                forTypes=asAdapterForTypes, forProtocols=asAdapterForProtocols
+                forTypes=asAdapterForTypes, forProtocols=asAdapterForProtocols,
+                memoize=memoize
             )
         elif factoryMethod:
             raise TypeError(
                 "'factoryMethod' is only used when declaring an adapter type"
             )
+        elif memoize:
+            raise TypeError(
+                "'memoize' is only used when declaring an adapter type"
+            )
 
         if protocolExtends:
             declareAdapter(NO_ADAPTER_NEEDED, protocolExtends,
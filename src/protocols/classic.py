@@ -48,25 +48,29 @@ class ProviderMixin:
     )
 
     def declareProvides(self,protocol,adapter=NO_ADAPTER_NEEDED,depth=1):
-        registry = self.__dict__.get('__protocols_provided__')
-        if registry is None:
-            self.__protocols_provided__ = registry = {}
-        if updateWithSimplestAdapter(registry,protocol,adapter,depth):
+        registry = _updatedRegistry(
+            _providedRegistry(self), protocol, adapter, depth
+        )
+        if registry is not None:
+            self.__protocols_provided__ = registry
             adapt(protocol,IOpenProtocol).addImplicationListener(self)
             return True
 
     declareProvides = metamethod(declareProvides)
 
     def newProtocolImplied(self, srcProto, destProto, adapter, depth):
-        registry = self.__dict__.get('__protocols_provided__',())
-        if srcProto not in registry:
+        registry = _providedRegistry(self)
+        if not registry:
             return
 
-        baseAdapter, d = registry[srcProto]
-        adapter = composeAdapters(baseAdapter,srcProto,adapter)
+        record = registry.get(srcProto)
+        if record is None:
+            return
+
+        adapter = composeAdapters(record.adapter,srcProto,adapter)
 
         declareAdapterForObject(
-            destProto, adapter, self, depth+d
+            destProto, adapter, self, depth+record.depth
         )
 
     newProtocolImplied = metamethod(newProtocolImplied)
@@ -74,16 +78,123 @@ class ProviderMixin:
     def __conform__(self,protocol):
 
         for cls in getMRO(self):
-            conf = cls.__dict__.get('__protocols_provided__',())
-            if protocol in conf:
-                return conf[protocol][0](self)
-
+            conf = cls.__dict__.get('__protocols_provided__')
+            if conf:
+                if conf.__class__ is not providedRegistry:
+                    conf = _providedRegistry(cls)
+                record = conf.get(protocol)
+                if record is not None:
+                    return record.adapter(self)
+
+    try:
+        from _speedups import ProviderMixin__conform__ as __conform__
+    except ImportError:
+        pass
     __conform__ = metamethod(__conform__)
 
+
+class providedRegistry(tuple):
+
+    """Immutable 'protocol -> AdapterRecord' mapping for 'ProviderMixin'
+
+    Items are stored flat, as '(protocol, record, protocol, record, ...)',
+    which takes a fraction of the memory of a dictionary for the few protocols
+    that an instance usually provides.  'declareProvides()' replaces it with
+    an updated copy (see '_updatedRegistry()').
+    """
+
+    __slots__ = ()
+
+    def get(self, protocol, default=None):
+        items = tuple.__iter__(self)
+        for key in items:
+            record = items.next()
+            if key is protocol or key == protocol:
+                return record
+        return default
+
+    def __getitem__(self, protocol):
+        record = self.get(protocol)
+        if record is None:
+            raise KeyError(protocol)
+        return record
+
+    def __contains__(self, protocol):
+        return self.get(protocol) is not None
+
+    def __len__(self):
+        return tuple.__len__(self)/2
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def items(self):
+        items = tuple.__iter__(self)
+        return [(key, items.next()) for key in items]
+
+    def keys(self):
+        return [key for key, record in self.items()]
+
+    def values(self):
+        return [record for key, record in self.items()]
+
+    def __repr__(self):
+        return "providedRegistry(%r)" % dict(self.items())
+
+    def __reduce__(self):
+        return providedRegistry, (list(tuple.__iter__(self)),)
+
+
+def _providedRegistry(ob):
+    """Return 'ob.__dict__.get("__protocols_provided__")', upgraded if needed
+
+    Objects pickled by older versions have a dictionary of '(adapter, depth)'
+    tuples instead of a 'providedRegistry'.  It is replaced (on 'ob') by an
+    equivalent 'providedRegistry' the first time it's used.
+    """
+    registry = ob.__dict__.get('__protocols_provided__')
+
+    if registry and registry.__class__ is not providedRegistry:
+        items = []
+        for protocol, (adapter, depth) in registry.items():
+            items.append(protocol)
+            items.append(AdapterRecord(adapter, depth))
+        registry = providedRegistry(items)
+        setattr(ob, '__protocols_provided__', registry)
+
+    return registry
+
+
+def _updatedRegistry(registry, protocol, adapter, depth):
+    """Return 'registry' updated w/'adapter' @ 'depth', or 'None' if unchanged
+
+    'registry' is a 'providedRegistry' (or 'None'); only the entry for
+    'protocol' is changed or added in the copy that's returned.
+    """
+
+    items = list(tuple.__iter__(registry or ()))
+    mapping = {}
+
+    for pos in range(0, len(items), 2):
+        if items[pos] is protocol or items[pos] == protocol:
+            mapping[protocol] = items[pos+1]
+            break
+    else:
+        pos = len(items)
+        items.extend((protocol, None))
+
+    if updateWithSimplestAdapter(mapping, protocol, adapter, depth):
+        items[pos+1] = mapping[protocol]
+        return providedRegistry(items)
+
 class conformsRegistry(dict):
 
     """Helper type for objects and classes that need registration support"""
 
+    # One of these is made for each object with declarations, so it doesn't
+    # get an instance dictionary
+    __slots__ = 'subject', '__weakref__'
+
     def __call__(self, protocol):
 
         # This only gets called for non-class objects
@@ -93,7 +204,7 @@ class conformsRegistry(dict):
             subject = self.subject()
 
             if subject is not None:
-                return self[protocol][0](subject)
+                return self[protocol].adapter(subject)
 
 
     def findImplementation(self, subject, protocol, checkSelf=True):
@@ -111,7 +222,7 @@ class conformsRegistry(dict):
                 )
 
             if protocol in conf:
-                return conf[protocol][0](subject)
+                return conf[protocol].adapter(subject)
 
 
 
@@ -155,9 +266,18 @@ class conformsRegistry(dict):
 
     def __setstate__(self,(subject,items)):
         self.clear()
-        self.update(dict(items))
+        for protocol, (adapter, depth) in items:
+            # Older versions pickled '(adapter, depth)' tuples, not records
+            self[protocol] = AdapterRecord(adapter, depth)
         self.subject = mkRef(subject)
 
+try:
+    from _speedups import installConformsRegistry
+except ImportError:
+    pass
+else:
+    installConformsRegistry(conformsRegistry)
+
 
 
 
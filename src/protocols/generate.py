@@ -1,15 +1,16 @@
 """Autogenerated protocols from type+method names, URI, sequence, etc."""
 
-from interfaces import Protocol, allocate_lock, Interface
+from interfaces import Protocol, allocate_lock, Interface, Variation
 from advice import metamethod, supermeta
 from api import declareAdapterForProtocol, declareAdapterForType
 from api import declareAdapter, adapt
 from adapters import NO_ADAPTER_NEEDED
+from weakref import WeakValueDictionary
 
 __all__ = [
     'protocolForType', 'protocolForURI', 'sequenceOf', 'IBasicSequence',
     'URIProtocol', 'TypeSubset', 'WeakSubset', 'ADAPT_SEQUENCE',
-    'SequenceProtocol'
+    'SequenceProtocol', 'variationOf'
 ]
 
 
@@ -176,6 +177,11 @@ def ADAPT_SEQUENCE(ob, proto):
         out.append(item)
     return out
 
+try:
+    from _speedups import ADAPT_SEQUENCE
+except ImportError:
+    pass
+
 
 
 
@@ -268,6 +274,29 @@ def sequenceOf(baseProtocol):
         __registryLock.release()
 
 
+# Variations are often made per context object, so unlike the protocols above
+# they're only kept while in use.  When one dies, so do its implication links.
+
+variations = WeakValueDictionary()
+
+def variationOf(baseProtocol, context=None):
+
+    """Return a unique 'Variation' of 'baseProtocol' for 'context'"""
+
+    key = baseProtocol, context
+
+    __registryLock.acquire()
+
+    try:
+        proto = variations.get(key)
+        if proto is None:
+            proto = variations[key] = Variation(baseProtocol, context)
+        return proto
+
+    finally:
+        __registryLock.release()
+
+
 
 
 
@@ -13,7 +13,7 @@ __all__ = [
 import api
 from advice import metamethod, classicMRO, mkRef
 from adapters import composeAdapters, updateWithSimplestAdapter
-from adapters import NO_ADAPTER_NEEDED, DOES_NOT_SUPPORT
+from adapters import NO_ADAPTER_NEEDED, DOES_NOT_SUPPORT, minimumAdapter
 
 from types import InstanceType
 
@@ -21,11 +21,11 @@ from types import InstanceType
 # Thread locking support
 
 try:
-    from thread import allocate_lock
+    from thread import allocate_lock, get_ident
 
 except ImportError:
     try:
-        from dummy_thread import allocate_lock
+        from dummy_thread import allocate_lock, get_ident
 
     except ImportError:
         class allocate_lock(object):
@@ -33,6 +33,9 @@ except ImportError:
             def acquire(*args): pass
             def release(*args): pass
 
+        def get_ident():
+            return 0
+
 
 
 
@@ -45,61 +48,261 @@ class Protocol:
 
     """Generic protocol w/type-based adapter registry"""
 
+    # If true, adapters this protocol gets by implication from other protocols
+    # are only computed when instances of the class are first looked up
+    lazyImplications = False
+
+    # Most protocols never have anything registered with them, so registries
+    # and locks are only created when first written; until then, these class
+    # attributes stand in for them.  Classes are weakly referenced, so that
+    # dynamically created ones can be garbage collected: the registry and
+    # cache are keyed by id(), and '__classes' maps each id to a weakref that
+    # cleans up when the class dies.
+    #
+    # '__adapters' is only changed under the lock, but lookups read it without
+    # locking, one entry at a time.  '__cache' maps the id of each class
+    # looked up to its (partial) MRO and the adapter found for it.  Writers
+    # discard the cached lookups that their change may affect, after counting
+    # the change in '__changes', so a lookup that raced with a change doesn't
+    # keep its result.  (The weakref callbacks for dead classes just drop
+    # the class's own entries.)  '__implies' is replaced with an updated copy,
+    # and only changed in place by the weakref callbacks that drop implied
+    # protocols when they die (see '_refForgetter()').
+    __adapters = __classes = __implies = __listeners = __lock = None
+    __cache = __ref = None
+    __changes = 0
+
+    # The transitive closure of '__implies', the number of times it's been
+    # discarded, and weak refs to the protocols whose '__implies' have us
+    # (see '_impliedPaths()')
+    __paths = __impliedBy = None
+    __pathChanges = 0
+
+    # Implied declarations waiting to be applied, and the protocols that have
+    # some and imply this one (see '_deferImplied()')
+    __pending = __pendingSources = None
+
     def __init__(self):
-        self.__adapters = {}
-        self.__implies = {}
-        self.__listeners = None
-        self.__lock = allocate_lock()
+        pass
 
 
-    def getImpliedProtocols(self):
+    def __getLock(self):
+        """Return the lock for changing this protocol's registries"""
+
+        lock = self.__lock
+
+        if lock is None:
+            _allocationLock.acquire()
+            try:
+                lock = self.__lock
+                if lock is None:
+                    lock = self.__lock = allocate_lock()
+            finally:
+                _allocationLock.release()
+
+        return lock
+
+    __getLock = metamethod(__getLock)
+
+
+    def __forgetLookups(self, klass=None):
+        """Discard cached lookups that may now find something else
+
+        Those are the lookups of 'klass' and its subclasses, or all of them if
+        'klass' is 'None' or its subclasses can't be listed.  The caller must
+        hold the lock, and have already made the change."""
+
+        self.__changes += 1
+        cache = self.__cache
+
+        if not cache:
+            return
+
+        if klass is None or klass is object or klass is InstanceType \
+           or not isinstance(klass, type):
+            # Classic classes' MROs include 'InstanceType' and 'object'
+            cache.clear()
+            return
+
+        todo = [klass]
+        seen = {}
+
+        while todo:
+            klass = todo.pop()
+            key = id(klass)
+            if key not in seen:
+                seen[key] = True
+                try:
+                    del cache[key]
+                except KeyError:
+                    pass
+                todo.extend(type.__subclasses__(klass))
 
-        # This is messy so it can clean out weakrefs, but this method is only
-        # called for declaration activities and is thus not at all
-        # speed-critical.  It's more important that we support weak refs to
-        # implied protocols, so that dynamically created subset protocols can
-        # be garbage collected.
+    __forgetLookups = metamethod(__forgetLookups)
+
+
+    def __takePending(self, classes=None):
+        """Remove and return the declarations pending for 'classes' (or all)
+
+        Returns a list of '(klass, [(adapter, depth), ...])' pairs."""
 
         out = []
-        add = out.append
+        pending = self.__pending
 
-        self.__lock.acquire()   # we might clean out dead weakrefs
+        if not pending:
+            return out
+
+        if classes is not None:
+            classes = [klass for klass in classes if id(klass) in pending]
+            if not classes:
+                return out
+
+        lock = self.__getLock()
+        lock.acquire()
 
         try:
-            for k,v in self.__implies.items():
-                proto = k()
-                if proto is None:
-                    del self.__implies[k]
+            if pending:
+                if classes is None:
+                    for key in pending.keys():
+                        entry = pending.pop(key)
+                        klass = entry[0]()
+                        if klass is not None:
+                            out.append((klass, entry[1:]))
                 else:
-                    add((proto,v))
+                    for klass in classes:
+                        entry = pending.pop(id(klass), None)
+                        if entry:
+                            out.append((klass, entry[1:]))
+        finally:
+            lock.release()
 
-            return out
+        return out
+
+    __takePending = metamethod(__takePending)
+
+
+    def __addPendingSources(self, items, klass=None):
+        """Note '(key, ref)' items for protocols w/pending declarations for us
+
+        'klass' is the class they're pending for, or 'None' if it may be any.
+        """
+
+        lock = self.__getLock()
+        lock.acquire()
 
+        try:
+            if self.__pendingSources is None:
+                if self.__cache is None:
+                    self.__cache = {}
+                self.__pendingSources = {}
+            self.__pendingSources.update(items)
+
+            # A cached lookup may be missing what's now pending
+            self.__forgetLookups(klass)
+        finally:
+            lock.release()
+
+    __addPendingSources = metamethod(__addPendingSources)
+
+
+    def __applyPending(self, mro):
+        """Apply pending declarations that may affect lookups of 'mro'
+
+        Only protocols in '__pendingSources' are checked, and any that have
+        nothing left pending are then dropped from it.  Returns true if any
+        declarations were applied."""
+
+        sources = self.__pendingSources
+        applied = _applyPending(sources, mro)
+        _prunePending(sources, self.__getLock())
+        return applied
+
+    __applyPending = metamethod(__applyPending)
+
+
+    def getImpliedProtocols(self):
+
+        # We support weak refs to implied protocols, so that dynamically
+        # created subset protocols can be garbage collected.  Their callbacks
+        # remove them when they die, but one that dies while an updated copy
+        # is being made can be left behind, so dead refs are still skipped.
+
+        out = []
+        add = out.append
+
+        for k,v in (self.__implies or {}).items():
+            proto = k()
+            if proto is not None:
+                add((proto,v))
+
+        return out
+
+
+
+    def __addImpliedBy(self, proto):
+        """Note that 'proto' implies us, so its closure includes ours"""
+
+        lock = self.__getLock()
+        lock.acquire()
+
+        try:
+            if self.__impliedBy is None:
+                self.__impliedBy = {}
+            key = mkRef(proto, _refForgetter(self, '_Protocol__impliedBy'))
+            if key not in self.__impliedBy:
+                self.__impliedBy[key] = True
         finally:
-            self.__lock.release()
+            lock.release()
 
+    __addImpliedBy = metamethod(__addImpliedBy)
 
 
     def addImpliedProtocol(self,proto,adapter=NO_ADAPTER_NEEDED,depth=1):
 
-        self.__lock.acquire()
+        if isinstance(proto, Protocol):
+            # Before the implication is added, so that implications added to
+            # 'proto' meanwhile discard our closure as well
+            proto.__addImpliedBy(self)
+
+        lock = self.__getLock()
+        lock.acquire()
         try:
-            key = mkRef(proto)
-            if not updateWithSimplestAdapter(
-                self.__implies, key, adapter, depth
-            ):
-                return self.__implies[key][0]
+            key = mkRef(proto, _refForgetter(self, '_Protocol__implies'))
+            implies = _updatedCopy(self.__implies, key, adapter, depth)
+            if implies is None:
+                return self.__implies[key].adapter
+            self.__implies = implies
         finally:
-            self.__lock.release()
+            lock.release()
+
+        _closureChanged(self)
+
+        sources = self.__pendingSources
+        if sources:
+            # Declarations pending for us will imply 'proto' when applied
+            _notePendingSources(proto, sources.items())
 
         # Always register implied protocol with classes, because they should
         # know if we break the implication link between two protocols
-        for klass,(baseAdapter,d) in self.__adapters.items():
-            api.declareAdapterForType(
-                proto,composeAdapters(baseAdapter,self,adapter),klass,depth+d
-            )
+        classes = self.__classes
+        implied = []
+
+        for key,record in (self.__adapters or {}).items():
+            klass = classes.get(key)
+            if klass is not None:
+                klass = klass()
+            if klass is not None:
+                implied.append((
+                    klass, proto, composeAdapters(record.adapter,self,adapter),
+                    depth+record.depth
+                ))
 
-        if self.__listeners:
+        _declareImplied(implied)
+
+        if _openBatches and get_ident() in _openBatches:
+            _queueNotice(self, proto, adapter, depth)
+
+        elif self.__listeners:
             for listener in self.__listeners.keys():    # Must use keys()!
                 listener.newProtocolImplied(self, proto, adapter, depth)
 
@@ -123,14 +326,31 @@ class Protocol:
 
     def registerImplementation(self,klass,adapter=NO_ADAPTER_NEEDED,depth=1):
 
-        self.__lock.acquire()
+        if self.__pendingSources:
+            # Declarations already pending for 'klass' would have been made
+            # before this one if they hadn't been deferred, and the order can
+            # change what's implied (e.g. when this one replaces them)
+            _applyPending(self.__pendingSources, [klass])
+
+        lock = self.__getLock()
+        lock.acquire()
         try:
+            if self.__adapters is None:
+                if self.__cache is None:
+                    self.__cache = {}
+                self.__adapters = {}
+                self.__ref = _indexRef(self, self.__adapters)
+            key = self.__classKey(klass)
             if not updateWithSimplestAdapter(
-                self.__adapters,klass,adapter,depth
+                self.__adapters,key,adapter,depth
             ):
-                return self.__adapters[klass][0]
+                return self.__adapters[key].adapter
+
+            _protocolsByClass.setdefault(key,{})[id(self)] = self.__ref
+
+            self.__forgetLookups(klass)
         finally:
-            self.__lock.release()
+            lock.release()
 
         if adapter is DOES_NOT_SUPPORT:
             # Don't register non-support with implied protocols, because
@@ -139,10 +359,10 @@ class Protocol:
             # way to "disinherit" a superclass' claim to support something.
             return adapter
 
-        for proto, (extender,d) in self.getImpliedProtocols():
-            api.declareAdapterForType(
-                proto, composeAdapters(adapter,self,extender), klass, depth+d
-            )
+        _declareImplied([
+            (klass, proto, composeAdapters(adapter,self,extender), depth+d)
+                for proto, (extender,d) in self.getImpliedProtocols()
+        ])
 
         return adapter
 
@@ -162,14 +382,68 @@ class Protocol:
 
     registerObject = metamethod(registerObject)
 
-    def __adapt__(self, obj):
+    def __classKey(self, klass):
+        """Return the registry key for 'klass', forgetting it when it dies
 
-        get = self.__adapters.get
+        The caller must hold the lock, so that only one weakref (and callback)
+        is ever made for each class."""
 
-        try:
-            typ = obj.__class__
-        except AttributeError:
-            typ = type(obj)
+        key = id(klass)
+        classes = self.__classes
+
+        if classes is None:
+            classes = self.__classes = {}
+
+        if key not in classes:
+
+            unindex = _unindex
+
+            def forget(ref):
+                # Drop the dead class from the registries and cache; no other
+                # lookup can be affected, since its subclasses are dead too.
+                # We mustn't lock, as we may be called at any time
+                for mapping in self.__classes, self.__adapters, self.__cache:
+                    if mapping:
+                        try:
+                            del mapping[key]
+                        except KeyError:
+                            pass
+                unindex(key, id(self))
+
+            classes[key] = mkRef(klass,forget)
+
+        return key
+
+    __classKey = metamethod(__classKey)
+
+    def __cacheKey(self, klass):
+        """Return the lookup cache key for 'klass', forgetting it when it dies"""
+
+        key = id(klass)
+        classes = self.__classes
+
+        if classes is None or key not in classes:
+            lock = self.__getLock()
+            lock.acquire()
+            try:
+                self.__classKey(klass)
+            finally:
+                lock.release()
+
+        return key
+
+    __cacheKey = metamethod(__cacheKey)
+
+    def getAdapterForType(self, typ):
+        """Return the adapter for instances of 'typ' (incl. bases), or 'None'"""
+
+        changes = self.__changes
+        adapters = self.__adapters
+
+        if not adapters and not self.__pendingSources:
+            return None     # nothing registered, so nothing to look up
+
+        cache = self.__cache
 
         try:
             mro = typ.__mro__
@@ -177,19 +451,82 @@ class Protocol:
             # Note: this adds 'InstanceType' and 'object' to end of MRO
             mro = classicMRO(typ,extendedClassic=True)
 
+        # Cached lookups are only valid as long as the MRO is unchanged.
+        # Built-in types never die and their MRO never changes, so we keep
+        # their MRO as is and check it by identity.  For other classes we
+        # keep the MRO without 'typ' itself, so the cache won't keep 'typ'
+        # alive.
+        cached = cache.get(id(typ))
+        if cached is not None and (
+            cached[0] is mro or cached[0] == mro[1:]
+        ):
+            return cached[1]
+
+        if self.__pendingSources and self.__applyPending(mro):
+            # Something was declared, so look again
+            return self.getAdapterForType(typ)
+
+        get = (adapters or {}).get
+
         for klass in mro:
-            factory=get(klass)
+            factory=get(id(klass))
             if factory is not None:
-                return factory[0](obj)
+                factory = factory.adapter
+                break
+        else:
+            factory = None  # cache misses too, to skip the MRO walk next time
+
+        if getattr(typ, '__flags__', _HEAPTYPE) & _HEAPTYPE:
+            mro = mro[1:]
+
+        key = self.__cacheKey(typ)
+        cache[key] = mro, factory
+
+        if self.__changes != changes:
+            # A change made during the lookup may have been missed, and its
+            # writer may have discarded the cached lookups before we stored
+            try:
+                del cache[key]
+            except KeyError:
+                pass
+
+        return factory
 
     try:
-        from _speedups import Protocol__adapt__ as __adapt__
+        from _speedups import Protocol_getAdapterForType as getAdapterForType
+    except ImportError:
+        pass
+    getAdapterForType = metamethod(getAdapterForType)
+
+    def __adapt__(self, obj):
+
+        if not self.__adapters and not self.__pendingSources:
+            return None     # fast path for protocols with nothing registered
+
+        try:
+            typ = obj.__class__
+        except AttributeError:
+            typ = type(obj)
+
+        factory = self.getAdapterForType(typ)
+
+        if factory is not None:
+            return factory(obj)
+
+    try:
+        # Older builds have a Protocol__adapt__ that doesn't know about the
+        # lookup cache or adapter records; builds that do also have this
+        from _speedups import Protocol_getAdapterForType
     except ImportError:
         pass
+    else:
+        from _speedups import Protocol__adapt__ as __adapt__
+        del Protocol_getAdapterForType
     __adapt__ = metamethod(__adapt__)
 
     def addImplicationListener(self, listener):
-        self.__lock.acquire()
+        lock = self.__getLock()
+        lock.acquire()
 
         try:
             if self.__listeners is None:
@@ -199,7 +536,7 @@ class Protocol:
             self.__listeners[listener] = 1
 
         finally:
-            self.__lock.release()
+            lock.release()
 
     addImplicationListener = metamethod(addImplicationListener)
 
@@ -208,9 +545,181 @@ class Protocol:
         return api.adapt(ob,self,default)
 
 
+_allocationLock = allocate_lock()   # for creating per-protocol locks
+
+_HEAPTYPE = 1<<9    # 'Py_TPFLAGS_HEAPTYPE': set for classes made at runtime
+
+_registryAttributes = dict([
+    (attr, True) for attr in Protocol.__dict__.keys()
+        if attr.startswith('_Protocol__') and Protocol.__dict__[attr] is None
+])
+
+# Reverse index of type registrations: maps the id() of each class registered
+# with a protocol to a dictionary mapping the id() of each such protocol to a
+# weak reference to it.  Entries are removed when the class or protocol dies.
+
+_protocolsByClass = {}
+
+def _unindex(classKey, protoKey, index=_protocolsByClass):
+    """Forget that the class with id 'classKey' is registered w/'protoKey'"""
+
+    # 'index' is bound early, since we're called from weakref callbacks that
+    # may run while the interpreter is shutting down
+
+    provided = index.get(classKey)
+
+    if provided is not None:
+        try:
+            del provided[protoKey]
+        except KeyError:
+            pass
+        if not provided:
+            try:
+                del index[classKey]
+            except KeyError:
+                pass
+
+def _indexRef(proto, adapters):
+    """Return a ref to 'proto' that unindexes 'adapters' when 'proto' dies"""
+
+    protoKey = id(proto)
+    unindex = _unindex
+
+    def forget(ref):
+        for classKey in adapters.keys():
+            unindex(classKey, protoKey)
+
+    return mkRef(proto, forget)
+
+
+def _refForgetter(owner, attr):
+    """Return a weakref callback that drops the dead ref from 'owner.attr'
+
+    The callback doesn't lock, as it may be called at any time, and only holds
+    a weak reference to 'owner', so 'owner' isn't kept alive by its own keys.
+    """
+
+    owner = mkRef(owner)
+
+    def forget(ref):
+        mapping = getattr(owner(), attr, None)
+        if mapping:
+            try:
+                del mapping[ref]
+            except KeyError:
+                pass
+
+    return forget
+
+
+# Transitive closure of protocol implications.  The simplest adapter and depth
+# for each protocol that a 'Protocol' implies, directly or not, are computed
+# the first time they're asked for, and kept until an implication is declared
+# for it or a protocol it implies ('_impliedPaths()').  Declaring one only has
+# to discard the closures of the protocols that imply its source, found by
+# following '__impliedBy' back from it, and protocols that die are simply
+# missing from the next closure.
+
+_closureLock = allocate_lock()
+
+def _closureChanged(source):
+    """Discard the closures that an implication added to 'source' changes"""
+
+    _closureLock.acquire()
+
+    try:
+        todo = [source]
+        seen = {}
+
+        while todo:
+            proto = todo.pop()
+            if id(proto) in seen:
+                continue
+            seen[id(proto)] = proto
+            proto._Protocol__pathChanges += 1
+
+            for ref in (proto._Protocol__impliedBy or {}).keys():
+                proto = ref()
+                if proto is not None:
+                    todo.append(proto)
+    finally:
+        _closureLock.release()
+
+
+def _impliedPaths(source):
+    """Return a dict mapping refs to the protocols 'source' implies to records
+
+    Each 'AdapterRecord' has the simplest adapter (and its depth) from
+    'source' to the protocol, following '__implies' edges in order of depth.
+    Ambiguous paths are skipped, since adapting reports them when they're used.
+    """
+
+    generation = source._Protocol__pathChanges
+    cached = source._Protocol__paths
+
+    if cached is not None and cached[0]==generation:
+        return cached[1]
+
+    paths = {}
+    byDepth = {0: [(source, NO_ADAPTER_NEEDED)]}
+
+    while byDepth:
+        depth = min(byDepth.keys())
+        items = byDepth[depth]
+        del byDepth[depth]
+
+        for proto, adapter in items:
+            if proto is source:
+                if depth:
+                    continue    # back round a cycle
+            else:
+                try:
+                    if not updateWithSimplestAdapter(
+                        paths, mkRef(proto), adapter, depth
+                    ):
+                        continue
+                except TypeError:
+                    continue
+
+            implies = getattr(proto,'_Protocol__implies',None) or {}
+
+            for ref, record in implies.items():
+                implied = ref()
+                path = composeAdapters(adapter, proto, record.adapter)
+                if implied is not None and path is not DOES_NOT_SUPPORT:
+                    byDepth.setdefault(depth+record.depth,[]).append(
+                        (implied, path)
+                    )
+
+    source._Protocol__paths = generation, paths
+    return paths
+
+
+def _updatedCopy(mapping, key, adapter, depth):
+    """Return a copy of 'mapping' updated w/'adapter' @ 'depth', or 'None'
+
+    'None' is returned if 'updateWithSimplestAdapter()' wouldn't change the
+    entry for 'key'.  'mapping' itself is never changed, and may be 'None'.
+    """
+
+    entry = {}
+
+    if mapping:
+        old = mapping.get(key)
+        if old is not None:
+            entry[key] = old
+    else:
+        mapping = {}
+
+    if updateWithSimplestAdapter(entry, key, adapter, depth):
+        mapping = mapping.copy()
+        mapping[key] = entry[key]
+        return mapping
+
 # Use faster __call__ method, if possible
 # XXX it could be even faster if the __call__ were in the tp_call slot
-# XXX directly, but Pyrex doesn't have a way to do that AFAIK.
+# XXX directly, but 'Protocol' is a classic class, so its instances all share
+# XXX the instance type's slot.  (See 'installInterfaceCall' for interfaces.)
 
 try:
     from _speedups import Protocol__call__
@@ -222,6 +731,328 @@ else:
 
 
 
+# Lazy implication support: implied declarations for lazy protocols (or made
+# during a declaration batch) wait in the protocol's '__pending' until the class
+# or a subclass is looked up in the protocol or one it implies, or the batch is
+# committed.  '__pending' maps the id() of each class to a list of a weakref to
+# the class (which removes the entry if the class dies first) followed by
+# (adapter, depth) items.
+#
+# So that lookups needn't check every protocol, each protocol's
+# '__pendingSources' maps the id() of each protocol (itself included) that has
+# pending declarations and implies it to a weak reference.  Lookups apply
+# only those.  '_pendingProtocols' has all the protocols with pending
+# declarations, for committing batches and 'protocolsProvidedBy()'.
+#
+# Applying a pending declaration for a class implies others for it, which are
+# declared at once rather than deferred again (except for lazy protocols, when
+# committing a batch).  '_applying' maps the id() of each thread that's
+# applying pending declarations to true if it's committing a batch.
+
+_pendingProtocols = {}
+_pendingLock = allocate_lock()
+_applying = {}
+
+# Declaration batches are per thread: '_openBatches' maps the id() of each
+# thread with a batch open to the number of (nested) batches it has open.
+# While it has any, the implication listener callbacks for its declarations are
+# queued in '_pendingNotices[thread]', a list with one notice per source and
+# implied protocol plus a dictionary of their positions, and are sent when its
+# outermost batch commits.  Committing applies all the (non-lazy) pending
+# declarations, including any made by batches still open in other threads.
+
+_openBatches = {}
+_pendingNotices = {}
+
+# Implied declarations that aren't deferred are propagated using a worklist
+# per thread, instead of recursively: '_worklists' maps a thread's id to a
+# dictionary of depth -> list of (class, protocol, adapter) to declare
+
+_worklists = {}
+
+_registerImplementation = Protocol.__dict__['registerImplementation']
+
+def _declareImplied(items):
+    """Declare implied '(klass, proto, adapter, depth)' items, or defer them
+
+    Only protocols using the stock 'registerImplementation()' can defer, since
+    others may have side effects that must happen at declaration time.  Nor
+    is 'DOES_NOT_SUPPORT' deferred, because registering it doesn't imply
+    anything: it only reaches protocols implied later if it's already in the
+    registry when their implications are added."""
+
+    thread = get_ident()
+    applying = _applying.get(thread)
+    batched = _openBatches and thread in _openBatches
+    declare = []
+
+    for item in items:
+        proto = item[1]
+        if item[2] is DOES_NOT_SUPPORT:
+            deferring = False
+        elif applying is None:
+            deferring = batched or getattr(proto,'lazyImplications',False)
+        else:
+            deferring = applying and getattr(proto,'lazyImplications',False)
+
+        if deferring and getattr(
+            proto.__class__,'registerImplementation',None
+        ) is _registerImplementation:
+            _deferImplied(*item)
+        else:
+            declare.append(item)
+
+    if declare:
+        _declareAll(declare)
+
+
+def _declareAll(items):
+    """Declare '(klass, proto, adapter, depth)' items and those they imply
+
+    Implied declarations that aren't deferred are added to a worklist for the
+    current thread, so they're declared in one pass instead of recursively.
+    """
+
+    thread = get_ident()
+    worklist = _worklists.get(thread)
+
+    if worklist is not None:
+        # We're called (indirectly) from the loop below, so just add to it
+        for klass, proto, adapter, depth in items:
+            worklist.setdefault(depth,[]).append((klass,proto,adapter))
+        return
+
+    _worklists[thread] = worklist = {}
+
+    for klass, proto, adapter, depth in items:
+        worklist.setdefault(depth,[]).append((klass,proto,adapter))
+
+    try:
+        # Shallowest first, so each (class, protocol) pair usually gets its
+        # best adapter first, and worse ones are then rejected without being
+        # propagated any further.  Diamond-shaped implication graphs imply
+        # the same pair more than once at a depth (w/equivalent but distinct
+        # adapter chains), so each pair is only declared again at that depth
+        # if the adapter is preferable, or the choice is ambiguous (in which
+        # case declaring it reports the error).
+        seen = {}
+        while worklist:
+            depth = min(worklist.keys())
+            for klass, proto, adapter in worklist.pop(depth):
+                key = id(klass), id(proto), depth
+                best = seen.get(key)
+                if best is not None:
+                    try:
+                        if minimumAdapter(best[2],adapter,depth,depth) \
+                           is best[2]:
+                            continue
+                    except TypeError:
+                        pass
+                seen[key] = klass, proto, adapter   # keep the ids unique
+                api.declareAdapterForType(proto, adapter, klass, depth)
+    finally:
+        del _worklists[thread]
+
+
+def _deferImplied(klass, proto, adapter, depth):
+    """Make 'adapter' for 'klass' to 'proto' pending, until it's needed"""
+
+    key = id(klass)
+    lock = proto._Protocol__getLock()
+    lock.acquire()
+
+    try:
+        pending = proto._Protocol__pending
+        if pending is None:
+            pending = proto._Protocol__pending = {}
+        entry = pending.get(key)
+        if entry is None:
+            entry = pending[key] = [
+                mkRef(klass, _pendingForgetter(pending, key))
+            ]
+        elif len(entry)==2:
+            # Keep only the simplest, as registering would: one it replaces
+            # could otherwise be implied further than it ever was.  (An
+            # ambiguous pair is kept, as it's only an error if registered.)
+            old, oldDepth = entry[1]
+            try:
+                best = minimumAdapter(old,adapter,oldDepth,depth)
+            except TypeError:
+                pass
+            else:
+                if best is old and oldDepth<=depth:
+                    return
+                del entry[1:]
+        entry.append((adapter,depth))
+    finally:
+        lock.release()
+
+    protoKey = id(proto)
+    _pendingLock.acquire()
+
+    try:
+        ref = _pendingProtocols.get(protoKey)
+        if ref is None or ref() is not proto:
+            ref = _pendingProtocols[protoKey] = mkRef(
+                proto, _pendingForgetter(_pendingProtocols, protoKey)
+            )
+    finally:
+        _pendingLock.release()
+
+    _notePendingSources(proto, [(protoKey, ref)], klass)
+
+
+def _notePendingSources(proto, items, klass=None):
+    """Note '(key, ref)' pending 'items' with 'proto' & the protocols it implies
+
+    Those are the protocols whose lookups could be changed by applying them.
+    'klass' is the class they're pending for, or 'None' if it may be any.
+    """
+
+    targets = [proto]
+
+    for ref in _impliedPaths(proto).keys():
+        target = ref()
+        if isinstance(target, Protocol):
+            targets.append(target)
+
+    for target in targets:
+        target._Protocol__addPendingSources(items, klass)
+
+
+def _pendingForgetter(mapping, key):
+    """Return a weakref callback to drop the dead ref's entry from 'mapping'
+
+    The entry for 'key' is either the ref or a list starting with it, and is
+    left alone if it has since been replaced."""
+
+    def forget(ref):
+        entry = mapping.get(key)
+        if isinstance(entry, list):
+            entry = entry[0]
+        if entry is ref:
+            try:
+                del mapping[key]
+            except KeyError:
+                pass
+
+    return forget
+
+
+def _applyPending(sources, classes=None, committing=False):
+    """Apply the declarations pending in 'sources' for 'classes' (or all)
+
+    'sources' maps keys to weak references to protocols.  Returns true if any
+    declarations were applied.  If 'committing' is true, lazy protocols'
+    declarations aren't applied, and they (but only they) can defer the ones
+    they imply.
+    """
+
+    thread = get_ident()
+    previous = _applying.get(thread)
+    _applying[thread] = committing
+    applied = False
+
+    # Pending declarations are older than any being declared now, so they're
+    # declared in full before going on with those
+    worklist = _worklists.pop(thread, None)
+
+    try:
+        # Declarations can still be made pending by other threads (or by
+        # lazy protocols when committing), so repeat until there are none
+        while True:
+            todo = []
+            for ref in sources.values():
+                proto = ref()
+                if proto is None or committing and getattr(
+                    proto,'lazyImplications',False
+                ):
+                    continue
+                for klass, items in proto._Protocol__takePending(classes):
+                    for adapter, depth in items:
+                        todo.append((klass, proto, adapter, depth))
+            if not todo:
+                break
+            _declareAll(todo)
+            applied = True
+    finally:
+        if previous is None:
+            del _applying[thread]
+        else:
+            _applying[thread] = previous
+        if worklist is not None:
+            _worklists[thread] = worklist
+
+    return applied
+
+
+def _prunePending(sources, lock):
+    """Drop the dead protocols and those with nothing pending from 'sources'"""
+
+    lock.acquire()
+
+    try:
+        for key, ref in sources.items():
+            proto = ref()
+            if proto is None or not proto._Protocol__pending:
+                del sources[key]
+    finally:
+        lock.release()
+
+
+def _queueNotice(src, dest, adapter, depth):
+    """Queue the 'newProtocolImplied()' callback for 'src' implying 'dest'"""
+
+    thread = get_ident()
+    queued = _pendingNotices.get(thread)
+
+    if queued is None:
+        queued = _pendingNotices[thread] = [], {}
+
+    notices, index = queued
+    key = id(src), id(dest)
+    notice = src, dest, adapter, depth
+
+    if key in index:
+        # Only the latest (i.e. best) adapter for the implication is sent
+        notices[index[key]] = notice
+    else:
+        index[key] = len(notices)
+        notices.append(notice)
+
+
+def _commitImplications():
+    """Apply the pending implied declarations for non-lazy protocols"""
+
+    _applyPending(_pendingProtocols, committing=True)
+    _prunePending(_pendingProtocols, _pendingLock)
+
+
+def _sendNotices():
+    """Send the implication listener callbacks queued by this thread's batch"""
+
+    notices, index = _pendingNotices.pop(get_ident(), ([], None))
+
+    for src, dest, adapter, depth in notices:
+        listeners = src._Protocol__listeners
+        if listeners:
+            for listener in listeners.keys():   # Must use keys()!
+                listener.newProtocolImplied(src, dest, adapter, depth)
+
+
+def _propagateImplications(typ):
+    """Apply pending implied declarations for 'typ' and its bases"""
+
+    try:
+        mro = typ.__mro__
+    except AttributeError:
+        mro = classicMRO(typ,extendedClassic=True)
+
+    _applyPending(_pendingProtocols, mro)
+    _prunePending(_pendingProtocols, _pendingLock)
+
+
+
 
 
 
@@ -257,6 +1088,14 @@ class AbstractBaseMeta(Protocol, type):
         type.__init__(self, __name__, __bases__, __dict__)
         Protocol.__init__(self)
 
+        # Registries are looked up through our MRO, so we mustn't see those
+        # of a base that already has its own (see '__setattr__()')
+        for attr in _registryAttributes:
+            for b in self.__mro__[1:]:
+                if attr in b.__dict__:
+                    type.__setattr__(self, attr, None)
+                    break
+
         for b in __bases__:
             if isinstance(b,AbstractBaseMeta) and b.__bases__<>(object,):
                 self.addImpliedProtocol(b)
@@ -274,11 +1113,35 @@ class AbstractBaseMeta(Protocol, type):
                 "Can't change interface __bases__", self
             )
 
+        if attr not in self.__dict__ and attr in _registryAttributes:
+            # Our subclasses would see our registry in place of the default,
+            # so give those that don't have their own a 'None' of their own
+            for sub in _allSubclasses(self):
+                if attr not in sub.__dict__:
+                    type.__setattr__(sub, attr, None)
+
         type.__setattr__(self,attr,val)
 
     __call__ = type.__call__
 
 
+def _allSubclasses(klass):
+    """Return a list of 'klass' subclasses, their subclasses, and so on"""
+
+    out = []
+    seen = {}
+    todo = type.__subclasses__(klass)
+
+    while todo:
+        klass = todo.pop()
+        if id(klass) not in seen:
+            seen[id(klass)] = True
+            out.append(klass)
+            todo.extend(type.__subclasses__(klass))
+
+    return out
+
+
 class AbstractBase(object):
     """Base class for a protocol that's a class"""
 
@@ -310,13 +1173,15 @@ class Interface(object):
     __metaclass__ = InterfaceClass
 
 
+# Let interfaces adapt from the tp_call slot, without going through a Python
+# __call__ method and a bound Protocol.__call__
 
-
-
-
-
-
-
+try:
+    from _speedups import installInterfaceCall
+except ImportError:
+    pass
+else:
+    installInterfaceCall(InterfaceClass, Interface)
 
 
 
@@ -1,6 +1,8 @@
 from unittest import TestSuite, TestCase, makeSuite
 from protocols import adapt, advise, Interface, Attribute, declareAdapter
 from protocols import AbstractBase, AdaptationFailure
+from protocols import NO_ADAPTER_NEEDED, DOES_NOT_SUPPORT, adapt_many
+from protocols import adapt_first, adapt_each
 
 class APITests(TestCase):
 
@@ -17,6 +19,685 @@ class APITests(TestCase):
         assert adapt('foo',list,None) is None
 
 
+    def checkConformAddedAfterAdapt(self):
+        class Conformer(object): pass
+        c = Conformer()
+        assert adapt(c,42,None) is None
+        c.__conform__ = lambda protocol: "instance"
+        assert adapt(c,42,None) == "instance"
+        del c.__conform__
+        assert adapt(c,42,None) is None
+        Conformer.__conform__ = lambda self,protocol: "class"
+        assert adapt(c,42,None) == "class"
+
+    def checkInterfaceCall(self):
+        class IFoo(Interface): pass
+        class Foo: advise(instancesProvide=[IFoo])
+        foo = Foo()
+        assert IFoo(foo) is foo
+        assert IFoo(42,None) is None
+        assert IFoo(42,default=99) == 99
+        self.assertRaises(AdaptationFailure, IFoo, 42)
+        self.assertRaises(TypeError, IFoo)
+        self.assertRaises(TypeError, IFoo, foo, None, None)
+
+        class IBar(IFoo):
+            def __init__(self, *args):
+                self.args = args
+        assert IBar(foo).args == (foo,)
+
+        class IMeta(Interface.__class__): pass
+        class IBaz(Interface): __metaclass__ = IMeta
+        class Baz: advise(instancesProvide=[IBaz])
+        baz = Baz()
+        assert IBaz(baz) is baz
+        assert IBaz(foo,None) is None
+
+    def checkAdapterChain(self):
+        from protocols.adapters import composeAdapters, minimumAdapter
+        from protocols.tests.checks import a1, a2
+        from cPickle import loads, dumps
+
+        c1 = composeAdapters(a1, None, a2)
+        assert c1(42) == ('a2',('a1',42))
+        assert c1.__adapterCount__ == 2
+
+        c2 = composeAdapters(c1, None, composeAdapters(a2, None, a1))
+        assert c2.adapters == (a1,a2,a2,a1)     # flattened, not nested
+        assert c2.__adapterCount__ == 4
+        assert minimumAdapter(c2, c1) is c1
+
+        assert composeAdapters(c1, None, DOES_NOT_SUPPORT) is DOES_NOT_SUPPORT
+        assert composeAdapters(NO_ADAPTER_NEEDED, None, c1) is c1
+        assert composeAdapters(lambda ob: None, None, a1)(42) is None
+        assert loads(dumps(c2)).adapters == c2.adapters
+
+        # Long chains are kept whole as a step, not copied at each step
+        c3 = a1
+        for i in range(50):
+            c3 = composeAdapters(c3, None, a2)
+        assert c3.__adapterCount__ == 51 and len(c3.adapters) < 51
+        ob = c3(42)
+        for i in range(50):
+            assert ob[0] == 'a2'
+            ob = ob[1]
+        assert ob == ('a1',42)
+
+    def checkAdapterRecords(self):
+        from protocols.adapters import AdapterRecord, composeAdapters
+        from protocols.adapters import updateWithSimplestAdapter
+        from protocols.tests.checks import a1, a2
+        from cPickle import loads, dumps
+
+        c1 = composeAdapters(a1, None, a2)
+        reg = {}
+        assert updateWithSimplestAdapter(reg, 'x', c1, 1)
+        r = reg['x']
+        assert isinstance(r, AdapterRecord) and r.count == 2
+        adapter, depth = r
+        assert (adapter, depth) == (r[0], r[1]) == (c1, 1)
+        assert not updateWithSimplestAdapter(reg, 'x', c1, 2)
+        assert updateWithSimplestAdapter(reg, 'x', a1, 1) and reg['x'][0] is a1
+        self.assertRaises(TypeError, updateWithSimplestAdapter, reg, 'x', a2, 1)
+
+        reg = {'x': (a1, 1)}    # plain tuples are still understood
+        assert not updateWithSimplestAdapter(reg, 'x', c1, 1)
+        adapter, depth = loads(dumps(r))
+        assert adapter.adapters == c1.adapters and depth == 1
+
+    def checkAdaptMany(self):
+        class IFoo(Interface): pass
+        class Foo: advise(instancesProvide=[IFoo])
+        class Bar(object): pass
+        class Conformer(object):
+            def __conform__(self,protocol):
+                return "conformed"
+        declareAdapter(lambda ob: ('bar',ob), provides=[IFoo], forTypes=[Bar])
+
+        f, b, c = Foo(), Bar(), Conformer()
+        self.assertEqual(
+            adapt_many([f,b,c,f,42,b], IFoo, None),
+            [f,('bar',b),"conformed",f,None,('bar',b)]
+        )
+        self.assertRaises(AdaptationFailure, adapt_many, [f,42], IFoo)
+        self.assertEqual(adapt_many((), IFoo), [])
+
+        class Unsized(list):
+            def __len__(self): raise TypeError
+        self.assertEqual(adapt_many(Unsized([f,42]), IFoo, None), [f,None])
+
+        # Protocols that aren't Protocols, or override __adapt__
+        self.assertEqual(adapt_many([[],'x'], list, None), [[],None])
+        class Classic: pass
+        classic = Classic()
+        self.assertEqual(adapt_many([classic,42], Classic, 0), [classic,0])
+        from cStringIO import StringIO
+        s = StringIO("foo")
+        self.assertEqual(adapt_many([s,42], IImplicitRead, 99), [s,99])
+
+    def checkAdaptFirstAndEach(self):
+        class IFoo(Interface): pass
+        class IBar(Interface): pass
+        class IBaz(IBar): pass
+        class Foo(object): advise(instancesProvide=[IBaz])
+        class Conformer:
+            def __conform__(self,protocol):
+                if protocol is IFoo:
+                    return "conformed"
+
+        f, c = Foo(), Conformer()
+        assert adapt_first(f, [IFoo,IBar,IBaz]) is f
+        assert adapt_first(c, [IBar,IFoo]) == "conformed"
+        assert adapt_first(c, [IBar,list], 42) == 42
+        assert adapt_first([], [IFoo,list]) == []
+        self.assertRaises(AdaptationFailure, adapt_first, 42, [IFoo,IBar])
+        self.assertEqual(adapt_each(f, [IFoo,IBar,Foo,IBaz]), [None,f,f,f])
+        self.assertEqual(adapt_each(c, [IFoo,IBar], 0), ["conformed",0])
+        self.assertEqual(adapt_each(c, ()), [])
+        class Classic: pass
+        self.assertEqual(adapt_each(42, [Classic]), [None])
+        assert adapt_first(42, [Classic], None) is None
+
+    def checkMemoizedAdapter(self):
+        from protocols import Adapter
+        class IFoo(Interface): pass
+        class Subject(object): pass
+        class FooAdapter(Adapter):
+            advise(
+                instancesProvide=[IFoo], asAdapterForTypes=[Subject,list],
+                memoize=4
+            )
+        s1, s2, s3, s4, s5 = [Subject() for i in range(5)]
+        a1, a2 = IFoo(s1), IFoo(s2)
+        assert a1.subject is s1 and a2.subject is s2
+        assert IFoo(s1) is a1 and IFoo(s2) is a2
+        IFoo(s3); IFoo(s4); IFoo(s1)
+        IFoo(s5)    # evicts the least recently used: s2 and s3
+        assert IFoo(s1) is a1
+        assert IFoo(s2) is not a2
+        l = []  # not weakly referenceable, so never cached
+        assert IFoo(l) is not IFoo(l)
+
+        # Redeclaring a memoized factory isn't ambiguous
+        declareAdapter(FooAdapter, [IFoo], forTypes=[Subject], memoize=4)
+
+        try:
+            class Bad: advise(instancesProvide=[IFoo], memoize=4)
+        except TypeError:
+            pass
+        else:
+            raise AssertionError("Should've rejected 'memoize'")
+
+    def checkAdapterCache(self):
+        from protocols.adapters import AdapterCache
+        class Subject(object): pass
+        cache = AdapterCache(lambda ob: [ob.__class__], 10)
+        s = Subject()
+        a = cache(s)
+        assert cache(s) is a and a == [Subject]
+        assert len(cache.entries) == 1
+        del s   # entries go away with their subjects
+        assert len(cache.entries) == 0
+        assert cache(Subject()) is not a
+
+    def checkLazyImplications(self):
+        from protocols import Protocol, declareAdapterForType
+        from protocols import declareAdapterForProtocol
+        P1, P2, P3, P4 = Protocol(), Protocol(), Protocol(), Protocol()
+        P2.lazyImplications = P3.lazyImplications = True
+        declareAdapterForProtocol(P2, lambda o: ('P2',o), P1)
+        declareAdapterForProtocol(P3, NO_ADAPTER_NEEDED, P2)
+        class Base(object): pass
+        class Sub(Base): pass
+        declareAdapterForType(P1, NO_ADAPTER_NEEDED, Base)
+        assert id(Base) in P2._Protocol__pending
+        declareAdapterForType(P2, DOES_NOT_SUPPORT, Sub)
+        declareAdapterForType(P4, NO_ADAPTER_NEEDED, Sub)
+        ob = Sub()
+        assert P4(ob) is ob and P1(ob) is ob
+        # Only lookups in protocols that P2 implies (or P2's own) apply it
+        assert id(Base) in P2._Protocol__pending
+        assert P2._Protocol__pendingSources.keys() == [id(P2)]
+        assert P4._Protocol__pendingSources is None
+        assert P2(ob, None) is None     # the closer declaration still wins
+        assert id(Base) not in P2._Protocol__pending
+        assert P3(ob) == ('P2', ob) and not P3._Protocol__pending
+        # Later implications of P2 apply to its pending declarations, too
+        declareAdapterForType(P1, NO_ADAPTER_NEEDED, Sub)
+        declareAdapterForProtocol(P4, lambda o: ('P4',o), P3)
+        assert id(Sub) in P2._Protocol__pending
+        assert id(P2) in P4._Protocol__pendingSources
+
+    def checkDeferralKeepsDeclarationOrder(self):
+        from protocols import Protocol, declareAdapterForType
+        from protocols import declareAdapterForProtocol
+        from protocols import beginDeclarations, commitDeclarations
+        f = lambda o: ('f',o)
+        for mode in 'eager', 'lazy', 'batch':
+            IA, IB, IC = Protocol(), Protocol(), Protocol()
+            IB.lazyImplications = IC.lazyImplications = (mode=='lazy')
+            declareAdapterForProtocol(IC, NO_ADAPTER_NEEDED, IB)
+            declareAdapterForProtocol(IB, f, IA)
+            class C(object): pass
+            if mode=='batch': beginDeclarations()
+            declareAdapterForType(IA, NO_ADAPTER_NEEDED, C)
+            # IB's pending 'f' is registered first, so it's still implied
+            declareAdapterForType(IB, DOES_NOT_SUPPORT, C)
+            c = C()
+            self.assertEqual(IC(c, None), ('f',c))
+            if mode=='batch': commitDeclarations()
+            assert IB(c, None) is None and IC(c, None) == ('f',c)
+            # A pending declaration that a later one replaces is forgotten,
+            # or it'd be ambiguous with itself along P2 and P3 as well
+            P1, P2, P3, P4 = [Protocol() for i in range(4)]
+            for p in P1, P2, P3, P4:
+                p.lazyImplications = (mode=='lazy')
+            declareAdapterForProtocol(P4, NO_ADAPTER_NEEDED, P2)
+            declareAdapterForProtocol(P4, lambda o: ('g',o), P3, 2)
+            if mode=='batch': beginDeclarations()
+            declareAdapterForProtocol(P1, f, IA)
+            declareAdapterForProtocol(P1, NO_ADAPTER_NEEDED, IA)
+            declareAdapterForProtocol(P2, NO_ADAPTER_NEEDED, P1, 2)
+            declareAdapterForProtocol(P3, NO_ADAPTER_NEEDED, P1)
+            if mode=='batch': commitDeclarations()
+            assert P4(c) is c
+
+    def checkDeclarationBatch(self):
+        from protocols import Protocol, declareAdapterForProtocol
+        from protocols import beginDeclarations, commitDeclarations
+        class Listener:
+            def __init__(self): self.log = []
+            def newProtocolImplied(self, *args): self.log.append(args)
+        P1, P2, P3 = Protocol(), Protocol(), Protocol()
+        listener = Listener()
+        P1.addImplicationListener(listener)
+        class Foo: pass
+
+        beginDeclarations()
+        beginDeclarations()
+        declareAdapterForProtocol(P2, lambda o: ('P2',o), P1, 2)
+        declareAdapterForProtocol(P2, NO_ADAPTER_NEEDED, P1)
+        declareAdapterForProtocol(P3, NO_ADAPTER_NEEDED, P2)
+        declareImplementation(Foo, instancesProvide=[P1])
+        commitDeclarations()
+        assert id(Foo) in P2._Protocol__pending and not listener.log
+        commitDeclarations()
+
+        assert not P2._Protocol__pending and not P3._Protocol__pending
+        self.assertEqual(listener.log, [(P1,P2,NO_ADAPTER_NEEDED,1)])
+        foo = Foo()
+        assert P2(foo) is foo and P3(foo) is foo
+        self.assertRaises(RuntimeError, commitDeclarations)
+
+    def checkDeepImplications(self):
+        from protocols import Protocol, declareAdapterForProtocol
+        from protocols import declareAdapterForType
+        # Propagation isn't recursive, so long chains don't overflow the stack
+        protos = [Protocol() for i in range(1000)]
+        for i in range(1,1000):
+            declareAdapterForProtocol(protos[i-1], NO_ADAPTER_NEEDED, protos[i])
+        class Foo(object): pass
+        declareAdapterForType(protos[-1], lambda o: ('Foo',o), Foo)
+        foo = Foo()
+        assert protos[0](foo) == ('Foo',foo)
+
+    def checkRegistryDoesNotKeepClassesAlive(self):
+        from protocols import Protocol, declareAdapterForProtocol
+        from weakref import ref
+        import gc
+        P1, P2, P3 = Protocol(), Protocol(), Protocol()
+        P3.lazyImplications = True
+        declareAdapterForProtocol(P2, NO_ADAPTER_NEEDED, P1)
+        declareAdapterForProtocol(P3, NO_ADAPTER_NEEDED, P1)
+        class New(object): pass
+        class Classic: pass
+        class NotLookedUp(object): pass
+        for klass in New, Classic, NotLookedUp:
+            declareImplementation(klass, instancesProvide=[P1])
+        ob = New()
+        assert P2(ob) is ob and P2(Classic(),None) is not None
+        assert id(NotLookedUp) in P3._Protocol__pending
+        refs = ref(New), ref(Classic), ref(NotLookedUp)
+        keys = id(NotLookedUp),
+        del New, Classic, NotLookedUp, ob, klass
+        gc.collect()
+        for r in refs:
+            assert r() is None
+        for p in P1, P2, P3:
+            assert not p._Protocol__adapters
+            assert not p._Protocol__cache
+        assert keys[0] not in P3._Protocol__pending
+
+    def checkDeadClassesKeepOtherLookups(self):
+        from protocols import Protocol
+        import gc
+        P = Protocol()
+        class Keep(object): pass
+        class Dies(object): pass
+        for klass in Keep, Dies:
+            declareImplementation(klass, instancesProvide=[P])
+            P(klass())
+        cache = P._Protocol__cache
+        assert id(Keep) in cache and id(Dies) in cache
+        del Dies, klass
+        gc.collect()
+        assert P._Protocol__cache is cache and cache.keys() == [id(Keep)]
+        assert P._Protocol__adapters.keys() == [id(Keep)]
+        assert P(Keep()) is not None
+
+    def checkRegistriesAllocatedOnWrite(self):
+        from protocols import Protocol, Interface, Variation
+        P = Protocol()
+        assert not P.__dict__   # nothing allocated until something's declared
+        assert P(self, None) is None and not P.__dict__
+        class IBase(Interface): pass
+        class ISub(IBase): pass
+        class Foo(object): pass
+        declareImplementation(Foo, instancesProvide=[IBase])
+        assert ISub._Protocol__adapters is None
+        assert ISub(Foo(), None) is None and IBase(Foo(), None) is not None
+        V = Variation(P)
+        declareImplementation(Foo, instancesProvide=[V])
+        assert P._Protocol__implies and V(Foo(), None) is not None
+
+    def checkInterfacesDontShareRegistries(self):
+        from protocols import Interface
+        class IBase(Interface): pass
+        class IMid(IBase): pass
+        class ILeaf(IMid): pass
+        for I in IBase, IMid, ILeaf:
+            # Nothing to shadow yet, so nothing's written to the class dicts
+            assert '_Protocol__adapters' not in I.__dict__
+            assert '_Protocol__cache' not in I.__dict__
+        class Foo(object): pass
+        declareImplementation(Foo, instancesProvide=[IBase])
+        assert IBase(Foo(), None) is not None
+        class ILater(IBase): pass
+        for I in IMid, ILeaf, ILater:
+            assert I._Protocol__adapters is None
+            assert I._Protocol__cache is None
+            assert I(Foo(), None) is None
+
+    def checkDeclarationsForgetAffectedLookups(self):
+        from protocols import Protocol, declareAdapterForType
+        from protocols import declareAdapterForProtocol
+        P1, P2 = Protocol(), Protocol()
+        class A(object): pass
+        class B(object): pass
+        class C(B): pass
+        class Classic: pass
+        declareAdapterForType(P1, NO_ADAPTER_NEEDED, A)
+        a, b, c, classic = A(), B(), C(), Classic()
+        for ob in a, b, c, classic:
+            P1(ob, None)
+        cache = P1._Protocol__cache
+        implies = P1._Protocol__implies
+        declareAdapterForType(P1, NO_ADAPTER_NEEDED, B)
+        # Only the lookups of B and its subclasses are discarded
+        assert id(B) not in cache and id(C) not in cache
+        assert id(A) in cache and id(Classic) in cache
+        assert P1(b) is b and P1(c) is c
+        declareAdapterForType(P1, NO_ADAPTER_NEEDED, object)
+        assert not cache and P1(classic) is classic
+        # Implications are replaced, not changed
+        declareAdapterForProtocol(P2, NO_ADAPTER_NEEDED, P1)
+        assert not implies and P2(a) is a
+
+    def checkReverseIndexes(self):
+        from protocols import Protocol, protocolsProvidedBy, typesProviding
+        from protocols import declareAdapterForProtocol
+        from protocols.interfaces import _protocolsByClass
+        import gc
+        class IA(Interface): pass
+        class IB(IA): pass
+        P, Q = Protocol(), Protocol()
+        class Base(object): advise(instancesProvide=[IB])
+        class Sub(Base): advise(instancesDoNotProvide=[IA])
+        declareImplementation(Base, instancesProvide=[Q])
+        declareAdapter(lambda o: o, provides=[P], forTypes=[Sub])
+
+        provided = protocolsProvidedBy(Sub)
+        for proto in IB, P, Q:
+            assert proto in provided
+        assert IA not in provided and IA in protocolsProvidedBy(Base)
+        assert typesProviding(IA) == typesProviding(IB) == [Base]
+        assert typesProviding(P) == [Sub]
+        assert typesProviding(list) == typesProviding(42) == []
+
+        # Only the pending declarations that could matter are applied
+        L1, L2 = Protocol(), Protocol()
+        L1.lazyImplications = L2.lazyImplications = True
+        declareAdapterForProtocol(L1, NO_ADAPTER_NEEDED, P)
+        declareAdapterForProtocol(L2, NO_ADAPTER_NEEDED, Q)
+        assert typesProviding(L1) == [Sub] and not L1._Protocol__pending
+        assert id(Base) in L2._Protocol__pending
+        assert typesProviding(L2) == [Base]
+
+        key = id(Sub)
+        del Sub, Q, L1, L2, provided, proto
+        gc.collect()
+        assert key not in _protocolsByClass and typesProviding(P) == []
+        assert len(_protocolsByClass[id(Base)]) == 2
+
+    def checkImplicationClosure(self):
+        from protocols import Protocol, declareAdapterForProtocol
+        from protocols import getImplication, impliedSubset, allImpliedProtocols
+        class IA(Interface): pass
+        class IB(IA): pass
+        class IC(IB): pass
+        P, Q, R = Protocol(), Protocol(), Protocol()
+        assert getImplication(IC, IA) == (NO_ADAPTER_NEEDED, 2)
+        assert getImplication(IC, IC) == (NO_ADAPTER_NEEDED, 0)
+        assert getImplication(IA, IC) is None
+        assert impliedSubset(IC, [IA, P, IC, IB]) == [IA, IC, IB]
+
+        declareAdapterForProtocol(Q, lambda o: ('Q',o), P)
+        declareAdapterForProtocol(R, lambda o: ('R',o), Q)
+        declareAdapterForProtocol(P, NO_ADAPTER_NEEDED, R)  # a cycle
+        adapter, depth = getImplication(P, R)
+        assert depth == 2 and adapter(1) == ('R',('Q',1))
+        assert impliedSubset(P, [P, Q, R, IA]) == [P, Q, R]
+        declareAdapterForProtocol(R, lambda o: ('PR',o), P)
+        adapter, depth = getImplication(P, R)
+        assert depth == 1 and adapter(1) == ('PR',1)
+        implied = dict(allImpliedProtocols(P))
+        assert len(implied) == 2 and implied[Q][1] == 1
+
+    def checkOnlyAffectedClosuresDiscarded(self):
+        from protocols import Protocol, declareAdapterForProtocol
+        from protocols.interfaces import _impliedPaths
+        P, Q, R, S, T = [Protocol() for i in range(5)]
+        declareAdapterForProtocol(Q, NO_ADAPTER_NEEDED, P)
+        declareAdapterForProtocol(T, NO_ADAPTER_NEEDED, S)
+        paths = [_impliedPaths(proto) for proto in P, Q, S]
+        declareAdapterForProtocol(R, NO_ADAPTER_NEEDED, Q)
+        # P implies Q, so P's closure is discarded along with Q's, but S's
+        # is kept
+        assert _impliedPaths(S) is paths[2]
+        assert len(_impliedPaths(P)) == 2 and len(_impliedPaths(Q)) == 1
+
+    def checkDeadImplicationsForgotten(self):
+        from protocols import Protocol, declareAdapterForProtocol
+        import gc
+        P, Q, R = Protocol(), Protocol(), Protocol()
+        declareAdapterForProtocol(Q, NO_ADAPTER_NEEDED, P)
+        declareAdapterForProtocol(R, NO_ADAPTER_NEEDED, Q)
+        declareAdapterForProtocol(R, NO_ADAPTER_NEEDED, P)
+        implies = P._Protocol__implies
+        del Q
+        gc.collect()
+        # Dead entries are dropped as they die, without copying the mapping
+        assert len(implies) == 1 and P._Protocol__implies is implies
+        assert [proto for proto, d in P.getImpliedProtocols()] == [R]
+
+    def checkTransientVariationsForgotten(self):
+        from protocols import variationOf, allImpliedProtocols
+        from protocols.interfaces import _impliedPaths
+        import gc
+        class IContext(Interface): pass
+        keep = variationOf(IContext, 'kept')
+        for i in range(20):
+            for j in range(100):
+                variationOf(IContext, object())
+            gc.collect()
+            # The closure only has room for the live implied protocols
+            assert allImpliedProtocols(IContext) == [
+                (keep, (NO_ADAPTER_NEEDED, 1))
+            ]
+            assert len(_impliedPaths(IContext)) == 1
+
+    def checkCompactDeclarations(self):
+        from protocols import ProviderMixin, adviseObject
+        from protocols.classic import providedRegistry
+        from pickle import loads, dumps
+        class IA(Interface): pass
+        class IB(Interface): pass
+        class Mixed(ProviderMixin): pass
+        class Plain(object): pass
+        ob, plain = Mixed(), Plain()
+        adviseObject(ob, provides=[IA, IB])
+        adviseObject(plain, provides=[IA])
+        registry = ob.__protocols_provided__
+        assert isinstance(registry, providedRegistry) and len(registry) == 2
+        assert IA(ob) is ob and IB in registry and registry[IB].depth == 1
+        declareAdapter(lambda o: ('IB',o), provides=[IB], forObjects=[ob])
+        assert IB(ob) is ob     # the existing, shorter adapter is kept
+        copy = loads(dumps(providedRegistry([Interface, registry[IA]])))
+        assert isinstance(copy, providedRegistry)
+        assert copy[Interface].adapter is NO_ADAPTER_NEEDED
+        assert not hasattr(plain.__conform__, '__dict__') and IA(plain) is plain
+
+    def checkEquivalentProtocols(self):
+        from protocols import adviseObject
+        class IX(Interface): pass
+        class IA(Interface): advise(equivalentProtocols=[IX])
+        class Old(object): pass
+        class Foo(object): pass
+        f = lambda ob: ('f',ob)
+        g = lambda ob: ('g',ob)
+
+        # Each protocol keeps its own declarations, which are preferred to
+        # those it gets from its equivalents
+        declareAdapter(f, provides=[IA], forTypes=[Old])
+        declareAdapter(g, provides=[IX], forTypes=[Old])
+        old = Old()
+        assert IA(old) == ('f',old) and IX(old) == ('g',old)
+
+        class New(object): advise(instancesProvide=[IX])
+        new, foo = New(), Foo()
+        assert IA(new) is new
+        adviseObject(foo, provides=[IA])
+        assert IX(foo) is foo
+
+    def checkIncompatibleBaseConform(self):
+        from protocols import adviseObject
+        class IA(Interface): pass
+        class IB(Interface): pass
+        class Base: pass
+        class Mid(Base): pass
+        class Sub(Mid): pass
+        adviseObject(Base, provides=[IA])
+        adviseObject(Sub, provides=[IB])
+        assert IA(Sub) is Sub and IB(Sub) is Sub
+        Mid.__conform__ = lambda self, protocol: None
+        self.assertRaises(TypeError, Sub.__conform__, IA)
+
+    def checkClassicBasesChanged(self):
+        class IA(Interface): pass
+        class Base: pass
+        class Other: pass
+        class Sub(Base): pass
+        declareAdapter(NO_ADAPTER_NEEDED, provides=[IA], forTypes=[Other])
+        ob = Sub()
+        assert adapt(ob, IA, None) is None
+        Sub.__bases__ = (Other,)
+        assert adapt(ob, IA, None) is ob
+        Sub.__bases__ = (Base,)
+        assert adapt(ob, IA, None) is None
+
+    def checkAdaptUsesClassAttribute(self):
+        class IA(Interface): pass
+        class Real(object): pass
+        class Proxy(object):
+            __class__ = property(lambda self: Real)
+        class Proxy2(object):
+            def __getattribute__(self, name):
+                if name=='__class__':
+                    return Real
+                return object.__getattribute__(self, name)
+        declareAdapter(NO_ADAPTER_NEEDED, provides=[IA], forTypes=[Real])
+        for ob in Real(), Proxy(), Proxy2():
+            assert adapt(ob, IA, None) is ob
+        assert adapt(object(), IA, None) is None
+
+    def checkOldRegistryPickles(self):
+        from protocols import adviseObject
+        from protocols.adapters import AdapterRecord
+        from cPickle import loads, dumps
+        ob = Pickled()
+        adviseObject(ob, provides=[IPickled])
+        registry = ob.__conform__
+        for protocol, record in registry.items():
+            # Older versions stored (and so pickled) plain tuples
+            dict.__setitem__(registry, protocol, tuple(record))
+        copy = loads(dumps(ob))
+        record = copy.__conform__[IPickled]
+        assert isinstance(record, AdapterRecord)
+        assert record.adapter is NO_ADAPTER_NEEDED and record.depth == 1
+        assert IPickled(copy) is copy
+        assert loads(dumps(copy)).__conform__.keys() == [IPickled]
+
+    def checkOldProvidedPickles(self):
+        from protocols import adviseObject
+        from protocols.classic import providedRegistry
+        from cPickle import loads, dumps
+        class IB(Interface): pass
+        class IC(Interface): pass
+        ob = PickledMixin()
+        # Older versions stored (and so pickled) a dictionary of tuples
+        ob.__protocols_provided__ = {IPickled: (NO_ADAPTER_NEEDED, 1)}
+        copy = loads(dumps(ob))
+        assert IPickled(copy) is copy
+        adviseObject(copy, provides=[IB])
+        registry = copy.__protocols_provided__
+        assert isinstance(registry, providedRegistry) and len(registry) == 2
+        assert registry[IPickled].adapter is NO_ADAPTER_NEEDED
+        declareAdapter(lambda o: ('IC',o), provides=[IC], forProtocols=[IB])
+        assert IC(copy) == ('IC',copy) and IPickled(copy) is copy
+
+    def checkBatchesArePerThread(self):
+        from protocols import Protocol, declareAdapterForProtocol
+        from protocols import beginDeclarations, commitDeclarations
+        from threading import Thread
+        P1, P2 = Protocol(), Protocol()
+        declareAdapterForProtocol(P2, NO_ADAPTER_NEEDED, P1)
+        class Foo: pass
+        results = []
+        def declare():
+            declareImplementation(Foo, instancesProvide=[P1])
+            results.append(P2._Protocol__adapters.keys() == [id(Foo)])
+            try:
+                commitDeclarations()
+            except RuntimeError:
+                results.append(True)
+        beginDeclarations()
+        try:
+            thread = Thread(target=declare)
+            thread.start()
+            thread.join()
+        finally:
+            commitDeclarations()
+        self.assertEqual(results, [True, True])
+
+    def checkImpliedDuplicatesSkipped(self):
+        from protocols import Protocol, declareAdapterForProtocol
+        from protocols import declareAdapterForType
+        from protocols.tests.checks import a1, a2
+        A, B, D = Protocol(), Protocol(), Protocol()
+        log = []
+        register = D.registerImplementation
+        def counting(klass, adapter, depth):
+            log.append((adapter, depth))
+            return register(klass, adapter, depth)
+        D.registerImplementation = counting
+        # A implies D at depth 2, directly and (w/a longer chain) via B
+        declareAdapterForProtocol(D, a1, A, 2)
+        declareAdapterForProtocol(B, a2, A)
+        declareAdapterForProtocol(D, a2, B)
+        class Foo(object): pass
+        declareAdapterForType(A, NO_ADAPTER_NEEDED, Foo)
+        assert log == [(a1, 3)]     # the longer chain isn't declared
+        foo = Foo()
+        assert D(foo) == ('a1', foo)
+
+    def checkImpliedAmbiguity(self):
+        from protocols import Protocol, declareAdapterForProtocol
+        from protocols import declareAdapterForType
+        from protocols.tests.checks import a1, a2
+        # A implies D through B and C at the same depth, w/different adapters
+        A, B, C, D = Protocol(), Protocol(), Protocol(), Protocol()
+        declareAdapterForProtocol(B, a1, A)
+        declareAdapterForProtocol(C, a2, A)
+        declareAdapterForProtocol(D, NO_ADAPTER_NEEDED, B)
+        declareAdapterForProtocol(D, NO_ADAPTER_NEEDED, C)
+        class Foo(object): pass
+        class Bar(object): pass
+        for check in 0, 1:
+            D.lazyImplications = check  # lazily, the lookup reports it
+            try:
+                if check:
+                    declareAdapterForType(A, NO_ADAPTER_NEEDED, Bar)
+                    D(Bar())
+                else:
+                    declareAdapterForType(A, NO_ADAPTER_NEEDED, Foo)
+                    D(Foo())
+            except TypeError, v:
+                assert v.args[0] == "Ambiguous adapter choice"
+                assert v.args[3:] == (3, 3)
+                assert v.args[1] in (a1, a2) and v.args[2] in (a1, a2)
+            else:
+                raise AssertionError("Ambiguity wasn't reported")
+
     def checkAdviseFailsInCallContext(self):
         try:
             advise()
@@ -163,7 +844,9 @@ class APITests(TestCase):
 
 
 from protocols import protocolForType, protocolForURI, sequenceOf, advise
-from protocols import declareImplementation, Variation
+from protocols import declareImplementation, Variation, variationOf
+from protocols import ProviderMixin
+from protocols.generate import ADAPT_SEQUENCE
 from UserDict import UserDict
 
 IGetSetMapping  = protocolForType(dict,['__getitem__','__setitem__'])
@@ -185,6 +868,15 @@ class MyUserMapping(object):
 
 declareImplementation(MyUserMapping,[IMyUnusualMapping])
 
+class IPickled(Interface):
+    pass
+
+class Pickled:
+    pass    # classic, so it gets a 'conformsRegistry' when advised
+
+class PickledMixin(ProviderMixin):
+    pass
+
 
 
 
@@ -234,6 +926,20 @@ class GenerationTests(TestCase):
         class ISequenceLike(Interface): advise(protocolIsSubsetOf=[multimap])
         ISequenceLike([d1,d2])
 
+    def checkSequenceFailure(self):
+        d1,d2 = {},{}
+        assert multimap((d1,d2)) == [d1,d2]
+        assert ADAPT_SEQUENCE(iter([d1,d2]), multimap) == [d1,d2]
+        assert multimap([]) == []
+        assert multimap([d1,None,d2], None) is None
+
+        seen = []
+        class Counted(object):
+            def __conform__(self, protocol):
+                seen.append(self)
+        self.assertRaises(AdaptationFailure, multimap, [Counted(),Counted()])
+        assert len(seen)==1     # gave up at the first failure
+
     def checkVariation(self):
         d = {}
         assert IMyUnusualMapping(d,None) is d # GetSet implies variation
@@ -244,6 +950,21 @@ class GenerationTests(TestCase):
         self.assertEqual(repr(Variation(Interface,42)),
           "Variation(<class 'protocols.interfaces.Interface'>,42)")
 
+    def checkVariationOf(self):
+        import gc
+        class IContext(Interface): pass
+        ctx = object()
+        V = variationOf(IContext, ctx)
+        assert variationOf(IContext, ctx) is V and V.context is ctx
+        assert variationOf(IContext) is not V
+        class Foo(object): advise(instancesProvide=[IContext])
+        foo = Foo()
+        assert V(foo) is foo
+        # Unused variations are dropped, along with their implication links
+        del V
+        gc.collect()
+        assert IContext.getImpliedProtocols() == []
+
 def test_suite():
 
     from protocols.tests import test_advice, test_direct, test_classes
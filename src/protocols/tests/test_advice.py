@@ -98,6 +98,16 @@ class MROTests(TestCase):
         assert list(getMRO(spam)) == basicMRO
         assert list(getMRO(spam,True)) == basicMRO+[InstanceType,object]
 
+    def checkClassicMROBasesChanged(self):
+        class foo: pass
+        class bar: pass
+        class baz(foo): pass
+        class spam(baz): pass
+        assert list(getMRO(spam)) == [spam,baz,foo]
+        baz.__bases__ = (bar,)
+        assert list(getMRO(spam)) == [spam,baz,bar]
+        assert list(getMRO(spam,True)) == [spam,baz,bar,InstanceType,object]
+
 
 
 TestClasses = SuperTest, MROTests
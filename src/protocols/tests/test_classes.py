@@ -34,6 +34,20 @@ class BasicChecks(AdaptiveChecks, ImplementationChecks):
         self.assertM1ProvidesOnlyAandM2ProvidesB(m1,m2)
         self.assertChangingBasesChangesInterface(M1,M2,m1,m2)
 
+    def checkDeclarationAfterLookup(self):
+
+        # Lookups are cached per type, so later declarations for the type
+        # or its bases must still be seen
+
+        class Sub(self.klass): pass
+        inst = self.make(Sub)
+        assert self.IA(inst,None) is None
+        declareImplementation(self.klass, instancesProvide=[self.IB])
+        assert self.IA(inst,None) is inst
+        declareImplementation(Sub, instancesDoNotProvide=[self.IA])
+        assert self.IA(inst,None) is None
+        assert self.IB(inst,None) is inst
+
 TestClasses = makeClassTests(BasicChecks)
 
 def test_suite():
@@ -105,8 +105,20 @@ class ZopeInterfaceAsProtocol(StickyAdapter, Protocol):
 
     def __getstate__(self):
         state = self.__dict__.copy()
-        del state['_Protocol__lock']        # locks can't be pickled
-        del state['_Protocol__listeners']   # and neither can weakref dict
+
+        # Locks and weakref dicts can't be pickled, lookup tables are rebuilt
+        # on demand, and class registrations are keyed by id() and hold weakrefs
+        # (Zope's own declarations record class support).  Registries are only
+        # created when first used, so any of these may be missing.
+        for name in (
+            '_Protocol__lock', '_Protocol__listeners', '_Protocol__cache',
+            '_Protocol__adapters', '_Protocol__classes', '_Protocol__paths',
+            '_Protocol__pending', '_Protocol__pendingSources',
+            '_Protocol__impliedBy',
+        ):
+            if name in state:
+                del state[name]
+
         return state
 
     def __hash__(self):